@@ -0,0 +1,165 @@
+# SYNTHETIC DATA GENERATOR
+# Writes a multi-year archive of PT_<Mon>_<yyyy>.CSV files in the same layout as the allotment logger so the viewer
+# and the benchmark suite can be exercised on far more data than the four sample months in Env_Data/.
+#
+# Usage: python benchmarks/generate_data.py OUT_DIR [--start 2020-02-01T15:30] [--end 2024-06-17T09:00] [--cadence 30]
+
+import os
+import sys
+import math
+import random
+import argparse
+import datetime
+
+HEADER = 'Date/Time (YYYY:MM:DD HH:MM:SS), Temperature (*C), Pressure (Pa), Humidity (%), Infrared, Visible, Full Spectrum, Lux (lm/m^2)'
+
+# NOTE - fixed English abbreviations, the file names must not depend on the locale of the machine generating them
+MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+LATITUDE = math.radians(52.5)
+
+
+def solarElevation(when):
+    """Return the sine of the approximate solar elevation at the allotment for a naive local datetime."""
+
+    dayOfYear = when.timetuple().tm_yday
+    declination = math.radians(23.44) * math.sin(2 * math.pi * (284 + dayOfYear) / 365)
+    hourAngle = math.radians(15 * (when.hour + when.minute / 60 - 12))
+
+    return (math.sin(LATITUDE) * math.sin(declination)
+            + math.cos(LATITUDE) * math.cos(declination) * math.cos(hourAngle))
+
+
+class Weather():
+    """Random walk weather model producing one logger row per call."""
+
+    def __init__(self, rng, spikeRate):
+
+        self.rng = rng
+        self.spikeRate = spikeRate
+        self.pressure = 101325.0
+        self.cloud = 0.5
+        self.tempOffset = 0.0
+
+    def sample(self, when):
+
+        rng = self.rng
+        dayOfYear = when.timetuple().tm_yday
+
+        # Slow moving weather state: pressure systems, cloud cover and a few days of warm/cold anomaly
+        self.pressure += rng.gauss(0, 25) + (101325.0 - self.pressure) * 0.002
+        self.cloud = min(1.0, max(0.0, self.cloud + rng.gauss(0, 0.05)))
+        self.tempOffset = self.tempOffset * 0.995 + rng.gauss(0, 0.1)
+
+        sunElevation = solarElevation(when)
+        seasonal = 10.0 - 8.0 * math.cos(2 * math.pi * (dayOfYear - 15) / 365)
+        diurnal = 5.0 * math.sin(2 * math.pi * (when.hour + when.minute / 60 - 9) / 24)
+        temperature = seasonal + diurnal * (1.2 - self.cloud) + self.tempOffset + rng.gauss(0, 0.3)
+
+        humidity = min(100.0, max(15.0, 75.0 - 2.0 * diurnal - 1.0 * (temperature - seasonal) + 10 * self.cloud + rng.gauss(0, 2)))
+
+        if sunElevation > 0:
+            # Broken cloud makes the light readings jump around much like the real sensor does
+            light = sunElevation * (1.0 - 0.8 * self.cloud * rng.random())
+            infrared = int(12000 * light)
+            visible = int(25000 * light)
+        else:
+            infrared = 0
+            visible = 0
+
+        fullSpectrum = infrared + visible
+        lux = 2.72 * visible - 1.64 * infrared if visible else 0.0
+        pressure = self.pressure
+
+        # Occasional sensor glitches, the kind of nonsense values the BMP/TSL sensors produce
+        if rng.random() < self.spikeRate:
+            pressure = rng.choice((0.0, 9990.27, 110000.0 + rng.random() * 50000))
+        if rng.random() < self.spikeRate:
+            lux = rng.choice((0.0, 88000.0 + rng.random() * 400000))
+
+        return (round(temperature, 2), round(pressure, 2), round(humidity, 2),
+                infrared, visible, fullSpectrum, round(max(lux, 0.0), 3))
+
+
+def formatValue(value):
+
+    if isinstance(value, int):
+        return str(value)
+    # The logger drops trailing zeros, e.g. 100299 rather than 100299.00
+    return ('%f' % value).rstrip('0').rstrip('.')
+
+
+def generate(outDir, start, end, cadence=30, gapRate=0.002, spikeRate=0.0005, seed=0):
+    """Write the archive to outDir and return the list of files written.
+
+    start and end are naive datetimes, end is exclusive and normally falls part way through its month so the last
+    file is a partial current month. cadence is the sample period in minutes. gapRate is the chance per sample of
+    the logger dropping out for between half an hour and two days.
+    """
+
+    rng = random.Random(seed)
+    weather = Weather(rng, spikeRate)
+    step = datetime.timedelta(minutes=cadence)
+    os.makedirs(outDir, exist_ok=True)
+
+    written = []
+    fh = None
+    fileMonth = None
+    gapUntil = None
+    when = start
+
+    while when < end:
+
+        if (when.year, when.month) != fileMonth:
+            if fh:
+                fh.close()
+            fileMonth = (when.year, when.month)
+            filename = os.path.join(outDir, 'PT_{0}_{1}.CSV'.format(MONTH_ABBR[when.month - 1], when.year))
+            fh = open(filename, 'w', newline='')
+            fh.write(HEADER + '\n')
+            written.append(filename)
+
+        row = weather.sample(when)
+
+        if gapUntil is not None and when < gapUntil:
+            pass
+        elif rng.random() < gapRate:
+            gapUntil = when + datetime.timedelta(minutes=rng.randint(30, 48 * 60))
+        else:
+            fh.write(when.strftime('%d/%m/%Y %H:%M') + ',' + ','.join(formatValue(value) for value in row) + '\n')
+
+        when += step
+
+    if fh:
+        fh.close()
+
+    return written
+
+
+def parseDateTime(text):
+
+    return datetime.datetime.fromisoformat(text)
+
+
+def main(argv=None):
+
+    now = datetime.datetime.now().replace(second=0, microsecond=0)
+
+    parser = argparse.ArgumentParser(description='Generate a synthetic multi-year environmental data archive.')
+    parser.add_argument('outDir', help='directory to write the PT_<Mon>_<yyyy>.CSV files to')
+    parser.add_argument('--start', type=parseDateTime, default=datetime.datetime(2020, 2, 1, 15, 30),
+                        help='first sample, ISO format (default: 2020-02-01T15:30, the first real logger sample)')
+    parser.add_argument('--end', type=parseDateTime, default=now,
+                        help='exclusive end, ISO format (default: now, giving a partial current month)')
+    parser.add_argument('--cadence', type=int, default=30, help='sample period in minutes (default: 30)')
+    parser.add_argument('--gap-rate', type=float, default=0.002, help='chance per sample of a logger outage')
+    parser.add_argument('--spike-rate', type=float, default=0.0005, help='chance per sample of a sensor glitch')
+    parser.add_argument('--seed', type=int, default=0, help='random seed, the same seed always gives the same archive')
+    args = parser.parse_args(argv)
+
+    written = generate(args.outDir, args.start, args.end, args.cadence, args.gap_rate, args.spike_rate, args.seed)
+    print('Wrote {0} files to {1}'.format(len(written), args.outDir))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,321 @@
+# BENCHMARK SUITE
+# Times each stage of the viewer pipeline against a synthetic archive and stores the results per commit in
+# benchmarks/results/<commit>.json so a regression shows up as a diff against an earlier run.
+#
+# Usage: python benchmarks/run_benchmarks.py [--data DIR] [--cadence 30] [--repeat 3] [--compare latest|FILE]
+
+import os
+import sys
+import csv
+import json
+import glob
+import time
+import argparse
+import datetime
+import platform
+import statistics
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+# NOTE - a fixed end date rather than now, otherwise every run would benchmark a slightly different archive
+DEFAULT_START = datetime.datetime(2020, 2, 1, 15, 30)
+DEFAULT_END = datetime.datetime(2024, 6, 17, 9, 0)
+
+PERIODS = (('day', 1), ('week', 7), ('month', 30), ('season', 90))
+
+
+def gitCommit():
+    """Return the short hash of HEAD, suffixed with -dirty when the working tree has local changes."""
+
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, text=True).strip()
+        dirty = subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+    return commit + '-dirty' if dirty else commit
+
+
+def ensureData(dataDir, cadence):
+    """Generate the default synthetic archive into dataDir unless it is already there."""
+
+    if glob.glob(os.path.join(dataDir, 'PT_*_*.CSV')):
+        return
+
+    import generate_data
+
+    print('Generating synthetic archive in {0}...'.format(dataDir))
+    generate_data.generate(dataDir, DEFAULT_START, DEFAULT_END, cadence=cadence)
+
+
+def timeIt(func, repeat):
+    """Call func repeat times and return the min/median/mean wall time in seconds."""
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return {'min': min(timings), 'median': statistics.median(timings), 'mean': statistics.mean(timings), 'repeat': repeat}
+
+
+# Run in a fresh interpreter per sample, a module is only imported once per process. Prints the seconds taken and the
+# peak Python heap allocated while making the icons available.
+RESOURCE_PROBE = '''
+import sys, time, tracemalloc
+sys.path.insert(0, {repo!r})
+from PyQt5 import QtCore
+tracemalloc.start()
+start = time.perf_counter()
+{load}
+print(time.perf_counter() - start, tracemalloc.get_traced_memory()[1])
+'''
+
+RESOURCE_LOADS = {
+    'rcc': 'assert QtCore.QResource.registerResource({0!r})'.format(os.path.join(REPO_DIR, 'resources', 'resources.rcc')),
+    'module': 'import resources',
+}
+
+
+def timeResources(load, repeat):
+    """Return the timing of making the icons available one way, with the peak Python heap it allocated."""
+
+    timings = []
+    peaks = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', RESOURCE_PROBE.format(repo=REPO_DIR, load=RESOURCE_LOADS[load])], text=True)
+        seconds, peak = output.split()
+        timings.append(float(seconds))
+        peaks.append(int(peak))
+
+    return {'min': min(timings), 'median': statistics.median(timings), 'mean': statistics.mean(timings), 'repeat': repeat, 'peak_bytes': max(peaks)}
+
+
+def endOfPeriod(startDateTime, days):
+    """Mirror MainWindow.replotter's mapping of the period box onto an end date."""
+
+    if days <= 14:
+        return startDateTime.addDays(days)
+    elif days == 30:
+        return startDateTime.addMonths(1)
+    return startDateTime.addMonths(3)
+
+
+def findAnchors(dataDir, qtc):
+    """Pick a start date per period whose start and end samples both exist, so gaps can't stall the row search."""
+
+    present = set()
+    for filename in glob.glob(os.path.join(dataDir, 'PT_*_*.CSV')):
+        with open(filename) as fh:
+            next(fh)
+            present.update(line[:16] for line in fh)
+
+    latest = max(qtc.QDateTime.fromString(stamp, 'dd/MM/yyyy hh:mm') for stamp in present)
+    anchors = {}
+
+    for name, days in PERIODS:
+        # Walk back from a year before the latest sample so every range sits in the middle of the archive
+        candidate = qtc.QDateTime(latest.date().addYears(-1), qtc.QTime(0, 0))
+        for _ in range(365):
+            end = endOfPeriod(candidate, days)
+            if candidate.toString('dd/MM/yyyy hh:mm') in present and end.toString('dd/MM/yyyy hh:mm') in present:
+                anchors[name] = (candidate, end)
+                break
+            candidate = candidate.addDays(-1)
+        else:
+            raise RuntimeError('No gap free {0} range found in {1}'.format(name, dataDir))
+
+    return anchors, len(present)
+
+
+def runSuite(dataDir, repeat):
+
+    os.environ['ENV_DATA_DIR'] = dataDir
+    # NOTE - the startup benchmarks open and close windows, they mustn't restore or overwrite a real session
+    os.environ['ENV_VIEWER_SESSION'] = ''
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    sys.path.insert(0, REPO_DIR)
+
+    import data_viewer
+    from data_viewer import qtc, qtg, qtw
+
+    app = qtw.QApplication.instance() or qtw.QApplication([])
+    anchors, rowCount = findAnchors(dataDir, qtc)
+    results = {}
+
+    results['catalog_scan'] = timeIt(data_viewer.scanCatalog, repeat)
+
+    # Parsed months are cached, clear the cache first so month_load always measures a cold read
+    def coldLoad(start, end):
+        data_viewer.env_data.clearCache()
+        data_viewer.CsvReader(start, end)
+
+    # A month read for every column, as month_load always has, then for just the column a single chart draws
+    def coldMonth(filename, wanted=None):
+        data_viewer.env_data.clearCache()
+        data_viewer.env_data.loadMonth(filename, wanted)
+
+    start, end = anchors['month']
+    monthFilename = data_viewer.monthFilename(start)
+    results['month_load'] = timeIt(lambda: coldMonth(monthFilename), repeat)
+    results['month_load.temperature'] = timeIt(lambda: coldMonth(monthFilename, (data_viewer.env_schema.column('temperature'),)), repeat)
+
+    # Every month parsed straight from its file, past the month cache, to follow the parser on its own
+    monthFiles = data_viewer.env_data.monthFiles(dataDir)
+    results['month_parse'] = timeIt(lambda: [data_viewer.env_data.readMonth(path) for path in monthFiles], repeat)
+
+    # The same months through csv.reader and parseRows, the path a file not in the logger's own layout takes, to
+    # keep the fast parser's gain in view
+    def parseGeneric(path):
+        with data_viewer.env_data.openMonth(path) as fh:
+            csvReader = csv.reader(fh.read().splitlines())
+        return data_viewer.env_data.parseRows(next(csvReader, []), csvReader)
+
+    results['month_parse.generic'] = timeIt(lambda: [parseGeneric(path) for path in monthFiles], repeat)
+
+    # Aggregate levels are built from the months on first use, time a Season drawn at a level from cold
+    start, end = anchors['season']
+    results['level_build'] = timeIt(lambda: (coldLoad(start, end), data_viewer.CsvReader(start, end).newRequest(start, end, 500)), repeat)
+
+    # The whole archive streamed to each export format, the month cache is bypassed so every run reads the files
+    import env_stream
+    exportDir = os.path.join(BENCH_DIR, '.data', 'export')
+    os.makedirs(exportDir, exist_ok=True)
+    for fileFormat in env_stream.FORMATS:
+        outPath = os.path.join(exportDir, 'archive.' + fileFormat)
+        results['stream_export.' + fileFormat] = timeIt(lambda: env_stream.exportRange(outPath, 0, 2 ** 40, dataDir, range(1, len(env_stream.env_data.FIELDS)), fileFormat), 1)
+
+    # Time to a painted window, then to a chart on screen, the chart being built and loaded when its tab is first shown
+    def openWindow(start=None, end=None):
+        window = data_viewer.MainWindow()
+        app.processEvents()
+        if start is not None:
+            window.startDateTimeBox.setDateTime(start)
+            window.refreshAll()
+            window.tabs.setCurrentWidget(window.tempPlot)
+            app.processEvents()
+        window.close()
+        window.deleteLater()
+
+    for load in RESOURCE_LOADS:
+        results['startup.icons_' + load] = timeResources(load, repeat)
+
+    start, end = anchors['day']
+    results['startup.window'] = timeIt(openWindow, repeat)
+    results['startup.first_chart'] = timeIt(lambda: openWindow(start, end), repeat)
+
+    plot = data_viewer.Plot('temperature')
+    luxPlot = data_viewer.Plot('lux')
+    statSheet = data_viewer.Statistics(background=False)
+    image = qtg.QImage(1280, 720, qtg.QImage.Format_ARGB32)
+    plot.resize(image.size())
+    plot.show()
+
+    def render():
+        app.processEvents()
+        painter = qtg.QPainter(image)
+        plot.render(painter)
+        painter.end()
+
+    # The SQLite copy lives beside the archive rather than in it, so the CSV benchmarks above still read the CSVs
+    env_sqlite = data_viewer.env_sqlite
+    dbPath = dataDir + '.sqlite'
+    if os.path.exists(dbPath):
+        os.remove(dbPath)
+    results['sqlite_import'] = timeIt(lambda: env_sqlite.importArchive(dataDir, dbPath), 1)
+
+    for name, days in PERIODS:
+        start, end = anchors[name]
+        reader = data_viewer.CsvReader(start, end)
+        startSecs = start.toMSecsSinceEpoch() // 1000
+        endSecs = end.toMSecsSinceEpoch() // 1000
+
+        results['sqlite_query.' + name] = timeIt(lambda: env_sqlite.queryRange(dbPath, startSecs, endSecs), repeat)
+
+        results['range_slice.' + name] = timeIt(lambda: reader.newRequest(start, end), repeat)
+        results['range_load_cold.' + name] = timeIt(lambda: (coldLoad(start, end), reader.newRequest(start, end)), repeat)
+        results['statistics.' + name] = timeIt(lambda: statSheet.refreshData(start, end), repeat)
+        results['series_build.temperature.' + name] = timeIt(lambda: plot.refreshData(start, end), repeat)
+        results['series_build.lux.' + name] = timeIt(lambda: luxPlot.refreshData(start, end), repeat)
+        results['render.' + name] = timeIt(render, repeat)
+
+    dataset = {
+        'dir': dataDir,
+        'files': len(data_viewer.scanCatalog()),
+        'rows': rowCount,
+        'anchors': {name: anchors[name][0].toString(qtc.Qt.ISODate) for name, _ in PERIODS},
+    }
+
+    return results, dataset
+
+
+def latestResults(exclude):
+    """Return the most recently written results file other than exclude, or None."""
+
+    candidates = [path for path in glob.glob(os.path.join(RESULTS_DIR, '*.json')) if os.path.abspath(path) != os.path.abspath(exclude)]
+    return max(candidates, key=os.path.getmtime) if candidates else None
+
+
+def printReport(results, baseline=None):
+
+    print('{0:<36}{1:>12}{2:>12}{3:>10}'.format('benchmark', 'median ms', 'min ms', 'change'))
+    for name, timing in results.items():
+        change = ''
+        if baseline and name in baseline:
+            change = '{0:+.1f}%'.format(100 * (timing['median'] / baseline[name]['median'] - 1))
+        print('{0:<36}{1:>12.2f}{2:>12.2f}{3:>10}'.format(name, timing['median'] * 1000, timing['min'] * 1000, change))
+
+    for name, timing in results.items():
+        if 'peak_bytes' in timing:
+            print('{0:<36}{1:>12.1f} KiB peak Python heap'.format(name, timing['peak_bytes'] / 1024))
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description='Benchmark the environmental data viewer pipeline.')
+    parser.add_argument('--data', help='archive to benchmark (default: generate one in benchmarks/.data/)')
+    parser.add_argument('--cadence', type=int, default=30, help='sample period in minutes for a generated archive')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark (default: 3)')
+    parser.add_argument('--compare', help="results file to compare against, or 'latest' for the previous run")
+    parser.add_argument('--no-save', action='store_true', help='do not write the results file')
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, BENCH_DIR)
+    dataDir = os.path.abspath(args.data or os.path.join(BENCH_DIR, '.data', 'cadence_{0}'.format(args.cadence)))
+    ensureData(dataDir, args.cadence)
+
+    results, dataset = runSuite(dataDir, args.repeat)
+
+    commit = gitCommit()
+    outPath = os.path.join(RESULTS_DIR, commit + '.json')
+    record = {
+        'commit': commit,
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'dataset': dataset,
+        'results': results,
+    }
+
+    baseline = None
+    comparePath = latestResults(outPath) if args.compare == 'latest' else args.compare
+    if comparePath:
+        with open(comparePath) as fh:
+            baseline = json.load(fh)['results']
+        print('Comparing against {0}'.format(comparePath))
+
+    printReport(results, baseline)
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        with open(outPath, 'w') as fh:
+            json.dump(record, fh, indent=2)
+        print('Results written to {0}'.format(outPath))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
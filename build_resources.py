@@ -0,0 +1,84 @@
+# RESOURCE BUILD
+# Compiles the tab icons listed in resources/resources.qrc into resources/resources.rcc, a binary resource file the
+# viewer hands straight to QResource.registerResource so Qt memory maps it, and into resources.py, the generated Python
+# module used when the binary file is missing. Run it again after changing an icon.
+#
+# Usage: python build_resources.py [--from-module]
+
+import os
+import sys
+import struct
+import argparse
+import tempfile
+import subprocess
+import importlib.util
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+QRC_PATH = os.path.join(REPO_DIR, 'resources', 'resources.qrc')
+RCC_PATH = os.path.join(REPO_DIR, 'resources', 'resources.rcc')
+MODULE_PATH = os.path.join(REPO_DIR, 'resources.py')
+
+# Binary layout: RCC_MAGIC, then the format version and the file offsets of the tree, data and names blocks as big
+# endian uint32s, followed by the blocks themselves
+RCC_MAGIC = b'qres'
+RCC_VERSION = 2
+RCC_HEADER_SIZE = len(RCC_MAGIC) + 4 * 4
+
+
+def compileModule(qrcPath, modulePath):
+    """Write the Python resource module for qrcPath with pyrcc5."""
+
+    subprocess.check_call(['pyrcc5', '-o', modulePath, qrcPath])
+
+
+def binaryResource(modulePath):
+    """Return the contents of a binary .rcc file holding the same resources as a pyrcc5 module.
+
+    pyrcc5 can't write the binary format itself, but the module's data, name and tree blocks are the ones a binary
+    file holds, with offsets relative to the start of each block, so only the header has to be added.
+    """
+
+    spec = importlib.util.spec_from_file_location('compiledResources', modulePath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    data = module.qt_resource_data
+    names = module.qt_resource_name
+    tree = module.qt_resource_struct_v2
+
+    dataOffset = RCC_HEADER_SIZE
+    namesOffset = dataOffset + len(data)
+    treeOffset = namesOffset + len(names)
+    header = RCC_MAGIC + struct.pack('>IIII', RCC_VERSION, treeOffset, dataOffset, namesOffset)
+
+    return header + data + names + tree
+
+
+def build(qrcPath=QRC_PATH, rccPath=RCC_PATH, modulePath=MODULE_PATH, recompile=True):
+    """Write the resource module and the binary file, recompile False builds the binary file from the module as it is."""
+
+    if recompile:
+        compileModule(qrcPath, modulePath)
+
+    # NOTE - written beside the target and renamed, a viewer starting meanwhile never maps a half written file
+    rccDir = os.path.dirname(rccPath)
+    fd, tmpPath = tempfile.mkstemp(dir=rccDir, suffix='.rcc')
+    with os.fdopen(fd, 'wb') as fh:
+        fh.write(binaryResource(modulePath))
+    os.chmod(tmpPath, 0o644)
+    os.replace(tmpPath, rccPath)
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description='Compile the viewer icons into a binary resource file and a Python module.')
+    parser.add_argument('--from-module', action='store_true', help='build the binary file from the existing resources.py rather than recompiling it')
+    args = parser.parse_args(argv)
+
+    build(recompile=not args.from_module)
+    written = [RCC_PATH] if args.from_module else [RCC_PATH, MODULE_PATH]
+    print('Wrote ' + ' and '.join(os.path.relpath(path, REPO_DIR) for path in written))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,15 +4,96 @@
 # First, import all core modules - sys here allows the passing of acutal script augments to QApplication
 
 import sys
-import csv
-import resources
-import glob
+import os
+import math
+import time
+
+# Startup is reported as the time from here to the window first being painted
+LAUNCH_TIME = time.perf_counter()
+
+import logging
+import argparse
+import bisect
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import diagnostics
+import env_chill
+import env_climate
+import env_data
+import env_index
+import env_metrics
+import env_rolling
+import env_schema
+import env_session
+import env_sqlite
+from diagnostics import timings, timingsEnabled, profileOnce
 from PyQt5 import QtChart as qtch
 from PyQt5 import QtWidgets as qtw
 from PyQt5 import QtGui as qtg
 from PyQt5 import QtCore as qtc
 
+# Location of the monthly PT_<Mon>_<yyyy>.CSV logger files, set ENV_DATA_DIR to point the viewer at another archive
+DATA_DIR = os.environ.get('ENV_DATA_DIR', 'C:/Users/Diplodocus/Desktop/python_code/Farm Management App/Env_Data')
+
+# Optional SQLite copy of the archive, created with env_sqlite.py, used in preference to the CSVs once populated
+DB_PATH = os.environ.get('ENV_DATA_DB', os.path.join(DATA_DIR, env_sqlite.DB_FILENAME))
+
+# Per half hour baseline of every column across the archive, kept beside the data and updated as months change
+CLIMATOLOGY_PATH = os.environ.get('ENV_DATA_CLIMATOLOGY', os.path.join(DATA_DIR, 'env_climatology.columns'))
+
+# What the viewer last showed, painted straight away at the next launch, set ENV_VIEWER_SESSION empty to start afresh
+SESSION_PATH = os.environ.get('ENV_VIEWER_SESSION', os.path.join(os.path.expanduser('~'), '.env_viewer_session.pickle'))
+
+# Tab icons compiled by build_resources.py, a binary resource file Qt memory maps rather than a module of bytes literals
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'resources.rcc')
+
+# Chart points drawn per pixel of plot width, a range with more samples than that is drawn from an aggregate level
+POINTS_PER_PIXEL = 2
+
+# How long the x axis has to stay put after a zoom before the visible window is re-queried
+REQUERY_DELAY_MS = 200
+
+# Data is held this many visible widths beyond each edge of a chart, panning within it needs no load at all and the
+# next width is fetched in the background as the view nears the end of what is held
+PREFETCH_SPANS = 0.5
+
+# Qt paints every point of a series, on or off screen, so once panning stops a held window wider than this many
+# visible widths is trimmed back to the view and its margins
+HELD_SPANS = 4
+
+
+def monthFilename(fileDateTime):
+    """Return the path of the data file holding the month of fileDateTime, which may be a compressed copy."""
+
+    fileDateTimeStr = qtc.QDateTime.toString(fileDateTime, 'MMM yyyy')
+    return env_data.monthPath(os.path.join(DATA_DIR, 'PT_{0}_{1}.CSV'.format(fileDateTimeStr[0:3], fileDateTimeStr[4:8])))
+
+
+def catalogBackend():
+    """Return 'sqlite' when the archive has been imported into DB_PATH, otherwise 'csv'."""
+
+    return 'sqlite' if env_sqlite.isPopulated(DB_PATH) else 'csv'
+
+
+def scanCatalog(dataDir=None):
+    """Return the sorted start-of-month epoch (msecs) of every month in the archive.
+
+    With no dataDir the months come from whichever backend is present, otherwise from the data files in dataDir.
+    """
+
+    if dataDir is None and catalogBackend() == 'sqlite':
+        files = env_sqlite.importedFiles(DB_PATH)
+    else:
+        files = env_data.monthFiles(dataDir or DATA_DIR)
+
+    # Months kept compressed are named PT_<Mon>_<yyyy>.CSV.gz and so on, the month is read from the name's stem
+    csvFiles = []
+    for file in files:
+        stem = env_data.monthStem(file)
+        csvFiles.append(qtc.QDateTime.toMSecsSinceEpoch(qtc.QDateTime.fromString(stem[3:6] + ' ' + stem[7:11], 'MMM yyyy')))
+
+    return sorted(csvFiles)
+
 # next create a main window class - NOTE the difference here between the standard template and the one for a main window is the call to QWidget and QMainWindow in the class definition
 # NOTE - here the class QWidget is made into a sub class and the constructor method is overridden.
 # this is the recommended way to approach Qt GUI building as it allows customisation and expansion on Qt's powerful widget classes.
@@ -20,7 +101,10 @@ from PyQt5 import QtCore as qtc
 # NOTE - always call super().__init__() inside your child class's constructor, especially with Qt classes as it will cause errors.
 
 class MainWindow(qtw.QMainWindow):
-    
+
+    # Emitted from the prefetch thread with the statistics' samples once a restored session proves current, else None
+    sessionChecked = qtc.pyqtSignal(object)
+
     def __init__(self):
         """MainWindow constructor"""
         super().__init__()
@@ -34,19 +118,29 @@ class MainWindow(qtw.QMainWindow):
         self.statSheet = Statistics()
         statsIdx = tabs.addTab(self.statSheet, '')
 
-        self.tempPlot = Plot(1)
+        # Each chart is built the first time its tab is shown, until then the tab holds a placeholder
+        self.tempPlot = LazyPlot('temperature')
         tempIdx = tabs.addTab(self.tempPlot, '')
 
-        self.pressurePlot = Plot(2)
+        self.pressurePlot = LazyPlot('pressure')
         pressureIdx = tabs.addTab(self.pressurePlot, '')
 
-        self.humidityPlot = Plot(3)
+        self.humidityPlot = LazyPlot('humidity')
         humidityIdx = tabs.addTab(self.humidityPlot, '')
 
-        self.luxPlot = Plot(7)
+        self.luxPlot = LazyPlot('lux')
         luxIdx = tabs.addTab(self.luxPlot, '')
 
+        # Derived from temperature and humidity, there are no icons for these so the tabs are labelled instead
+        self.dewPointPlot = LazyPlot('dewPoint')
+        tabs.addTab(self.dewPointPlot, 'Dew Point')
+
+        self.vpdPlot = LazyPlot('vpd')
+        tabs.addTab(self.vpdPlot, 'VPD')
+        self.plotTabs = (self.tempPlot, self.pressurePlot, self.humidityPlot, self.luxPlot, self.dewPointPlot, self.vpdPlot)
+
         # set icons for tabs
+        registerResources()
         statsIcon = qtg.QIcon(':/plots/stats.png')
         tempIcon = qtg.QIcon(':/plots/temperature.png')
         pressureIcon = qtg.QIcon(':/plots/pressure.png')
@@ -85,11 +179,7 @@ class MainWindow(qtw.QMainWindow):
         self.goButton.setShortcut(qtg.QKeySequence('enter'))
 
         # Limit maximum date time to the end of the month the data is present for
-        csvFiles = []
-        for file in glob.glob("C:/Users/Diplodocus/Desktop/python_code/Farm Management App/Env_Data/*.csv"):
-            csvFiles.append(qtc.QDateTime.toMSecsSinceEpoch(qtc.QDateTime.fromString(file[-12:-9] + ' ' + file[-8:-4], 'MMM yyyy')))
-
-        csvFiles = sorted(csvFiles)
+        csvFiles = scanCatalog()
         latestAvailableData = qtc.QDateTime.fromMSecsSinceEpoch(csvFiles[-1])
         
         self.maximumDateTime = latestAvailableData.addMonths(1)
@@ -126,6 +216,9 @@ class MainWindow(qtw.QMainWindow):
         self.dataCompCombobox.addItem('Humidity', 3)
         self.dataCompCombobox.addItem('Luminosity', 4)
 
+        self.filterCheckbox = qtw.QCheckBox('Filter sensor spikes', self, checked = env_data.FILTER_ENABLED)
+        self.filterCheckbox.toggled.connect(self.setFiltered)
+
         # Add widgets to the layout
         gridLayout.addWidget(startLabel, 0, 0)
         gridLayout.addWidget(endLabel, 0, 1)
@@ -136,6 +229,7 @@ class MainWindow(qtw.QMainWindow):
         gridLayout.addWidget(dataCompLabel, 2, 1)
         gridLayout.addWidget(self.yearCompSpinbox, 3, 0)
         gridLayout.addWidget(self.dataCompCombobox, 3, 1)
+        gridLayout.addWidget(self.filterCheckbox, 4, 0)
         gridLayout.addWidget(self.goButton, 1, 2, 4, 1)
 
         # Create status bar
@@ -145,12 +239,135 @@ class MainWindow(qtw.QMainWindow):
         self.statusBar().addPermanentWidget(self.plotInfo)
         # NOTE - need to add update function when new data is called and a new tab is selected.
 
+        # Per stage timing of the last refresh, hidden unless ENV_VIEWER_TIMINGS is set or toggled with Ctrl+T
+        self.timingInfo = qtw.QLabel()
+        self.timingInfo.setVisible(timingsEnabled())
+        self.statusBar().addWidget(self.timingInfo)
+        qtw.QShortcut(qtg.QKeySequence('Ctrl+T'), self, activated=self.toggleTimingInfo)
+        qtw.QShortcut(qtg.QKeySequence('Ctrl+M'), self, activated=self.showMemoryReport)
+        self.tabs = tabs
+
+        for plotTab in self.plotTabs:
+            plotTab.rangeSelected.connect(self.showSelection)
+
         # Set up signals and slots
         # Prevent end date being earlier in time than start date, also fixes max data view to 3 months
         self.startDateTimeBox.dateTimeChanged.connect(self.minEndDateTimeModifier)
 
+        # Month stamps of the range on show, saved with the session so the next launch can tell if it is still current
+        self.shownStamps = None
+        self.sessionPending = False
+        self.sessionChecked.connect(self.sessionCurrent)
+        self.restoreSession()
+
         self.show()
 
+        # The first pass of the event loop paints the window, startup is measured up to there
+        self.startupSecs = None
+        qtc.QTimer.singleShot(0, self.reportStartup)
+
+    @qtc.pyqtSlot()
+    def reportStartup(self):
+
+        self.startupSecs = time.perf_counter() - LAUNCH_TIME
+        diagnostics.logger.info('stage=startup ms=%.2f', self.startupSecs * 1000)
+        self.timingInfo.setText('Startup {0:.0f}ms'.format(self.startupSecs * 1000))
+
+        # NOTE - only once the restored view is up, the check would otherwise hold up its first paint
+        if self.sessionPending:
+            self.startSessionCheck()
+
+    def restoreSession(self):
+        """Show the range, tab, charts and figures saved when the viewer was last closed, then check them in the background."""
+
+        session = env_session.load(SESSION_PATH) if SESSION_PATH else None
+        if session is None:
+            return
+
+        # The charts and figures were drawn with the filter as it was then, setFiltered passes it on to the views
+        self.filterCheckbox.setChecked(session['filtered'])
+        env_data.FILTER_ENABLED = session['filtered']
+
+        # NOTE - the date box clamps to the archive, a range no longer on offer isn't restored
+        startDateTime = qtc.QDateTime.fromSecsSinceEpoch(session['start'])
+        self.startDateTimeBox.setDateTime(startDateTime)
+        periodIdx = self.endDateTimeBox.findText(session['period'])
+        if self.startDateTimeBox.dateTime() != startDateTime or periodIdx < 0:
+            return
+        self.endDateTimeBox.setCurrentIndex(periodIdx)
+
+        with timings.span('session.restore'):
+            startDateTime, endDateTime = self.selectedRange()
+            for plotTab in self.plotTabs:
+                plotTab.restore(startDateTime, endDateTime, session['plots'].get(plotTab.sensorName), tuple(session['stamps']))
+            self.statSheet.restoreSummary(startDateTime.toSecsSinceEpoch(), endDateTime.toSecsSinceEpoch(), session['stats'])
+            self.plotInfo.setText(self.statSheet.statusBarData())
+            self.tabs.setCurrentIndex(session['tab'])
+
+        self.shownStamps = session['stamps']
+        self.sessionPending = True
+        self.statusBar().showMessage('Showing the last session, checking for newer data...')
+
+    def startSessionCheck(self):
+        """Check a restored session against the archive on the prefetch thread, sessionCurrent gets the answer."""
+
+        startDateTime, endDateTime = self.selectedRange()
+
+        def checked(future):
+            self.sessionChecked.emit(None if future.exception() else future.result())
+
+        prefetchPool().submit(checkSession, startDateTime.toSecsSinceEpoch(), endDateTime.toSecsSinceEpoch(), self.shownStamps).add_done_callback(checked)
+
+    @qtc.pyqtSlot(object)
+    def sessionCurrent(self, statsData):
+        """Keep a restored session when its months are unchanged, otherwise load the range afresh."""
+
+        # NOTE - a range picked with GO since the session was restored has already replaced it
+        if not self.sessionPending:
+            return
+        self.sessionPending = False
+
+        if statsData is None:
+            self.statusBar().showMessage('Newer data found, reloading...', 5000)
+            self.replotter()
+            return
+
+        self.statSheet.plotData = statsData
+        self.statusBar().showMessage('Up to date', 5000)
+
+    def saveSession(self):
+        """Write the range, tab, chart data and figures on show to SESSION_PATH for the next launch."""
+
+        if not SESSION_PATH or self.shownStamps is None:
+            return
+
+        startDateTime, endDateTime = self.selectedRange()
+        plots = {}
+        for plotTab in self.plotTabs:
+            snapshot = plotTab.snapshot()
+            if snapshot is not None:
+                plots[plotTab.sensorName] = snapshot
+
+        env_session.save(SESSION_PATH, {
+            'start': startDateTime.toSecsSinceEpoch(),
+            'period': self.endDateTimeBox.currentText(),
+            'tab': self.tabs.currentIndex(),
+            'filtered': self.filterCheckbox.isChecked(),
+            'stamps': self.shownStamps,
+            'plots': plots,
+            'stats': self.statSheet.summary,
+        })
+
+    def closeEvent(self, event):
+
+        self.saveSession()
+        super().closeEvent(event)
+
+    def builtPlots(self):
+        """Return the Plots of the chart tabs that have been shown so far."""
+
+        return [plotTab.plot for plotTab in self.plotTabs if plotTab.plot is not None]
+
     @qtc.pyqtSlot(qtc.QDateTime)
     def minEndDateTimeModifier(self, startDateTime):
 
@@ -222,9 +439,104 @@ class MainWindow(qtw.QMainWindow):
             self.goButton.setEnabled(True)
             self.windowRangeLabel.setText('Note: Max data viewing range is 3 months')
 
+    @qtc.pyqtSlot()
+    def toggleTimingInfo(self):
+
+        self.timingInfo.setVisible(not self.timingInfo.isVisible())
+
+    @qtc.pyqtSlot(bool)
+    def setFiltered(self, filtered):
+
+        env_data.FILTER_ENABLED = filtered
+        plots = self.builtPlots()
+        for view in plots + [self.statSheet]:
+            view.filtered = filtered
+
+        if not hasattr(self.statSheet, 'plotData'):
+            return
+
+        # The loaded data keeps both views once filtered, only a range loaded before filtering was on needs fetching
+        if filtered and not self.statSheet.plotData.masks:
+            self.replotter()
+            return
+
+        # Aggregate levels are built from one view or the other, so a plot drawn from a level has to fetch it again
+        for plot in plots:
+            if isinstance(plot.plotData, env_data.EnvAggregate):
+                plot.requery()
+            else:
+                plot.drawSeries()
+            plot.setSelection(plot.selection)
+        self.statSheet.summarise()
+        if self.statSheet.selection is not None:
+            self.statSheet.showSelection(*self.statSheet.selection[:2])
+        self.plotInfo.setText(self.statSheet.statusBarData())
+
     @qtc.pyqtSlot()
     def replotter(self):
 
+        timings.reset()
+
+        with profileOnce():
+            if diagnostics.tracemallocEnabled():
+                diagnostics.memoryLogger.info('allocations for one refresh\n%s', diagnostics.traceAllocations(self.refreshAll))
+            else:
+                self.refreshAll()
+
+            # Painting normally happens later in the event loop, force it now so it can be timed
+            if self.timingInfo.isVisible():
+                with timings.span('paint'):
+                    self.tabs.currentWidget().repaint()
+
+        timings.log(start=self.startDateTimeBox.dateTime().toString(qtc.Qt.ISODate), period=self.endDateTimeBox.currentText().replace(' ', '_'))
+        self.timingInfo.setText(timings.breakdown())
+
+    @qtc.pyqtSlot(int, int)
+    def showSelection(self, startSecs, endSecs):
+        """Summarise a span dragged out on a chart in the statistics sheet and status bar, (0, 0) goes back to the range."""
+
+        if not hasattr(self.statSheet, 'plotData'):
+            return
+
+        if endSecs > startSecs:
+            self.statSheet.showSelection(startSecs, endSecs)
+        else:
+            self.statSheet.clearSelection()
+        self.plotInfo.setText(self.statSheet.statusBarData())
+
+    def memoryUsage(self):
+        """Return the memory report rows for the data held by each tab and its chart series."""
+
+        datasets = {}
+        chartSeries = {}
+
+        for tabIdx in range(self.tabs.count()):
+            tab = self.tabs.widget(tabIdx)
+            if isinstance(tab, LazyPlot):
+                tab = tab.plot
+                if tab is None:
+                    continue
+            tabName = tab.chart().title().strip() if isinstance(tab, qtch.QChartView) else 'Statistics'
+
+            if hasattr(tab, 'plotData'):
+                datasets[tabName] = diagnostics.deepSizeOf(tab.plotData)
+            if isinstance(tab, qtch.QChartView):
+                for series in tab.chart().series():
+                    seriesName = '{0} / {1}'.format(tabName.split()[0], series.name())
+                    chartSeries[seriesName] = chartSeries.get(seriesName, 0) + diagnostics.seriesBytes(series)
+
+        return diagnostics.memoryReport({'dataset': datasets, 'chart series': chartSeries})
+
+    @qtc.pyqtSlot()
+    def showMemoryReport(self):
+
+        report = qtw.QMessageBox(self, windowTitle='Memory Usage')
+        report.setText('<pre>{0}</pre>'.format(diagnostics.formatMemoryReport(self.memoryUsage())))
+        report.exec()
+
+    def selectedRange(self):
+        """Return the (start, end) QDateTimes picked with the date box and period."""
+
         startDateTime = self.startDateTimeBox.dateTime()
         endDateTimeIdx = self.endDateTimeBox.itemData(self.endDateTimeBox.currentIndex())
 
@@ -235,12 +547,22 @@ class MainWindow(qtw.QMainWindow):
         else:
             endDateTime = startDateTime.addMonths(3)
 
-        self.tempPlot.refreshData(1, startDateTime, endDateTime)
-        self.pressurePlot.refreshData(2, startDateTime, endDateTime)
-        self.humidityPlot.refreshData(3, startDateTime, endDateTime)
-        self.luxPlot.refreshData(7, startDateTime, endDateTime)
+        return startDateTime, endDateTime
+
+    def refreshAll(self):
+
+        startDateTime, endDateTime = self.selectedRange()
+
+        # Stamped before the months are read, a month changing during the load shows up as stale next launch
+        self.sessionPending = False
+        self.shownStamps = monthStamps(startDateTime.toSecsSinceEpoch(), endDateTime.toSecsSinceEpoch())
+
+        # A chart that hasn't been shown yet only keeps the range, it is loaded when the chart is built
+        for plotTab in self.plotTabs:
+            plotTab.refreshData(startDateTime, endDateTime)
         self.statSheet.refreshData(startDateTime, endDateTime)
-        self.plotInfo.setText(self.statSheet.statusBarData())
+        with timings.span('stats.status_bar'):
+            self.plotInfo.setText(self.statSheet.statusBarData())
 
 class CsvReader():
     """The model for a CSV table."""
@@ -248,167 +570,475 @@ class CsvReader():
     def __init__(self, startDateTime, endDateTime):
         super().__init__()
 
-        # Do first read in of data file based on start date
-        fileDateTimeStr = qtc.QDateTime.toString(startDateTime, 'MMM yyyy')
-        filename = 'c:/Users/Diplodocus/Desktop/python_code/Farm Management App/Env_Data/PT_{0}_{1}.CSV'.format(fileDateTimeStr[0:3], fileDateTimeStr[4:8])
-
-        with open(filename) as fh:
-            csvReader = csv.reader(fh)
-            self._headers = next(csvReader)
-            self._data = list(csvReader)
+        # Do first read in of data file based on start date, just its timestamps, each request reads the columns it needs
+        # NOTE - panning can ask for a range starting before the first month was logged, that month is just empty
+        self._filename = monthFilename(startDateTime)
+        self._data = env_data.loadMonth(self._filename, ()) if os.path.exists(self._filename) else env_data.EnvData([])
+        self._headers = self._data.headers
 
-    def newRequest(self, startDateTime, endDateTime):
+    def laterMonths(self, startDateTime, endDateTime):
+        """Return the files of the months after the start month up to the end date that have been logged."""
 
-        startMonthInt = int(qtc.QDateTime.toString(startDateTime, 'MM'))
-        endMonthInt = int(qtc.QDateTime.toString(endDateTime, 'MM'))
-
-        startDateTimeStr = qtc.QDateTime.toString(startDateTime, 'dd/MM/yyyy hh:mm')
-        endDateTimeStr = qtc.QDateTime.toString(endDateTime, 'dd/MM/yyyy hh:mm')
+        endMonth = (endDateTime.date().year(), endDateTime.date().month())
 
         fileDateTime = startDateTime
-        fileDateTimeStr = qtc.QDateTime.toString(fileDateTime, 'MMM yyyy')
-        filename = 'c:/Users/Diplodocus/Desktop/python_code/Farm Management App/Env_Data/PT_{0}_{1}.CSV'.format(fileDateTimeStr[0:3], fileDateTimeStr[4:8])
-
-        with open(filename) as fh:
-            csvReader = csv.reader(fh)
-            self._headers = next(csvReader)
-            plotData = list(csvReader)
+        filenames = []
 
         # If start date month and end date month are not the same run through loop and collect data
-        while startMonthInt != endMonthInt:
+        # NOTE - year and month are compared together, a panned chart can hold more than a year
+        while (fileDateTime.date().year(), fileDateTime.date().month()) < endMonth:
 
-            startMonthInt += 1
             fileDateTime = fileDateTime.addMonths(1)
 
-            # Catch year end
-            if startMonthInt == 13:
-                startMonthInt = 1
+            # NOTE - a range ending at midnight on the 1st asks for a month that may not have been logged yet
+            filename = monthFilename(fileDateTime)
+            if os.path.exists(filename):
+                filenames.append(filename)
 
-            fileDateTimeStr = qtc.QDateTime.toString(fileDateTime, 'MMM yyyy')
-            filename = 'c:/Users/Diplodocus/Desktop/python_code/Farm Management App/Env_Data/PT_{0}_{1}.CSV'.format(fileDateTimeStr[0:3], fileDateTimeStr[4:8])
+        return filenames
 
-            with open(filename) as fh:
-                csvReader = csv.reader(fh)
-                self._headers = next(csvReader)
-                newData = list(csvReader)
+    def newRequest(self, startDateTime, endDateTime, maxPoints=None, bucketSecs=None, wanted=None):
+        """Return the samples in the range, or an aggregate level of them when there are more than maxPoints.
 
-            for row in newData:
-                plotData.append(row)
+        bucketSecs picks the level rather than leaving it to maxPoints, 0 asks for the raw samples. wanted lists the
+        column indices to read, the rest are None, or None for every column.
+        """
 
-        startIdx = None
-        endIdx = None
+        filenames = self.laterMonths(startDateTime, endDateTime)
+        if os.path.exists(self._filename):
+            filenames.insert(0, self._filename)
 
-        #NOTE - this needs to be amended so that if a value isn't return due to missing data it finds the nearest data
-        while startIdx == None:
-            for row in self._data:
-                if row[0] == startDateTimeStr:
-                    startIdx = plotData.index(row)
-                    break
+        startSecs = startDateTime.toMSecsSinceEpoch() // 1000
+        endSecs = endDateTime.toMSecsSinceEpoch() // 1000
+        if bucketSecs is None:
+            bucketSecs = maxPoints and env_data.chooseLevel(endSecs - startSecs, self._data.cadence, maxPoints)
 
-                elif row == plotData[-1]:
+        # The months are read concurrently and come back in time order
+        if bucketSecs:
+            with timings.span('csv.load_levels'):
+                monthData = env_data.loadLevels(filenames, bucketSecs, wanted)
+        else:
+            with timings.span('csv.load_months'):
+                monthData = env_data.loadMonths(filenames, wanted)
 
-                    startDateTime = qtc.QDateTime.fromString(endDateTimeStr, 'dd/MM/yyyy hh:mm')
-                    startDateTime = endDateTime.addSecs(1800)
-                    startDateTimeStr = qtc.QDateTime.toString(endDateTime, 'dd/MM/yyyy hh:mm')
+        # Samples are sorted by time so the range is found by bisection, a missing start or end sample simply
+        # starts or ends the range at the nearest following sample
+        with timings.span('csv.row_search'):
+            blockClass = env_data.EnvAggregate if bucketSecs else env_data.EnvData
+            plotData = blockClass.concatenate(month.between(startSecs, endSecs) for month in monthData)
 
+        return(plotData)
 
-        while endIdx == None:
-            for row in plotData:
-                if row[0] == endDateTimeStr:
-                    endIdx = plotData.index(row)
-                    break
-                elif row == plotData[-1]:
+    def monthBlocks(self, startDateTime, endDateTime, cached=True):
+        """Return (key, load) for each month in the range, key changes with the file and load returns its data.
 
-                    endDateTime = qtc.QDateTime.fromString(endDateTimeStr, 'dd/MM/yyyy hh:mm')
-                    endDateTime = endDateTime.addSecs(1800)
-                    endDateTimeStr = qtc.QDateTime.toString(endDateTime, 'dd/MM/yyyy hh:mm')
+        With cached False the months are read past the month cache, so they can't push out the months on show.
+        """
 
-        plotData = plotData[startIdx:endIdx]
+        filenames = self.laterMonths(startDateTime, endDateTime)
+        if os.path.exists(self._filename):
+            filenames.insert(0, self._filename)
 
-        return(plotData)
+        blocks = []
+        for filename in filenames:
+            stat = os.stat(filename)
+            if cached:
+                load = lambda filename=filename: env_data.loadMonth(filename)
+            else:
+                load = lambda filename=filename: env_data.prepareMonth(filename, env_data.FILTER_ENABLED)
+            blocks.append(((filename, stat.st_size, stat.st_mtime_ns), load))
+
+        return blocks
+
+
+class SqliteReader():
+    """Reads ranges from the imported SQLite database, a drop in replacement for CsvReader."""
+
+    def __init__(self, startDateTime, endDateTime):
+        super().__init__()
+
+        self._headers = env_sqlite.headers(DB_PATH)
+
+    def newRequest(self, startDateTime, endDateTime, maxPoints=None, bucketSecs=None, wanted=None):
+
+        startSecs = startDateTime.toMSecsSinceEpoch() // 1000
+        endSecs = endDateTime.toMSecsSinceEpoch() // 1000
+        if bucketSecs is None:
+            bucketSecs = maxPoints and env_data.chooseLevel(endSecs - startSecs, env_sqlite.cadence(DB_PATH), maxPoints)
+
+        # Unfiltered levels are grouped by SQLite itself, filtered ones need the samples to run the filter over
+        if bucketSecs and not env_data.FILTER_ENABLED:
+            with timings.span('sqlite.query_level'):
+                return env_sqlite.queryLevel(DB_PATH, startSecs, endSecs, bucketSecs, self._headers, wanted)
+
+        with timings.span('sqlite.query'):
+            plotData = env_sqlite.queryRange(DB_PATH, startSecs, endSecs, self._headers, wanted)
+
+        # NOTE - unlike the month cache query results aren't kept, so the filter runs on every request here
+        if env_data.FILTER_ENABLED:
+            env_data.filterSpikes(plotData)
+
+        if bucketSecs:
+            with timings.span('level.build'):
+                plotData = env_data.aggregate(plotData, bucketSecs, filtered=True)
+
+        return plotData
+
+    def monthBlocks(self, startDateTime, endDateTime, cached=True):
+        """Return (key, load) for each imported month in the range, the key changes when the month is re-imported.
+
+        Query results are never cached, so cached makes no difference here.
+        """
+
+        # NOTE - keyed by stem, a month compressed since it was imported keeps its blocks
+        stamps = {env_data.monthStem(filename): (filename,) + stamp for filename, stamp in env_sqlite.importStamps(DB_PATH).items()}
+        monthStart = qtc.QDateTime(qtc.QDate(startDateTime.date().year(), startDateTime.date().month(), 1), qtc.QTime(0, 0))
+        blocks = []
+
+        while monthStart < endDateTime:
+            stem = env_data.monthStem(monthFilename(monthStart))
+            if stem in stamps:
+                startSecs = monthStart.toSecsSinceEpoch()
+                endSecs = monthStart.addMonths(1).toSecsSinceEpoch()
+                blocks.append(((DB_PATH,) + stamps[stem], lambda startSecs=startSecs, endSecs=endSecs: self.loadBlock(startSecs, endSecs)))
+            monthStart = monthStart.addMonths(1)
+
+        return blocks
+
+    def loadBlock(self, startSecs, endSecs):
+
+        with timings.span('sqlite.query'):
+            blockData = env_sqlite.queryRange(DB_PATH, startSecs, endSecs, self._headers)
+
+        return env_data.filterSpikes(blockData) if env_data.FILTER_ENABLED else blockData
+
+
+def dataReader(startDateTime, endDateTime):
+    """Return a reader for whichever backend the catalog says is present."""
+
+    if catalogBackend() == 'sqlite':
+        return SqliteReader(startDateTime, endDateTime)
+
+    return CsvReader(startDateTime, endDateTime)
+
+
+def loadRange(startSecs, endSecs, maxPoints=None, bucketSecs=None, wanted=None):
+    """Return the samples from startSecs up to endSecs from whichever backend is present, safe off the GUI thread."""
+
+    startDateTime = qtc.QDateTime.fromSecsSinceEpoch(startSecs)
+    endDateTime = qtc.QDateTime.fromSecsSinceEpoch(endSecs)
+
+    return dataReader(startDateTime, endDateTime).newRequest(startDateTime, endDateTime, maxPoints, bucketSecs, wanted)
+
+
+def formatSpan(startSecs, endSecs):
+
+    startText = qtc.QDateTime.fromSecsSinceEpoch(startSecs).toString('dd/MM/yyyy hh:mm')
+    endText = qtc.QDateTime.fromSecsSinceEpoch(endSecs).toString('dd/MM/yyyy hh:mm')
+
+    return '{0} - {1}'.format(startText, endText)
+
+
+def selectionStats(columnIdx, startSecs, endSecs, filtered=False):
+    """Return the range index figures, ({subset: (min, max, mean, count)}, seconds covered), for a column over a span."""
+
+    startDateTime = qtc.QDateTime.fromSecsSinceEpoch(startSecs)
+    endDateTime = qtc.QDateTime.fromSecsSinceEpoch(endSecs)
+
+    with timings.span('index.query'):
+        return env_index.rangeStats(dataReader(startDateTime, endDateTime).monthBlocks(startDateTime, endDateTime), columnIdx, startSecs, endSecs, filtered)
+
+
+def growingDegreeDays(startSecs, endSecs):
+    """Return (degree days, days) from startSecs to endSecs, summed over the daily rollups rather than the samples.
+
+    A day counts when its middle falls inside the span, its extremes come from the whole calendar day.
+    """
+
+    with timings.span('stats.degree_days'):
+        temperatureIdx = env_schema.column('temperature')
+        days = loadRange(startSecs, endSecs, bucketSecs=86400, wanted=(temperatureIdx,))
+        degreeDays = env_metrics.growingDegreeDays(days.minimums.get(temperatureIdx, ()), days.maximums.get(temperatureIdx, ()))
+
+    return sum(degreeDays), len(degreeDays)
+
+
+def accumulatedHours(startSecs, endSecs, filtered=False, cached=True):
+    """Return the (chill, frost, logged) hours over a span, from each month's hour accumulator."""
+
+    startDateTime = qtc.QDateTime.fromSecsSinceEpoch(startSecs)
+    endDateTime = qtc.QDateTime.fromSecsSinceEpoch(endSecs)
+
+    with timings.span('hours.query'):
+        blocks = dataReader(startDateTime, endDateTime).monthBlocks(startDateTime, endDateTime, cached)
+        return env_chill.accumulatedHours(blocks, startSecs, endSecs, filtered)
+
+
+def hoursByYear(startSecs, endSecs, filtered=False):
+    """Return (year, chill, frost, logged) hours for the same dates in each year of the archive that has data for them."""
+
+    catalog = scanCatalog()
+    if not catalog:
+        return []
+
+    firstYear = qtc.QDateTime.fromMSecsSinceEpoch(catalog[0]).date().year()
+    lastYear = qtc.QDateTime.fromMSecsSinceEpoch(catalog[-1]).date().year()
+    startDateTime = qtc.QDateTime.fromSecsSinceEpoch(startSecs)
+    endDateTime = qtc.QDateTime.fromSecsSinceEpoch(endSecs)
+
+    # NOTE - other years are read past the month cache, every year of a long archive would push out the range on show
+    years = []
+    for year in range(firstYear, lastYear + 1):
+        shift = year - startDateTime.date().year()
+        chill, frost, logged = accumulatedHours(startDateTime.addYears(shift).toSecsSinceEpoch(), endDateTime.addYears(shift).toSecsSinceEpoch(),
+                                                filtered, cached=not shift)
+        if logged:
+            years.append((year, chill, frost, logged))
+
+    return years
+
+
+def statisticsFigures(startSecs, endSecs, filtered=False, byYear=True):
+    """Return (degree days, hours by year) for the statistics sheet, hours by year None when byYear is False.
+
+    These read beyond the samples the sheet holds, the daily rollups and every year's months, so the sheet has them
+    worked out on the prefetch thread.
+    """
+
+    return growingDegreeDays(startSecs, endSecs), hoursByYear(startSecs, endSecs, filtered) if byYear else None
+
+
+def climatology():
+    """Return the climatology table, brought up to date with any month added or changed since it was last saved."""
+
+    table = env_climate.climatology(CLIMATOLOGY_PATH)
+    catalog = scanCatalog()
+
+    # NOTE - an archive emptied since the table was saved leaves nothing in it
+    if not catalog:
+        if table.update([]):
+            table.save(CLIMATOLOGY_PATH)
+        return table
+
+    startDateTime = qtc.QDateTime.fromMSecsSinceEpoch(catalog[0])
+    endDateTime = qtc.QDateTime.fromMSecsSinceEpoch(catalog[-1]).addMonths(1)
+
+    # Only the month file stamps are checked once the table is current, no samples are read
+    with timings.span('climatology.update'):
+        if table.update(dataReader(startDateTime, endDateTime).monthBlocks(startDateTime, endDateTime)):
+            table.save(CLIMATOLOGY_PATH)
+
+    return table
+
+
+def monthStamps(startSecs, endSecs):
+    """Return the block keys of the months behind a range, any change to the data changes them."""
+
+    startDateTime = qtc.QDateTime.fromSecsSinceEpoch(startSecs)
+    endDateTime = qtc.QDateTime.fromSecsSinceEpoch(endSecs)
+
+    return [key for key, _ in dataReader(startDateTime, endDateTime).monthBlocks(startDateTime, endDateTime)]
+
+
+def stampedRange(startSecs, endSecs, maxPoints=None, bucketSecs=None, wanted=None):
+    """Return (month stamps, samples) for a range, see loadRange, safe off the GUI thread.
+
+    The stamps are taken first, a month rewritten while it is read then looks newer than the samples, never older.
+    """
+
+    stamps = tuple(monthStamps(startSecs, endSecs))
+
+    return stamps, loadRange(startSecs, endSecs, maxPoints, bucketSecs, wanted)
+
+
+def checkSession(startSecs, endSecs, stamps):
+    """Return the statistics' samples for a range restored from a session snapshot, or None if its months have changed.
+
+    Safe off the GUI thread, the samples let the restored sheet summarise selections as if the range had been loaded.
+    """
+
+    with timings.span('session.check'):
+        if monthStamps(startSecs, endSecs) != stamps:
+            return None
+
+    return loadRange(startSecs, endSecs, wanted=Statistics.COLUMNS)
+
+
+_resourcesRegistered = False
+
+
+def registerResources():
+    """Make the :/plots icons available, from RESOURCE_FILE or, failing that, the compiled resources module."""
+
+    global _resourcesRegistered
+
+    if _resourcesRegistered:
+        return
+
+    if not qtc.QResource.registerResource(RESOURCE_FILE):
+        # NOTE - the generated module registers its data as it is imported
+        import resources
+
+    _resourcesRegistered = True
+
+
+_prefetchPool = None
+
+
+def prefetchPool():
+    """Return the single background thread that loads data beyond the edges of a panned chart."""
+
+    global _prefetchPool
+
+    if _prefetchPool is None:
+        # NOTE - muted, what it loads is not part of the refresh being timed on the GUI thread
+        _prefetchPool = ThreadPoolExecutor(max_workers=1, initializer=timings.mute)
+
+    return _prefetchPool
 
   
 # Temperature graph class
 class Plot(qtch.QChartView):
 
-    def __init__(self, idx):
-        super().__init__()
+    # Emitted from the prefetch thread with (generation, side, startSecs, endSecs, (stamps, data)), delivered on the GUI thread
+    chunkLoaded = qtc.pyqtSignal(int, str, int, int, object)
 
-        startDateTime = qtc.QDateTime(2020, 2, 1, 15, 30)
-        endDateTime = qtc.QDateTime(2020, 2, 1, 16, 00)
+    # Emitted with (startSecs, endSecs) as a span is dragged out, (0, 0) when the selection is cleared
+    rangeSelected = qtc.pyqtSignal(int, int)
 
-        chartTitle = CsvReader(startDateTime, endDateTime)._headers[idx]
-        seriesTitle = chartTitle.split()[0]
+    # Emitted from the prefetch thread with the climatology once it is up to date, None if it couldn't be built
+    climateLoaded = qtc.pyqtSignal(object)
 
-        # Create QChart object
-        chart = qtch.QChart(title=chartTitle)
+    def __init__(self, sensorName):
+        super().__init__()
+
+        # The chart draws its sensor and any others the schema registry puts on the same chart, e.g. the light counts
+        # on the lux chart
+        sensors = env_schema.chartSensors(sensorName)
+        self.sensor = sensors[0]
+        self.idx = self.sensor.column
+
+        # NOTE - titled from the schema rather than a data file's header, building a chart reads nothing from disk
+        chart = qtch.QChart(title=self.sensor.header)
         self.setChart(chart)
 
         # Create series object
-        self.series = qtch.QSplineSeries(name=seriesTitle)
+        self.series = qtch.QSplineSeries(name=self.sensor.title)
         chart.addSeries(self.series)
         #self.series.setColor(qtg.QColor('red'))
 
-        if idx == 7:
-            self.irSeries = qtch.QSplineSeries(name='Infrared')
-            chart.addSeries(self.irSeries)
-            self.visSeries = qtch.QSplineSeries(name='Visible Light')
-            chart.addSeries(self.visSeries)
-            self.fsSeries = qtch.QSplineSeries(name='Full Spectrum')
-            chart.addSeries(self.fsSeries)
+        self.companionSeries = []
+        for sensor in sensors[1:]:
+            series = qtch.QSplineSeries(name=sensor.title)
+            chart.addSeries(series)
+            self.companionSeries.append((series, sensor.column))
 
         # setup the axes
         self.xAxis = qtch.QDateTimeAxis()
         self.yAxis = qtch.QValueAxis()
-        chart.setAxisX(self.xAxis, self.series)
-        chart.setAxisY(self.yAxis, self.series)
-
-        if idx == 7:
-            chart.setAxisX(self.xAxis, self.irSeries)
-            chart.setAxisY(self.yAxis, self.irSeries)
-            chart.setAxisX(self.xAxis, self.visSeries)
-            chart.setAxisY(self.yAxis, self.visSeries)
-            chart.setAxisX(self.xAxis, self.fsSeries)
-            chart.setAxisY(self.yAxis, self.fsSeries)
+        for series in [self.series] + [series for series, _ in self.companionSeries]:
+            chart.setAxisX(self.xAxis, series)
+            chart.setAxisY(self.yAxis, series)
+
+        # Extra series carrying each line on past a gap in the data, keyed by the series they continue
+        self.continuations = {}
+
+        # Draw the spike filtered values rather than the raw ones
+        self.filtered = env_data.FILTER_ENABLED
+
+        # The columns behind each series, in the order the hover readout lists them
+        self.seriesColumns = [(sensor.title, sensor.column) for sensor in sensors]
+
+        # Crosshair and readout that follow the mouse, drawn in chart coordinates on top of the series
+        self.crosshair = qtw.QGraphicsLineItem(chart)
+        self.crosshair.setPen(qtg.QPen(qtg.QColor(120, 120, 120), 1, qtc.Qt.DashLine))
+        self.readoutBox = qtw.QGraphicsRectItem(chart)
+        self.readoutBox.setBrush(qtg.QColor(255, 255, 255, 220))
+        self.readoutBox.setPen(qtg.QPen(qtg.QColor(160, 160, 160)))
+        self.readout = qtw.QGraphicsSimpleTextItem(self.readoutBox)
+        for item in (self.crosshair, self.readoutBox):
+            item.setZValue(100)
+            item.hide()
+        self.setMouseTracking(True)
+
+        # Dragging across the chart selects a span, summarised from the range index on every mouse move
+        self.selection = None
+        self.dragStart = None
+        self.selectionBand = qtw.QGraphicsRectItem(chart)
+        self.selectionBand.setBrush(qtg.QColor(70, 130, 180, 50))
+        self.selectionBand.setPen(qtg.QPen(qtc.Qt.NoPen))
+        self.selectionBox = qtw.QGraphicsRectItem(chart)
+        self.selectionBox.setBrush(qtg.QColor(255, 255, 255, 220))
+        self.selectionBox.setPen(qtg.QPen(qtg.QColor(70, 130, 180)))
+        self.selectionInfo = qtw.QGraphicsSimpleTextItem(self.selectionBox)
+        self.selectionInfo.setPos(4, 2)
+        for item in (self.selectionBand, self.selectionBox):
+            item.setZValue(90)
+            item.hide()
+
+        # Zooming re-queries the visible window once the axis settles, at the level that suits its width. The points
+        # already drawn are magnified straight away so the interaction never waits on a load.
+        self.settingRange = False
+        self.requeryTimer = qtc.QTimer(self, singleShot=True, interval=REQUERY_DELAY_MS)
+        self.requeryTimer.timeout.connect(self.requery)
+        self.xAxis.rangeChanged.connect(self.axisMoved)
+
+        # Panning keeps the span, the loaded window is extended a chunk at a time instead. loadGeneration is bumped
+        # by every full reload so a chunk fetched for the data it replaced is dropped.
+        self.loadedStart = self.loadedEnd = self.viewSpan = 0
+        self.loadGeneration = 0
+        self.pending = set()
+        self.linesUsed = {}
+        self.chunkLoaded.connect(self.extendData)
+        self.trimTimer = qtc.QTimer(self, singleShot=True, interval=REQUERY_DELAY_MS)
+        self.trimTimer.timeout.connect(self.requery)
+
+        # Rolling window lines over the main series, switched on from the context menu. derived maps each kind to its
+        # lines, the deviation goes on its own axis as it is nowhere near the scale of the readings.
+        self.rollingWindow = 86400
+        self.derived = {}
+        self.stdAxis = None
+
+        # Anomaly view: each series drawn as its departure from the climatology mean, over a band between its
+        # percentiles. Both come straight from the precomputed table.
+        self.anomaly = False
+        self.band = None
+        self.climate = None
+
+        # The first time the table is built it reads every month in the archive, so it is brought up to date on the
+        # prefetch thread and the view switched over when it arrives
+        self.climatePending = False
+        self.climateLoaded.connect(self.showAnomaly)
 
         # As we are using curves there is one appearance optimization to do:
         self.setRenderHint(qtg.QPainter.Antialiasing)       
 
     # Define the refresh method
-    def refreshData(self, idx, startDateTime, endDateTime):
-
-        self.series.clear()
+    def refreshData(self, startDateTime, endDateTime):
 
         # Grab data
-        envData = CsvReader(startDateTime, endDateTime)
-        self.plotData = envData.newRequest(startDateTime, endDateTime)
-    
-        # Draw in data
-        if idx == 7:
-
-            self.irSeries.clear()
-            self.visSeries.clear()
-            self.fsSeries.clear()
-
-            for row in self.plotData:
-
-                irVal = float(row[idx-3])
-                visVal = float(row[idx-2])
-                fsVal = float(row[idx-1])
-                luxVal = float(row[idx])
-                timeVal = qtc.QDateTime.fromString(row[0], 'dd/MM/yyyy hh:mm').toMSecsSinceEpoch()
-
-                self.series.append(timeVal, luxVal) 
-                self.irSeries.append(timeVal, irVal)
-                self.visSeries.append(timeVal, visVal)
-                self.fsSeries.append(timeVal, fsVal)
-        else:
-            for row in self.plotData:
+        with timings.span('plot.load'):
+            stamps, plotData = stampedRange(startDateTime.toSecsSinceEpoch(), endDateTime.toSecsSinceEpoch(), self.maxPoints(),
+                                            wanted=self.wantedColumns())
 
-                dataVal = float(row[idx])
-                timeVal = qtc.QDateTime.fromString(row[0], 'dd/MM/yyyy hh:mm').toMSecsSinceEpoch()
+        self.showData(startDateTime, endDateTime, plotData, stamps)
 
-                self.series.append(timeVal, dataVal) 
+    def showData(self, startDateTime, endDateTime, plotData, stamps):
+        """Draw plotData as the range startDateTime to endDateTime, whether just loaded or from a session snapshot.
+
+        stamps are the block keys of the months plotData was read from, see stampedRange.
+        """
+
+        self.plotData = plotData
+        self.plotStamps = stamps
+        self.loadedStart = startDateTime.toSecsSinceEpoch()
+        self.loadedEnd = endDateTime.toSecsSinceEpoch()
+        self.viewSpan = self.loadedEnd - self.loadedStart
+        self.loadGeneration += 1
+        self.pending.clear()
+        self.setSelection(None)
+
+        self.drawSeries()
 
         # Set axis ranges
         timeLength = int(startDateTime.secsTo(endDateTime)/(3600*24))
@@ -430,10 +1060,12 @@ class Plot(qtch.QChartView):
             self.xAxis.setTickCount(timeLength) 
             self.xAxis.setFormat('d') 
         else:
-            self.xAxis.setTickCount(timeLength/3)   
+            self.xAxis.setTickCount(int(timeLength/3))
             self.xAxis.setFormat('d MMM')   
         # self.xAxis.setTickCount(timeLength/(timeLength*0.05)) # 0.0417 is ideal but font size means its cut off
+        self.settingRange = True
         self.xAxis.setRange(startDateTime, endDateTime)
+        self.settingRange = False
 
         # format axis based on time window i.e. only show hh:mm for less than a day
         # if timeLength <= 1:
@@ -442,26 +1074,574 @@ class Plot(qtch.QChartView):
         # else:
         #     self.xAxis.setFormat('dd MMM (hh:mm)')
 
-        if idx == 1:
-            self.yAxis.setRange(-5, 50)
-            self.yAxis.setTickType(0)
-            self.yAxis.setTickAnchor(-5)
-            self.yAxis.setTickInterval(5)
-        elif idx == 2:
-            self.yAxis.setRange(95000, 105000)
-            self.yAxis.setTickType(0)
-            self.yAxis.setTickAnchor(95000)
-            self.yAxis.setTickInterval(500)
-        elif idx == 3:
-            self.yAxis.setRange(0, 100)
-            self.yAxis.setTickType(0)
-            self.yAxis.setTickAnchor(0)
-            self.yAxis.setTickInterval(5)
-        elif idx == 7:
-            self.yAxis.setRange(0, 90000)
-            self.yAxis.setTickType(0)
-            self.yAxis.setTickAnchor(0)
-            self.yAxis.setTickInterval(5000)
+        if not self.anomaly:
+            self.setDefaultRange()
+
+    def setDefaultRange(self):
+        """Set the y axis to the fixed range of the column drawn."""
+
+        low, high, tick = self.sensor.axis
+        self.yAxis.setRange(low, high)
+        self.yAxis.setTickType(0)
+        self.yAxis.setTickAnchor(low)
+        self.yAxis.setTickInterval(tick)
+
+    def drawSeries(self):
+        """Fill the series from self.plotData, using the spike filtered values when self.filtered is set."""
+
+        idx = self.idx
+
+        # The store already holds typed values, only the time needs scaling to the msecs the axis expects
+        timeVals = [timeVal * 1000 for timeVal in self.plotData.time]
+
+        # Draw in data - replace() hands Qt the whole point list at once, appending point by point makes the
+        # spline recalculate its control points every time
+        with timings.span('plot.series_build'):
+            segments = self.plotData.segments()
+
+            for series, columnIdx in self.seriesValues():
+                self.setSegments(series, timeVals, self.drawnValues(self.plotData, columnIdx), segments)
+
+        self.drawDerived()
+        self.drawBand()
+
+    def seriesValues(self):
+        """Return (series, column index) for every series on the chart."""
+
+        return self.companionSeries + [(self.series, self.idx)]
+
+    def wantedColumns(self):
+        """Return the column indices the plot draws, the only ones its requests read."""
+
+        return [columnIdx for _, columnIdx in self.seriesColumns]
+
+    def maxPoints(self):
+        """Return the most points worth drawing across the plot area."""
+
+        # NOTE - the plot area is empty until the chart is first laid out
+        return int(max(self.chart().plotArea().width(), 500) * POINTS_PER_PIXEL)
+
+    @qtc.pyqtSlot(qtc.QDateTime, qtc.QDateTime)
+    def axisMoved(self, minDateTime, maxDateTime):
+
+        self.positionSelection()
+
+        if self.settingRange or not hasattr(self, 'plotData'):
+            return
+
+        # A scroll keeps the span and only needs the edges topping up, a zoom changes it and needs a new level.
+        # Each zoom step restarts the timer, so a burst of key presses costs one query.
+        if abs(minDateTime.secsTo(maxDateTime) - self.viewSpan) > 1:
+            self.requeryTimer.start()
+        elif not self.requeryTimer.isActive():
+            self.prefetchEdges()
+
+    @qtc.pyqtSlot()
+    def requery(self):
+        """Reload the window the x axis now shows plus a margin, raw or at whichever level suits it, and redraw."""
+
+        visibleStart = self.xAxis.min().toSecsSinceEpoch()
+        visibleEnd = self.xAxis.max().toSecsSinceEpoch()
+        self.viewSpan = visibleEnd - visibleStart
+        margin = int(self.viewSpan * PREFETCH_SPANS)
+
+        # The margin is loaded at the visible window's level, so the point budget grows with it
+        with timings.span('plot.requery'):
+            self.plotStamps, self.plotData = stampedRange(visibleStart - margin, visibleEnd + margin, int(self.maxPoints() * (1 + 2 * PREFETCH_SPANS)),
+                                                          wanted=self.wantedColumns())
+
+        self.loadedStart = visibleStart - margin
+        self.loadedEnd = visibleEnd + margin
+        self.loadGeneration += 1
+        self.pending.clear()
+        self.trimTimer.stop()
+
+        self.drawSeries()
+
+    def prefetchEdges(self):
+        """Start loading the next chunk beyond whichever loaded edge the visible window is getting close to."""
+
+        visibleStart = self.xAxis.min().toSecsSinceEpoch()
+        visibleEnd = self.xAxis.max().toSecsSinceEpoch()
+        margin = int(self.viewSpan * PREFETCH_SPANS)
+
+        # A fast pan can overtake the loaded window, the chunk then stretches to cover the whole jump
+        if visibleEnd + margin > self.loadedEnd and 'right' not in self.pending:
+            self.fetchChunk('right', self.loadedEnd, max(self.loadedEnd, visibleEnd) + self.viewSpan)
+        if visibleStart - margin < self.loadedStart and 'left' not in self.pending:
+            self.fetchChunk('left', min(self.loadedStart, visibleStart) - self.viewSpan, self.loadedStart)
+
+        if self.loadedEnd - self.loadedStart > HELD_SPANS * self.viewSpan:
+            self.trimTimer.start()
+
+    def fetchChunk(self, side, startSecs, endSecs):
+
+        self.pending.add(side)
+        generation = self.loadGeneration
+
+        # Chunks are read at the level already drawn so they join the existing data point for point
+        bucketSecs = self.plotData.cadence if isinstance(self.plotData, env_data.EnvAggregate) else 0
+
+        def loaded(future):
+            chunk = None if future.exception() else future.result()
+            self.chunkLoaded.emit(generation, side, startSecs, endSecs, chunk)
+
+        prefetchPool().submit(stampedRange, startSecs, endSecs, bucketSecs=bucketSecs, wanted=self.wantedColumns()).add_done_callback(loaded)
+
+    @qtc.pyqtSlot(int, str, int, int, object)
+    def extendData(self, generation, side, startSecs, endSecs, loaded):
+        """Add a prefetched chunk to the data and draw it as new lines, leaving the points already drawn alone."""
+
+        if generation != self.loadGeneration:
+            return
+        self.pending.discard(side)
+
+        # NOTE - a failed load leaves the edge where it was, the next pan step asks for it again
+        if loaded is None:
+            return
+
+        # The months either side of the join are both behind the data now, a month read by both keeps one stamp
+        stamps, chunk = loaded
+        self.plotStamps = tuple(dict.fromkeys(self.plotStamps + stamps if side == 'right' else stamps + self.plotStamps))
+
+        if side == 'right':
+            self.loadedEnd = endSecs
+        else:
+            self.loadedStart = startSecs
+
+        if len(chunk):
+            with timings.span('plot.series_extend'):
+                self.drawChunk(chunk, side)
+
+                if side == 'right':
+                    self.plotData.extend(chunk)
+                else:
+                    chunk.extend(self.plotData)
+                    self.plotData = chunk
+
+            # A window near the join now takes in samples from both sides, so the rolling lines are worked out again
+            self.drawDerived()
+            self.drawBand()
+
+        # The view may have moved on while the chunk loaded
+        self.prefetchEdges()
+
+    def drawChunk(self, chunk, side):
+        """Draw each run of samples in chunk on a spare line, joined to the existing data when there is no gap."""
+
+        if not len(self.plotData):
+            joined = False
+        elif side == 'right':
+            joined = chunk.time[0] - self.plotData.time[-1] <= self.plotData.cadence * env_data.GAP_FACTOR
+            edgeIdx = len(self.plotData) - 1
+        else:
+            joined = self.plotData.time[0] - chunk.time[-1] <= self.plotData.cadence * env_data.GAP_FACTOR
+            edgeIdx = 0
+
+        timeVals = [timeVal * 1000 for timeVal in chunk.time]
+        segments = chunk.segments()
+
+        for series, columnIdx in self.seriesValues():
+            dataVals = self.drawnValues(chunk, columnIdx)
+            for segmentIdx, (startIdx, endIdx) in enumerate(segments):
+                points = self.points(timeVals[startIdx:endIdx], dataVals[startIdx:endIdx])
+
+                # The line shares the sample at the join, so it runs on from the old one without a break
+                if joined:
+                    edgePoints = self.points([self.plotData.time[edgeIdx] * 1000], self.drawnValues(self.plotData.slice(edgeIdx, edgeIdx + 1), columnIdx))
+                if joined and side == 'right' and segmentIdx == 0:
+                    points = edgePoints + points
+                elif joined and side == 'left' and segmentIdx == len(segments) - 1:
+                    points += edgePoints
+
+                self.spareLine(series).replace(points)
+
+    @staticmethod
+    def points(timeVals, dataVals):
+
+        # NOTE - nan marks a time of year with no baseline in the anomaly view, Qt can't place a point there
+        return [qtc.QPointF(timeVal, dataVal) for timeVal, dataVal in zip(timeVals, dataVals) if dataVal == dataVal]
+
+    def setSegments(self, series, timeVals, dataVals, segments):
+        """Draw each unbroken run of samples as its own line so the spline breaks at gaps instead of bridging them."""
+
+        continuations = self.continuations.setdefault(series, [])
+
+        # Continuation series are only ever added, ranges with fewer gaps leave the spare ones empty
+        while len(continuations) < len(segments) - 1:
+            self.addContinuation(series)
+
+        lines = [series] + continuations
+        for line, (startIdx, endIdx) in zip(lines, segments):
+            line.replace(self.points(timeVals[startIdx:endIdx], dataVals[startIdx:endIdx]))
+        for line in lines[len(segments):]:
+            line.clear()
+
+        self.linesUsed[series] = len(segments)
+
+    def addContinuation(self, series):
+
+        continuation = qtch.QSplineSeries(name=series.name())
+        self.chart().addSeries(continuation)
+        for axis in series.attachedAxes():
+            continuation.attachAxis(axis)
+        continuation.setPen(series.pen())
+        self.chart().legend().markers(continuation)[0].setVisible(False)
+        self.continuations[series].append(continuation)
+
+        return continuation
+
+    def spareLine(self, series):
+        """Return the next unused line for series, adding a continuation if they are all drawn on."""
+
+        used = self.linesUsed.get(series, 0)
+        self.linesUsed[series] = used + 1
+        if used == 0:
+            return series
+
+        continuations = self.continuations.setdefault(series, [])
+        return continuations[used - 1] if used <= len(continuations) else self.addContinuation(series)
+
+    def mousePressEvent(self, event):
+
+        super().mousePressEvent(event)
+        if event.button() == qtc.Qt.LeftButton and hasattr(self, 'plotData'):
+            self.dragStart = event.pos()
+
+    def mouseMoveEvent(self, event):
+
+        super().mouseMoveEvent(event)
+        self.updateCrosshair(event.pos())
+
+        if self.dragStart is not None and event.buttons() & qtc.Qt.LeftButton and abs(event.pos().x() - self.dragStart.x()) > 2:
+            self.setSelection(sorted((self.secsAt(self.dragStart), self.secsAt(event.pos()))))
+            self.rangeSelected.emit(*self.selection)
+
+    def mouseReleaseEvent(self, event):
+
+        super().mouseReleaseEvent(event)
+        if event.button() != qtc.Qt.LeftButton or self.dragStart is None:
+            return
+
+        # A click without a drag clears the selection
+        if abs(event.pos().x() - self.dragStart.x()) <= 2 and self.selection is not None:
+            self.setSelection(None)
+            self.rangeSelected.emit(0, 0)
+        self.dragStart = None
+
+    def resizeEvent(self, event):
+
+        super().resizeEvent(event)
+        self.positionSelection()
+
+    def secsAt(self, viewPos):
+        """Return the epoch seconds under a point of the view, clamped to the plot area."""
+
+        chart = self.chart()
+        plotArea = chart.plotArea()
+        chartPos = chart.mapFromScene(self.mapToScene(viewPos))
+        chartPos.setX(min(max(chartPos.x(), plotArea.left()), plotArea.right()))
+
+        return int(chart.mapToValue(chartPos, self.series).x() / 1000)
+
+    def setSelection(self, selection):
+        """Select (startSecs, endSecs), or clear the selection with None, and summarise it on the chart."""
+
+        self.selection = tuple(selection) if selection else None
+        if self.selection is None:
+            self.selectionBand.hide()
+            self.selectionBox.hide()
+            return
+
+        startSecs, endSecs = self.selection
+        stats, _ = selectionStats(self.idx, startSecs, endSecs, self.filtered)
+
+        lines = [formatSpan(startSecs, endSecs)]
+        for subset, label in (('all', self.seriesColumns[0][0]), ('day', 'Day'), ('night', 'Night')):
+            lines.append('{0}: {1}'.format(label, Statistics.formatStats(stats[subset])))
+        self.selectionInfo.setText('\n'.join(lines))
+
+        self.positionSelection()
+
+    def positionSelection(self):
+        """Move the selection band to wherever its span now sits on the x axis."""
+
+        if self.selection is None:
+            return
+
+        chart = self.chart()
+        plotArea = chart.plotArea()
+        left, right = (min(max(chart.mapToPosition(qtc.QPointF(secs * 1000, 0), self.series).x(), plotArea.left()), plotArea.right())
+                       for secs in self.selection)
+        self.selectionBand.setRect(left, plotArea.top(), right - left, plotArea.height())
+
+        textRect = self.selectionInfo.boundingRect()
+        self.selectionBox.setRect(0, 0, textRect.width() + 8, textRect.height() + 4)
+        self.selectionBox.setPos(plotArea.left() + 8, plotArea.top() + 8)
+
+        self.selectionBand.setVisible(right > left)
+        self.selectionBox.show()
+
+    def leaveEvent(self, event):
+
+        super().leaveEvent(event)
+        self.crosshair.hide()
+        self.readoutBox.hide()
+
+    def nearestSample(self, epochSecs):
+        """Return the index of the sample closest to epochSecs by bisecting the time index, or None if there is none."""
+
+        timeVals = self.plotData.time
+        sampleIdx = bisect.bisect_left(timeVals, epochSecs)
+
+        if sampleIdx == len(timeVals) or (sampleIdx > 0 and epochSecs - timeVals[sampleIdx - 1] < timeVals[sampleIdx] - epochSecs):
+            sampleIdx -= 1
+
+        # Inside a gap the nearest sample can be hours away, better to show nothing than a misleading value
+        if sampleIdx < 0 or abs(timeVals[sampleIdx] - epochSecs) > self.plotData.cadence * env_data.GAP_FACTOR:
+            return None
+
+        return sampleIdx
+
+    def updateCrosshair(self, viewPos):
+        """Move the crosshair to the mouse and show the values of every series at the nearest sample."""
+
+        chart = self.chart()
+        chartPos = chart.mapFromScene(self.mapToScene(viewPos))
+        plotArea = chart.plotArea()
+
+        sampleIdx = None
+        if hasattr(self, 'plotData') and len(self.plotData) and plotArea.contains(chartPos):
+            sampleIdx = self.nearestSample(chart.mapToValue(chartPos, self.series).x() / 1000)
+
+        if sampleIdx is None:
+            self.crosshair.hide()
+            self.readoutBox.hide()
+            return
+
+        sampleTime = self.plotData.time[sampleIdx]
+        lineX = chart.mapToPosition(qtc.QPointF(sampleTime * 1000, 0), self.series).x()
+        self.crosshair.setLine(lineX, plotArea.top(), lineX, plotArea.bottom())
+
+        lines = [qtc.QDateTime.fromMSecsSinceEpoch(sampleTime * 1000).toString('dd/MM/yyyy hh:mm')]
+        if isinstance(self.plotData, env_data.EnvAggregate):
+            lines[0] += ' ({0} mean)'.format(env_data.formatBucket(self.plotData.cadence))
+        for name, columnIdx in self.seriesColumns:
+            lines.append('{0}: {1:.2f}'.format(name, self.plotData.values(columnIdx, self.filtered)[sampleIdx]))
+        self.readout.setText('\n'.join(lines))
+
+        # Keep the readout inside the plot area, flipping it to the left of the line near the right hand edge
+        textRect = self.readout.boundingRect()
+        self.readout.setPos(4, 2)
+        boxWidth = textRect.width() + 8
+        boxX = lineX + 8 if lineX + 8 + boxWidth < plotArea.right() else lineX - 8 - boxWidth
+        boxY = min(max(chartPos.y() - textRect.height() - 12, plotArea.top()), plotArea.bottom() - textRect.height() - 4)
+        self.readoutBox.setRect(0, 0, boxWidth, textRect.height() + 4)
+        self.readoutBox.setPos(boxX, boxY)
+
+        self.crosshair.show()
+        self.readoutBox.show()
+
+    def contextMenuEvent(self, event):
+
+        menu = qtw.QMenu(self)
+
+        for kind, label in (('mean', 'Rolling mean'), ('envelope', 'Rolling min/max'), ('std', 'Rolling standard deviation')):
+            action = menu.addAction(label, lambda kind=kind: self.toggleDerived(kind))
+            action.setCheckable(True)
+            action.setChecked(kind in self.derived)
+            action.setEnabled(not self.anomaly)
+
+        windowMenu = menu.addMenu('Rolling window')
+        for windowSecs in env_rolling.WINDOWS:
+            action = windowMenu.addAction(env_data.formatBucket(windowSecs), lambda windowSecs=windowSecs: self.setRollingWindow(windowSecs))
+            action.setCheckable(True)
+            action.setChecked(windowSecs == self.rollingWindow)
+
+        menu.addSeparator()
+        action = menu.addAction('Anomaly against climatology (building...)' if self.climatePending else 'Anomaly against climatology', self.toggleAnomaly)
+        action.setCheckable(True)
+        action.setChecked(self.anomaly)
+        action.setEnabled(not self.climatePending)
+
+        menu.exec(event.globalPos())
+
+    def toggleDerived(self, kind):
+        """Add or remove one kind of rolling line."""
+
+        chart = self.chart()
+
+        if kind in self.derived:
+            for line in self.derived.pop(kind):
+                for continuation in [line] + self.continuations.pop(line, []):
+                    chart.removeSeries(continuation)
+                self.linesUsed.pop(line, None)
+            if kind == 'std':
+                chart.removeAxis(self.stdAxis)
+                self.stdAxis = None
+            return
+
+        if kind == 'std':
+            self.stdAxis = qtch.QValueAxis(titleText='Std. deviation')
+            chart.addAxis(self.stdAxis, qtc.Qt.AlignRight)
+
+        colour = self.series.pen().color()
+        lines = []
+        for part in (('min', 'max') if kind == 'envelope' else (kind,)):
+            line = qtch.QSplineSeries()
+            chart.addSeries(line)
+            line.attachAxis(self.xAxis)
+            line.attachAxis(self.stdAxis if kind == 'std' else self.yAxis)
+            line.setPen(qtg.QPen(colour.darker(160) if kind == 'mean' else colour.lighter(130), 1.5 if kind == 'mean' else 1, qtc.Qt.DashLine if kind == 'std' else qtc.Qt.SolidLine))
+            lines.append(line)
+        self.derived[kind] = lines
+
+        self.nameDerived()
+        self.drawDerived()
+
+    def setRollingWindow(self, windowSecs):
+
+        self.rollingWindow = windowSecs
+        self.nameDerived()
+        self.drawDerived()
+
+    def nameDerived(self):
+
+        window = env_data.formatBucket(self.rollingWindow)
+        for kind, lines in self.derived.items():
+            for line, part in zip(lines, ('min', 'max') if kind == 'envelope' else (kind,)):
+                line.setName('{0} {1} {2}'.format(self.seriesColumns[0][0], window, part))
+                for continuation in self.continuations.get(line, []):
+                    continuation.setName(line.name())
+
+    def drawDerived(self):
+        """Work out and draw each rolling line that is switched on, the figures are cached per column, window and range."""
+
+        if not self.derived or not hasattr(self, 'plotData'):
+            return
+
+        with timings.span('plot.derived_build'):
+            timeVals = [timeVal * 1000 for timeVal in self.plotData.time]
+            segments = self.plotData.segments()
+
+            for kind, lines in self.derived.items():
+                values = (env_rolling.rolling(self.plotData, self.idx, self.rollingWindow, kind, self.filtered, self.plotStamps)
+                          if len(timeVals) else [[]] * len(lines))
+                for line, lineVals in zip(lines, values):
+                    self.setSegments(line, timeVals, lineVals, segments)
+
+                if kind == 'std':
+                    self.stdAxis.setRange(0, max(values[0], default=0) * 1.1 or 1)
+
+    def toggleAnomaly(self):
+        """Switch between the readings and their departure from the climatology, with its percentile band."""
+
+        if self.anomaly:
+            self.setAnomaly(None)
+            return
+
+        if self.climatePending:
+            return
+        self.climatePending = True
+        self.chart().setTitle('{0} (building climatology...)'.format(self.sensor.header))
+
+        def loaded(future):
+            self.climateLoaded.emit(None if future.exception() else future.result())
+
+        prefetchPool().submit(climatology).add_done_callback(loaded)
+
+    @qtc.pyqtSlot(object)
+    def showAnomaly(self, climate):
+        """Switch to the anomaly view once the climatology has been brought up to date."""
+
+        self.climatePending = False
+        self.chart().setTitle(self.sensor.header)
+        if climate is not None:
+            self.setAnomaly(climate)
+
+    def setAnomaly(self, climate):
+        """Draw against climate, or the readings again when it is None."""
+
+        chart = self.chart()
+        self.anomaly = climate is not None
+
+        if self.anomaly:
+            self.climate = climate
+
+            # The rolling lines are of the readings, they have no place on an anomaly scale
+            for kind in list(self.derived):
+                self.toggleDerived(kind)
+
+            # NOTE - the edge lines are parented to the chart, Python would otherwise collect them from under the area
+            self.band = qtch.QAreaSeries(qtch.QLineSeries(chart), qtch.QLineSeries(chart))
+            self.band.setName('Climatology p{0}-p{1}'.format(*env_climate.BAND))
+            self.band.setColor(qtg.QColor(70, 130, 180, 60))
+            self.band.setBorderColor(qtg.QColor(70, 130, 180, 120))
+            chart.addSeries(self.band)
+            self.band.attachAxis(self.xAxis)
+            self.band.attachAxis(self.yAxis)
+        else:
+            chart.removeSeries(self.band)
+            self.band = None
+            self.climate = None
+
+        if hasattr(self, 'plotData'):
+            self.drawSeries()
+            if not self.anomaly:
+                self.setDefaultRange()
+
+    def drawnValues(self, envData, columnIdx):
+        """Return a column as drawn, the readings or in the anomaly view their departure from the baseline mean."""
+
+        values = envData.values(columnIdx, self.filtered)
+        if not self.anomaly or not len(values):
+            return values
+
+        bucketSecs = envData.cadence if isinstance(envData, env_data.EnvAggregate) else 0
+        means = self.climate.baseline(envData.time, columnIdx, bucketSecs)[0]
+
+        return [value - mean for value, mean in zip(values, means)]
+
+    def drawBand(self):
+        """Draw the climatology percentile band around zero and fit the y axis to it and the anomalies."""
+
+        if not self.anomaly or not hasattr(self, 'plotData'):
+            return
+
+        with timings.span('plot.band_build'):
+            timeVals = [timeVal * 1000 for timeVal in self.plotData.time]
+            bucketSecs = self.plotData.cadence if isinstance(self.plotData, env_data.EnvAggregate) else 0
+            means, lowers, uppers = self.climate.baseline(self.plotData.time, self.idx, bucketSecs) if len(timeVals) else ((), (), ())
+
+            lowerVals = [lower - mean for lower, mean in zip(lowers, means)]
+            upperVals = [upper - mean for upper, mean in zip(uppers, means)]
+            self.band.lowerSeries().replace(self.points(timeVals, lowerVals))
+            self.band.upperSeries().replace(self.points(timeVals, upperVals))
+
+        # Symmetric about zero so above and below normal read the same way
+        extent = max((abs(value) for values in (lowerVals, upperVals, self.drawnValues(self.plotData, self.idx)) for value in values if value == value), default=0)
+        extent = extent * 1.1 or 1
+        self.yAxis.setRange(-extent, extent)
+        self.yAxis.setTickType(0)
+        self.yAxis.setTickAnchor(0)
+        self.yAxis.setTickInterval(self.tickInterval(extent))
+
+    @staticmethod
+    def tickInterval(extent):
+        """Return a 1, 2 or 5 times a power of ten step giving five or so ticks either side of zero."""
+
+        magnitude = 10 ** math.floor(math.log10(extent / 5))
+        for step in (1, 2, 5, 10):
+            if extent / (step * magnitude) <= 5:
+                return step * magnitude
+
+        return 10 * magnitude
+
+    def clearSelection(self):
+
+        if self.selection is not None:
+            self.setSelection(None)
+            self.rangeSelected.emit(0, 0)
 
     # We can enable the user to pan around the chart by overriding the keyPressEvent() method in the QChart Object
     def keyPressEvent(self, event):
@@ -471,18 +1651,128 @@ class Plot(qtch.QChartView):
             qtc.Qt.Key_Right: lambda: self.chart().scroll(-10, 0),
             qtc.Qt.Key_Left: lambda: self.chart().scroll(10, 0),
             qtc.Qt.Key_Greater: self.chart().zoomIn,
-            qtc.Qt.Key_Less: self.chart().zoomOut
+            qtc.Qt.Key_Less: self.chart().zoomOut,
+            qtc.Qt.Key_Escape: self.clearSelection
         }
         callback = keymap.get(event.key())
         if callback:
             callback()
 
+
+class LazyPlot(qtw.QStackedWidget):
+    """Tab showing a placeholder until it is first displayed, when the Plot for its sensor is built.
+
+    A chart, its series and axes cost more to create than the rest of the window, so tabs nobody opens never build
+    one. A range asked for before then is kept and loaded as the chart is built.
+    """
+
+    # Passed on from the Plot once it is built
+    rangeSelected = qtc.pyqtSignal(int, int)
+
+    def __init__(self, sensorName):
+        super().__init__()
+
+        self.sensorName = sensorName
+        self.plot = None
+        self.range = None
+
+        # Data for the range saved in a session snapshot and the month stamps it was read at, drawn instead of
+        # loading when the chart is built
+        self.snapshotData = None
+        self.snapshotStamps = None
+
+        self.placeholder = qtw.QLabel('Loading {0} chart...'.format(env_schema.sensor(sensorName).title), alignment=qtc.Qt.AlignCenter)
+        self.addWidget(self.placeholder)
+
+    def build(self):
+        """Create the Plot if it hasn't been yet and draw the last range asked for, return the Plot."""
+
+        if self.plot is not None:
+            return self.plot
+
+        with timings.span('plot.build'):
+            self.plot = Plot(self.sensorName)
+        self.plot.rangeSelected.connect(self.rangeSelected)
+        self.addWidget(self.plot)
+        self.setCurrentWidget(self.plot)
+
+        if self.snapshotData is not None:
+            self.plot.showData(*self.range, self.snapshotData, self.snapshotStamps)
+            self.snapshotData = None
+        elif self.range is not None:
+            self.plot.refreshData(*self.range)
+
+        return self.plot
+
+    def refreshData(self, startDateTime, endDateTime):
+
+        self.range = (startDateTime, endDateTime)
+        self.snapshotData = None
+        if self.plot is not None:
+            self.plot.refreshData(startDateTime, endDateTime)
+
+    def restore(self, startDateTime, endDateTime, snapshotData, stamps):
+        """Take the range and data of a session snapshot, drawn when the chart is built, None loads the range then."""
+
+        self.range = (startDateTime, endDateTime)
+        self.snapshotData = snapshotData
+        self.snapshotStamps = stamps
+        if self.plot is not None:
+            self.snapshotData = None
+            if snapshotData is not None:
+                self.plot.showData(startDateTime, endDateTime, snapshotData, stamps)
+            else:
+                self.plot.refreshData(startDateTime, endDateTime)
+
+    def snapshot(self):
+        """Return the data drawn for the range, compacted for a session snapshot, or None if the chart doesn't hold it."""
+
+        if self.plot is None or self.range is None:
+            return self.snapshotData
+
+        # NOTE - a zoom or trim can leave less than the range loaded, that chart just loads it next time
+        plot = self.plot
+        startSecs, endSecs = (dateTime.toSecsSinceEpoch() for dateTime in self.range)
+        if not (plot.loadedStart <= startSecs and plot.loadedEnd >= endSecs):
+            return None
+
+        return env_session.compactData(plot.plotData.between(startSecs, endSecs), plot.wantedColumns(), plot.filtered)
+
+    def showEvent(self, event):
+
+        super().showEvent(event)
+
+        # NOTE - built from the event loop so the placeholder is painted while the chart is created and loaded
+        if self.plot is None:
+            qtc.QTimer.singleShot(0, self.build)
+
+
 class Statistics(qtw.QWidget):
 
-    def __init__(self):
+    # Emitted from the prefetch thread with (generation, figures), see statisticsFigures, None if they couldn't be had
+    rangeFiguresLoaded = qtc.pyqtSignal(int, object)
+    selectionFiguresLoaded = qtc.pyqtSignal(int, object)
+    WORKING_TEXT = 'Working...'
+
+    # Temperature, lux for the day/night split, dew point and VPD
+    COLUMNS = env_schema.columns(('temperature', 'lux', 'dewPoint', 'vpd'))
+
+    # The labels filled in for a range, saved in a session snapshot
+    SUMMARY_LABELS = ('dayTempRangeLabel', 'nightTempRangeLabel', 'coverageRangeLabel', 'dewPointRangeLabel', 'vpdRangeLabel',
+                      'degreeDaysRangeLabel', 'chillRangeLabel', 'frostRangeLabel', 'hoursByYearRangeLabel')
+
+    def __init__(self, background=True):
 
         super().__init__()
 
+        # The degree days and the same dates in other years are worked out on the prefetch thread and filled in when
+        # they arrive. An offscreen render, which is taken as soon as the sheet is refreshed, has them worked out first.
+        self.background = background
+        self.rangeGeneration = 0
+        self.selectionGeneration = 0
+        self.rangeFiguresLoaded.connect(self.showRangeFigures)
+        self.selectionFiguresLoaded.connect(self.showSelectionFigures)
+
         # create container widget and layout
         gridLayout = qtw.QGridLayout()
 
@@ -516,6 +1806,27 @@ class Statistics(qtw.QWidget):
         firstFrostYearLabel = qtw.QLabel('Selected Year', self)
         firstFrostLifetimeLabel = qtw.QLabel('Lifetime Average', self)
 
+        coverageLabel = qtw.QLabel('Data Coverage', self)
+        self.coverageRangeLabel = qtw.QLabel('Selected Range', self)
+
+        dewPointLabel = qtw.QLabel('Min/Max/Average Dew Point (*C)', self)
+        self.dewPointRangeLabel = qtw.QLabel('Selected Range', self)
+
+        vpdLabel = qtw.QLabel('Min/Max/Average Vapour Pressure Deficit (kPa)', self)
+        self.vpdRangeLabel = qtw.QLabel('Selected Range', self)
+
+        degreeDaysLabel = qtw.QLabel('Growing Degree Days (base {0:g}*C)'.format(env_metrics.GDD_BASE), self)
+        self.degreeDaysRangeLabel = qtw.QLabel('Selected Range', self)
+
+        chillLabel = qtw.QLabel('Chill Hours ({0:g} to {1:g}*C)'.format(*env_chill.CHILL_RANGE), self)
+        self.chillRangeLabel = qtw.QLabel('Selected Range', self)
+
+        frostLabel = qtw.QLabel('Frost Hours (below {0:g}*C)'.format(env_chill.FROST_BELOW), self)
+        self.frostRangeLabel = qtw.QLabel('Selected Range', self)
+
+        hoursByYearLabel = qtw.QLabel('Chill/Frost Hours Over the Same Dates Each Year', self)
+        self.hoursByYearRangeLabel = qtw.QLabel('Selected Range', self, alignment=qtc.Qt.AlignTop)
+
         # Add widgets to layout
         gridLayout.addWidget(dayTempLabel, 0, 0)
         gridLayout.addWidget(self.dayTempRangeLabel, 1, 0)
@@ -541,59 +1852,278 @@ class Statistics(qtw.QWidget):
         gridLayout.addWidget(firstFrostYearLabel, 4, 2)
         gridLayout.addWidget(firstFrostLifetimeLabel, 5, 2)
 
+        gridLayout.addWidget(coverageLabel, 6, 0)
+        gridLayout.addWidget(self.coverageRangeLabel, 7, 0)
+
+        gridLayout.addWidget(dewPointLabel, 6, 1)
+        gridLayout.addWidget(self.dewPointRangeLabel, 7, 1)
+
+        gridLayout.addWidget(vpdLabel, 6, 2)
+        gridLayout.addWidget(self.vpdRangeLabel, 7, 2)
+
+        gridLayout.addWidget(degreeDaysLabel, 8, 0)
+        gridLayout.addWidget(self.degreeDaysRangeLabel, 9, 0)
+
+        gridLayout.addWidget(chillLabel, 8, 1)
+        gridLayout.addWidget(self.chillRangeLabel, 9, 1)
+
+        gridLayout.addWidget(frostLabel, 8, 2)
+        gridLayout.addWidget(self.frostRangeLabel, 9, 2)
+
+        gridLayout.addWidget(hoursByYearLabel, 0, 3)
+        gridLayout.addWidget(self.hoursByYearRangeLabel, 1, 3, 9, 1)
+
         # Format the shape of the layout, not exactly the best way to do this
-        gridLayout.setRowMinimumHeight(6, 600)
+        gridLayout.setRowMinimumHeight(10, 450)
         gridLayout.setColumnMinimumWidth(3, 600)
         gridLayout.setRowMinimumHeight(0, 50)
         gridLayout.setRowMinimumHeight(3, 50)
+        gridLayout.setRowMinimumHeight(6, 50)
+        gridLayout.setRowMinimumHeight(8, 50)
+
+        self.filtered = env_data.FILTER_ENABLED
+
+        # (startSecs, endSecs, temperature figures, coverage) of a span selected on a chart, shown instead of the range
+        self.selection = None
+
+        # The range's label texts, status bar text and coverage, kept while a selection is shown in the labels
+        self.summary = None
 
 
     def refreshData(self, startDateTime, endDateTime):
 
-        envData = CsvReader(startDateTime, endDateTime)
-        self.plotData = envData.newRequest(startDateTime, endDateTime)
+        with timings.span('stats.load'):
+            envData = dataReader(startDateTime, endDateTime)
+            self.plotData = envData.newRequest(startDateTime, endDateTime, wanted=self.COLUMNS)
 
-        dayTempData = []
-        nightTempData = []
+        self.selection = None
+        self.startSecs = startDateTime.toMSecsSinceEpoch() // 1000
+        self.endSecs = endDateTime.toMSecsSinceEpoch() // 1000
+        self.summarise()
 
-        for row in self.plotData:
-            if float(row[7]) > 40.0: # set to 40 based on wiki lux at sunrise for fully overcast day (for a clear day it is 400)
-                dayTempData.append(float(row[1]))
-            else:
-                nightTempData.append(float(row[1]))
+    def summarise(self):
+        """Fill in the sheet from self.plotData, using the spike filtered values when self.filtered is set."""
+
+        temperature = self.plotData.values(env_schema.column('temperature'), self.filtered)
+        lux = self.plotData.values(env_schema.column('lux'), self.filtered)
+
+        with timings.span('stats.day_night_split'):
+            # set to 40 based on wiki lux at sunrise for fully overcast day (for a clear day it is 400)
+            dayTempData = [tempVal for tempVal, luxVal in zip(temperature, lux) if luxVal > env_index.DAY_LUX]
+            nightTempData = [tempVal for tempVal, luxVal in zip(temperature, lux) if luxVal <= env_index.DAY_LUX]
 
-        dayMinString = '{:.2f}'.format(min(dayTempData))
-        dayMaxString = '{:.2f}'.format(max(dayTempData))
-        dayAvgString = '{:.2f}'.format(sum(dayTempData)/len(dayTempData))
-        nightMinString = '{:.2f}'.format(min(nightTempData))
-        nightMaxString = '{:.2f}'.format(max(nightTempData))
-        nightAvgString = '{:.2f}'.format(sum(nightTempData)/len(nightTempData))
+        statsStart = time.perf_counter()
 
-        dayTempRange = f'Min: {dayMinString}   Max: {dayMaxString}   Average: {dayAvgString}'
-        nightTempRange = f'Min: {nightMinString}   Max: {nightMaxString}   Average: {nightAvgString}'
+        dayTempRange = self.minMaxAvg(dayTempData)
+        nightTempRange = self.minMaxAvg(nightTempData)
 
         self.dayTempRangeLabel.setText(dayTempRange)
         self.nightTempRangeLabel.setText(nightTempRange)
 
-    def statusBarData(self):
+        self.dewPointRangeLabel.setText(self.minMaxAvg(self.plotData.values(env_schema.column('dewPoint'), self.filtered)))
+        self.vpdRangeLabel.setText(self.minMaxAvg(self.plotData.values(env_schema.column('vpd'), self.filtered)))
+        self.showHours(self.startSecs, self.endSecs)
+        self.showWorking(byYear=True)
+
+        # Worked out from the gap index, no need to go back over the samples
+        self.coverage = self.plotData.coverage(self.startSecs, self.endSecs)
+        missingHours = self.plotData.missingSeconds(self.startSecs, self.endSecs) / 3600
+        self.coverageRangeLabel.setText(f'{self.coverage:.1%} ({len(self.plotData.gaps)} gaps, {missingHours:.1f} hours missing)')
+
+        timings.add('stats.summarise', time.perf_counter() - statsStart)
+
+        # NOTE - kept apart from the labels, a selection overwrites them but a session snapshot wants the range
+        self.summary = {'labels': {name: getattr(self, name).text() for name in self.SUMMARY_LABELS},
+                        'status': f'{self.minMaxAvg(temperature)}   Coverage: {self.coverage:.1%}',
+                        'coverage': self.coverage}
+
+        # The same dates in every other year, each year's months are reduced to hourly prefix sums once and kept
+        self.rangeGeneration += 1
+        self.requestFigures(self.rangeFiguresLoaded, self.rangeGeneration, self.startSecs, self.endSecs, True)
+
+    def restoreSummary(self, startSecs, endSecs, summary):
+        """Show the figures of a session snapshot for startSecs to endSecs, the samples follow once it proves current."""
+
+        self.selection = None
+        self.startSecs = startSecs
+        self.endSecs = endSecs
+        self.coverage = summary['coverage']
+        self.summary = summary
+        for name, text in summary['labels'].items():
+            getattr(self, name).setText(text)
+
+        # NOTE - a session closed before the figures arrived saved them as pending, they are worked out again
+        if self.WORKING_TEXT in summary['labels'].values():
+            self.rangeGeneration += 1
+            self.requestFigures(self.rangeFiguresLoaded, self.rangeGeneration, startSecs, endSecs, True)
+
+    def showSelection(self, startSecs, endSecs):
+        """Fill in the sheet for a span selected on a chart, from the range index rather than the samples."""
+
+        stats, covered = selectionStats(env_schema.column('temperature'), startSecs, endSecs, self.filtered)
+        coverage = min(1.0, covered / (endSecs - startSecs)) if endSecs > startSecs else 1.0
+        self.selection = (startSecs, endSecs, stats, coverage)
+
+        self.dayTempRangeLabel.setText(self.formatStats(stats['day']))
+        self.nightTempRangeLabel.setText(self.formatStats(stats['night']))
+        self.dewPointRangeLabel.setText(self.formatStats(selectionStats(env_schema.column('dewPoint'), startSecs, endSecs, self.filtered)[0]['all']))
+        self.vpdRangeLabel.setText(self.formatStats(selectionStats(env_schema.column('vpd'), startSecs, endSecs, self.filtered)[0]['all']))
+        self.showHours(startSecs, endSecs)
+        self.coverageRangeLabel.setText(f'{coverage:.1%} (selection {formatSpan(startSecs, endSecs)})')
+        self.showWorking(byYear=False)
+
+        self.selectionGeneration += 1
+        self.requestFigures(self.selectionFiguresLoaded, self.selectionGeneration, startSecs, endSecs, False)
+
+    def clearSelection(self):
+
+        self.selection = None
+        self.summarise()
+
+    def requestFigures(self, signal, generation, startSecs, endSecs, byYear):
+        """Work out the figures that read beyond the sheet's samples, see statisticsFigures, and emit them on signal."""
+
+        if not self.background:
+            signal.emit(generation, statisticsFigures(startSecs, endSecs, self.filtered, byYear))
+            return
+
+        def loaded(future):
+            signal.emit(generation, None if future.exception() else future.result())
+
+        prefetchPool().submit(statisticsFigures, startSecs, endSecs, self.filtered, byYear).add_done_callback(loaded)
+
+    def showWorking(self, byYear):
+        """Mark the labels filled in by requestFigures as pending, they are kept as they are when worked out in line."""
+
+        if not self.background:
+            return
+
+        self.degreeDaysRangeLabel.setText(self.WORKING_TEXT)
+        if byYear:
+            self.hoursByYearRangeLabel.setText(self.WORKING_TEXT)
+
+    @qtc.pyqtSlot(int, object)
+    def showRangeFigures(self, generation, figures):
+        """Fill in the range's degree days and years once they arrive, unless the range has changed since."""
+
+        if generation != self.rangeGeneration:
+            return
+
+        labels = {'degreeDaysRangeLabel': self.formatDegreeDays(*figures[0]) if figures else 'No data',
+                  'hoursByYearRangeLabel': self.formatHoursByYear(figures[1], self.endSecs - self.startSecs) if figures else 'No data'}
+
+        # NOTE - a selection shown meanwhile keeps the labels, the range's figures wait in the summary for it to clear
+        self.summary['labels'].update(labels)
+        for name, text in labels.items():
+            if self.selection is None or name == 'hoursByYearRangeLabel':
+                getattr(self, name).setText(text)
+
+    @qtc.pyqtSlot(int, object)
+    def showSelectionFigures(self, generation, figures):
+        """Fill in a selection's degree days once they arrive, unless the selection has changed since."""
+
+        if generation != self.selectionGeneration or self.selection is None:
+            return
 
-        data = []
+        self.degreeDaysRangeLabel.setText(self.formatDegreeDays(*figures[0]) if figures else 'No data')
 
-        for row in self.plotData:
-            data.append(float(row[1]))
+    @staticmethod
+    def minMaxAvg(data):
 
-        minString = '{:.2f}'.format(min(data))
-        maxString = '{:.2f}'.format(max(data))
-        avgString = '{:.2f}'.format(sum(data)/len(data))
+        # NOTE - a range can be entirely night or lie in a logger outage
+        if not len(data):
+            return 'No data'
 
-        plotInfoStr = f'Min: {minString}   Max: {maxString}   Average: {avgString}'
+        return Statistics.formatStats((min(data), max(data), sum(data)/len(data), len(data)))
 
-        return plotInfoStr
+    @staticmethod
+    def formatStats(stats):
+        """Format a (min, max, mean, count) tuple the way the sheet shows it."""
+
+        minVal, maxVal, avgVal, count = stats
+        if not count:
+            return 'No data'
+
+        minString = '{:.2f}'.format(minVal)
+        maxString = '{:.2f}'.format(maxVal)
+        avgString = '{:.2f}'.format(avgVal)
+
+        return f'Min: {minString}   Max: {maxString}   Average: {avgString}'
+
+    def showHours(self, startSecs, endSecs):
+
+        chill, frost, logged = accumulatedHours(startSecs, endSecs, self.filtered)
+        self.chillRangeLabel.setText(f'{chill:.1f} hours ({logged:.0f} hours logged)' if logged else 'No data')
+        self.frostRangeLabel.setText(f'{frost:.1f} hours ({logged:.0f} hours logged)' if logged else 'No data')
+
+    @staticmethod
+    def formatDegreeDays(degreeDays, days):
+
+        if not days:
+            return 'No data'
+
+        return f'{degreeDays:.1f} over {days} days'
+
+    @staticmethod
+    def formatHoursByYear(years, spanSecs):
+
+        spanHours = spanSecs / 3600
+
+        return '\n'.join(f'{year}:   Chill: {chill:.1f}   Frost: {frost:.1f}   ({logged / spanHours:.0%} logged)'
+                         for year, chill, frost, logged in years) or 'No data'
+
+    def statusBarData(self):
+
+        if self.selection is not None:
+            startSecs, endSecs, stats, coverage = self.selection
+            return f'Selection {formatSpan(startSecs, endSecs)}: {self.formatStats(stats["all"])}   Coverage: {coverage:.1%}'
+
+        return self.summary['status']
 
 # The main code execution
 
+def memoryReportCli(args):
+    """Load a range without showing the window and print what it costs in memory."""
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = qtw.QApplication(sys.argv[:1])
+    mw = MainWindow()
+
+    if args.start:
+        mw.startDateTimeBox.setDateTime(qtc.QDateTime.fromString(args.start, qtc.Qt.ISODate))
+    periodIdx = mw.endDateTimeBox.findText(args.period)
+    if periodIdx < 0:
+        sys.exit('Period {0} is not available from {1}'.format(args.period, mw.startDateTimeBox.dateTime().toString(qtc.Qt.ISODate)))
+    mw.endDateTimeBox.setCurrentIndex(periodIdx)
+
+    # Nothing is shown offscreen, so build every chart to count what each would hold
+    for plotTab in mw.plotTabs:
+        plotTab.build()
+
+    if args.trace_allocations:
+        print(diagnostics.traceAllocations(mw.refreshAll))
+        print()
+    else:
+        mw.refreshAll()
+
+    print(diagnostics.formatMemoryReport(mw.memoryUsage()))
+
+
 if __name__ == '__main__':
-    app = qtw.QApplication(sys.argv)
+    logging.basicConfig(level=os.environ.get('ENV_VIEWER_LOG', 'WARNING').upper(), format='%(asctime)s %(name)s %(message)s')
+
+    parser = argparse.ArgumentParser(description='Allotment environmental data viewer.')
+    parser.add_argument('--memory-report', action='store_true', help='load a range offscreen, print its memory usage and exit')
+    parser.add_argument('--trace-allocations', action='store_true', help='with --memory-report, also print what the load allocated')
+    parser.add_argument('--start', help='start date of the range, ISO format (default: latest month)')
+    parser.add_argument('--period', default='Day', help='Day, 3 Days, Week, Fortnight, Month or Season (default: Day)')
+    args, qtArgs = parser.parse_known_args()
+
+    if args.memory_report:
+        memoryReportCli(args)
+        sys.exit()
+
+    app = qtw.QApplication(sys.argv[:1] + qtArgs)
     windowsStyle = qtw.QStyleFactory.create('Fusion')
     app.setStyle(windowsStyle)
     mw = MainWindow()
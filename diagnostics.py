@@ -0,0 +1,272 @@
+# DIAGNOSTICS
+# Lightweight instrumentation for the data viewer. Timing spans are cheap enough to leave on permanently, they are
+# summed per stage for each refresh and can be shown in the status bar or written out as structured log lines.
+#
+# Environment switches:
+#   ENV_VIEWER_TIMINGS=1          show the per stage breakdown in the status bar from start up
+#   ENV_VIEWER_PROFILE=<file>     run the next refresh under cProfile and dump the stats to <file>
+#   ENV_VIEWER_TRACEMALLOC=1      log what each refresh leaves allocated, by source line
+
+import os
+import sys
+import time
+import array
+import tracemalloc
+import logging
+import cProfile
+import pstats
+import io
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger('env_viewer.timing')
+
+
+class Timings():
+    """Accumulates wall time per named stage for one refresh of the viewer.
+
+    Background work, such as prefetching or a session check, runs on threads that are muted so its spans don't land
+    in the breakdown of whatever refresh happens to be running at the time.
+    """
+
+    def __init__(self):
+
+        self.refreshCount = 0
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.reset()
+
+    def reset(self):
+
+        with self.lock:
+            self.stages = {}
+            self.calls = {}
+            self.startTime = time.perf_counter()
+
+    def mute(self):
+        """Drop every span recorded on the calling thread from now on, e.g. as a background pool's initializer."""
+
+        self.local.muted = True
+
+    def isMuted(self):
+
+        return getattr(self.local, 'muted', False)
+
+    @contextmanager
+    def muted(self):
+        """Drop the spans recorded on the calling thread inside the with block."""
+
+        previous = self.isMuted()
+        self.local.muted = True
+        try:
+            yield
+        finally:
+            self.local.muted = previous
+
+    def add(self, stage, seconds):
+
+        if self.isMuted():
+            return
+
+        # Months are loaded on worker threads, stages from several threads add up to more than the wall time
+        with self.lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    @contextmanager
+    def span(self, stage):
+        """Time the body of a with block and add it to stage."""
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def total(self):
+
+        return time.perf_counter() - self.startTime
+
+    def breakdown(self, limit=6):
+        """Return the slowest stages as a short string for the status bar."""
+
+        with self.lock:
+            stages = list(self.stages.items())
+
+        slowest = sorted(stages, key=lambda item: item[1], reverse=True)[:limit]
+        parts = ['{0} {1:.0f}ms'.format(stage, seconds * 1000) for stage, seconds in slowest]
+
+        return 'Refresh {0:.0f}ms: '.format(self.total() * 1000) + '  '.join(parts)
+
+    def log(self, **context):
+        """Write one key=value line per stage, plus a total line, for the refresh that just finished."""
+
+        self.refreshCount += 1
+        extra = ''.join(' {0}={1}'.format(key, value) for key, value in context.items())
+
+        # NOTE - logged from a copy, a load pool worker may still add a stage while the lines are written
+        with self.lock:
+            stages = [(stage, seconds, self.calls[stage]) for stage, seconds in self.stages.items()]
+
+        for stage, seconds, calls in stages:
+            logger.info('refresh=%d stage=%s ms=%.2f calls=%d%s', self.refreshCount, stage, seconds * 1000, calls, extra)
+        logger.info('refresh=%d stage=total ms=%.2f%s', self.refreshCount, self.total() * 1000, extra)
+
+
+# Shared recorder, each refresh resets it before the pipeline runs
+timings = Timings()
+
+
+def timingsEnabled():
+
+    return os.environ.get('ENV_VIEWER_TIMINGS', '') not in ('', '0')
+
+
+@contextmanager
+def profileOnce():
+    """Run the with block under cProfile if ENV_VIEWER_PROFILE is set, then clear it so only one refresh is captured."""
+
+    outPath = os.environ.pop('ENV_VIEWER_PROFILE', None)
+    if not outPath:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(outPath)
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(25)
+        logger.info('profile written to %s\n%s', outPath, summary.getvalue())
+
+
+# MEMORY ACCOUNTING
+# The report is split into categories, anything holding data (caches, downsampled levels) registers a provider so it
+# shows up without the report needing to know about it.
+
+memoryLogger = logging.getLogger('env_viewer.memory')
+
+MEMORY_CATEGORIES = ('dataset', 'cache', 'pyramid level', 'chart series')
+
+# Approximate cost of one point in a Qt chart series: a QPointF, plus two more control points for a spline
+QPOINTF_BYTES = 16
+
+_memoryProviders = []
+
+
+def registerMemoryProvider(category, provider):
+    """Add provider, a callable returning {name: bytes}, to the given category of the memory report."""
+
+    _memoryProviders.append((category, provider))
+
+
+def deepSizeOf(obj, seen=None):
+    """Return the bytes held by obj and everything reachable from it through containers and attributes."""
+
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, (str, bytes, bytearray, int, float, array.array)):
+        return size
+    if isinstance(obj, dict):
+        size += sum(deepSizeOf(key, seen) + deepSizeOf(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(deepSizeOf(item, seen) for item in obj)
+
+    if hasattr(obj, '__dict__') and not isinstance(obj, type):
+        size += deepSizeOf(vars(obj), seen)
+    for slot in getattr(type(obj), '__slots__', ()):
+        if hasattr(obj, slot):
+            size += deepSizeOf(getattr(obj, slot), seen)
+
+    return size
+
+
+def seriesBytes(series):
+    """Estimate the memory Qt holds for the points of a chart series."""
+
+    perPoint = QPOINTF_BYTES * 3 if series.type() == series.SeriesTypeSpline else QPOINTF_BYTES
+    return series.count() * perPoint
+
+
+def memoryReport(sections=None):
+    """Return (category, name, bytes) rows for the given {category: {name: bytes}} plus every registered provider."""
+
+    rows = []
+    for category, entries in (sections or {}).items():
+        rows.extend((category, name, size) for name, size in entries.items())
+    for category, provider in _memoryProviders:
+        rows.extend((category, name, size) for name, size in provider().items())
+
+    return rows
+
+
+def formatBytes(size):
+
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return '{0:.1f} {1}'.format(size, unit) if unit != 'B' else '{0} B'.format(size)
+        size /= 1024
+    return '{0:.1f} GiB'.format(size)
+
+
+def formatMemoryReport(rows):
+
+    lines = []
+    grandTotal = 0
+
+    for category in MEMORY_CATEGORIES + tuple(sorted({row[0] for row in rows} - set(MEMORY_CATEGORIES))):
+        entries = [(name, size) for rowCategory, name, size in rows if rowCategory == category]
+        total = sum(size for _, size in entries)
+        grandTotal += total
+
+        lines.append('{0:<40}{1:>12}'.format(category.title(), formatBytes(total)))
+        if not entries:
+            lines.append('    (none)')
+        for name, size in sorted(entries, key=lambda entry: entry[1], reverse=True):
+            lines.append('    {0:<36}{1:>12}'.format(name, formatBytes(size)))
+
+    lines.append('{0:<40}{1:>12}'.format('Total', formatBytes(grandTotal)))
+
+    return '\n'.join(lines)
+
+
+def tracemallocEnabled():
+
+    return os.environ.get('ENV_VIEWER_TRACEMALLOC', '') not in ('', '0')
+
+
+def traceAllocations(func, limit=15):
+    """Call func under tracemalloc and return a summary of what it left allocated, grouped by source line."""
+
+    alreadyTracing = tracemalloc.is_tracing()
+    if not alreadyTracing:
+        tracemalloc.start()
+
+    before = tracemalloc.take_snapshot()
+    func()
+    after = tracemalloc.take_snapshot()
+
+    if not alreadyTracing:
+        tracemalloc.stop()
+
+    # Ignore tracemalloc's own bookkeeping
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(filters).compare_to(before.filter_traces(filters), 'lineno')
+
+    lines = ['Net allocated: {0}'.format(formatBytes(sum(stat.size_diff for stat in stats)))]
+    for stat in stats[:limit]:
+        frame = stat.traceback[0]
+        lines.append('{0:>12} {1:>+8} blocks  {2}:{3}'.format(formatBytes(stat.size_diff), stat.count_diff, os.path.basename(frame.filename), frame.lineno))
+
+    return '\n'.join(lines)
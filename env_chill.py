@@ -0,0 +1,118 @@
+# CHILL AND FROST HOURS
+# Fruit trees need a winter's worth of chill, hours between 0 and 7 *C, before they flower, and hours below freezing
+# are what damage blossom. Each month is reduced once to the chill and frost hours of each clock hour, kept as prefix
+# sums, so the hours between any two dates are a pair of subtractions however long the span. That keeps comparing
+# the same dates across every year in the archive cheap.
+
+import bisect
+from array import array
+from itertools import accumulate
+from collections import OrderedDict
+
+import env_data
+import env_schema
+from diagnostics import registerMemoryProvider, timings
+
+CHILL_RANGE = (0.0, 7.0)
+
+# Below this a sample counts towards frost hours
+FROST_BELOW = 0.0
+
+HOUR = 3600
+
+HOURS_CACHE_SIZE = env_data.MONTH_CACHE_SIZE * 2
+
+
+class HourAccumulator():
+    """Prefix sums of the chill, frost and logged hours of each clock hour of a block of samples."""
+
+    __slots__ = ('hourStarts', 'chill', 'frost', 'logged')
+
+    def __init__(self, envData, filtered=False):
+
+        timeVals = envData.time
+        temperature = envData.values(env_schema.column('temperature'), filtered)
+        lowest, highest = CHILL_RANGE
+
+        # Each sample stands for one sample period, so a clock hour with a gap in it counts for less than a full hour
+        weight = envData.cadence / HOUR
+        offset = env_data.bucketOffset(timeVals[0]) if len(timeVals) else 0
+        hourStarts = array('q')
+        chill = array('d')
+        frost = array('d')
+        logged = array('d')
+
+        for timeVal, tempVal in zip(timeVals, temperature):
+            hourStart = (timeVal + offset) // HOUR * HOUR - offset
+            if not hourStarts or hourStarts[-1] != hourStart:
+                hourStarts.append(hourStart)
+                chill.append(0.0)
+                frost.append(0.0)
+                logged.append(0.0)
+            chill[-1] += weight if lowest <= tempVal <= highest else 0.0
+            frost[-1] += weight if tempVal < FROST_BELOW else 0.0
+            logged[-1] += weight
+
+        # NOTE - capped at an hour, a sample period measured across a change of cadence can overfill one
+        self.hourStarts = hourStarts
+        self.chill = array('d', accumulate((min(1.0, hours) for hours in chill), initial=0.0))
+        self.frost = array('d', accumulate((min(1.0, hours) for hours in frost), initial=0.0))
+        self.logged = array('d', accumulate((min(1.0, hours) for hours in logged), initial=0.0))
+
+    def query(self, startSecs, endSecs):
+        """Return (chill, frost, logged) hours of the clock hours starting from startSecs up to endSecs."""
+
+        start = bisect.bisect_left(self.hourStarts, startSecs)
+        end = bisect.bisect_left(self.hourStarts, endSecs)
+
+        return self.chill[end] - self.chill[start], self.frost[end] - self.frost[start], self.logged[end] - self.logged[start]
+
+    def nbytes(self):
+
+        return sum(column.itemsize * len(column) for column in (self.hourStarts, self.chill, self.frost, self.logged))
+
+
+_hoursCache = OrderedDict()
+
+
+def accumulatedHours(blocks, startSecs, endSecs, filtered=False):
+    """Return (chill, frost, logged) hours from startSecs to endSecs, to the nearest clock hour.
+
+    blocks is a list of (key, load) per month as for env_index.rangeStats, each month is reduced the first time it is
+    asked for and never loaded again while its key is unchanged.
+    """
+
+    totals = [0.0, 0.0, 0.0]
+
+    for key, load in blocks:
+        cacheKey = (key, filtered)
+        accumulator = _hoursCache.get(cacheKey)
+        if accumulator is None:
+            monthData = load()
+            with timings.span('hours.build'):
+                accumulator = HourAccumulator(monthData, filtered)
+            _hoursCache[cacheKey] = accumulator
+        _hoursCache.move_to_end(cacheKey)
+
+        for idx, hours in enumerate(accumulator.query(startSecs, endSecs)):
+            totals[idx] += hours
+
+    while len(_hoursCache) > HOURS_CACHE_SIZE:
+        _hoursCache.popitem(last=False)
+
+    return tuple(totals)
+
+
+def clearCache():
+
+    _hoursCache.clear()
+
+
+def _hoursCacheUsage():
+
+    # NOTE - the month's file name is third from the end of both a CSV and a SQLite block key
+    return {'hours {0}'.format(str(key[-3]).replace('\\', '/').rsplit('/', 1)[-1]): accumulator.nbytes()
+            for (key, _), accumulator in _hoursCache.items()}
+
+
+registerMemoryProvider('range index', _hoursCacheUsage)
@@ -0,0 +1,349 @@
+# CLIMATOLOGY
+# The normal reading for every day of the year and half hour of the day, worked out across all the years in the
+# archive, so a range can be drawn as its departure from normal. Each month is reduced once to the mean of each half
+# hour and written into its year's table, only the days it touches are worked out again, so a new month costs a
+# month's worth of work rather than a pass over the archive. The table is kept in a sidecar file beside the data.
+#
+# Five or so years give too few readings per half hour for percentiles to mean much, so each day's figures are drawn
+# from a window of POOL_DAYS either side of it, the usual practice for daily climate normals.
+
+import os
+import math
+import time
+import threading
+from array import array
+from itertools import accumulate
+
+import env_data
+from diagnostics import registerMemoryProvider, timings
+
+SLOT_SECS = 1800
+SLOTS_PER_DAY = 86400 // SLOT_SECS
+
+# Days of a leap year, a 28 day February just leaves the 29th empty
+DAYS = 366
+MONTH_DAYS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+MONTH_STARTS = tuple(accumulate(MONTH_DAYS[:-1], initial=0))
+
+POOL_DAYS = 7
+
+PERCENTILES = (10, 50, 90)
+
+# Percentiles shaded either side of the baseline
+BAND = (10, 90)
+
+# Every column but time, derived ones included
+COLUMNS = tuple(range(1, len(env_data.FIELD_TYPECODES)))
+
+TABLE_VERSION = 3
+
+
+def slotIndices(timeVals):
+    """Return the day of year * SLOTS_PER_DAY + half hour of each local timestamp."""
+
+    indices = array('I')
+    hourStart = hourEnd = 0
+
+    # NOTE - localtime once an hour rather than per sample, which also keeps each clock change in the right place
+    for timeVal in timeVals:
+        if not hourStart <= timeVal < hourEnd:
+            local = time.localtime(timeVal)
+            hourStart = timeVal - local.tm_min * 60 - local.tm_sec
+            hourEnd = hourStart + 3600
+            base = (MONTH_STARTS[local.tm_mon - 1] + local.tm_mday - 1) * SLOTS_PER_DAY + local.tm_hour * (3600 // SLOT_SECS)
+        indices.append(base + (timeVal - hourStart) // SLOT_SECS)
+
+    return indices
+
+
+def percentile(ordered, pct):
+    """Return the pct percentile of a sorted list, interpolating between the two nearest values."""
+
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def emptyTable():
+
+    return array('d', [math.nan]) * (DAYS * SLOTS_PER_DAY)
+
+
+def monthDays(month):
+    """Return the days of year of a month, 1 to 12."""
+
+    return range(MONTH_STARTS[month - 1], MONTH_STARTS[month - 1] + MONTH_DAYS[month - 1])
+
+
+def clearDays(tables, days):
+    """Set every half hour of the given days to nan in a year's tables."""
+
+    positions = [slot * DAYS + day for slot in range(SLOTS_PER_DAY) for day in days]
+    for table in tables.values():
+        for position in positions:
+            table[position] = math.nan
+
+
+class Climatology():
+    """Mean and percentiles of each column per day of year and half hour, built up a month at a time.
+
+    years holds the half hour means of every year, per column, laid out half hour major so the days either side of
+    one are a slice. means and percentiles are laid out day major, indexed by slotIndices. months holds the block key
+    each month was taken in at and placed the (year, month) its half hours were written to.
+    """
+
+    def __init__(self):
+
+        # NOTE - one table is shared by every chart and brought up to date on the worker pool, so it is only changed
+        # or read under the lock
+        self.lock = threading.RLock()
+        self.months = {}
+        self.placed = {}
+        self.years = {}
+        self.means = {column: emptyTable() for column in COLUMNS}
+        self.percentiles = {column: {pct: emptyTable() for pct in PERCENTILES} for column in COLUMNS}
+        self.prefixes = {}
+
+    def update(self, blocks):
+        """Bring the table in line with the archive's months, return True when the table changed.
+
+        blocks is a list of (key, load) for every month in the archive as for env_index.rangeStats. Months that are
+        new or have changed are taken in, months no longer among them are taken out.
+        """
+
+        with self.lock:
+            # NOTE - the month's file name is third from the end of both a CSV and a SQLite block key
+            blocks = {str(key[-3]).replace('\\', '/').rsplit('/', 1)[-1]: (key, load) for key, load in blocks}
+
+            # Taken out first, a month renamed, e.g. compressed, is then written back under its new name
+            known = dict(self.months)
+            dirty = set()
+            for monthName in set(self.months) - set(blocks):
+                dirty.update(self.removeMonth(monthName))
+
+            for monthName, (key, load) in blocks.items():
+                if self.months.get(monthName) == key:
+                    continue
+
+                # A changed month comes out first, one that is now empty or shorter mustn't leave its old days behind
+                if monthName in self.months:
+                    dirty.update(self.removeMonth(monthName))
+
+                monthData = load()
+                with timings.span('climatology.add_month'):
+                    days = self.addMonth(monthData)
+                dirty.update(days)
+                self.months[monthName] = key
+                if days:
+                    local = time.localtime(monthData.time[0])
+                    self.placed[monthName] = (local.tm_year, local.tm_mon)
+
+            # NOTE - an empty month changes no days, but its key still has to be saved
+            if not dirty:
+                return self.months != known
+
+            # Each day's window takes in the days either side, so those are worked out again too
+            days = sorted({(day + shift) % DAYS for day in dirty for shift in range(-POOL_DAYS, POOL_DAYS + 1)})
+            with timings.span('climatology.rebuild'):
+                self.rebuild(days)
+
+            return True
+
+    def addMonth(self, monthData):
+        """Write a month's half hour means into its year's table, return the days of year it covers."""
+
+        if not len(monthData):
+            return set()
+
+        local = time.localtime(monthData.time[0])
+        days = monthDays(local.tm_mon)
+
+        tables = self.years.setdefault(local.tm_year, {column: emptyTable() for column in COLUMNS})
+        slots = env_data.aggregate(monthData, SLOT_SECS)
+
+        # A re-read month replaces what was there, a shortened one mustn't leave its old days behind
+        clearDays(tables, days)
+
+        for position, slotIdx in enumerate(slotIndices([timeVal - SLOT_SECS // 2 for timeVal in slots.time])):
+            # NOTE - the last half hour of a month can spill into the next day of year, keep it in this month's days
+            day, slot = divmod(slotIdx, SLOTS_PER_DAY)
+            if day not in days:
+                continue
+            for column in COLUMNS:
+                if column < len(slots.columns):
+                    tables[column][slot * DAYS + day] = slots.columns[column][position]
+
+        return set(days)
+
+    def removeMonth(self, monthName):
+        """Clear a month that has gone from the archive out of its year's table, return the days of year it covered."""
+
+        del self.months[monthName]
+        place = self.placed.pop(monthName, None)
+        if place is None:
+            return set()
+
+        # NOTE - another name may have been written to the same month since, its half hours are left alone
+        if place in self.placed.values():
+            return set()
+
+        year, month = place
+        days = monthDays(month)
+        if any(placedYear == year for placedYear, _ in self.placed.values()):
+            clearDays(self.years[year], days)
+        else:
+            del self.years[year]
+
+        return set(days)
+
+    def rebuild(self, days):
+        """Work out the mean and percentiles of the given days of year from the window of days around each."""
+
+        self.prefixes.clear()
+
+        for column in COLUMNS:
+            stores = [tables[column] for tables in self.years.values()]
+            means = self.means[column]
+            percentiles = self.percentiles[column]
+
+            for slot in range(SLOTS_PER_DAY):
+                base = slot * DAYS
+                for day in days:
+                    values = []
+                    lo = day - POOL_DAYS
+                    hi = day + POOL_DAYS + 1
+                    for store in stores:
+                        if lo < 0:
+                            values.extend(store[base + DAYS + lo:base + DAYS])
+                        if hi > DAYS:
+                            values.extend(store[base:base + hi - DAYS])
+                        values.extend(store[base + max(lo, 0):base + min(hi, DAYS)])
+
+                    ordered = sorted(value for value in values if value == value)
+                    position = day * SLOTS_PER_DAY + slot
+                    if ordered:
+                        means[position] = sum(ordered) / len(ordered)
+                        for pct in PERCENTILES:
+                            percentiles[pct][position] = percentile(ordered, pct)
+                    else:
+                        means[position] = math.nan
+                        for pct in PERCENTILES:
+                            percentiles[pct][position] = math.nan
+
+    def tables(self, column):
+        """Return the (mean, lower, upper) tables drawn for a column."""
+
+        return self.means[column], self.percentiles[column][BAND[0]], self.percentiles[column][BAND[1]]
+
+    def baseline(self, timeVals, column, bucketSecs=0):
+        """Return (mean, lower, upper) arrays, the table's figures for each timestamp, nan where there are none.
+
+        Samples look up their half hour. A bucket wider than a half hour, stamped at its middle, gets the average of
+        the half hours it spans from prefix sums, which is only an approximation for the percentiles.
+        """
+
+        with self.lock:
+            if bucketSecs <= SLOT_SECS:
+                indices = slotIndices(timeVals)
+                return tuple(array('d', [table[idx] for idx in indices]) for table in self.tables(column))
+
+            slots = bucketSecs // SLOT_SECS
+            firsts = slotIndices([timeVal - bucketSecs // 2 for timeVal in timeVals])
+            results = []
+
+            for table in self.tables(column):
+                sums, counts = self.prefixSums(table)
+                averaged = array('d')
+                for first in firsts:
+                    last = min(first + slots, (first // SLOTS_PER_DAY + 1) * SLOTS_PER_DAY)
+                    count = counts[last] - counts[first]
+                    averaged.append((sums[last] - sums[first]) / count if count else math.nan)
+                results.append(averaged)
+
+            return tuple(results)
+
+    def prefixSums(self, table):
+
+        prefix = self.prefixes.get(id(table))
+        if prefix is None:
+            prefix = (array('d', accumulate((value if value == value else 0.0 for value in table), initial=0.0)),
+                      array('I', accumulate((value == value for value in table), initial=0)))
+            self.prefixes[id(table)] = prefix
+
+        return prefix
+
+    def nbytes(self):
+
+        with self.lock:
+            arrays = ([table for tables in self.years.values() for table in tables.values()] + list(self.means.values())
+                      + [table for tables in self.percentiles.values() for table in tables.values()]
+                      + [column for prefix in self.prefixes.values() for column in prefix])
+
+            return sum(column.itemsize * len(column) for column in arrays)
+
+    def save(self, path):
+        """Write the table to path, an archive on a read only share just goes without.
+
+        Kept beside the data like the month sidecars, so it is written as JSON and raw arrays rather than a pickle.
+        """
+
+        with self.lock:
+            years = sorted(self.years)
+            description = {'version': TABLE_VERSION, 'columns': COLUMNS, 'percentiles': PERCENTILES, 'years': years,
+                           'months': self.months, 'placed': self.placed}
+            tables = ([self.years[year][column] for year in years for column in COLUMNS] + [self.means[column] for column in COLUMNS]
+                      + [self.percentiles[column][pct] for column in COLUMNS for pct in PERCENTILES])
+            try:
+                env_data.writeColumnFile(path, description, tables)
+            except OSError:
+                pass
+
+    @classmethod
+    def load(cls, path):
+        """Return the table saved at path, or an empty one when there is none or it was saved by another version."""
+
+        climatology = cls()
+        try:
+            description, tables = env_data.readColumnFile(path)
+        except (OSError, ValueError):
+            return climatology
+
+        size = DAYS * SLOTS_PER_DAY
+        years = description.get('years', [])
+        if ((description.get('version'), tuple(description.get('columns', ())), tuple(description.get('percentiles', ())))
+                != (TABLE_VERSION, COLUMNS, PERCENTILES)):
+            return climatology
+        if len(tables) != (len(years) + 1 + len(PERCENTILES)) * len(COLUMNS) or any(table is None or table.typecode != 'd' or len(table) != size for table in tables):
+            return climatology
+
+        # Tables come back in the order save wrote them: each year's columns, the means, then each column's percentiles
+        tables = iter(tables)
+        climatology.years = {year: {column: next(tables) for column in COLUMNS} for year in years}
+        climatology.means = {column: next(tables) for column in COLUMNS}
+        climatology.percentiles = {column: {pct: next(tables) for pct in PERCENTILES} for column in COLUMNS}
+        climatology.months = {monthName: tuple(key) for monthName, key in description['months'].items()}
+        climatology.placed = {monthName: tuple(place) for monthName, place in description['placed'].items()}
+
+        return climatology
+
+
+_climatologies = {}
+
+
+def climatology(path):
+    """Return the climatology kept at path, read from the file the first time."""
+
+    if path not in _climatologies:
+        _climatologies[path] = Climatology.load(path)
+
+    return _climatologies[path]
+
+
+def _climatologyUsage():
+
+    return {path.replace('\\', '/').rsplit('/', 1)[-1]: climatology.nbytes() for path, climatology in list(_climatologies.items())}
+
+
+registerMemoryProvider('climatology', _climatologyUsage)
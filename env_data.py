@@ -0,0 +1,982 @@
+# ENVIRONMENTAL DATA STORE
+# Holds logger samples in contiguous typed arrays, one per column, instead of a list of eight strings per row.
+# A month of 30 minute data is ~1,500 rows, at 1 minute cadence over several years the list-of-str layout costs
+# hundreds of bytes a sample while the arrays below cost 44.
+
+import os
+import sys
+import bz2
+import csv
+import glob
+import gzip
+import json
+import lzma
+import time
+import bisect
+import struct
+import operator
+import threading
+from array import array
+from itertools import repeat
+from collections import OrderedDict, Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import env_schema
+import env_metrics
+from diagnostics import registerMemoryProvider, timings
+
+# One typecode and field name per logger column, see env_schema
+COLUMN_TYPECODES = tuple(sensor.typecode for sensor in env_schema.LOGGER)
+
+RECORD_FIELDS = tuple(sensor.name for sensor in env_schema.LOGGER)
+
+# Derived columns follow the logger's own, worked out once when a month is read (see env_metrics)
+DERIVED_TYPECODES = tuple(typecode for _, _, typecode, _, _ in env_metrics.METRICS)
+DERIVED_FIELDS = tuple(field for field, _, _, _, _ in env_metrics.METRICS)
+DERIVED_HEADERS = [header for _, header, _, _, _ in env_metrics.METRICS]
+
+# Every column a block holds, logged then derived
+FIELD_TYPECODES = COLUMN_TYPECODES + DERIVED_TYPECODES
+FIELDS = RECORD_FIELDS + DERIVED_FIELDS
+
+# The logger's normal sample period, used until a block has enough samples to measure its own
+DEFAULT_CADENCE = 1800
+
+# A step longer than this many sample periods counts as a gap in the data
+GAP_FACTOR = 1.5
+
+
+class EnvRecord():
+    """Read only view of one sample, for code that wants row access rather than columns.
+
+    A field the block wasn't read with (see projection) is None.
+    """
+
+    __slots__ = RECORD_FIELDS
+
+    def __init__(self, *values):
+
+        for field, value in zip(RECORD_FIELDS, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+
+        raise AttributeError('EnvRecord is read only')
+
+    def __getitem__(self, idx):
+
+        return getattr(self, RECORD_FIELDS[idx])
+
+    def __len__(self):
+
+        return len(RECORD_FIELDS)
+
+    def __repr__(self):
+
+        return 'EnvRecord({0})'.format(', '.join('{0}={1!r}'.format(field, getattr(self, field)) for field in RECORD_FIELDS))
+
+
+def detectGaps(timeVals):
+    """Return (cadence, gaps) for a sorted time array, gaps holds the index of every sample that follows a gap.
+
+    This is the one pass over the timestamps, done at ingest. Slicing and joining blocks afterwards keeps the gap
+    index up to date without looking at the samples again.
+    """
+
+    if len(timeVals) < 2:
+        return DEFAULT_CADENCE, array('I')
+
+    steps = array('q', map(operator.sub, timeVals[1:], timeVals))
+    cadence = Counter(steps).most_common(1)[0][0]
+    limit = cadence * GAP_FACTOR
+
+    return cadence, array('I', [idx + 1 for idx, step in enumerate(steps) if step > limit])
+
+
+def projection(wanted=None):
+    """Return the column indices to read for a request for the wanted ones, None asks for every column.
+
+    Time is always read, and so are the inputs of any derived column asked for.
+    """
+
+    if wanted is None:
+        return tuple(range(len(FIELD_TYPECODES)))
+
+    needed = {0} | set(wanted)
+    for idx, (_, _, _, inputs, _) in enumerate(env_metrics.METRICS, len(COLUMN_TYPECODES)):
+        if idx in needed:
+            needed.update(inputs)
+
+    return tuple(sorted(needed))
+
+
+class EnvData():
+    """A block of samples stored as one typed array per column, sorted by time.
+
+    gaps is the compact gap index, the positions of the samples that follow a gap, and cadence the sample period in
+    seconds both were measured against. A block read for only some columns holds None in place of the others.
+    """
+
+    __slots__ = ('headers', 'columns', 'gaps', 'cadence', 'masks', 'filtered')
+
+    def __init__(self, headers, columns=None, gaps=None, cadence=DEFAULT_CADENCE, masks=None, filtered=None):
+
+        self.headers = headers
+        self.columns = columns if columns is not None else [array(typecode) for typecode in FIELD_TYPECODES]
+        self.gaps = gaps if gaps is not None else array('I')
+        self.cadence = cadence
+
+        # Spike filter results per column index: masks flag the outliers, filtered holds the column with each one
+        # replaced by its rolling median. Both travel with the raw columns so switching views costs nothing.
+        self.masks = masks if masks is not None else {}
+        self.filtered = filtered if filtered is not None else {}
+
+    @property
+    def time(self):
+
+        return self.columns[0]
+
+    def column(self, idx):
+
+        return self.columns[idx]
+
+    def values(self, idx, filtered=False):
+        """Return the raw column, or the spike filtered one when asked for and available."""
+
+        if filtered:
+            return self.filtered.get(idx, self.columns[idx])
+
+        return self.columns[idx]
+
+    def __len__(self):
+
+        return len(self.columns[0])
+
+    def missing(self, wanted=None):
+        """Return the indices of the columns a request for wanted needs that this block wasn't read with."""
+
+        return tuple(idx for idx in projection(wanted) if self.columns[idx] is None)
+
+    def fill(self, other):
+        """Take in the columns other holds and this block doesn't, other being the same samples read for more columns."""
+
+        for idx, column in enumerate(other.columns):
+            if self.columns[idx] is None and column is not None:
+                self.columns[idx] = column
+                if idx in other.masks:
+                    self.masks[idx] = other.masks[idx]
+                    self.filtered[idx] = other.filtered[idx]
+
+    def __getitem__(self, idx):
+
+        return EnvRecord(*(None if column is None else column[idx] for column in self.columns[:len(RECORD_FIELDS)]))
+
+    def __iter__(self):
+
+        return self.records()
+
+    def records(self):
+
+        # NOTE - time is always read, so it sets the length and a column left out stands in as None throughout
+        for values in zip(*(repeat(None) if column is None else column for column in self.columns[:len(RECORD_FIELDS)])):
+            yield EnvRecord(*values)
+
+    def indexOf(self, epochSecs):
+        """Return the index of the first sample at or after epochSecs."""
+
+        return bisect.bisect_left(self.columns[0], epochSecs)
+
+    def slice(self, startIdx, endIdx):
+
+        # Keep the gaps strictly inside the slice, one at startIdx would only mark the slice's own first sample
+        firstGap = bisect.bisect_right(self.gaps, startIdx)
+        lastGap = bisect.bisect_left(self.gaps, endIdx)
+        gaps = array('I', [gapIdx - startIdx for gapIdx in self.gaps[firstGap:lastGap]])
+
+        masks = {idx: mask[startIdx:endIdx] for idx, mask in self.masks.items()}
+        filtered = {idx: column[startIdx:endIdx] for idx, column in self.filtered.items()}
+
+        columns = [None if column is None else column[startIdx:endIdx] for column in self.columns]
+
+        return EnvData(self.headers, columns, gaps, self.cadence, masks, filtered)
+
+    def between(self, startSecs, endSecs):
+        """Return the samples from startSecs up to but not including endSecs, missing samples are simply absent."""
+
+        return self.slice(self.indexOf(startSecs), self.indexOf(endSecs))
+
+    def extend(self, other):
+
+        offset = len(self)
+
+        # Filter results only survive a join if both sides have them, an empty block takes on the other's
+        if not offset and not self.masks:
+            self.masks = {idx: bytearray() for idx in other.masks}
+            self.filtered = {idx: array(column.typecode) for idx, column in other.filtered.items()}
+        for idx in list(self.masks):
+            if idx in other.masks:
+                self.masks[idx].extend(other.masks[idx])
+                self.filtered[idx].extend(other.filtered[idx])
+            else:
+                del self.masks[idx]
+                del self.filtered[idx]
+
+        # Only the join between the two blocks needs checking, each block already knows its own gaps
+        if offset and len(other):
+            self.cadence = min(self.cadence, other.cadence)
+            if other.time[0] - self.time[-1] > self.cadence * GAP_FACTOR:
+                self.gaps.append(offset)
+        elif len(other):
+            self.cadence = other.cadence
+
+        self.gaps.extend(gapIdx + offset for gapIdx in other.gaps)
+
+        # A column missing from either side is missing from the join
+        for idx, (column, otherColumn) in enumerate(zip(self.columns, other.columns)):
+            if column is None or otherColumn is None:
+                self.columns[idx] = None
+            else:
+                column.extend(otherColumn)
+
+    @classmethod
+    def concatenate(cls, blocks):
+
+        blocks = list(blocks)
+        merged = cls(blocks[0].headers if blocks else [])
+        for block in blocks:
+            merged.extend(block)
+
+        return merged
+
+    def segments(self):
+        """Return the (startIdx, endIdx) of each unbroken run of samples."""
+
+        bounds = [0] + list(self.gaps) + [len(self)]
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    def missingSeconds(self, startSecs, endSecs):
+        """Return the time between startSecs and endSecs not covered by a sample, from the gap index alone."""
+
+        if not len(self):
+            return max(0, endSecs - startSecs)
+
+        timeVals = self.columns[0]
+        missing = max(0, timeVals[0] - startSecs) + max(0, endSecs - timeVals[-1] - self.cadence)
+        missing += sum(timeVals[gapIdx] - timeVals[gapIdx - 1] - self.cadence for gapIdx in self.gaps)
+
+        return missing
+
+    def coverage(self, startSecs, endSecs):
+        """Return the fraction of startSecs to endSecs that has data."""
+
+        span = endSecs - startSecs
+        if span <= 0:
+            return 1.0
+
+        return max(0.0, 1.0 - self.missingSeconds(startSecs, endSecs) / span)
+
+    def nbytes(self):
+
+        return (sum(column.itemsize * len(column) for column in self.columns if column is not None) + self.gaps.itemsize * len(self.gaps)
+                + sum(len(mask) for mask in self.masks.values())
+                + sum(column.itemsize * len(column) for column in self.filtered.values()))
+
+
+# Epoch of each 'dd/MM/yyyy hh' seen so far, mktime is slow and there are only 24 distinct hours a day
+_hourEpochs = {}
+
+
+def parseTimestamp(text):
+    """Convert a logger 'dd/MM/yyyy hh:mm' timestamp to local epoch seconds."""
+
+    hourKey = text[:13]
+    hourEpoch = _hourEpochs.get(hourKey)
+
+    if hourEpoch is None:
+        hourEpoch = int(time.mktime((int(text[6:10]), int(text[3:5]), int(text[0:2]), int(text[11:13]), 0, 0, 0, 0, -1)))
+        _hourEpochs[hourKey] = hourEpoch
+
+    return hourEpoch + int(text[14:16]) * 60
+
+
+def numberColumn(typecode, texts):
+    """Convert one column of number strings into a typed array in a single pass."""
+
+    if typecode != 'I':
+        return array(typecode, map(float, texts))
+
+    # NOTE - hourly averaged files hold half counts, e.g. 0.5, which are truncated
+    try:
+        return array(typecode, map(int, texts))
+    except ValueError:
+        return array(typecode, map(int, map(float, texts)))
+
+
+def parseRows(headers, rows, wanted=None):
+    """Build an EnvData from csv rows of strings, skipping blank or truncated lines.
+
+    Only the columns a request for wanted needs are converted, see projection, each with the same converters
+    parseFast uses.
+    """
+
+    # NOTE - a header that doesn't name every logger column is taken to be in the logger's own order
+    positions = env_schema.headerPositions(headers) or tuple(range(len(COLUMN_TYPECODES)))
+    needed = projection(wanted)
+    rows = [row for row in rows if len(row) > max(positions)]
+
+    columns = [array(COLUMN_TYPECODES[0], map(parseTimestamp, map(operator.itemgetter(positions[0]), rows)))]
+    for idx, (typecode, position) in enumerate(zip(COLUMN_TYPECODES[1:], positions[1:]), 1):
+        columns.append(numberColumn(typecode, list(map(operator.itemgetter(position), rows))) if idx in needed else None)
+
+    return buildMonth(loggerHeaders(headers, positions), columns, needed)
+
+
+def loggerHeaders(headers, positions):
+    """Return a file's header labels in EnvData column order, the registry's label for any the file lacks."""
+
+    return [headers[position] if position < len(headers) else sensor.header for sensor, position in zip(env_schema.LOGGER, positions)]
+
+
+def buildMonth(headers, columns, wanted=None):
+    """Wrap freshly parsed logger columns in an EnvData, adding the wanted derived columns and the gap index."""
+
+    needed = projection(wanted)
+    with timings.span('csv.derive'):
+        columns += env_metrics.deriveColumns(columns, [sensor.column in needed for sensor in env_schema.DERIVED])
+
+    cadence, gaps = detectGaps(columns[0])
+
+    return EnvData(headers + DERIVED_HEADERS, columns, gaps, cadence)
+
+
+# FAST PARSER
+# The logger writes a header naming its columns, then a 'dd/MM/yyyy hh:mm' timestamp and plain numbers on every line.
+# A file like that is parsed a column at a time from the text, with no csv.reader and no row lists, each column
+# converted by a single map() straight into its typed array. Columns are found through the schema registry by their
+# header names, a sensor added by newer firmware is stepped over without being converted. Anything else, a header
+# missing a column, a quoted field, a misplaced timestamp, goes through csv.reader and parseRows as before.
+
+# Characters in a 'dd/MM/yyyy hh:mm' timestamp, the comma after it sits at this index on every line
+STAMP_WIDTH = 16
+
+MINUTE_SECS = {'{0:02d}'.format(minute): minute * 60 for minute in range(60)}
+
+
+def parseFast(text, wanted=None):
+    """Build an EnvData from the text of a logger file in the logger's own layout, or return None for anything else.
+
+    Every line is checked but only the columns a request for wanted needs are converted, see projection.
+    """
+
+    header, _, body = text.partition('\n')
+    headers = header.rstrip('\r').split(',')
+    positions = env_schema.headerPositions(headers)
+    if positions is None:
+        return None
+
+    # Every field of every line in one flat list, each column is then a strided slice of it
+    width = len(headers)
+    lines = body.splitlines()
+    fields = ','.join(lines).split(',') if lines else []
+
+    # Blank and truncated lines are skipped as parseRows skips them, a line with extra fields isn't the logger's
+    if len(fields) != width * len(lines):
+        commas = list(map(str.count, lines, repeat(',')))
+        if max(commas) >= width:
+            return None
+        lines = [line for line, count in zip(lines, commas) if count == width - 1]
+        fields = ','.join(lines).split(',') if lines else []
+
+    # NOTE - a line out of step would put a number where a timestamp should be, so this also checks the alignment
+    stamps = fields[positions[0]::width]
+    if set(map(len, stamps)) - {STAMP_WIDTH}:
+        return None
+
+    needed = projection(wanted)
+    try:
+        columns = [numberColumn(typecode, fields[position::width]) if idx in needed else None
+                   for idx, (typecode, position) in enumerate(zip(COLUMN_TYPECODES, positions)) if idx]
+
+        hours = [stamp[:13] for stamp in stamps]
+        for hourKey in set(hours).difference(_hourEpochs):
+            parseTimestamp(hourKey + ':00')
+        timeVals = array(COLUMN_TYPECODES[0], map(operator.add, map(_hourEpochs.__getitem__, hours),
+                                                  map(MINUTE_SECS.__getitem__, [stamp[14:] for stamp in stamps])))
+    except (ValueError, KeyError, OverflowError):
+        return None
+
+    return buildMonth(loggerHeaders(headers, positions), [timeVals] + columns, needed)
+
+
+def readMonth(filename, wanted=None):
+    """Parse one monthly logger file into an EnvData, a compressed one from its sidecar when that is current.
+
+    wanted limits the columns parsed, see projection. A compressed month is always read whole, it is only
+    decompressed once and its sidecar has to hold every column.
+    """
+
+    compressed = isCompressed(filename)
+    if compressed:
+        monthData = readSidecar(filename)
+        if monthData is not None:
+            return monthData
+        wanted = None
+
+    with timings.span('csv.file_open'):
+        fh = openMonth(filename)
+    with fh, timings.span('csv.read'):
+        text = fh.read()
+
+    with timings.span('csv.parse'):
+        monthData = parseFast(text, wanted)
+    if monthData is None:
+        with timings.span('csv.parse_generic'):
+            csvReader = csv.reader(text.splitlines())
+            headers = next(csvReader, [])
+            monthData = parseRows(headers, csvReader, wanted)
+
+    if compressed:
+        writeSidecar(filename, monthData)
+
+    return monthData
+
+
+# COMPRESSED MONTHS
+# Older months can be kept gzip, xz or bzip2 compressed, PT_<Mon>_<yyyy>.CSV.gz and so on, and are decompressed as
+# they are parsed. The parsed columns are then written to a sidecar file beside the month, keyed on the compressed
+# file's size and modification time, so each month is decompressed once per change rather than once per session.
+# Sidecars sit in the archive, which may be a shared drive, so they hold JSON and raw array bytes, never a pickle:
+# a tampered one can at worst be rejected or give wrong numbers, it can't run code in the viewer.
+
+OPENERS = {'.gz': gzip.open, '.xz': lzma.open, '.bz2': bz2.open}
+
+# Looked for in this order, a month still being logged to is plain CSV and wins over an older compressed copy
+MONTH_SUFFIXES = ('',) + tuple(OPENERS)
+
+# Sidecars go beside the months unless ENV_DATA_SIDECAR_DIR points somewhere writable, e.g. for a read only share
+SIDECAR_DIR = os.environ.get('ENV_DATA_SIDECAR_DIR', '')
+
+SIDECAR_VERSION = 2
+
+# Column file layout: COLUMN_FILE_MAGIC, a uint32 length and that many bytes of JSON describing the file and the
+# typecode and length of each array, then the arrays back to back
+COLUMN_FILE_MAGIC = b'ENVCOLS1'
+
+
+def isCompressed(filename):
+
+    return os.path.splitext(filename)[1].lower() in OPENERS
+
+
+def openMonth(filename):
+    """Open a month file as text, decompressing on the fly when it is compressed."""
+
+    opener = OPENERS.get(os.path.splitext(filename)[1].lower())
+    if opener is None:
+        return open(filename, newline='')
+
+    return opener(filename, 'rt', newline='')
+
+
+def monthStem(filename):
+    """Return 'PT_<Mon>_<yyyy>' for a month file, compressed or not."""
+
+    name = os.path.basename(filename)
+    if isCompressed(name):
+        name = os.path.splitext(name)[0]
+
+    return os.path.splitext(name)[0]
+
+
+def monthPath(filename):
+    """Return the file holding the month a plain .CSV path names, which may be a compressed copy, or the path itself."""
+
+    for suffix in MONTH_SUFFIXES:
+        if os.path.exists(filename + suffix):
+            return filename + suffix
+
+    return filename
+
+
+def monthFiles(dataDir):
+    """Return every month file in dataDir, one per month, preferring a plain CSV to a compressed copy of it."""
+
+    # NOTE - the extension is matched in either case as the logger writes .CSV but glob is case sensitive off Windows
+    found = {}
+    for suffix in MONTH_SUFFIXES:
+        for path in glob.glob(os.path.join(dataDir, 'PT_*_*.[Cc][Ss][Vv]' + suffix)):
+            found.setdefault(monthStem(path), path)
+
+    return sorted(found.values())
+
+
+def sidecarPath(filename):
+
+    return os.path.join(SIDECAR_DIR or os.path.dirname(filename), '.{0}.columns'.format(os.path.basename(filename)))
+
+
+def writeColumnFile(path, description, columns):
+    """Write a JSON description and a list of typed arrays (or None) to path, raising OSError if it can't.
+
+    Written under a temporary name and moved into place, a half written file is never read.
+    """
+
+    layout = [None if column is None else [column.typecode, len(column)] for column in columns]
+    header = json.dumps(dict(description, byteorder=sys.byteorder, layout=layout)).encode()
+
+    with open(path + '.tmp', 'wb') as fh:
+        fh.write(COLUMN_FILE_MAGIC + struct.pack('<I', len(header)) + header)
+        for column in columns:
+            if column is not None:
+                column.tofile(fh)
+    os.replace(path + '.tmp', path)
+
+
+def readColumnFile(path):
+    """Return (description, columns) from a file written by writeColumnFile.
+
+    Raises OSError if it can't be read and ValueError if it isn't a complete column file.
+    """
+
+    with open(path, 'rb') as fh:
+        try:
+            if fh.read(len(COLUMN_FILE_MAGIC)) != COLUMN_FILE_MAGIC:
+                raise ValueError('not a column file')
+            description = json.loads(fh.read(struct.unpack('<I', fh.read(4))[0]))
+
+            columns = []
+            for entry in description['layout']:
+                if entry is None:
+                    columns.append(None)
+                    continue
+                typecode, count = entry
+                column = array(typecode)
+                column.fromfile(fh, count)
+                if description['byteorder'] != sys.byteorder:
+                    column.byteswap()
+                columns.append(column)
+        except (struct.error, EOFError, KeyError, TypeError) as error:
+            raise ValueError('truncated or malformed column file') from error
+
+    return description, columns
+
+
+def readSidecar(filename):
+    """Return the month saved beside a compressed file, or None if there is none or the file has changed since."""
+
+    stat = os.stat(filename)
+    try:
+        with timings.span('csv.sidecar_read'):
+            description, columns = readColumnFile(sidecarPath(filename))
+    except (OSError, ValueError):
+        return None
+
+    # NOTE - JSON gives lists back, the fields and stamp are compared as the tuples they were written from
+    if (description.get('version'), tuple(description.get('fields', ())), tuple(description.get('stamp', ()))) != (SIDECAR_VERSION, FIELDS, (stat.st_size, stat.st_mtime_ns)):
+        return None
+    if len(columns) != len(FIELDS) + 1 or [None if column is None else column.typecode for column in columns[:-1]] != list(FIELD_TYPECODES):
+        return None
+
+    return EnvData(description['headers'], columns[:-1], columns[-1], description['cadence'])
+
+
+def writeSidecar(filename, monthData):
+    """Save a parsed compressed month beside it, a read only archive just goes without."""
+
+    stat = os.stat(filename)
+    description = {'version': SIDECAR_VERSION, 'fields': FIELDS, 'stamp': (stat.st_size, stat.st_mtime_ns),
+                   'headers': monthData.headers, 'cadence': monthData.cadence}
+
+    try:
+        writeColumnFile(sidecarPath(filename), description, monthData.columns + [monthData.gaps])
+    except OSError:
+        pass
+
+
+# SPIKE FILTER
+# Hampel filter: a sample is an outlier when it is further from the median of its neighbours than FILTER_SIGMAS
+# scaled median absolute deviations. The window slides along a sorted list so each step is an insert and a delete
+# rather than a fresh sort.
+
+FILTER_ENABLED = os.environ.get('ENV_DATA_FILTER', '') not in ('', '0')
+
+# Samples either side of the one being tested, 3 is an hour and a half at the logger's normal cadence
+FILTER_HALF_WINDOW = 3
+FILTER_SIGMAS = 3.0
+
+# Smallest deviation from the rolling median ever treated as a spike, per sensor name (the floor in the schema
+# registry). Without it flat runs, such as zero lux all night, have no spread and the first light of dawn would be
+# flagged.
+FILTER_FLOORS = {sensor.name: sensor.floor for sensor in env_schema.LOGGER if sensor.floor is not None}
+
+# Scales the median absolute deviation to a standard deviation for normally distributed data
+MAD_SCALE = 1.4826
+
+
+def hampel(values, halfWindow, nSigmas, floor):
+    """Return (mask, filtered) for one column, mask is 1 for each outlier and filtered has it replaced by the median."""
+
+    count = len(values)
+    mask = bytearray(count)
+    filtered = array(values.typecode, values)
+    window = []
+    lo = hi = 0
+
+    for idx in range(count):
+        while hi < min(count, idx + halfWindow + 1):
+            bisect.insort(window, values[hi])
+            hi += 1
+        while lo < idx - halfWindow:
+            del window[bisect.bisect_left(window, values[lo])]
+            lo += 1
+
+        median = window[len(window) // 2]
+        deviation = abs(values[idx] - median)
+
+        # The cheap test first, most samples are nowhere near the floor and never need the MAD
+        if deviation <= floor:
+            continue
+
+        spread = sorted(abs(value - median) for value in window)[len(window) // 2]
+        if deviation > max(floor, nSigmas * MAD_SCALE * spread):
+            mask[idx] = 1
+            filtered[idx] = median
+
+    return mask, filtered
+
+
+def filterSpikes(envData):
+    """Add the spike masks and filtered columns to envData, unless it already has them."""
+
+    with timings.span('filter.hampel'):
+        for name, floor in FILTER_FLOORS.items():
+            idx = env_schema.column(name)
+            if idx not in envData.masks and envData.columns[idx] is not None:
+                envData.masks[idx], envData.filtered[idx] = hampel(envData.columns[idx], FILTER_HALF_WINDOW, FILTER_SIGMAS, floor)
+
+    # A derived column isn't filtered itself, it is derived again from the filtered inputs and flagged wherever one was
+    derivedIdxs = range(len(COLUMN_TYPECODES), len(envData.columns))
+    wanted = [idx not in envData.masks and envData.columns[idx] is not None for idx in derivedIdxs]
+    if any(wanted):
+        inputs = [envData.filtered.get(idx, column) for idx, column in enumerate(envData.columns[:len(COLUMN_TYPECODES)])]
+        derived = env_metrics.deriveColumns(inputs, wanted)
+        for idx, (_, _, _, metricInputs, _), column in zip(derivedIdxs, env_metrics.METRICS, derived):
+            if column is not None:
+                envData.masks[idx] = bytearray(any(flags) for flags in zip(*(envData.masks[inputIdx] for inputIdx in metricInputs)))
+                envData.filtered[idx] = column
+
+    return envData
+
+
+def prepareMonth(filename, filterEnabled, wanted=None):
+    """Read a month file and run the optional filter stage, the unit of work handed to the load pool."""
+
+    monthData = readMonth(filename, wanted)
+    if filterEnabled:
+        filterSpikes(monthData)
+
+    return monthData
+
+
+def _prepareMuted(filename, filterEnabled, wanted=None):
+
+    with timings.muted():
+        return prepareMonth(filename, filterEnabled, wanted)
+
+
+# MONTH CACHE
+# Every GO used to re-read each month file once per tab, the parsed months are kept here keyed by file name and
+# invalidated when the file's size or modification time changes (the current month is still being written to).
+
+MONTH_CACHE_SIZE = 36
+
+# Months missing from the cache are read concurrently. Threads suit a network mounted archive where the time goes
+# waiting on I/O, ENV_DATA_LOAD_POOL=process also spreads the parsing over every core.
+LOAD_WORKERS = int(os.environ.get('ENV_DATA_LOAD_WORKERS', '0')) or min(8, (os.cpu_count() or 1) * 2)
+LOAD_POOL = os.environ.get('ENV_DATA_LOAD_POOL', 'thread')
+
+_monthCache = OrderedDict()
+_loadPool = None
+
+# NOTE - the GUI thread and the prefetch thread load through the same caches, every lookup, insert, eviction and walk
+# of them, and every change to a cached block, is made holding this lock. Files are read with it released.
+_cacheLock = threading.RLock()
+
+
+def loadPool():
+
+    global _loadPool
+
+    if _loadPool is None:
+        poolClass = ProcessPoolExecutor if LOAD_POOL == 'process' else ThreadPoolExecutor
+        _loadPool = poolClass(max_workers=LOAD_WORKERS)
+
+    return _loadPool
+
+
+def loadMonths(filenames, wanted=None):
+    """Return the EnvData for each monthly logger file in the order given, reading uncached files concurrently.
+
+    wanted limits the columns read, see projection. A cached month read for fewer columns only has the missing ones
+    parsed and added to it, so whatever columns the requests so far have needed stay in the one cached block.
+    """
+
+    monthData = [None] * len(filenames)
+    misses = []
+
+    for idx, filename in enumerate(filenames):
+        stat = os.stat(filename)
+        key = (stat.st_size, stat.st_mtime_ns)
+
+        with _cacheLock:
+            cached = _monthCache.get(filename)
+            missing = cached[1].missing(wanted) if cached is not None and cached[0] == key else None
+            if missing == ():
+                _monthCache.move_to_end(filename)
+                monthData[idx] = cached[1]
+
+                # Filtering may have been switched on since the month was cached, the masks are kept with it once made
+                if FILTER_ENABLED and len(cached[1].masks) < len(FILTER_FLOORS) + len(DERIVED_TYPECODES):
+                    filterSpikes(cached[1])
+            else:
+                misses.append((idx, filename, key, missing if missing is not None else wanted))
+
+    # A single file isn't worth the hand off to the pool
+    if len(misses) == 1:
+        loaded = [prepareMonth(misses[0][1], FILTER_ENABLED, misses[0][3])]
+    elif misses:
+        # The pool's workers take on whether the caller is recording, a background load stays out of the refresh's timings
+        prepare = _prepareMuted if timings.isMuted() else prepareMonth
+        loaded = loadPool().map(prepare, [miss[1] for miss in misses], [FILTER_ENABLED] * len(misses), [miss[3] for miss in misses])
+    else:
+        loaded = []
+
+    # Results come back in submission order, so the months stay in time order however the reads finish
+    for (idx, filename, key, _), data in zip(misses, loaded):
+        # A top up is merged into the month it tops up, which the same file stamp says holds the same samples
+        with _cacheLock:
+            cached = _monthCache.get(filename)
+            stale = cached is not None and cached[0] == key and len(cached[1]) != len(data)
+            if cached is not None and cached[0] == key and not stale:
+                cached[1].fill(data)
+                data = cached[1]
+                if FILTER_ENABLED:
+                    filterSpikes(data)
+
+        if stale:
+            data = prepareMonth(filename, FILTER_ENABLED, wanted)
+        monthData[idx] = data
+
+        with _cacheLock:
+            _monthCache[filename] = (key, data)
+            _monthCache.move_to_end(filename)
+
+    with _cacheLock:
+        while len(_monthCache) > MONTH_CACHE_SIZE:
+            _monthCache.popitem(last=False)
+
+    return monthData
+
+
+def loadMonth(filename, wanted=None):
+    """Return the EnvData for a monthly logger file, from the cache when the file is unchanged."""
+
+    return loadMonths([filename], wanted)[0]
+
+
+def clearCache():
+
+    with _cacheLock:
+        _monthCache.clear()
+        _levelCache.clear()
+
+
+def _monthCacheUsage():
+
+    with _cacheLock:
+        return {filename.replace('\\', '/').rsplit('/', 1)[-1]: monthData.nbytes() for filename, (_, monthData) in _monthCache.items()}
+
+
+registerMemoryProvider('cache', _monthCacheUsage)
+
+
+# AGGREGATE LEVELS
+# A Season of 1 minute data is well over 100,000 points for a chart a couple of thousand pixels wide. Each month can
+# also be held at coarser fixed width buckets, the mean, min and max of the samples in each, and a view is drawn from
+# the finest level that still fits its width. Levels are built from the cached months the first time they are asked for.
+
+# Bucket widths in seconds, finest first
+LEVEL_BUCKETS = (300, 900, 3600, 3 * 3600, 12 * 3600, 86400)
+
+LEVEL_CACHE_SIZE = MONTH_CACHE_SIZE * 2
+
+
+class EnvAggregate(EnvData):
+    """An EnvData whose samples are time buckets, stamped at the bucket's middle.
+
+    columns hold the mean of each bucket, minimums and maximums the extremes per column index and counts the number of
+    samples behind each bucket. cadence is the bucket width.
+    """
+
+    __slots__ = ('counts', 'minimums', 'maximums')
+
+    def __init__(self, headers, columns=None, gaps=None, cadence=DEFAULT_CADENCE, counts=None, minimums=None, maximums=None):
+
+        if columns is None:
+            columns = [array('q')] + [array('d') for _ in FIELD_TYPECODES[1:]]
+        super().__init__(headers, columns, gaps, cadence)
+
+        self.counts = counts if counts is not None else array('I')
+        self.minimums = minimums if minimums is not None else {}
+        self.maximums = maximums if maximums is not None else {}
+
+    def slice(self, startIdx, endIdx):
+
+        block = EnvData.slice(self, startIdx, endIdx)
+
+        return EnvAggregate(self.headers, block.columns, block.gaps, self.cadence, self.counts[startIdx:endIdx],
+                            {idx: column[startIdx:endIdx] for idx, column in self.minimums.items()},
+                            {idx: column[startIdx:endIdx] for idx, column in self.maximums.items()})
+
+    def extend(self, other):
+
+        if not len(self) and not self.minimums:
+            self.minimums = {idx: array(column.typecode) for idx, column in other.minimums.items()}
+            self.maximums = {idx: array(column.typecode) for idx, column in other.maximums.items()}
+
+        super().extend(other)
+
+        self.counts.extend(other.counts)
+        for idx in list(self.minimums):
+            if idx in other.minimums:
+                self.minimums[idx].extend(other.minimums[idx])
+                self.maximums[idx].extend(other.maximums[idx])
+            else:
+                del self.minimums[idx]
+                del self.maximums[idx]
+
+    def nbytes(self):
+
+        return (super().nbytes() + self.counts.itemsize * len(self.counts)
+                + sum(column.itemsize * len(column) for column in self.minimums.values())
+                + sum(column.itemsize * len(column) for column in self.maximums.values()))
+
+
+def levelGaps(timeVals, bucketSecs):
+    """Return the gap index of a level, an empty bucket between two full ones is a gap."""
+
+    limit = bucketSecs * GAP_FACTOR
+
+    return array('I', [idx for idx in range(1, len(timeVals)) if timeVals[idx] - timeVals[idx - 1] > limit])
+
+
+def bucketOffset(epochSecs):
+    """Return the UTC offset that aligns buckets on local midnight, so a day bucket is a calendar day."""
+
+    return time.localtime(epochSecs).tm_gmtoff
+
+
+def aggregate(envData, bucketSecs, filtered=False):
+    """Return envData reduced to one EnvAggregate sample per bucketSecs wide bucket that holds any samples."""
+
+    timeVals = envData.time
+    if not len(timeVals):
+        return EnvAggregate(envData.headers, cadence=bucketSecs)
+
+    offset = bucketOffset(timeVals[0])
+    keys = [(timeVal + offset) // bucketSecs for timeVal in timeVals]
+
+    # One pass finds where each bucket starts, the reductions below then run over array slices
+    starts = [0] + [idx for idx in range(1, len(keys)) if keys[idx] != keys[idx - 1]]
+    bounds = list(zip(starts, starts[1:] + [len(keys)]))
+
+    columns = [array('q', [keys[start] * bucketSecs - offset + bucketSecs // 2 for start, _ in bounds])]
+    minimums = {}
+    maximums = {}
+
+    for idx in range(1, len(envData.columns)):
+        values = envData.values(idx, filtered)
+        if values is None:
+            columns.append(None)
+            continue
+        buckets = [values[start:end] for start, end in bounds]
+        columns.append(array('d', [sum(bucket) / len(bucket) for bucket in buckets]))
+        minimums[idx] = array(values.typecode, map(min, buckets))
+        maximums[idx] = array(values.typecode, map(max, buckets))
+
+    counts = array('I', [end - start for start, end in bounds])
+
+    return EnvAggregate(envData.headers, columns, levelGaps(columns[0], bucketSecs), bucketSecs, counts, minimums, maximums)
+
+
+def chooseLevel(spanSecs, cadence, maxPoints):
+    """Return the finest bucket width that draws spanSecs in at most maxPoints, or None when the raw samples fit."""
+
+    if spanSecs / cadence <= maxPoints:
+        return None
+
+    for bucketSecs in LEVEL_BUCKETS:
+        if bucketSecs > cadence and spanSecs / bucketSecs <= maxPoints:
+            return bucketSecs
+
+    return LEVEL_BUCKETS[-1]
+
+
+_levelCache = OrderedDict()
+
+
+def loadLevels(filenames, bucketSecs, wanted=None):
+    """Return the EnvAggregate at bucketSecs for each monthly logger file, building any that aren't cached.
+
+    A cached level built for fewer columns than wanted is built again from the month, topped up to the wanted ones.
+    """
+
+    levels = [None] * len(filenames)
+    misses = []
+
+    for idx, filename in enumerate(filenames):
+        stat = os.stat(filename)
+        key = (stat.st_size, stat.st_mtime_ns)
+
+        # Raw and filtered levels are separate entries, the means of a spiky month differ from the filtered ones
+        cacheKey = (filename, bucketSecs, FILTER_ENABLED)
+        with _cacheLock:
+            cached = _levelCache.get(cacheKey)
+            if cached is not None and cached[0] == key and not cached[1].missing(wanted):
+                _levelCache.move_to_end(cacheKey)
+                levels[idx] = cached[1]
+            else:
+                misses.append((idx, cacheKey, key))
+
+    if misses:
+        monthData = loadMonths([cacheKey[0] for _, cacheKey, _ in misses], wanted)
+        # NOTE - aggregated under the lock, the months are cached blocks the other thread may be filtering
+        with timings.span('level.build'), _cacheLock:
+            for (idx, cacheKey, key), data in zip(misses, monthData):
+                levels[idx] = aggregate(data, bucketSecs, FILTER_ENABLED)
+                _levelCache[cacheKey] = (key, levels[idx])
+
+    with _cacheLock:
+        while len(_levelCache) > LEVEL_CACHE_SIZE:
+            _levelCache.popitem(last=False)
+
+    return levels
+
+
+def formatBucket(bucketSecs):
+
+    if bucketSecs < 3600:
+        return '{0}m'.format(bucketSecs // 60)
+    if bucketSecs < 86400:
+        return '{0}h'.format(bucketSecs // 3600)
+    return '{0}d'.format(bucketSecs // 86400)
+
+
+def _levelCacheUsage():
+
+    with _cacheLock:
+        return {'{0} {1}'.format(filename.replace('\\', '/').rsplit('/', 1)[-1], formatBucket(bucketSecs)): level.nbytes()
+                for (filename, bucketSecs, _), (_, level) in _levelCache.items()}
+
+
+registerMemoryProvider('pyramid level', _levelCacheUsage)
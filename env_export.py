@@ -0,0 +1,185 @@
+# BATCH EXPORT
+# Renders every Plot tab and the statistics sheet to image files for each month of the archive, or for a given list
+# of ranges, without opening a window. Ranges are spread over worker processes, each with its own offscreen
+# QApplication, so a report archive of the whole history takes minutes rather than an afternoon of clicking.
+#
+# Usage: python env_export.py OUT_DIR [--range 2020-03-01:Month ...] [--format png svg pdf] [--workers 4]
+
+import os
+import sys
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# The tabs to export, as (file name, sensor the Plot draws)
+PLOTS = (('temperature', 'temperature'), ('pressure', 'pressure'), ('humidity', 'humidity'), ('lux', 'lux'), ('dewpoint', 'dewPoint'), ('vpd', 'vpd'))
+
+PERIODS = {'Day': 1, '3 Days': 3, 'Week': 7, 'Fortnight': 14, 'Month': 30, 'Season': 90}
+
+FORMATS = ('png', 'svg', 'pdf')
+
+# Set up once per worker process by initWorker
+_worker = {}
+
+
+def initWorker(width, height):
+    """Create the offscreen QApplication and the views reused for every range this process renders."""
+
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+    import data_viewer
+    from data_viewer import qtw
+
+    _worker['app'] = qtw.QApplication.instance() or qtw.QApplication([])
+    _worker['plots'] = {name: data_viewer.Plot(sensorName) for name, sensorName in PLOTS}
+    _worker['statSheet'] = data_viewer.Statistics(background=False)
+
+    # NOTE - the views have to be shown, on the offscreen platform nothing appears, or the chart never lays out its
+    # axes and legend before it is rendered
+    for view in list(_worker['plots'].values()) + [_worker['statSheet']]:
+        view.resize(width, height)
+        view.show()
+
+
+def renderView(view, path, fileFormat):
+    """Paint a widget into path as a PNG, SVG or PDF."""
+
+    from data_viewer import qtc, qtg
+    from PyQt5 import QtSvg
+
+    size = view.size()
+
+    if fileFormat == 'png':
+        device = qtg.QImage(size, qtg.QImage.Format_ARGB32)
+        device.fill(qtc.Qt.white)
+    elif fileFormat == 'svg':
+        device = QtSvg.QSvgGenerator()
+        device.setFileName(path)
+        device.setSize(size)
+        device.setViewBox(qtc.QRect(qtc.QPoint(0, 0), size))
+    else:
+        device = qtg.QPdfWriter(path)
+        device.setPageSizeMM(qtc.QSizeF(size.width() * 25.4 / 96, size.height() * 25.4 / 96))
+        device.setPageMargins(qtc.QMarginsF(0, 0, 0, 0))
+        device.setResolution(96)
+
+    painter = qtg.QPainter(device)
+    view.render(painter)
+    painter.end()
+
+    if fileFormat == 'png':
+        device.save(path)
+
+
+def exportRange(startIso, period, outDir, formats):
+    """Render every tab for one range, return the list of files written."""
+
+    from data_viewer import qtc
+
+    startDateTime = qtc.QDateTime.fromString(startIso, qtc.Qt.ISODate)
+    days = PERIODS[period]
+    if days <= 14:
+        endDateTime = startDateTime.addDays(days)
+    elif days == 30:
+        endDateTime = startDateTime.addMonths(1)
+    else:
+        endDateTime = startDateTime.addMonths(3)
+
+    rangeDir = os.path.join(outDir, startDateTime.toString('yyyy-MM'))
+    os.makedirs(rangeDir, exist_ok=True)
+    prefix = '{0}_{1}'.format(startDateTime.toString('yyyy-MM-dd'), period.replace(' ', '').lower())
+    written = []
+
+    for name, _ in PLOTS:
+        plot = _worker['plots'][name]
+        plot.refreshData(startDateTime, endDateTime)
+        _worker['app'].processEvents()
+        for fileFormat in formats:
+            path = os.path.join(rangeDir, '{0}_{1}.{2}'.format(prefix, name, fileFormat))
+            renderView(plot, path, fileFormat)
+            written.append(path)
+
+    statSheet = _worker['statSheet']
+    statSheet.refreshData(startDateTime, endDateTime)
+    _worker['app'].processEvents()
+    for fileFormat in formats:
+        path = os.path.join(rangeDir, '{0}_statistics.{1}'.format(prefix, fileFormat))
+        renderView(statSheet, path, fileFormat)
+        written.append(path)
+
+    return written
+
+
+def monthlyRanges():
+    """Return a (start, 'Month') range for every month in the archive."""
+
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    import data_viewer
+
+    return [(data_viewer.qtc.QDateTime.fromMSecsSinceEpoch(monthStart).toString(data_viewer.qtc.Qt.ISODate), 'Month')
+            for monthStart in data_viewer.scanCatalog()]
+
+
+def parseRange(text):
+
+    start, _, period = text.partition(':')
+    period = period or 'Month'
+    if period not in PERIODS:
+        raise argparse.ArgumentTypeError('period must be one of {0}'.format(', '.join(PERIODS)))
+    if 'T' not in start:
+        start += 'T00:00:00'
+
+    return start, period
+
+
+def parseSize(text):
+
+    width, _, height = text.partition('x')
+    return int(width), int(height)
+
+
+def exportRanges(ranges, outDir, formats=('png',), workers=None, size=(1600, 900), log=None):
+    """Export the given (start, period) ranges using a pool of worker processes, return the number of files."""
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(ranges)))
+    written = 0
+
+    # NOTE - spawn rather than fork, a forked child would share the parent's Qt state
+    context = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initWorker, initargs=size) as pool:
+        futures = {pool.submit(exportRange, start, period, outDir, formats): (start, period) for start, period in ranges}
+        for future in as_completed(futures):
+            start, period = futures[future]
+            try:
+                files = future.result()
+            except Exception as error:
+                if log:
+                    log('{0} {1}: failed - {2}'.format(start[:10], period, error))
+                continue
+            written += len(files)
+            if log:
+                log('{0} {1}: {2} files'.format(start[:10], period, len(files)))
+
+    return written
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description='Export the viewer charts and statistics for many ranges at once.')
+    parser.add_argument('outDir', help='folder to write the report archive to')
+    parser.add_argument('--range', dest='ranges', action='append', type=parseRange,
+                        help='START[:PERIOD], e.g. 2020-03-01:Month, may be repeated (default: every month in the archive)')
+    parser.add_argument('--format', dest='formats', nargs='+', choices=FORMATS, default=['png'], help='output formats (default: png)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per core)')
+    parser.add_argument('--size', type=parseSize, default=(1600, 900), help='image size in pixels (default: 1600x900)')
+    args = parser.parse_args(argv)
+
+    ranges = args.ranges or monthlyRanges()
+    written = exportRanges(ranges, args.outDir, args.formats, args.workers, args.size, log=print)
+    print('Wrote {0} files for {1} ranges to {2}'.format(written, len(ranges), args.outDir))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
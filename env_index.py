@@ -0,0 +1,164 @@
+# RANGE INDEX
+# Answers min/max/mean queries over any span of a month without going back over the samples, so a selection dragged
+# across a chart can be summarised on every mouse move. Prefix sums give the total and count of any span in O(1).
+# The minimum and maximum of each whole hour are kept too, which covers the middle of a span, leaving only the part
+# hours at either end to scan. Every figure is kept for all samples and for the day and night samples separately.
+
+import bisect
+import math
+from array import array
+from itertools import accumulate
+from collections import OrderedDict
+
+import env_data
+import env_schema
+from diagnostics import registerMemoryProvider, timings
+
+# A sample counts as daytime above this lux, 40 being sunrise on a fully overcast day (400 for a clear one)
+DAY_LUX = 40.0
+
+INDEX_BUCKET = 3600
+
+INDEX_CACHE_SIZE = env_data.MONTH_CACHE_SIZE * 2
+
+SUBSETS = ('all', 'day', 'night')
+
+
+class RangeIndex():
+    """Prefix sums and hourly extremes of one column of a block of samples, split into all, day and night."""
+
+    __slots__ = ('time', 'values', 'isDay', 'cadence', 'sums', 'dayCounts', 'bucketStarts', 'minimums', 'maximums')
+
+    def __init__(self, envData, columnIdx, filtered=False):
+
+        self.time = envData.time
+        self.values = envData.values(columnIdx, filtered)
+        self.isDay = bytes(luxVal > DAY_LUX for luxVal in envData.values(env_schema.column('lux'), filtered))
+        self.cadence = envData.cadence
+
+        dayValues = [value if isDay else 0.0 for value, isDay in zip(self.values, self.isDay)]
+        self.sums = {'all': array('d', accumulate(self.values, initial=0.0)),
+                     'day': array('d', accumulate(dayValues, initial=0.0))}
+        self.sums['night'] = array('d', [total - day for total, day in zip(self.sums['all'], self.sums['day'])])
+        self.dayCounts = array('I', accumulate(self.isDay, initial=0))
+
+        # Bucket k holds the samples bucketStarts[k] up to bucketStarts[k + 1], the last entry is the sample count
+        if len(self.time):
+            offset = env_data.bucketOffset(self.time[0])
+            keys = [(timeVal + offset) // INDEX_BUCKET for timeVal in self.time]
+            starts = [0] + [idx for idx in range(1, len(keys)) if keys[idx] != keys[idx - 1]] + [len(keys)]
+        else:
+            starts = [0]
+        self.bucketStarts = array('I', starts)
+
+        # Buckets without a day (or night) sample hold +/-inf, which never wins a comparison
+        self.minimums = {}
+        self.maximums = {}
+        for subset in SUBSETS:
+            bucketMins = array('d')
+            bucketMaxs = array('d')
+            for start, end in zip(starts, starts[1:]):
+                lo, hi = self.scan(subset, start, end)
+                bucketMins.append(lo)
+                bucketMaxs.append(hi)
+            self.minimums[subset] = bucketMins
+            self.maximums[subset] = bucketMaxs
+
+    def scan(self, subset, start, end):
+        """Return the (min, max) of samples start to end by looking at each one, for spans of an hour or less."""
+
+        values = self.values[start:end]
+        if subset != 'all':
+            wanted = 1 if subset == 'day' else 0
+            values = [value for value, isDay in zip(values, self.isDay[start:end]) if isDay == wanted]
+
+        if not len(values):
+            return math.inf, -math.inf
+
+        return min(values), max(values)
+
+    def query(self, startSecs, endSecs):
+        """Return {subset: (min, max, total, count)} for the samples from startSecs up to endSecs."""
+
+        start = bisect.bisect_left(self.time, startSecs)
+        end = bisect.bisect_left(self.time, endSecs)
+
+        # Whole buckets inside the span are firstBucket up to lastBucket
+        firstBucket = bisect.bisect_left(self.bucketStarts, start)
+        lastBucket = bisect.bisect_right(self.bucketStarts, end) - 1
+
+        dayCount = self.dayCounts[end] - self.dayCounts[start]
+        counts = {'all': end - start, 'day': dayCount, 'night': end - start - dayCount}
+
+        results = {}
+        for subset in SUBSETS:
+            if firstBucket < lastBucket:
+                parts = [self.scan(subset, start, self.bucketStarts[firstBucket]), self.scan(subset, self.bucketStarts[lastBucket], end),
+                         (min(self.minimums[subset][firstBucket:lastBucket]), max(self.maximums[subset][firstBucket:lastBucket]))]
+                lo = min(part[0] for part in parts)
+                hi = max(part[1] for part in parts)
+            else:
+                lo, hi = self.scan(subset, start, end)
+
+            results[subset] = (lo, hi, self.sums[subset][end] - self.sums[subset][start], counts[subset])
+
+        return results
+
+    def nbytes(self):
+
+        arrays = [self.dayCounts, self.bucketStarts] + [column for table in (self.sums, self.minimums, self.maximums) for column in table.values()]
+
+        return sum(column.itemsize * len(column) for column in arrays) + len(self.isDay)
+
+
+_indexCache = OrderedDict()
+
+
+def rangeStats(blocks, columnIdx, startSecs, endSecs, filtered=False):
+    """Return ({subset: (min, max, mean, count)}, seconds covered) for a column over startSecs to endSecs.
+
+    blocks is a list of (key, load) per month, key changing whenever the month does and load returning its EnvData.
+    Each month's index is built the first time it is asked for, a month already indexed is never loaded again.
+    """
+
+    combined = {subset: (math.inf, -math.inf, 0.0, 0) for subset in SUBSETS}
+    covered = 0
+
+    for key, load in blocks:
+        cacheKey = (key, columnIdx, filtered)
+        index = _indexCache.get(cacheKey)
+        if index is None:
+            monthData = load()
+            with timings.span('index.build'):
+                index = RangeIndex(monthData, columnIdx, filtered)
+            _indexCache[cacheKey] = index
+        _indexCache.move_to_end(cacheKey)
+
+        results = index.query(startSecs, endSecs)
+        for subset, (lo, hi, total, count) in results.items():
+            combinedLo, combinedHi, combinedTotal, combinedCount = combined[subset]
+            combined[subset] = (min(lo, combinedLo), max(hi, combinedHi), total + combinedTotal, count + combinedCount)
+
+        # Each sample stands for one sample period, the same measure the gap index's coverage uses
+        covered += results['all'][3] * index.cadence
+
+    while len(_indexCache) > INDEX_CACHE_SIZE:
+        _indexCache.popitem(last=False)
+
+    stats = {subset: (lo, hi, total / count if count else math.nan, count) for subset, (lo, hi, total, count) in combined.items()}
+
+    return stats, covered
+
+
+def clearCache():
+
+    _indexCache.clear()
+
+
+def _indexCacheUsage():
+
+    return {'{0} {1}'.format(env_data.FIELDS[columnIdx], str(key[0]).replace('\\', '/').rsplit('/', 1)[-1]): index.nbytes()
+            for (key, columnIdx, _), index in _indexCache.items()}
+
+
+registerMemoryProvider('range index', _indexCacheUsage)
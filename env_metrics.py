@@ -0,0 +1,66 @@
+# DERIVED METRICS
+# Agronomic figures worked out from the logged readings rather than measured: dew point and vapour pressure deficit
+# from temperature and humidity, and growing degree days from the daily temperature extremes. Dew point and VPD are
+# derived a whole column at a time when a month is read, so they are kept in the month cache with the readings and
+# every level, index and chart built from the month gets them for nothing.
+
+import math
+from array import array
+
+import env_schema
+
+# Magnus formula coefficients (Alduchov and Eskridge 1996), good to 0.1% between -40 and 50 *C
+MAGNUS_A = 17.625
+MAGNUS_B = 243.04
+MAGNUS_KPA = 0.61094
+
+# Base temperature for growing degree days, 10 *C suits most allotment vegetables
+GDD_BASE = 10.0
+
+
+def saturationPressure(temperature):
+    """Return the saturation vapour pressure in kPa at a temperature in *C."""
+
+    return MAGNUS_KPA * math.exp(MAGNUS_A * temperature / (temperature + MAGNUS_B))
+
+
+def dewPoint(temperature, humidity):
+    """Return the dew point in *C for a temperature in *C and relative humidity in %."""
+
+    # NOTE - a humidity of 0 is a sensor fault rather than bone dry air, clamp it rather than take log(0)
+    gamma = math.log(max(humidity, 0.01) / 100.0) + MAGNUS_A * temperature / (temperature + MAGNUS_B)
+
+    return MAGNUS_B * gamma / (MAGNUS_A - gamma)
+
+
+def vapourPressureDeficit(temperature, humidity):
+    """Return the vapour pressure deficit in kPa for a temperature in *C and relative humidity in %."""
+
+    return saturationPressure(temperature) * (1.0 - min(max(humidity, 0.0), 100.0) / 100.0)
+
+
+# How each derived column of the schema registry is worked out: (input sensors, function)
+DERIVATIONS = {
+    'dewPoint': (('temperature', 'humidity'), dewPoint),
+    'vpd': (('temperature', 'humidity'), vapourPressureDeficit),
+}
+
+# One entry per derived column, in column order after the logger's own: (field, header, typecode, inputs, function)
+METRICS = tuple((sensor.name, sensor.header, sensor.typecode, env_schema.columns(DERIVATIONS[sensor.name][0]), DERIVATIONS[sensor.name][1])
+                for sensor in env_schema.DERIVED)
+
+
+def deriveColumns(columns, wanted=None):
+    """Return the derived columns for a list of input columns indexed like the logger's, one typed array each.
+
+    wanted flags the metrics to work out, one per entry of METRICS, the others come back as None.
+    """
+
+    return [array(typecode, map(function, *(columns[idx] for idx in inputs))) if wanted is None or wanted[position] else None
+            for position, (_, _, typecode, inputs, function) in enumerate(METRICS)]
+
+
+def growingDegreeDays(dailyMinimums, dailyMaximums, base=GDD_BASE):
+    """Return the growing degree days of each day from its minimum and maximum temperature, by the averaging method."""
+
+    return array('d', [max(0.0, (lowest + highest) / 2.0 - base) for lowest, highest in zip(dailyMinimums, dailyMaximums)])
@@ -0,0 +1,144 @@
+# ROLLING WINDOWS
+# Rolling mean, min/max envelope and standard deviation of a column over a time window centred on each sample. Each
+# is a single pass: two pointers track the ends of the window, the mean and deviation come from prefix sums and the
+# envelope from monotonic deques, so a 24 hour window costs no more than a 1 hour one. Windows are measured in time
+# rather than samples, a gap simply leaves fewer samples in the windows either side of it.
+
+import math
+import operator
+from array import array
+from itertools import accumulate
+from collections import OrderedDict, deque
+
+import env_data
+from diagnostics import registerMemoryProvider, timings
+
+# Windows offered on the charts, in seconds
+WINDOWS = (3600, 6 * 3600, 86400, 7 * 86400)
+
+KINDS = ('mean', 'envelope', 'std')
+
+ROLLING_CACHE_SIZE = 32
+
+
+def windowBounds(timeVals, windowSecs):
+    """Return (starts, ends), the first sample inside and the first sample after the window centred on each sample."""
+
+    half = windowSecs // 2
+    count = len(timeVals)
+    starts = array('I')
+    ends = array('I')
+    lo = hi = 0
+
+    for timeVal in timeVals:
+        while timeVals[lo] < timeVal - half:
+            lo += 1
+        while hi < count and timeVals[hi] <= timeVal + half:
+            hi += 1
+        starts.append(lo)
+        ends.append(hi)
+
+    return starts, ends
+
+
+def rollingMean(values, weights, starts, ends):
+    """Return the weighted mean of each window from prefix sums, weights None counts every sample once."""
+
+    sums = array('d', accumulate((value * weight for value, weight in zip(values, weights)) if weights else values, initial=0.0))
+    totals = array('d', accumulate(weights, initial=0.0)) if weights else range(len(values) + 1)
+
+    return array('d', [(sums[end] - sums[start]) / (totals[end] - totals[start]) for start, end in zip(starts, ends)])
+
+
+def rollingStd(values, weights, starts, ends):
+    """Return the population standard deviation of each window from prefix sums of the values and their squares."""
+
+    # NOTE - measured from the first value so the sums of squares stay small, e.g. pressure is ~100,000 Pa
+    shift = values[0] if len(values) else 0.0
+    weights = weights or [1] * len(values)
+    sums = array('d', accumulate(((value - shift) * weight for value, weight in zip(values, weights)), initial=0.0))
+    squares = array('d', accumulate(((value - shift) ** 2 * weight for value, weight in zip(values, weights)), initial=0.0))
+    totals = array('d', accumulate(weights, initial=0.0))
+
+    deviations = array('d')
+    for start, end in zip(starts, ends):
+        total = totals[end] - totals[start]
+        mean = (sums[end] - sums[start]) / total
+        deviations.append(math.sqrt(max(0.0, (squares[end] - squares[start]) / total - mean * mean)))
+
+    return deviations
+
+
+def rollingExtreme(values, starts, ends, smallest):
+    """Return the min (or max) of each window, the deque holds the indices of the values that could still win."""
+
+    beaten = operator.ge if smallest else operator.le
+    window = deque()
+    extremes = array('d')
+    hi = 0
+
+    for start, end in zip(starts, ends):
+        while hi < end:
+            while window and beaten(values[window[-1]], values[hi]):
+                window.pop()
+            window.append(hi)
+            hi += 1
+        while window[0] < start:
+            window.popleft()
+        extremes.append(values[window[0]])
+
+    return extremes
+
+
+_rollingCache = OrderedDict()
+
+
+def rolling(envData, columnIdx, windowSecs, kind, filtered=False, stamps=None):
+    """Return the arrays drawn for one kind of rolling line, (mean,), (min, max) or (std,), one value per sample.
+
+    An EnvAggregate is weighted by its bucket counts and its envelope comes from the bucket extremes, so both match
+    the raw samples. Its deviation is of the bucket means, the spread within each bucket isn't kept.
+
+    stamps are the block keys of the months envData was read from, see monthBlocks, taken before they were read. The
+    lines are only cached when they are given, the range alone can't tell a month rewritten since from the one read.
+    """
+
+    timeVals = envData.time
+    rangeKey = (len(timeVals), timeVals[0], timeVals[-1], envData.cadence) if len(timeVals) else (0,)
+    cacheKey = (columnIdx, windowSecs, kind, filtered, rangeKey, tuple(stamps)) if stamps is not None else None
+
+    cached = _rollingCache.get(cacheKey) if cacheKey is not None else None
+    if cached is not None:
+        _rollingCache.move_to_end(cacheKey)
+        return cached
+
+    with timings.span('rolling.compute'):
+        values = envData.values(columnIdx, filtered)
+        aggregated = isinstance(envData, env_data.EnvAggregate)
+        weights = envData.counts if aggregated else None
+        starts, ends = windowBounds(timeVals, windowSecs)
+
+        if kind == 'mean':
+            lines = (rollingMean(values, weights, starts, ends),)
+        elif kind == 'std':
+            lines = (rollingStd(values, weights, starts, ends),)
+        else:
+            lowest = envData.minimums[columnIdx] if aggregated else values
+            highest = envData.maximums[columnIdx] if aggregated else values
+            lines = (rollingExtreme(lowest, starts, ends, True), rollingExtreme(highest, starts, ends, False))
+
+    if cacheKey is not None:
+        _rollingCache[cacheKey] = lines
+        while len(_rollingCache) > ROLLING_CACHE_SIZE:
+            _rollingCache.popitem(last=False)
+
+    return lines
+
+
+def _rollingCacheUsage():
+
+    return {'{0} {1} {2}'.format(env_data.FIELDS[columnIdx], env_data.formatBucket(windowSecs), kind): sum(line.itemsize * len(line) for line in lines)
+            for (columnIdx, windowSecs, kind, _, _, _), lines in _rollingCache.items()}
+
+
+registerMemoryProvider('cache', _rollingCacheUsage)
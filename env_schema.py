@@ -0,0 +1,119 @@
+# SCHEMA REGISTRY
+# Every column the viewer knows, looked up by sensor name rather than by position: its column in an EnvData, header
+# label, unit, typecode, default chart axis and the chart it is drawn on. A logger file's own columns are found by the
+# names in its header, so a file from newer firmware with its columns moved or extra sensors added still parses, and
+# a column no view asks for is never converted.
+
+# The logger's columns in EnvData order, then the derived ones (see env_metrics):
+#   (name, header label, title, typecode, default axis (low, high, tick interval), chart it is drawn on,
+#    spike filter floor)
+# Typecodes:
+#   time - int64 epoch seconds (local time, matching QDateTime.toMSecsSinceEpoch()/1000)
+#   temperature and humidity - float32, the logger only writes 2 decimal places
+#   pressure and lux - float64, e.g. 102459.77 needs more digits than float32 holds
+#   infrared, visible and full spectrum - uint32 raw sensor counts
+# The floor is the smallest deviation from the rolling median the spike filter ever treats as a spike (see
+# env_data.hampel), None for a column that isn't filtered.
+LOGGER_SENSORS = (
+    ('time', 'Date/Time (YYYY:MM:DD HH:MM:SS)', 'Time', 'q', None, None, None),
+    ('temperature', 'Temperature (*C)', 'Temperature', 'f', (-5, 50, 5), 'temperature', 3.0),
+    ('pressure', 'Pressure (Pa)', 'Pressure', 'd', (95000, 105000, 500), 'pressure', 400.0),
+    ('humidity', 'Humidity (%)', 'Humidity', 'f', (0, 100, 5), 'humidity', 15.0),
+    ('infrared', 'Infrared', 'Infrared', 'I', (0, 90000, 5000), 'lux', 3000),
+    ('visible', 'Visible', 'Visible Light', 'I', (0, 90000, 5000), 'lux', 6000),
+    ('fullSpectrum', 'Full Spectrum', 'Full Spectrum', 'I', (0, 90000, 5000), 'lux', 9000),
+    ('lux', 'Lux (lm/m^2)', 'Lux', 'd', (0, 90000, 5000), 'lux', 15000.0),
+)
+
+DERIVED_SENSORS = (
+    ('dewPoint', 'Dewpoint (*C)', 'Dewpoint', 'f', (-15, 30, 5), 'dewPoint', None),
+    ('vpd', 'VPD (kPa)', 'VPD', 'f', (0, 4, 0.5), 'vpd', None),
+)
+
+
+class Sensor():
+    """One column of an EnvData."""
+
+    __slots__ = ('name', 'column', 'label', 'title', 'unit', 'typecode', 'axis', 'chart', 'floor')
+
+    def __init__(self, name, column, label, title, typecode, axis, chart, floor=None):
+
+        self.name = name
+        self.column = column
+        self.label = label
+        self.title = title
+        self.unit = splitLabel(label)[1]
+        self.typecode = typecode
+        self.axis = axis
+        self.chart = chart
+        self.floor = floor
+
+    @property
+    def header(self):
+        """The label as the logger writes it, after a comma and a space."""
+
+        return ' ' + self.label if self.column else self.label
+
+    def __repr__(self):
+
+        return 'Sensor({0!r}, column={1}, unit={2!r}, typecode={3!r})'.format(self.name, self.column, self.unit, self.typecode)
+
+
+def splitLabel(label):
+    """Return (key, unit) for a header label, e.g. ('temperature', '*C') for ' Temperature (*C)'.
+
+    The key is the name before any bracketed unit, lower case without spaces, so a change of case or spacing in a
+    firmware update still matches.
+    """
+
+    name, _, unit = label.partition('(')
+
+    return name.replace(' ', '').lower(), unit.rstrip(') ').strip()
+
+
+SENSORS = {}
+for _column, (_name, _label, _title, _typecode, _axis, _chart, _floor) in enumerate(LOGGER_SENSORS + DERIVED_SENSORS):
+    SENSORS[_name] = Sensor(_name, _column, _label, _title, _typecode, _axis, _chart, _floor)
+
+LOGGER = tuple(SENSORS[fields[0]] for fields in LOGGER_SENSORS)
+DERIVED = tuple(SENSORS[fields[0]] for fields in DERIVED_SENSORS)
+
+# Header keys of the logger's columns, to find them in a file
+_loggerKeys = {splitLabel(sensor.label)[0]: sensor.column for sensor in LOGGER}
+
+
+def sensor(name):
+
+    return SENSORS[name]
+
+
+def column(name):
+    """Return the EnvData column index of a sensor."""
+
+    return SENSORS[name].column
+
+
+def columns(names):
+
+    return tuple(SENSORS[name].column for name in names)
+
+
+def chartSensors(chart):
+    """Return the sensors drawn on a chart, the one it is named after first."""
+
+    return [SENSORS[chart]] + [sensor for sensor in SENSORS.values() if sensor.chart == chart and sensor.name != chart]
+
+
+def headerPositions(headers):
+    """Return the position in a file of each logger column, read from the file's header, or None if any is missing.
+
+    Columns the viewer doesn't know, such as a sensor added by a firmware update, are left out.
+    """
+
+    positions = [None] * len(LOGGER)
+    for position, label in enumerate(headers):
+        columnIdx = _loggerKeys.get(splitLabel(label)[0])
+        if columnIdx is not None and positions[columnIdx] is None:
+            positions[columnIdx] = position
+
+    return None if None in positions else tuple(positions)
@@ -0,0 +1,77 @@
+# SESSION SNAPSHOT
+# What the viewer was showing when it was closed: the range and tab picked, the data each chart drew and the figures
+# on the statistics sheet, plus the stamps of the months they came from. The next launch paints that straight from
+# the file, then compares the stamps against the archive in the background and only reloads if a month has changed.
+# Charts keep just the columns they draw, so a snapshot is the size of the points on screen rather than the samples.
+
+import os
+import copy
+import pickle
+import logging
+import tempfile
+
+import env_data
+
+SESSION_VERSION = 1
+
+logger = logging.getLogger('env_viewer.session')
+
+
+def compactData(envData, columns, filtered=False):
+    """Return a copy of envData holding only time and the given columns, with their filtered values when filtered."""
+
+    keep = {0} | set(columns)
+    compact = copy.copy(envData)
+    compact.columns = [column if idx in keep else None for idx, column in enumerate(envData.columns)]
+    compact.masks = {idx: mask for idx, mask in envData.masks.items() if idx in keep} if filtered else {}
+    compact.filtered = {idx: column for idx, column in envData.filtered.items() if idx in keep} if filtered else {}
+
+    if isinstance(compact, env_data.EnvAggregate):
+        compact.minimums = {idx: column for idx, column in envData.minimums.items() if idx in keep}
+        compact.maximums = {idx: column for idx, column in envData.maximums.items() if idx in keep}
+
+    return compact
+
+
+def save(path, session):
+    """Write session to path, a failed write is logged and leaves any earlier snapshot in place.
+
+    Saving runs as the window closes, so nothing it raises is let through to stop the viewer shutting down.
+    """
+
+    # NOTE - the blocks are pickled column lists, they only mean the same thing to a viewer with the same columns
+    state = dict(session, version=SESSION_VERSION, fields=env_data.FIELDS, typecodes=env_data.FIELD_TYPECODES)
+
+    # NOTE - written beside the target and renamed, closing mid write never leaves a truncated snapshot to load
+    tmpPath = None
+    try:
+        fd, tmpPath = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as fh:
+            pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpPath, path)
+        tmpPath = None
+    except Exception:
+        logger.exception('could not save the session to %s', path)
+    finally:
+        if tmpPath is not None:
+            try:
+                os.remove(tmpPath)
+            except OSError:
+                pass
+
+
+def load(path):
+    """Return the session saved at path, or None when there is none or it was saved by another version or schema."""
+
+    try:
+        with open(path, 'rb') as fh:
+            state = pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+    if not isinstance(state, dict):
+        return None
+    if (state.get('version'), state.get('fields'), state.get('typecodes')) != (SESSION_VERSION, env_data.FIELDS, env_data.FIELD_TYPECODES):
+        return None
+
+    return state
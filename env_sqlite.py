@@ -0,0 +1,304 @@
+# SQLITE STORAGE BACKEND
+# Optional alternative to reading the monthly CSVs: the archive is imported once into a local SQLite database keyed
+# on epoch seconds, after which a range request is an indexed SELECT rather than a scan of every month file.
+#
+# Usage: python env_sqlite.py [DATA_DIR] [--db FILE] [--batch 5000]
+
+import os
+import sys
+import time
+import sqlite3
+import bisect
+import argparse
+import threading
+from array import array
+
+import env_data
+import env_schema
+import env_metrics
+
+DB_FILENAME = 'env_data.sqlite'
+
+COLUMNS = env_data.RECORD_FIELDS
+
+# Derived columns aren't stored, they are worked out in the query by the same functions the CSV path uses
+DERIVED = ['{0}({1})'.format(field, ', '.join(COLUMNS[idx] for idx in inputs)) for field, _, _, inputs, _ in env_metrics.METRICS]
+
+# Column affinity for each array typecode in the schema registry
+SQL_TYPES = {'q': 'INTEGER', 'I': 'INTEGER', 'f': 'REAL', 'd': 'REAL'}
+
+# NOTE - the samples columns come from the schema registry, a sensor added there is stored without editing this
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    time INTEGER PRIMARY KEY,
+{0}
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS imports (
+    filename TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    rows INTEGER
+);
+
+-- Gap index: the sample that follows each gap and the sample before it
+CREATE TABLE IF NOT EXISTS gaps (
+    time INTEGER PRIMARY KEY,
+    previous INTEGER
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+""".format(',\n'.join('    {0} {1}'.format(sensor.name, SQL_TYPES[sensor.typecode]) for sensor in env_schema.LOGGER[1:]))
+
+# Keyed by (dbPath, thread), a connection can only be used from the thread that opened it
+_connections = {}
+
+
+def connect(dbPath):
+    """Return a (cached) connection to dbPath for the calling thread with the schema in place."""
+
+    key = (dbPath, threading.get_ident())
+    connection = _connections.get(key)
+    if connection is None:
+        connection = sqlite3.connect(dbPath)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.executescript(SCHEMA)
+        for field, _, _, inputs, function in env_metrics.METRICS:
+            connection.create_function(field, len(inputs), function, deterministic=True)
+        _connections[key] = connection
+
+    return connection
+
+
+def close(dbPath):
+
+    connection = _connections.pop((dbPath, threading.get_ident()), None)
+    if connection is not None:
+        connection.close()
+
+
+def importArchive(dataDir, dbPath, batchSize=5000, log=None):
+    """Import every month file in dataDir that is new or changed since the last import, return the rows written.
+
+    Unchanged files (same size and modification time) are skipped, so running the import again is a no-op. Each
+    file's old rows are replaced and the inserts are committed in transactions of batchSize rows.
+    """
+
+    connection = connect(dbPath)
+    imported = importStamps(dbPath)
+    written = 0
+
+    for path in env_data.monthFiles(dataDir):
+        filename = os.path.basename(path)
+        stat = os.stat(path)
+        if imported.get(filename) == (stat.st_size, stat.st_mtime_ns):
+            continue
+
+        monthData = env_data.readMonth(path)
+        rows = list(zip(*monthData.columns[:len(COLUMNS)]))
+
+        with connection:
+            if rows:
+                # The whole month goes, a file cut short mustn't leave behind the rows it no longer has
+                startSecs, endSecs = monthBounds(rows[0][0])
+                startSecs, endSecs = min(startSecs, rows[0][0]), max(endSecs, rows[-1][0] + 1)
+                connection.execute('DELETE FROM samples WHERE time >= ? AND time < ?', (startSecs, endSecs))
+                connection.execute('DELETE FROM gaps WHERE time >= ? AND time < ?', (startSecs, endSecs))
+            connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', ('headers', ','.join(monthData.headers)))
+
+        insert = 'INSERT OR REPLACE INTO samples VALUES ({0})'.format(', '.join('?' * len(COLUMNS)))
+        for batchStart in range(0, len(rows), batchSize):
+            with connection:
+                connection.executemany(insert, rows[batchStart:batchStart + batchSize])
+
+        # Only recorded once every batch is in, an interrupted import is redone next time
+        with connection:
+            if rows:
+                storeGaps(connection, monthData)
+            # A month compressed since it was imported replaces the record of its plain CSV
+            connection.execute('DELETE FROM imports WHERE filename LIKE ?', (env_data.monthStem(filename) + '.%',))
+            connection.execute('INSERT OR REPLACE INTO imports VALUES (?, ?, ?, ?)', (filename, stat.st_size, stat.st_mtime_ns, len(rows)))
+
+        written += len(rows)
+        if log:
+            log('{0}: {1} rows'.format(filename, len(rows)))
+
+    return written
+
+
+def monthBounds(epochSecs):
+    """Return the (start, end) epoch seconds of the local calendar month holding epochSecs."""
+
+    local = time.localtime(epochSecs)
+    year, month = local.tm_year, local.tm_mon
+
+    return int(time.mktime((year, month, 1, 0, 0, 0, 0, 0, -1))), int(time.mktime((year + month // 12, month % 12 + 1, 1, 0, 0, 0, 0, 0, -1)))
+
+
+def storeGaps(connection, monthData):
+    """Record the month's gap index plus any gap between it and its neighbouring months already imported."""
+
+    timeVals = monthData.time
+    gapRows = [(timeVals[gapIdx], timeVals[gapIdx - 1]) for gapIdx in monthData.gaps]
+
+    row = connection.execute("SELECT value FROM meta WHERE key = 'cadence'").fetchone()
+    cadence = min(int(row[0]), monthData.cadence) if row else monthData.cadence
+    connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', ('cadence', str(cadence)))
+    limit = cadence * env_data.GAP_FACTOR
+
+    previous = connection.execute('SELECT max(time) FROM samples WHERE time < ?', (timeVals[0],)).fetchone()[0]
+    if previous is not None and timeVals[0] - previous > limit:
+        gapRows.append((timeVals[0], previous))
+
+    following = connection.execute('SELECT min(time) FROM samples WHERE time > ?', (timeVals[-1],)).fetchone()[0]
+    if following is not None:
+        connection.execute('DELETE FROM gaps WHERE time = ?', (following,))
+        if following - timeVals[-1] > limit:
+            gapRows.append((following, timeVals[-1]))
+
+    connection.executemany('INSERT OR REPLACE INTO gaps VALUES (?, ?)', gapRows)
+
+
+def isPopulated(dbPath):
+    """True when dbPath exists and has had at least one month imported."""
+
+    if not os.path.exists(dbPath):
+        return False
+
+    return connect(dbPath).execute('SELECT EXISTS (SELECT 1 FROM imports)').fetchone()[0] == 1
+
+
+def importedFiles(dbPath):
+
+    return [filename for (filename,) in connect(dbPath).execute('SELECT filename FROM imports ORDER BY filename')]
+
+
+def importStamps(dbPath):
+    """Return {filename: (size, mtime_ns)} for every month file imported, as it was when imported."""
+
+    return {filename: (size, mtime) for filename, size, mtime in connect(dbPath).execute('SELECT filename, size, mtime_ns FROM imports')}
+
+
+def headers(dbPath):
+
+    row = connect(dbPath).execute("SELECT value FROM meta WHERE key = 'headers'").fetchone()
+    return row[0].split(',')[:len(COLUMNS)] + env_data.DERIVED_HEADERS if row else []
+
+
+def cadence(dbPath):
+
+    row = connect(dbPath).execute("SELECT value FROM meta WHERE key = 'cadence'").fetchone()
+    return int(row[0]) if row else env_data.DEFAULT_CADENCE
+
+
+def timeRange(dbPath):
+    """Return the (first, last) sample times held, (None, None) when empty."""
+
+    return connect(dbPath).execute('SELECT min(time), max(time) FROM samples').fetchone()
+
+
+def queryRange(dbPath, startSecs, endSecs, dbHeaders=None, wanted=None):
+    """Return the samples from startSecs up to but not including endSecs as an EnvData.
+
+    wanted limits the columns selected, see env_data.projection, the others are None.
+    """
+
+    needed = env_data.projection(wanted)
+    selected = [idx for idx in needed if idx < len(COLUMNS)]
+    connection = connect(dbPath)
+    cursor = connection.execute(
+        'SELECT {0} FROM samples WHERE time >= ? AND time < ? ORDER BY time'.format(', '.join(COLUMNS[idx] for idx in selected)), (startSecs, endSecs))
+    rows = cursor.fetchall()
+
+    if not rows:
+        return env_data.EnvData(dbHeaders or headers(dbPath), cadence=cadence(dbPath))
+
+    columns = [None] * len(COLUMNS)
+    for idx, values in zip(selected, zip(*rows)):
+        columns[idx] = array(env_data.COLUMN_TYPECODES[idx], values)
+    columns += env_metrics.deriveColumns(columns, [sensor.column in needed for sensor in env_schema.DERIVED])
+
+    # The stored gap index is turned into positions by bisection, the samples themselves aren't looked at again
+    timeVals = columns[0]
+    gapTimes = connection.execute('SELECT time FROM gaps WHERE time > ? AND time <= ?', (timeVals[0], timeVals[-1]))
+    gaps = array('I', [bisect.bisect_left(timeVals, gapTime) for (gapTime,) in gapTimes])
+
+    return env_data.EnvData(dbHeaders or headers(dbPath), columns, gaps, cadence(dbPath))
+
+
+def iterRange(dbPath, startSecs, endSecs, chunkRows=10000):
+    """Yield the samples from startSecs up to endSecs as EnvData blocks of at most chunkRows, for streaming.
+
+    The blocks come straight off the cursor, so only one is ever held. They carry no gap index.
+    """
+
+    dbHeaders = headers(dbPath)
+    dbCadence = cadence(dbPath)
+    cursor = connect(dbPath).execute(
+        'SELECT {0} FROM samples WHERE time >= ? AND time < ? ORDER BY time'.format(', '.join(COLUMNS)), (startSecs, endSecs))
+
+    while True:
+        rows = cursor.fetchmany(chunkRows)
+        if not rows:
+            return
+
+        columns = [array(typecode, values) for typecode, values in zip(env_data.COLUMN_TYPECODES, zip(*rows))]
+        columns += env_metrics.deriveColumns(columns)
+        yield env_data.EnvData(dbHeaders, columns, cadence=dbCadence)
+
+
+def queryLevel(dbPath, startSecs, endSecs, bucketSecs, dbHeaders=None, wanted=None):
+    """Return the samples from startSecs up to but not including endSecs reduced to bucketSecs wide buckets.
+
+    The grouping is done by SQLite, only one row per bucket comes back to Python. wanted limits the columns reduced,
+    as for queryRange.
+    """
+
+    # NOTE - SQLite works out the derived columns itself, so unlike queryRange their inputs needn't be selected
+    selected = range(1, len(env_data.FIELD_TYPECODES)) if wanted is None else sorted(set(wanted) - {0})
+    expressions = list(COLUMNS) + DERIVED
+    offset = env_data.bucketOffset(startSecs)
+    reductions = ', '.join('avg({0}), min({0}), max({0})'.format(expressions[idx]) for idx in selected)
+    cursor = connect(dbPath).execute(
+        'SELECT (time + ?) / ? AS bucket, count(*), {0} FROM samples WHERE time >= ? AND time < ? GROUP BY bucket ORDER BY bucket'.format(reductions),
+        (offset, bucketSecs, startSecs, endSecs))
+    rows = cursor.fetchall()
+
+    if not rows:
+        return env_data.EnvAggregate(dbHeaders or headers(dbPath), cadence=bucketSecs)
+
+    fields = list(zip(*rows))
+    timeVals = array('q', [bucket * bucketSecs - offset + bucketSecs // 2 for bucket in fields[0]])
+    columns = [timeVals] + [None] * (len(env_data.FIELD_TYPECODES) - 1)
+    minimums = {}
+    maximums = {}
+
+    for position, idx in enumerate(selected, 1):
+        typecode = env_data.FIELD_TYPECODES[idx]
+        columns[idx] = array('d', fields[3 * position - 1])
+        minimums[idx] = array(typecode, fields[3 * position])
+        maximums[idx] = array(typecode, fields[3 * position + 1])
+
+    return env_data.EnvAggregate(dbHeaders or headers(dbPath), columns, env_data.levelGaps(timeVals, bucketSecs), bucketSecs,
+                                 array('I', fields[1]), minimums, maximums)
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description='Import the monthly logger CSVs into a SQLite database.')
+    parser.add_argument('dataDir', nargs='?', default=os.environ.get('ENV_DATA_DIR', '.'), help='folder holding the PT_<Mon>_<yyyy>.CSV files')
+    parser.add_argument('--db', help='database file (default: {0} in the data folder)'.format(DB_FILENAME))
+    parser.add_argument('--batch', type=int, default=5000, help='rows per transaction (default: 5000)')
+    args = parser.parse_args(argv)
+
+    dbPath = args.db or os.path.join(args.dataDir, DB_FILENAME)
+    written = importArchive(args.dataDir, dbPath, args.batch, log=print)
+    print('Imported {0} rows into {1}'.format(written, dbPath))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
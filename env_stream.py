@@ -0,0 +1,239 @@
+# STREAMING EXPORT
+# Writes any range of the archive, and any choice of columns, to CSV, JSON lines or a typed binary file. The samples
+# are read a block at a time, a month from the CSVs or a fixed number of rows off a SQLite cursor, and written out
+# before the next block is read, so exporting years of 1 minute data holds no more than one block in memory.
+#
+# Usage: python env_stream.py OUT_FILE [DATA_DIR] [--start 2020-03-01] [--end 2021-03-01] [--columns temperature lux]
+#                             [--format csv|jsonl|bin] [--chunk 10000] [--filtered] [--db FILE]
+
+import os
+import sys
+import csv
+import json
+import time
+import struct
+import argparse
+from array import array
+
+import env_data
+import env_schema
+import env_sqlite
+
+CHUNK_ROWS = 10000
+
+FORMATS = ('csv', 'jsonl', 'bin')
+
+# Binary layout: BINARY_MAGIC, a uint32 length and that many bytes of JSON describing the columns, then per chunk a
+# uint32 row count followed by each column's values packed back to back in its own typecode
+BINARY_MAGIC = b'ENVDATA1'
+
+# NOTE - fixed English abbreviations, the file names don't depend on the locale
+MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+def monthFiles(dataDir, startSecs, endSecs):
+    """Return the month files in dataDir that overlap startSecs to endSecs, in time order."""
+
+    months = []
+    for path in env_data.monthFiles(dataDir):
+        name = env_data.monthStem(path)
+        if name[3:6] not in MONTH_ABBR:
+            continue
+        year, month = int(name[7:11]), MONTH_ABBR.index(name[3:6]) + 1
+        monthStart = time.mktime((year, month, 1, 0, 0, 0, 0, 0, -1))
+        monthEnd = time.mktime((year + month // 12, month % 12 + 1, 1, 0, 0, 0, 0, 0, -1))
+        if monthStart < endSecs and monthEnd > startSecs:
+            months.append(((year, month), path))
+
+    return [path for _, path in sorted(months)]
+
+
+def monthBlocks(startSecs, endSecs, dataDir, dbPath=None, filtered=False):
+    """Yield the samples from startSecs up to endSecs a month at a time, read past the month cache."""
+
+    if dbPath and env_sqlite.isPopulated(dbPath):
+        # Walking month by month from an open ended range would never finish, start and end at the samples held
+        firstTime, lastTime = env_sqlite.timeRange(dbPath)
+        if firstTime is None:
+            return
+        startSecs = max(startSecs, firstTime)
+        endSecs = min(endSecs, lastTime + 1)
+
+        monthStart = time.localtime(startSecs)
+        year, month = monthStart.tm_year, monthStart.tm_mon
+        blockStart = startSecs
+        while blockStart < endSecs:
+            year, month = year + month // 12, month % 12 + 1
+            blockEnd = min(endSecs, int(time.mktime((year, month, 1, 0, 0, 0, 0, 0, -1))))
+            block = env_sqlite.queryRange(dbPath, blockStart, blockEnd)
+            yield env_data.filterSpikes(block) if filtered else block
+            blockStart = blockEnd
+        return
+
+    for path in monthFiles(dataDir, startSecs, endSecs):
+        yield env_data.prepareMonth(path, filtered).between(startSecs, endSecs)
+
+
+def sampleChunks(startSecs, endSecs, dataDir, dbPath=None, chunkRows=CHUNK_ROWS, filtered=False):
+    """Yield the samples from startSecs up to endSecs as EnvData blocks of at most chunkRows."""
+
+    # The spike filter looks either side of each sample, so filtered values are worked out a month at a time
+    if dbPath and env_sqlite.isPopulated(dbPath) and not filtered:
+        yield from env_sqlite.iterRange(dbPath, startSecs, endSecs, chunkRows)
+        return
+
+    for block in monthBlocks(startSecs, endSecs, dataDir, dbPath, filtered):
+        for chunkStart in range(0, len(block), chunkRows):
+            yield block.slice(chunkStart, chunkStart + chunkRows)
+
+
+def formatTimestamps(timeVals):
+    """Return each epoch time in the logger's 'dd/MM/yyyy hh:mm' format, calling localtime once an hour."""
+
+    texts = []
+    hourStart = hourEnd = 0
+
+    for timeVal in timeVals:
+        if not hourStart <= timeVal < hourEnd:
+            local = time.localtime(timeVal)
+            hourStart = timeVal - local.tm_min * 60 - local.tm_sec
+            hourEnd = hourStart + 3600
+            prefix = time.strftime('%d/%m/%Y %H:', local)
+        texts.append('{0}{1:02d}'.format(prefix, (timeVal - hourStart) // 60))
+
+    return texts
+
+
+def exportValues(chunk, columns, filtered):
+    """Return the chosen columns of a chunk ready to write, float32 ones rounded to the digits they actually hold."""
+
+    # NOTE - adding 0.0 turns the logger's -0.00 into 0.0, SQLite stores it that way so both backends write the same
+    values = []
+    for idx in columns:
+        column = chunk.values(idx, filtered)
+        values.append([float('{0:.7g}'.format(value)) + 0.0 for value in column] if column.typecode == 'f' else column)
+
+    return values
+
+
+def writeCsv(fh, chunks, columns, filtered=False):
+
+    # NOTE - the header comes from the schema, not the first chunk, so an empty range still gets one
+    writer = csv.writer(fh)
+    writer.writerow([env_schema.sensor(env_data.FIELDS[idx]).label for idx in columns])
+    rows = 0
+
+    for chunk in chunks:
+        values = exportValues(chunk, columns, filtered)
+        if columns[0] == 0:
+            values[0] = formatTimestamps(chunk.time)
+        writer.writerows(zip(*values))
+        rows += len(chunk)
+
+    return rows
+
+
+def writeJsonLines(fh, chunks, columns, filtered=False):
+
+    names = [env_data.FIELDS[idx] for idx in columns]
+    rows = 0
+
+    for chunk in chunks:
+        fh.writelines(json.dumps(dict(zip(names, row))) + '\n' for row in zip(*exportValues(chunk, columns, filtered)))
+        rows += len(chunk)
+
+    return rows
+
+
+def writeBinary(fh, chunks, columns, filtered=False):
+
+    description = json.dumps({'byteorder': sys.byteorder, 'columns': [[env_data.FIELDS[idx], env_data.FIELD_TYPECODES[idx]] for idx in columns]}).encode()
+    fh.write(BINARY_MAGIC + struct.pack('<I', len(description)) + description)
+    rows = 0
+
+    for chunk in chunks:
+        fh.write(struct.pack('<I', len(chunk)))
+        for idx in columns:
+            fh.write(chunk.values(idx, filtered).tobytes())
+        rows += len(chunk)
+
+    return rows
+
+
+def readBinary(fh):
+    """Yield {name: array} per chunk of a file written by writeBinary."""
+
+    if fh.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise ValueError('not an exported binary file')
+    description = json.loads(fh.read(struct.unpack('<I', fh.read(4))[0]))
+
+    while True:
+        count = fh.read(4)
+        if not count:
+            return
+        rows = struct.unpack('<I', count)[0]
+
+        chunk = {}
+        for name, typecode in description['columns']:
+            column = array(typecode)
+            column.frombytes(fh.read(rows * column.itemsize))
+            if description['byteorder'] != sys.byteorder:
+                column.byteswap()
+            chunk[name] = column
+        yield chunk
+
+
+WRITERS = {'csv': writeCsv, 'jsonl': writeJsonLines, 'bin': writeBinary}
+
+
+def exportRange(outPath, startSecs, endSecs, dataDir, columns, fileFormat='csv', dbPath=None, chunkRows=CHUNK_ROWS, filtered=False):
+    """Stream startSecs to endSecs of the given column indices into outPath, return the rows written.
+
+    The time column is always written first.
+    """
+
+    columns = [0] + [idx for idx in columns if idx != 0]
+    chunks = sampleChunks(startSecs, endSecs, dataDir, dbPath, chunkRows, filtered)
+
+    if fileFormat == 'bin':
+        with open(outPath, 'wb') as fh:
+            return writeBinary(fh, chunks, columns, filtered)
+
+    with open(outPath, 'w', newline='') as fh:
+        return WRITERS[fileFormat](fh, chunks, columns, filtered)
+
+
+def parseDate(text):
+
+    return int(time.mktime(time.strptime(text, '%Y-%m-%dT%H:%M' if 'T' in text else '%Y-%m-%d')))
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description='Stream a range of the archive to CSV, JSON lines or a typed binary file.')
+    parser.add_argument('outFile', help='file to write')
+    parser.add_argument('dataDir', nargs='?', default=os.environ.get('ENV_DATA_DIR', '.'), help='folder holding the PT_<Mon>_<yyyy>.CSV files')
+    parser.add_argument('--start', type=parseDate, default=0, help='first date, YYYY-MM-DD[THH:MM] (default: the start of the archive)')
+    parser.add_argument('--end', type=parseDate, default=2 ** 62, help='date to stop before (default: the end of the archive)')
+    parser.add_argument('--columns', nargs='+', choices=env_data.FIELDS[1:], default=list(env_data.FIELDS[1:]), help='columns after time (default: all)')
+    parser.add_argument('--format', dest='fileFormat', choices=FORMATS, help='output format (default: from the file extension, else csv)')
+    parser.add_argument('--chunk', type=int, default=CHUNK_ROWS, help='rows read and written at a time (default: {0})'.format(CHUNK_ROWS))
+    parser.add_argument('--filtered', action='store_true', help='write the spike filtered values')
+    parser.add_argument('--db', help='SQLite copy to read instead of the CSVs (default: {0} in the data folder, if imported)'.format(env_sqlite.DB_FILENAME))
+    args = parser.parse_args(argv)
+
+    extension = os.path.splitext(args.outFile)[1].lstrip('.').lower()
+    fileFormat = args.fileFormat or (extension if extension in FORMATS else 'csv')
+    dbPath = args.db or os.path.join(args.dataDir, env_sqlite.DB_FILENAME)
+    columns = [env_data.FIELDS.index(name) for name in args.columns]
+
+    started = time.perf_counter()
+    rows = exportRange(args.outFile, args.start, args.end, args.dataDir, columns, fileFormat, dbPath, args.chunk, args.filtered)
+    elapsed = time.perf_counter() - started
+
+    size = os.path.getsize(args.outFile)
+    print('Wrote {0} rows, {1:.1f} MB to {2} in {3:.1f}s ({4:.1f} MB/s)'.format(rows, size / 1e6, args.outFile, elapsed, size / 1e6 / max(elapsed, 1e-9)))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
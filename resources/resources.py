@@ -1,5835 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.14.1)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x60\x98\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0b\x11\x00\x00\x0b\x11\x01\x7f\x64\
-\x5f\x91\x00\x00\x00\x18\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\
-\x72\x65\x00\x70\x61\x69\x6e\x74\x2e\x6e\x65\x74\x20\x34\x2e\x30\
-\x2e\x39\x6c\x33\x7e\x4e\x00\x00\x60\x09\x49\x44\x41\x54\x78\x5e\
-\xed\x9d\x07\xb8\x5c\x45\xd9\xc7\x67\xef\xde\xbb\x77\xcf\xde\x54\
-\x02\x18\x08\x2d\x52\x42\x2f\x82\x10\x10\x50\x69\x36\x3e\x11\x91\
-\x4f\x6c\x9f\x80\x02\x82\x22\x88\x22\x08\x21\x8d\x14\x42\x4b\x08\
-\xe9\x95\x0e\x22\x02\x16\xa4\x84\x26\x08\x24\x84\xf4\x40\x20\x1d\
-\x42\x12\x52\x6e\x7a\xbd\x49\x76\xbe\xf7\x3f\x33\xef\xd9\xb3\x67\
-\x67\xf7\x6e\x4d\x82\x3b\xe7\x79\x7e\xcf\xee\xce\x9e\x3a\x33\xff\
-\x77\xde\x99\x33\x45\x48\x29\x1d\x0e\x47\x95\x62\x0d\x74\x38\x1c\
-\xd5\x81\x35\xd0\xe1\x70\x54\x07\xd6\x40\x87\xc3\x51\x1d\x58\x03\
-\x1d\x0e\x47\x75\x60\x0d\x74\x38\x1c\xd5\x81\x35\xd0\xe1\x70\x54\
-\x07\xd6\x40\x87\xc3\x51\x1d\x58\x03\x1d\x0e\x47\x75\x60\x0d\x74\
-\x38\x1c\xd5\x81\x35\xd0\xe1\x70\x54\x07\xd6\x40\x87\xc3\x51\x1d\
-\x58\x03\x1d\x0e\x47\x75\x60\x0d\x74\x38\x1c\xd5\x81\x35\xd0\xe1\
-\x70\x54\x07\xd6\x40\x87\xc3\x51\x1d\x58\x03\x1d\x0e\x47\x75\x60\
-\x0d\x74\x38\x1c\xd5\x81\x35\xd0\xe1\x70\x54\x07\xd6\x40\x87\xc3\
-\x51\x1d\x58\x03\x1d\x0e\x47\x75\x60\x0d\x74\x38\x1c\xd5\x81\x35\
-\xd0\xe1\x70\x54\x07\xd6\x40\x87\xc3\x51\x1d\x58\x03\x1d\x0e\x47\
-\x75\x60\x0d\x74\x38\x1c\xd5\x81\x35\xd0\xe1\x70\x54\x07\xd6\x40\
-\x87\xc3\x51\x1d\x58\x03\x1d\x0e\x47\x75\x60\x0d\x74\x38\x1c\xd5\
-\x81\x35\xd0\xe1\x70\x54\x07\xd6\x40\x87\xc3\x51\x1d\x58\x03\x1d\
-\x0e\x47\x75\x60\x0d\x74\x38\x1c\xd5\x81\x35\xd0\xe1\x70\x54\x07\
-\xd6\x40\x87\xc3\x51\x1d\x58\x03\x1d\x0e\x47\x75\x60\x0d\x74\x38\
-\x1c\xd5\x81\x35\xd0\xe1\x70\x54\x07\xd6\x40\x87\xc3\x51\x1d\x58\
-\x03\x1d\x0e\x47\x75\x60\x0d\x74\x38\x1c\xd5\x81\x35\xd0\xe1\x70\
-\x54\x07\xd6\x40\x87\xc3\x51\x1d\x58\x03\x1d\xff\xfd\x1c\x7b\xec\
-\xb1\x47\x1d\x77\xdc\x71\x27\x19\x8e\xee\x7c\xea\xa9\x47\x9d\x71\
-\xf6\xb9\x9d\x6c\xfb\x3a\xfe\x7b\xb1\x06\x3a\x3e\xdf\x88\x78\xc3\
-\x19\x22\xe6\x5d\x2e\xa2\xb5\xdd\x45\xb4\x6e\xac\xa8\x89\x3e\x2f\
-\x44\x64\x82\xa8\xab\xff\x44\xd4\xd6\x35\xc6\xe3\xf1\xf5\x89\x44\
-\x62\x23\xb1\x29\x1a\x8d\x6e\x14\x42\xac\x57\x61\x2d\x5b\xad\x4e\
-\xb4\xde\x63\x49\x7d\xdc\x9b\x4c\xc7\x3e\x2f\x62\xf1\x07\xe9\xf8\
-\x1e\xc2\x6b\xf1\x4b\xd1\x6a\xcf\xaf\xda\xae\xe5\xf8\x7c\x63\x0d\
-\x74\x7c\x7e\x10\x5e\xcb\x2f\x93\x50\xaf\x25\xc1\x3e\x40\x4c\x12\
-\x91\x9a\xf5\x24\x68\xfa\x23\x42\xe0\x33\x9d\x78\x7d\xbd\xf4\x3c\
-\x4f\x41\xe2\xcf\xfc\x2f\x1e\x57\xff\xc5\xea\xea\x52\xff\x45\x70\
-\x2e\x22\x52\xb3\x41\xd4\xc6\xa6\x93\x21\x79\x48\xd4\x27\x7e\x27\
-\xda\xec\xdd\xd9\x76\x4f\x8e\xcf\x0f\xd6\x40\xc7\xee\x0d\x09\xf0\
-\xff\x48\xec\x0f\x52\xc9\xbe\x40\x0b\xdd\x2a\xf6\xed\x44\x13\xb1\
-\xcd\x7c\xdf\x4e\xa5\xfc\x0e\x12\x77\x12\x90\xf8\x93\x14\x16\x66\
-\x87\xd9\x07\x6c\x8f\xc5\x62\x38\x16\xe7\xc0\xf1\xa1\xf3\xc3\x20\
-\x10\xd1\xda\x4f\xe8\x7e\x1e\x15\x89\xd6\x97\xdb\xee\xd5\xb1\x7b\
-\x63\x0d\x74\xec\x5e\x1c\xdf\xf9\x2b\xc7\xed\xb5\x4f\x87\xdf\xb7\
-\x6c\xdd\xe6\xe5\x68\x5d\x6c\x5d\xa6\x18\x95\xc8\x59\xe8\x61\x51\
-\xe3\xff\x24\x09\x3b\x6b\xc9\x1f\xc6\xec\xab\x0c\x05\x19\x81\xf0\
-\xf9\x76\x10\x7c\xbd\xc0\x71\x64\x0c\x6a\xa2\x1b\xc8\x1b\x79\x51\
-\x24\x5a\x5d\x75\xf0\x89\xa7\x1e\x69\x7b\x16\xc7\xee\x85\x35\xd0\
-\xb1\x7b\x40\x75\xf9\xaf\x53\x1d\x7c\x4c\x24\x5a\xbb\x8a\xc5\x6b\
-\x04\x0c\xa1\x43\x80\x10\x23\x0b\x13\x42\x0c\x7e\xf7\x29\x44\xfc\
-\x4c\xf0\x18\x32\x02\x1c\x6e\xbb\x16\x1b\x04\xdf\x4b\xc0\xfe\x89\
-\x96\xad\xd6\xb5\xda\x73\xef\xa7\xf7\x38\xe0\xe0\xef\xdb\x9e\xcd\
-\xb1\x7b\x60\x0d\x74\xec\x5a\x44\xbd\x07\x17\xff\x9d\xa0\x6b\x1f\
-\x89\x44\xb6\x93\x18\x01\xbb\xf0\x08\x0f\x0a\xd2\x4a\x4a\xc8\x09\
-\x19\xad\xad\x0d\xfd\x8f\xf3\xa7\xae\x11\x26\x8b\x11\x08\x12\xbc\
-\xbe\xfa\x4e\xfb\x99\xfb\x8c\xeb\x76\x84\x48\x8d\x14\x31\x6f\x92\
-\x68\x68\xf3\x4b\xdb\xb3\x3a\x76\x2d\xd6\x40\xc7\xae\x81\xdc\xe7\
-\xdf\x90\x1b\x3d\x3b\x20\x4a\x2e\x5d\x55\x49\x4f\x46\x00\x8d\x74\
-\xca\x00\x40\x94\xd9\x4b\x73\xb8\xe3\x35\x32\x9e\x68\x90\x5e\x43\
-\x0b\xe9\xd1\x67\xbe\x25\xbf\x8f\xae\xdf\x9b\x73\x10\x89\x44\x36\
-\x23\xc0\x24\x49\xf0\xea\xbe\x70\x7f\xb4\x2f\x0c\x02\xdf\x3b\xfd\
-\x4f\xe7\xab\xab\x5f\x20\x5a\xee\x71\x83\xed\xd9\x1d\xbb\x06\x6b\
-\xa0\x63\xe7\x22\xea\x13\x57\x90\xd8\xe6\x1a\x21\x01\x76\xa9\xb9\
-\x84\x65\xe0\x09\xf8\xa5\xb2\x32\x02\x28\xd5\x21\xd6\x1a\x12\x38\
-\x4a\x5b\x73\x8e\x78\x44\x48\x8f\x3e\x41\xd4\x84\xa9\x7d\xea\xea\
-\x25\x5d\x4f\x52\x3d\x5d\x8a\x16\x6d\x35\xf8\x8e\x30\xfc\x87\x7d\
-\x78\x7f\x83\x3a\x57\xac\x4e\xbd\x21\x88\xd5\xc7\xcd\xb5\x7c\x23\
-\xa5\x80\x71\xe0\x7b\x32\xe2\x0f\xc2\x55\x16\xbd\x7f\x5d\xfd\x42\
-\xd1\x7a\xaf\x6b\x6d\x71\xe1\xd8\xb9\x58\x03\x1d\x3b\x07\xe1\xb5\
-\xf8\x36\x09\x7f\xb2\x2f\x8c\x74\xe1\xe3\x37\x0b\x88\xff\x57\x44\
-\xa8\x74\x47\xa9\xae\x4a\x77\x12\xa5\x2f\x70\x80\x92\x7f\xef\x0e\
-\xd2\x3b\xe6\x74\xe9\x7d\xfd\x12\x19\xbd\xe8\x0f\x52\x5c\x71\xaf\
-\x14\x7f\x78\x58\x8a\xee\xff\x94\xe2\xce\x37\xa4\x18\x38\x49\x8a\
-\x21\x33\xd2\x41\x18\xfe\xc3\x3e\xd8\x17\xc7\x5c\x74\xa3\x14\x5f\
-\xbd\x44\x8a\x23\x4e\xd5\xe7\x84\x27\x10\x25\xb1\x87\xae\x07\xa3\
-\x00\x0f\x41\x89\x3f\xf8\xfa\x30\xfd\xfe\xf1\xc9\x1e\x8d\x36\x20\
-\x31\x6f\xba\x68\xd7\xe1\x02\x5b\xdc\x38\x76\x0e\xd6\x40\x47\xe5\
-\xa1\x52\xf0\xc9\x80\xab\xcf\xc2\x67\xa1\x04\x85\x93\x02\x25\x3c\
-\x09\x0e\xdf\x23\x84\x2a\xe1\x61\x04\x3a\x1e\x25\xa3\x5f\xff\xb1\
-\x14\x97\xf6\x91\xf1\x2e\x4f\x49\xaf\xff\x5b\xd2\x1b\x32\x55\x46\
-\x1f\x5a\x24\xc5\x93\xab\xa5\x78\x7c\x85\x14\x8f\x7e\x26\xc5\xc3\
-\x8b\xa5\x40\xd8\x03\x9f\x10\x1f\x13\x0b\x0d\xf8\x4e\x61\xf8\x0f\
-\xfb\x60\x5f\x1c\x83\x63\x1f\x5b\x26\xc5\xd8\x05\xca\x48\xa8\x73\
-\x5f\xda\x4b\x7a\x67\xff\x58\xc6\x0e\x3a\x4a\x79\x02\x30\x06\x5e\
-\x0d\x11\xaf\xd7\xde\x41\xc0\x0b\x09\x11\x7c\xa6\x80\x21\xa0\xfd\
-\x13\xad\x9f\x15\x07\x1e\x7d\xb0\x2d\x9e\x1c\x95\xc5\x1a\xe8\xa8\
-\x1c\x22\xde\x70\x35\x89\x78\x6d\x40\x08\x7e\xeb\x39\x61\x17\x7e\
-\xd8\x2d\xaf\x25\x57\xfd\xa8\x33\x64\xe4\x92\x5b\xa5\xd7\xf5\xaf\
-\xd2\xbb\x7f\xa2\xf4\x46\x7f\x24\xe3\x0f\xcc\x97\xde\x88\xf7\xa5\
-\x37\x94\xc4\x3f\xe2\x43\x29\x46\xcd\x91\x62\xe4\x6c\x0d\xbe\x8f\
-\x9a\x2b\xc5\x68\x30\x2f\x0b\xf4\x1f\xf6\x09\x1f\x87\xff\xc6\x92\
-\xa1\x78\xe8\x53\x7d\x0d\xba\x96\x37\xe8\x3d\x19\xef\xfa\xb4\xf4\
-\x2e\xb9\x59\x7a\xc7\x7f\x4d\xc6\x1a\x5a\xa6\xdf\xa3\xa5\x2a\x41\
-\x84\x9f\x0f\xcf\xae\x9f\xbf\x36\xb6\x91\xe2\xe6\x1a\x5b\x9c\x39\
-\x2a\x87\x35\xd0\x51\x19\x28\x93\x3f\x1f\xc8\xfc\xe8\x60\xc3\x62\
-\xc8\x4f\xf8\x07\x1d\x23\xc5\x0f\x6f\x91\xe2\x8e\xd7\xa4\x78\x90\
-\x4a\xeb\x27\x1a\x65\xe4\xc1\x4f\x94\xe0\xbd\xfb\xdf\xd3\x86\x80\
-\x84\x59\x3b\x62\x96\x8c\x8c\x99\x27\x6b\xc6\xcc\x97\xb5\x63\x35\
-\xf8\x2e\x00\x8b\x7d\x54\x00\xdf\x00\xcc\xa3\xe3\xe6\xcb\xa8\x39\
-\x06\x9f\xfa\x38\xf3\x3f\x8c\xc3\x48\x32\x34\x83\x27\x93\x87\x31\
-\x85\x8c\xcd\x4c\xe9\x8d\x9d\x23\x63\xa3\x3e\x92\xa2\xdf\xeb\x52\
-\x90\x41\x12\x1d\x8f\x4b\xbf\xe7\xe6\x0d\x01\x3e\x53\xed\x03\x42\
-\xfc\xdd\x16\x77\x8e\xca\x60\x0d\x74\x94\x97\xda\x56\x7b\x5c\x4c\
-\x42\x58\x69\x32\x38\x32\xbb\x69\x19\xcf\x43\xf8\x68\x98\x3b\xf5\
-\x7b\x52\xdc\xf4\xb8\x16\xf0\x13\x2b\x55\x49\xac\x04\x69\x4a\xe8\
-\x38\xb9\xfb\x89\x21\x93\x65\x0b\x43\x0d\x19\x00\x31\x92\xfe\x1f\
-\x4e\x82\x1d\x4a\x25\x38\x18\x81\x92\x9d\x8c\x02\x89\x3a\x86\x52\
-\xfc\xc1\x05\x32\xf1\x10\x41\x9f\x71\x02\x82\x57\xe7\xc7\x71\xc3\
-\x68\xdf\x21\x74\x0c\x3e\xcd\x71\xf8\x4f\x19\x12\x1c\x3f\x9c\x84\
-\x3f\x78\x92\x32\x36\x30\x3a\xb1\x61\x33\xf4\x3d\xe1\xde\xc6\x50\
-\x75\xe1\xa6\x27\xf4\x3d\xe3\xde\x6d\xcf\x94\x22\xf8\xfc\xa9\x6a\
-\x81\x10\xcb\x88\xf3\x6d\x71\xe9\x28\x2f\xd6\x40\x47\xf9\x68\xb3\
-\x77\xfb\x21\x68\x20\x43\xeb\x3d\x65\xea\xdc\xa5\xbe\xa9\xdf\x2b\
-\xe2\x0d\x52\x9c\x7b\x99\x14\x7d\x5e\xd1\xf5\x70\xd4\xcb\x95\x40\
-\x21\x7a\x12\x25\x19\x80\x1a\x2a\x99\x1b\x86\x4d\x93\x09\x2a\x91\
-\x6b\xef\x9f\x24\xc5\x00\xf0\x9e\x32\x06\xfb\x3e\x3c\x5b\x7e\xfd\
-\x5f\x4b\xe4\x55\x6f\xad\x90\x77\x4c\x5b\x2d\x1f\x9e\xbb\x5e\xbe\
-\xb4\x78\x93\x9c\xb4\x62\x8b\x9c\xbd\xb6\x49\x2e\xda\xb0\x4d\x2e\
-\xd9\xb8\x4d\x2e\x26\x16\xac\x6f\x92\x33\x57\x6d\x95\xff\xf9\x6c\
-\xb3\x7c\xf6\xe3\x0d\x72\xe8\xac\xb5\xf2\x4f\x13\x1b\xe5\xff\xbe\
-\xba\x4c\x1e\xfb\xcc\x22\x65\x28\x94\x61\x80\x21\x19\x34\x5d\xc6\
-\x06\x4d\x96\x0d\x74\x8d\x04\xbc\x00\x78\x03\x44\x6c\xe8\x74\x7d\
-\x6f\x30\x4c\xb8\x57\xdc\x73\x5f\xf2\x54\xce\xbb\x5c\x3f\x8b\xff\
-\x8c\x19\x86\x20\x18\x0f\xf8\x44\x1c\xf1\x7f\xb7\xdb\xe2\xd4\x51\
-\x3e\xac\x81\x8e\xf2\x50\x53\x1f\x7f\xc9\xbc\x1a\x53\xfd\xeb\x8d\
-\x11\xc8\x14\x3e\xc2\xf9\xb5\x5a\xb4\x56\x8a\xb3\xff\x4f\x8a\xbb\
-\xde\xd4\x0d\x71\x28\x59\x55\xfd\x9d\x80\xb8\xc8\x08\x68\xd7\x9c\
-\xdc\xf5\x41\x53\xa5\xe8\xff\x9e\xac\x1b\x34\x49\x1e\xf8\xe8\x1c\
-\xf9\x93\x57\x97\xc8\x7b\xc7\x2f\x94\xaf\xcc\x5e\x2c\x3f\x5e\xba\
-\x5c\x6e\xdd\xb2\x99\x6e\xa3\xb4\x6d\xfb\x8e\xa4\x32\x12\xff\xfc\
-\x64\xa3\xbc\xe5\xad\x45\xf2\xec\xbf\xbc\x2f\xf7\x1e\x41\xd7\x1d\
-\x4c\xa5\xfe\xc8\xb9\x32\x31\x74\x5a\xca\x08\x0c\x9b\x69\xaa\x0a\
-\xe6\x7e\x71\xef\x78\x06\x3c\xcb\x39\x3f\xa7\x67\x33\x6f\x08\x82\
-\xcf\x9b\x22\x18\x2f\xea\x4d\x08\xfa\x2e\xb4\x6c\xd9\x72\xdc\x99\
-\x67\x9e\xe9\x86\x29\x57\x08\x6b\xa0\xa3\x34\xda\x7d\xb1\xd3\x71\
-\x24\xe4\x8f\x90\x99\x49\xf4\x4d\x24\x7e\xbf\x83\x0c\xfd\x4e\x17\
-\x7f\xb0\x44\x3c\xe1\x3c\x29\x6e\x7f\x31\x25\xfc\x40\x69\xcf\x75\
-\x73\x25\x30\x55\x12\x4f\x95\x87\x3f\x38\x5d\x5e\x3b\x6e\x8e\x7c\
-\x61\xc1\x6a\xb9\xa1\x69\x07\x5d\x1a\xdb\x0e\xb9\x71\xcd\x2a\xb9\
-\x6a\xe5\x4a\xb9\x62\xc5\x0a\xb9\x61\xd3\x66\xd9\x44\x22\xde\x46\
-\x40\xcc\xdb\x93\x49\xb9\x23\x0b\xf8\x0f\xfb\x61\x7f\x80\x30\x7f\
-\xdb\xbc\x41\x6e\x5b\xdb\x48\xe7\x5d\x21\x17\xac\x58\xa3\x3c\x8a\
-\x0e\x4f\x7c\x4c\x55\x84\x39\x99\x46\x00\x9e\x8a\x32\x04\x74\xef\
-\x78\x06\xbc\x5d\xc0\x33\xf5\xa2\x67\x3b\xf1\x1b\xf6\x67\xd7\xf8\
-\x46\x80\xc4\x8f\x38\xdb\x66\xe2\xed\xc3\xda\xda\x5a\xf7\x96\xa0\
-\x02\x58\x03\x1d\xc5\xd3\xaa\xfd\xfe\x67\x91\xf8\x57\x99\x0c\xad\
-\xdc\x59\xd3\x79\x87\x8d\x80\xae\x0e\x04\x4b\xc0\xbd\x0e\x90\xe2\
-\xda\xe1\x52\x3c\xb2\x44\x8a\x87\x09\x16\xbe\x11\x12\xea\xdd\xaa\
-\x1e\x4e\xc2\xaf\x1b\x3b\x4f\x5e\xf8\x8f\xd9\xf2\xb1\x69\x9f\xc8\
-\x45\x9f\x2d\x27\xbd\x6f\xa5\xcb\xea\x0d\x02\x86\x70\xb7\x36\x6d\
-\x93\x2b\x8d\x01\x00\x9b\x37\x6f\x96\x49\xfa\x0f\xe4\xda\xf0\x37\
-\xef\xc3\xfb\x83\xb5\xeb\xd6\xc9\xcf\x96\xaf\x50\xac\xa3\xef\xbc\
-\xcd\xa1\xaa\xc4\x5e\x8f\x2d\x54\x9e\x80\x67\xf3\x04\x00\x9e\x81\
-\x0d\x01\x5e\x31\x3e\xb2\x94\x9e\x75\x84\x7e\x66\x7e\xfe\x90\x37\
-\x60\xc4\xaf\xe2\x2a\x1e\x8f\x73\x95\x00\xed\x02\x27\xd1\x65\xad\
-\xf1\xee\x28\x0e\x6b\xa0\xa3\x38\x1a\xf6\xda\xe7\xbb\x22\x52\xb3\
-\xd5\x64\x58\x6e\xd0\x52\xa5\x9a\x32\x02\xdc\xb7\xbe\xa1\x85\x7a\
-\x8f\xaf\xfe\x87\xbb\x3f\x94\x04\xf3\xf8\x72\x2d\x14\xb8\xce\x10\
-\x0d\x8b\x1f\x9f\xc3\xe7\xca\x16\x54\x0f\xbf\xf6\xed\xe5\x72\xc2\
-\xc2\xe5\x72\xc3\xea\x95\x72\xcb\x9a\x46\xe5\xe2\x73\xc9\xce\x62\
-\xc5\x86\xcf\x6d\xdb\xb6\xc9\xc6\xc6\xc6\x34\x23\x50\xcc\xb6\x7e\
-\xfd\x7a\xff\x1c\x10\x3f\xce\x0d\xcf\x60\xf3\x76\x7d\xad\x3b\xa7\
-\xaf\x56\x8d\x85\x51\xaa\x92\xc4\x73\x19\x01\x65\x08\x4c\xd5\xe0\
-\x31\x7a\xd6\xa1\xef\xeb\x6a\x01\xc7\x83\xf1\x06\xe0\xf6\x1b\xf1\
-\x63\x04\x23\x7b\x4b\x6c\x04\x36\x11\x5f\xa7\xcb\x5a\xe3\xdf\x51\
-\x38\xd6\x40\x47\xe1\x24\xf6\xde\xf7\xe2\x40\x27\x98\x34\xf1\x9b\
-\xef\xba\x07\x1f\x7a\xd3\xa1\x6b\xed\xde\xfb\xc9\xc8\xf5\xa3\xb4\
-\xf0\xd1\x11\x87\x1b\xd0\x8c\xf0\x7d\xf1\x8f\x98\x2b\xbf\xf7\xf2\
-\x67\xf2\x93\xf5\x4d\x72\xfb\x86\x35\x72\xfd\xaa\x95\x72\x19\x95\
-\xc4\x70\xed\xc3\xa2\xe7\xef\xbc\xc1\x08\x64\xf3\x04\x9a\x03\x1b\
-\x04\xcf\xc7\xc2\x10\x60\xe3\xff\xe1\x6d\x60\x7b\x6b\xd9\x66\xff\
-\x9e\x23\xa3\xe7\x66\x1a\x81\xc0\xf3\xf8\xdf\xf1\xac\xe8\x80\x84\
-\x6a\xc1\xf5\x63\xd0\x52\xaa\xe2\x27\x5a\x87\xee\xc4\xba\x47\x21\
-\x06\x22\x85\xe2\x8f\xe3\x14\x9f\xdf\xa0\x4b\x5b\xd3\xc1\x51\x18\
-\xd6\x40\x47\x61\x34\xb4\xdb\xfb\x02\x12\x3f\x67\xd4\x70\x8f\x3e\
-\x7c\x37\x6e\x6e\x44\xf7\xe0\x3b\xfe\x6b\xd2\xeb\xf7\x8a\xf4\xc6\
-\xcc\x91\x11\x74\xd8\x41\x07\x9c\xa0\x50\x08\xe5\xf6\x53\xc9\x7f\
-\xe6\x73\x4b\xe8\x12\x49\xb9\x69\xed\x1a\xb9\x94\x84\x0f\xf1\x87\
-\x85\x8c\xcd\xf6\x1d\x25\xf5\x16\xaa\x0e\x2c\x5b\xb1\x52\xb9\xef\
-\xcb\x8d\x11\xc8\xb5\xe1\x18\x78\x15\xab\xd7\xae\x53\xd7\xc2\x31\
-\x5c\xf2\x63\xe3\x73\xb3\x01\xc0\x9b\x03\xff\xbe\xd5\x33\x64\x31\
-\x02\x19\x86\xc0\x54\x0b\x60\x00\x07\x4c\x94\xd1\x63\x29\x4e\x10\
-\x37\x89\x04\x89\xdf\xd3\x71\xa6\xb1\x19\x01\xc4\xf1\x39\x74\x79\
-\x6b\x7a\x38\xf2\xc7\x1a\xe8\xc8\x9f\x96\x7b\xec\x79\x0e\x09\x9b\
-\x5d\xd4\x2c\xe2\x0f\xbc\xde\xfb\xf6\xaf\x64\x84\x4a\x3f\x0f\xef\
-\xd2\xd1\x71\x67\xc8\x14\x19\x81\x5b\x1c\x14\x07\x81\x46\x3f\x94\
-\xfe\x7f\x5b\xb8\x5e\x95\xfc\x4b\x96\x65\x2f\xc5\xb1\xf1\x77\x88\
-\x17\xa4\x6f\x14\xb6\x6e\x95\x5c\x47\xde\xc3\x4a\x94\xe6\xe4\x3d\
-\x6c\xda\xb6\x43\x6e\x34\xe0\x3b\xda\x0e\xfc\x6d\xcb\x06\xb9\x7d\
-\x6d\xa3\xdc\xb4\xba\x51\x6e\xd9\xa8\x4b\x7e\x3e\x2f\x0c\x44\xb0\
-\x0a\xd0\x6b\xaa\xa9\x02\xc0\x60\x99\x7b\xcf\xdb\x08\x00\x32\x02\
-\xa8\x3e\x78\xc3\xa6\x4b\xef\x3b\x57\xca\x78\x8d\x25\xce\xd2\xe3\
-\x93\xe3\x18\x55\xad\x53\xe9\x16\xac\xe9\xe2\xc8\x0f\x6b\xa0\x23\
-\x3f\xf6\xd8\xbb\xfd\x89\x54\xb2\xaf\x31\x19\xd2\xea\xf6\xa7\x65\
-\xe4\xcb\xef\xd4\x6e\x2f\x09\x20\x32\xf2\x23\xdd\x9b\x0e\x22\x61\
-\x23\xc0\xa2\x30\x42\xf1\x1e\x98\x2f\xa7\x2d\x5a\x21\xd7\x34\xae\
-\xf4\x4b\xef\x6c\xa2\x47\x3b\x40\x70\xc3\x2e\x78\xcf\xff\xe2\xa7\
-\x1b\xe5\x7d\xef\xaf\x91\xbf\x7d\x7b\x99\xbc\xe8\xef\x1f\xc9\xaf\
-\x3e\xf9\xbe\x3c\xfe\x91\x19\xf2\x8b\x8f\xcd\x95\xfb\x3e\xf1\xb1\
-\xdc\xf7\xf1\x8f\xe5\x81\x4f\x7e\x22\x8f\x7a\x7a\x91\xfc\xca\x3f\
-\x17\xcb\xef\x3f\x37\x5f\x5e\xf3\xd2\x6c\xd9\xef\xed\xf9\xf2\xd9\
-\x8f\x96\xcb\x4f\xe9\x1c\xe6\x7a\x7c\x01\x7c\x2a\xa6\x35\x6e\x4d\
-\xb6\x7e\x64\x61\x52\x8c\x9a\x97\x24\x83\x95\xa4\x7b\x0e\x30\x37\
-\x49\x46\x20\x49\xcf\x07\x60\x04\x10\x9e\xf6\x7c\x20\x3a\xf2\x43\
-\xdd\xa1\x88\xf6\x89\x3f\x40\x61\x88\x23\x5b\xdc\xa5\xc7\x2b\xc7\
-\x35\x1a\x5b\x8f\xa0\x7b\xb1\xa6\x8f\xa3\x79\xac\x81\x8e\xfc\xa0\
-\x6d\x9e\xc9\x88\x76\xf1\x73\xc7\x9e\x3a\xaa\xcf\xfe\xfe\x21\xd5\
-\x75\x37\x58\xd7\x87\xe8\xb3\x1a\x01\x2a\x45\x13\xc3\xa6\xc9\x37\
-\xe6\x2e\x51\x25\xf7\x46\x2a\xb5\xb1\xb1\xe8\xd9\x55\x0f\x6e\xab\
-\xb7\xee\x90\x7f\xff\x78\xa3\xfc\xdd\x84\x95\xf2\xe4\xbf\x2f\x96\
-\x0d\xe8\xc0\x83\xb7\x07\xdc\xb3\x6f\xe8\x47\x52\x0c\x9c\x2c\x6b\
-\x06\x4e\x92\x51\x74\x1c\x1a\x66\x7a\x0c\x02\xf4\xf8\x1b\x3c\x23\
-\x89\x8e\x44\xa2\xff\x7b\x49\x71\xff\x74\x25\xec\xc4\x83\x0b\x92\
-\x27\xfe\xed\xd3\xe4\x6f\xdf\x59\x99\xfc\xc7\xc7\x1b\x92\x64\x54\
-\x92\x73\xd7\x6d\x93\x83\x66\xad\x93\xed\x1e\xfb\x84\xce\x8f\xde\
-\x81\x74\x1d\xf4\x00\x0c\x43\xcf\x19\x1f\x32\x95\x8d\x40\xd2\x18\
-\x01\x9f\xe8\x88\x0f\x95\x71\xc0\x7f\xd8\x0f\xdd\x8c\x55\x1c\x21\
-\xae\x62\xaa\x0d\x20\x15\x87\x1a\x9b\x11\x98\x4b\x8f\x6e\x4d\x1f\
-\x47\xf3\x58\x03\x1d\xcd\x43\xdb\xeb\x26\x03\xb2\xfb\x1f\x12\xbf\
-\x79\xc7\x8d\xb1\xf6\xb7\x3d\xab\x4b\xfe\x70\x43\x9f\x31\x02\xf1\
-\xb0\x11\x30\xe2\x87\x18\x6f\x79\x1d\xf9\xbb\x49\x6e\x21\x97\x9b\
-\xdd\xf0\xa0\xf0\xf1\xfd\x5f\x8b\x36\xca\xcb\xde\x5c\x2e\xdb\x53\
-\x69\xee\xf7\xd8\x0b\x74\xe1\x0d\xf6\xed\xaf\x1d\x3d\x47\xf5\xe0\
-\x6b\x18\x32\x39\x99\x20\x6a\xa9\x04\x46\xe9\x5d\x3f\x7c\x66\x12\
-\x61\x2d\x08\xaa\x9e\x24\xa3\x0f\x90\x80\x59\xd8\xa3\x17\xd2\xf9\
-\xf0\xfb\x63\x99\x78\xf4\x13\x59\xff\xd0\xc2\xad\x62\xc4\xbc\xcd\
-\x62\xf4\xfc\xcd\x24\xfe\x2d\x74\x8d\xad\x3e\x63\x15\x5b\xe8\xd8\
-\xcd\xe2\x81\x05\xf8\x2e\xe3\x18\xa0\x44\xcf\x03\x62\x23\x3e\x50\
-\xe7\x8c\xc2\x03\x0a\x8a\x9f\x3c\x06\x65\x18\x46\xce\x4e\xaa\x2e\
-\xc5\xb7\x3d\x9b\x54\x71\x17\x8c\x4b\x4d\x30\x9e\x39\xee\x5f\xa3\
-\xa8\xb0\xa6\x93\x23\x37\xd6\x40\x47\x6e\x68\x1b\x6c\x32\x5e\x16\
-\xf1\x9b\x52\xab\xa1\x8d\x14\xdd\x9f\x33\xe2\xa7\xd2\x4d\x09\x5f\
-\x97\xf0\x68\xe4\x83\x28\x15\x24\xca\xa0\x27\x50\x4f\xf5\x67\x74\
-\xe7\xad\x1f\x34\x59\x26\x46\x7f\x28\x9f\x27\x81\x87\xb7\xc6\x2d\
-\xdb\x65\xff\x99\x6b\xe4\xd1\xe4\xba\xfb\xa2\x27\xc1\xa3\xed\x40\
-\xf5\xd9\xc7\xb5\x82\x68\x83\x03\x91\xc1\xc8\x24\xe9\x3a\x7e\xc9\
-\x5c\x3f\x94\xea\xdf\xb8\xfe\xd0\xa9\x32\x36\xea\x43\xdd\x42\x0f\
-\x01\x8f\x21\x21\x8f\x9e\xb7\xbe\x66\xe4\x9c\x25\xb5\xc3\x3e\x5a\
-\x16\x19\xf4\xc1\x12\x31\x60\xe6\x32\x71\xef\xf4\xe5\x35\xf7\x4e\
-\x5b\x1c\xb9\x7b\xea\x12\x71\xd7\xd4\xe5\xc4\x4a\x71\xe7\x94\x46\
-\x71\xe7\xd4\x46\xfa\xbe\x82\xf8\x4c\xdc\x3d\x6d\x09\xed\xb7\x42\
-\xdc\x37\xb3\x51\x0c\x9c\xf9\x59\xbc\xff\xc4\xd5\x89\x01\xef\xae\
-\x4c\x0c\x7a\x6f\x3d\x3d\x5f\x93\x37\x64\xf2\x56\x6f\xe8\x94\x1d\
-\xf1\x11\x33\x53\x86\x46\xdf\x67\x52\x8c\xf8\x28\x29\x1e\x5f\x9e\
-\x14\x3d\x9e\x4b\xaa\x38\x44\xdc\x66\xf7\x04\x38\x0d\x06\x51\xb4\
-\x58\xd3\xcb\x91\x1d\x6b\xa0\x23\x3b\xb4\x5d\x6a\x32\x9c\xea\xae\
-\x6a\xbe\xa7\xc4\xcf\xf5\x56\xf4\x7f\xef\xf6\xf7\x90\xf8\x4d\xa9\
-\x8f\xef\x18\xa8\xa3\xdc\x72\x82\x5c\x74\x94\xfc\xc1\xbe\xf5\xa0\
-\x8e\x4a\x67\x88\x1a\xc6\x02\x7d\xfa\x9f\x5a\xb0\x41\xb9\xf8\x7f\
-\x7a\xaf\x51\xd5\xdf\xb9\xa4\xc7\xf9\x50\xba\xab\xf3\x32\xc6\xd0\
-\x28\x41\x81\xe0\x77\x22\x32\xca\x74\xde\x19\x4e\xe2\x27\x21\x92\
-\x20\xb7\xc4\x86\x4e\x5f\x23\x86\x7d\xb4\x48\x0c\x7c\x7f\x89\xb8\
-\x67\xda\x52\x71\xc7\xa4\x25\xa2\xd7\xc4\x95\xe2\xf6\x77\xb7\x88\
-\x9e\x13\xb6\x88\x1e\xe3\x37\x13\x5b\x45\xcf\x77\xa5\xb8\x9d\xaa\
-\x0a\xb7\x4f\xcc\x4d\x4f\xa2\xfb\xf8\x6d\x7c\x5c\xbc\xeb\xab\x4d\
-\x89\xae\x2f\x6f\x4c\x74\x7f\xb5\x31\xd1\xeb\xdf\xab\xe2\x77\xbe\
-\xb3\x4a\x0c\xfa\x60\xa5\x18\x39\x67\x0d\xdd\x1f\x79\x0b\x0b\xb6\
-\x89\x07\xe9\xb9\x30\xf4\x18\xde\xd2\x63\x64\x04\xba\xfd\x3d\x49\
-\x71\xa9\x05\xaf\xe3\x36\x1c\xe7\xf8\xe4\x86\xc1\x4b\x6d\x69\xe6\
-\xc8\x8e\x35\xd0\x61\x27\x1a\x8d\x1e\x49\x99\x0c\x2b\xe9\x20\xb3\
-\x05\x47\xf4\xe1\x93\xc4\x6f\x7a\xb4\xc1\x65\xbd\xf9\x09\x2d\xfe\
-\x11\xe9\xe2\x57\x50\x89\x7d\xce\xf3\x4b\x64\xdf\x69\xab\xe5\xdd\
-\x33\xd6\xc8\x8b\x5e\xf9\x8c\x84\x3e\x57\xd6\x0e\x9e\xaa\x06\xd9\
-\x28\x03\x40\xc6\x00\x46\x41\x89\x1a\xc7\xb2\x5b\xcf\xa5\x3d\x7d\
-\x42\xf4\x19\x25\x3d\xc3\xa2\xd7\xa5\x7e\xca\x08\x40\x5c\x0f\x52\
-\xdd\x7d\xec\x82\x26\x12\xfc\xfa\xc4\x80\x09\x4b\x13\xfd\xfe\xb3\
-\x24\xd1\xf3\xb5\xa5\xd1\x9e\x6f\xad\x26\xa1\x6f\x26\xd1\x6e\x55\
-\x02\xee\x45\x22\x07\x2c\xe8\x5e\x86\xdb\xdf\x4d\x16\x80\x39\x66\
-\xa2\xac\xed\xf1\x96\xf4\xba\xbe\x42\xbc\xaa\x88\xdd\xf6\xfa\x0e\
-\xd1\x63\x02\x5d\xeb\xdd\xcd\xa2\xef\xa4\x95\xe4\x31\x34\x8a\xc1\
-\xb3\x1a\xc5\xc8\xb9\xeb\xa8\xea\xd0\x24\xc8\x33\x12\x7f\x5e\x45\
-\x71\xf9\x24\x0c\xab\x31\x02\x7e\x57\x6a\xfd\x5b\x7f\xe7\xb4\x40\
-\xda\xb8\x46\xc1\x02\xb0\x06\x3a\xec\x78\x9e\x37\xc9\x64\xb4\x60\
-\xa3\x1f\x3e\xd3\xb9\x66\xb0\x1e\x1a\x9b\xa5\xe4\xbf\x87\x44\x1f\
-\xde\x9e\x9c\xb9\x44\xb6\x1d\x36\x45\x8d\xb4\xf3\x3d\x01\x63\x04\
-\x70\x2c\x97\xf0\x19\xa5\x7d\xd0\xb0\xe8\xdf\xa6\xb4\x0f\x0a\x9f\
-\xdc\x6b\x2d\xfa\xed\xf4\x7b\xad\x18\xfa\xe1\xa2\x58\xbf\xf1\x8b\
-\x13\xdd\x5e\x59\xe1\x75\x19\xb7\x99\xd8\xee\x75\x7d\x4d\x89\x32\
-\xda\xf3\xed\xdc\x22\xef\x69\x80\xb0\x7b\x4e\xd0\x9f\x19\xa8\x70\
-\xfe\x4f\x7d\x8f\xf6\xf8\x4f\xd2\xbb\xed\xe5\x14\x5d\xc1\x2b\x32\
-\xd6\xfd\x0d\xda\x47\x1b\x08\x32\x06\xa0\x89\xf6\xdf\x40\x55\x8a\
-\x95\xe4\x89\xac\x12\xc3\x66\xad\x15\x7f\x6e\xdc\x26\xae\x1d\x16\
-\x8c\xe3\x60\xbc\xf3\x77\x4e\x93\xf1\x14\x9d\xd6\xf4\x73\x64\x62\
-\x0d\x74\x64\xd2\xb6\x6d\xdb\x7b\x4d\x0f\x35\x7b\x8b\x3f\xbb\xfe\
-\x17\xdf\x64\xc4\x6f\x1a\xfc\x8c\x40\x55\xc7\x1e\x2a\xb9\x6f\x98\
-\xb0\x92\x4e\xa7\x5b\xf3\x55\xbf\xfd\x6d\x3b\xe4\xf2\xc6\x55\x52\
-\xae\x5f\xa5\x5e\xbd\x89\x21\x1f\x64\xb4\x09\xb0\x11\x48\x23\x9b\
-\xf0\xf9\x3b\x50\xa5\x3d\x5c\xea\xf9\x9b\xc4\xf0\xd9\x4b\x45\xff\
-\x19\x9f\x88\x3e\xef\x2d\x8b\x75\x7d\x9d\x44\xff\xb2\xf4\xba\xbd\
-\x46\x02\x7c\x53\x46\x7a\x8e\x47\xc9\xec\x8b\x13\x62\xf5\xc5\x9d\
-\x55\xe4\xf9\x43\xe7\x93\x74\x5e\x05\x55\x03\x92\x74\xbd\x24\x7d\
-\xe2\xb7\xba\x5e\xac\xdb\xbf\xd9\x60\x10\xc6\x18\x28\x83\x30\x7e\
-\x3b\x85\x6d\x14\x77\xbc\xb7\x4a\x8c\x5d\xd2\x28\x2e\xbc\x01\x5d\
-\x81\x6d\x55\x01\xfe\xae\xda\x03\xc8\x53\xeb\xc9\xe9\xe6\xc8\x8d\
-\x35\xd0\x91\x0e\x6d\x27\x50\xa6\xc2\x90\x5e\xee\xa3\x1e\xcc\x80\
-\xa9\x56\x6a\x4c\x82\x81\xb1\xf0\xe8\xd3\xcf\x02\xa5\x4f\x25\x7e\
-\xaa\xe7\xa3\xa5\x1e\x1b\xbf\xc6\xdb\xb1\x63\x87\x5c\xbd\x7a\xb5\
-\x7a\xc7\x8f\xd1\x7b\x9f\xac\xde\xa0\xfa\xfc\xab\x7a\x3f\x89\xbe\
-\x59\x23\xa0\xcf\x9f\x72\xef\xf9\x3b\xcf\xf5\x37\x66\xfe\x3a\x31\
-\xe4\xc3\x45\xa2\xdf\x94\x45\x24\xe4\x75\x24\xa8\x64\x0c\x62\x54\
-\x2e\x78\xba\xf0\x22\x3d\xdf\x09\x1a\x01\x25\x5a\x0a\x2f\x99\x90\
-\xf8\x61\x50\xf4\x7f\xf4\x69\x8c\x80\x32\x04\x74\x2f\x6c\x6c\x82\
-\xd0\xbe\x64\x08\x70\x4c\xf7\x77\xb6\x89\xbb\x3f\x58\x27\x8e\x3d\
-\x4f\x8f\xb5\xa8\xf1\x97\x36\x0b\xa6\x85\x1e\x73\xe1\x79\x3b\x3a\
-\x76\xec\xf8\x2d\x4e\x3f\x47\x76\xac\x81\x8e\x74\x68\xfb\x37\x32\
-\x18\x19\x01\x1e\x9e\xca\x46\x20\x55\xf2\x77\x38\x8c\xdc\xfb\x59\
-\x5a\x78\x30\x00\x5a\x90\x5a\xfc\xe4\xf6\x7f\xe3\xc5\xa5\x74\x2a\
-\xbd\xb1\xf8\x57\xad\x5a\xe5\xf7\xb5\xc7\xc0\x1e\xf4\xae\x53\x43\
-\x6c\xa9\x7e\xaf\xdc\xfd\x5c\x46\xc0\x26\x7c\x94\xf8\x5a\xf8\x6b\
-\xc4\xfd\x1f\x2c\xa4\x7a\xf5\x12\xd5\x00\x07\x11\x51\x5d\x1e\xee\
-\x36\xc4\x66\x04\x67\x04\xc6\x42\x7b\x97\x3c\x01\x65\x04\x7c\xc1\
-\x96\x6a\x04\xb2\x8a\x9f\x49\x37\x02\x52\x19\x01\x16\x7f\xd8\x18\
-\xe0\xd8\xde\x93\xa4\xe8\x46\xf7\xb4\xf7\x17\xb5\xe0\x53\xdd\xaf\
-\x01\x8b\x5f\xa5\x51\x43\x43\x83\xab\x0a\xe4\x81\x35\xd0\x91\x82\
-\xb6\x2b\x4d\x06\x53\xae\x3f\x19\x81\xe0\x50\x55\x9d\xf9\xe0\x01\
-\x74\xfb\x87\x2e\xfd\xe1\xfa\x1b\xf1\xfb\x9f\xc4\xbb\x2b\xb6\xd0\
-\xe9\xf4\x7b\xfb\xb0\xf8\xb9\x93\xcf\xc7\xeb\xb7\xa9\xe9\xb9\xfc\
-\x63\x09\xab\x11\x60\xe1\x8f\x31\xf5\x7c\x55\xc7\x27\xc3\x31\x66\
-\xfe\x5a\x12\xfe\x02\x72\xf3\x97\x92\xf0\x9b\x74\x23\x1e\xdc\xe9\
-\x77\x95\xe0\x49\x64\xaa\x74\xd7\xe2\x0f\x89\xd1\x50\x2e\x23\xd0\
-\xac\xf8\x19\xbb\x11\x60\x20\x7e\xec\xa3\x8d\x40\x8f\x77\x92\xe2\
-\x8e\x19\x49\x71\xf5\xc3\xec\x01\xe8\xf8\x27\x02\x43\xae\xd5\x3c\
-\x02\x6a\xc8\xb5\x10\x57\x50\xb4\x5a\xd3\xd5\xa1\xb1\x06\x3a\x52\
-\xd0\xb6\xd8\x64\x32\xbf\xd5\x9f\x8c\x80\x32\x00\x18\xd6\x1b\x47\
-\xd8\xff\xfe\x29\x55\xef\x0f\x88\x5e\x35\xd4\x51\x69\xfe\x85\xc7\
-\x3f\x96\x1b\xa8\xae\x8f\x2d\x2c\x7e\x74\xef\xe5\x7e\xf8\x37\x4f\
-\x6c\x54\x55\x05\xe5\x35\x18\x03\x00\x02\x46\x40\xbd\xbf\xf7\x8d\
-\x00\xae\xa3\x1b\xf7\x36\x93\xab\xff\x31\x95\xf8\x9f\xe2\x75\x5b\
-\x50\xf8\xc0\x88\x1f\x02\xd3\xae\x76\x4a\x60\x56\x4a\x35\x02\x79\
-\x8b\x9f\xc9\x6d\x04\xf4\xf1\x7c\x8e\xee\x6f\x27\xc5\x5d\xb3\x92\
-\xe2\x1b\xbf\x45\x5a\x28\x0f\xcc\x88\x9f\x0d\x00\x7e\x73\x5a\x7d\
-\x4a\xd1\x6a\x4d\x57\x87\xc6\x1a\xe8\xd0\xd0\xd6\xd7\x64\xa4\x60\
-\x87\x1f\x7c\xea\xa1\xab\x98\x0f\xff\xe8\xd3\x64\x7c\x38\xc6\xbe\
-\x9b\x7a\x3f\x03\xe1\x42\xc0\x54\x9f\x6f\xf7\xe8\x42\xb9\x66\x2b\
-\x19\x80\x64\x76\xf1\x3f\x31\x7f\xbd\xda\x97\x8f\xf5\x3f\x0d\x24\
-\x7a\x88\x3f\x65\x04\x10\x8e\x0e\x34\x23\xe6\x2c\x11\x77\x4e\x99\
-\x4f\xc2\xdf\x94\x26\x7c\xd3\x78\x67\xc4\xcf\x25\x7f\xba\xb0\x72\
-\x50\xac\x11\x28\x58\xfc\x4c\xbe\x46\x80\x41\x75\xe0\xa0\x13\xf4\
-\xe8\x4a\x2c\x92\x62\xbc\x32\x12\x3f\xa7\x11\xa7\x59\x1f\x4e\x4f\
-\x47\x26\xd6\x40\x87\x86\x36\x5e\x8a\x1b\x25\x0a\x32\x56\x9a\xdb\
-\x19\x8d\xd5\x4b\xaf\xcb\x93\xd2\x1b\xf9\x81\x9a\x2a\x3b\x28\x7e\
-\x5f\xb8\xf8\x1c\x31\x57\x3e\xb3\x70\xbd\x94\x1b\xd7\xca\xc5\xcb\
-\x96\xab\x61\xb6\x70\xfb\xd1\xbd\x17\xdb\xcb\x8b\x37\xe9\xfd\x4d\
-\x4f\xbe\xb4\x73\x70\xfd\x9e\xbe\x2b\x23\x30\x98\x8c\x00\x46\xce\
-\x0d\x99\xb2\x3e\x32\x60\xfa\x7c\x12\x47\x23\xd7\xf1\xe9\x7b\xaa\
-\xf5\x3e\xbd\xe4\x2f\x48\xfc\x4c\xa1\x46\xa0\x68\xf1\x33\xb4\x7f\
-\xb3\x46\x00\x9f\x3d\xde\x91\xe2\x8e\xe9\x32\x72\xcd\xc3\x46\xfc\
-\x7a\xa2\x15\xe3\xf6\x73\x3a\xb1\x17\x80\x29\x8c\xac\xe9\xeb\xa0\
-\xe8\xb1\x05\x3a\x90\x6f\xc4\x40\x93\x81\x32\xdf\xf9\x73\xab\xff\
-\x77\xae\x96\xd1\x47\x16\xeb\x61\xbd\x64\x00\x30\x04\x56\x79\x02\
-\x29\xf1\x9a\x49\x3d\xe6\xc8\x23\x1f\x79\x5f\xbe\xbf\xe8\x33\xb9\
-\x63\x5d\xa3\x94\x4d\xba\x3d\x00\xdb\xb4\xc6\xad\xb2\xf5\xc3\x54\
-\x92\x53\x55\x41\xb9\xfe\x59\xc4\xaf\x3e\xa9\xc4\xc7\x7c\xff\xde\
-\xc0\x89\x4b\x13\x3d\x5e\x5d\xe4\x75\x79\x79\x7b\xa4\x97\x12\x87\
-\xae\x23\x6b\xa1\xb0\xdb\x9f\x5d\x48\x05\x90\xaf\x11\x28\x59\xfc\
-\x4c\x9e\x46\x20\xd2\x9d\xae\xd7\x7b\x82\xf4\xbe\xf6\x7f\x6a\x82\
-\x95\x08\x26\x53\xe5\xf4\x49\xa5\x15\xa7\xdd\x40\x8a\x6a\x6b\x3a\
-\x57\x3b\xd6\xc0\xff\x76\x4e\x3b\xf3\x6b\x87\x7d\xe9\x4b\x27\x1c\
-\x7f\xf8\xe1\x87\x9f\xde\xae\x5d\xbb\xe3\x6d\xfb\xd0\xb6\xde\x64\
-\x1e\x2e\x51\xf0\x9d\xea\x9c\xa6\xb7\xdf\x1e\xfb\x4a\x31\x78\xba\
-\xc4\x6c\x3e\xd1\x11\xb3\x74\x23\x9d\xd5\x08\xe8\x99\x73\x23\x03\
-\x27\xc9\x83\xc7\x4e\x93\x03\xa7\x2d\x97\x93\x57\x6e\x91\xef\x2e\
-\xdf\xa2\xa6\xeb\x6e\xf3\xc8\xc2\xec\xe2\xd7\xdf\xb5\x11\xc0\xac\
-\x41\x18\x78\x73\xff\x07\x73\x49\x94\x2b\xbd\x6e\xaf\x6b\x61\x76\
-\x7d\x45\xbd\xc2\x33\x02\x61\xb7\x3f\xbb\x80\x8a\xa0\x39\x23\x50\
-\x36\xf1\x33\xb9\x8c\x00\xfd\xa7\xee\x07\xff\x75\x7b\x4d\x7a\x37\
-\xfd\x43\x46\xda\xb4\xd7\x69\x92\x5a\x6a\x0d\x04\xd3\xad\x59\x2f\
-\xe0\x88\x23\x8e\x38\xa4\x1a\x67\x1f\xb6\x06\xfe\xb7\x70\xe0\xb9\
-\x17\x5f\xb0\xe7\xe1\x27\xfc\x31\xf1\x85\xfd\xfa\x8b\x86\x36\x4f\
-\xd6\xd4\xd5\xbf\x99\x68\xd3\x6e\x51\xa2\x45\xcb\xb5\x09\xcf\xdb\
-\x18\x8d\x46\xb7\x50\xe6\x00\xe8\x60\xb2\x4e\x44\xeb\x56\x50\xe9\
-\x3e\x91\xbe\xbf\x4f\x70\x26\x0a\x7e\xa6\x5e\xfb\xfd\xbc\xb7\x6e\
-\xf5\x47\x57\x5f\x12\x2e\x96\xe2\xca\x30\x02\x04\x4f\x8c\x81\x2e\
-\xbe\x6a\xf8\xed\x30\x3d\x79\x86\x72\xf5\xe9\xbb\x7a\xe7\xaf\x05\
-\x9f\x5d\xfc\x68\xe8\x1b\x33\xbf\x51\xdc\x3d\x75\xae\x6a\xe4\xa3\
-\xfa\x2f\x89\x00\x3d\xe9\xb4\x8b\xaf\x8d\x40\x45\xc4\xcf\x64\x33\
-\x02\x65\x17\x3f\x63\x33\x02\x2c\x7e\xbe\x8f\x5b\x5f\x94\x91\x3b\
-\x28\xae\xbf\xfb\xa7\xf4\xb4\xd1\x70\x9a\x71\x55\x60\x3a\xf1\x06\
-\xb1\x80\x68\x24\x36\x10\xe8\x3a\xcc\xac\x8f\xc5\x62\x2b\x1b\x1a\
-\x1a\xe6\xb7\x68\xd1\xe2\xdd\x78\x3c\xfe\x0c\x85\xf5\xab\xad\xad\
-\xbd\x6a\xbf\xfd\xf6\xbb\xe0\x94\x53\x4e\x39\xda\x96\xc7\x3e\xef\
-\x58\x03\x3f\xaf\x88\x1f\xfc\xf1\x5c\xd1\xe9\x94\x5e\x62\x9f\x83\
-\x5f\x16\x2d\xdb\xad\x8c\x61\x7e\xb9\x16\xad\xd4\x34\x53\xb1\xba\
-\x5a\x3d\x29\x27\xa0\xfa\x22\x5a\xf2\x29\x81\x73\xe1\xb7\xfa\xfb\
-\x61\x5c\xfa\xe3\x9d\x3f\x5e\xbd\xa1\x9f\x3a\x4a\x66\xb4\xca\x13\
-\x61\x4f\x80\xc5\x0f\x60\x20\x20\x7a\xbf\xa4\x87\xd1\x60\x43\x90\
-\x55\xfc\xf4\x89\xd7\x7b\x23\xe7\x2c\x16\x7d\x27\x7d\xac\xba\xca\
-\xea\x46\xbe\x1d\x10\x49\xc8\x08\x90\x48\xc8\x2b\x08\x0a\x26\x2c\
-\xaa\x12\x09\x1b\x81\xa0\xb1\x29\xab\xf8\x99\x0c\x23\x80\xe7\xa3\
-\xeb\x77\x79\x89\x18\x27\x23\x88\x8b\xbb\x3f\xa4\x7d\xe9\x73\xef\
-\x83\xd3\xd3\x48\x13\x36\x02\xcd\x12\x5a\xe6\xdc\xff\x9e\x48\x24\
-\x56\x91\x31\x78\x95\xf6\xe9\x49\x9c\x65\xcb\x7f\x9f\x47\xac\x81\
-\x9f\x27\xc4\x2f\xef\xb9\x50\x7c\xe9\x1b\x0f\x88\x0e\x9d\x16\x0b\
-\xaf\x25\xd5\xcf\xd3\xea\x82\x10\xfe\x76\x4a\xc0\x26\x32\x02\xf8\
-\x04\x3b\xf0\x2e\x9f\xfe\xb3\x81\x8c\x82\x91\x65\x41\xf1\x83\xb4\
-\x73\x8a\xfa\x06\x29\x8e\x3b\x8b\xbc\x80\x3e\x52\xf4\xa7\x4c\xcf\
-\x2b\xf7\x40\xd4\xc3\xde\x27\xc1\x4f\xf2\x85\xcf\xe2\x37\xe2\x4e\
-\x09\x9d\xb1\x89\x9f\x3f\xd1\xca\x3f\xec\xa3\x05\x24\x86\x65\xa2\
-\xd7\x24\x16\x45\xaa\xae\x4f\xdf\xc3\xa2\xd4\x42\x29\xbf\xf8\x19\
-\xdb\xf5\x2a\x22\x7e\x80\x73\x2a\x23\x40\xae\x3e\xae\x05\xe1\xe3\
-\xf3\xf6\xb7\xa9\xe4\xa7\xea\xd7\x1f\x9f\x97\xe2\x82\x5b\xa4\x38\
-\xfc\x4c\x9d\x26\xe1\x74\x4a\x4f\xbf\x60\xda\x02\xfe\x2f\x88\xfa\
-\x8f\x84\xcf\x79\x05\x9d\x8a\xf0\x69\x2b\x30\x3e\x21\x46\x12\xdf\
-\xb6\xe5\xcb\xcf\x0b\xd6\xc0\xdd\x1d\xf1\xe8\xb2\xa3\xc5\x85\x37\
-\xdc\x2d\x0e\xef\xfc\xb1\x68\xb9\x47\xd0\xea\x23\x11\xf1\xfa\x87\
-\x13\x5a\x2d\xc4\x81\x04\x24\x54\x27\x91\xfa\xfa\xc0\x7a\x75\xe5\
-\xa0\xa1\xb5\x14\xa7\xff\x80\x32\xe3\x63\xda\x1b\x20\x63\x10\x57\
-\x8b\x75\x9a\x86\xc1\x21\x53\x49\xd0\xe6\x15\x21\x0b\x3d\x03\xe5\
-\x11\x04\xc4\x4f\xc2\x1f\xbb\x60\x87\x18\x3c\x6b\x2e\x09\x60\xb5\
-\x7a\xe5\x65\x04\x6f\xc4\xc1\x9f\x8a\x60\xc9\x0f\x20\xd2\xe0\xff\
-\xe5\xa6\xae\xfb\x9b\x69\xd7\xab\xed\x9e\xdf\x2b\xc2\xbc\x31\xc2\
-\xe7\xef\x35\x68\xf0\xc3\xb5\x7a\x91\xf1\xc1\xf8\x85\xcb\x06\x4a\
-\x71\xc2\xff\x48\xe1\x99\x09\x43\xca\x8c\xc9\x33\x3e\x94\x67\xd8\
-\x38\x20\x5f\x21\x7f\xe1\x77\xf0\x18\x2c\x02\xd3\xc3\x96\x57\x77\
-\x77\xac\x81\xbb\x2b\x62\xd4\xdc\x33\xc4\x05\xd7\x3f\x25\x3a\x1e\
-\xb7\x4d\x4d\xb3\xa5\x23\x1f\x09\xb3\x8d\x8c\x40\xd0\xaa\x23\x9c\
-\xbb\x86\x66\x00\xd7\xce\xec\x53\x3c\x98\xa0\x22\xbd\xce\x29\xc5\
-\x61\x5f\x96\xf1\x2b\xef\xd1\x1e\x00\x96\xd0\x36\x0b\x68\xa6\xda\
-\x04\x94\xd0\x33\x0d\x40\x50\xfc\x28\xf5\x31\x2e\x7e\xe0\xfb\x73\
-\xa8\xbe\xbf\xd1\x88\x7f\x87\x1e\x83\xaf\x08\x89\x3f\xe5\x86\xfb\
-\x50\x09\x5d\x29\x23\x10\xac\xf3\x07\x09\x37\x0c\x16\x45\x50\xf8\
-\xa0\xc7\x3b\x32\xd2\xe3\x6d\x2d\x7c\x5c\xe7\x87\x3d\xa4\x77\xe8\
-\x49\xd2\xab\x8f\xc9\x18\xc7\x39\xd2\x20\x9c\x0e\x25\x90\x23\xcf\
-\xf8\xf9\xca\xa0\xf3\x9d\xfe\xe4\xe3\xd1\x96\x30\x96\xb0\x36\x2c\
-\xef\x8e\x58\x03\x77\x37\xc4\x3f\xb6\x9d\x2c\x7e\xd4\xf5\x9f\xe2\
-\xe0\x13\x82\x89\x1d\x16\x3d\xa3\xfe\x0f\x27\x24\x5c\x38\x55\xa7\
-\x4b\x24\x74\x9b\x40\x0c\x9e\x00\x3c\x07\xc6\x4f\xc4\xc2\xc1\x6b\
-\x41\xba\x5e\x3c\x22\xa4\x17\x25\x0e\x3d\x5e\x46\xaf\xb9\x5f\x46\
-\xc7\xcc\x55\x7d\x04\xe0\x0d\x68\x4f\xc0\x18\x80\xa0\x11\x48\x13\
-\xff\x42\x2d\xfe\xfb\x66\x7e\x44\xe2\xdf\x62\xde\xed\xab\xfa\x3e\
-\x01\xe1\x67\x15\x3f\xbe\xa7\xb9\xe7\x15\x30\x02\xe1\x06\xbf\x1a\
-\x88\x33\x50\x1d\x28\xc9\x08\x84\x4a\x7d\x25\xfe\xbe\x53\xa4\xd7\
-\x9d\x9e\xf1\x47\xbd\xa4\xd7\xf1\x58\x59\x43\x71\x8d\x59\x83\x55\
-\x1a\x36\xb4\x28\xc1\x90\x9b\x34\x87\xe7\xc8\xd0\xef\x08\x19\x75\
-\x9d\x5f\xf4\xda\x04\x2a\xcf\xd4\xd5\xf9\x79\x28\x70\xbd\x70\x9e\
-\x63\x63\xc0\xff\xe3\xf7\x43\xc4\x61\xb6\xfc\xbc\x3b\x61\x0d\xdc\
-\x9d\x10\xbf\x1b\x3b\x56\x1c\xf3\x35\x5d\xe2\xea\xc8\x86\xf0\xc3\
-\x09\xc0\x11\xaf\xf0\xc5\x8f\x4e\x22\x94\x51\xd0\x61\x87\x45\x1e\
-\xab\x8d\xaa\x12\xc4\x8b\xd5\xc9\x18\x4f\x41\x9d\x01\xed\x0b\x51\
-\x1b\x61\xdb\xf7\x49\x07\xe3\x02\xd4\xa2\x1f\x44\x94\xc3\x0f\x3f\
-\x55\x46\xbb\xfc\x55\x7b\x03\x54\x2d\xf0\x3b\x0b\x69\xc1\xa7\x8b\
-\x5f\xbb\xfd\xd9\xc5\xcf\x63\xf0\x0d\x61\xf1\x73\x78\xa5\x8c\x40\
-\xb6\xd6\xfe\xb4\xeb\x11\x45\x19\x81\x50\xa9\x8f\x67\x8f\xf4\x9b\
-\x21\xbd\x2b\x87\x4b\xaf\x53\x67\xe9\xd5\xea\xf5\x14\x94\xf1\xa7\
-\x7c\xa0\xe2\x3a\x53\x94\x99\xa8\xfd\x91\x86\xcd\x7b\x08\xaa\x47\
-\x21\xe5\x09\xbf\x91\xb8\xb6\xce\x3f\x56\x15\x1c\x7c\x3d\x32\x08\
-\xa1\x63\x39\xff\x71\x5e\x0c\x1a\x82\xcd\x44\x5f\x5b\xbe\xde\x5d\
-\xb0\x06\xee\x0e\x88\x11\x1f\x5d\x23\xbe\x79\xc5\x2a\x7f\x4e\x38\
-\x25\x7c\x7f\xf4\x17\x47\x36\xbe\x07\xa0\x8c\x52\x5b\xab\x4b\x88\
-\x78\x3d\x65\x9c\x9a\x94\x18\xcd\xff\x58\xb3\x3e\xd6\xaa\xad\xf4\
-\xbe\xb0\xbf\xf4\xf6\xed\x28\x63\xed\x0f\xd4\x2b\xd3\xa0\x3e\x89\
-\xf5\xec\xb3\x09\x1e\xe1\xc8\x10\xc6\x90\x04\x09\x66\x48\xd5\x58\
-\x84\x0c\x17\xc8\x74\xd1\xf3\x2e\x93\xde\x00\x12\xca\xa8\x0f\xb5\
-\x11\xd0\xa3\x05\xb5\xf8\xf9\x13\x75\x7e\xed\xf6\x5b\xc4\xef\xd7\
-\xfd\x15\xd9\xc4\xcf\x94\xdb\x08\x64\x13\x3f\x53\xb4\x11\xc0\x79\
-\xf8\x5c\xf8\x84\xf8\xfb\xcd\x94\x91\xdb\x5e\x97\xde\xe9\x3f\xd2\
-\x71\x4a\x1e\x55\xc4\x22\x62\xbb\x11\xe0\x34\x4a\xed\x97\x06\x3a\
-\x0b\xa1\xb1\x10\xfd\x06\xf6\xfe\xa2\x14\xfb\x74\x52\x44\xda\x1f\
-\x22\xbd\xf6\x07\x49\xaf\xed\x5e\xea\xad\x51\x34\x9a\x69\x30\x94\
-\x11\xa0\xc2\x04\x85\x4a\x16\xa3\x13\xcc\x93\xf8\x0c\x1a\x02\xcc\
-\x1e\x7d\x81\x2d\x9f\xef\x6a\xac\x81\xbb\x92\xa3\x1e\x9c\xda\xb9\
-\xf6\xf7\x63\x5f\x16\x64\xf9\x4d\xe4\x35\x35\x2b\x7c\x55\x1f\x37\
-\xab\xee\x80\x28\x79\x00\x2d\x5b\xcb\xe8\x01\x47\x4a\x71\xda\xf7\
-\xa5\xb8\xe8\x8f\x52\x5c\x3d\x48\x8a\x2e\x4f\x4b\x71\xe7\x1b\x6a\
-\x65\xdd\xd8\xfd\xef\x49\xef\x3e\xca\xb8\xf7\x8d\x57\xdf\xc5\x60\
-\xaa\xa7\xdf\x45\x19\x17\x33\xf8\xfe\x7a\xa8\x14\x17\xdf\x2c\xc5\
-\x19\x17\x4b\x71\xc0\x51\xa9\x29\xaa\x7d\x4c\x46\xa3\x6b\x66\x88\
-\x3f\xb8\x9f\xf6\x5a\x14\xd1\x0e\x94\xc9\x7e\x3f\x46\x7a\x63\x66\
-\xab\xa9\xb2\xd5\xab\x43\x7e\xd5\x87\x7a\x3f\x1a\xfc\x50\xe7\xcf\
-\x70\xfb\x0b\x13\x3f\x53\x2e\x23\xd0\x9c\xf8\x99\x82\x8d\x40\x50\
-\xfc\x3d\xc6\xeb\xef\x77\x7e\x20\x23\x97\x0f\x95\x1e\xe2\x0a\xd5\
-\x29\x8a\xdb\x50\x0f\xbf\x34\x54\xdc\x67\xab\x0e\xc4\x5b\x4a\x71\
-\xd0\x97\xa4\x38\xf5\x12\x29\xbe\x4b\x69\x79\xe9\x60\x29\xae\x7b\
-\x4a\x8a\x5b\x5f\x91\xa2\xeb\x9b\x18\x54\xa4\xab\x19\xdd\xdf\xd2\
-\x6f\x17\x6e\x79\x5e\x7a\x37\xfd\x5d\x46\xaf\xff\x8b\x14\x97\x0f\
-\x93\xe2\xc2\xdb\xa4\x38\xfd\xa7\x52\x1c\x72\x8a\x14\x09\x55\x08\
-\xa9\x76\x07\xaf\x4e\x57\x13\x62\xf5\xc8\x13\xd6\xc2\x22\x98\x47\
-\xf1\xc9\x63\x12\xc0\x48\x5b\x9e\xdf\x95\x58\x03\x77\x15\x7b\x8e\
-\x9a\xf9\xcb\xc4\x25\x37\xaf\xf5\xda\xb5\x47\xc9\x8d\x12\x9f\x1b\
-\x58\x2c\xc2\x4f\xb7\xf6\x4a\xfc\x28\xd5\xcf\xf8\xbe\xf4\x2e\xef\
-\x23\xa3\x7d\xc6\xe9\xf7\xf3\x58\x8d\x16\xef\xeb\xb1\x20\x25\x56\
-\xdf\xc5\x52\xd5\xaa\x57\xdd\x42\x35\x45\x35\x5c\x73\x35\x1b\xee\
-\xc8\x59\x52\x3c\x48\xff\x61\x75\x5e\xec\x8b\x63\xd4\xab\x3d\x2a\
-\xad\x61\x18\xae\xba\x4f\x8a\x33\x7f\x28\x45\xbb\x0e\xfe\x35\xe3\
-\x70\x19\x55\xa9\x90\xc8\x14\x7f\x10\x73\x9f\x51\x64\xea\x0b\x7f\
-\x2b\xbd\xe1\x33\x92\xf1\xe1\x33\xf5\xec\xb7\xe8\xe4\x33\xf4\xa3\
-\x05\x24\x00\x6e\xed\x2f\x59\xfc\x4c\xa9\x46\x20\x5f\xf1\x33\x79\
-\x1b\x81\x34\xf1\xd3\x3d\xe1\xb9\xfb\x4c\x91\x91\xb3\xaf\xd4\xd5\
-\xb3\x3a\xaa\xa6\x25\x5a\xa8\x3a\x79\x46\x5c\xfa\xe8\xf4\x57\x69\
-\x80\x76\x81\x7a\xaa\xd2\xb5\x3f\x58\x0b\xfe\x27\xf7\x48\x71\xf3\
-\x8b\xba\xcf\xc4\x5d\x1f\xe8\xbe\x02\x77\xcc\x50\xd7\x50\xd7\x52\
-\x7d\x29\x26\xd2\xfd\x62\x26\xa4\x57\xf5\x3d\xd3\x67\x14\xf1\x83\
-\x7d\xf0\x8a\xf1\x2e\xca\x0f\x00\xfb\xdf\x42\x46\x03\x06\xe4\xcc\
-\x4b\x65\x6c\xff\x23\xb5\xc1\xa7\x6b\xc6\xa8\xa0\xd1\xde\x5e\xb3\
-\x86\x00\x6f\x0f\x00\x8e\x9d\x7b\xd0\x41\x07\x7d\xc7\x96\xff\x77\
-\x05\xd6\xc0\x5d\x01\x09\xad\xaf\x38\xe7\x52\xdd\xc8\x13\xab\xdd\
-\xa6\xea\xee\x5a\x54\x99\xe2\x0f\xba\x79\xe4\xb6\x47\x4e\xfa\x96\
-\xf4\xae\xee\x2f\xbd\x7b\xde\x24\x37\x7b\x96\xea\x9f\xaf\x84\x8e\
-\x7a\x35\xdc\x6d\x0c\xd3\x55\x9d\x75\xd0\x12\xaf\x5b\xe3\x23\x86\
-\xd8\xb0\x19\x32\x31\x78\x92\x02\xdf\xd5\x3e\xd8\x97\x8f\x81\x7b\
-\x0e\xc3\x80\x09\x3e\xf1\xbe\x1f\xab\xda\x5e\x37\x4a\xc6\x4f\xbb\
-\x40\x7a\x6d\xf6\x50\x25\x95\xaa\x66\xa8\x7b\xb2\x66\x04\x8d\x71\
-\x61\xb1\xaf\x77\xe2\x39\xb8\xd7\xa4\x5a\x09\x67\xe8\xac\xc5\x24\
-\x84\x65\x19\xe2\x2f\xd0\xed\xcf\x46\xb1\x46\xa0\x50\xf1\x33\xcd\
-\x1a\x81\xa0\xf8\x51\x0a\x43\x6c\xb7\xbe\x2a\x23\x9d\x4e\xd7\xa5\
-\x3e\xc4\x45\x6e\x36\xda\x71\x32\xe2\x50\x61\x44\xc7\xbf\xbd\x96\
-\x32\x7e\x32\xa5\xc5\xcf\xef\x95\xde\xad\x2f\xc8\x58\x1f\xf2\xa0\
-\xee\xa4\x34\x42\x7c\xe2\x3a\x30\x30\xa6\xb4\x17\x24\x78\xbe\x7e\
-\x84\x7e\xab\x4e\x45\x7c\x9f\x78\x95\xa9\xfe\xa3\x7d\xb0\x6f\x0f\
-\x1c\x43\x20\x0c\x5e\x59\x3f\xca\x1b\x30\x08\xf4\x3b\x76\xd5\x48\
-\x2a\x68\xa8\x8a\xb2\xf7\xfe\xa1\xb7\x11\x19\xf7\x1c\xcc\xbb\x98\
-\x44\x86\x27\x94\xd9\xde\xaa\x55\xab\x5f\xdb\x74\xb0\xb3\xb1\x06\
-\xee\x6c\x44\xff\x77\x9f\x16\x27\x9c\x8b\x48\xda\x41\x91\xb8\x1d\
-\x8b\x43\x52\x24\xa9\x77\xb0\x69\x25\x6b\x50\xf8\x2d\xda\x4a\xf1\
-\xad\x2b\x65\xa4\x0f\x25\x20\xd5\xad\xb9\xa1\x2d\x3a\x9c\x12\x5f\
-\xcd\xc7\x87\xe9\xb2\x75\x6f\x3b\x7f\x9e\x7c\xdd\xf0\x46\xc2\x4e\
-\xa7\x66\xe8\x0c\x35\x07\x3f\xde\xdb\xd7\x0f\x9f\xe9\x2f\xa2\xe1\
-\xf7\xd2\x83\xd1\xf0\x0d\xc2\x02\x19\x1f\x33\x47\x5f\xb3\xd7\xbf\
-\x64\xf4\x82\x6b\xa5\x68\xad\x57\xb7\xcd\xb8\x47\x1b\xf4\x3f\x19\
-\x81\xa4\xd7\xf1\x28\x99\xe8\xfa\xf4\x9a\x78\xbf\x89\x8b\x95\x0b\
-\xac\x1b\xfa\x90\xc1\x4a\x2e\xf9\xc3\x14\x6a\x04\x8a\x15\x3f\x93\
-\xd5\x08\x04\xcf\x03\x51\x52\x7d\x5f\x5c\xff\x57\x19\xd9\xbb\xa3\
-\x16\x3f\xbc\x29\x12\x48\x56\xf1\x47\x02\x71\xdb\xfa\x0b\x52\x9c\
-\x73\xb5\x14\x7f\xfc\x97\x3a\x4f\xbc\x97\x9a\xd7\x50\xb9\xf3\xb1\
-\xae\xaf\xe9\x6b\x31\x7c\x6d\xf3\x3d\xa7\x91\xb2\x1d\x03\x94\x51\
-\x30\xf1\x46\x46\x2b\xd6\x77\x92\xaa\x32\x78\x17\xdc\x28\x63\x1d\
-\x3a\x05\xee\xd1\xea\xb5\xa8\xa5\xce\x59\xfc\x81\xea\xca\x2e\x1f\
-\xaa\x6c\x0d\xdc\x99\x88\x3e\xaf\xbc\x2d\x0e\x39\x11\x91\xd1\x44\
-\xe2\x08\x5a\x4b\x8e\x30\xdd\x22\xcb\xa5\x2b\xe6\xdb\x3f\xff\x1a\
-\x49\x46\x43\x46\xa8\x44\xf6\xb0\xea\x0c\xd6\x96\xbb\x7f\xa2\xac\
-\x1d\x31\x4b\x09\x1d\xe2\x55\xc2\x1d\x49\xa0\xbf\x3d\xe6\xdf\xc7\
-\x94\xda\x28\xf1\x1f\x98\xaf\x96\xcc\xc2\x20\x9c\xbd\x1e\x5b\xa8\
-\x3e\xf1\xbb\xc5\x48\xf4\xe0\x9b\xac\x06\xed\x88\x81\x54\x2a\xe1\
-\x38\x1c\x4f\xc7\xe0\x7c\xca\x20\x90\x21\xc0\xeb\x3c\xd5\xc9\x87\
-\xae\x89\x45\x2d\xd5\x44\x20\xf7\x4f\xa6\x3a\xe3\x0d\x54\x57\x6c\
-\xad\xef\x11\xd8\x33\x82\x86\x9e\x53\x79\x02\xad\xf7\x68\xf2\x7e\
-\x39\x44\xc6\xfb\x50\xa6\xea\xfe\x96\x16\x3d\x0c\x00\x67\x40\xa2\
-\x54\xf1\x33\xf9\x1a\x81\x52\xc5\xcf\x58\x45\xc6\xe7\x82\xf8\xa9\
-\xbe\x2f\xae\x1c\x23\x23\x14\x67\xea\xd5\x29\xc4\x8f\x3a\xbf\x4d\
-\xfc\xc1\xb8\x44\x7d\xfc\xbc\xdf\x28\xaf\x41\xb9\xf7\xbd\x29\xee\
-\x4d\x89\x8d\xfb\xe5\xeb\xa9\xb8\xb2\xdc\x7b\x4e\xf1\xdb\xc0\x39\
-\xf8\x3c\xfc\x1d\x06\x9b\xae\xa9\xe6\x57\xec\x4d\x86\x07\x46\xe7\
-\xfb\xb7\x4a\xb1\xc7\x7e\xd6\x7b\x36\xed\x44\xaa\x40\x33\xe2\x47\
-\xd5\x96\xab\xb7\x63\x6d\xba\xd8\x59\x58\x03\x77\x16\xa2\xf7\xb8\
-\x19\x62\xbf\xc3\x11\x09\x24\xfe\x5a\x5f\xfc\xe6\x53\x47\x1c\x32\
-\x06\xd5\x09\x95\x9b\x8d\x49\x37\xd1\x88\x47\xa2\x8b\x8c\xa5\x92\
-\x18\xc2\x27\xd4\x2a\x3a\x58\xd1\x06\xa2\xc7\x82\x1b\x98\x37\x9f\
-\xbe\x1f\xf0\xe7\x8f\xe5\x05\x2f\x7f\x26\xbb\x4c\x5a\x25\x1f\x9e\
-\xbb\x5e\xfe\x7b\xe9\x66\xf9\xe1\x9a\x26\xb9\x62\xf3\x76\xb9\xae\
-\x69\x87\x5c\x4f\xe0\x13\xbf\x67\x53\xf8\xb8\x79\x2b\xe4\xa8\x49\
-\x1f\xcb\x2e\xff\x9e\x27\x7f\xf8\xfc\x7c\x79\xf0\x5f\x3e\xd1\x9e\
-\x03\x8c\xc1\xb0\x39\x32\x46\xe2\x6f\x41\xd7\xc2\xc0\x1e\xf4\xfb\
-\xf7\xab\x17\x68\x53\x80\x21\xb8\x87\x32\xe2\x99\x54\x07\x35\xf7\
-\x9f\xd3\x1b\x60\x23\xd0\xaa\x8d\xf4\x2e\xed\x9f\x8c\xf7\xa6\x8c\
-\x95\x32\x02\x8a\x72\x89\x9f\x69\xce\x08\x94\x4b\xfc\x4c\xa6\xd8\
-\xde\x32\xe2\x27\x2f\xed\xb2\x21\x32\x12\xa3\xf4\x45\x7d\x3f\x97\
-\xf8\x83\x71\xf8\xe5\xef\x4b\x71\xd3\xf3\xda\x15\x87\x5b\xae\x5c\
-\x74\xe3\xd6\xe3\x9a\xf4\x99\x61\x04\x72\xde\x4f\x33\xe2\x0f\x63\
-\xd2\x25\xf8\x3d\x76\x9b\x69\x43\xe8\x4d\x06\xe1\xd6\x97\xa4\x38\
-\xeb\x2a\x29\x6a\x4d\x09\x4f\xf7\x6e\xc4\xaf\x20\xf1\xa7\x55\x09\
-\x08\x7e\x53\xf0\x17\x9b\x3e\x76\x06\xd6\xc0\x9d\x81\xe8\xfb\xda\
-\xfb\x6a\x50\x8d\x16\x3f\x47\x88\x2f\x7e\xbf\x91\x87\xbe\x7b\x1d\
-\xbe\x28\xbd\x6b\x07\xcb\xe8\x43\x9f\x50\xdd\xfe\x53\x19\x21\xf1\
-\xe1\x75\x1a\x84\x08\x41\xaa\x51\x76\x24\x7a\xb8\xec\x58\xe1\xb6\
-\xf7\xd4\xd5\x72\xc2\xf2\x2d\x6a\xd9\xeb\x82\x37\x2c\x8d\xbd\xae\
-\x51\xae\x5f\xb5\x52\x36\xae\x59\xa7\xc6\xeb\x0f\x98\xb9\x5a\x7e\
-\xf3\x99\x8f\xd4\xbc\xfd\x6a\xf1\xcc\xa1\x1f\x68\xc3\x10\xae\x22\
-\xa0\xad\x00\x0d\x88\x37\x3e\x2a\xc5\x3e\xc1\xc1\x29\x19\x19\x5b\
-\x3f\x67\xa4\x06\x46\x20\xe9\x35\xb4\x94\xde\x65\x03\xd8\x08\xa8\
-\x0c\x56\x6e\xf1\x33\xd9\x8c\x40\xb9\xc5\xcf\xa4\x5d\xef\xd6\x17\
-\x65\xf4\x8e\xa9\xaa\x95\x3d\x12\xad\x43\x5b\x4f\x0e\xf1\xd3\x6f\
-\x0e\xdb\xeb\x20\xdd\x32\xaf\xea\xf6\x94\xde\x30\x22\x21\x21\xfa\
-\xd7\xa4\xef\x36\x23\x50\xb2\xf8\xc3\x04\xae\xab\xd2\x8a\x9e\x4d\
-\x2d\x76\xd2\x97\xee\xef\xb7\x7f\x96\xa2\xe3\x89\xba\x63\x18\xc4\
-\x8f\x57\x87\xe9\xfd\x07\x82\x46\x80\xdf\x12\xec\x12\x23\x60\x0d\
-\xac\x34\xa2\xff\x84\x49\xa2\xe3\xb1\x78\x68\xbb\xf8\x83\x2e\x5f\
-\xe7\x0b\x64\xfc\xde\xb7\x74\x1d\x9f\x4a\xfb\xda\x61\x33\xd5\xc2\
-\x19\x10\xbe\x5a\xe1\x76\xf0\x07\x72\x9f\xc7\x3f\x96\x37\xbe\xdb\
-\x28\xa7\xac\x4c\x4d\xb4\xc1\x1b\x66\xe0\xc5\xb4\x5b\x98\x8c\x73\
-\x3b\x4f\xc7\x4d\xf0\x2a\xbb\xfe\x14\xdd\x04\xfe\xc7\x7e\xab\xd7\
-\xae\x53\x53\x75\x37\xae\x5c\x21\xb7\x6d\xda\x20\x93\x1b\xd6\xca\
-\xb5\x8d\x2b\xe5\xa4\x85\x4b\x65\xef\xf7\x96\xc9\x23\xb1\x1e\x9f\
-\xa9\x52\xa4\x8d\xe6\x63\x8f\x00\x8d\x85\x30\x4a\x5f\xfd\x51\xea\
-\x39\xb2\x55\x09\x28\xdc\xf7\x04\xae\x1c\xa6\xea\xb2\xaa\x54\x09\
-\x65\xe0\x72\x12\x36\x02\xc1\xbe\xfd\xe5\x14\x3f\x8b\x44\x5d\x0f\
-\xaf\xda\x6e\xa7\x74\xbc\x62\xa8\xac\x4b\x90\xe8\x95\xf8\x1b\xec\
-\xe2\x0f\xc6\x15\x4a\x7d\xbc\xb6\x43\x7b\x01\x5c\x7d\x94\xf8\x81\
-\x73\x67\x5c\xd3\xfc\x97\x6e\x04\xcc\xdc\x09\xe6\x77\xc9\xe2\x0f\
-\x62\xee\x43\x1b\xec\x71\xca\x10\xc4\x28\x0d\xe3\x98\x81\xf9\xdc\
-\x2b\xe9\xf9\xea\x53\x6f\x0b\x82\xcf\x68\x37\x02\x3b\xbd\x3a\x60\
-\x0d\xac\x24\x24\x90\x17\xc4\xb1\x5f\xc7\xc3\x36\xa9\x8e\x19\x61\
-\xf1\x07\x5f\xfd\xfc\xb8\x9b\x7e\x15\xf7\xc0\x42\x59\x3f\x48\x8f\
-\xb0\x83\xf0\xb1\x7a\x0e\x4a\xe2\x8e\x8f\xcd\x51\x0b\x64\xae\xda\
-\xb2\x9d\x4e\xad\x37\x08\x9a\xc5\x1e\x14\x39\xff\x97\x6b\x0b\xee\
-\xb7\x6e\xdd\x3a\x35\x6f\x1f\xa6\xef\xfa\x8c\x80\x41\x48\x06\x66\
-\xf2\x19\x3a\x6b\x6d\xba\xf8\xf9\x13\xc0\x08\xa0\x5b\x2f\xbc\x81\
-\xcb\xef\x4c\x1a\x37\x16\x0b\x5a\x04\x13\x3d\xf5\x9c\x6c\x04\xda\
-\xed\x23\xbd\xeb\x1e\x93\x5e\x0f\x12\x24\xea\x95\x10\x7f\xb6\x4c\
-\x5e\x22\xe1\x12\x11\x94\x55\xfc\x80\xcf\x45\xc2\x8d\xf4\x99\x4c\
-\xcf\xf6\xb8\x7e\xc6\x5c\x6e\x3f\x0b\x05\x9f\x78\x17\x8f\x52\x5f\
-\xb9\xfb\x81\xea\x8a\x11\x9d\xff\xdb\x06\xfd\x1f\x34\x02\x4c\x59\
-\xc5\x1f\x84\xae\xa7\x8d\x00\x5d\x07\xc6\x0e\x9f\xbd\xc9\x98\xff\
-\x7c\x40\xaa\x6d\x28\xb3\x4a\x18\xcc\x0f\x5c\x1d\xd8\xa9\x0d\x83\
-\xd6\xc0\x4a\x41\xf5\xe4\x21\xe2\xec\x9f\xe3\x21\xed\x25\x3f\x47\
-\x10\x1a\xfa\x78\x3d\x7d\xf5\x5a\x6e\xae\x8c\x8e\x9a\xad\xdd\x7d\
-\x12\x7e\xbb\xe1\x53\x64\xd7\xb7\x17\xa9\xfa\x3b\x6f\x61\xd1\x63\
-\x6b\x4e\xf0\xb9\x36\xcc\xde\xbb\x72\xe5\x4a\x7f\x02\xcf\x35\x6b\
-\xd6\xf8\xde\x04\x9f\xb7\xcf\xb4\xd5\xaa\xcd\xc1\x9f\xc5\x57\x55\
-\x07\xd8\x20\xe0\xbe\xe7\x24\xd5\x33\xdc\xfa\x54\x52\xb4\xda\x93\
-\x9f\x31\x5d\xfc\x0c\x3d\x7b\x3d\x5c\xc6\x03\x8f\x94\xde\x9f\x9e\
-\x93\x98\xf1\xc7\xcf\xf4\xcd\x65\xf6\x22\x09\x8f\xea\x43\xdf\x7e\
-\xdb\x7e\x45\xc1\xf7\x8c\x12\x1b\x43\x99\x6f\x7b\x43\x46\xf7\xed\
-\xa4\xba\xf5\x2a\xf1\x93\x6b\x5c\x17\xee\x56\xcb\xe9\x8f\x86\xbe\
-\x2b\x46\x49\x71\x37\x79\x51\xf9\x96\xfa\x16\xd4\x58\x85\xc0\xf3\
-\xd5\x77\x7b\xcd\xba\x5f\xd9\xa0\x7b\x0b\x1a\xd5\x78\x97\x71\xda\
-\x80\xdd\xf0\xac\xee\x79\x18\x7c\xc6\x14\x41\x23\xc0\x0d\x83\x3b\
-\x6d\x91\x53\x6b\x60\x25\x10\xff\x92\x57\xa9\xf1\xf3\xe8\x10\x61\
-\x2b\x09\x39\x62\x5a\xef\x45\x89\xfe\x2f\xdd\xa8\x86\xb5\xf5\x48\
-\x50\x58\x2a\x2b\x36\x98\xea\xdf\xf7\xbd\x27\xcf\x7f\x66\x96\x7c\
-\x6f\xc1\x52\xd9\xb4\xb6\x51\x36\x6d\xd9\xa2\xe7\xd9\x0f\x89\xde\
-\x7c\x35\xdf\x83\xe1\x29\xd8\xed\xe7\x63\xd3\xfe\x0b\x4d\xdd\xcd\
-\xac\x5f\xbf\x5e\x9d\x0b\x86\x06\x1b\x96\xe8\x6e\x8b\x29\xbd\x46\
-\x99\xaa\x40\x86\x11\x98\x97\xa4\x67\x48\xaa\x3e\x04\x77\xbc\xde\
-\x24\x5a\xed\x85\x59\x68\xac\x46\x40\x0d\x3a\x81\x30\x60\x04\x4e\
-\xf8\x86\xf4\x7a\xbe\x29\xe3\xb7\xbd\xa2\x33\x7f\x81\x19\x3f\x1f\
-\x82\x75\x7e\x1f\xca\xbc\xf0\x0c\x6c\xfb\x17\x04\xdf\xaf\x82\xee\
-\x1f\x13\x78\x1e\x73\x6e\xda\xab\x3e\xc6\x7f\xcd\xcb\xe9\xdf\x76\
-\x5f\xf5\x6a\x50\x09\x27\x57\x5d\xbf\x19\x6c\x1e\x0e\xa8\x44\x95\
-\x4a\x41\xf7\x66\xf3\x38\x50\x9d\x13\x98\xb5\xe8\x56\x32\x3e\x07\
-\x1c\x97\xfe\xac\x29\x38\x3f\xb0\x01\x80\x37\x70\x22\x65\x31\xab\
-\x96\xca\x89\x35\xb0\xdc\x88\xb7\xe5\x09\xe2\x4f\x7f\x66\x17\x87\
-\x1e\x52\xb9\x7d\x99\xe2\x6f\xf3\x05\x29\xfa\x52\x84\xc1\x75\x56\
-\x53\x6d\xcd\x97\x75\x63\xe6\xc8\xc8\xfd\x93\x65\xcb\xa1\x53\xe4\
-\x3d\xef\x2c\x90\x72\xeb\x66\xb9\x69\xed\x6a\xb9\xd4\xb8\xe5\x98\
-\x5a\x9b\x85\x8b\x2d\xf8\xa9\xc4\x4c\xc0\x48\x00\xfe\x2f\xdb\x86\
-\xff\x9b\xb6\xef\x90\x2b\x1a\x57\xc9\x65\x46\xf4\x38\x3f\x84\xcf\
-\x46\x00\x55\x03\x3e\xcf\x76\x3a\xe7\x09\xcf\x7e\xaa\xda\x03\xfc\
-\x46\xc1\x94\x21\x08\x0c\xf4\x81\x51\x58\xf4\xb1\xb8\xf1\xb9\x8d\
-\xaa\x41\x0b\xcf\x1e\xc8\x04\x78\x35\xc4\x82\x88\xd5\xc7\x75\x75\
-\xe0\xdb\xbf\x55\xc3\x60\xe3\x5d\x5e\x2e\x38\xf3\x37\x47\xb8\xc1\
-\x2f\x6d\x54\x5f\x39\x8c\x00\xdf\x2b\x3c\x8a\xbb\x3e\x90\x91\x6f\
-\x5d\xaf\x7b\xeb\x19\xf1\x43\xf4\xfc\xbc\xea\x77\x9d\x69\x35\xc7\
-\x6b\xb4\x1b\xff\xa9\x3b\xdd\x40\xfc\x7c\xae\x02\x9f\x3d\x2c\x7e\
-\xcc\x57\x90\xde\x26\x50\x66\x23\x40\xf7\x17\x3e\xbf\x5f\x1d\xc0\
-\x6f\x18\x01\xf4\x30\xc4\xaa\x46\x07\x9d\xa0\x9f\x35\xbb\x11\x60\
-\x9d\x7c\x48\x59\xcc\xaa\xa7\x72\x62\x0d\x2c\x37\x62\xc8\x8c\xc9\
-\xe2\xc0\xa3\xf4\xc3\xe9\x3a\x7e\x4a\xfc\x5c\xe7\x43\xc7\x9e\xde\
-\x94\xd9\xd1\x80\x66\x56\xd5\x85\xf8\xc5\x7d\x93\x64\xa7\x07\xa6\
-\xcb\x57\x67\x2f\x26\x85\x6e\xd5\x82\x26\x91\x62\x4d\x3d\x16\x25\
-\x1b\x01\x6c\x41\xd1\xdb\x04\x0f\x17\x1e\xaf\xff\xf0\xea\x6f\xc9\
-\xc6\x6d\x72\xb9\x79\x25\xb8\x55\x4d\xd1\x4d\xc7\x6e\x58\xa3\xbc\
-\x8b\x75\xab\x56\xca\x2d\x5b\x36\xfb\x55\x0b\xd3\x26\x90\x04\xf8\
-\x8e\x9d\x37\xd1\x9f\xfb\xff\xf9\x63\x2a\xe5\xe7\x61\x9e\x7e\x3d\
-\x7f\x5f\x18\xb4\x05\x60\xc5\x9e\x5e\x13\x3e\x15\xfd\xa8\x54\xbb\
-\xf1\xb9\xa4\x68\xb3\x8f\xff\xec\x69\xc3\x4d\x95\x4b\xac\xeb\xc4\
-\xe8\xfb\xe0\x5d\x35\x82\x3c\x01\xca\xbc\x94\x89\x8a\x11\x82\x8d\
-\xb0\xf8\xf9\x9c\x69\xa2\x29\xc5\x08\xf0\x3d\xc2\x75\x47\xc9\x7f\
-\xf5\x83\xba\xbf\xbe\x79\x1d\xc6\x75\x7e\x7c\xaa\x30\x34\x04\xe2\
-\x35\x6f\xdb\xf6\x54\xed\xfb\xbb\x3a\xa6\x9c\xe2\xf7\xeb\xfc\x74\
-\x9e\x8a\x18\x81\x1c\xe7\x4d\x33\x02\xe8\x9c\xd4\x87\xaa\xb0\x68\
-\xd0\xec\x70\xa4\x4e\xff\x74\x23\x00\x4d\xb0\x2e\xb8\x51\xb0\xe2\
-\x63\x07\xac\x81\xe5\x44\x3c\xbb\xe5\x66\xf1\x3f\xbf\xd1\x0f\xa5\
-\x1f\x38\xf5\xa0\xdc\x00\x84\x8e\x3e\x5d\x9e\x91\xe2\x71\x2a\xf9\
-\x43\xe2\x3f\xf3\xcf\xef\xcb\x39\x8b\x97\x51\x71\xbb\x35\xad\xfe\
-\x6d\x5b\x61\x07\x42\x45\xa9\x1c\xdc\xe6\xae\x6d\x92\x0f\xcd\x59\
-\x27\x7f\x37\x61\xa5\xfc\xd6\x8b\x4b\xe5\x51\x4f\x2f\x92\x7b\x3e\
-\xaa\x3b\xff\x24\x08\x7c\x62\xe1\x8e\xc3\x9f\xfa\x44\xbd\xea\xbb\
-\xe6\xa5\xd9\xf2\xfe\x09\x0b\x93\x93\x97\xae\x4b\xc2\x90\xd0\xa6\
-\x2c\x03\x7d\x4f\xae\x5e\xbb\x2e\xf9\xd9\xf2\x15\xc9\x25\xcb\x96\
-\x93\xab\xb0\x51\x3e\xb9\x60\x23\xdd\xef\x7c\xd5\x27\x41\x75\x3b\
-\x0e\x82\x41\x3e\xa3\xe7\xed\x50\x6b\xf5\x61\x9d\x3e\x2c\xd5\x05\
-\x51\xf4\x9b\x91\x14\xbf\x7d\x32\x29\xe2\x2d\x54\xeb\xb0\x9e\xd7\
-\x5e\xbd\x23\xd6\x71\xa1\xe2\x45\x1b\xc5\xe8\xfe\x47\x51\xe6\x19\
-\xa7\x32\xb4\x2f\xd6\x02\x05\x11\x24\x9b\xf8\x99\x92\x8d\x00\xdf\
-\x9f\x39\xaf\x9a\xcc\xa3\xe3\xb1\xba\xde\x6f\xe9\xde\x8b\x51\x7e\
-\x6a\x08\x6e\xeb\x3d\xa4\x77\xf5\x68\x19\xc5\x2b\xb4\x4a\x88\x9f\
-\xa1\xf3\x95\xd5\x08\xe4\x71\xbe\x4c\x23\x30\x55\x8a\x9b\x5f\xa2\
-\xaa\x8e\x19\x53\xc2\x05\xa0\x86\xb5\x01\xb8\x3a\xf0\x3f\x94\xff\
-\xac\xda\x2a\x07\xd6\xc0\x72\xd1\xfe\xf9\x2d\x9d\xc4\x8d\x8f\xae\
-\x31\x0f\xc2\x0f\xa4\xc5\x1f\x04\x23\xf5\xb8\xce\xcf\xe2\x1f\x30\
-\x49\x7e\xe7\xe9\x0f\x54\x0b\x3c\x5a\xdf\x79\x05\x1d\x18\x00\x06\
-\x46\x80\x57\xd7\xc5\x7e\x72\x9b\x6e\xa5\x5f\xb8\x7e\x9b\xbc\x6b\
-\xc6\x1a\xd5\x27\xa0\xfe\x01\x12\x22\x3a\x07\xa1\x37\x20\x3e\xf1\
-\xfa\x2e\xd0\x0d\x58\x31\x92\xc2\x06\x4d\x4d\xc2\xe0\x88\xfe\xef\
-\x25\xc5\x90\x0f\x92\xd1\xb1\xf3\x93\xc7\x3d\xb3\x28\x79\xeb\xa4\
-\x55\x72\xda\xaa\x26\x75\x5e\xb5\x6d\x23\xaf\x60\xc3\x5a\xf9\xf2\
-\x9c\x25\xb2\xc3\x43\x1f\x6e\x25\xa1\x6f\x8e\x3c\xb0\x60\x8b\x18\
-\x3b\xdf\x80\xef\x0b\x36\x8b\x07\x16\x6c\x13\x18\x93\x30\x66\xfe\
-\x6a\xb5\x56\x9f\x1e\xe5\x97\x54\x19\xfc\xae\x0f\x92\xb1\x9f\xf7\
-\x37\xa5\x62\xdc\x3e\xbc\xd4\x94\x0e\xd1\x73\x7f\xa5\x7b\x9b\xdd\
-\xfa\x22\x65\x36\xd3\xc5\x35\x94\xc9\xf2\xa1\x39\xf1\x33\x25\x19\
-\x01\x3e\x27\x09\x3f\x72\xe7\x4c\xfd\x1a\x0c\xae\x7f\x8e\xbe\xfd\
-\x6a\x10\xd7\x4f\xfa\xf9\xcf\xa8\x3a\x0b\xe1\x3c\x05\x3e\x67\xb3\
-\xe2\x67\xe8\xbc\x65\x31\x02\x05\x9c\x27\xcd\x08\xa0\x3a\x80\x2a\
-\xce\x6f\x1e\x93\xa9\x59\xad\xd2\xe2\x86\xf5\xa1\x06\x0f\x11\x73\
-\x29\xd7\x59\xf5\x55\x0e\xac\x81\xe5\xa2\xf5\x7d\x6f\x3f\x18\x3d\
-\xe6\x0c\x3c\x04\x86\xf4\x06\x1f\x2e\xe5\xfe\x7c\xe7\x1a\x23\xfe\
-\xd9\x28\x31\x65\xdd\x68\x5d\xf2\x43\xfc\x28\xd9\xb7\x6d\xd5\x0d\
-\x7d\xd8\x82\xe2\xe7\xdf\x5b\xa9\x3a\xb0\x7e\xcd\x6a\xb9\x65\x4d\
-\xa3\x7c\x63\xee\x12\x79\xe9\xab\x9f\xaa\x52\x1d\x3d\xf7\x94\xe0\
-\xe9\x9c\xa8\x9f\xab\xf1\x00\x04\x1a\xeb\xfc\x06\x3b\x72\xdb\x31\
-\x20\xc8\x1b\x3a\x2d\xd9\x30\x64\x72\xb2\x05\x81\x1e\x85\x35\x6a\
-\x5a\x2e\xb8\xee\xc4\xf0\x79\xdb\xe9\xb8\x2d\xe7\xbf\xb4\x74\xf3\
-\xc8\xf7\x57\xaf\x78\x70\x66\xe3\x9a\xab\xff\xf9\xd1\x8a\x36\x77\
-\xbd\xb5\xba\xb6\xf7\x1b\xab\xe2\xfd\xde\x59\x26\xee\x9a\xfa\x19\
-\x81\xcf\x65\xe2\xee\x69\x4b\xc5\x3d\xd3\x97\x89\xfe\x33\x56\x51\
-\xc9\xbf\x42\xdc\x3b\x1d\x23\xfd\xb6\xa9\xcc\xa0\x07\xf8\x24\xd5\
-\x7b\x7e\x64\xf8\x6f\xfd\x46\x0f\x26\x49\x2f\x05\xd2\xa1\x4c\x12\
-\xbd\xee\x49\xe9\xf5\x78\x43\x62\x26\xdc\x5c\xe2\xcd\x46\xbe\xe2\
-\x67\x8a\x32\x02\x7c\xce\x1e\xe3\x65\xa4\xcf\x24\xe9\x5d\xfb\x88\
-\xee\xdb\x50\x5f\x6f\x1f\xd5\xc7\xcf\x7c\xf6\xaf\xb4\xb1\xe0\x57\
-\x67\x44\x56\xf1\x66\x21\x6f\xf1\x33\xa5\x1a\x81\x22\x8e\xcf\x30\
-\x02\xe8\xcd\xf8\xbf\xbd\x4c\x7c\x64\x18\x47\xd6\x09\x57\x05\x2a\
-\xf6\x6a\xd0\x1a\x58\x0e\x0e\x7d\xf8\x83\xd3\x13\x3f\xeb\xb6\x05\
-\xfd\xbc\xa3\x75\x75\x78\xa0\x4c\xf1\x1f\x76\xb2\xee\x46\x0b\x31\
-\x92\x10\xd1\xda\x2f\x06\x4e\x96\x67\x90\xdb\x8f\x46\xbe\xed\x24\
-\x7e\x76\xe9\xc3\xe2\x87\x7b\xce\xad\xf1\x4b\x37\x36\xc9\x2b\xc7\
-\xcd\xf3\x5f\x13\x46\x86\xcf\x52\x7d\xf7\xfd\xd7\x73\xe6\xfc\x2c\
-\x7a\xfa\x8e\x06\x3a\xfa\x9c\x9b\x8c\x0f\x9d\x9a\xf4\xf4\x7a\x7b\
-\x32\x8a\xeb\x8f\x5d\x80\xff\xb6\x92\x57\xb0\xa6\x66\xf0\xac\x65\
-\xb5\x03\x66\xac\x14\x77\x4c\x5e\x26\xba\x4d\x58\x25\xba\x8c\xdf\
-\x2a\xba\xbc\xd3\x24\x6e\x79\x7b\x4b\xed\x6d\xaf\x6d\x6f\x50\x99\
-\xee\x55\x19\xeb\x4e\xf5\x3a\x4c\x4d\x1d\x04\xfd\xc5\xbb\x8f\xdf\
-\x2c\x7a\x4c\xd8\xae\x32\x81\x19\xdd\x47\x19\xc1\x2c\xd7\x35\x4e\
-\x75\x18\x51\x33\xda\x22\x2e\x82\x03\x5d\x18\x0e\x3b\xfa\x5c\x19\
-\x85\xa8\x8c\x48\x0a\x31\x02\x85\x8a\x9f\x29\xd8\x08\xe0\xbc\x84\
-\x1a\x5f\x8f\x0e\x3f\x27\x9c\xa7\x4a\x7f\xeb\x78\x7e\x16\xff\x21\
-\x9d\x75\xe3\x18\x8e\xa3\xea\x51\x41\x22\x36\x14\x2c\x7e\x86\xae\
-\x59\x94\x11\x28\xf6\x38\x22\xcd\x08\xc0\x9b\xc3\x9b\x8e\x93\x7f\
-\xa0\xe3\x82\x35\xa1\x61\xbd\x28\xcd\x90\x87\xb8\xb9\x53\xa7\x4e\
-\x67\x50\x56\xb7\x6a\xad\x14\xac\x81\xe5\xa0\x66\xc0\x84\xc1\xde\
-\x21\xc7\x61\xa0\xc7\x36\xb8\x80\x51\x3d\x15\x37\x5d\xd1\x58\xbb\
-\x98\x27\x45\xdf\x57\xa4\x78\x98\xdc\xe4\x51\x73\x94\xf8\xa2\x83\
-\x26\xcb\x8e\x63\xa6\xc9\x59\x8b\xa8\xce\x4f\x6e\x7f\xb6\x92\x9f\
-\x85\x8f\xed\xd1\xb9\xeb\xe5\xde\x8f\x51\x49\x3d\x64\xb6\xac\x1f\
-\x32\x4d\xb6\x24\x23\x90\x18\x6c\xa6\xe2\x4e\x89\x1e\xdf\x59\xf8\
-\xe6\x3b\xc4\x3f\xcd\xcc\x07\x40\xe2\x1f\xf9\xe1\x16\x31\x7c\xf6\
-\x0a\x31\x60\xe6\x32\x12\xfc\x0a\x4a\xb0\x8d\x24\xde\xad\x24\xe4\
-\x24\xdc\xf7\xa8\x62\xa2\xa6\x37\xb9\xf3\xf4\x59\xd7\xfd\x8d\xa4\
-\xd7\xf5\x65\x45\xac\xbb\x5a\x6f\x3f\x1d\x35\xee\x1c\x89\x1f\x16\
-\x3f\x32\xc0\xeb\x3a\xf3\x63\x34\x9b\x9e\xf5\x28\x15\x37\x36\x7e\
-\x31\xbc\x60\x23\x50\xac\xf8\x99\xbc\x8d\x80\x39\xaf\x16\x3f\xd5\
-\xfb\x2f\xbb\x4f\xd5\xed\xad\x25\x3f\x3f\x63\xbc\x85\x14\xbf\xff\
-\x9b\xae\x13\x9b\xfe\x0e\x85\x8a\xb9\x68\xf1\x33\x85\x8a\xb9\x04\
-\xf1\x33\x29\x23\x40\x05\x40\x0f\x2a\x38\xd0\x28\xb8\xe7\x81\x3a\
-\x4e\xd2\xab\x49\x2c\x7e\x35\x84\xb8\x55\xab\x56\x4f\x52\x76\xb7\
-\x6a\xad\x14\xac\x81\xe5\x40\x5c\x7c\xd3\x2a\x55\xbf\x4b\x34\xa8\
-\x51\x50\x78\x08\xf5\xce\x97\x33\xc5\x25\xb7\xfa\xae\x3f\x96\xbb\
-\x6e\x41\x22\x44\xe9\xdd\xfd\x8d\x79\xa4\xf8\x26\xd3\x2a\x9f\x29\
-\x7e\x36\x0a\x30\x02\x57\xfc\x67\x85\x76\xf3\x47\x92\xf7\x00\xf7\
-\x9e\x04\x5f\x1f\x5a\x8c\x23\x4d\xf8\x5c\xfa\xd3\x7e\x58\xd1\x97\
-\x84\xbf\x23\x71\xff\x7b\xeb\xa2\xfd\xa7\xac\x10\x77\x4c\x5a\x41\
-\x09\xbc\x89\x04\x4f\x25\x36\xea\xeb\x24\x5e\x5f\xc0\x21\x61\x83\
-\xf4\x12\x5d\x09\x5b\x67\x08\x1d\x6e\xfe\x67\x2c\xfb\xd1\x3e\xaa\
-\x3d\x80\x5c\xc1\x0b\xbb\xea\x38\xb1\x55\x05\x38\xec\xd0\x53\xc9\
-\x60\x4e\x95\xd1\x3c\xbb\xed\x96\x2a\x7e\x26\x2f\x23\x40\xe7\xd6\
-\xe3\xeb\x69\x1f\x54\x55\x8e\x3c\x3d\x35\x87\x5f\xf0\x59\x82\x61\
-\xe7\xff\x51\x3f\x7b\xb0\xd1\x8f\x3e\xf3\x15\x75\xc9\xe2\x67\xf2\
-\x15\x75\xbe\xfb\xe5\x01\x8e\x55\xe7\x41\x6f\xcf\x3e\x94\xc7\x7e\
-\x7e\x7f\x66\x3c\x11\x24\x7e\x5f\x3b\xf4\x1d\x6d\x68\xc7\x51\xd6\
-\xb7\xea\xad\x58\xac\x81\xa5\x22\x06\x4e\xfa\x83\x38\xf0\x68\x3c\
-\xc4\xb6\x48\x4d\x34\xe9\xf1\xd0\x5e\x9e\x30\xf3\x20\xfa\xcf\x94\
-\xcc\x91\x51\xb3\xd5\xda\xf7\x28\xb5\xeb\x06\x4d\x92\xcf\xce\x5d\
-\x45\xa7\xd0\xef\xd8\xb3\x89\x7f\xe5\x96\xed\xf2\xf4\xe7\xc8\x73\
-\x18\x3a\x47\xb9\xf9\xea\x1d\x3c\x97\xf6\x18\xb2\x9b\x32\x02\x49\
-\xb3\x28\x87\x11\x3e\xfd\xff\xc0\x42\x19\x1f\x36\x6d\x5b\xe2\xbe\
-\x77\x57\x27\xfa\xbc\xb1\x22\xda\xe3\xad\x75\x24\xfa\x1d\x29\xf7\
-\x5d\x25\x52\x4a\xbc\x46\xe8\xe6\x37\xff\x9f\x86\x9f\xa0\x59\x32\
-\x46\xc6\xff\xc8\xec\x3e\x54\x0d\x80\x27\xf0\xc5\x2f\xeb\x84\xb7\
-\x89\x86\xb9\x62\xa4\x6a\x40\x8a\x76\x23\x91\x99\xf3\xd9\xc4\x5d\
-\x2e\xf1\x33\xcd\x19\x01\xf5\x7f\x97\x71\xda\xf5\xff\xc5\xfd\x5a\
-\xfc\x36\xf8\xd9\xf6\x3f\x86\x8c\x2b\x19\xd9\xb4\x78\x48\xdd\x63\
-\x73\xe2\x2e\x9b\xf8\x19\xba\x76\x4e\x71\x37\xf7\x7f\xa1\xd0\xf9\
-\xfc\x3c\x01\x23\xd0\x9b\xf2\xdd\x71\xdf\x4a\x8b\x23\x34\x0c\x07\
-\xc4\xcf\x7d\x03\xc6\x50\xf6\xb7\x6a\xae\x58\xac\x81\xa5\x22\x7e\
-\x78\xcb\x54\x73\xc3\xaa\x25\x53\xbd\xf3\x85\x01\xc0\xfb\x60\xbc\
-\xf3\xbd\x7e\xb4\x7a\xdf\x1f\x21\x71\x9a\x35\xef\xf5\xda\x79\x43\
-\x3e\x90\x8f\xcd\xd3\xbd\xed\x82\xad\xfe\xd8\x58\xfc\x9f\x6d\xda\
-\xae\x5e\xe5\x41\xfc\x28\xf5\xb5\xe8\x03\xae\xbe\x36\x02\x70\xef\
-\x51\xb7\x37\x46\x60\x56\x52\xbd\x8e\x1b\x3b\x7f\x7b\xfc\xfe\x49\
-\xab\x13\xbd\xff\xbd\x22\x71\xdb\xcb\x9b\xa2\xe8\x98\xa1\x5b\xe7\
-\x41\x4a\xf4\xfc\x3b\x25\xfe\x66\xc9\x10\x79\x33\xe1\x7e\x86\x37\
-\xef\xcb\xc5\x95\x14\x27\x3a\xce\x32\x61\xe1\x1c\x7d\xae\xde\xb7\
-\xc7\x78\x35\x83\x0d\x9f\x37\x28\xf2\x72\x8b\x9f\xc9\x66\x04\xfc\
-\x70\x63\x00\xd0\xe3\x2f\xed\x9e\x6d\x5c\x36\x38\x35\xb8\x07\xe7\
-\xb7\xdc\x63\x36\x91\x97\x5d\xfc\x0c\xdd\x83\x55\xe4\xd9\xc2\x4b\
-\x85\xce\xab\xf2\x06\xe2\x8d\xbc\xa6\xd8\x75\x4f\xf8\x6f\x05\x8c\
-\xf8\xf9\xf5\xb0\xdf\x16\x40\x6c\x20\x09\x58\x35\x57\x2c\xd6\xc0\
-\x52\x20\xb7\xfe\x4c\xd1\xe9\x14\xdc\x2c\x0f\x7e\x51\x37\x8f\xc6\
-\x20\xdd\xcd\xf5\x2c\x35\x89\x47\xdd\x30\x72\xc1\x8d\xf8\x81\x1a\
-\xcf\x3f\x6c\xae\xbc\xe4\x35\xaa\xff\xd3\x06\xc1\xc3\x08\xc0\xd5\
-\xe7\xea\xc0\x9a\xad\x3b\xe4\xd1\x10\x3f\xed\x57\x07\xf1\x43\xf8\
-\x19\xe2\x37\xee\x3e\x8c\xc0\x90\xa9\xaa\x71\x0f\xf5\xfc\xda\x61\
-\xef\xaf\x8b\xdf\xf1\x16\x84\xbf\xd1\xeb\x42\x19\xa7\xa7\x72\x3d\
-\x53\xa2\x67\x97\xbd\x00\xd1\x87\x09\x8b\x3d\xfc\x3b\xe3\x18\x64\
-\x7c\x00\x21\xe0\xd5\xd0\x31\xe7\xa9\x0c\x90\x55\x3c\x75\x9e\xee\
-\x29\x87\x0e\x25\xe4\x39\x84\xc5\x8e\x1e\x6f\xc1\xdf\xea\xdc\xe1\
-\x6b\x96\x40\xd8\x08\xa8\xeb\xab\xdf\x3a\x13\x47\xae\x7f\x2a\x35\
-\x16\x3e\x0c\x3f\x53\xa7\x33\x74\xd7\x58\x34\x92\xf2\xf3\x5b\xae\
-\x05\xc2\x62\x57\x63\x17\x2a\x21\x7e\x86\xee\x25\x2c\xf6\x8a\x88\
-\x9f\xa1\xeb\xa9\x3c\x82\x76\x9d\x5e\xef\xc8\xd8\xe9\x3f\xd6\x13\
-\x8f\x9a\x1e\x93\x30\x04\x14\x67\xac\x21\xf6\x02\xba\x91\x14\xac\
-\xda\x2b\x06\x6b\x60\x29\x88\xcb\xef\xbc\x47\xad\xd1\xa7\x6f\xd8\
-\x37\x00\x40\xb5\x09\xdc\x30\x5a\x62\xde\x3e\x35\x8b\x8f\x11\xbf\
-\xbf\x76\x1e\x18\x35\x4f\x8e\xfc\x50\xf5\xb4\x4b\xdb\xd0\x5b\xef\
-\xf4\x7f\x92\xdb\x4f\xe2\x57\x25\xbf\x4d\xf8\xe1\xba\x3e\x26\x0d\
-\x19\x36\x6d\x6b\xe2\xae\xb7\x97\x27\xba\xbd\xb2\x0e\xc2\x57\x93\
-\x3f\xf6\x50\x13\x6f\xe4\xe5\xde\x17\x4a\x50\xf4\xcd\x66\x1c\xce\
-\xfc\x10\x03\x4a\xf6\xab\x1f\x52\xf1\x94\x15\x34\x12\x61\x9f\xbe\
-\x46\x40\x74\x6c\xd0\x08\x30\x95\x10\x3f\x13\x16\xa5\x82\x4a\xb1\
-\x48\x3f\xba\xff\x4b\xee\x30\xf7\x9a\xbb\x31\x53\x19\xbb\x1c\xa5\
-\x7f\x10\xeb\xf5\x88\xb2\x8b\x9f\x09\x19\x01\xa6\xec\xe2\x07\x78\
-\x76\x02\x0d\xc2\x6a\x01\x94\xeb\x1f\xd7\x9d\xa2\x30\x84\x38\xb3\
-\x6f\x08\xf7\xa3\x29\x6b\x17\x61\x6b\x60\x29\x88\x2f\x7f\xe7\x7d\
-\x75\xa3\x7a\xd5\x1e\x7d\xf3\xbe\xf5\x3f\x45\x46\xa9\x8e\x1e\x5c\
-\x3c\x33\x46\x9e\x80\x11\x70\xea\x93\x8c\xc0\xcf\xfe\xbd\x5c\x3e\
-\xb3\x70\x83\x1c\xb7\x78\x93\xbc\xef\xfd\x35\xf2\x90\xbf\x7c\xa2\
-\x1a\xfc\xfc\xe9\xbe\x58\xf8\xfa\x98\x94\xf8\xf9\x13\x2e\xff\xc8\
-\x39\xab\x23\xfd\x26\x2d\xa7\x0c\xba\x5d\xcf\xfe\xfa\x72\x92\x12\
-\x32\x28\xf6\xb2\x09\x3f\x48\x30\x03\x29\x31\x5a\xf6\xf1\x31\x99\
-\xc0\x37\x02\x9d\x4e\xd7\x71\x15\x5c\xe4\x94\x5b\x87\x31\xd5\xf5\
-\x9f\x5e\x4a\x4d\x78\x69\xce\x11\x36\x3a\x98\xed\x36\xed\x1a\x65\
-\x26\x6c\x74\xd0\x26\xa1\x44\x0d\xd7\x5e\xdd\x73\xc8\x00\x70\xfa\
-\x77\x3c\xd1\xbc\xf6\x6b\xbe\xf4\x0f\x12\xbe\x5e\x45\xc4\x18\x40\
-\xcd\x16\x1c\xb8\x5e\xb3\x69\x58\x0a\x26\x1e\x30\xe6\x43\x2d\x81\
-\xd6\xf9\xfb\x6a\x12\x9c\x90\x17\xc8\x05\x29\x6b\xea\x9b\x36\xed\
-\x15\x83\x35\xb0\x58\xc4\x9d\x6f\x7c\x49\xec\x7d\x90\x29\xf1\xfd\
-\xd5\x7b\xfc\x87\x89\x5c\x71\xaf\xf4\x30\xa1\xa6\x59\x38\x33\xc3\
-\x03\x08\x0a\x1b\xd3\x70\x99\x49\x37\xd4\xf7\x91\x66\xd8\x6d\x73\
-\xe2\x57\x9d\x78\x16\x6c\x17\x83\x67\x2d\x13\xb7\x4f\x58\xa7\x56\
-\x96\xd5\x25\x88\xdf\x0a\x4f\x19\xaa\x22\xc2\x07\x61\x31\x82\x9c\
-\x19\x56\x89\x80\xe0\xb6\x00\x0c\x83\xd5\x89\xac\xe3\x2d\x98\x11\
-\x4e\xff\x59\xaa\xee\x6c\xc4\xb3\x5b\x78\x00\xb7\xbd\x22\x23\x78\
-\x06\xb4\xa9\xf0\xbc\x78\xd1\x3a\xba\x77\x32\x04\x78\xbf\xcd\xcf\
-\xf0\xa3\x3b\xf5\xbb\x6f\xbe\xff\x3c\xee\xf1\xbf\xda\x03\x00\x74\
-\x3d\x95\x67\x50\x0d\xe8\x49\x69\x79\xe5\x30\xed\xfe\x87\x87\x4a\
-\x6b\x2d\x71\x35\x60\x84\x4d\x7f\xc5\x60\x0d\x2c\x16\x71\xde\xe5\
-\xd7\x8b\xfa\x04\x6e\x90\xdd\x7f\xfa\xae\x4b\x83\x48\xbb\x7d\xa5\
-\xd7\xff\x2d\xfd\xde\x9d\x3c\x80\xba\xe1\xef\xa7\xb5\x01\x84\x8d\
-\x80\x9a\x84\xd3\x88\x5c\x75\xea\x09\xfc\xe7\xa3\xc5\x9f\xfa\x8e\
-\x52\x7f\xcc\xfc\xcd\xe2\xde\xe9\x9f\x51\x26\xdb\x1a\x57\x33\xc1\
-\x68\xe1\x9b\x11\x61\x41\x23\x60\x4f\x90\x12\x08\x8a\x1f\xdf\xc3\
-\xbf\x6d\xc7\x28\x58\x08\x6c\x04\x7e\xd0\x53\xbf\x27\xd7\x89\xad\
-\x39\xf1\x7b\xda\x4b\xc0\xab\x49\xb3\x7f\x50\xfc\xc8\xb4\xbb\xae\
-\x0d\x80\x7e\xa3\x1a\xd0\x77\xaa\xf6\x02\x20\xfe\xe0\xbd\x83\x53\
-\x2e\xf6\xdb\x2e\xd4\x7d\xe5\x71\x6f\x61\xf1\xff\xd7\xb5\x01\x10\
-\xe1\x3c\x12\xeb\x41\x1a\x39\xec\x64\xe9\xd5\x0a\xb3\xf8\x88\x1f\
-\x87\xd0\x13\x7b\x00\x0b\x6d\xfa\x2b\x06\x6b\x60\xb1\x88\x83\x4f\
-\x78\xdc\xdc\x20\x5b\x2a\x55\x02\xa8\xba\xff\x39\x3f\xd3\xd3\x7a\
-\x51\xe9\xaf\x26\xd4\x24\xe1\xe2\xfd\x3f\xbf\x02\xb4\x76\xde\x09\
-\x62\x15\xbf\xfa\xae\x3d\x00\xf4\x28\x1c\x3d\x6f\x9d\xe8\x37\x65\
-\xb9\xe8\xfe\x4e\x52\x89\x3f\x5d\xec\xa8\xf3\xa7\x25\x68\x39\x33\
-\x50\x38\x21\x9b\x0b\x4f\x23\x28\x08\x08\x04\xee\x34\x26\xbf\x84\
-\x21\xc0\xfa\xf7\x57\x3f\xac\xeb\xfd\x39\xc4\xdf\x5c\x78\xa9\x84\
-\xc5\x8f\xdf\x19\xe1\x84\x32\x02\xd7\x3e\xa1\xa7\xf2\x82\xcb\x7f\
-\xe4\xd7\x75\x97\x57\x88\x1f\xe7\xf2\x9f\x33\xf7\x7d\x85\xcf\xcb\
-\x69\x95\x2d\xbc\x64\xe8\x7e\xac\x62\xcf\x16\x5e\x06\x32\xf2\x86\
-\x1a\x3e\x3d\x4b\xc6\xce\xbf\xc1\xcc\x94\x9c\xb6\x0c\x19\x7b\xd4\
-\xa6\x60\x15\x5f\xb7\x69\xb0\x50\xac\x81\xc5\x22\xf6\xd8\x77\xae\
-\xb9\x39\x58\x2a\x75\xa3\x91\x9a\x1a\xe9\xd5\xd5\x4a\xef\xfa\x11\
-\x6a\x2e\x7d\x35\x6f\xbf\x11\xb4\x7a\x87\x4f\x46\x00\x93\x7d\x60\
-\x92\x4f\x74\xe5\xad\x1d\x99\xc3\x08\x30\x61\xf1\x3f\x48\xe2\x1f\
-\x39\x17\x83\x6e\x1a\x45\x0f\x4a\xb0\x6e\xe4\xf6\xa7\xbb\xfb\x29\
-\x97\x3f\x94\xa0\xe5\xc8\x40\x19\x09\x59\xe0\xff\x8a\xa0\x30\xe0\
-\x09\xa0\x9e\x8f\xa9\xb3\xd1\x59\x06\xe2\xe7\x92\x93\xf6\x69\x4e\
-\xe4\xcd\xfd\x5f\x28\xd9\xc4\x6f\xfd\x1f\x9e\x00\xc4\x0e\x57\x1f\
-\xff\xe3\xde\xf1\x1d\xf7\xc0\xf7\xd1\xcc\xfd\x34\x27\xf2\xb2\x1b\
-\x01\xba\x9f\x9c\x22\x6f\xee\xff\x22\xc8\xc8\x13\x2a\x7e\x28\x8d\
-\xd1\x46\x72\xc3\xb3\x32\x86\x79\x13\xb1\xbe\x65\x02\x2b\x59\xa7\
-\x19\x01\x1e\x1f\xd0\xc3\xa6\xc1\x42\xb1\x06\x16\x83\xf8\xca\x45\
-\x87\x8a\xda\xd8\xd6\xc0\x8d\x26\x7d\xf1\xef\x73\x90\x72\xff\x31\
-\xad\x97\x12\x37\xc4\x0f\x21\x9b\x5e\x7c\x89\x07\xe6\xca\x06\xd3\
-\x13\x10\x0b\x74\xe4\x34\x02\x4a\xfc\xea\xbf\x94\xf8\x47\xcc\x59\
-\x25\x7a\x4f\x5c\x85\x88\x25\xf1\x07\xdd\x7c\x7b\x5d\x3f\x94\xa0\
-\xa5\x64\xa0\x8c\x84\xb4\xec\x03\xf2\xda\x4f\x65\x02\x86\x32\x03\
-\x0c\x01\x4a\x05\x7e\x65\x46\xfb\xe4\x2b\xee\x7c\xf7\x6b\x8e\xe6\
-\xc4\x6f\xdd\x8f\x40\xb7\x60\xf5\x1f\x3f\x07\x5f\x5f\x3d\x5b\xf6\
-\x7b\xc9\x57\xdc\x65\x33\x02\x74\x2f\x79\x89\x3b\xdf\xfd\xf2\xc0\
-\x9a\x17\x38\x5e\x00\xa6\x50\x3b\xe8\x4b\xfa\x95\x60\xe6\x70\x71\
-\x1e\x25\xf8\x92\x4d\x87\x85\x62\x0d\x2c\x06\xd1\xae\xc3\x45\xa6\
-\xb1\x47\x95\xfe\xaa\xf3\x0f\x26\x7b\xc0\x43\x7c\xe5\x02\x19\x7d\
-\x90\xea\xe7\x98\xdf\x8f\xc4\xab\xea\xf6\x23\xe6\xca\xb3\x9e\x5f\
-\x22\x5f\xf8\x74\xa3\x5c\xb8\xbe\x49\x4e\x5a\xbe\x51\xde\xfc\xfa\
-\x3c\xd9\x6a\x28\x26\xfd\x9c\x64\x37\x02\x5a\xfc\xa9\x06\x3f\xb8\
-\xfd\x10\x7f\xaf\x89\xab\xd1\x8b\x2f\x2f\xf1\x33\xa1\x04\x2d\x26\
-\x03\x59\x13\x32\x07\x85\xee\x1f\xa6\x50\x51\x17\xba\x7f\x98\x7c\
-\xc5\xcf\x64\xec\x1f\x6e\xec\x6b\xe6\xfa\x85\x8a\xba\x64\x23\x40\
-\xf7\x53\x90\xa8\x0b\xdd\xdf\x42\xce\x3c\x80\xf8\xe1\xee\xe1\x5f\
-\xbf\x02\x5a\x52\xed\x00\xa1\x4e\x41\xdc\x0e\xb0\xc2\xa6\xc3\x42\
-\xb1\x06\x16\x83\xa8\xab\xef\x62\x1a\xfc\x9a\x48\xfc\x49\xb5\xbc\
-\x97\x99\xe3\x2e\xfa\x93\xae\x52\xfc\xb9\x91\x4a\xfb\xd9\xba\x25\
-\x9f\x4a\x7e\xee\xf0\x93\xbe\x25\xe5\x13\xd3\x3f\xf5\x1b\x06\xd3\
-\x8d\x80\x45\xfc\x23\xe7\xae\xd1\x25\x7f\x81\xe2\x67\x42\x09\x5a\
-\x48\x06\xca\x99\x90\x39\x28\xf6\xb8\x62\xc5\x5c\xec\x71\x85\x8a\
-\x9f\x29\xcb\x71\x44\xbe\x69\x51\xec\x71\x45\x8b\xb9\xd8\xe3\x88\
-\xbc\xd2\x1e\x46\x13\x6f\x7a\x7e\x3e\x50\x19\x00\x80\xd2\x3f\x64\
-\x04\xf8\xbf\xce\x24\x1a\xab\x1e\xf3\xc5\x1a\x58\x0c\x54\xfa\x3f\
-\x84\x9b\x22\xf1\x6f\x0b\xae\x86\xa2\x06\x00\xdd\xfa\x94\x5a\x99\
-\x37\xa2\x66\xf8\xa5\x52\xfe\xe1\x05\xaa\x4b\x2f\x36\xf4\xf2\xe3\
-\xa1\xbd\x3c\x2d\xd7\xa5\xcf\x53\x55\x81\xaa\x03\x68\x13\x08\xbc\
-\x1d\x08\xbc\xea\x23\x6f\x62\xf4\xbc\x0d\xa2\xef\xa4\xfc\xdd\xfe\
-\x6c\x14\x61\x04\xf2\x4a\xc8\x1c\x14\x7a\x7c\xb1\x22\x66\x0a\x3d\
-\xbe\x58\x11\x33\x85\x1e\x5f\xb4\x88\x0d\x05\x1f\x5f\x82\x88\x15\
-\x45\x1c\x9f\x57\x9a\x23\x5d\x00\xda\x7f\x6e\x7a\x41\x9a\x37\x6a\
-\x0a\x36\x02\x89\x44\x02\xcb\x8b\x71\x35\xe0\x17\xd0\x5e\x29\x58\
-\x03\x8b\x81\xb6\x77\x4c\x9f\xff\xed\x44\x52\x2d\x99\x4d\xa5\xbf\
-\x9a\x13\x7d\xd0\x54\x35\xee\xbf\x06\x93\x63\x52\xe9\xff\xcd\x17\
-\x97\xd2\x21\x7a\x4c\xbf\x6d\xb0\xcf\x23\xb3\xd7\xa8\x79\x01\x30\
-\x3e\xc0\xbc\x22\x4c\x7f\xcf\x3f\x66\xfe\x16\x71\xe7\x94\x15\xa8\
-\x1b\x97\x24\x7e\x26\x94\xa0\xb9\x32\x50\x5e\x09\x99\x07\xf9\x9e\
-\xa7\x50\xf1\x66\x23\xdf\xf3\x14\x2a\xde\x6c\xe4\x7b\x9e\x82\xc5\
-\x9b\x85\xbc\xcf\x13\x4a\xeb\xa2\xd3\xb0\x80\xf3\xe4\x9b\xd6\x0a\
-\x4e\x17\xb4\x9d\xec\xab\x96\xcd\xd3\xfd\x29\x8c\x11\x80\x01\x20\
-\xb6\xe1\x3b\x85\xf5\x25\xb9\x58\xf5\x98\x2f\xd6\xc0\x62\xa8\xa9\
-\x89\x2c\x36\x16\x6a\x87\x2a\xf9\xb9\x23\xc3\x41\xc7\x92\x70\xa9\
-\xe4\x27\x01\xab\x2e\xbc\x43\xe6\xc8\x3f\xbc\xdb\x48\x87\x68\xc1\
-\xb3\x01\x00\x6c\x00\x1e\x9f\xb7\x9e\x0c\xc5\x6c\xb5\x02\x10\x19\
-\x00\x35\xa8\xc7\x37\x02\x63\x17\xec\x10\xfd\x67\x98\x57\x7d\x19\
-\xad\xfd\x99\x11\x9a\x2f\xa1\x04\xb5\x65\xa0\x82\x12\x32\x0f\x9a\
-\x3b\x5f\xbe\xa2\xcd\x97\xe6\xce\x97\xaf\x68\xf3\xa5\xb9\xf3\xe5\
-\x2d\xda\x3c\x69\xf6\x7c\x05\x88\x36\x2f\xf2\x38\x5f\x73\x69\x9c\
-\x01\xd2\x04\xe2\xc7\xdb\x93\x63\xbf\x61\x0c\x40\xaa\x33\x18\xaa\
-\x00\x30\x00\x04\x0a\xdb\xbf\x92\x5c\xac\x7a\xcc\x17\x6b\x60\x31\
-\xd0\xcd\x6c\xc6\x4d\x11\x7a\x49\x6f\x1e\xf7\xff\xe5\x6f\xab\xf5\
-\xfc\x60\x04\x54\xcb\xff\xb0\xb9\x72\xf8\x87\x6b\xe9\x90\xd4\x88\
-\x3f\x6c\x30\x00\xfc\xbb\xfb\xe4\x55\xca\x50\x60\x6e\x40\x6f\xc8\
-\x14\x3d\x63\x0f\x46\xf5\x8d\xa6\xaa\xc1\xe0\x59\x2b\xa9\xe4\xd7\
-\x9d\x7c\xca\x25\x7e\x26\x94\xa0\xc1\x0c\x54\x70\x42\xe6\x49\xb6\
-\xf3\x36\x27\xd6\x62\xc9\x76\xde\xe6\xc4\x5a\x2c\xd9\xce\xdb\xac\
-\x58\x8b\x24\xeb\x79\xf3\x10\x6b\x51\xe4\x38\x6f\xb6\xb4\xcd\x09\
-\xd2\x03\x0d\x81\x77\x53\xd5\xf7\xcc\x4b\xb5\x86\x42\xb3\x05\xa1\
-\x0a\x00\xad\xb5\x6c\xd9\x72\x3c\xc9\xc5\xaa\xc7\x7c\xb1\x06\x16\
-\xca\xc1\x07\x1f\x7c\x0e\xdd\x90\xba\x29\x7f\xe6\x1f\xbe\xe9\x73\
-\x2f\x4b\xcd\xf9\x87\x2a\xc0\xa8\x79\xaa\xe5\x1f\x1b\x8f\xf9\xc7\
-\x86\x4f\x33\x0b\xaf\xfc\xe1\x6b\x58\x5b\x4f\xf5\xfb\x4f\x9a\xce\
-\x42\x49\xf4\x20\x4c\xdc\xff\xde\xfa\xda\x9e\xff\x59\x5f\x11\xf1\
-\x33\xa1\x04\x45\x06\x2a\x2a\x21\x0b\x20\x7c\xfe\x6c\x22\x2d\x17\
-\xe1\xf3\x97\x7d\x5d\x80\x10\x61\x23\xa0\xae\x6f\x13\x69\x99\x08\
-\x1b\x81\x5d\xbe\x2e\x40\xa1\xd7\x63\x03\xf0\x9d\x1b\xb5\x86\x82\
-\xdd\xc1\x35\x3b\x50\x05\x68\xd1\xa2\x45\xc9\x13\x86\x5a\x03\x0b\
-\xe5\x80\x03\x0e\xb8\x38\x20\xfe\x74\x03\xf0\xfd\xdf\x4b\xf1\xe4\
-\x6a\x6d\x00\x46\xeb\xb5\xf6\x79\x11\x4f\x34\xfc\x05\x0d\x00\x7f\
-\x76\xfe\xc7\x62\xf5\x9a\xd0\x74\xff\x4d\x62\x5d\x7e\x32\x00\xdb\
-\x12\xbd\x5e\x5f\xa5\x22\x55\x77\xef\x45\xc6\x29\xaf\xf8\x99\x50\
-\x82\x32\x65\xcf\x38\x01\x82\x19\x86\xa9\x84\xf8\x99\xa0\x11\xf0\
-\xa9\x80\xf8\x99\xb0\x28\x99\x72\x8b\x9f\xc9\x76\xbd\x8a\xa5\x61\
-\xb9\xf2\x0c\xd2\x1b\x6f\x02\xd0\x79\x2a\xfb\xa4\xa1\xea\x55\x60\
-\x7d\x7d\xfd\x8a\xf3\xcf\x3f\xff\x60\x92\x8d\x55\x97\xf9\x60\x0d\
-\x2c\x94\x0e\x1d\x3a\x5c\x56\x5b\xab\x46\xaf\xf9\x3d\x00\xfd\x2a\
-\xc0\x4f\xba\xfb\xaf\x00\x51\xfa\xc7\x1f\x5c\x20\x3f\x5e\xbf\x8d\
-\x0e\xd3\x8d\x80\xbc\xb1\x01\xd8\xbc\x3d\x29\x3b\x62\xe4\x9f\x5e\
-\x6c\x43\x37\xfc\x3d\xb0\x50\xd6\x0c\x9c\xd1\xa8\x47\xf5\xa9\x44\
-\xc5\xa8\x3e\x44\x58\x65\x0c\x00\xa0\x84\x08\x66\xa0\x8a\xaf\x2b\
-\x47\xe0\x1a\x7c\x3d\x5c\xbb\x52\xe2\x67\x2a\xba\x36\xa0\x85\xb0\
-\xd1\xc1\xf5\x6d\xfb\x95\x8b\x5d\xbe\x36\x20\x0c\xb8\x6d\xbf\x5c\
-\xb0\x01\xc0\xab\xc0\x9f\x0d\x60\xc1\x87\xe1\x57\x81\xeb\x3b\x77\
-\xee\x7c\x08\xc9\xc6\xaa\xcb\x7c\xb0\x06\x16\xca\x3e\xfb\xec\x73\
-\x25\x1a\xfe\x22\x7a\x08\xb0\xbe\x39\x76\x5b\x2e\xed\x9b\xaa\x02\
-\x90\x01\xc0\x94\xdd\x58\x8d\x07\x9b\xcd\x00\x60\xd5\x9e\x3d\x1f\
-\x5d\x98\xc4\xbe\x64\x00\xf4\x2b\xbf\x51\x73\x36\xc6\xbb\xbf\xbe\
-\x9e\xc5\x6f\x22\x38\x59\xa9\xd2\x03\xd8\x4a\xe4\x4a\x5e\xcf\x56\
-\x22\x57\xac\xb4\x22\x6c\x25\x64\x25\x3d\x0e\x6b\x89\x4c\xbf\x2b\
-\xe5\x71\xe0\x39\x6c\x25\xf2\xce\xce\x33\x45\xa5\x21\x0c\xc0\x1d\
-\x33\xa4\xb8\x7c\x28\x0b\x3e\x8c\xd2\x18\x15\xba\x1b\x4f\x3e\xf9\
-\xe4\xe3\x49\x36\x56\x5d\xe6\x83\x35\xb0\x50\xda\xb7\x6f\x7f\x0d\
-\xaa\x00\x64\x04\x76\xa0\x13\x90\xba\x49\x36\x00\xbf\xb8\x4b\xaa\
-\xc5\x31\xd1\x0d\x98\x44\xdd\xf2\xe1\x05\x6a\x66\x1f\x6c\x10\x7d\
-\x10\x6c\x6b\xe9\xbf\x56\x0f\x2f\x80\x01\x30\xad\xfe\xf3\x93\xf1\
-\x7e\x6f\xaf\xa6\xd2\x3f\x89\x0c\x43\xa5\x06\x3e\xd9\x08\x54\x24\
-\x41\x83\x09\x89\xef\xc1\x8c\x54\x89\xeb\x05\xc5\x8f\x6b\x85\xaf\
-\x6f\x3b\xa6\x14\xd2\xc4\xa8\xe3\x34\xed\xfa\xe5\x36\x02\x61\xf1\
-\xa7\x8d\xea\xa3\xcf\xb2\x1b\x81\x90\xf8\x63\x6a\x54\x68\xea\xfa\
-\x3b\x3b\xcf\x14\x9c\x86\x3c\x37\xc4\x2f\x46\x04\x45\x1f\x44\x35\
-\xb4\x93\xe6\x36\x9d\x74\xd2\x49\x25\x2d\x22\x6a\x0d\x2c\x14\xba\
-\x91\x9f\xc2\x00\x10\x78\x05\xa8\xba\x01\xfb\x06\xe0\xb2\x3b\x52\
-\x1e\xc0\x68\x3d\x7b\xef\x47\x6b\xf4\x4a\x3b\xc1\x65\xbc\xf8\xfb\
-\x87\x6b\xb6\xf2\x8c\x3f\x49\x2c\xb9\x15\xbf\x7f\xf2\x06\x8a\xc4\
-\x4d\x81\x99\x7c\x90\x61\x94\x31\xe0\x08\x2e\x67\x82\x5a\xc5\x17\
-\xca\x50\xe5\xbc\x5e\x58\xfc\x2c\x3e\xeb\x7d\x94\x81\xb0\xf8\x59\
-\x7c\xd9\xee\xa3\x54\xc2\xe2\xe7\xb8\xcb\x76\x1f\x25\x93\x21\x7e\
-\x1d\x77\xd9\xee\xa3\x1c\xe4\x93\x67\x0a\x4a\x43\xe5\x01\x90\x01\
-\xc8\xe2\x01\xa0\xad\xcd\xe8\x6d\xd3\x71\xc7\x1d\x77\x0c\xc9\xc6\
-\xaa\xcb\x7c\xb0\x06\x16\x0a\x6d\xdf\x33\x16\x69\x07\x91\x8c\xa3\
-\x3a\xc0\x0b\x42\xfc\xb4\x07\x19\x00\xdd\x06\xa0\x66\xf3\x19\x36\
-\x57\xde\x3c\x51\xf7\x03\x80\xe8\xf1\xea\x4f\xcd\xfd\x67\x0c\xc0\
-\x4d\x13\x1b\x93\xb4\x4f\x32\x3a\x66\x9e\x8c\x0f\x9b\xbe\x23\xd1\
-\xf7\xcd\x35\x18\x61\xc6\xe2\x27\xd8\x08\x94\x3d\x41\xad\x09\xc9\
-\x54\xc0\x08\x34\x27\xba\x9c\xf7\x53\x04\xcd\x89\xae\xb9\xfb\x29\
-\x94\xe6\xd2\xa8\xb9\xfb\x29\x98\x66\x44\xd7\xdc\xfd\x14\x43\x21\
-\x79\x26\xbf\x34\xa4\x38\x57\x6d\x00\x54\x05\xf8\xbf\xfb\x7c\xd1\
-\x33\x46\x67\xca\x00\xc4\xe3\xf1\x92\x27\x09\xb5\x06\x16\x0a\x6d\
-\xe7\x98\x9b\xc3\x8d\xa9\xa9\x8c\xe3\x0d\x2d\xf4\xf4\xd0\x17\xdd\
-\x68\xde\x02\xe8\x75\xff\xe0\x05\x80\x51\x1f\x65\xce\xfb\x37\x9a\
-\xc2\xd4\xff\xa3\xe6\x26\xe3\xc3\x67\xc8\xc4\xc0\x89\x1b\xbd\xae\
-\x2f\x6f\x8a\xea\xc6\xa9\x8c\x06\xbf\x72\x26\x68\xce\x84\x64\xca\
-\x68\x04\xf2\x15\x5b\x5e\xf7\x95\x07\xf9\x8a\x2d\xdf\xfb\x6a\x8e\
-\x7c\xd3\x26\xdf\xfb\x6a\x96\x3c\xc5\x96\xef\x7d\xe5\x43\x31\x79\
-\xa6\xd9\x34\x44\x7c\xfb\x6f\x01\x7a\x1b\xe1\xeb\xb7\x00\x46\xfc\
-\xca\x00\xa0\xbb\x3d\x85\xad\x24\xd9\x58\x35\x99\x2f\xd6\xc0\x42\
-\xa1\xed\x24\x42\xf5\x4f\x86\x11\x80\x01\x50\x03\x81\xe8\x77\xe4\
-\x1b\xbf\x48\xab\x02\x98\x96\x7d\xfa\x3d\x57\x9e\xf3\xc2\x12\xd9\
-\x67\xea\x6a\xd9\x9b\x38\xf7\x85\xa5\x14\x46\xf5\x7e\x88\x5f\xad\
-\xd8\x33\x25\x99\xb8\xe3\xcd\x35\xd1\x6e\x6f\x6a\xe1\xf3\xac\xbd\
-\xa1\x08\x2b\x47\x82\xe6\x95\x90\x4c\x28\x41\x8b\xb9\x5e\xa1\x22\
-\x2b\xe8\xfe\x2c\x14\x2a\xb2\x42\xef\x2f\x4c\xa1\x69\x52\xe8\xfd\
-\x65\x50\xa0\xc8\x0a\xbd\x3f\x1b\xa5\xe4\x99\x66\xf7\xe7\x7e\x00\
-\x58\x3c\x05\x06\x80\xaa\xd3\x10\x3f\x74\x65\x4a\x7e\x1e\x11\xb8\
-\x7b\xf4\x03\x00\xb4\x6d\x36\x37\xa5\x1a\x28\x78\x24\xa0\x77\xda\
-\x77\x65\xe4\xa1\x45\x28\xd5\xfd\xd2\x1f\x9e\x80\x32\x04\x98\x0f\
-\x00\xab\xf6\x9a\x95\x7b\xb1\xb2\x8f\x9a\xcf\x7f\xc8\x54\x99\x18\
-\xf4\xde\xa6\xe8\xed\x6f\x6f\x30\x8b\x75\x64\x08\x3f\x48\x29\x09\
-\x5a\x50\x42\x32\x25\x18\x81\x62\xc5\x55\xd4\x7d\x12\xc5\x8a\xab\
-\xd8\xfb\x2c\x36\x2d\x8a\xbd\xcf\x82\xc5\x65\x28\xf6\x3e\x41\x39\
-\xf2\x4c\xd6\xe3\x10\xcf\xca\x00\x90\xc7\xfc\xd5\xcb\x95\x01\x88\
-\xd6\xd5\x2b\xf1\x2b\xcf\x3a\x1e\x47\x23\x3b\x0f\x06\x7a\xc7\xa6\
-\xc5\x42\xb0\x06\x16\x03\x6d\x9f\x99\x9b\x52\xd6\x09\x63\x01\xd4\
-\xba\xf0\x47\x9c\xac\xa6\xfd\x42\x8f\x3e\x16\x3f\x7f\x62\x68\x30\
-\x1a\xfc\x80\xaa\xf3\xeb\xc5\x3c\x54\xaf\xbf\xe8\x7d\x53\xb1\x62\
-\x8f\x5e\x58\x53\x1b\x80\xb2\x1b\x81\xa2\x12\x92\x09\x25\x68\x3e\
-\xd7\x2b\x56\x54\x4c\xa1\xf7\x5b\xb4\xa8\x0c\x85\xde\x6f\x29\xa2\
-\x02\x05\xdf\x6f\xbe\xa2\xca\x42\x31\xf7\x5b\xce\x3c\x63\x3d\x1e\
-\x71\xac\xde\x02\x4c\x53\xab\x05\x61\x25\x2d\x35\xaf\x86\x16\x3f\
-\xf4\x05\x03\xc0\x53\xee\xed\x3e\x63\x01\x68\x9b\x68\x6e\x0a\xd6\
-\x89\x6e\x32\xa2\x6f\x7e\x6f\x4c\x06\x4a\x19\x69\xd8\x74\xb5\x0c\
-\x98\x6f\x04\x02\x86\x00\xe3\x04\xea\x59\xfc\x64\x2c\xa2\x23\x3f\
-\xdc\x26\xee\x9c\xb2\x46\xf4\x54\x91\x92\xf7\x62\x1d\x85\x24\x68\
-\x49\x09\xc9\x84\x12\x34\xd7\xf5\x0a\x15\x53\x36\xf2\xbd\xef\xac\
-\x62\xe2\xeb\xe2\x33\x17\x66\x9f\x7c\xef\xbb\x18\x31\xd9\xc8\x7a\
-\xdf\x61\xe8\x3e\x4a\x11\x3f\x53\xc8\x7d\x57\x22\xcf\x64\x9c\x27\
-\x18\xf7\x07\x1c\x2d\xbd\xba\x1a\x35\x2b\x50\x7d\x7d\x3d\xb4\xc5\
-\xf0\xb4\x60\xf7\xda\xb4\x58\x08\xd6\xc0\x62\xa0\xed\x31\x73\x53\
-\xa9\x09\x41\x09\xe5\x09\xdc\xf2\x84\x5a\x0d\x08\xb3\x01\x2b\x4f\
-\x80\x0d\x80\x11\x7f\xda\x5a\x7e\x30\x12\x23\xe6\x90\xeb\xff\xee\
-\x16\x13\x29\x79\x89\x9f\xc9\x27\x41\xcb\x92\x90\x4c\x28\x41\x6d\
-\xd7\xcb\x57\x44\xf9\xd2\xdc\xfd\x5b\x45\x84\x6b\x32\x28\x61\xe0\
-\x66\x62\xd4\x19\x8e\xc1\x64\xa3\xbc\x10\x2a\xc2\xf0\x1f\x4f\x43\
-\x46\x34\x77\xff\x85\x88\x28\x1f\xac\xf7\x1f\xdc\x87\xae\x5f\x0e\
-\xf1\x33\xf9\xdc\x7f\x25\xf3\x8c\x7f\x3e\x13\xdf\x98\x0f\x20\x7a\
-\xd3\xbf\xa4\xd7\x66\x4f\xe9\xd5\xc7\x64\xbd\x2e\xf9\x99\xa0\x07\
-\x70\x8d\x4d\x8b\x85\x60\x0d\x2c\x06\xda\xba\x99\x9b\x82\x75\x4a\
-\xeb\x0c\x14\xbd\xb4\x8f\xf4\xc6\x9a\xf5\x00\xb8\x3a\x60\x13\xbf\
-\x5a\xc3\x6f\x81\x14\x03\xdf\x5f\x5b\x88\xfb\x1f\x26\x57\x82\x96\
-\x35\x21\x99\x50\x82\x06\xaf\xd7\x9c\x78\x8a\x25\xdb\x73\x64\x15\
-\x0f\xae\x8b\xd6\x65\x7c\xe2\x1d\x33\x1a\x99\x30\x83\x2f\xc2\x30\
-\x9f\x3f\x80\xe8\x11\x86\xff\xe0\x82\x06\x8e\xc9\xf6\x1c\xf9\x88\
-\xa7\x18\x72\x3d\x47\x39\xc5\xcf\xe4\x7a\x8e\x9d\x91\x67\xfc\xf3\
-\x52\x7c\xab\x65\xe0\x2f\xed\xaf\x26\x05\xd5\x6e\x7f\xda\x58\x00\
-\x68\x4b\xeb\xab\x0c\x33\x03\x5b\x03\x8b\x81\xb6\x0b\xcd\x4d\x05\
-\xc6\x03\x98\x01\x41\x67\x5e\x22\xa3\x0f\x2d\x92\xfe\x72\x60\x64\
-\x04\x6a\x46\xce\x0e\x8a\x3f\x35\xde\x7f\xcc\x7c\xb8\xff\x6b\x0b\
-\x75\xff\xc3\xd8\x12\xb4\x22\x09\xc9\x84\x12\x14\xd7\xcb\x26\x9a\
-\x72\x11\x7e\x9e\xac\xa2\xe1\xd2\x1c\xaf\x96\xb0\x18\xea\x55\x0f\
-\x48\x71\xce\xaf\xa4\x38\xf2\x2c\x3d\xe9\x04\x16\xf3\xd8\x63\x7f\
-\x29\x3a\x1c\x21\xc5\x51\x67\x4b\x71\xee\x35\x52\xfc\xea\x41\x33\
-\x33\xb1\x99\xd1\x97\xce\x11\xc5\x9c\xf5\x81\xe7\x49\x1b\x45\x48\
-\x94\x4b\xfc\x4c\xf8\x79\x70\xbd\x4a\x88\x9f\xd9\xd5\x79\x06\xe7\
-\x8f\x76\xa5\xeb\xf5\x9e\x20\xbd\xf3\xae\xd2\x2b\x04\x85\x86\x02\
-\x1b\xf0\x1d\x63\xea\xad\x5a\x2c\x04\x6b\x60\xb1\xd0\xb6\xc9\xdc\
-\x9c\xbe\x51\x33\x93\x89\x68\xff\x45\x72\xeb\x3f\xa2\xba\xfd\x47\
-\x24\xf6\xd4\xb2\x60\x69\xe2\xc7\xa0\x1f\xcc\xf6\x33\x6a\xee\x66\
-\x72\x47\x37\x99\x48\x2a\x4a\xfc\x4c\x38\x41\x83\x11\x6d\xdb\xbf\
-\x64\x42\x09\xca\x54\x42\xfc\x4c\x30\x83\xfa\xd0\x33\xa7\xc4\x4f\
-\x9f\x98\x6a\x1a\x60\xed\xbe\x03\x8e\xd5\x69\x92\x0f\x07\x1c\xa7\
-\x8f\xe1\xe3\x51\x3a\x05\x8c\x40\x90\x72\x8b\x9f\xd9\xd9\x69\xb8\
-\x5b\xe4\x99\xee\xaf\xcb\xf8\x11\xa7\xe9\x34\xe0\x1e\xb5\x29\xf8\
-\x0d\xc0\xdb\x36\x0d\x16\x8a\x35\xb0\x58\x68\x7b\xcf\xdc\x1c\xdf\
-\x64\x8a\x2e\x4f\x4b\xf1\xc8\x52\x59\x8b\x55\x81\x03\xe2\xc7\x0a\
-\x41\xba\x3a\xa0\x47\xfd\x89\x21\x1f\x52\xe9\x3f\x61\x9b\x89\x20\
-\x32\x00\xc5\xaf\xd6\x0b\x54\x82\x06\x22\x77\x67\x8c\x08\x0b\x26\
-\x68\x25\xc5\xcf\xa8\xbe\xee\x81\x67\x4c\x89\x1f\x2e\x3d\xb9\xf2\
-\x7f\xf8\x87\x14\x87\x9e\x9a\x9e\x1e\x11\x2a\x59\x90\xb9\x94\x91\
-\x36\x70\x17\x6e\xfc\x17\xdc\xf7\x30\xca\x8c\x7f\xf8\xbb\xbf\x2c\
-\x59\x78\x14\x21\xc6\xdb\x87\xef\xa9\x9c\x84\x47\xf5\xe1\x79\x6d\
-\xfb\x95\x8b\x5d\x97\x67\xc6\x29\xf1\x7b\x37\xfc\x45\x8a\xfa\x86\
-\xf4\x34\xd0\xa0\x60\xe5\x06\xc0\x7b\x6c\x1a\x2c\x14\x6b\x60\xb1\
-\xd0\x76\xb7\xb9\xb9\x54\x3b\x00\xbb\x30\xff\xf3\x1b\x29\x1e\x5f\
-\xae\x16\x00\x09\x1a\x00\xd3\x26\xa0\xe7\xfa\x1f\xbb\x20\x29\x06\
-\xcc\x5c\x2f\xba\x8f\xdf\x61\x22\xa7\x24\xf1\x03\x5b\x09\x59\xa9\
-\xd2\x0a\x04\xdd\xfe\x9d\x71\x3d\x5b\x89\xa5\x4a\x2b\x88\xbf\x0f\
-\xd5\xe7\x7f\xf7\x8c\x14\x2d\xf7\xd4\x69\xa0\xc4\x9d\x51\xa2\x64\
-\x27\xb8\x3f\xe6\x76\xfc\xe5\x08\xb5\x0a\xb0\x5a\xc7\x2e\x70\xbd\
-\x8a\x1a\x39\x5b\x09\x19\xf4\x70\x2a\xc0\x2e\xcb\x33\x88\xd7\xde\
-\xe3\xa5\x77\xe1\xcd\x6a\x4d\x80\x50\x5a\xb1\xfb\xcf\x9d\x80\x2e\
-\xb0\x69\xb0\x50\xac\x81\xc5\x42\xdb\xb7\xcc\xcd\x71\x3b\x40\xaa\
-\x1a\xd0\xe1\x30\x19\x1f\x44\xee\x3f\x09\x1e\xd5\x00\xac\x0a\x1c\
-\x30\x02\x6a\xe6\x1f\x31\x76\x7e\x93\xb8\x6b\xea\x7a\xbf\xfe\x6f\
-\x89\xac\x42\x08\x26\xe4\xce\x18\x11\x16\x14\x3f\x32\x6d\x30\xe3\
-\x56\xe2\x7a\x69\xe2\xa7\xcf\xa0\x27\x80\x25\xa7\x55\x63\x1f\xcf\
-\x2b\x67\x5b\xaf\x2f\x5f\x8c\x11\x8f\xd4\xd6\x49\xef\xb2\x81\xd2\
-\xbb\x9d\xaa\x01\x94\x59\x83\xf1\x5b\x11\x23\x10\x12\x7f\x5a\x1a\
-\x56\xc8\x08\xec\xd2\x3c\x73\xdb\x2b\x32\x8e\x05\x42\x8f\x3a\x5d\
-\x2d\x0d\x16\xcb\xbe\x36\xe0\x72\x9b\xfe\x8a\xc1\x1a\x58\x0a\xb4\
-\x7d\x62\x6e\x32\xd5\x18\x48\x46\x20\x1e\xad\x91\xde\x6f\x87\xea\
-\xe5\xc1\x86\x69\xb7\x1f\x53\x7e\x1b\x23\xa0\x7a\xff\x91\x11\xd8\
-\x2e\xfa\xbc\xb7\xce\x44\x0e\x0c\x40\xd1\x46\x20\x3d\x21\x75\xfd\
-\x2d\x5c\x5a\x96\x33\x41\xc3\xe2\x57\x62\x08\x65\xe0\x72\x5e\x2f\
-\x2c\x7e\x16\x83\xff\xdc\xdd\x5e\x95\xb1\x5b\x5e\x4a\x95\xfe\x25\
-\x82\xc1\x5d\x5e\x5d\x54\x7a\x6d\xf7\x96\xde\x75\x8f\xc9\x68\x2f\
-\xba\x0f\xd5\x30\x68\x79\xee\xd0\xbd\x16\x45\x86\xf8\x2d\x69\x18\
-\x78\xee\x72\xb0\x4b\xf3\x0c\x89\x5f\xf4\x9d\xa2\xd6\x55\x8c\xab\
-\xd5\x80\x30\xb5\x7e\xc6\xb2\x60\xfc\xfa\xef\xcf\x36\xed\x15\x83\
-\x35\xb0\x14\x68\x1b\x6e\x6e\x12\x37\xab\xbc\x80\x38\x3d\x88\xea\
-\x16\x7c\xca\xb7\x65\x14\x4b\x79\x71\xaf\x40\xc2\x18\x01\xd5\x01\
-\xc8\x1b\x34\x69\x4b\xe4\xf6\xf1\x5b\x4d\x04\x91\xf8\x8b\xab\xff\
-\xdb\x12\x92\xa9\x44\x82\xe6\x14\x41\x05\x8c\x40\x73\x22\x50\xcf\
-\x8f\xd9\x85\x6e\xfe\x87\x8c\xb5\xce\x61\x00\x6c\xd5\x01\x4b\x98\
-\x9a\xee\x1d\x6b\x3d\xa0\x7b\x77\x8d\x90\xd1\x43\x4f\xd1\x6f\x08\
-\xf0\x9c\x44\xce\xe7\x2f\x86\x50\x9c\xe5\x4c\x43\xcb\xf3\x17\xc3\
-\x2e\xcf\x33\xe8\x7b\x71\xd7\x07\x52\x9c\xfe\x53\x15\xe7\x4a\x33\
-\xa6\xfb\x2f\x66\x02\xa6\x30\xc0\x6d\x6b\x3f\xb2\x69\xaf\x18\xac\
-\x81\xa5\x40\xdb\x59\xe6\x26\x95\x07\x80\xbe\xcb\x58\x23\x00\x16\
-\x2d\x5a\x47\xd6\xac\xe7\xf3\x52\x3c\xbc\x44\x1b\x01\xdd\xf8\x47\
-\x46\x60\x96\x9e\xf4\x73\xc0\xbb\x98\xf5\x67\x7b\x44\x77\x50\x29\
-\xbb\xf8\x99\x72\x26\x68\x5e\x99\x3f\x94\xa1\x4b\xb9\x5e\x5e\x99\
-\x9f\xae\xa7\xdc\xd7\xee\x14\x17\x47\x9e\xae\xeb\x93\xc1\x2a\x40\
-\x58\xe4\xf8\x2f\xa3\x8a\xa0\xab\x6e\x66\xad\x07\x1f\x95\x86\xf8\
-\x1f\x2b\x17\xe3\x15\x61\x33\xfd\x04\x0a\x26\x14\x57\x79\xa5\x61\
-\xb6\x78\xc8\x93\x5d\x9e\x67\xd0\x5e\x03\x83\x7a\xf3\x8b\x52\x24\
-\xda\xe8\xf8\x85\xd7\x5c\xef\x8f\x01\xc0\x4c\xc0\xec\xfe\x2f\xb1\
-\xe9\xae\x58\xac\x81\xa5\x42\xdb\x54\xdc\x2c\x89\x1f\x8b\x84\xa4\
-\x67\x9c\xd3\x7f\x20\xc5\x63\xcb\xa5\x18\x99\xf2\x02\x88\x64\x74\
-\xd4\x47\xd2\xbb\x77\xfc\x16\x8a\x94\x1d\x98\xfc\x83\x22\xbc\x60\
-\x03\x90\x4f\x42\x32\xe5\x48\xd0\x82\x32\x7d\x28\x63\x17\x73\xbd\
-\x82\x32\x3d\x09\x33\xd6\x6b\x82\xf4\xae\xa0\x6a\x17\x95\xdc\xca\
-\x08\x84\x39\xe1\x7c\x29\x7e\xda\x5f\x8a\xeb\x9e\xd2\xfc\xf4\x5e\
-\x29\x8e\xff\x8e\xff\x7f\x84\xea\xfe\xaa\xe4\xe7\x34\x8c\x9a\x37\
-\x07\xf8\x1f\xfd\x07\xf8\x5a\x78\x6e\xa2\xa0\xf8\xb0\x11\x8a\xa3\
-\x82\xd2\xb0\xb9\xf8\xc8\xc2\x6e\x91\x67\x54\xe9\x3f\x4b\x8a\xb3\
-\xaf\xd2\x71\x1b\x30\xd0\xaa\x00\xc5\x42\x3b\x9e\xc7\x8b\x81\x0c\
-\xb4\x69\xae\x58\xac\x81\xa5\x42\xa5\xc6\x6f\xd1\x77\x19\x37\x8d\
-\x9b\xc7\x10\x61\x7e\x20\xf5\x70\xdd\x9f\x53\x4b\x85\x19\x2f\xc0\
-\x5f\xe5\x37\x3a\x60\x0a\x26\xff\x68\x52\x91\xdc\xf5\x95\x64\x21\
-\x09\x5a\x48\x42\x32\xa5\x24\x68\x51\x99\x3d\x94\xc1\x0b\xb9\x5e\
-\x41\x99\x9d\xef\x85\x4a\x16\x65\x04\x7e\x39\x48\x7a\x87\x9e\x24\
-\x63\x0d\xad\xa4\xa8\x8b\x4b\x71\xd0\x09\x52\x5c\x3e\x8c\x4a\x70\
-\x72\x39\xf1\x6a\x8f\xdf\xf3\xe3\x3b\xdc\xd0\x4b\x07\xcb\x48\xa2\
-\xb5\xf4\x62\x54\xef\x57\xde\x9b\x11\x3f\xa7\x21\x83\x73\x60\xe2\
-\x0a\x78\x01\xe6\xda\xcd\xc6\x0b\xff\xc6\x67\x1a\xe3\x33\xc5\xcf\
-\xfb\xe6\xa0\xa0\x78\x09\xb1\x5b\xe4\x19\x78\xbb\xbd\x27\xeb\xa5\
-\xc0\xf0\xa6\x45\xc5\xad\x69\x38\xd7\x24\x49\x4b\x6a\x88\x3d\xe6\
-\x01\x68\xdf\xbe\xfd\x57\x6d\x9a\x2b\x16\x6b\x60\xa9\x9c\x78\xe2\
-\x89\x9d\xe8\x66\x97\x9b\x8c\x93\x6a\x0c\xe4\x99\x82\x8f\x3f\xdb\
-\x18\x00\x7f\x88\xb0\xee\x03\x70\xdf\xcc\x4d\xd1\xae\x6f\xfa\x33\
-\xff\xe6\x9b\xa0\xc5\x24\x24\x53\x4c\x82\x36\x9b\xc9\x73\x41\xfb\
-\x16\x6a\x04\x0a\xce\xe4\x2a\x63\x99\x7b\x62\x23\x80\x36\x81\xdf\
-\xff\x55\xc6\xfe\xf0\xac\x76\x37\x59\xb8\xca\x85\xa7\x4c\x08\xf0\
-\x9d\x4a\xa3\xc8\xdd\xb3\xa4\x77\xd9\x7d\x29\xf1\xeb\x19\x9f\x53\
-\xf8\x3d\x3c\x2f\xd5\x25\x97\x1a\x57\x90\x8a\x03\x7b\x46\x0f\x00\
-\x97\x57\x1d\x43\x9f\xe6\x18\xb5\xd6\x03\x9e\xb1\xcb\x38\x19\xbb\
-\x8d\x8e\xc1\x3e\xe1\xe3\xcc\xbe\x61\x0a\x8e\x1f\x62\xb7\xc9\x33\
-\x88\x73\x18\xe2\xce\xff\xab\xe3\x34\xbd\x0f\x06\x17\x9c\xdb\x50\
-\xa0\xb6\x6c\xd9\x72\x9c\x4d\x6f\xa5\x60\x0d\x2c\x07\x6d\xdb\xb6\
-\xed\x6f\x4a\x0d\x6e\xb9\xd4\x0f\xc3\xaf\x05\x7f\x3d\x44\x4f\x16\
-\x3a\x72\xb6\xee\x03\xf0\x00\xfa\x00\xcc\xd8\x2e\xba\xab\x2e\xa7\
-\x98\xf4\x53\x4f\xfc\xd9\x4c\x82\x96\x92\x90\x4c\x21\x09\x9a\x35\
-\x21\x0b\x81\x8e\xc9\xd7\x08\x14\x93\xb9\x15\x41\xd1\x50\x26\x53\
-\xf1\x84\x4e\x26\x84\x8a\x27\x25\x7c\xf3\x7f\x60\x5f\x2c\xe9\xed\
-\xdd\xfa\xa2\xee\x8e\x7a\xea\x45\x6a\x44\x67\x46\x9b\x01\xff\x3e\
-\xa4\x73\x5a\x63\xa0\x7f\x6d\x22\x3d\x9e\x5e\xa3\xff\x8d\x81\xc1\
-\x7e\xa1\xb1\x08\x71\x5c\xef\x96\x17\xb4\xf8\x6f\xa7\xfd\x2c\x63\
-\x11\xc2\xf7\x19\xa6\x90\x78\xda\x6d\xf2\x0c\x9e\x0d\xb3\xff\x5e\
-\x35\x36\x3d\x7e\x53\x40\x33\x40\xd5\xff\xa9\xf4\xff\x81\x4d\x6b\
-\xa5\x60\x0d\x2c\x17\xb4\xad\xc0\x8d\x9b\x07\xd0\x0f\xc3\x06\x60\
-\x8f\x7d\x79\xd1\x50\xcc\x02\x84\x4e\x40\xdb\x45\xff\xe9\x9b\x44\
-\x0f\x15\x39\x6a\xca\x6f\x8e\xb4\x6c\x09\x5a\x8e\x84\x64\xf2\x49\
-\xd0\xac\x09\x59\x0c\x74\x6c\x73\x46\xa0\x90\x4c\x6d\x25\x28\x18\
-\xfa\xd4\xfd\x04\xc6\xa9\xf3\xa9\xf8\x0a\xfe\x4f\xf8\xd7\x43\x87\
-\x94\x9e\xff\x91\xd1\xcb\x07\xeb\xb4\xca\x80\xd3\x70\x7f\x3d\x88\
-\x08\x23\x09\x03\xe7\xe1\xeb\xf9\xf1\x45\xc2\x56\xf1\x75\x27\x55\
-\x31\x82\x63\x11\x8e\x3a\x4b\xc6\x0f\x3c\x5a\x7a\xfb\x7c\x51\x7a\
-\xfb\x1e\x2c\x63\xf4\x3d\xd7\x58\x04\x3e\x6f\xc6\xb5\x0c\xf9\xc4\
-\xd7\x6e\x93\x67\x82\xcf\xb0\xdf\x51\x3a\x3e\xd3\x0d\xad\x5f\xfa\
-\x9b\xcf\x17\x6c\x1a\x2b\x15\x6b\x60\xb9\xa0\xed\x66\x73\xf3\xe9\
-\x5e\x00\xbb\x90\xa7\x7d\x5f\x8a\xc7\x96\x91\x01\x40\x27\x20\x32\
-\x00\xf7\x4e\xdf\xc8\x06\x00\x04\x23\x2f\x9c\xa0\xe5\x4c\x48\x26\
-\x57\x82\x66\x4d\xc8\x52\xa0\x73\x64\x33\x02\xf9\x64\xe6\x62\xc8\
-\x16\x6f\xe9\xcf\x3e\x4e\x46\x51\x12\xa3\x5e\x5a\xe7\xe9\xb4\xb2\
-\xe1\x51\x9d\xb5\xcb\xeb\x5a\xd4\xc1\xf8\xc0\x77\xf3\x3b\xda\xed\
-\x0d\xfd\x36\x82\x88\x5f\x72\x7b\xda\x58\x84\x38\x5e\x0d\xa3\x6f\
-\x41\xac\x56\xc6\x6a\x42\xe7\x06\x96\xb1\x08\xe1\xf3\x87\xc9\x15\
-\x6f\xbb\x45\x9e\xe1\xfb\xe6\x86\xbf\xaf\xfd\x52\x3f\x6b\xa6\xf8\
-\x83\x20\xec\x2b\x36\x8d\x95\x8a\x35\xb0\x9c\xd0\x36\xdb\x3c\x00\
-\xbf\xc3\xd4\x0f\xc4\x0f\x7c\x59\xbf\xa4\x9a\x35\x78\xf4\x1c\xac\
-\xfa\xdb\x14\x30\x00\x19\x91\xc8\x09\x5a\x89\x84\x64\x6c\x09\x6a\
-\x4d\x48\xcb\xb1\x45\x41\xe7\x0a\x1b\x81\x5c\x99\xb8\x1c\x84\xe3\
-\x2f\xe3\x99\xd1\xb7\x1f\xa5\xef\x9f\xc6\x49\x11\xcb\x65\x00\x5a\
-\x65\x37\x00\xf8\x44\xa9\xdd\x77\x9a\x8c\xde\xf0\x8c\xf4\x8e\x3c\
-\x43\xcd\x10\x15\x27\xa1\xe3\xd5\xa2\x7a\xcf\x8d\x7e\x05\x89\x06\
-\x19\x8b\x61\xb2\x0b\xf2\x2a\xe0\x1d\x22\x5f\x34\x33\x16\xc1\xbf\
-\x46\x96\x74\xb0\xc5\xdf\x6e\x91\x67\xf8\x7e\x21\x7e\x78\x36\x97\
-\x0e\x4a\x7f\xce\x14\x2c\x7a\xee\xf7\xff\x90\x4d\x5b\xe5\xc0\x1a\
-\x58\x4e\x68\xe3\x61\xc2\x66\xa6\x20\xc6\xb8\x91\x78\xff\x7c\xdb\
-\xdf\xc8\x08\xac\x90\xe2\xde\xa9\x68\x03\xd0\xe2\xef\x99\xc5\x08\
-\x04\x28\x77\x42\x32\xe1\x04\x65\xca\x2e\x7e\x86\xce\x19\x34\x02\
-\xe1\xcc\x6b\x3d\xa6\x44\x82\x82\x08\x82\xb8\x66\xe1\x2a\x57\x5d\
-\xa7\x5d\x08\x93\x76\x6d\xa8\x1a\xd7\xf5\x4d\x7b\x15\x00\xe7\x08\
-\x8c\x45\xf0\xa7\xb6\x52\xbd\xdc\x52\xfd\x0a\x02\x3d\xdd\x32\x51\
-\xc6\xc0\x14\x14\x66\x2c\x82\xdf\xf7\x00\xd7\x08\x8a\x2a\x44\xb6\
-\x34\xdc\x65\x79\x86\xef\x13\xf7\x8e\xb6\x0f\x0c\xd0\x6a\xd8\xc3\
-\x3c\xa7\x89\x4f\x0d\x8b\x9f\xdf\xfb\xaf\xb1\xe9\xaa\x5c\x58\x03\
-\xcb\x0d\x6d\x4f\x9a\x87\x61\x8b\xa6\x1f\x52\x27\x6e\x52\xb4\x6d\
-\x9f\x14\xf7\x51\x26\x1a\x3a\x77\x83\xe8\xfa\xd6\x36\x93\xa1\x30\
-\x17\x80\x1f\xc1\x61\x23\x80\xfa\x2c\xff\x57\x09\xc2\x09\x5a\x31\
-\xf1\x33\x74\xee\xb0\x11\xa8\x94\xf8\x19\xdd\x26\x90\x8a\x53\x25\
-\x7e\xfc\xd7\xfd\x2d\xdd\x10\xc7\xcb\x53\xb3\x08\x19\xfe\x7d\xd0\
-\x97\x68\x7f\x9e\x49\x28\x10\x37\xf8\x0e\x03\x10\x1a\x8b\x80\xf5\
-\x23\xf3\x16\x7f\x10\xae\x32\xe2\xf3\x17\xc3\x33\x3d\x01\xbe\x6e\
-\x08\x95\x86\x81\xe7\xdb\x65\x79\x86\xef\x11\xf7\x0c\xcf\x0a\xed\
-\x26\xfb\x1e\xa1\x9f\x29\x3d\x6e\xb9\x80\xc4\x77\xae\x36\xff\xc6\
-\xa6\xa9\x72\x61\x0d\xac\x04\xb4\x2d\x33\x0f\x94\x5e\x15\xa8\x31\
-\x2b\x0a\x1f\x74\x34\x65\xba\x89\x9b\x44\xef\xc9\xdb\x4d\xe2\x6a\
-\x03\x60\x22\x2f\xa3\xc4\xaa\xb0\x40\x6c\x5e\x87\x2f\x90\x6c\x04\
-\x13\x9b\xbf\xe7\x89\x6a\x7d\xbf\x2d\xbd\x04\x51\xae\xb8\x65\xdf\
-\x72\x60\xbb\x9e\x1a\x40\xd4\x8d\xc4\x8f\x52\xf6\xba\xbf\x64\x77\
-\xff\x59\x90\xa7\x5e\xa2\xfb\x0d\x20\xbd\x70\xde\x60\x3c\xa0\x5a\
-\x70\x1b\x95\xb6\xfe\x48\x44\x72\xfb\x03\x9d\x8a\x80\x9e\xed\x26\
-\x70\xde\x5c\x70\xb5\x00\xd5\x8e\x1b\x9e\x35\x6d\x02\x64\x64\xf8\
-\x7a\x7c\xed\x00\xbb\x55\x9e\x41\x1c\x21\x4e\xc0\xa1\x66\xac\x3f\
-\xc7\x63\x8a\xb0\xf8\x5f\xb2\x69\xa9\x9c\x58\x03\x2b\x01\x6d\x17\
-\x99\x87\x4a\xf5\x0b\x48\x37\x02\x54\xa2\x1c\x9f\x24\x97\x32\xa9\
-\x13\xf7\x6d\x53\x15\x40\xeb\x75\x2a\x21\xc3\x2b\xe8\x56\x22\x41\
-\x83\x09\xa9\x4a\xe5\x80\x55\xcf\x6a\x04\x90\x09\x39\x23\xf2\x2b\
-\x2f\x94\x8e\x3c\xdf\x5e\x0e\x22\xb7\x9b\xf7\xf4\xb8\x16\x7d\xea\
-\x77\xe2\xb8\xee\xab\x32\xda\x93\xea\x8b\x96\x63\x4a\x21\xed\x7a\
-\x44\x3d\x1a\xe9\xf0\xbd\xc7\xbf\x65\xec\x0e\x8a\xfb\xeb\x9f\x96\
-\x62\xcf\x03\x90\x3e\x99\xa5\xbf\xc2\xb8\xac\xe8\x45\x18\x74\xc9\
-\x83\x71\x81\x8c\x8e\xf6\x01\xd3\xb9\x25\x28\x7e\xdd\x49\x4c\xb7\
-\x01\x64\x18\x01\xeb\xf5\x0c\x2c\x98\x2f\x7e\x39\xfd\xf5\x23\xc7\
-\x7b\x80\x60\x9e\x51\x9e\x0e\xa7\xe1\xae\xc8\x33\xdd\xde\xd0\xf1\
-\x01\x8e\x3a\x2b\xfd\x59\x52\xb0\x26\xb8\x80\x5c\x6d\xd3\x51\xb9\
-\xb1\x06\x56\x0a\xda\xee\x31\x0f\x17\xac\x0a\x68\x74\x84\x24\xc5\
-\xfe\x47\x27\xc5\xad\xaf\xc0\x7d\x4c\xa2\xb1\x24\x3d\x21\x75\xfd\
-\x2d\xcd\xd2\x96\x39\x41\xc3\x09\x89\xcc\x85\xf3\xe7\x34\x02\xc1\
-\x4c\xa8\xea\xbe\x24\x22\x74\xb4\x81\x2b\x8d\x3a\x72\x37\x02\x9f\
-\x16\x22\x98\x02\xea\x96\xe7\x7d\xf0\x5b\x74\x7d\xc3\xbc\x1b\xd7\
-\x61\x51\x74\x8c\xb1\x1c\x5b\x0c\xe1\xeb\xf1\xb9\x63\xb7\xbe\x24\
-\xbd\xdf\x3c\x28\xbd\x73\xaf\x94\xb1\x96\x6d\x91\x16\x76\x31\x72\
-\x7d\xb5\x1d\x5e\x01\xd2\xf3\xc1\xc8\x85\x45\xc8\xbf\x11\x0f\x87\
-\x9e\xaa\xa6\xb6\xf2\x5a\xb4\x52\xa2\x57\x6e\x3f\x9d\x17\x7d\x44\
-\x30\xb0\xc8\x8b\xd5\xc9\x78\x43\x4b\x29\x6a\xc3\xd5\x81\xb4\x7a\
-\x71\x0a\xbe\xa7\xd0\x58\x04\xff\xda\x84\x2d\xcf\xa4\xa5\xe1\xce\
-\xcc\x33\x48\x47\x32\xb0\x51\x2c\x85\x7e\xc4\x57\xd3\x9f\x21\x05\
-\x8b\x1f\x9f\x5c\xf7\xbf\xc8\xa6\xa1\x72\x63\x0d\xac\x24\xb4\xbd\
-\x6a\x1e\x30\x6c\x04\xd8\x13\x48\x8a\xbd\x3a\xa2\xf1\x28\x19\xeb\
-\xf3\x9e\x8e\x40\x4e\x48\xce\x58\xa1\x48\x2f\x57\x82\xda\x12\x92\
-\xff\xcb\x69\x04\x78\x3f\x6e\x3c\xfb\xfd\xdf\xa4\xf8\xd2\x77\xa9\
-\x14\x3d\x50\x8a\x36\xfb\x48\xd1\x76\x5f\xfd\x19\x22\xb2\xc7\xbe\
-\xd2\x6b\x7f\x90\x0f\x7e\xfb\xff\xd3\x31\xf1\x2f\x1c\xe8\xff\x17\
-\x6d\xb7\x5f\xda\xb1\xc5\x10\xbe\x9e\x7f\x4e\xdc\x5f\x8b\x76\x32\
-\x16\xa7\x12\x1a\xa2\xac\x8f\xc9\x58\xfa\x34\xd4\x29\xb8\xe4\xfa\
-\xf6\xef\xd3\xdd\xff\x40\x5c\xe9\xb8\xa0\x70\x8a\x8b\xf8\x95\xc3\
-\x75\x6b\x3f\xc6\xb7\x87\x7a\x14\x46\xbf\x74\xbe\xf4\x7e\x7a\x07\
-\x19\x9e\x87\x64\xfc\xda\x87\x33\xc6\x22\x84\x1a\xc7\x4c\x98\x11\
-\x8f\x65\x2c\x02\xbe\xdb\xc4\xcf\x54\xc2\x08\x64\xcd\x33\xf4\x19\
-\xa1\xba\xbe\x9a\x3b\xe1\x8f\x7f\x93\xde\x61\x27\xeb\x4e\x55\xf6\
-\x92\x9f\x61\x4d\xf4\xb6\x69\xa7\x12\x58\x03\x2b\x0d\x6d\x73\xcd\
-\x83\x06\xfb\x07\x68\x4c\x75\x00\xc3\x58\xbd\x9f\xdf\xab\x66\x48\
-\x51\x09\xc9\x6e\x66\x20\xb1\xcb\x69\x04\x72\x89\x9f\xc9\x69\x04\
-\xb8\xe4\x57\xad\xde\x7b\xe1\x99\x72\x82\x75\x13\xbd\xba\x5a\xdd\
-\xdf\x9e\x3e\xd5\x3a\x8a\x16\xe2\xb5\xfa\x3d\x39\x50\x19\xa8\x48\
-\xd2\xae\x97\xe3\x5c\x98\x84\x82\xbb\x00\x67\x34\xd2\xb1\xf8\xda\
-\x1f\x4a\xcf\x4b\x55\x13\x2e\xfd\x03\x71\xa4\x30\x69\x84\x31\xee\
-\xe8\x50\x84\xb1\x08\xb1\x83\x4f\xd4\x6d\x0a\xa1\xb1\x08\xd1\xbe\
-\x53\x52\xfd\x04\x7a\x51\x1c\xaa\xd7\x63\x83\x75\x5d\x5f\x5d\x37\
-\x8b\x27\x00\x42\x63\x11\x72\x89\x9f\x29\xa7\x11\xc8\x9a\x67\x90\
-\x17\x70\x4f\x77\xcd\x92\x91\x5f\x3f\x22\xbd\x7d\x0e\x56\x06\x10\
-\x86\x30\x34\xa6\x82\xf3\x3d\xbe\xb3\xf8\x9f\xb2\x69\xa6\x52\x58\
-\x03\x2b\x0d\x6d\x47\x10\x8d\xe6\x81\xc3\x46\x40\x67\x42\x72\x0d\
-\x31\x2d\x72\xec\xbc\x6b\xb4\xb0\xf0\xea\x24\xd8\xe7\xdc\x64\xb2\
-\x72\x18\x81\x7c\xc4\xcf\x58\x8d\x00\xf6\x47\xa2\xa3\xfb\xea\x31\
-\xe7\xe1\x59\xa4\x88\x42\x3c\xc8\xbc\x99\x44\x6a\x6a\x74\x1d\x58\
-\x09\x2d\xa1\x7e\xdb\xf6\x53\xa8\xc6\x33\x2a\x99\xb1\x2f\xa1\xfb\
-\xe5\x5b\xf6\xcb\x41\xda\xf5\x72\x9e\x43\xa5\x83\x8c\x61\x2d\x07\
-\x53\x5f\xf7\x8d\x80\xef\xb6\xd2\x7e\xbf\x7a\x40\xb7\xf0\x07\x8d\
-\x72\x30\x9e\xe8\x37\xe2\x51\xc5\x11\xba\xf7\xf6\xa2\xff\x51\x67\
-\x47\xc7\xa2\x3f\x3e\xaf\xbf\x07\xc6\x22\xc0\x3d\x56\x3d\x14\xbb\
-\xbc\x24\xe3\xb4\xbf\x5a\x16\x0b\xe2\x36\xf7\x93\x01\x97\xa2\x81\
-\xb1\x08\xf9\x88\x9f\x29\x87\x11\xb0\xe6\x19\x80\x3c\x8a\xc1\x3d\
-\x78\xbe\x0b\x6f\x53\x6f\x3f\x94\xf1\x0d\xbc\xfe\x34\x46\xc0\x26\
-\xfe\xff\xd8\xf4\x52\x49\xac\x81\x3b\x03\xda\x4e\x26\x78\x16\x61\
-\xdf\x08\x50\x86\xd3\x8b\x8b\xa2\x83\x08\x65\x44\x15\x7e\xf0\xc9\
-\x52\x5c\xff\x57\x9d\xd8\x28\x75\x50\xfa\x70\xa6\xa3\xcf\x52\x8c\
-\x40\x21\xe2\x67\x32\x8c\x00\x5a\xeb\xd1\xc0\x83\x56\xef\x16\xe6\
-\xdd\x6e\x16\xc2\xe3\xeb\xf1\xdb\xb6\x5f\x98\x60\x23\x5a\xa8\x14\
-\xc9\x49\xc6\x78\xfe\x3c\x8f\x85\xf0\xf9\x98\xb4\xa9\xa9\x2e\xbe\
-\x3d\xbd\xe1\x2f\x1c\x5f\xf4\xdb\x17\x3f\xe1\x7b\x6f\xd8\x0f\xc2\
-\x00\xf8\xce\x61\xe6\x98\xb4\x74\x80\x11\x40\x5a\x7f\xf9\xfb\xfa\
-\x9a\xe1\x3a\x33\xff\x36\x63\x11\x0a\x11\x3f\x53\x8a\x11\xc8\xcc\
-\x33\xa6\xc4\xc7\xf3\xa0\x5a\x04\x43\xc7\x05\x81\xb9\xdf\x50\x3a\
-\x04\x47\xc8\xb2\xf8\xa7\xda\x74\x52\x69\xac\x81\x3b\x0b\xda\xbe\
-\x42\x6c\x34\x11\xa0\xc6\x3b\x23\x72\x80\x2f\x7e\x4e\x6c\xb8\x8e\
-\xe7\x5d\xab\x2d\x2c\x46\x4f\x05\x33\x51\x28\x03\xe5\x9b\xa0\xc5\
-\x88\x9f\xc9\x30\x02\xb8\x5e\xa0\xd5\xdb\x46\xb1\xe2\x67\x0a\x35\
-\x02\xc5\x8a\x9f\x41\x0f\x3d\x55\x7f\xaf\xab\xd1\xc6\xf8\x07\x3d\
-\xd2\x1b\xde\x18\x8e\x17\xfa\x9e\x21\x7e\xfe\x3f\xb8\x7f\x38\xcc\
-\x1c\xef\xa7\x07\x3c\x81\xdb\xe9\x1a\xbf\xc8\xe6\x05\x98\x78\xdb\
-\x63\x7f\x19\xeb\x82\xf4\xd6\xd7\xcc\x57\xfc\x4c\x31\x46\x20\x23\
-\xcf\x28\xaf\x94\x0c\x00\xfa\x26\xa0\x10\xf8\x5e\x17\x29\x1a\xb8\
-\x11\x15\xf7\x99\x4a\x63\x93\x1e\xba\x80\xd3\xe9\xc1\xe2\x9f\x66\
-\xd3\xc7\xce\xc0\x1a\xb8\x33\xa1\xed\x14\xa2\xd1\x88\x1f\xf3\x07\
-\xb0\xdb\xc9\x16\x32\xbd\x04\xd8\xfb\x8b\x52\xfc\x6f\x1f\x4a\x0c\
-\xf2\x04\x60\x08\x94\x47\x80\x0c\x39\x5e\x95\xc4\x9c\x38\xcd\x25\
-\x68\x29\xe2\x67\xd2\x8d\xc0\x38\x19\x85\xab\xcb\xd3\x6f\x87\x66\
-\xd8\xd1\x6e\x38\x25\xbc\x72\xfb\x49\xfc\xca\xed\x4f\xfd\x9f\x17\
-\x94\x81\x94\x11\x48\x73\xe5\x2d\xfb\x11\x69\xd7\x6b\x66\xdf\x34\
-\x90\x69\x79\xca\x70\xfa\x8d\x89\x44\xbc\xfd\x0e\xa3\x7a\xfc\x60\
-\x89\x46\xd9\x70\xc9\xed\xc7\x07\x7d\xcf\x10\x3f\xff\x57\x00\x3a\
-\x5d\xa8\x3a\x80\xd7\xa1\x7f\x78\x26\x67\x57\x64\xd5\x4e\x74\xf3\
-\x3f\xd5\xbe\xc5\x5e\x2f\x2f\x23\x80\xe7\x24\x52\x79\x66\x1c\x79\
-\x29\x2f\xeb\x70\x0c\x70\x42\x15\xf5\xe7\x03\xa5\xd8\x3f\xb0\xe6\
-\x42\xb8\x3b\xb3\x71\xf9\x03\x46\x40\xe5\xf5\xda\xda\xda\x77\x6d\
-\xba\xd8\x59\x58\x03\x77\x36\xfb\xed\xb7\xdf\xc9\x89\x44\x62\x21\
-\x22\x84\xc4\x0f\xab\xc8\xe2\x57\x91\x66\xbe\xfb\x99\x52\x81\x11\
-\x54\x70\x47\xf1\x2a\x0a\x6e\x17\xda\x08\x90\x48\x94\x11\x50\xef\
-\xd4\x09\x15\x48\x50\x24\x96\x49\xd0\x72\x88\x9f\xf1\x33\x90\x1a\
-\x41\xf7\xa6\x8c\x5e\x35\x9a\xea\xa8\xe9\x62\x53\x75\x40\xbc\xfb\
-\x8e\x13\xf4\x99\xad\xc1\x2f\x5f\xe2\x30\x96\x38\x17\x11\xad\xc9\
-\xf4\x22\xd2\xae\x97\x65\x9f\xbc\x68\xf5\x05\x29\xce\xfd\xb5\x8c\
-\xdd\x4a\xf1\x89\xc6\x3c\x33\x13\xb0\x7a\xf6\x60\x9c\xd1\xf7\x72\
-\x88\x5f\x81\x34\x84\x21\x47\x3f\x85\x1b\x9f\x91\xf1\x96\x66\x8a\
-\xac\x10\x31\x4c\x32\x8b\x09\x4a\xc9\x00\xc4\x28\x3d\xcb\x92\x86\
-\xb8\x7f\x36\x02\x7c\x3e\x7c\xaa\x7b\x7a\xd3\xbc\x91\x22\xf1\xf7\
-\x78\x53\xe7\x39\xfc\xf7\xb3\xfe\xba\x8a\xca\xf7\xa6\xf2\x68\x46\
-\x7c\x07\xf3\xf1\x0e\x32\x02\x6a\xa6\xac\x96\x2d\x5b\x8e\x3b\xf7\
-\xdc\x73\x0f\xb6\x69\x62\x67\x61\x0d\xdc\x15\x9c\x7c\xf2\xc9\xc7\
-\xd4\xd7\xd7\xbf\xce\x91\x44\x04\x7b\x0c\x06\x8c\x00\x4a\xa8\x80\
-\x21\xc0\xab\xb6\xb3\x7f\xa5\xa7\xb4\x42\xfd\x92\xea\x8e\xd1\xde\
-\x13\x8d\x28\x75\xc3\x52\x04\xef\xe3\xe1\xa6\xa9\x84\x0c\x8b\x5f\
-\x87\xfb\x89\x1d\xc8\x18\xf9\x92\x6e\x04\xfe\x23\xa3\x57\x8e\xd2\
-\x2d\xdd\x75\x24\x76\xaa\xba\xa8\x77\xe0\x2d\x5b\xab\xcf\x08\x85\
-\xa9\x77\xde\x25\x82\x77\xe7\xea\x9c\x44\xb4\x9e\x4a\x49\x13\x8e\
-\xf3\xfb\xd7\x0b\xfd\x97\x1b\xba\x2f\xb4\xbc\xef\x73\x98\x9e\x2a\
-\xec\xe2\x5e\x54\xa5\x79\x4d\x67\xf4\x5e\x13\x65\xac\x6b\xaa\x03\
-\x56\x9a\xc0\x29\xce\xca\x29\x7e\x45\x0f\xf2\xe6\x7a\xbf\xa7\xa7\
-\x33\xf3\x12\x6a\x6e\xbc\xb4\x46\x4a\x54\x4d\xf0\x36\xa3\xfd\x41\
-\xca\x38\xa9\x0e\x4e\xf9\xa6\x1d\xef\xc7\xd7\x32\x84\x7b\x46\xaa\
-\x3c\x03\xf7\x9e\xc2\xd5\x6a\x48\x3d\xa8\x60\xe9\x3d\x5e\xc6\x7b\
-\x52\x38\x5e\xf3\x7e\xfb\x06\x8a\xab\x4e\xa9\x7c\x88\xfb\x0b\xe6\
-\xcb\x14\xa9\xbc\x9b\x6a\xeb\x92\x35\x35\x35\x03\x6c\x3a\xd8\xd9\
-\x58\x03\x77\x25\xb4\xf1\xe2\x22\x20\xb7\x37\x10\x8c\xf0\x28\x95\
-\xba\xe8\x21\xf6\xcd\xeb\xa4\xf8\xf5\xa3\x7a\x8d\x35\x2a\x91\xbd\
-\x3e\x13\xa4\xd7\xeb\x6d\x19\xe9\x3d\x49\xd5\xd3\x95\x50\x89\x94\
-\xf8\x03\x0d\x38\xc1\x8c\x11\xcc\x34\xcd\x81\x0c\x14\xf6\x04\x6e\
-\x1f\x2f\x23\x7f\x7c\x4e\x7a\xbf\x7d\x4c\x73\xdd\x63\x32\xf2\xbb\
-\xa7\x75\x37\xd6\x72\xf0\x3b\x2a\x1d\xaf\x7b\x9c\xce\xfd\xa8\x22\
-\x7a\xfd\x53\xea\xfc\xb8\x4e\x30\xcc\x7a\xac\x8d\x1b\x9f\x93\xe2\
-\x56\x12\x3c\xe2\x02\x2d\xd8\x4a\xf8\xe9\x2e\x3f\xc4\x9d\x26\x74\
-\x0a\x2f\xbb\xf8\xf1\xdd\x8c\x45\x88\x7e\xf5\x52\xdd\x2f\x21\xd0\
-\x63\x50\x55\x15\xd1\xa2\x5e\x1b\x91\xb1\x43\x28\xbd\x51\x05\xe4\
-\xe3\x83\xe7\x0b\x13\x3c\x3f\x3e\xd5\x73\x19\xe3\x6f\xc2\x23\xf4\
-\xe9\xa1\xd7\x20\x5e\x4b\xde\x4e\x79\x86\xe2\x20\xda\x77\xb2\x4e\
-\xd3\xdf\x3c\x28\xe3\xdf\xfd\x83\x14\x87\x9f\x19\xaa\x96\xe4\x14\
-\x3e\xe7\x57\x14\x68\x5c\xdf\x47\xc3\xf7\xff\xd9\xf2\xfe\xae\xc0\
-\x1a\xb8\xab\xa1\xed\x02\xe2\x33\x02\x3f\xe0\x09\x84\xbd\x81\x80\
-\x21\xb0\x24\x00\xc2\xf6\x3c\x40\x46\x8f\xff\xa6\xf4\xbe\xf5\x6b\
-\xe9\xfd\x44\x77\x36\xf1\x6e\xfa\x3b\xb9\x71\x2f\x68\xf1\xa3\xd4\
-\xc0\xeb\x28\x74\xdc\xe1\xb7\x0b\xc8\x10\xe1\xcc\x92\x2f\xb4\x7f\
-\x9a\x11\x80\x28\xcc\x0c\x3c\xc8\x50\x11\x2a\xd1\x44\x1f\xf2\x50\
-\xca\x09\xdd\x3f\xdc\xd1\xe0\x75\xf8\x7b\xf4\x76\xba\x7f\xdb\x31\
-\xd9\x40\x5c\x40\xf0\x78\x16\x88\x83\x1b\xb7\x38\x2e\x0c\x41\x23\
-\x10\x2c\x31\xd9\x20\x94\x06\x5d\x2f\x34\x16\x21\x8a\x3a\xb3\x69\
-\x37\xf1\x21\x83\xa0\x26\x39\xcd\x36\x16\x21\x0c\x9f\x5f\x7d\x47\
-\x1a\x53\x5a\x23\xcd\x91\xf6\xfc\xdc\xf8\x9f\x9e\x39\x72\x2b\x19\
-\xb4\x6b\x1f\x91\xde\xcf\xee\x92\xde\x77\xae\x97\xde\x29\xdf\x93\
-\xde\x01\x47\xa8\xb9\xfa\xd3\xf3\x18\x0a\xa0\x94\x57\x12\x20\x98\
-\x3f\xf1\xe9\x97\xfa\xc4\x3b\xc4\x11\xb6\x3c\xbf\xab\xb0\x06\xee\
-\x2e\xd0\xf6\xb8\x89\x38\x80\x88\xe4\x6e\x92\xe9\x46\x80\x09\x7b\
-\x05\x84\x1a\x86\x5a\x4f\xa5\x46\x0b\x72\x99\xa9\xce\x18\xdf\xf7\
-\x10\x29\xf6\x3f\x46\xd7\xdb\x30\xce\x1c\x33\xd0\x7c\x87\x2c\x3b\
-\x32\xbc\x7a\x45\x15\x30\x02\x9c\x81\xf2\xc1\x64\x32\x65\x04\x20\
-\x0a\x18\x01\xe5\x6d\x60\x86\x63\x73\xce\x8a\x40\xa5\xb0\xea\xd7\
-\xaf\x3d\x1b\x00\x97\xd5\xbe\x6f\x73\xa0\x34\x25\xcc\x98\x81\x6c\
-\xc4\x50\x1f\x46\xc9\x6f\xc0\x6f\xdb\x7e\x85\x01\x03\x39\x45\xf7\
-\x01\x08\x8d\x45\xc0\xdb\x8b\xa0\x01\xd0\xf3\x07\xd0\x7f\xd9\xc6\
-\x22\x84\x09\x8a\x1f\x69\x0c\x0f\x03\x69\x8e\xb4\x3f\xec\x2b\x52\
-\x1c\x72\x8a\x9e\xa8\x04\x3d\x50\x13\xad\x65\x84\xaa\x44\x2a\xcf\
-\xc0\xfb\x88\xa0\x33\x96\x11\xba\x25\x7f\x05\x08\x0b\x3f\x58\x70\
-\xa1\xf4\xbf\xcd\x96\xc7\x77\x35\xd6\xc0\xdd\x09\xda\xbe\x4b\x7c\
-\x40\xe0\x07\x60\x43\xc0\x11\x1e\x8c\xf8\x00\xda\x33\xc0\x74\xe4\
-\xaa\x13\x0c\x5a\xcf\x91\xa8\x75\x51\x7b\x23\x5c\xc7\x13\xf5\x7b\
-\x7c\x55\x1a\x14\x28\x58\x23\x7e\x7c\x47\xdd\xd1\xeb\xf1\x86\xee\
-\x02\x4a\xde\x86\x77\xcb\xbf\x64\xf4\x36\x72\xad\x43\x7d\xf2\xcb\
-\x45\xb8\x6f\x7f\xb0\x7f\x7f\x65\x48\x1f\xa7\x00\x54\x3d\xdc\xba\
-\x6f\x21\xbc\xa1\x4b\x7d\xb4\xe7\xc4\x5b\xe8\x34\x31\x62\x33\x6f\
-\x88\x34\x54\x12\xc7\x6b\x29\xbc\x1d\x19\x88\x6c\x63\x11\x6c\x20\
-\x4d\x7b\x51\x69\x8f\x57\xb5\x07\x9e\x90\x9e\xf6\x21\xa2\xfc\x06\
-\x05\xaf\x40\x81\xdf\x59\xcb\xba\x7f\x30\xff\xe1\x33\x28\x7c\xf0\
-\x2f\xe2\x28\x5b\xde\xde\x1d\xb0\x06\xee\x8e\xd0\xf6\x7b\x62\x29\
-\xc1\x11\x0b\x43\x80\x88\xe6\x04\x08\x26\x84\x22\x58\x72\x04\x5f\
-\x9f\x81\x08\xde\x89\xb3\x45\x8f\xd6\xe9\xe3\x4e\xfb\x71\x52\xf4\
-\x9b\xd9\x44\x25\x4a\x13\x65\xa8\x26\x2a\x5d\xf3\x43\xed\xfb\x6e\
-\x13\x89\xbf\xc9\xeb\xf9\x9f\xa4\x77\x3d\xd5\xcd\x4f\xbe\x20\xe9\
-\x75\x38\x34\xb3\xdf\x7d\x19\x09\xf7\xed\x2f\xf7\xd8\x81\x0c\x42\
-\xe3\x13\x82\xdf\x63\x7b\xed\x6f\x3f\x26\x1f\xcc\x58\x84\xb4\x7e\
-\xf2\xe9\xe2\x57\x7d\x43\xd4\x28\xc2\x86\x16\x49\x8f\xd2\x3e\xfe\
-\xed\xeb\x9a\xa8\xf4\xcf\x2f\xad\xf0\x3f\xf6\x43\xda\x9e\xfa\x23\
-\x9d\xd6\x48\x73\x4e\x7f\x05\x4a\xf9\x88\x7a\x5d\xaa\xab\x1c\x09\
-\x9d\x67\x80\xc9\x43\xa1\x7e\x1b\x9c\xd7\x38\xdf\x05\x3d\x54\x30\
-\x99\x28\xcb\x02\x9e\x95\xc4\x1a\xb8\x3b\x43\xdb\xad\xc4\x22\x82\
-\x23\x3a\x18\xf9\x9c\x18\x10\xbf\xdf\xe1\x82\x1b\x90\xc2\xae\xa4\
-\x49\x50\xda\xdf\x7c\x22\x33\x62\x96\xd6\x7b\xe7\x6a\x57\xf4\x9e\
-\xd9\x79\x13\xb9\xeb\x7d\xe9\xdd\x39\x4d\x7a\xd7\x3f\x21\xbd\xbd\
-\x3a\x24\xe1\x65\xa8\xd7\x71\x79\xf4\xbf\x2f\x86\x6c\xe7\x2e\xd7\
-\xd8\x01\x1b\xc1\x73\xc7\xcc\xab\x45\x7c\x86\xc3\x4a\x42\x09\xdf\
-\x9c\x3b\x20\x7e\x7c\x27\x91\xee\x50\x55\xba\xc3\x3b\xeb\x16\xf9\
-\x3b\xc8\x9d\xc7\xc4\x25\x96\xf4\x48\x03\x69\x89\x34\x45\xda\x22\
-\x8d\x83\x69\x1e\xb8\x76\xb8\xc0\x40\x98\x79\x6f\xef\xdf\x47\x2a\
-\xcf\x28\x50\x00\x21\xef\xf9\xe7\x20\x26\x12\x3f\xb6\xe5\xdd\xdd\
-\x11\x6b\xe0\xe7\x01\xda\x7e\x45\x4c\x20\x82\x91\x8f\x44\x69\xa2\
-\x84\xc4\x7b\x56\x95\x60\x94\x90\x9c\xc8\x2a\xd1\x42\x46\x00\x09\
-\xca\x89\x89\x52\x61\xa3\xf8\xe3\x73\xfd\x44\xdf\x29\x3d\xc8\x65\
-\xbc\x9d\x4a\x8f\xbc\x88\xf6\xf8\x4f\xef\xd6\x37\xff\x6d\x40\xdb\
-\x1e\xaf\x0e\x48\x74\x3a\xe5\x13\x55\xc5\x88\xd6\x92\x41\x2a\xa4\
-\x1f\x7e\xfe\xe4\x3c\x27\x65\xd0\x52\xc7\x0e\x64\x10\x3a\xa7\x3f\
-\x87\x9f\x41\xbd\x96\xcb\xf2\x5f\x61\xf8\xe9\x98\x29\xfe\x94\x5b\
-\xbd\x39\x76\xe1\x2d\xf7\xb6\xed\xf9\xda\x80\x36\x37\x3d\x73\x5f\
-\xab\x5b\xff\x75\x6f\xa4\xe7\xf8\x5e\xb6\x74\xf1\x41\x5a\x22\x4d\
-\x91\xb6\x48\x63\x7d\x1e\x4e\x77\x95\xf6\x16\xf1\xfb\xff\x21\x8f\
-\x98\x7b\xd9\x41\x6c\xa7\xdf\x61\xd1\x6f\x21\x9e\x25\xbe\x6d\xcb\
-\xab\xbb\x33\xd6\xc0\xcf\x13\xb4\x9d\x41\x0c\x24\xe6\x13\xe1\x84\
-\x44\x02\x22\xb1\x00\x32\x90\xf2\x12\x68\x1f\x4e\x50\x05\x25\x28\
-\xbf\xa2\x79\xdb\x76\x8d\x42\x20\xf1\x2f\x30\xee\x2b\x7b\x24\xc1\
-\x52\x44\x81\x7b\x34\xd7\x2b\x98\x7c\xcf\x85\x4c\x5c\x8e\xeb\x81\
-\xe0\xb9\x8c\x18\x33\x30\x82\xcd\xb9\x4f\xbe\x58\xc4\x9f\x12\x5c\
-\xa4\xa6\xa4\xd2\x95\xb6\xb7\xcd\xb9\xf8\x15\x73\x5a\x7e\x30\x79\
-\x06\x69\x07\x90\x67\xb0\xdf\xb6\x70\xbc\xd3\x6f\xfc\x87\x02\x08\
-\x33\x5f\x1f\x6a\xbb\xd6\xe7\x01\x6b\xe0\xe7\x95\x16\x2d\x5a\x7c\
-\xab\x4d\x9b\x36\xf7\xd3\xe7\x04\x4a\xc8\xf5\x94\x30\x3a\xd3\x58\
-\x80\x28\x4c\xa2\xc3\xaa\x2b\x61\x51\xf8\x77\x6d\xe7\x2d\x04\x2a\
-\x2d\x79\x94\xa3\xca\x5c\x86\xb2\x18\x81\x42\xcf\x51\x0e\x23\x90\
-\x8f\xf8\x99\x32\x18\x01\x1e\x0c\xc6\xe2\x87\x08\xd9\x38\x83\x9f\
-\xd8\xe2\xbc\x10\x68\xc3\x2b\x66\x3e\xdf\x8e\x90\xf8\x39\xdc\x0a\
-\xc5\xff\x67\x94\xb7\x5e\xdc\x63\x8f\x3d\x7a\x76\xec\xd8\xf1\x6c\
-\xdb\xf9\x3f\x6f\x58\x03\xff\x5b\xa0\xed\x9b\xc4\x4d\xc4\x58\xe2\
-\x0d\xe2\x13\x02\x86\x41\x59\x7f\x63\x04\xb0\xe6\xda\xca\x3d\xf7\
-\xdc\xf3\x3a\xdb\x39\x0a\x85\x36\xb4\xfa\xe2\x0b\xdc\xc2\xa0\x11\
-\x50\xd5\x0d\xce\x6c\x00\x99\x2f\xbc\x4f\x36\x8a\x3d\x16\x25\x5a\
-\x31\xd7\x03\xc1\x63\x21\x4c\xdb\x3e\x61\x42\x02\xb6\xee\x93\x0d\
-\x73\x2c\x0c\x32\x06\x86\xb1\xcb\x0f\xde\x27\x4e\xb1\xc5\x77\x31\
-\xd0\xf6\x33\x62\x19\xa7\x3f\x30\xe2\x87\xc1\x41\xba\xad\x26\x66\
-\x11\x48\xcb\xfb\x08\x54\x37\x3b\xdb\xce\xf5\x79\xc7\x1a\xf8\xdf\
-\x0e\x6d\x47\x13\xa7\x11\xdf\x24\x8b\x7e\x7e\xe7\xce\x9d\xcb\xf6\
-\x9a\x86\xb6\x13\x89\xad\x04\x7e\x64\x50\x8c\x27\x50\xcc\x31\x41\
-\x82\xa5\x78\xbe\xc7\x06\x8f\x21\x31\x5a\xf7\xc9\x06\xf6\x2f\xf4\
-\xd8\x2c\xc7\x7c\x4c\xdc\x64\x8b\xe7\x72\xd0\xa1\x43\x87\x1f\xed\
-\xb3\xcf\x3e\x97\xed\xbd\xf7\xde\x3f\xae\xa9\xa9\x39\x9b\xae\xf5\
-\x65\x62\x97\xf6\xcd\xdf\xd9\x58\x03\x1d\xa5\x61\x32\x12\xc6\x35\
-\x6c\x20\xd0\xf5\x13\x6c\x66\x48\xd0\x9b\x29\xa3\xfb\x90\x28\xfd\
-\xff\xc2\x14\xb2\x6f\x2e\x48\xd0\x79\x9f\x23\xb8\x2f\x89\xd1\xba\
-\x4f\x73\xe0\xb8\x7c\xcf\x61\xf6\xdd\x44\x9e\xd8\xea\xfa\xfa\xfa\
-\x69\x14\x36\x86\xf8\xa1\x2d\x6e\x1d\xe5\xc5\x1a\xe8\xa8\x3c\x0d\
-\x0d\x0d\x87\x1e\x7e\xf8\xe1\x9d\x8f\x3c\xf2\xc8\x53\x01\x95\x42\
-\x47\x16\xb3\x4f\x21\x1c\x76\xd8\x61\x5f\x6e\xee\x5c\xc1\x7d\x0e\
-\x3c\xf0\xc0\xe3\x6d\xfb\xe4\x0b\x8e\x6f\xee\x5c\x66\x9f\xd3\x8e\
-\x3d\xf6\xd8\x93\x6c\xff\x3b\x2a\x8b\x35\xd0\xe1\x70\x54\x07\xd6\
-\x40\x87\xc3\x51\x1d\x58\x03\x1d\xbb\x86\x73\xce\x39\xe7\x10\x10\
-\xfe\x5e\x29\x76\xf6\xf5\x1c\xbb\x1f\xd6\x40\x47\xe9\xd0\x36\x92\
-\xc0\xab\x24\x74\x50\x6a\x96\x48\x24\x32\x3f\x91\x48\x7c\x4c\x7c\
-\xc2\xd4\xd6\xd6\x2e\xb0\xed\x5b\x2e\x3c\xcf\x4b\xbb\x5e\x2c\x16\
-\x5b\x68\xdb\xaf\x48\xb0\x2a\xf4\xbb\xc4\x9f\x09\x74\x96\x39\xd1\
-\x16\x4f\x8e\x5d\x8b\x35\xd0\x51\x1a\xb4\x7d\x4a\xe0\x4b\xde\x84\
-\x5f\xf5\x81\x42\x5f\xf7\x15\x4a\xf0\x55\xdf\x4e\xb8\x1e\x06\xf3\
-\xbc\xd3\xbe\x7d\xfb\x2b\x6c\x71\xe6\xd8\x35\x58\x03\x1d\xc5\x43\
-\xdb\x63\x26\xc3\xe3\x15\x17\x77\x29\xcd\x09\x89\x1f\x9d\x5f\xac\
-\x90\x28\xad\xc7\x94\x0a\x89\x7f\x67\x5c\x0f\x9d\x79\x54\x57\x6c\
-\xf2\x2e\x7c\x43\xd3\xd0\xd0\x30\xee\x98\x63\x8e\x39\xd9\x16\x7f\
-\x8e\x9d\x8b\x35\xd0\x51\x3c\xb4\xf1\x90\x65\x08\x80\x7b\xb9\xe1\
-\xb7\x95\x70\xc9\x8f\x52\xd8\x16\x66\x3b\xb6\x58\x6c\x9d\x7c\x82\
-\x61\x65\xba\x9e\xff\xec\x74\x0d\xee\x1d\xb8\x9d\xbe\xab\x1e\x7e\
-\xf4\xb9\xf2\x80\x03\x0e\xb8\xd0\x16\x87\x8e\x9d\x87\x35\xd0\x51\
-\x3c\xb4\xad\x40\x06\x27\x58\x00\x59\x0d\x40\x2e\xa1\x57\xca\x08\
-\xd8\xc4\x6f\xfb\xaf\x5c\xd7\xc3\x35\xe8\x7c\xdc\x35\x18\x61\x88\
-\x0f\xd5\xbf\x9f\x7e\x37\xed\xbf\xff\xfe\x3b\x65\x11\x4c\x87\x1d\
-\x6b\xa0\xa3\x78\x68\xcb\x3a\x16\x20\x08\x09\x9c\x4b\x45\x05\x09\
-\xae\xa8\x7d\x0a\x81\x04\xee\x9f\x8b\xc4\xd7\xec\x3e\xa5\x5e\x0f\
-\xd7\x30\xe7\x52\x5e\x40\xe0\x3f\xc4\x8f\x1a\xe1\x47\xe1\xab\x8e\
-\x3a\xea\xa8\x53\x6d\x71\xe9\xa8\x3c\xd6\x40\x47\xf1\xd0\x96\x73\
-\x2c\x00\x28\xa4\x74\x2f\x97\x27\x90\xab\xe4\x0f\x53\x0e\x4f\x00\
-\xd7\xa0\xe3\xd1\xae\x80\xfa\x3f\x8b\x3e\x6c\x04\x94\x27\x50\x5f\
-\x5f\xff\x9a\x2d\x2e\x1d\x95\xc7\x1a\xe8\x28\x0d\xda\xb2\x8e\x05\
-\x20\x41\xfb\x7d\xe4\x01\x09\x2c\xad\x5f\xbc\x8d\x62\x8e\x09\x42\
-\x82\xf6\x8f\x25\x31\x5a\xf7\x09\x13\x3c\xa6\xd0\xeb\xe1\x1a\x74\
-\xdc\x56\x22\x68\x6c\xd0\x26\x82\xcf\xa0\x11\x00\xca\x13\x68\xdd\
-\xba\xb5\x7b\x3b\xb0\x0b\xb0\x06\x3a\x2a\x43\x29\x7d\xfb\x8b\x3d\
-\xb6\x94\xbe\xfd\xf9\x8c\x1d\x08\xc3\xfd\xff\x3b\x75\xea\x74\x66\
-\xdb\xb6\x6d\x7f\x48\xe2\xc6\x50\x6c\x36\x02\x3c\xc4\x97\xc5\x1f\
-\x0c\x7b\xcf\x76\x3e\x47\x65\xb1\x06\x3a\x1c\xe5\x84\xb6\xb3\x88\
-\x95\x46\xe8\xd9\x3c\x01\x84\x9d\x69\x3b\xde\x51\x39\xac\x81\x0e\
-\x47\xb9\x81\xb8\x89\xa0\xf8\x83\x46\x80\x67\xfd\xe9\x6d\x3b\xd6\
-\x51\x39\xac\x81\x0e\x47\x25\xa0\x6d\x88\x11\x3a\xea\xfd\x6c\x04\
-\x00\x57\x03\x5e\xb0\x1d\xe7\xa8\x1c\xd6\x40\x87\xa3\x12\xd0\x86\
-\x09\x5c\xf1\x85\x4b\x7e\xfe\xce\x9e\xc1\x6c\xdb\x71\x8e\xca\x61\
-\x0d\x74\x38\x2a\x05\x6d\x3c\x59\x6b\xd0\x03\x60\x03\xb0\xc2\x76\
-\x8c\xa3\x72\x58\x03\x1d\x8e\x4a\x41\xdb\x3a\x23\x76\x9b\x01\x58\
-\x69\x3b\xc6\x51\x39\xac\x81\x0e\x47\x25\xa0\xed\x24\x22\xe8\xfa\
-\xf3\x27\x1b\x80\x79\xb6\xe3\x1c\x95\xc3\x1a\xe8\x70\x54\x02\xda\
-\x7a\x1b\xa1\x07\x1b\x01\xf1\xc9\x8d\x80\xaf\xda\x8e\x73\x54\x0e\
-\x6b\xa0\xc3\x51\x6e\x68\x3b\x8c\x60\xf7\x3f\xf8\x3a\x10\xf0\x6b\
-\xc0\x7b\x6d\xc7\x3a\x2a\x87\x35\xd0\xe1\xc8\x45\xc7\x8e\x1d\x8f\
-\x25\xb1\x0e\x27\xb0\x60\xc7\xac\x16\x2d\x5a\x3c\x72\xc4\x11\x47\
-\x9c\x66\xdb\x17\xd0\x76\x30\xf1\x21\x81\x1f\xe1\xde\x80\x80\x0d\
-\xc2\xe7\x6e\x6d\xbd\xcf\x3b\xd6\x40\x87\x23\x1b\xe8\xea\x4b\x42\
-\xcd\x98\xf1\x28\x1e\x8f\xaf\x6a\xdb\xb6\x6d\x3f\x74\x01\xe6\x7d\
-\x69\x43\xa9\x7f\x0b\x81\x95\x76\x10\x90\xab\x2b\xf0\x47\xc1\xeb\
-\x38\x76\x0e\xd6\x40\x87\x23\x1b\xb4\xd9\x66\x3c\x52\x2e\xbc\x19\
-\x45\xd8\x94\x48\x24\x96\xd6\xd6\xd6\x2e\xe1\x70\x83\xad\xe4\xc7\
-\x6f\xde\xe7\x5a\xdb\xf5\x1c\x95\xc5\x1a\xe8\x70\x64\x83\xb6\xc5\
-\x46\xb0\x10\x7e\x50\xc8\xf8\xbd\xcd\x32\x94\x18\x0d\x7e\xec\xe2\
-\x87\xc5\xaf\x46\x02\x12\x53\x6c\xd7\x72\x54\x1e\x6b\xa0\xc3\x91\
-\x0d\xda\x96\x19\xd1\x06\x0d\x00\x0b\x5a\x7d\x27\x23\xc0\x73\x0c\
-\xf2\xa4\x22\xfe\x7f\x06\xfc\x66\x8f\x00\xe7\x71\xab\x02\xed\x22\
-\xac\x81\x0e\x47\x36\x68\x7b\xce\x08\x97\x27\x3d\x09\x8a\xda\xc7\
-\xe2\x09\x04\xf7\xe3\x92\x1f\xfc\xc8\x76\x1d\xc7\xce\xc1\x1a\xe8\
-\x70\x64\x83\x36\x4c\x76\xc2\xf5\x76\x7c\x86\x3d\x01\x16\x39\x8c\
-\x40\x78\x7a\x31\xec\xcb\xc7\xe2\xf7\x8f\x6d\xd7\x70\xec\x3c\xac\
-\x81\x0e\x47\x2e\x68\xeb\x4c\x7c\x40\x28\xa1\x13\x70\xe7\x51\xaa\
-\xe3\x33\x68\x10\x78\xfa\xf1\x6d\xc4\x76\xe3\x09\x80\xb2\xae\xf7\
-\xef\x28\x1e\x6b\xa0\xc3\x91\x0f\xb4\x61\xc5\x9f\x4f\x08\x16\xb6\
-\x15\xae\x0e\x24\x12\x89\xc5\xf5\xf5\xf5\xb7\xd9\xce\xe5\xd8\x35\
-\x58\x03\x1d\x8e\x42\xa0\xed\x12\x02\x6b\xfa\x4f\x21\x56\x11\x1b\
-\x0d\x8d\xc4\xe4\x48\x24\x32\xba\x5d\xbb\x76\x57\x9d\x7e\xfa\xe9\
-\x87\xdb\x8e\x77\xec\x3a\xac\x81\x0e\x87\xa3\x3a\xb0\x06\x3a\x1c\
-\x8e\xea\xc0\x1a\xe8\x70\x38\xaa\x03\x6b\xa0\xc3\xe1\xa8\x0e\xac\
-\x81\x0e\x87\xa3\x3a\xb0\x06\x3a\x1c\x8e\xea\xc0\x1a\xe8\x70\x38\
-\xaa\x03\x6b\xa0\xc3\xe1\xa8\x0e\xac\x81\x0e\x87\xa3\x3a\xb0\x06\
-\x3a\x1c\x8e\xea\xc0\x1a\xe8\x70\x38\xaa\x03\x6b\xa0\xc3\xe1\xa8\
-\x0e\xac\x81\x0e\x87\xa3\x3a\xb0\x06\x3a\x1c\x8e\xea\xc0\x1a\xe8\
-\x70\x38\xaa\x03\x6b\xa0\xc3\xe1\xa8\x0e\xac\x81\x0e\x87\xa3\x3a\
-\xb0\x06\x3a\x1c\x8e\xea\xc0\x1a\xe8\x70\x38\xaa\x03\x6b\xa0\xc3\
-\xe1\xa8\x0e\xac\x81\x0e\x87\xa3\x3a\xb0\x06\x3a\x1c\x8e\xea\xc0\
-\x1a\xe8\x70\x38\xaa\x03\x6b\xa0\xc3\xe1\xa8\x0e\xac\x81\x0e\x87\
-\xa3\x3a\xb0\x06\x3a\x1c\x8e\xea\xc0\x1a\xe8\x70\x38\xaa\x03\x6b\
-\xa0\xc3\xe1\xa8\x0e\xac\x81\x0e\x87\xa3\x3a\xb0\x06\x3a\x1c\x8e\
-\xea\xc0\x1a\xe8\x70\x38\xaa\x03\x6b\xa0\xc3\xe1\xa8\x0e\xac\x81\
-\x0e\x87\xa3\x3a\xb0\x06\x3a\x1c\x8e\xea\xc0\x1a\xe8\x70\x38\xaa\
-\x03\x6b\xa0\xc3\xe1\xa8\x0e\xac\x81\x0e\x87\xa3\x3a\xb0\x06\x3a\
-\x1c\x8e\xea\xc0\x1a\xe8\x70\x38\xaa\x03\x6b\xa0\xc3\xe1\xa8\x0e\
-\xac\x81\x0e\x87\xa3\x3a\xb0\x06\x3a\x1c\x8e\xea\xc0\x1a\xe8\x70\
-\x38\xaa\x03\x6b\xa0\xc3\xe1\xa8\x0e\xac\x81\x0e\x87\xa3\x1a\x90\
-\xe2\xff\x01\x97\x0c\xea\x8b\xd2\x6c\x51\x0c\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x12\x32\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\xc8\x00\x00\x01\x0e\x08\x03\x00\x00\x00\xfb\x40\xa8\xb1\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x03\
-\x00\x50\x4c\x54\x45\x00\x00\x00\x15\x15\x15\x2f\x25\x1e\x33\x33\
-\x33\x2f\x65\x86\x21\x97\xd8\x2a\xa5\xf8\x83\x83\x83\xad\xc6\xd7\
-\xe6\xe6\xe6\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xbc\xec\x4a\xc8\x00\x00\x01\x00\x74\x52\x4e\
-\x53\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\
-\x00\x53\xf7\x07\x25\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\
-\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\xa8\x64\x00\x00\x00\x18\x74\x45\
-\x58\x74\x53\x6f\x66\x74\x77\x61\x72\x65\x00\x70\x61\x69\x6e\x74\
-\x2e\x6e\x65\x74\x20\x34\x2e\x30\x2e\x39\x6c\x33\x7e\x4e\x00\x00\
-\x0d\x8b\x49\x44\x41\x54\x78\x5e\xed\x9c\x81\x72\xdc\x38\x0e\x44\
-\x77\x34\xb6\xc7\xc9\xff\xff\x6f\x96\x92\x5a\x12\x49\x35\x40\x10\
-\x04\xc7\xd9\xab\x7b\x55\x5b\x95\x1d\x25\x26\x5e\x80\x26\x25\x39\
-\xc9\x3f\x7f\x66\xf3\x7a\x3d\x9f\xcf\xd7\x37\xfe\x6f\x1a\xb3\x45\
-\x9e\x8f\xc7\x92\x44\x96\xc7\xe3\x85\x4f\x26\x31\x57\xe4\x7b\x59\
-\x2d\x36\x96\xc7\x13\x1f\xce\x61\xae\xc8\xd6\x8d\x83\x65\xc1\xa7\
-\x53\x98\x2a\x72\xf5\x63\x63\x6a\x4f\x66\x8a\xbc\x1e\x30\x38\x78\
-\x4c\x8c\xfc\x4c\x91\xda\x23\xe5\x04\x57\x26\x30\x51\xe4\x59\x0e\
-\xd6\xca\xc4\xad\x6b\x9e\xc8\xf7\xad\x21\x89\x79\x2d\x99\x27\x52\
-\xec\x58\x07\xcb\xb4\xbc\x4f\x13\xb9\x25\x7d\x67\x5a\xde\xa7\x89\
-\x70\x8f\x79\x87\xc9\x2c\x11\x92\xf4\x9d\x59\x79\x9f\x24\x42\x93\
-\xbe\x33\x29\xef\x93\x44\xaa\x33\x3d\x67\x52\xde\xe7\x88\x08\x49\
-\xdf\x99\xd3\x92\x39\x22\x9a\xc7\xa4\xbc\x4f\x11\x11\x93\xbe\xb3\
-\xcc\xc8\xfb\x14\x11\xb5\x21\x89\x19\xc3\x35\x43\x44\x49\xfa\xce\
-\x8c\x2d\x78\x82\x88\x9a\xf4\x8d\x19\x77\xc1\x13\x44\x9a\x1e\x53\
-\xb6\xe0\x78\x91\x57\x6b\xb0\x56\xe2\x6f\xb9\xc2\x45\x94\x33\x3d\
-\x23\x7e\xb8\xc2\x45\x1a\x5b\xef\x41\x78\xde\xa3\x45\xda\x49\xdf\
-\x09\x6f\x49\xb4\x88\xd1\x23\x3e\xef\xc1\x22\xa6\xa4\xef\x04\xe7\
-\x3d\x58\xc4\xdc\x90\xf0\xe1\x8a\x15\x11\x92\xce\x3f\x8d\xcd\x7b\
-\xa8\x08\xdf\x7a\x97\xe5\x4b\x30\xc1\x2f\x0b\x21\x54\x84\xbe\x38\
-\x79\x2e\x9f\x5f\x1f\xfc\x42\x64\xde\x23\x45\xf8\xd6\xbb\x3c\xbf\
-\xbe\xa4\x96\x04\xe6\x3d\x52\x84\x27\x7d\x49\x1e\x52\x4b\x02\x1f\
-\xb1\x02\x45\x78\xa6\x97\x8f\x55\xe4\x8b\x5f\x0c\xcc\x7b\x9c\x88\
-\x70\x93\xb5\x35\xe4\xeb\xeb\x53\x18\x2e\xfc\xe2\x71\xe2\x44\xf8\
-\xe3\x14\x1a\x22\x0d\x57\xdc\xb7\x4c\xc2\x44\x94\xa4\xef\x08\x2d\
-\x89\xca\x7b\x98\x88\x30\x58\x9f\xd0\x98\x9e\xf7\x28\x11\x35\xe9\
-\x3b\xc2\x4f\x09\xca\x7b\x90\x88\x9e\xf4\x9d\xb9\x79\x0f\x12\x69\
-\x24\x7d\x47\xea\x1a\xbe\xc6\x18\x31\x22\xcd\xa4\xef\x70\x91\x98\
-\x96\xc4\x88\x34\x93\xbe\x33\xf3\x96\x2b\x44\x44\x2a\x10\xf5\x5f\
-\xd0\x9f\x17\x73\xbe\x47\x88\x58\x92\xbe\x33\x31\xef\x11\x22\x52\
-\x88\x51\x7d\x8e\xf0\x53\x03\x5a\x12\x20\x22\xbc\x38\x21\x0d\x49\
-\x70\x91\x80\x96\x04\x88\x08\x1e\xac\x21\x13\x6f\xb9\xc6\x45\xa4\
-\x17\x27\xa8\xbc\x86\xff\xec\xf1\xe1\x1a\x17\x91\xb6\xde\x7a\xef\
-\x05\xb3\xf2\x3e\x2c\x22\x26\x5d\x10\x99\xf5\x88\x35\x2a\x22\x6e\
-\xbd\x52\x47\xc4\xc3\x04\x5f\xd0\xcb\xa8\x88\xf0\xe2\x44\x6e\xc8\
-\xac\xf3\x7d\x50\x44\xbc\xc9\x92\x1b\x22\xb6\x64\xec\x11\x6b\x50\
-\x44\x4c\xba\x26\x22\xb4\x64\x6c\xb8\xc6\x44\xe4\xa4\x6b\x22\x53\
-\xce\xf7\x21\x11\x25\xe9\x9a\x87\xb0\x05\x8f\xb5\x64\x48\x44\x4e\
-\xba\x2e\x32\x23\xef\x23\x22\x4a\xd2\x1b\x22\x13\xf2\x3e\x22\xa2\
-\x24\xbd\xe1\x21\xb5\x64\xe0\x95\xca\x80\x88\x96\xf4\x96\x48\xfc\
-\xf9\xee\x17\x91\x92\xbe\x35\xa4\x29\x12\x7e\xcb\xe5\x17\x11\x5f\
-\x9c\x98\x44\x84\x96\x3c\xdd\x79\x77\x8b\xa8\x49\x6f\x7b\x84\xe7\
-\xdd\x2d\xa2\x0e\x96\x45\x24\x78\x0b\xf6\x8a\x08\x49\x47\x43\x2c\
-\x22\x5f\xf8\x35\x15\xde\xbc\x3b\x45\xf4\xa4\xdb\x44\x62\xf3\xee\
-\x14\x11\x1a\x82\xa4\x9b\x3c\x82\x6f\xb9\x7c\x22\xe2\x8b\x93\xdd\
-\xc3\x28\xc2\xf3\xbe\xf8\xf2\xee\x13\x69\x0c\x96\x55\x24\x32\xef\
-\x2e\x11\x5e\xc0\xf3\x48\xba\x59\x44\xd8\x82\x5d\xc3\xe5\x11\x69\
-\x25\xdd\xec\x11\x99\x77\x8f\x48\x23\xe9\x1d\x22\x81\xb7\x5c\x0e\
-\x11\xed\x71\x6a\x07\x55\x5a\x08\x6b\x89\x43\x44\x7b\x9c\xda\x41\
-\x91\x16\xc2\xf2\xde\x2f\xc2\x5f\x91\x9e\x67\x7a\x02\x35\xda\x10\
-\x5a\xd2\xbd\x05\xf7\x8b\xb4\x92\xde\x29\x22\xb4\xa4\x7b\xb8\xba\
-\x45\x9a\x49\xef\x14\x89\xca\x7b\xaf\x48\x3b\xe9\xbd\x22\x41\x5b\
-\x70\xaf\x88\xe0\xe1\x6f\x88\x34\x5c\xbd\xdf\x32\xe9\x14\xd1\x1f\
-\xa7\x76\x50\x9f\x1d\xa1\x25\x7d\x79\xef\x14\x69\x27\xdd\x21\x22\
-\xe4\xbd\xef\x95\x4a\x9f\x88\x21\xe9\x0e\x91\x90\xbc\x77\x89\x34\
-\x6f\xb2\x56\x50\x5c\x0f\x11\x79\xef\x12\xd1\x5f\x9c\x00\x14\xd7\
-\x05\x6f\x49\xd7\x2b\x95\x1e\x11\x4b\xd2\x7d\x22\x01\x79\xef\x11\
-\xb1\x0c\x96\x53\x64\xfc\x96\xab\x43\x44\x48\x7a\x44\x43\x02\xf2\
-\x6e\x17\x31\x25\xbd\x2d\xf2\xfd\xeb\xf7\x37\x7e\x98\x33\x9c\x77\
-\xbb\x88\x29\xe9\x0d\x91\xef\xdf\x07\xf8\xe0\x42\xe8\xb7\xb9\x25\
-\x66\x11\x5b\xd2\x75\x11\x48\x6c\xe0\xa3\x0b\x2e\x62\x6e\x89\x59\
-\xc4\x36\x58\x66\x8f\xdf\xb7\x01\x1b\xcc\xbb\x55\x84\x2f\x93\xbd\
-\x38\x01\xa8\x8a\x01\x81\x13\x7c\x7c\xc2\x57\xb0\x6e\xc1\x56\x11\
-\x63\x43\x14\x91\x2b\x1f\x07\xb8\x70\xc0\xf3\x6e\x1d\x2e\xa3\x88\
-\x10\xc5\x3a\xe9\x3d\x0d\xb9\x0f\xd7\xd0\x16\x6c\x13\x69\xbd\x22\
-\x3d\x41\x49\x0c\x54\x9f\xf1\x0b\x57\x4e\x84\xe1\x42\x11\x3a\x36\
-\x11\xc1\xe3\xd6\x90\xae\xc9\xba\xa7\x64\x24\xef\x26\x11\xeb\xd6\
-\xab\x89\xa0\xf6\x02\x5c\xba\x10\x5a\x62\xc9\xbb\x49\xc4\x9a\xf4\
-\x61\x91\x81\xbc\x5b\x44\xac\x49\x57\x23\xf2\x0b\xc5\xe7\xe0\x52\
-\x86\x3f\xef\x06\x11\x73\xd2\x55\x11\x92\x91\x5b\xd8\x13\xee\x96\
-\x18\x44\xcc\x49\x57\x45\x0c\xdb\xef\x8a\x3b\xef\x6d\x11\xf1\x4f\
-\x91\xa2\xf8\x0c\x14\xc3\x41\xf5\x19\xb8\x50\xc2\x57\x6b\xe7\xbd\
-\x2d\x62\x4f\xba\x2e\x72\x33\x61\x0d\xf1\xbf\x52\x69\x8a\xd8\x93\
-\xde\x12\xa9\x53\x82\x8f\x6b\x9c\x79\x6f\x89\x58\x5e\x91\x9e\xa0\
-\x14\x89\x72\xe3\xc2\x87\x37\x9c\x8f\x58\x2d\x91\xf6\x37\x43\x2e\
-\x50\x89\x02\x1c\x12\x7c\xae\x36\xa4\x1b\x6d\x54\x24\xd0\x10\xb1\
-\x9f\xe9\x09\x14\xa2\x81\xf1\x62\x1b\xef\x85\xd0\x12\x3d\xef\x0d\
-\x91\x8e\xa4\x9b\x44\x4c\xb8\xf2\xae\x8b\x08\x49\xe7\x0d\x09\x13\
-\x71\xe5\x5d\x15\x31\xbe\x38\x01\xa8\x22\x00\x4f\xde\x55\x11\xe3\
-\x8b\x13\x80\x2a\x22\x10\x26\x41\xfb\x8b\x7e\x9a\x48\x57\xd2\x9d\
-\x22\xc2\xee\xc5\x45\xb4\x96\x68\x22\x5d\x83\xe5\x11\x39\x8e\xc8\
-\xbb\x4d\xff\x2d\x97\x22\xc2\xfb\x4b\x6f\xb2\x56\x50\x42\x07\xd0\
-\x58\xb9\xa9\xf0\xb5\x95\xbc\x2b\x22\xb3\x1b\x02\x87\x9d\xda\xa4\
-\x3b\xef\xb2\x48\x5f\xd2\xbb\x45\x5a\x77\x5e\xbd\x5b\xb0\x28\xd2\
-\xf1\x38\xb5\x83\x02\xac\xa0\xfe\x0b\x7c\x7e\xd2\xd9\x12\x51\x44\
-\xf0\xf8\x40\xd9\x37\xb0\xbc\x15\xf2\xc0\x88\x2b\x07\x9d\x79\x97\
-\x44\xa4\x2f\x33\xad\x21\xf7\x98\x08\x2d\x11\x86\x4b\x10\xe9\x3b\
-\xd3\x57\xb0\xba\x15\x14\x5f\x80\x4b\x07\x7d\x79\x17\x44\x78\xd4\
-\xe4\xa4\x87\x88\xd4\x2d\x11\x8a\xe0\x2d\xe1\x22\xdd\x49\x0f\x88\
-\x48\x02\x17\x4f\xb8\x08\x6f\x09\x17\x91\x92\x1e\x26\x42\x3b\x32\
-\x94\x77\x2a\xd2\xf1\xe2\xe4\x00\x4b\x9b\x41\xe5\x15\xb8\x78\xc2\
-\xeb\xa0\x8f\x58\x54\xa4\x3b\xe9\x51\x22\xb6\xbc\xd3\xe1\x62\x22\
-\xfd\x49\xef\xf6\x10\x42\x62\xcc\x3b\xdb\x82\x89\x48\xd7\x8b\x13\
-\x80\x75\x3b\x40\xe5\x35\xb8\x7a\x22\x0c\x17\x4a\xcd\x20\x22\x8e\
-\x86\x38\x44\xd8\x4b\xed\x44\xfd\x5a\x82\xe7\x9d\xb4\xe4\x2e\xc2\
-\x1b\xa2\x9c\xe9\x2b\x58\xb6\x07\x54\x5e\x83\xab\x27\xd6\x96\xdc\
-\x45\x84\xbb\x5e\x54\xcc\xc1\xa2\x5d\x08\x29\x31\x6e\xc1\xb7\xa7\
-\xde\x9b\x88\xf0\x7c\xab\x0e\x96\x4b\x44\x6a\x89\x29\xef\xf7\x8d\
-\xeb\x26\xe2\xd8\x7a\x9d\x22\x63\x5b\x70\x7d\x2a\xd6\x22\xae\x86\
-\x38\x45\xc6\xf2\x5e\x9d\x8a\xb5\x88\xa0\x3f\xc3\x63\x2c\xef\xf5\
-\xc6\x55\x89\x08\x5b\x16\x0a\x96\xc0\x82\xdd\x0c\xe5\xbd\x4a\x49\
-\x25\xc2\xcf\x90\x46\x43\xdc\x22\xd6\xbc\x5b\x5a\x52\x89\xb8\x1a\
-\xe2\x17\x19\xca\x7b\xd9\x92\x52\x84\xde\xf6\xb6\x92\x3e\x41\xa4\
-\xce\x3b\xdf\x82\x8b\x96\x94\x22\xef\x6e\xc8\x58\x4b\x8a\x1d\xb8\
-\x10\xa1\x7b\xef\xcc\x86\x98\xf3\x4e\x5b\x52\xec\xc0\x85\x08\xef\
-\x60\xcb\x63\x48\x64\x24\xef\xc5\x6c\x15\x22\xbe\x86\x8c\x89\x18\
-\x87\x8b\xb7\x04\x75\xaf\xe4\x22\x7c\xb2\x50\xad\x02\xd6\x72\x82\
-\xc2\x6b\xaa\x96\xd0\x94\xe4\xb3\x95\x8b\xf0\x43\x64\x72\x43\xac\
-\x2d\xa1\x22\xd9\x6c\xe5\x22\x3f\xd2\x10\xeb\x53\x2f\x3d\xde\xb3\
-\xd9\xca\x44\xf8\xfd\x62\xb3\x21\xc3\x22\x23\x2d\xb9\x66\x2b\x13\
-\x61\x93\x65\x88\xfa\xb8\x88\xbf\x25\xd9\xbe\x95\x89\xd0\xc9\x6a\
-\x7b\x8c\x8b\xd8\x5a\xc2\xe2\x9e\x7d\xef\xfd\x12\x61\x37\xbe\xad\
-\xfb\xf7\x0d\x2c\x34\x02\x2a\xaf\xa8\x5a\xa2\x87\xe4\x12\xa1\xf7\
-\x59\xe2\xb7\x43\x32\xb0\xce\x08\xc2\x23\x16\xae\x02\x36\x5b\x57\
-\x48\x2e\x11\x1a\x91\xf7\x34\xc4\xd6\x12\x3a\x5b\x67\x48\x2e\x11\
-\xe7\x9e\x15\x23\x22\xe4\x1d\x57\x01\x13\x39\x43\x72\x8a\xd0\x88\
-\x18\xf6\xac\xa9\x2d\xc1\x45\x40\x67\x0b\xe5\x5f\x22\x2c\x22\x86\
-\xd3\x30\xc8\x43\x30\x69\xcf\xd6\x19\x92\x53\xc4\x1b\x91\xa9\x22\
-\xed\xd9\x3a\xef\x52\x4e\x91\x9f\x9d\x2c\x29\x25\xb8\x08\x88\xc8\
-\xf9\x74\xa5\x8b\xa0\x56\x15\x2c\x32\x0c\x4a\x2f\xc1\x35\x40\x0f\
-\x77\xd4\xaf\x8a\xa0\x54\x1d\x2c\x32\x0c\x6d\x49\xf9\xf0\x4e\x43\
-\x82\xfa\x0f\x11\x76\xc7\x68\x8a\x48\x98\x88\xa5\x25\x16\x11\x36\
-\x7f\xef\x15\xa1\xc7\x3b\xae\x01\x26\x82\x6d\xeb\x10\x21\x9b\x96\
-\xe9\x46\x2b\xce\x83\xb7\xa4\xdc\x80\x99\x08\xb6\xad\x43\xc4\xbd\
-\x69\x05\x9a\xa0\xf6\x82\x32\x24\xa8\x2c\xe7\xf8\x4e\xc9\xb0\x08\
-\x96\x88\x00\xb5\x97\xe0\xda\x0e\xd9\xb6\x8e\xef\x2f\xa8\x22\xa8\
-\x55\x07\x6b\x04\x40\xf7\x2d\x5c\xdb\x51\xf6\x5f\x4d\x04\x95\xea\
-\x60\x89\x10\x50\x7b\x01\x2e\xed\x28\x77\x5b\x10\xa1\xb7\x8c\x28\
-\x55\x07\x4b\x84\x80\xda\x0b\x70\x69\x47\x39\x48\x34\x91\x37\x67\
-\x3d\x44\x84\x9c\x87\xb6\xdd\x77\xba\x48\x7b\xff\xdd\x0d\x64\x91\
-\x77\x9f\x87\x09\x76\x24\xb6\x45\xf6\x13\xf1\x10\xb9\xff\x8c\xb7\
-\x1f\x23\x7c\xdb\x2a\x45\x50\x5b\xce\x7f\x45\xa4\x0c\x09\x6a\xcb\
-\xf9\x1b\x45\x58\x48\x9a\x47\x7b\x5b\xe4\xfd\x19\x61\x1d\x19\x17\
-\xf9\x81\xb0\xb7\x45\x48\x99\xff\x15\x91\xf1\x5d\xeb\xff\x22\x7e\
-\x22\x44\xfe\x8a\x5b\x94\x00\x11\xff\xbd\x56\xa4\x89\xef\x64\xdf\
-\x0d\x86\x45\xb0\x42\x08\xa8\xbd\x00\x97\x40\x53\x84\x3e\x8f\xfc\
-\x7d\x22\xed\xbb\xdf\xff\x6d\x11\x94\xda\x00\x6b\x04\xc0\xb2\xde\
-\x14\x09\x7b\x66\xc7\x12\x11\xa0\xf4\x82\xf2\x60\x67\x8f\xba\x16\
-\x91\x37\xcf\x16\x6a\x2f\x28\x37\x2d\x54\x96\x73\x7c\xcf\xea\x10\
-\x49\x2d\xba\x63\x11\xc1\x12\x01\xb4\x27\x8b\x6e\x5a\x95\x08\x3b\
-\xda\xdf\x9c\x76\x94\x5e\x82\x6b\x3b\x34\xeb\xfb\x79\x78\x8a\xfc\
-\x05\xaf\x51\x50\x7a\x09\xae\xed\x28\x6f\x83\x4e\x91\x9f\x4f\x3b\
-\x9d\xac\x76\xd6\x6d\x22\xef\x0c\x09\x4a\x2f\x69\x67\xdd\xf2\x1d\
-\xab\xf7\xa6\x1d\xa5\x97\xe0\x1a\x60\x39\xbe\x7d\x0f\x91\x6d\x5b\
-\xa6\xb4\x63\x91\x51\x50\x79\x05\x2e\xee\xd0\xac\xdf\x44\xe8\x8d\
-\x3c\x6a\x55\xc1\x2a\x83\xd0\x84\x54\x93\x45\x23\x82\x4d\xeb\x12\
-\xa1\xdb\x96\x25\x24\x58\x65\x10\x54\x5e\x81\x8b\x40\xcb\xfa\x25\
-\xf2\xb3\x21\xe1\x7f\xaa\xa6\x6c\x08\x8d\xc8\x91\xf5\x4c\x84\x86\
-\x04\xb5\x6a\x60\x95\x31\x50\x79\x05\x2e\x02\xda\x90\x23\x22\x99\
-\x08\x3d\xdb\xdf\x34\x5b\x28\xbc\x06\x57\x01\xfb\x9d\x3e\x23\x92\
-\x89\xb0\x90\x98\xf6\x2d\xac\x33\x00\xea\xae\x69\x4f\xd6\x15\x91\
-\x4c\x84\x86\xc4\x72\xb8\x63\x1d\x3f\xc2\x1f\x3b\x33\x4c\x56\xf6\
-\x17\x94\x32\x11\xd6\x3a\x4b\xdc\xb1\x90\x1b\xbe\xf3\xd6\xb7\x27\
-\xbc\x21\x67\x44\x72\x11\xfa\x3d\x12\x43\xdc\xb1\x90\x1b\xd4\x7d\
-\x03\x97\x01\x3b\x0d\xb3\xc9\xca\x45\x84\xd9\x6a\xb6\x04\x2b\x79\
-\x41\xd9\x37\xaa\x84\xd0\x79\xc9\xfe\x81\xa7\x5c\x84\xff\xdc\xc9\
-\xb3\x85\xb2\xef\xe0\xfa\x41\x63\xb2\x0a\x91\x9f\x98\x2d\x29\x20\
-\xb5\x07\x8b\x7a\x3e\x59\x85\xc8\x4f\xcc\x16\xca\xbe\x51\x25\x9d\
-\xdd\xc1\xe7\x7b\x56\x25\xc2\x66\x6b\x69\xb7\x04\x6b\x79\xb0\x36\
-\x84\x46\x5d\xfe\x8b\x30\x7c\xb6\x9a\x2d\xc1\x62\x1e\xa4\x23\xa4\
-\x4a\x7a\xfb\xef\xc1\x94\x22\x7c\xb6\x9a\x2d\xc1\x62\x1e\x50\xf7\
-\x0d\x5c\x3e\xa0\x0d\x51\xfe\xb2\x98\xd0\x92\xe6\xa1\x88\xe5\x1c\
-\xa0\xee\x1a\x5c\x3d\xa1\x1e\xd7\x7d\xd6\x4a\x29\xc2\xef\xe5\x27\
-\xb6\x04\x85\x57\xe0\xe2\x09\xdd\xb2\xaa\x7f\x25\xb0\x12\xe1\x47\
-\x49\xab\x25\x58\xcf\x01\xcd\x48\x1d\x10\xa1\x21\x79\xd4\x6f\x22\
-\x42\x4b\x1a\x79\xc7\x7a\x0e\xd8\xae\x75\xf3\xa0\x0d\x29\xa3\x7e\
-\x17\xa1\x2d\x69\x0e\x17\x56\x74\x80\xe2\x73\x70\xe5\x84\x27\xbd\
-\xd8\x7b\x13\xb5\x08\x7d\x2a\x49\xbc\xaf\x25\xb8\x70\x41\x3d\xea\
-\x86\xdc\x44\xba\xff\xc5\xb6\x0d\x2c\xe9\x01\xe5\x9f\xe0\xe3\x0b\
-\x61\xb0\xea\x7f\xbd\xe2\x26\x22\xb4\x44\xbf\x77\xc4\x9a\x2e\x20\
-\x00\xf0\xe1\x85\x70\x84\xd4\x0d\xb9\x8b\x48\x29\xd1\x87\x0b\xab\
-\xba\xc8\x76\xae\xfa\x0e\x2b\xc1\x27\xa4\xda\xb2\x12\x77\x11\xbe\
-\x71\x35\x86\x0b\xab\x3a\x81\xc6\xbd\x1d\xc2\xbd\x09\x69\x08\x13\
-\x11\x7e\xad\x6a\x82\x65\xfd\x7c\xdf\x36\xdd\x0d\x1e\x10\xd2\x10\
-\x26\x22\xb4\x44\xdd\x83\xb1\x6e\x34\x42\x40\x48\x43\xa8\xc8\x87\
-\x30\x5c\x5a\x4c\xb0\x72\x30\x92\xc7\xbd\x21\x54\x44\x6c\x89\x62\
-\x82\x95\x63\xe1\x41\x4f\x75\xa0\xce\x1c\x2a\x22\x9d\x8a\x8a\x09\
-\x96\x0e\x45\x08\x2b\x1b\x2c\x41\x44\xca\xbb\x16\x78\x2c\x1e\x88\
-\xe8\x41\x06\x4b\x12\x91\x86\x4b\x31\xc1\xea\x71\x88\xbf\x99\x6c\
-\xb0\x44\x11\xfa\x84\x95\x58\x44\x13\x2c\x1f\x86\xe8\x41\x07\x4b\
-\x14\x11\x87\x4b\xee\x09\x0a\x08\x42\x5c\x9f\x0f\x96\x2c\x22\xfc\
-\x13\xfe\x6b\x4f\x84\xc4\xa3\x82\x18\xe4\xdf\x47\x3e\x58\x8a\x88\
-\xb4\x73\xad\x5f\x8b\x9a\xa0\x84\x10\x84\x7d\x57\x1e\x2c\x45\x44\
-\x8c\xc9\x6a\xf2\xc9\x54\x50\xc4\x38\x9f\xa2\x47\xf5\xc2\x21\x47\
-\x16\x91\x63\xb2\xbe\x21\x22\x26\x28\x63\x18\xcd\x43\x08\x48\x42\
-\x11\x11\x63\xb2\x9a\x90\xc8\xa3\x8e\x51\xe4\xdf\x3f\x39\x20\x09\
-\x4d\x44\x3c\x4d\x12\x6c\xbc\x50\xc9\x18\x9a\x87\x18\x90\x84\x2a\
-\x22\xc7\x24\x71\x1f\x2f\x94\x32\xc2\x87\x3c\x56\xba\x87\x2e\xa2\
-\x9a\xac\xe3\x55\xa9\xa0\x1a\x3f\xc2\xe3\xc7\x8e\x1c\xf4\x15\x5d\
-\xa4\x61\x52\x27\x05\xe5\x78\xd1\xda\xa1\x06\x7d\xa5\x21\xf2\xe7\
-\xa9\x4d\xd7\x2d\x29\xa8\xc8\xc5\xa7\x92\x8e\x44\xc3\xa3\x29\xd2\
-\x30\x59\xef\x58\x32\x15\xd4\xe4\x61\xbd\x65\x50\x68\x79\xb4\x45\
-\x94\xe3\x64\xa3\x8c\x0a\xaa\xea\x46\x9f\x2a\x83\x87\x41\xa4\x65\
-\x52\xa8\xa0\xae\x4e\x5a\x1a\xcb\xed\x75\xdc\x1d\x83\x48\x6b\xba\
-\x36\x95\x23\x2b\x28\xad\x87\xc6\x50\x25\xda\xfd\xb0\x89\xb4\x4d\
-\xd6\x5a\x92\x83\xc3\x24\x45\xbc\xa5\xb1\x58\x3c\x6c\x22\xfa\xc9\
-\x08\xb6\xb6\x7c\x75\x89\xac\x16\x2d\x8d\xd4\x0f\xf5\xfc\x38\xb0\
-\x89\x18\x4d\x76\x17\x23\x9f\x29\x19\x6d\x8b\xd4\x0f\x93\x87\x55\
-\x24\x3d\x9e\x18\x16\xdd\x64\x9e\x06\x99\xcf\x0f\x53\x2f\x12\xfa\
-\x7d\x49\x86\x55\xc4\x6a\x92\xd8\x64\x44\x9b\xcf\x8f\x4d\xc2\xf8\
-\xc5\x1e\xe5\x37\x0a\x15\xcc\x22\x96\xc8\x5f\xac\xa5\xae\x3a\x49\
-\x08\xac\x3f\x3e\x3e\x37\xf3\x50\xee\xdb\x2b\x3a\x44\x52\x50\x3a\
-\x6a\x48\x6c\x55\xe7\xe0\x73\x2b\xb6\xed\x0a\xf4\x88\x74\x8c\x57\
-\x04\xf6\xb1\x5a\xe9\x12\xe9\x1b\xaf\x41\xb4\xc7\x41\x42\xa7\x48\
-\xf7\x78\x79\xe9\x1a\xab\x95\x5e\x91\x3f\xdf\xcb\x3b\x9a\xd2\x91\
-\x72\xd0\x2d\xf2\x8e\xa6\x3c\x8c\x87\x60\x8e\x43\x64\x4d\xca\x4c\
-\x95\xee\xa9\xda\x70\x89\xcc\x9c\xaf\xf4\x95\xb1\x48\x1f\x3e\x91\
-\x75\xbe\xa6\xa8\x2c\x9e\xa9\xda\xf0\x8a\x4c\x51\x59\x1e\x8b\x53\
-\x63\x44\x64\x53\x89\xcc\x4a\x1a\x2a\xb7\xc6\x98\xc8\x96\x95\x28\
-\x95\x31\x8d\x51\x91\xa4\x12\xb3\x83\xa5\x31\x1d\xd2\x18\x17\x49\
-\xbc\x46\xdb\x92\x2c\x3c\x1b\x6e\x49\x80\x48\x6a\xcb\x40\x5a\xd2\
-\xef\xc2\xb8\x45\x22\x44\x24\x91\x46\xac\x5f\x26\x6d\xb6\x8f\xd7\
-\xe0\x48\x1d\x44\x89\x24\xbe\x5f\x3d\x32\xab\xc4\x68\x2e\x72\x02\
-\x45\x56\x76\x99\x87\xfa\x0c\xb5\xac\x0e\x11\xb1\x28\x08\x16\xd9\
-\xf8\x7e\xed\x3a\x89\xed\xb9\x70\xb5\x5a\x7f\xf0\xd8\x0c\x92\x42\
-\xd4\x38\xe5\xcc\x10\x01\xc9\xe7\xf5\x4a\xcf\xe9\xc9\x22\xfd\xf7\
-\xb1\xfe\xdf\x0c\x03\x30\x51\xe4\x9d\xfc\xf9\xf3\x2f\x0f\xdd\xef\
-\x34\x4e\xad\x42\x30\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x1a\xde\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x5a\x00\x00\x00\x73\x08\x06\x00\x00\x00\x18\x0b\x15\xfc\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x00\x18\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\
-\x72\x65\x00\x70\x61\x69\x6e\x74\x2e\x6e\x65\x74\x20\x34\x2e\x30\
-\x2e\x39\x6c\x33\x7e\x4e\x00\x00\x1a\x4f\x49\x44\x41\x54\x78\x5e\
-\xed\x9d\x79\x7c\x53\xd7\x95\xc7\xcd\x62\x8c\x31\xe0\x1d\xd9\x96\
-\x6d\x59\xd8\xb2\x24\xdb\x5a\xac\xcd\x0b\xde\xf1\x8e\x31\xd8\x60\
-\x30\x10\x16\x63\xf6\x2d\x64\x9f\x6c\x4d\x9a\xd0\x4c\x56\xa6\x5b\
-\x9a\x49\x33\x69\xda\x66\xba\x4c\x33\x5b\xfa\xe9\x74\x25\x4d\x48\
-\xb3\x27\x25\x5b\x49\x02\x36\xc6\x10\x96\xb0\x04\x70\x02\x09\x90\
-\xa4\xbf\x39\xe7\x3e\x3d\x5b\x12\x37\x34\x13\x4b\x26\x1d\xfb\x8f\
-\xef\xe7\x3d\x1d\x49\xef\xdd\xfb\x7d\xe7\x9d\x77\xef\xb3\x24\x87\
-\x01\x18\x61\x08\x90\x06\x47\x08\x3e\xd2\xe0\x08\xc1\x47\x1a\x1c\
-\x21\xf8\x48\x83\x23\x04\x1f\x69\x70\x84\xe0\x23\x0d\x7e\xd5\xe8\
-\x5c\xbd\x1e\xab\xd6\x6d\x44\xc7\xca\x35\x62\xb9\xb4\x73\x95\xb2\
-\x5c\xbe\x06\x6b\x37\x5e\x49\x2f\x91\xbf\xef\xab\x84\x34\x78\xa9\
-\xf1\x14\x96\x20\x62\xfc\x44\x4c\x98\x18\x83\xd8\xf8\x44\xc4\x25\
-\x4c\x41\xa2\x26\x09\x53\x92\x92\x05\xbc\xce\xc4\x27\x6a\x88\x64\
-\x7a\x8d\x06\xe3\x23\x27\x89\xf7\xd8\x1d\x1e\x6c\xd8\x74\x39\x6d\
-\x46\xbe\xed\x4b\x85\x34\x78\xa9\xd0\xea\xa6\x22\x26\x2e\x1e\x59\
-\xd9\x46\x38\x5c\x6e\x78\x3c\x1e\x3f\x0a\x0a\x0a\x2e\xc0\xe5\x29\
-\x14\xb8\x0b\x8a\xc4\x32\xdb\x94\x43\xdb\x98\x82\xd4\x34\xfd\x57\
-\x4a\xb8\x34\x38\xd4\xcc\x6d\x5f\x84\xa8\xe8\x38\x98\xf3\x2c\x42\
-\x56\xa0\x60\x55\xa6\x0c\x8f\xdb\x1f\x97\x8b\xde\x43\x4b\x8b\xc5\
-\x86\xc9\x31\xb1\xa8\x69\x68\xa2\x5d\xc8\xf7\x3b\x94\x48\x83\x43\
-\xc9\xf4\xba\x46\x24\x6b\xd3\xfa\x33\x52\x95\x5b\xe0\x76\x7d\x29\
-\xd1\xe2\xf5\x2e\x97\x17\x0f\xd2\x33\xf4\x70\x17\x95\xd0\xae\xe4\
-\xfb\x1f\x2a\xa4\xc1\xa1\xa2\xb5\x6d\x11\x74\xfa\x4c\x3f\x39\xaa\
-\xdc\x41\xe3\x15\xef\x74\x7b\xa0\x37\x98\x50\x5d\x37\x93\x76\x29\
-\x6f\xc7\x50\x20\x0d\x0e\x15\x69\xe9\x53\x45\xd6\xb1\x18\x51\x6f\
-\xfb\x45\xbb\x50\xe0\xb1\xa3\xd8\x6d\x46\xb9\x5b\x87\x2a\xb7\x06\
-\xb5\xae\x78\xd4\xb9\x62\x89\x68\x2f\xb1\x22\xc6\xcf\xf1\x6b\xf8\
-\xb5\x05\x1e\x07\x0a\x3d\x6e\xef\xb6\x14\xd9\x6a\xe6\xa7\xe9\x0d\
-\x97\xb4\x66\x4b\x83\x43\x81\x29\xc7\xda\x7f\xaa\x0b\xd1\x94\x79\
-\x8c\x92\x8d\x56\x14\x7b\x0c\xa8\xf2\xc4\x62\x69\x65\x18\xee\x5f\
-\x1f\x8f\xdf\x7c\x43\x87\xe7\xb6\x66\xe1\xa5\xad\x99\x02\x5e\xff\
-\xcd\x37\xf4\x78\x60\x43\x02\x96\x55\x8d\x22\xe9\xb1\x28\x71\x1b\
-\x51\xe4\x76\x28\xdb\x52\x0f\x1c\xed\xa3\xc0\x53\x24\x32\x3b\xd3\
-\x90\x7d\xc9\x64\x4b\x83\xa1\x66\xdd\xfa\x2b\x60\xb7\x51\xd6\xba\
-\x06\x44\x2b\xb2\x5d\x24\xca\x42\x19\x9a\x86\x96\x69\x13\xf1\xe3\
-\xaf\x39\xf1\xee\x63\xd3\x71\xfc\x27\xb9\xe8\xfb\x61\x2a\x3e\x78\
-\x28\x0e\xa7\x1f\x8c\xc6\x99\xef\xc7\x88\xf5\x13\x0f\x27\xe3\xfd\
-\x9f\x5a\x71\xe8\xb1\x7a\xfc\xfc\x96\x22\xcc\x2d\x99\x84\x4a\x7a\
-\x6f\x89\xc7\x26\xb6\x25\x46\x26\xb4\x0f\x75\x3f\x56\xbb\x03\x3c\
-\x26\x0f\x6c\xcf\x50\x20\x0d\x86\x9a\xb2\x8a\x5a\xbf\x6c\x56\x51\
-\x25\x2f\xa9\x99\x84\x1d\xdf\x77\xe3\xe4\xbf\x1a\xd1\xf7\xc0\x14\
-\x9c\xbe\x37\x0a\x67\xee\x08\xc7\xd9\x2d\xe1\x38\x7f\xdb\x58\xc1\
-\x47\xb7\x8d\xc1\x47\xff\x38\x1e\x67\xee\x9d\x8c\xd3\xdf\x4d\x41\
-\xdf\x8f\x4c\xf8\xcb\x43\x85\xe8\xac\x8f\x46\xb9\x47\x2b\xb6\xc5\
-\xe5\xa3\x90\xb2\x59\x88\xf6\x96\x11\x4f\x71\xe9\x25\xc9\x6a\x69\
-\x30\xd4\x98\x73\x6d\x70\x3a\x95\x5a\xaa\x4a\x76\x15\xb8\x28\x13\
-\x33\x31\xb7\x34\x02\x7f\xfe\x97\x6a\xf4\x3d\x92\x41\x82\xc3\x70\
-\x6e\x4b\x18\xce\xde\x18\x86\xf3\xd7\x85\xe1\xd3\xab\xc3\xf0\xc9\
-\x55\x61\xf8\xec\x9a\x51\xf8\xeb\xb5\x4a\xec\xdc\xf5\xb4\xbc\x8d\
-\x5e\x73\xdf\x68\xf4\x3d\xac\xc3\xeb\x3f\xa8\x42\x7b\xf9\x78\x92\
-\x6d\x20\xc9\x4a\x46\x8b\x83\xea\x15\xcd\xfb\x1e\x36\xa2\x5d\x9e\
-\x62\xa5\x76\xf2\xa9\x5d\xc0\xc2\xdd\x70\xb9\xed\xa8\xf1\x24\xe0\
-\x57\xb7\x9b\x70\xf2\x47\x06\x12\x37\x09\x1f\xdf\x4c\x12\xaf\x21\
-\xc1\x57\x92\xe0\x2b\x88\x4d\x61\xf8\xeb\x15\x24\x99\xd9\x3c\x06\
-\x9f\xd2\x52\xc8\x67\xe9\x37\x8d\xc2\xc7\x77\x47\xe1\xe4\x23\x59\
-\xf8\xfd\x5d\x79\xa8\x73\x27\x28\xe5\xa3\xbf\xee\x2b\xb2\x79\x18\
-\x39\x8c\x44\x73\x76\x0d\x94\x0c\x1e\x2d\x14\x79\xcc\xe8\xa8\xd3\
-\xe0\xf8\xcf\x8b\xf0\xf1\x77\x22\x70\xfe\x16\xce\x5c\x16\x4b\x6f\
-\xd9\x4c\x62\x37\x8d\xc6\x67\x1b\x95\xa5\xc2\x58\x25\x76\x39\xad\
-\x93\xf0\xcf\x28\xd3\xcf\x7f\x6d\x34\xce\x7c\x33\x1c\xc7\x7e\xe6\
-\xc1\xda\x26\x2d\x4a\x69\x9b\xbc\xed\x40\xd1\x6b\x37\x6e\xa6\x66\
-\xc8\xdb\x16\x2a\xa4\xc1\x50\x13\x28\xba\xc8\x95\x47\x17\xb1\x64\
-\x3c\x70\x65\x3e\x9d\xfe\x39\x38\x7b\x87\x52\x16\x3e\xdb\x4c\xa2\
-\x2f\x27\xfa\xe5\x5e\x08\xcb\x17\xd0\x6b\xf9\x3d\x67\xef\x0c\xc3\
-\x89\x87\x8c\x78\xf8\x5a\x07\x8d\x5a\xe2\xc5\xb0\xcf\x4f\x74\x61\
-\xc1\xf0\xca\x68\xee\xb0\x92\xcd\x45\x94\x79\xb9\xa8\xf7\x4c\xc4\
-\xb6\xfb\xaa\xd0\x77\x7f\x06\x3e\xb9\x55\xa9\xc7\xfd\x12\x7d\x32\
-\x79\x20\x36\xa6\x9f\x4f\xd7\x53\x09\xd9\xa0\xd4\xef\xb3\x5f\x0b\
-\xc3\xa9\xef\xe8\xf0\xec\xfd\xd3\xd1\xe0\x0e\xa7\x21\x9f\xc1\x4f\
-\x34\x1f\xe0\x35\xeb\x36\x50\x33\xe4\x6d\x0b\x15\xd2\x60\xa8\x51\
-\x33\x59\x15\x50\x46\x32\x9a\x5c\x63\xf0\xf2\x03\x74\x11\xfc\x66\
-\x2a\xce\x73\x6d\xa6\x4c\x66\x81\x81\x42\x3f\xa1\x25\xf3\xd9\xa6\
-\x71\xb4\x0c\xc7\x67\x1b\x08\xef\xf3\x9f\x50\x56\x9f\xa3\x0b\x67\
-\xdf\x56\x2d\xde\x7c\xa8\x06\xb3\x9c\x61\x28\x77\x65\x0e\xd4\x69\
-\x2f\xc3\x26\xa3\x7d\x3b\xcd\x43\xb0\x32\x77\x26\x9a\x5d\x61\x78\
-\xed\x81\x2a\x9c\xba\x37\x05\xe7\x6f\x60\xd1\x94\xa5\x5e\xd1\x22\
-\x63\x7d\x38\x47\x72\x4f\x6f\x8a\x42\xdf\x86\xc9\x82\x0f\x36\x4d\
-\x12\x9c\xdc\x1c\x85\x53\xd7\x47\xe1\xe8\x3d\x06\xec\xfc\xc1\x2c\
-\x34\x3b\xe4\xa2\xd7\x6f\xdc\x44\xcd\x90\xb7\x2d\x54\x48\x83\xa1\
-\xc6\xb7\xd3\x3c\x7b\xf3\x15\xdd\x77\x77\xb2\x32\x6c\xdb\x48\xa5\
-\x60\xdd\x68\x7c\xba\xd6\x1f\x8e\x7d\xb8\x61\x02\x0e\x5f\x91\x8a\
-\x9e\x2b\x33\x05\x7b\xaf\xca\xa6\xa5\x01\x3d\x57\x67\x61\xcf\x4d\
-\x59\xe8\xba\xaf\x18\xaf\xfc\x60\x09\x1a\x9d\x51\x28\x73\x19\xfd\
-\x44\xf3\xfe\x86\x65\x46\x33\xaa\xe8\x57\xbf\x57\x85\x13\x77\x26\
-\xe3\x1c\x0d\xd7\xce\x72\xcd\x15\xa2\xc7\x0a\xfe\xba\x86\x97\x8a\
-\xec\x13\x1b\xe3\xf0\x68\xcd\x18\x6c\xad\x9a\x88\x7b\xaa\x26\xe1\
-\x2e\x41\xb4\x58\xde\x5d\x3f\x19\x5b\x66\x25\xe1\x9a\xb6\x5c\x54\
-\xe5\x6b\x50\xe2\xca\x1d\x11\xad\xc2\xa2\x67\x39\x47\x61\xc7\xb7\
-\x2b\x70\xea\x0e\x2d\xce\xd1\xb0\x8e\x45\x9f\x5f\x4b\x35\x79\x0d\
-\xd5\xde\x00\x0e\x6e\x4a\xc3\x66\xe7\x78\x34\xdb\x92\xd1\x60\x4b\
-\x45\xbd\x2d\x7d\x00\x87\x0e\xd3\xf3\xd3\x51\xee\x34\x8a\xa9\x78\
-\x11\x89\x1d\xa9\xd1\x5e\xb8\x8e\xb6\x38\x46\xe1\xb5\x6f\x51\x8d\
-\x66\xd1\x57\x8d\xc2\xd9\x75\x24\x7b\x0d\x65\xb5\x2a\x78\x75\xb8\
-\x80\x33\xbb\x77\x53\x06\x56\x15\x68\x48\xa6\x99\x86\x6f\x16\x71\
-\x23\x69\x00\xbb\x58\xf2\x5d\x3c\x31\x33\x24\xc9\x81\x19\xbd\x6e\
-\xc3\x46\x6a\x86\xbc\x6d\xa1\x42\x1a\x0c\x35\xbe\x92\xf9\x96\xa8\
-\x9f\xe8\x2d\x5a\x9c\xa5\x99\xe0\xc7\x24\xf9\xe3\x55\x24\x7c\xf5\
-\x68\xc1\xf9\x55\x0a\x2c\x7b\xff\xc6\x0c\xac\x77\xc7\xa2\xc6\x99\
-\x89\x2a\x87\x01\x95\x94\xbd\x9c\xc1\x2a\x65\x2e\xb3\x18\x9b\x17\
-\xba\xac\x24\xd9\x3f\xa3\x79\x36\x3a\x2c\x2f\x86\x81\xa2\x4f\xde\
-\x9e\x82\x73\x34\x1b\xfc\x68\x35\x5d\x10\x57\xd2\x08\xe3\x02\xc6\
-\xe0\xf0\x3a\x0d\xbe\x55\x39\x11\x57\x97\x6a\x70\x4d\x85\x16\x57\
-\x57\xa4\x09\xae\xac\x24\xaa\x53\xb1\xa9\xde\x80\x55\xb3\x1c\x28\
-\x77\xeb\x51\xec\xb2\x5f\x20\x7a\x98\x66\xf4\x40\xe9\x78\x75\x6b\
-\x05\xfa\x6e\x4b\x25\xd1\xa3\x29\x9b\xa9\x46\xaf\x18\x45\x8c\xb9\
-\x80\xd3\xab\x22\x71\x64\xad\x06\xfb\xd7\xeb\xfa\xd9\xb7\x41\x87\
-\xbd\x1b\xd3\xd0\x7b\xad\x0e\x3d\x77\x14\xe0\xc5\xef\xb5\x63\xa6\
-\x6b\xc2\xc8\xa8\xc3\x17\x5f\xd1\xa7\xbe\xae\x15\x63\xe8\xb3\x2b\
-\x28\xa3\x3b\x47\xe3\xdc\xf2\xb1\x82\x4f\x04\xf4\x98\x63\x3e\x28\
-\x71\x7a\x0d\xad\x8b\xf7\xd0\xac\xf1\xc4\xad\x49\xd8\xf9\xed\x2a\
-\xb4\xd2\x38\xba\x92\xca\x8b\xaf\x68\x66\x98\x96\x0e\x7f\xd1\x27\
-\x6e\xa1\xd2\x41\xb2\x3e\xea\xa4\x8b\xe1\x72\xa2\x83\x04\x76\x8c\
-\xc5\xf9\x65\x54\xa3\x09\xe5\xf1\x00\x7e\xf1\x15\xa3\xf1\xd1\xfa\
-\x30\xb1\x8d\x8b\x89\x1e\xc9\xe8\xad\x55\x78\xff\x6b\x74\x31\xa4\
-\xa1\xdd\x19\x92\xfc\xf1\xb2\x51\xc4\x18\xc1\xb9\xa5\x0c\x3f\xf6\
-\x87\x63\x7e\xa2\xd7\x8d\xa2\x6d\x24\x7f\xae\xe8\x61\x7b\x31\xe4\
-\x8e\xab\xa2\x5f\xbe\xbb\x4c\x88\x66\x59\x22\xa3\x29\x93\x85\xe8\
-\xa5\xe1\x5e\xd1\x8a\x74\x5f\x7c\xe3\x67\x3a\xe8\x7d\xf4\xde\xe3\
-\x37\xa7\xe0\x8d\xad\x95\x23\x19\xed\xdb\x69\x45\xb4\x81\x44\x8f\
-\xc1\x4b\x77\x95\xe3\xf8\x4d\xa9\x38\x43\xb3\x3f\x96\xc6\x82\x3f\
-\x5a\x32\x56\xf0\xf1\x62\x62\x09\x65\xec\x52\x7f\x44\x9c\xe0\xf5\
-\xd3\xcb\xe8\x4c\xa0\xf7\x1e\xbb\x29\x19\xaf\xdd\x57\x85\x16\xfb\
-\x48\x8d\xf6\xeb\xb8\x2a\xfa\xc5\x3b\xcb\x70\xec\x46\x2d\x4e\xaf\
-\x19\x85\xd3\x2c\x52\x48\x1e\x27\xe8\x17\xea\x15\xef\x77\x00\xbc\
-\x71\x7e\x0f\xbf\x97\xb7\xf1\xc6\xd6\xe9\x68\xcd\x1f\x35\x92\xd1\
-\x2a\x3c\xdc\x52\x4a\x87\x2a\x3a\x0d\xa7\x57\xd3\x10\x4e\x88\x1e\
-\x87\x33\x8b\xc3\x05\x1f\x5d\xc6\x50\x79\xa0\xf5\x53\x4b\x22\x71\
-\xa8\x23\x1e\xfb\x3a\x35\xd8\xb7\x3c\x59\xd0\xdb\x99\x8c\x9e\x15\
-\x1a\xf4\x6c\x48\xc2\xae\x9b\xad\x78\xfe\x9f\x5a\xd1\x94\x3f\x5e\
-\x4c\x60\x02\x6b\xf4\xb0\x11\xcd\x9d\x1d\x90\xad\x88\x6e\xcd\x1f\
-\x83\x17\xb6\x94\xe1\xe8\x75\xa9\x38\xbd\x72\x2c\x3e\x5c\x42\x52\
-\x17\x8d\xc5\x99\x85\x24\x9b\xf8\x90\xd6\x15\xc6\x91\xe4\x44\xfc\
-\xc7\xec\x64\x3c\x34\x27\x0b\xdf\x6f\x31\xe0\x9f\x5b\x8d\x84\x01\
-\xdf\x9b\x43\xb4\x65\xe1\xfe\x0e\x37\xee\x5d\xdf\x80\x3a\xa7\x0e\
-\x25\x2e\xcb\xf0\xcd\xe8\x0b\x45\x1b\xd0\x6a\x0f\x27\xd1\x15\x38\
-\x7e\x6d\xba\x10\x7d\x66\x31\x89\x26\xc1\xa7\x17\x84\x0b\x3e\x58\
-\x38\x40\x6f\x27\xcd\x00\xed\xe3\xd0\x6a\x49\xc4\x2c\xab\x46\xdc\
-\x5c\x52\x99\x65\x4f\xc1\x8c\xfc\x54\x9a\x9e\x1b\x50\xe1\xca\xa5\
-\x99\xa1\xf2\x81\x1a\x5f\xd1\xc3\xa6\x46\xfb\x8b\x56\x6a\x74\xab\
-\x3d\x02\x2f\xdc\x5e\x85\x63\xd7\xa4\xe1\xc3\x4e\x25\x7b\x15\xc9\
-\x11\x02\x55\xf2\x87\xed\x63\xb1\xbb\x43\x87\x35\x8e\x38\x71\x9f\
-\x83\x6f\x2c\xf1\xad\x50\xa6\xcc\x39\x40\xa9\x3b\x1f\x25\x6e\xa7\
-\xf4\xee\xdd\xb0\x17\xfd\xd2\x6d\x55\x38\x72\x15\x65\x74\x87\x2a\
-\x95\x4a\x46\x00\xa7\xe7\x8f\x43\xf7\x92\x74\x6c\xb0\x45\xa3\x31\
-\x5f\x8f\x6a\x87\x72\x63\xa9\xca\x61\x14\x54\xe7\x1b\x30\x9d\xe5\
-\x3b\x72\x48\x74\xfe\xf0\xbe\x4d\xea\x2b\x9a\x25\x54\xd2\x69\x3e\
-\xd7\x16\x81\x67\x6f\x2e\xc7\xd1\x2b\x74\xf8\x70\xa9\x57\xec\x3c\
-\xca\x6c\x5f\xda\x28\x46\xf4\x2e\x4c\xc4\xad\x39\x61\x58\x61\x0c\
-\x47\x87\x29\x12\x4b\xcd\x51\x04\x2f\x23\xb1\x38\x27\x12\xf3\xf3\
-\x26\x61\x86\x6d\x0a\x2a\x1d\x19\xd2\x9b\x4a\xc3\x58\xb4\x91\x44\
-\x47\x0a\xd1\x47\x36\xa7\xa3\x6f\x09\x65\x34\x89\xfd\x60\x2e\x2d\
-\x25\x1c\x6e\x8f\xc6\x6b\x4b\xb3\xf0\x6c\xa7\x1d\x7f\x5a\x6e\xc7\
-\xf6\xe5\x0e\x6c\xa7\xf5\x27\x89\x67\xd6\xb9\xf0\xf4\x3f\x54\xe3\
-\xd7\x77\x2d\x45\x83\x3d\x41\x94\x91\x91\x8c\x66\xd1\xae\x42\x3f\
-\xd1\xef\x6d\x4a\xc7\xa9\xc5\xe3\x70\xaa\x2d\x1c\x7d\xad\xe3\x48\
-\x2c\xd5\x67\xe2\xf4\x1c\x95\x70\x9c\x6c\x8b\xc4\xe1\xb6\x18\xec\
-\x9f\x9f\x80\x03\xed\x1a\xc1\xfe\x05\x1a\x91\xe9\xef\x2e\x4f\x44\
-\xd7\x15\x46\x3c\xb7\x65\x06\x95\xa3\x48\xb1\xed\x11\xd1\x12\xd1\
-\x87\x36\xa6\xa1\x6f\x11\xc9\x9c\x3b\x16\xa7\x5a\x22\x48\xf6\x78\
-\xc1\x07\x2d\x04\x89\x67\xd9\xbc\xec\x9b\x4d\xd9\xcd\x07\x82\xe3\
-\x5e\xf8\xc0\x9c\x5c\x38\x16\x87\xd7\xa7\xe0\x95\x5b\x2b\x31\xdf\
-\x1a\x2e\xea\xf7\xb0\x15\xed\xdb\x69\x86\x27\x15\x6d\xf6\x09\x78\
-\xe6\xa6\x32\x1c\x58\xaf\xc5\x09\x1a\x59\x9c\x6a\xa1\x89\xc9\x2c\
-\xca\x6c\x92\x2d\x84\xcf\x56\xa1\x4c\x17\xf8\xc6\x22\xf0\xe1\x2c\
-\xe5\xb9\x0f\x16\x46\xe0\xd0\xba\x34\xbc\x7c\x53\x05\x89\x8e\x18\
-\x11\xed\x0b\x8b\xe6\x8c\x7e\xe6\x06\xca\x68\x92\xa4\x88\x26\xc1\
-\xb3\xc6\xe3\xc4\xec\x71\x02\x5e\x17\xe2\x3f\x87\x0f\x9a\x95\x65\
-\x5f\xfb\x78\x1c\x5a\x9d\x8e\x97\x6e\xac\xc4\xbc\xbc\xf1\x62\x24\
-\x12\x28\x7a\xf8\xfe\x85\xc5\x2b\xfa\xe9\xeb\x4a\x70\x70\x4d\x2a\
-\x4e\xce\x0b\x17\x72\x4f\xce\x8c\xc0\xc9\x66\x2a\x23\x3e\x9c\x9a\
-\xa9\xd0\x1f\xe3\xd7\xa8\xf0\xf3\x54\xcf\x0f\xae\x48\xc5\x2b\xd7\
-\x4f\x47\x7b\xae\x5c\xf4\xb0\xcc\x68\xbe\xd7\xc1\x35\xba\xcd\x1a\
-\x89\xed\x57\x17\xe3\xe0\x2a\xca\xe8\xb9\xe3\xf0\x7e\x73\x04\x4e\
-\x34\x05\x88\x24\x4e\x31\x4d\x91\xb4\x1e\x49\xaf\x21\x66\x46\x29\
-\xf0\x3a\xc1\x17\xca\x03\x2b\x28\xa3\x6f\x18\x11\xed\x27\xba\xb0\
-\x50\xb9\x18\xb6\x59\xa3\x48\x74\x09\xde\xed\xa4\x8c\x9e\x33\x5e\
-\x88\x3c\x39\x83\x4a\x47\x93\xc2\xc9\x19\x13\xfa\x39\x41\x1c\x61\
-\x66\x4e\xee\xe7\x58\x13\x2f\x27\xe2\xf8\x9c\xc9\xd8\xd7\x99\x81\
-\x67\xaf\xab\x42\xbb\x75\xe2\x88\x68\x15\x1e\x81\xa8\xa2\x9f\xbe\
-\xb2\x14\xef\x76\x50\x46\xb7\x72\x36\x93\xe0\x86\x40\x48\x32\x2d\
-\x0f\x35\xc5\x60\xc7\x8c\x24\x3c\xdd\x94\x26\x78\x6a\xe6\xc0\xf2\
-\x99\xb9\x7a\x6c\x5b\x62\xc5\xbf\x6d\x6e\x44\xb3\x3d\x91\xca\xd2\
-\x85\xe3\xe8\x61\x7b\x3f\x9a\x45\xf3\x6c\x6e\xfb\xe6\x32\xec\x5f\
-\x96\x8a\x13\x74\xe1\x7b\xbf\x91\xa8\xa7\x72\x40\x9c\xac\xa3\xb2\
-\x41\xbc\x5f\x4f\x07\x80\x64\xef\x9c\x95\x82\xeb\x69\x36\xb8\x20\
-\x47\x83\xb6\x1c\x2d\xe6\xe6\x0e\xd0\x9a\xa7\x45\xb3\x55\x87\x3a\
-\xca\x64\x9e\x86\xab\xdf\xd2\xf2\xdd\xdf\xb0\xae\xd1\x2c\xfa\xc9\
-\xcb\x4b\xb1\x6f\x49\x9a\xa8\xcf\xc7\x1a\x22\x70\xbc\x8e\x64\xd7\
-\xfa\x73\xac\x36\x02\xaf\xb5\xea\xb1\xc2\x9e\x46\xb3\x3e\x7b\xff\
-\xbd\x0c\xe5\x83\x32\xde\xfb\x1a\x14\x53\xbf\x67\xa8\x3c\x37\xb0\
-\x3f\x66\x98\xfe\xcd\xd0\xad\x94\x0e\xcb\x24\x3c\xb1\xa1\x04\xbd\
-\x8b\xd3\x71\x7c\xe6\x78\x21\xf9\x78\x75\xe4\x05\x1c\x9b\x3e\x1e\
-\xaf\x35\xeb\xd1\x69\x4b\x45\x49\xbe\x55\x88\x16\xdb\xe9\x17\xea\
-\xff\x78\x20\x3e\xc0\x30\xad\xd1\x03\xa2\xb7\xad\x9f\x86\xde\x45\
-\x69\x38\x46\x17\xc1\x63\x35\x8a\xd4\x63\xd3\x27\x78\xe1\x75\x45\
-\xfe\xce\x19\x29\xb8\x36\x27\x9a\xce\x82\x54\xb4\xe6\xea\xd0\x92\
-\xa7\xa7\x25\xc3\xeb\x69\x68\xa2\xd2\x51\x6d\xcb\x46\xb9\xc3\x82\
-\x62\x6f\xc6\xfb\xee\x93\xc7\xd1\x24\x3b\x5c\xd6\xb6\x50\x21\x0d\
-\x86\x1a\xdf\x4e\x33\x6a\xe9\xd8\xb6\xb6\x18\xbd\x0b\x75\x54\x9f\
-\x49\xac\x10\x4d\xcb\xaa\x89\x0a\xfd\xc2\x27\x60\x5f\x7d\x3c\x9e\
-\xa8\x48\xc0\xe3\x95\xa9\x78\x7c\xba\x0e\x8f\x57\xe9\xf1\xcb\x4a\
-\xbd\x58\xff\x65\x6d\x1a\x1e\x6b\x35\xe3\xc1\x25\x15\x98\x4d\x59\
-\xcf\xb2\x65\x19\x4d\x4c\x91\xb5\x2d\x54\x48\x83\xa1\xc6\xb7\xd3\
-\xa2\x46\x3b\xcc\x24\x3a\x9a\x44\x97\x60\xef\xfc\x54\x1c\xad\x1f\
-\x8f\xa3\x55\x91\x38\x52\xc1\x44\x79\x51\x1e\xbf\x57\x4e\xa3\x8e\
-\xca\x28\xec\xad\x8e\x46\x77\x4d\x1c\x91\x80\x9e\x6a\x95\x38\xec\
-\x9d\x11\x87\xb7\x16\x66\xe1\xf7\xeb\x2b\xd1\x6e\x89\x43\x55\xbe\
-\x79\xa4\x74\x30\x2c\x81\x65\x2c\xc8\x8d\xc6\x13\xab\xa7\x91\x68\
-\xaa\xd1\xb5\x13\x70\x94\x64\x1e\x2d\xff\x7c\x0e\x57\x4c\x22\xe1\
-\x03\x28\x8f\x29\x5e\x3f\x11\x5d\xf3\x75\x78\x6a\x5d\x19\x16\xe5\
-\xc6\x5c\x20\x7a\xd8\x7e\xf6\xce\x57\xf4\xb6\x95\x94\xd1\x73\x29\
-\xa3\xab\xc7\x8b\xcc\x7d\xaf\x94\xb2\xb8\x8c\x26\x26\x5e\x8e\x95\
-\x5e\x88\xef\x73\x47\xca\x94\xda\xce\xdb\x78\x7a\x75\x29\x2e\x33\
-\x47\xa3\x5a\x92\xd1\xc3\x73\xd4\xe1\x15\xbd\x30\x27\x16\x7f\x58\
-\x5e\x84\xbd\x73\xd2\x49\xf4\x04\x12\x4d\x94\x44\xf5\x73\x74\x5a\
-\x14\x8e\xf9\xc0\x8f\x03\xe1\x03\xc3\x25\x67\x6f\x4b\x1a\xb6\xaf\
-\x2a\x91\x8a\x56\xff\xc2\x42\xc4\xc8\xda\x16\x2a\xa4\xc1\x50\x13\
-\x28\x7a\x3a\xcd\xde\x58\xf4\xef\x97\x15\x0b\x49\x5c\x36\x58\xda\
-\xe1\x69\x13\x04\xef\x15\x2b\x1c\x2d\x1a\xe0\xbd\xe2\x89\x5e\x06\
-\x9e\x67\xb8\x8e\xf7\xcc\x4e\xc7\xd3\x2b\x4a\xb1\xc8\x34\x59\x9a\
-\xd1\xc3\xa2\x74\xcc\x5f\xd0\x4e\x9d\xe5\xb1\x2e\x0d\xbb\x68\x68\
-\xc7\x1d\x57\x44\xc7\xe3\x0f\x24\xba\x67\xa6\x4e\xd4\xe0\x43\xc5\
-\x11\x38\x5c\x44\xb2\x05\x54\x7b\xff\x06\x47\x0a\x79\x49\x19\x5d\
-\x36\x49\x6c\xe3\xa9\xce\x12\x2c\xa6\x8c\xe6\x7b\x1d\xea\xd8\x5a\
-\xa5\xad\x6d\x3e\x35\x45\xde\xbe\x50\x21\x0d\x86\x8a\xd2\xca\x6a\
-\x64\x65\xf3\x37\x59\x15\xd1\xaa\x00\xa5\x74\xc4\xe3\x77\x8b\x59\
-\xb4\x5e\xc8\xfa\xa2\x92\x59\xb0\x2f\x47\xa7\x4d\xc2\x9e\xc6\x74\
-\x3c\xb5\xb4\x88\x44\x4f\xea\x17\xad\x7e\x25\x9a\xbf\xd7\x62\x36\
-\x9b\x51\x34\x6d\x68\x7f\x67\x49\x1a\x0c\x05\xd5\xb5\x8d\xca\xef\
-\x27\xf1\x57\x85\x45\xa7\xd5\x8c\xa6\xe1\x9d\xdd\x44\xf5\x34\x1e\
-\xbf\x5e\xe0\x41\x57\x43\x1a\xd5\xe4\x49\x38\xe8\x89\xc4\xa1\x02\
-\x2a\x07\x1e\x2a\x0f\x17\xe1\x88\x5b\xa1\x3f\x46\xe5\x64\x77\xad\
-\x16\x7f\x5c\x54\x88\x65\xe6\x18\x2a\x1d\xfe\xa2\xb9\x8c\x30\x59\
-\x59\xd9\x28\x29\xab\xa2\xa6\xc9\xdb\x1b\x6c\xa4\xc1\x60\xb3\x68\
-\xe9\x72\xf1\x6b\x5d\x42\xb0\xf7\x3b\xd9\xbc\xce\x37\x7c\xf8\x23\
-\x5b\x4d\x79\x19\x58\x6f\x98\x80\xed\x73\x6c\xd8\x53\x97\x8a\xc3\
-\xc5\x93\x71\xc0\x1d\x89\x83\x6e\xca\xec\xbf\xc1\x7b\xae\x01\x0e\
-\xbb\xa9\xb6\x17\x4d\xa6\x31\x76\x32\x5e\x6c\xb3\x61\x73\x56\x24\
-\x66\x59\xd4\x8f\x85\x29\x67\x0f\x0f\xef\x84\x6c\x57\x21\x32\x33\
-\x0d\x68\x5b\xb0\x98\x9a\x28\x6f\x77\x30\x91\x06\x83\xcd\x14\x6d\
-\xaa\xf8\x92\x3d\x5f\xf1\xf9\x67\x1c\x54\xd1\x7c\x53\xa8\xd1\x96\
-\x89\x8d\x56\x2d\x7e\xdb\x60\xa2\x6c\xd6\x61\x7f\x59\x3c\x0e\xb8\
-\xa2\xf0\xae\x73\x02\x31\x11\x07\x9d\x94\xdd\x7f\x83\xc3\x0e\x85\
-\x83\xf4\xbe\xf7\x3c\x74\x90\xa6\xc5\xa1\xa7\x3e\x0d\x7f\xac\x37\
-\x62\xb3\x2d\x45\xec\xa3\x84\xf6\x25\xfe\x28\xec\x73\xa0\xf9\xcb\
-\xff\xfc\x43\x84\x81\xed\x0d\x05\xd2\x60\x30\xc9\xc8\x32\xf6\xff\
-\x92\x81\xd2\x39\x3e\x75\x5d\xe2\x86\xd0\x2c\xab\x01\xd7\x14\x64\
-\x62\x5b\x7b\x31\x76\xcd\xc8\xc2\xfe\x92\x38\x1c\x2a\x8c\xf5\x93\
-\x78\xc0\x31\xf1\x0b\x71\x28\x5f\x41\x88\x2f\x8c\xa6\x51\x0b\xcd\
-\x1a\x1b\xa7\x62\xfb\xc2\x52\xdc\x50\x9c\x25\xf6\x55\xc1\xdf\x43\
-\xa4\x8c\x66\xd1\xdc\x0e\x85\x42\x2a\x69\x06\x6a\xaa\xbc\xfd\xc1\
-\x42\x1a\x0c\x16\x75\x33\x5a\xc4\x0f\x46\xa9\x92\x39\xa3\xf8\xd4\
-\xe5\x4c\x6e\xb6\xe8\x71\x53\xd1\x54\xbc\xd0\x96\x8f\xae\xba\x74\
-\xec\x2f\x4d\xc4\xc1\x82\x18\x21\xea\x50\xfe\xe4\x2f\xcc\x01\x87\
-\x8a\x22\xfc\xa0\x3d\x4a\xd9\x86\x27\x06\xfb\xa7\x25\x60\x77\x8d\
-\x0e\xaf\xcc\x73\xe3\xeb\x25\xd9\xa2\x8c\xf0\xbe\xd5\xf6\xa8\x6d\
-\xb2\xe5\x3b\x51\x58\x52\x49\x4d\x96\xf7\x23\x18\x48\x83\xc1\x22\
-\x23\xd3\x2c\x32\xa6\xbf\x63\x24\x99\xef\xa6\x35\xd8\x28\x93\x5d\
-\x34\x32\x98\xe7\xc1\xee\xea\x54\x1c\x2a\xa2\xec\x75\x47\xe3\x5d\
-\x3b\x65\xb0\x95\x84\x09\x48\x9e\x40\x7d\x2c\x67\xbf\x2d\x00\x4b\
-\x94\x88\x8b\x6d\x71\xa6\x17\xf1\x3d\x11\x1d\xfe\x34\xaf\x00\x37\
-\xb8\x75\x68\xa4\xcc\x56\x3e\x61\xaa\xd4\x6c\x01\x65\xb8\x3e\xd3\
-\x48\x4d\x96\xf7\x23\x18\x48\x83\xc1\xa0\xac\xa2\x9a\x24\x2b\xbf\
-\x9d\xa4\xc2\x92\xab\xf2\x2d\xe8\xc8\x23\xc9\x2d\x2e\x74\xd5\x4e\
-\xc5\xbe\xc2\x04\x91\x91\x2c\x66\xbf\x85\x45\xab\x82\x07\x0f\x8b\
-\xe7\x6d\xf3\x3e\xba\xa7\xa7\xe3\xf9\x39\x1e\xac\xb6\xa5\xa1\xd6\
-\x99\x27\x64\x8b\x0b\x23\x5d\x14\xf9\x8f\x04\x9c\x10\x8e\x82\x42\
-\x6a\xba\xbc\x3f\x83\x45\x1a\x0c\x06\x66\x93\xc5\x4f\x32\x53\xee\
-\xb0\xa3\x2d\x4f\x8f\x47\x1a\x3c\xd8\x59\x6b\xa4\x52\x11\x87\x03\
-\xf9\x31\x8a\x14\x92\x1c\x2a\x58\xf6\xe1\x82\x58\xbc\x5d\x3d\x15\
-\x8f\x36\xe6\x63\x7e\x8e\x16\x95\x74\xc0\x45\xe9\x50\x7f\x45\x8c\
-\xd6\x4d\x39\x79\xd4\x74\x79\x7f\x06\x8b\x34\x38\x58\xda\xe6\x5d\
-\x26\x1a\xcf\x19\xd3\x2f\x9a\x3a\xd2\x60\x33\xe2\x76\x97\x0e\x2f\
-\x36\xe7\xa3\xbb\x34\x95\xb2\x38\x5a\x91\x61\xa6\x53\x3d\x97\xb2\
-\x30\x8f\xca\x07\x2d\x83\x09\x6f\x9b\xf7\x71\xc8\x1e\x83\x3d\xc5\
-\x49\xd8\xd1\x64\xc3\x3d\x9e\x0c\x2a\x21\x34\xbe\xf6\xb6\x8b\xeb\
-\xb4\x3a\x22\x6a\x6c\x6e\xa1\x2e\xc8\xfb\x35\x18\xa4\xc1\xc1\xc2\
-\x3f\x87\xc9\xa7\xa2\x2a\x9a\xc7\xad\x7c\xaa\xb6\xe5\xe8\xf0\xeb\
-\x06\x2b\x76\x95\xa5\x63\xaf\x33\x01\xfb\x54\x11\x66\x92\x92\x13\
-\x23\xe0\xf5\xe0\xc3\xf5\x3c\x06\xfb\x1c\x34\x12\x29\x4d\xc7\xb6\
-\x7a\x1b\xda\x73\xf4\x34\xe4\x53\x7e\x05\x41\xb4\x93\x6b\x35\x61\
-\x34\xe7\x52\x17\xe4\xfd\x1a\x0c\xd2\xe0\x60\x71\x38\x95\x1f\xd0\
-\x16\x8d\x27\xd1\xd3\x1c\x0e\xd4\xda\xcd\xb8\xda\x9d\x8d\x1d\x75\
-\x56\xec\x77\x6b\xb0\xcf\x12\x2b\x24\xf4\x9a\x26\xa1\xd7\x18\x1d\
-\x52\xf6\x66\x2b\xb2\x7b\xf3\xe8\x80\xba\x34\x78\xb5\xd6\x8a\x9b\
-\x8b\x72\xc5\x19\x56\xea\x72\xf6\x4b\x66\xf8\x07\xc2\x03\xfb\x13\
-\x0c\xa4\xc1\xc1\xb0\x64\xd9\x0a\x21\x99\xc7\xce\x62\xda\x4b\xa2\
-\x2b\xec\x56\xcc\xc9\xcb\xc4\x43\x35\x6e\xfc\xa5\x2c\x13\x07\x6d\
-\x5e\xc9\x12\x29\xc1\x27\x56\x88\xe6\x03\xca\xb2\x0f\x5a\x62\xb0\
-\xb3\x3c\x0b\x8f\x54\x3b\xc5\x19\xa6\xd6\x6a\x15\x2e\x1f\x73\xe6\
-\x2f\xa4\xae\xc8\xfb\xf7\x65\x91\x06\x07\x03\xdf\xd3\x60\xd1\x4e\
-\x1a\x3e\xa9\xf7\x17\xaa\xed\xb9\x58\x69\x4c\xc1\x6f\x9b\x8b\xb0\
-\xb3\x30\x1d\x07\x72\x63\xbd\x02\xe8\x74\x36\x0c\x15\x94\xd5\xc6\
-\x49\xa2\x3c\xbd\x53\xa8\xc3\xb6\xe6\x42\xac\x35\xa7\x28\xb7\x51\
-\xbd\x77\x11\x85\x68\x4a\x90\xd2\xca\xe0\xdf\x03\x91\x06\x07\x83\
-\x93\xae\xe2\xfc\x13\xc2\xaa\x64\xa6\xc1\x6a\xc6\x2d\xf6\xa9\x78\
-\xa6\xc6\x8e\xdd\x4e\x2d\x75\x36\x0e\x7b\x0d\x71\x24\x3b\x9e\x04\
-\xc4\x05\x08\x09\x0d\xfb\xb3\x78\xc9\xb2\xa3\x45\x1b\x9e\xaf\xb6\
-\xe2\x1b\xf9\x53\xd1\x48\x25\x4d\xbd\x8b\xc8\x70\xbd\xb6\x39\x5d\
-\xd4\x15\x79\xff\xbe\x2c\xd2\xe0\x60\xe8\xaf\xcd\x5e\xf8\x42\xd8\
-\x9c\x67\xc4\xfd\x9e\x6c\xfc\xb9\x2c\x07\xdd\xd6\x64\xd1\xf1\x9e\
-\x2c\xca\x68\x43\x02\x7a\x33\x29\xbb\x43\xc8\x3e\x2f\xe2\x71\x56\
-\xb4\xd8\xf7\xee\x5c\x0d\x5e\x2f\x31\xe1\x21\xb7\x01\xb3\x72\xf9\
-\xee\xde\x40\x7b\x19\x4e\x94\xc0\x7e\x0d\x16\x69\x70\x30\xc8\x44\
-\xcf\x36\x67\xe3\xc7\x05\x66\xbc\x59\x64\x44\x4f\x6e\x92\xe8\xf8\
-\xde\xa9\x71\x24\x3b\x9e\x96\x31\x21\xa5\x57\x4f\x67\x0e\xc1\xfb\
-\x13\x8f\x69\xdf\xdd\xe6\x44\xbc\xe5\xce\xc0\x2f\x0a\x4d\x68\xcd\
-\xb9\xf0\x83\xea\x7c\x5d\x09\xec\xd7\x60\x91\x06\x07\x43\xa0\x68\
-\xa6\x25\xd7\x80\xc7\xe8\x2a\xff\x96\x7b\x2a\xf6\x98\x12\xb1\x37\
-\x83\xa6\xc5\x19\x34\xae\xd5\xc7\x0e\x39\xbd\x99\xf1\xe8\x36\x26\
-\xe0\x6d\x9a\x21\x3e\x5e\x98\x83\xb9\x66\x7f\xd1\x62\xb6\xe8\x29\
-\xa2\xae\xc8\xfb\xf7\x65\x91\x06\x07\x43\xa0\x68\x6e\xf8\x1c\x8b\
-\x09\xff\x59\x9c\x87\x5d\x4e\x12\x6d\xd4\x90\x68\xca\xaa\xa1\x16\
-\x9d\x41\x67\x8f\x80\xce\x26\x6a\xc3\x1e\xbb\x0e\xbf\xa1\x83\x1f\
-\x28\x5a\xf0\xf7\x98\xd1\x7c\x51\xe4\x8c\x66\xd1\x6f\xd9\xf4\xe8\
-\xce\x4e\x12\x1d\xee\x49\xa7\xd2\x31\xc4\xec\x25\xde\xd5\xd3\x19\
-\x65\x98\x82\xdd\xd6\x34\xfc\x4f\x61\x9e\x54\x34\xdf\xfb\x08\xec\
-\xd7\x60\x91\x06\x07\x83\x4c\x34\x5f\x70\x7e\xea\x32\xe3\x8d\xfc\
-\x4c\x74\x65\x25\x53\xa7\x13\xb0\x27\x2d\xce\x07\xca\xee\x10\xd3\
-\x93\xaa\xc0\xb2\xf7\x64\x69\xf0\x0e\x8d\x82\xfe\xcb\x73\x61\xe9\
-\x10\xfc\xbd\x66\x34\x8f\x3a\x1e\xb4\x67\xe3\x55\x97\x09\xbb\x0c\
-\x5a\xec\x4d\x9b\x82\x3d\xa9\x24\x9b\xf1\x13\x1e\x3a\x7a\x52\x07\
-\xe8\xca\xd2\xe2\x0d\xbb\x01\x8f\xda\x8d\x74\x31\xf4\xff\x46\x80\
-\xfa\x57\x98\xc0\x7e\x0d\x16\x69\x70\x30\x04\x8a\xe6\x89\x4b\xa3\
-\xc5\x8c\x7b\x68\xba\xfb\x6c\x81\x15\x6f\x67\xa5\x52\x67\x49\x70\
-\x4a\x3c\xba\xb4\x44\x6a\xec\x90\xb0\x47\x4b\xd0\x3e\xf9\x20\xef\
-\xca\x4a\xc3\x0b\xce\x1c\x7c\xd7\x6a\xa4\xb3\xed\xc2\xcf\x7d\x70\
-\x1f\x02\xfb\x35\x58\xa4\xc1\xc1\xd0\xd4\x3c\x5b\x99\xac\x50\x56\
-\xa8\xd4\x59\x2d\xb8\x3c\x2b\x03\xbf\x2d\xf1\xe0\x4d\xa3\x0e\xbd\
-\xda\x38\x74\x27\x53\x66\x25\xc5\x62\x77\x4a\xdc\x45\xe1\xd7\x5d\
-\x0c\xd9\x7b\x7c\x11\x07\xd3\x0b\xbf\x9e\x0f\xf2\xce\x6c\x1d\x9e\
-\x2c\x76\xe0\x06\xa3\x9e\x92\xc0\xff\xab\x17\x9c\xd1\x55\xd5\xb5\
-\xd4\x15\x79\xff\xbe\x2c\xd2\xe0\x60\x09\x14\x3d\x3d\x3f\x1f\x8b\
-\x8d\x74\xaa\x4e\x73\xe3\xf5\x9c\xa9\xd8\x47\x9d\xe5\x4e\xb3\xe8\
-\x5d\xc9\x17\x87\x5f\x73\x31\x64\xef\x91\xd1\x9d\xcc\xfb\xa4\x09\
-\x92\x36\x01\xaf\x9b\xf4\xf8\x05\x1d\xf4\xe5\x99\x3a\xd4\xda\xfc\
-\x3f\xd6\xcb\xa3\xa4\x50\x7c\x0f\x51\x1a\x1c\x2c\x6a\xf9\xe0\x46\
-\xb3\x74\xbe\x43\x36\x23\xd7\x84\x2d\x4e\x2b\x76\xd0\x74\x7c\x7f\
-\x1a\x0d\xaf\xb8\x74\x08\x59\xbc\x0c\x1d\xbb\x92\x95\x65\x4f\x12\
-\x8d\x3a\x68\x9f\x07\x52\x35\xf8\x73\x9e\x09\x77\x3a\x2d\xe2\x22\
-\x5d\x9e\xef\xfd\x4f\x44\x3e\xb2\x03\xfb\x13\x0c\xa4\xc1\xc1\xc2\
-\x77\xc0\x84\x64\x82\x1b\xce\x7f\x79\xe6\x3b\x78\x2b\x4d\xd9\xd8\
-\xee\x76\xa0\x4b\x9f\x4e\xa7\x72\xa2\x10\xb0\x5b\x43\xa7\x78\x08\
-\x79\x7b\x0a\x95\x27\x5a\x76\x6b\xb8\x74\x24\x60\x77\x86\x16\xdb\
-\x1d\x56\xac\xa1\xd1\x06\x9f\x69\xea\x37\x02\x54\xd1\x9c\x18\x81\
-\xfd\x09\x06\xd2\xe0\x60\x59\xdc\xb1\x52\x34\x98\xef\x8a\xf1\x1f\
-\x41\x59\x34\x77\xa8\xd5\x6c\xc6\xc3\x54\xaf\x5f\xc9\xcb\xc3\x3b\
-\xe9\x5a\xd1\xf9\x2e\x4d\x22\x76\x4f\x21\x01\x21\x42\xdd\x3e\xef\
-\xeb\x2d\x6d\x12\x5e\xa6\x29\xf7\x0f\x6d\x79\x62\xb4\x51\xec\xe6\
-\xf6\x79\x33\x99\x85\x53\x7d\x6e\x9d\x3b\x8f\xba\x20\xef\xd7\x60\
-\x90\x06\x83\x01\x8f\x36\xc4\xc7\xbe\x68\xa9\x76\xa6\xce\x6a\xc7\
-\xa6\xcc\x4c\xfc\xb7\xdb\x89\x57\x33\x69\x96\x98\xa2\x11\x12\xde\
-\x49\x8c\x0f\x29\x42\x74\xf2\x14\xbc\x9e\xa5\xc7\xaf\xe8\x8c\xda\
-\x4c\x17\xe6\x3a\x5b\xae\x72\xd1\x56\x61\xd1\x21\x98\x7a\xab\x48\
-\x83\xc1\xa0\xba\xae\xd6\xef\x3e\x2f\xc3\x7f\x3a\x6a\xa2\xa1\xde\
-\xcd\x96\x1c\x3c\x67\xc9\xc3\x6e\x6d\x32\x65\x9c\x06\x5d\x89\x34\
-\x53\x4b\xa0\xcc\x93\xf0\x4e\xe2\xc5\x91\xbd\xc7\x97\x6e\xca\x68\
-\x66\x8f\x56\x8b\xe7\xf2\xcc\xb8\x8d\xce\x28\xae\xcd\xfc\xf9\x0e\
-\xfe\xb7\x51\x6a\x89\xe3\x64\xa8\xa8\x08\xdd\x67\xf1\xa4\xc1\x60\
-\xa1\xd6\x68\x15\xf1\x09\x25\x92\xdd\x66\xa2\xd3\xd7\x6a\xc5\x0b\
-\x66\x13\xde\x4c\xd1\x0a\x61\xbb\xe2\x13\x3e\x97\xb7\x2f\x82\xec\
-\xf5\xbe\xf0\x41\x7c\x4b\x9b\x82\x97\x8d\x26\x3c\x4a\x07\x77\xa1\
-\x49\x91\xac\xfc\xc7\x21\xa5\x7d\x6a\x3b\x03\xdb\x1f\x4c\xa4\xc1\
-\x60\x31\xbb\x75\x1e\x75\x82\x04\xbb\x94\xff\x8b\xa5\xc8\xf6\xa0\
-\x86\x2e\x42\x1d\x26\x33\x1e\x74\x3a\xf1\x92\x29\x87\x32\x5b\x8b\
-\x1e\x4d\x12\xba\xe3\x69\x94\x10\x28\x2b\x8e\x26\x18\x3e\x04\x66\
-\xac\x28\x0d\x09\xca\xfb\x76\xc7\x51\x19\x8a\xa5\x8b\x20\x67\x32\
-\x6d\x8b\x25\x73\x26\xbf\x64\x32\xe1\x11\x92\xd9\x91\x9d\x2d\xc6\
-\xf4\xca\x97\x40\x15\xb9\x6a\x59\x6b\x98\x11\xda\xff\xe0\x29\x0d\
-\x06\x93\x02\xcf\x34\xe5\xb3\x13\xde\xcc\x61\x4a\x5c\x05\xa8\xb6\
-\x39\xb0\x8c\xb2\xec\x91\xdc\x3c\x3c\x6f\xce\xc1\x9b\x3a\x3d\x76\
-\x69\x92\x15\xb9\x24\x8b\x85\x31\xbb\x62\xe8\xb1\x97\x77\x62\x03\
-\xa1\xe7\xd5\x03\xc2\xeb\x44\x77\xbc\x72\x00\x76\x25\x69\xf0\x97\
-\xb4\x34\x3c\x4f\x19\xfc\x13\x92\xdb\x69\x34\xd2\x98\xd9\x4e\x67\
-\xd4\xc0\x35\x43\x88\x0e\xd1\x94\x3b\x10\x69\x30\xd8\xa8\xd9\xcc\
-\x17\x1f\x16\xcd\x1f\x06\x67\xd9\xdc\xf1\x45\x46\x33\xee\xb3\xe5\
-\xe3\xc9\x3c\x3b\xc9\xce\x44\xd7\x14\x2d\xf6\xc4\xd1\x45\x32\xd6\
-\x9b\xc5\x24\xb8\x2b\x3a\x50\x36\x95\x03\x7a\x4e\x15\xce\x82\x39\
-\x9b\x19\x16\xdd\x45\x07\x6c\x67\xba\x1e\x4f\xd3\x41\xdc\x4a\x25\
-\x6a\x09\x65\x34\x67\x72\xa9\xcb\x4d\xd9\xac\x64\x71\xbf\xec\x21\
-\x90\xcc\x48\x83\xc1\x66\xfe\xfc\x05\x42\xb2\x3a\x12\x51\x3b\x58\
-\xec\x2e\x40\x25\x4d\x18\xda\x28\xeb\xb6\x64\x19\xf1\xcb\x5c\x3b\
-\x9e\x35\x98\xb1\x23\x6d\x2a\xde\x48\x4e\xc5\xce\xc4\x64\x21\xbc\
-\xdb\x87\x5d\x31\x0a\x2c\x9b\x25\xf3\xf3\xcc\xdb\x89\x1a\xbc\x41\
-\x82\x77\xa4\x67\xe0\xb9\x6c\x13\x7e\x67\xb5\xe1\x6e\x83\x11\xf3\
-\xa8\x5c\xf0\x3e\x78\x78\x29\x32\xd8\x2b\x59\x15\x3d\xab\xa5\x95\
-\x9a\x28\x6f\x77\x30\x91\x06\x43\x41\x7d\x7d\xa3\x38\x4d\xd5\x8f\
-\x21\x88\x2f\xc5\x53\xe7\x59\x40\x65\xbe\x1d\x4d\x79\xb9\xa2\x6e\
-\xdf\x61\xb1\xe3\x31\x87\x0b\xdb\x73\x2c\x78\x2d\x23\x93\x46\x0c\
-\xa9\xd8\x9f\x90\x82\x7d\xf1\xc9\xe8\x8d\x4b\x12\xf0\x7a\x4f\x7c\
-\x92\xc8\x7c\xb1\x4e\xaf\xe1\xd2\xf3\x27\xca\xdc\x7f\xcf\x77\xe1\
-\x2e\x92\xdc\x41\xb2\x9b\x73\x73\xfb\x25\xfb\x0a\x56\x24\xbb\x50\
-\x55\xf5\xff\xec\x13\xff\x2a\xd3\x6b\xea\x14\xc9\xde\x8c\x66\x06\
-\x3a\xee\x11\xd3\xe1\x16\x92\xb5\xd6\x60\x10\xd9\xf8\x33\xba\x50\
-\x3e\x61\xb2\xe0\xb9\x2c\x33\x5e\xc8\x34\xe3\xa5\xa9\x66\xbc\xac\
-\x37\xe3\xc5\x8c\x2c\x3c\xcf\x4c\x35\x50\xf6\xe6\xe0\x8f\x66\x2b\
-\x7e\x41\x07\x69\xab\x21\x1b\xeb\xf4\x99\x98\x4b\xeb\x2c\x98\x0f\
-\xa4\x38\x7b\x08\x3f\xc9\x14\xaf\xa8\xa8\xa0\x26\xc9\xdb\x19\x0a\
-\xa4\xc1\x50\xd2\xd8\xd4\x2c\x32\x5b\xfd\x99\x07\x81\x57\x04\x67\
-\x1e\x4f\xd5\xf9\x46\xcf\x4c\x8b\x05\x6d\x39\xb9\xe2\x82\xb9\x81\
-\x84\xdf\x90\x67\xc3\xed\x56\x17\xee\xcc\x73\x50\xc6\xe6\x63\x0b\
-\x3d\x7f\x23\x9d\x05\x1b\x72\xf2\xb0\x38\xdb\x8c\xb9\x94\xc1\x2d\
-\x16\xab\x98\x14\x55\x50\xed\x2f\xa5\x6d\xf2\xb5\x40\x15\xdd\x2f\
-\x9c\x2e\xcc\x7c\x76\x05\xb6\x2b\xd4\x48\x83\xa1\x66\xf1\xd2\x65\
-\x94\xd5\x5e\xc9\x3e\xa2\x79\xc8\xa5\xfc\x5f\x6f\x65\xa2\xc3\x8f\
-\xf9\x33\x7b\x9c\x9d\x0d\x54\x52\x9a\xa9\x86\xb7\x98\x2d\x94\xf5\
-\x39\xe2\x3e\x72\x23\x1d\x10\xb5\x34\xa8\x52\xd5\xac\x95\x49\xe6\
-\x7d\xb5\xb7\x2f\xa2\x26\xc8\xdb\x15\x4a\xa4\xc1\xa1\x82\x6f\x3e\
-\xf5\x8f\xaf\xbd\x4b\xfe\x8d\x25\x55\x0c\xc7\xd4\xfb\x24\x65\x54\
-\xb7\xcb\xa9\xfe\x32\x2c\x97\xcb\x4c\x99\x43\x91\x1c\x38\x92\x50\
-\xce\x18\xe5\xce\x21\xa3\x5c\x17\x86\x66\x74\xf1\x79\x48\x83\x43\
-\x49\xfb\xc2\xcb\x44\x19\xe1\xfb\x0c\xaa\x6c\x75\xa6\x26\xa4\x79\
-\x05\x7e\x61\xbc\xdb\x10\xdb\xf1\x12\xaa\x1b\x45\xff\x17\xa4\xc1\
-\x4b\xc1\x9c\xd6\xf9\x03\xa5\x84\x60\x61\xbe\xd2\x3e\x17\x9f\xf7\
-\x08\x7c\x9e\x9b\x3d\x7b\x36\x6d\x5a\xbe\xbf\xa1\x46\x1a\xbc\xd4\
-\x94\x96\x94\x8b\x0c\xf7\x95\xf6\xb9\x04\x88\x2e\x2e\x1e\xda\x6f\
-\xc4\x7e\x51\xa4\xc1\xaf\x12\x2b\x57\xae\x44\x4d\x4d\x8d\x5c\x32\
-\xc1\x63\xe1\x15\x2b\x56\xd0\x4b\xe5\xef\xff\xaa\x20\x0d\x8e\x10\
-\x7c\xa4\xc1\x11\x82\x8f\x34\x38\x42\xf0\x91\x06\x47\x08\x3e\xd2\
-\xe0\x08\xc1\x47\x1a\x1c\x21\xf8\x48\x83\x23\x04\x1f\x69\x70\x84\
-\xe0\x23\x0d\x8e\x10\x6c\x10\xf6\xbf\xff\x8c\x04\x37\xa5\xfa\x9d\
-\xe5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x70\xfc\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x06\
-\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\xa7\x93\x00\x00\
-\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\
-\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\xe2\x0b\x02\x08\
-\x1a\x10\xe9\x08\x52\xb4\x00\x00\x6f\xeb\x49\x44\x41\x54\x78\xda\
-\xed\xdd\x77\xbc\x14\xd5\xdd\x06\xf0\xe7\xcc\xee\xad\x94\xcb\xa5\
-\x4a\x11\xe1\xa2\xa2\x02\x4a\x53\x24\xa0\xa2\x62\x6c\x51\x8c\x1a\
-\x8d\xbd\xc4\x57\x8d\x92\x62\x8a\x49\x34\x31\xbc\x31\xcd\xf4\xa8\
-\x89\x26\xfa\x1a\xa3\x44\xa3\xb1\xa0\xc6\xbe\xea\x15\xb0\x23\x58\
-\x40\x45\x11\x90\x2a\xf5\x16\x2e\xb7\xef\x9c\xf7\x8f\xdd\xbd\xcc\
-\xce\xce\xee\x94\x6d\x67\x66\x9f\xf3\xf9\xf8\x91\xbb\x3b\xf3\xbd\
-\xf3\x9b\xbb\x33\xcf\x99\xd9\x99\x33\x00\x1b\x1b\x1b\x1b\x1b\x1b\
-\x5b\xc9\x35\x91\x0b\x64\xf6\xec\x59\x3d\x4e\x24\x52\x2f\xe9\xd1\
-\xa3\x47\x8f\x1e\x3d\x7a\x6a\x7b\xe1\x5c\xfd\xe2\x5c\x34\x7a\xf4\
-\xe8\xd1\xa3\x47\x8f\x5e\x61\x3c\xcf\x40\xfc\x97\x1b\xe7\x97\xd9\
-\xf4\x66\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\x85\xf3\x3c\x9d\x01\x98\
-\x3d\x7b\x96\x66\x7e\x2d\xcb\x62\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\
-\x05\xf4\x5c\x9f\x01\x88\xff\x72\x73\xcf\x43\xcf\xb2\x18\x7a\xf4\
-\xe8\xd1\xa3\x47\x8f\x5e\x01\x3d\x57\x67\x00\x66\xcf\x9e\x15\x32\
-\xbf\x96\x65\x31\xf4\xe8\xd1\xa3\x47\x8f\x1e\xbd\x02\x7b\x80\xc3\
-\x0e\x40\xfc\xfb\x86\x94\x9e\x07\x00\x4f\xbf\x9c\x1e\x3d\x7a\xf4\
-\xe8\xd1\xa3\x57\x78\xcf\x60\xda\x77\x00\xe2\x13\x86\x2c\xde\xd2\
-\xbd\x7c\xef\x40\x8f\x1e\x3d\x7a\xf4\xe8\xd1\x2b\xbc\x67\x30\x01\
-\xd8\x5c\x03\x60\xf8\xe5\xe6\x9e\x47\x34\xcb\x62\xe8\xd1\xa3\x47\
-\x8f\x1e\x3d\x7a\x05\xf2\xe2\xa6\x66\x70\x6c\xcf\x00\x68\x16\xaf\
-\x65\x53\x4c\x98\x1e\x3d\x7a\xf4\xe8\xd1\xa3\x57\x38\x2f\x6e\x26\
-\xe5\x79\x24\x52\x2f\xc3\x19\x26\x36\xf7\x3c\x00\xa0\x3b\xc7\xc5\
-\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\xf2\xeb\x25\x1d\xf9\x27\x5a\x38\
-\xcd\x0c\xe6\x23\xff\x6c\x4f\x63\xa8\xbe\x72\xe8\xd1\xa3\x47\x8f\
-\x1e\xbd\x20\x7a\x29\x79\x9e\xb0\x34\x8b\x19\xcc\x57\x1b\x02\x0c\
-\x7f\x7a\xf4\xe8\xd1\xa3\x47\xcf\x6f\x5e\xca\x99\x7c\xa3\x15\xb6\
-\x98\xc1\xd8\x24\xb2\xbb\x7a\x51\xf5\x95\x43\x8f\x1e\x3d\x7a\xf4\
-\xe8\x05\xd1\x33\xdf\x3d\x90\x32\x68\x90\x66\x9a\xc1\xdc\x01\x60\
-\xf8\xd3\xa3\x47\x8f\x1e\x3d\x7a\xfe\xf3\xcc\x47\xfe\x29\xe3\x06\
-\xa4\xbb\x08\xd0\xf3\xf0\x82\x3e\x5a\x39\xf4\xe8\xd1\xa3\x47\x8f\
-\x5e\xd0\x3d\x19\x89\xd4\x47\xad\xa6\xd7\x0c\x33\xf5\x34\x86\x3f\
-\x3d\x7a\xf4\xe8\xd1\xa3\x17\x08\x2f\x6d\x9e\x5b\xf5\x14\xb2\x19\
-\x5d\xc8\x8f\x2b\x87\x1e\x3d\x7a\xf4\xe8\xd1\x0b\x9a\x67\x7b\xf7\
-\x5e\xca\xc0\x00\x6e\x7f\xb1\x8f\x57\x0e\x3d\x7a\xf4\xe8\xd1\xa3\
-\x17\x54\xcf\xf6\xee\x3d\x81\x2c\x9b\x8f\x57\x0e\x3d\x7a\xf4\xe8\
-\xd1\xa3\x57\xb2\x5e\x56\x1d\x00\xd5\x8a\xa1\x47\x8f\x1e\x3d\x7a\
-\xf4\xe8\x39\xf3\x3c\x77\x00\x54\x2c\x86\x1e\x3d\x7a\xf4\xe8\xd1\
-\xa3\xe7\xac\x79\xea\x00\xa8\x5a\x0c\x3d\x7a\xf4\xe8\xd1\xa3\x47\
-\xcf\x59\x73\xdd\x01\x50\xb9\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\x9e\
-\xb3\xe6\xaa\x03\xa0\x7a\x31\xf4\xe8\xd1\xa3\x47\x8f\x1e\x3d\x67\
-\xcd\x71\x07\x40\xf5\x62\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\xce\x9b\
-\xa3\x0e\x80\xea\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x5c\x99\xa9\
-\x8f\x03\x4e\x33\x61\xc8\xe2\x2d\x25\x8a\xa1\x47\x8f\x1e\x3d\x7a\
-\xf4\xe8\xb9\x32\x01\xd8\x9c\x01\x30\x84\xbf\x79\x3a\x25\x8a\xa1\
-\x47\x8f\x1e\x3d\x7a\xf4\xe8\x39\x36\x13\x07\xfd\x12\xb0\x3f\x03\
-\x60\xf5\xbe\x12\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x1c\x9b\x29\
-\x43\xff\x87\x33\x4c\xcc\x23\x7f\x7a\xf4\xe8\xd1\xa3\x47\xcf\xff\
-\x5e\xd2\x91\x7f\xa2\x85\xd3\xcc\x60\x3e\xf2\x97\x70\xf0\x60\x01\
-\x1f\xaf\x1c\x7a\xf4\xe8\xd1\xa3\x47\x2f\x88\x5e\x4a\x9e\x27\x2c\
-\xcd\x62\x06\x0d\xa9\x47\xfe\x0c\x7f\x7a\xf4\xe8\xd1\xa3\x47\xcf\
-\x5f\x5e\xca\x99\x7c\xa3\x15\xb6\x98\xc1\xd8\x24\x00\x5d\xa1\x62\
-\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\xf6\x9e\xf9\xee\x3d\x19\x89\xd4\
-\xeb\xc6\x17\x34\xd3\x0c\xe6\x0e\x00\xc3\x9f\x1e\x3d\x7a\xf4\xe8\
-\xd1\xf3\x9f\x67\x3e\xf2\xd7\xcd\xd3\xa6\xbb\x08\x50\x5a\x4d\x1c\
-\xb0\x95\x43\x8f\x1e\x3d\x7a\xf4\xe8\x05\xdd\x93\x91\x48\x7d\xd4\
-\x6a\x7a\xcd\x30\x53\x4f\x63\xf8\xd3\xa3\x47\x8f\x1e\x3d\x7a\x81\
-\xf0\xd2\xe6\xb9\x55\x4f\x21\x9b\xd1\x85\xfc\xb8\x72\xe8\xd1\xa3\
-\x47\x8f\x1e\xbd\xa0\x79\xb6\x77\xef\xa5\x0c\x0c\xe0\xf6\x17\xfb\
-\x78\xe5\xd0\xa3\x47\x8f\x1e\x3d\x7a\x41\xf5\x6c\xef\xde\x13\xc8\
-\xb2\xf9\x78\xe5\xd0\xa3\x47\x8f\x1e\x3d\x7a\x25\xeb\x65\xd5\x01\
-\x50\xad\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\x9e\x33\xcf\x73\x07\x40\
-\xc5\x62\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\xce\x9a\xa7\x0e\x80\xaa\
-\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x9c\x35\xd7\x1d\x00\x95\x8b\
-\xa1\x47\x8f\x1e\x3d\x7a\xf4\xe8\x39\x6b\xae\x3a\x00\xaa\x17\x43\
-\x8f\x1e\x3d\x7a\xf4\xe8\xd1\x73\xd6\x1c\x77\x00\x54\x2f\x86\x1e\
-\x3d\x7a\xf4\xe8\xd1\xa3\xe7\xbc\x39\xea\x00\xa8\x5e\x0c\x3d\x7a\
-\xf4\xe8\xd1\xa3\x47\xcf\x95\x99\xfa\x38\xe0\x34\x13\x86\x2c\xde\
-\x52\xa2\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\x9e\x2b\x13\x80\xcd\x19\
-\x00\x43\xf8\x9b\xa7\x53\xa2\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\x9e\
-\x63\x33\x71\xd0\x2f\x01\xfb\x33\x00\x56\xef\x2b\x51\x0c\x3d\x7a\
-\xf4\xe8\xd1\xa3\x47\xcf\xb1\x99\x32\xf4\x7f\x38\xc3\xc4\x3c\xf2\
-\xa7\x47\x8f\x1e\x3d\x7a\xf4\xfc\xef\x25\x1d\xf9\x27\x5a\x38\xcd\
-\x0c\xe6\x23\x7f\x09\x07\x0f\x16\xf0\xf1\xca\xa1\x47\x8f\x1e\x3d\
-\x7a\xf4\x82\xe8\xa5\xe4\x79\xc2\xd2\x2c\x66\xd0\x90\x7a\xe4\xcf\
-\xf0\xa7\x47\x8f\x1e\x3d\x7a\xf4\xfc\xe5\xa5\x9c\xc9\x37\x5a\x61\
-\x8b\x19\x8c\x4d\x02\xd0\x15\x2a\x86\x1e\x3d\x7a\xf4\xe8\xd1\xa3\
-\x67\xef\x99\xef\xde\x93\x91\x48\xbd\x6e\x7c\x41\x33\xcd\x60\xee\
-\x00\x30\xfc\xe9\xd1\xa3\x47\x8f\x1e\x3d\xff\x79\xe6\x23\x7f\xdd\
-\x3c\x6d\xba\x8b\x00\xa5\xd5\xc4\x01\x5b\x39\xf4\xe8\xd1\xa3\x47\
-\x8f\x5e\xd0\x3d\x19\x89\xd4\x47\xad\xa6\xd7\x0c\x33\xf5\x34\x86\
-\x3f\x3d\x7a\xf4\xe8\xd1\xa3\x17\x08\x2f\x6d\x9e\x5b\xf5\x14\xb2\
-\x19\x5d\xc8\x8f\x2b\x87\x1e\x3d\x7a\xf4\xe8\xd1\x0b\x9a\x67\x7b\
-\xf7\x5e\xca\xc0\x00\x6e\x7f\xb1\x8f\x57\x0e\x3d\x7a\xf4\xe8\xd1\
-\xa3\x17\x54\xcf\xf6\xee\x3d\x81\x2c\x9b\x8f\x57\x0e\x3d\x7a\xf4\
-\xe8\xd1\xa3\x57\xb2\x5e\x56\x1d\x00\xd5\x8a\xa1\x47\x8f\x1e\x3d\
-\x7a\xf4\xe8\x39\xf3\x3c\x77\x00\x54\x2c\x86\x1e\x3d\x7a\xf4\xe8\
-\xd1\xa3\xe7\xac\x79\xea\x00\xa8\x5a\x0c\x3d\x7a\xf4\xe8\xd1\xa3\
-\x47\xcf\x59\x73\xdd\x01\x50\xb9\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\
-\x9e\xb3\xe6\xaa\x03\xa0\x7a\x31\xf4\xe8\xd1\xa3\x47\x8f\x1e\x3d\
-\x67\xcd\x71\x07\x40\xf5\x62\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\xce\
-\x9b\xa3\x0e\x80\xea\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x5c\x99\
-\xa9\x8f\x03\x4e\x33\x61\xc8\xe2\x2d\x25\x8a\xa1\x47\x8f\x1e\x3d\
-\x7a\xf4\xe8\xb9\x32\x01\xd8\x9c\x01\x30\x84\xbf\x79\x3a\x25\x8a\
-\xa1\x47\x8f\x1e\x3d\x7a\xf4\xe8\x39\x36\x13\x07\xfd\x12\xb0\x3f\
-\x03\x60\xf5\xbe\x12\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x1c\x9b\
-\x29\x43\xff\x87\x33\x4c\xcc\x23\x7f\x7a\xf4\xe8\xd1\xa3\x47\xcf\
-\xff\x5e\xd2\x91\x7f\xa2\x85\xd3\xcc\x60\x3e\xf2\x97\x70\xf0\x60\
-\x01\x1f\xaf\x1c\x7a\xf4\xe8\xd1\xa3\x47\x2f\x88\x5e\x4a\x9e\x27\
-\xac\xb0\xc5\x0c\x1a\x52\x8f\xfc\x19\xfe\xf4\xe8\x05\xc7\x1b\x02\
-\x60\x16\x80\x7d\xe2\x3f\x7f\x06\xa0\x1e\xc0\x16\x45\x96\x8f\x1e\
-\x3d\x7a\xb9\xf1\x12\x17\xf0\xf7\xcc\x6f\xb4\xc2\x16\x33\x18\x9b\
-\x04\xa0\x2b\x54\x0c\x3d\x7a\xf4\xbc\x7b\x63\x00\xdc\x04\xe0\xcb\
-\x48\x3d\x2a\xd0\x01\x3c\x0a\xe0\x07\x00\x3e\x0d\x48\xbd\xf4\xe8\
-\x95\xb2\x67\xbe\x7b\x4f\x46\x22\xf5\xba\xf1\x05\xcd\x34\x83\xb9\
-\x03\xc0\xf0\xa7\x47\x2f\x18\xde\x29\x00\xde\x05\x70\x06\xac\x2f\
-\xee\xd5\xe2\xef\xbd\x2b\x84\x38\x35\x00\xf5\xd2\xa3\x57\xea\x5e\
-\x52\x9e\x9b\xc3\x1f\xc6\x09\xcc\x1d\x00\xab\x89\x03\xb6\x72\xe8\
-\xd1\x2b\x15\xef\x28\x00\xcf\x03\x28\x73\x62\x0a\x21\xba\xc2\xe1\
-\xf0\x09\x47\x1d\x35\x63\x91\x4f\xeb\xa5\x47\x8f\x5e\xac\x49\xc4\
-\x8e\xfc\xa3\x56\xd3\x6b\x86\x99\x7a\x1a\xc3\x9f\x1e\xbd\xc0\x78\
-\x55\x00\xee\x81\xf3\xf0\x07\x80\xb2\x68\xb4\xfb\xee\x15\x2b\x3e\
-\xac\xf2\x61\xbd\xf4\xe8\xd1\x4b\x6e\x69\xf3\xdc\xea\xea\x40\x86\
-\x3f\x3d\x7a\xc1\xf1\x2e\x02\x30\xd2\x89\x19\x0f\x7f\x00\x80\x94\
-\xd8\x7b\xeb\xd6\xed\x17\xf8\xb0\x5e\x7a\xf4\xe8\xc5\x9a\xed\xdd\
-\x7b\x29\x03\x03\xb8\xfd\xc5\x3e\x5e\x39\xf4\xe8\x95\x82\x77\x96\
-\x13\xd3\x18\xfe\x89\x16\x8d\x46\xcf\xf0\x61\xbd\xf4\xe8\xd1\x8b\
-\x35\xdb\xbb\xf7\x04\xb2\x6c\x3e\x5e\x39\xf4\xe8\x95\x82\xd7\x00\
-\xa0\x5f\x26\xd3\x2a\xfc\xa5\x94\x00\xd0\x08\xa0\xd6\x67\xf5\xd2\
-\xa3\x47\xcf\xa1\x97\x55\x07\x40\xb5\x62\xe8\xd1\xa3\x97\xd2\x32\
-\x1f\x01\xa4\x0f\xff\x9e\x49\x7c\x56\x2f\x3d\x7a\xf4\x1c\x7a\xb6\
-\x4f\x03\xf4\x53\x31\xf4\xe8\xd1\x73\xde\x1c\x84\x7f\x60\xea\xa5\
-\x47\x8f\x5e\x6a\xf3\xd4\x01\x50\xb5\x18\x7a\xf4\xe8\x39\x6b\x0c\
-\x7f\x7a\xf4\xe8\xb9\xee\x00\xa8\x5c\x0c\x3d\x7a\xf4\xec\x1b\xc3\
-\x9f\x1e\x3d\x7a\x80\xcb\x0e\x80\xea\xc5\xd0\xa3\x47\x2f\x73\x63\
-\xf8\xd3\xa3\x47\x2f\xd1\x1c\x77\x00\x54\x2f\x86\x1e\x3d\x7a\x99\
-\x1b\xc3\x9f\x1e\x3d\x7a\xc6\x16\x76\x32\x91\xea\xc5\xd0\xa3\x47\
-\x2f\x73\x63\xf8\xd3\xa3\x47\xcf\x64\xda\x9f\x01\x88\x4f\x18\xb2\
-\x78\x4b\x89\x62\xe8\xd1\xa3\x97\xb9\x31\xfc\xe9\xd1\xa3\x67\x32\
-\x01\xd8\x74\x00\x0c\xe1\x6f\xde\x83\x28\x51\x0c\x3d\x7a\xf4\x32\
-\x7b\x0c\x7f\x7a\xf4\xe8\x19\x4c\x0d\x86\x3c\xb7\x3b\x03\x60\xf5\
-\xbe\x12\xc5\xd0\xa3\x47\xcf\xbd\xc7\xf0\xa7\x47\xaf\xf4\xbc\xb8\
-\x99\x32\xf4\x7f\x38\xc3\xc4\x3c\xf2\xa7\x47\x2f\x40\x1e\xc3\x9f\
-\x1e\xbd\x92\xf5\x12\xe1\x9f\x34\x7f\x38\xcd\x0c\x29\x4f\x09\x84\
-\x83\x07\x0b\xf8\x78\xe5\xd0\xa3\x17\x68\x8f\xe1\x4f\x8f\x5e\xc9\
-\x7a\x56\x4f\xfd\x95\xb0\x78\x23\xe5\x3b\x82\x78\x63\xf8\xd3\xa3\
-\xe7\x53\xcf\x6b\xf8\xc7\x9b\xef\xea\xa5\x47\x8f\x5e\xfa\x6b\xf8\
-\x8c\x56\xd8\x62\x06\x63\x93\x00\x74\x85\x8a\xa1\x47\x8f\x9e\x0b\
-\x2f\x9b\xf0\xb7\xba\x80\x50\xf5\x7a\xe9\xd1\xa3\x97\xf6\xee\x3d\
-\x19\x89\xd4\xeb\xc6\x17\x34\xd3\x0c\xe6\x2d\x9e\xe1\x4f\x8f\x9e\
-\x8f\x3d\xb7\x56\xa2\x31\xfc\xe9\xd1\xf3\xbd\x67\x3e\xf2\xd7\xcd\
-\xd3\xa6\xbb\x08\x50\x5a\x4d\x1c\xb0\x95\x43\x8f\x1e\x3d\x8b\xc6\
-\xf0\xa7\x47\x2f\x50\x9e\x8c\x44\xea\xa3\x56\xd3\x6b\x86\x99\x7a\
-\x1a\xc3\x9f\x1e\xbd\xd2\xf3\x00\x86\x3f\x3d\x7a\x01\xf4\xd2\xe6\
-\xb9\x55\x4f\x21\x9b\xd1\x85\xfc\xb8\x72\xe8\xd1\x2b\x79\x0f\x60\
-\xf8\xd3\xa3\x17\x30\xcf\xf6\xee\xbd\x94\x81\x01\xdc\xfe\x62\x1f\
-\xaf\x1c\x7a\xf4\xe8\xc5\x5b\xba\x11\x03\x55\x58\x3e\x7a\xf4\xe8\
-\x79\xf2\x6c\xef\xde\x13\xc8\xb2\xf9\x78\xe5\xd0\xa3\x57\x0a\x9e\
-\xed\xef\xb0\x19\x2e\xd8\xd5\x3e\x42\x81\x7a\xe9\xd1\xa3\xe7\xd0\
-\x73\xfc\x38\x60\x3f\x14\x43\x8f\x1e\x3d\x77\x8d\xcf\x0a\xa0\x47\
-\xaf\x74\x3d\xcf\x1d\x00\x15\x8b\xa1\x47\x8f\x9e\xf3\xc6\xf0\xa7\
-\x47\xaf\xb4\x3d\x4f\x1d\x00\x55\x8b\xa1\x47\x8f\x9e\xb3\xc6\xf0\
-\xa7\x47\x8f\x9e\xeb\x0e\x80\xca\xc5\xd0\xa3\x47\xcf\xbe\x31\xfc\
-\xe9\xd1\xa3\x07\xb8\xec\x00\xa8\x5e\x0c\x3d\x7a\xf4\x32\x37\x86\
-\x3f\x3d\x7a\xf4\x12\xcd\x71\x07\x40\xf5\x62\xe8\xd1\xa3\x97\xb9\
-\x31\xfc\xe9\xd1\xa3\x67\x6c\x61\x27\x13\xa9\x5e\x0c\x3d\x7a\xf4\
-\x32\x37\x86\x3f\x3d\x7a\xf4\x4c\xa6\xfd\x19\x80\xf8\x84\x21\x8b\
-\xb7\x94\x28\x86\x1e\x3d\x7a\x99\x1b\xc3\x9f\x1e\x3d\x7a\x26\x13\
-\x80\x4d\x07\xc0\x10\xfe\xe6\x3d\x88\x12\xc5\xd0\xa3\x47\x2f\xb3\
-\xc7\xf0\xa7\x47\x8f\x9e\xc1\xd4\x60\xc8\x73\xbb\x33\x00\x56\xef\
-\x2b\x51\x0c\x3d\x7a\xf4\xdc\x7b\x0c\x7f\x7a\xf4\x4a\xcf\x8b\x9b\
-\x29\x43\xff\x87\x33\x4c\xcc\x23\x7f\x7a\xf4\x02\xe4\x31\xfc\xe9\
-\xd1\x2b\x59\x2f\x11\xfe\x49\xf3\x87\xd3\xcc\x60\x3e\xf2\x97\x70\
-\xf0\x60\x01\x1f\xaf\x1c\x7a\xf4\x02\xed\x31\xfc\xe9\xd1\x2b\x59\
-\x2f\x25\xcf\x13\x96\x66\x31\x43\xd2\x77\x04\xf1\xc6\xf0\xa7\x47\
-\xcf\xa7\x9e\xd7\xf0\x8f\x37\xdf\xd5\x4b\x8f\x1e\xbd\xf4\xd7\xf0\
-\x19\xad\xb0\xc5\x0c\xc6\x26\x01\xe8\x0a\x15\x43\x8f\x1e\x3d\x17\
-\x5e\x36\xe1\x6f\x75\x01\xa1\xea\xf5\xd2\xa3\x47\x2f\xed\xdd\x7b\
-\x32\x12\xa9\xd7\x8d\x2f\x68\xa6\x19\xcc\x5b\x3c\xc3\x9f\x1e\x3d\
-\x1f\x7b\x6e\xad\x44\x63\xf8\xd3\xa3\xe7\x7b\xcf\x7c\xe4\xaf\x9b\
-\xa7\x4d\x77\x11\xa0\xb4\x9a\x38\x60\x2b\x87\x1e\x3d\x7a\x16\x8d\
-\xe1\x4f\x8f\x5e\xa0\x3c\x19\x89\xd4\x47\xad\xa6\xd7\x0c\x33\xf5\
-\x34\x86\x3f\x3d\x7a\xa5\xe7\x01\x0c\x7f\x7a\xf4\x02\xe8\xa5\xcd\
-\x73\xab\x9e\x42\x36\xa3\x0b\xf9\x71\xe5\xd0\xa3\x57\xf2\x1e\xc0\
-\xf0\xa7\x47\x2f\x60\x9e\xed\xdd\x7b\x29\x03\x03\xb8\xfd\xc5\x3e\
-\x5e\x39\xf4\xe8\xd1\x8b\xb7\x74\x23\x06\xaa\xb0\x7c\xf4\xe8\xd1\
-\xf3\xe4\xd9\xde\xbd\x27\x90\x65\xf3\xf1\xca\xa1\x47\xaf\x14\x3c\
-\xdb\xdf\x61\x33\x5c\xb0\xab\x7d\x84\x02\xf5\xd2\xa3\x47\xcf\xa1\
-\xe7\xf8\x71\xc0\x7e\x28\x86\x1e\x3d\x7a\xee\x1a\x9f\x15\x40\x8f\
-\x5e\xe9\x7a\x9e\x3b\x00\x2a\x16\x43\x8f\x1e\xbd\x94\xd6\x94\xee\
-\x0d\x07\xe1\x9f\x76\x5e\x85\xeb\xa5\x47\x8f\x9e\xc3\xe6\xa9\x03\
-\xa0\x6a\x31\xf4\xe8\xd1\x4b\x69\xef\x58\xbd\xe8\xf0\xc8\xdf\x72\
-\x5e\xc5\xeb\xa5\x47\x8f\x9e\xc3\x16\x76\x33\xb1\xea\xc5\xd0\xf3\
-\xe4\x8d\x02\x70\x29\x80\x63\xe3\xff\x16\x2f\xbe\xf8\xf2\x5a\x21\
-\xc4\x4b\xe5\xe5\x15\x77\xcf\x98\x31\x6d\x6d\xc0\xea\x2d\x35\xef\
-\x21\x00\x47\x19\x5f\x70\x71\xda\xff\x21\x1f\xd6\x4b\xcf\xe0\x2d\
-\x5c\xf8\xca\xf4\xee\xee\xe8\xa5\xba\xae\x1f\x09\x60\x24\x62\x83\
-\x43\x7d\x0a\xe0\x79\x00\xb7\x03\xf8\x28\x48\xf5\xd2\x73\xd7\x78\
-\x81\x4f\xe9\x7a\x65\x00\xe6\x01\xb8\xd6\x68\x98\xc2\xa1\x5b\x08\
-\xf1\xfb\x8a\x8a\xf2\x1b\xda\xda\xda\x3b\x7d\x5e\x6f\xa9\x7a\xbd\
-\x00\x7c\x0c\x60\x18\xe0\x2a\xfc\x37\x01\xd8\x1f\xc0\x6e\x9f\xd5\
-\x4b\x0f\xc0\xd2\xa5\xef\xd4\x34\x36\x36\xdf\x26\xa5\x3c\x33\xc3\
-\x35\x1d\x3a\x80\x3f\x00\xb8\x0e\x40\x97\x9f\xeb\xa5\xe7\xf1\x1a\
-\xa0\xa0\x14\x43\xcf\x95\x57\x06\xe0\x61\x00\xa7\x18\x5f\xcc\x10\
-\x0e\x4f\x02\x38\x1d\x80\xe3\x4e\x80\x62\xf5\x96\xba\x77\x1c\x80\
-\x67\x84\x10\x29\x5f\xf9\xa5\x09\x07\x1d\xc0\x09\x88\x1d\x25\xfa\
-\xb1\xde\x92\xf6\x96\x2c\x59\x56\xdb\xdc\xbc\x2b\x22\xa5\x9c\xe0\
-\xf0\x82\xce\x27\x10\xdb\xbe\xbb\xad\x3c\xd5\xeb\xa5\xe7\x2d\xfc\
-\x81\xd4\x87\x05\xf8\xb2\x18\x7a\xae\xbd\x9b\x00\x5c\x62\x7c\xc1\
-\xe6\xc8\x70\x7f\x00\x13\x00\x3c\x0a\x20\x6a\x63\xab\x58\x6f\xa9\
-\x7b\x6b\xd6\xad\x5b\xbf\x52\x4a\xf9\x25\xa3\x9b\x26\x1c\xda\x01\
-\x9c\x87\x58\x28\xf8\xb5\xde\x92\xf5\xe2\xe1\xff\xb4\x94\x72\xa2\
-\x8b\xbb\x39\xc6\xc6\xe7\x7f\xd1\x6f\xf5\xd2\xf3\x3e\x76\x4f\x5d\
-\xdd\x28\x61\x7b\x06\x20\xfe\xcb\x53\x1e\x29\xa8\x4a\x31\xf4\x5c\
-\x7b\x07\x00\x58\x01\xc3\x05\xa0\x2e\x4e\x0b\x2f\x00\x70\x36\x32\
-\x9c\x09\x50\xb0\x5e\x7a\x71\x6f\xf1\xe2\xd7\x0e\xe8\xec\xec\xba\
-\x49\x4a\x79\x62\x9a\xbf\xef\x53\x00\xbe\x07\xe0\xc3\x20\xd4\x5b\
-\x6a\x9e\x21\xfc\x27\x7b\xb8\x95\xb3\x1b\xc0\x7e\xb3\x67\xcf\xfa\
-\xcc\x2f\xf5\xd2\xcb\x6a\xe0\x3e\x00\x36\x5f\x01\x30\xfc\x03\xe9\
-\xfd\x09\xc0\xb7\x12\x3f\x78\xb8\x0f\x7c\x01\xd2\x74\x02\x14\xad\
-\x97\x9e\xa9\xbd\xf8\xe2\xc2\x61\xba\xae\x1f\x0d\x60\x74\xfc\xa5\
-\x35\x88\x1d\xfd\xad\x53\x61\xf9\xe8\xb9\xf7\xb2\x0c\xff\x44\xbb\
-\x71\xf6\xec\x59\x37\xfa\xa1\x5e\x7a\x9e\xc3\x3f\x71\xe0\x27\x91\
-\x06\x37\x36\xab\xdb\x04\x95\x28\x86\x9e\x67\xef\xb8\xc4\x3f\x3c\
-\x0e\x02\x73\x1a\x80\x07\x60\xea\x04\x28\x5c\x2f\x3d\x93\xa7\xeb\
-\xfa\x67\x00\xee\x56\x75\xf9\xe8\xb9\xf3\x72\x14\xfe\xd0\x34\x71\
-\x2c\x00\x73\x07\x40\xb9\x7a\xe9\x65\x1d\xfe\x00\x62\x43\xff\x87\
-\x33\x4c\xcc\x23\xff\x60\x7a\x63\x80\xac\x47\x80\x3b\x0d\x86\x4e\
-\x80\xe2\xf5\xd2\xa3\x17\x58\x2f\x57\xe1\x1f\xdf\x1f\x8c\x36\xbd\
-\xac\x5c\xbd\xf4\x3c\x7b\x49\x47\xfe\x89\xa6\xa5\x99\xc1\xfc\xba\
-\x54\xac\x18\x7a\xde\x7b\x82\xe1\x1c\x0d\xff\x7a\x1a\x80\x07\x2a\
-\x2a\x2a\x2a\x54\xae\x97\x1e\xbd\xa0\x7a\x39\x0e\x7f\xe5\xeb\xa5\
-\x97\x75\xf8\x27\x5a\xcf\x53\x7f\x35\x8b\x19\x34\xa4\x1e\xf9\xdb\
-\x3e\x55\xc8\xc7\x2b\xa7\xa4\x3c\x21\xc4\x7a\xf3\xeb\x59\xec\x3c\
-\x4e\xeb\xea\xea\x7a\x60\xd5\xaa\xd5\xe5\xaa\xd6\x4b\x8f\x5e\x10\
-\xbd\xfc\x84\xbf\x58\xab\x6a\xbd\xf4\x3c\x7b\x29\x67\xf2\x8d\x96\
-\x66\x31\x83\xb1\x49\x30\xfc\x03\xe5\x09\x21\x5e\x36\xbe\x9e\xed\
-\xce\x43\x4a\x39\x67\xdd\xba\x0d\xf7\x19\x3a\x01\x4a\xd5\x4b\x8f\
-\x5e\xd0\xbc\x3c\x1e\xf9\xbf\xa4\x62\xbd\xf4\xb2\x0a\x7f\x63\x93\
-\x91\x48\xbd\x6e\x7c\x41\x98\x66\x10\xa6\xd7\x75\x85\x8a\xa1\x97\
-\x03\x6f\xe1\xc2\x57\xa6\x77\x75\x75\xbf\x0c\x64\x1f\xfe\xa6\x9f\
-\x1f\x2b\x2b\x2b\x3b\xbb\xa3\xa3\xa3\x43\xa5\x7a\xe9\xd1\x0b\x92\
-\x97\xc7\xf0\xef\x06\x30\x56\x4a\xb9\x5a\xa5\x7a\xe9\x65\xed\x25\
-\xe6\x97\x91\x48\x7d\xca\x18\x2e\x3d\x3d\x84\xba\xba\x51\xc6\x0e\
-\x00\x22\x91\x7a\x7d\xf5\xea\xb5\x6e\x7f\xb7\xdf\x56\x4e\xc9\x79\
-\xfb\xec\x33\x72\xc3\xda\xb5\xeb\x0e\x94\x52\x1e\xe4\xd6\x4a\xb4\
-\x34\xd7\x10\x1c\x10\x8d\x46\xc7\xc3\xe1\x60\x41\x7e\x5d\x7f\xf4\
-\xe8\x15\xcb\xcb\xe7\x77\xfe\x52\xca\x9b\xe0\xe0\xd9\x0f\x7e\x5e\
-\x7f\x25\xec\x59\x86\x3f\x10\xff\x0a\xc0\x7c\xea\xdf\x7c\x9a\x40\
-\xb1\x62\xe8\x65\xe9\x09\x21\xfe\x07\xc0\x7b\x6e\xbd\xf8\xbc\x29\
-\xaf\x19\x76\x46\xa7\x21\x76\x77\x40\xb9\x13\xcb\xaf\xeb\x8f\x1e\
-\xbd\x42\x7b\x79\x0e\xff\x27\x01\xfc\x54\xa5\x7a\xe9\xe5\xd4\x4b\
-\x9b\xe7\x56\x57\x07\x32\xfc\x03\xee\x45\xa3\xd1\x46\x00\xb3\x00\
-\xbc\xed\xc6\x74\x78\xf7\xc0\x69\x70\xd0\x09\xf0\xf3\xfa\xa3\x47\
-\xaf\x90\x5e\x9e\xc3\x7f\x01\x62\xcf\x01\xe8\x72\x63\xf9\x69\xfd\
-\x95\xb0\x67\x7b\x0d\x5f\xca\xc0\x00\x6e\x7f\xb1\x8f\x57\x4e\xa9\
-\x7b\x0d\x88\x0d\x0a\xe4\xa8\x13\xe0\xf2\xd6\xc1\xd3\x90\xa1\x13\
-\x10\x90\xf5\x47\x8f\x5e\xde\xbd\x02\x84\x7f\xc6\xa1\xbd\xfd\xbe\
-\xfe\x4a\xdc\xb3\xbd\x80\x5f\x20\xcb\xe6\xe3\x95\x43\x2f\xd6\x6a\
-\x11\x7b\xea\xdb\x94\x74\x66\x16\xe3\x06\x2c\x00\x47\x0c\xa4\x47\
-\xcf\x93\xc7\xf0\xa7\x97\x6f\x2f\xab\x0e\x80\x6a\xc5\xd0\xf3\xec\
-\xa5\xed\x04\xe4\x60\xd0\xa0\x05\xe0\x88\x81\x45\xf1\xfe\x70\x0d\
-\xaa\x76\xea\x18\xd9\xd9\x85\x61\x5d\x5d\x18\xd2\x2d\x51\xab\x77\
-\xa3\xaf\x1e\x45\x35\x74\x94\x45\x01\x21\xa5\xa6\x85\x00\x09\x0d\
-\xdd\x22\x24\x5a\xb5\x30\x9a\xcb\x35\x7d\x7b\x59\x99\xdc\x52\x5e\
-\x86\x4d\xfd\x35\xac\xfb\xce\x1f\xd1\xe6\x87\x7a\x83\xe4\x31\xfc\
-\xe9\x15\xc2\xf3\xdc\x01\x50\xb1\x18\x7a\x59\x79\x29\x9d\x80\x1c\
-\x8d\x18\x08\x00\x0b\x2a\x2a\x2a\xbe\x7a\xc4\x11\xd3\xad\xae\x2f\
-\x09\xca\xfa\x2b\xa8\x37\x61\xc2\x27\x15\xe1\xf6\x2d\xd3\x77\xb7\
-\x74\x1f\xb6\xbb\x0d\xe3\x9b\x5b\x30\xaa\x69\x17\xf6\x6a\x6a\x46\
-\xbf\x86\x26\x54\x37\x34\xa1\xac\xb1\x19\x22\xd3\x9f\xcb\xc9\xdf\
-\x57\x08\xa0\x5f\x5f\xc8\xda\x1a\x74\xd5\xd6\xa0\xb5\xa6\x2f\x1a\
-\x6b\xfa\xe0\xf3\xbe\xbd\xb1\xb6\x57\x15\x96\xf7\xad\xc1\x6b\xc3\
-\xf6\xc7\x2b\x8f\x3f\x3e\xab\xd3\x4f\xeb\x4f\x65\x8f\xe1\x4f\xaf\
-\x50\x9e\xa7\x0e\x80\xaa\xc5\xd0\xcb\xda\xeb\xe9\x04\xe4\x30\xfc\
-\x01\x00\x9a\xa6\x3d\x36\x72\xe4\x88\xf3\xf6\xdd\xb7\xce\xb8\xe3\
-\x29\x76\xbd\xca\x7b\x52\x42\x5c\x3f\x57\x4c\xdd\xd9\x24\x4e\xdb\
-\xd9\x84\xc3\xb7\x6e\x93\xfb\x6f\xdc\x8a\x41\xeb\x36\xa0\xa2\xa3\
-\x33\xe7\xe1\xe0\xc9\x2a\x2f\x03\xf6\xd9\x5b\x74\x0c\x1f\x8c\x6d\
-\x83\x07\x89\x8f\xfb\xd7\xe0\xf5\xbe\x7d\x42\x4f\xcc\x38\x61\xf0\
-\x9b\x73\xe6\x6c\x74\x7d\x51\xb1\xca\x7f\x8f\x7c\x7b\x0c\x7f\x7a\
-\x85\xf4\x5c\x77\x00\x54\x2e\x86\x5e\xf6\x5e\x28\x14\xea\x2f\xa5\
-\xfe\xbc\x94\x98\x6c\x7c\x3d\x17\x3b\x23\x21\xc4\xe3\x23\x47\x8e\
-\x38\x37\xde\x09\x50\xa2\x5e\xd5\xbc\x9b\xae\x45\x9f\x8d\xdb\x71\
-\xe1\xd6\xed\x38\x79\xc3\x66\x4c\xfa\x78\x35\x06\x6f\xdb\x29\x52\
-\x86\xec\xce\x43\x38\xe4\xdc\x1b\x3c\x00\xfa\xfe\x75\xd8\x3a\x62\
-\x28\x96\x0d\x1e\x88\x27\x87\x0f\xc4\x3d\x3f\xf8\x0d\x76\xe5\x73\
-\xfd\xf9\xd9\x63\xf8\xd3\x2b\xb4\xe7\xaa\x03\xa0\x7a\x31\xf4\x72\
-\xe3\x19\x77\x44\x00\x47\x0c\xcc\xa7\xf7\xb7\xbf\xa1\xec\x83\xb7\
-\x70\xce\x96\x2d\x38\xff\xd3\x75\x98\xba\x7c\x25\x6a\xdb\xda\xd3\
-\xaf\x3f\xc0\x1f\xe1\x6f\xd5\xaa\x2a\x81\xf1\x63\xd1\x30\x66\x24\
-\x96\x0c\x19\x82\xf9\x07\x1d\x8a\xfb\xaf\xb8\x62\xcf\xed\x67\x2a\
-\xfc\x3d\x8a\xe5\x31\xfc\xe9\x15\xda\x03\x5c\x74\x00\x54\x2f\x86\
-\x5e\x6e\xbd\xd8\x0e\xa9\xf9\x69\x5d\x97\x93\xdd\x5a\x89\x96\x21\
-\x1c\x16\xc0\xe5\x0e\xc9\x6f\xeb\x2f\x93\x37\x6f\x2e\x86\x6d\x6a\
-\xc4\xf7\x56\xaf\xc5\x9c\x65\x2b\x30\x6a\x47\x83\xf5\x53\x39\x83\
-\x14\xfe\x56\x6d\x40\x2d\xf4\x49\xe3\xb0\xb6\x6e\x14\x1e\xdb\xab\
-\x46\xfb\xfd\xab\x2b\x8f\xdc\xea\x64\xfd\x39\x69\x7e\xfa\xbc\x30\
-\xfc\xe9\x15\xda\x4b\x34\x47\x1d\x00\xd5\x8b\xa1\x97\x1f\xef\xa5\
-\x97\x16\xf5\x89\x46\xa3\xcf\x21\xc3\x2d\x82\xe9\x9a\x83\x70\x58\
-\x00\x87\x3b\x26\xbf\xae\x3f\xa3\x37\xef\x5b\x18\xb9\xee\x73\x5c\
-\xff\xd1\xa7\x98\xf3\xf6\x7b\x18\xd2\x61\x53\xb5\x6a\x61\x9d\x6f\
-\xaf\xb2\x42\x60\xf2\x04\x6c\x19\x5b\x27\x9e\x18\x3c\xa0\xe2\x57\
-\x6f\x7f\x32\x6d\x3d\x7c\xf4\xf7\xf5\xea\x31\xfc\xe9\x15\xda\x33\
-\x98\xf6\x1d\x80\xf8\x84\x21\x8b\x69\x95\x28\x86\x5e\xde\x3d\xdb\
-\x71\x02\xcc\xcd\x45\x38\x2c\x80\xcd\x0e\xca\xcf\xeb\xef\xf8\x89\
-\xf5\xd5\x9f\x6c\xc6\x0d\x2b\x57\xe1\xbc\x37\xde\xc1\xf0\x76\x87\
-\x5f\x7a\xa8\x1e\xd6\xf9\xf6\x2a\x2b\x80\xc3\x0e\x91\x1b\xc7\xee\
-\x8b\x7f\xed\x37\x14\x3f\xfb\xfe\xef\xb0\xdb\xa9\xe5\xa7\xcf\x0b\
-\xc3\x9f\x5e\xa1\x3d\x83\x09\xc0\xa6\x03\xc0\xf0\xa7\x17\x6f\x8e\
-\x3b\x01\x1e\xc2\x61\x01\xd2\xec\xa8\xfc\xba\xfe\x26\xd6\xbd\x7c\
-\xfc\x27\x6b\xe5\xbc\x57\x96\x60\xd2\xf6\x9d\xd6\xa7\xf7\x73\xb8\
-\xfe\x02\xed\x0d\xec\x0f\x7d\xc6\x54\x2c\xdb\x6f\x14\x7e\xfa\xbb\
-\xbf\xe3\xc9\x4c\x96\x9f\x3e\x2f\x0c\x7f\x7a\x85\xf6\xe2\x66\x62\
-\x7f\x24\x01\xfb\x0e\x40\x22\xfc\x8d\xd3\x29\x51\x0c\xbd\x82\x7b\
-\xb6\x9d\x80\x52\x1e\x31\xf0\x90\xbd\x3f\xac\x6a\x6a\xdb\xf6\xf3\
-\xa5\xcb\xf5\x0b\x97\x2e\x47\x8d\x5b\x2f\xcb\xf5\x57\x12\xde\xe4\
-\xf1\x68\x9a\x32\x01\x77\x1f\xb8\x17\x7e\x64\x1e\x9c\xc8\x4f\x9f\
-\x17\x86\x3f\xbd\x42\x7b\x71\xd3\x78\x30\x22\x23\x91\x7a\x29\x32\
-\x4c\x6c\x3c\xf2\x4f\xfc\x5f\x89\x62\xe8\x15\xcd\x4b\xdb\x09\x28\
-\xd5\x11\x03\xa7\xee\xff\xc6\x3e\x6b\x36\x74\xdc\xb2\xe8\x4d\x79\
-\xdc\xa6\xcf\x65\xc8\xad\x95\xc3\xf5\x57\x32\xde\xd0\x21\x88\x1e\
-\x35\x0d\xcf\x1d\x50\x87\xab\xe6\xfd\x09\x6b\xfd\xf4\x79\x61\xf8\
-\xd3\x2b\x92\x97\x74\xe4\x8f\x4c\x1d\x80\x78\x4f\xc1\x7c\xe4\x6f\
-\xfb\x60\x01\x1f\xaf\x1c\x7a\x1c\x31\xd0\x95\x37\x79\xdf\x57\xa7\
-\xac\x5c\xdd\xfd\x97\x17\x5e\x91\x93\x76\xb7\x42\x04\x25\x5c\xfd\
-\xe4\xf5\xaa\x86\x9c\x3d\x13\x4b\xc7\x8e\x29\x9b\xbb\xf4\x93\x19\
-\xe6\x87\x5a\x29\xf5\x79\x01\x18\xfe\xf4\x8a\xe6\x25\x1d\xf9\x23\
-\x1e\xfe\x80\xc5\x57\x00\x86\xf0\x37\xbe\xcf\xf0\xa7\x67\x6c\x3d\
-\x9d\x80\x52\x1b\x31\x70\x4a\xdd\x2b\x33\xde\x5b\x15\xfd\xfb\x4b\
-\xaf\xc8\x03\x13\x57\xf2\xab\x10\x86\xa5\xec\x55\x94\x03\x47\xcf\
-\x10\x1f\x4e\xd8\x37\x74\xf9\xd2\xd5\x33\xde\x80\x42\x9f\x17\x30\
-\xfc\xe9\x15\xd7\x4b\x9c\x95\x34\x1e\xf9\xf7\x1c\x60\x09\x8b\x19\
-\xcc\x47\xfe\xba\x42\xc5\xd0\x53\xc4\x2b\xb5\x11\x03\x7f\x3c\x57\
-\x4c\x5c\xf6\x01\xe6\x47\x16\x63\x5c\xa7\xe1\xc9\xe9\xaa\x85\x61\
-\x29\x7b\xe5\x65\xc0\xec\x99\x72\xf9\xe4\x71\x38\xff\xc6\x5b\xf0\
-\xae\x1b\x8b\xe1\x9f\xbb\x7a\xe9\x29\xe3\x19\xbf\x92\x4c\x1c\xf9\
-\x27\x9d\x5d\x15\xa6\x19\xcc\x47\xfe\x0c\x7f\x7a\x69\xbd\x3c\x8f\
-\x18\xb8\xa0\xb2\xb2\xf2\xac\xd6\xd6\xd6\x2e\xb7\x56\x2e\xeb\x9d\
-\x37\x17\xc3\xde\xfb\x14\x0f\x3c\x5b\x2f\x66\xb6\xb6\x27\xbf\xa7\
-\x72\x18\x96\xb2\x57\x5d\x09\x9c\x70\x34\x16\x1f\x3c\x06\x67\xcf\
-\xbb\x15\x9b\xec\xac\x7c\x6e\x6f\xcb\x96\xbd\xd7\xa7\xa1\xa1\xf1\
-\x79\x86\x3f\xbd\x22\x79\xc6\x23\xff\xa8\x79\xda\x74\x1d\x00\x98\
-\x7b\x0a\x8a\x14\x43\x4f\x31\x2f\xcf\x23\x06\xfe\x0c\xc0\x4f\x8b\
-\x51\xef\xcd\x37\xa3\x62\xc9\xcb\xb8\xeb\xc9\x17\xf1\xd5\x9d\x8d\
-\xfe\x1c\x8b\xbf\xd4\xbd\x81\xfd\xa1\x9f\x74\x34\xfe\x3d\xf5\x28\
-\x5c\xfa\xcd\x6f\xc2\x72\x14\x86\x7c\x6f\x1f\x2f\xbe\xb8\xf0\x9f\
-\x52\xca\x73\x18\xfe\xf4\x8a\xe4\x25\x8e\xfc\xa3\x56\xd3\x0b\xc3\
-\x4c\x3d\x3f\x33\xfc\xe9\xb9\xf1\xf2\x38\x62\x60\x17\x80\x7d\x01\
-\xac\x2b\x64\xbd\xdf\xb8\x04\x73\x9f\x5b\x88\xdf\xae\xfc\x14\x95\
-\x7e\x0f\xc3\xca\x0a\xa0\x7f\x3f\xa0\x5f\x5f\xa0\x77\x2f\xa0\xba\
-\x2a\xf6\x5a\x59\xd9\x9e\xde\xbe\x04\xd0\xd5\x05\x74\x74\x02\xbb\
-\x5b\x05\x76\xb7\x02\x4d\xbb\x80\x86\x26\xa0\xb5\xcd\x5f\xf5\x5a\
-\xb5\xb1\x63\xd0\xfe\xc5\x23\xf1\xfd\x5b\xfe\x81\x5b\x8d\xaf\xe7\
-\x7b\xfb\x58\xb8\xf0\x95\x69\x5d\x5d\xdd\x8b\x18\xfe\xf4\x8a\xe8\
-\x49\x64\xb8\x86\x2f\x65\xe2\x2c\x47\x17\xf2\xdb\xca\xa1\x97\x03\
-\x2f\x1a\x8d\xee\x04\x70\x1c\x72\x3f\x62\x60\x19\x80\xcb\x00\xdc\
-\x50\x88\x7a\x7f\x72\x35\xc6\xbd\xf6\x2e\x1e\xbf\xe5\x1f\xa8\x73\
-\xb8\x7c\xae\x5a\x3e\xbc\xc1\x03\x80\xfd\xeb\x80\xfd\xea\x80\x51\
-\x23\x80\xd1\x7b\x4b\x8c\x18\x0a\x0c\x1d\x0c\xec\x35\x28\x16\xfa\
-\x4e\x9a\x04\xa0\x47\x05\x8c\x4b\x23\x00\x74\x74\x4a\x6c\xd9\x0e\
-\x6c\xde\x02\xac\xdf\x0c\xac\xdd\x00\xac\x5d\x0f\xac\x5a\x0b\x7c\
-\xbc\x1a\xd8\xf8\x79\x61\xeb\xf5\xe2\xad\xfc\x14\x95\x2b\x3f\xc5\
-\x2d\xb3\x67\xe2\x9a\xe9\x87\xe0\xd4\x1b\xff\x82\x15\x85\xd8\x3e\
-\xba\xbb\xa3\x5f\x63\xf8\xd3\x2b\xa2\x97\x31\xfc\x01\xd3\x19\x00\
-\x86\x3f\xbd\x2c\x3d\xdb\xc1\x82\x12\xcd\xc5\xce\xfc\x55\x00\x33\
-\xf2\x59\xaf\x94\x10\x97\x9e\x8d\x7f\x3c\xfa\x0c\x2e\x6c\x6c\x8e\
-\x6d\x13\xaa\x84\xd7\x9e\xf9\x81\x03\xf7\x05\x0e\x3d\x04\x98\x38\
-\x0e\x98\x70\x80\xc0\xf8\xb1\x40\xbf\xf8\x90\x43\x02\x80\x16\x92\
-\xce\x1e\xee\x61\x5e\x0e\x58\x87\xbf\x13\xaf\x69\x17\xb0\x62\x25\
-\xf0\xee\x87\xc0\xb2\xe5\xc0\x92\xf7\x80\xe5\x2b\x01\x29\xd5\x5a\
-\x7f\x89\xd6\xaf\x2f\xe4\x97\x4f\xc0\x3d\xe1\x9a\x43\x2f\x5f\xb3\
-\xa6\x97\x19\xc8\xe9\xf6\x11\x89\xd4\x7f\x04\xc4\x3a\x93\x39\xaa\
-\x77\x01\x18\xfe\xf4\x72\xe8\x79\xd9\x5f\x28\x5b\x0c\x3d\x25\x3c\
-\xdb\x4e\x80\xcb\x9d\xf9\xe7\x00\x86\xe6\xab\xde\x1f\xcd\xc5\x8c\
-\xc8\x22\x3c\xf1\xd6\xbb\xa8\xf5\xb8\x7c\xb6\xcd\x8b\x57\x16\x06\
-\x26\x4f\x00\x8e\x9e\x0e\xcc\x3c\x0c\x38\x7c\x72\xec\x34\x7e\x36\
-\x61\x6d\xd5\xf2\xe1\x35\x37\x0b\xbc\xb1\x0c\x78\xf5\x6d\xa0\xfe\
-\x75\xe0\xad\x77\x62\x67\x12\x0a\xb9\xfe\xec\xbc\xa9\x07\xa3\x61\
-\xd6\x17\xc2\x5f\x5e\xf6\xc9\x8c\x57\xe3\x2f\xe7\x63\xfb\xe8\x06\
-\xdc\x0d\x05\x9d\xa1\xde\x05\x60\xf8\xd3\xcb\xb1\x97\x55\x07\x40\
-\xb5\x62\xe8\x29\xe3\xa5\xed\x04\x78\xd8\x99\x6f\x05\x30\x24\xd7\
-\xf5\x4a\x09\x71\xf1\x57\x70\xef\x43\x4f\xe1\xdc\xdd\xad\x7b\xb6\
-\x83\x62\x86\xff\xf0\xbd\x80\x93\x8f\x01\x8e\x9f\x05\x1c\xfd\x05\
-\xa0\x6f\x6f\xd3\x7c\x50\x3f\xfc\xd3\x7d\x8d\x50\xff\x1a\xf0\xec\
-\xcb\xc0\x93\x2f\xc4\xbe\x46\xc8\xc7\xfa\x73\xeb\xf5\xaa\x86\x3c\
-\xfd\x44\xf1\xef\x33\x2e\x18\x7a\xfe\x9c\x39\x1b\x5d\x5f\xf7\xe4\
-\xe0\xf3\xd7\x8d\xe4\x5b\xb1\xbc\xd6\xbb\x00\x0c\x7f\x7a\x79\xf0\
-\x3c\x77\x00\x54\x2c\x86\x9e\x52\x5e\x4a\x27\xc0\xe3\xce\xfc\x2d\
-\x00\x87\xe5\x72\xf9\x7e\x72\x35\xc6\xbd\xf0\x3a\x5e\x7c\xf5\x6d\
-\x0c\x36\xbe\x5e\x8c\xf0\xef\xdf\x0f\x38\xeb\x4b\xc0\x05\x67\x00\
-\x87\x4d\x8c\x9d\xea\xb7\x6a\x7e\x0d\x7f\x2b\xef\x9d\x15\xc0\xfc\
-\x47\x80\xfb\x1f\x03\xb6\x6c\xcf\x6e\xfd\xb9\x69\xe9\xbc\x2f\x4c\
-\xc1\xd6\x63\x0f\xc7\x31\x37\xfe\x05\x2b\x9c\x5a\x0e\x3f\x7f\x9f\
-\x20\x76\x11\x6b\x36\xcb\xb7\x00\x0c\x7f\x7a\x79\xf2\x3c\x75\x00\
-\x54\x2d\x86\x9e\x72\x5e\x4f\x27\x20\x8b\x9d\xf9\x6f\x00\xfc\x20\
-\x57\xcb\x77\xd5\x05\xb8\xfe\x3f\x4f\xe2\x67\xdb\x4c\x4f\xe9\x2b\
-\x64\xf8\x97\x97\x01\x27\x1d\x03\x9c\x7f\x7a\xec\xff\xe5\x65\x99\
-\xad\x20\x85\xbf\xb1\x75\x77\x03\xcf\x2f\x02\xee\x7d\x18\x78\xfc\
-\x79\xc0\xf8\xb8\xe4\x42\x77\xc6\x06\xf5\x87\xfe\x95\x93\x71\xc3\
-\x5f\xef\xc5\x2f\xec\x2c\x17\x9f\xbf\xdb\x00\x5c\x99\xc5\xf2\x2d\
-\x00\xc3\x9f\x5e\x1e\x3d\xd7\xdb\xbb\xca\xc5\xd0\x53\xcf\xcb\x72\
-\xc4\x40\x1d\xc0\x01\x88\x1d\x49\x65\xb5\x7c\x7f\xb8\x06\x55\x0b\
-\x3f\x40\xfd\x63\xcf\xe1\x30\xf3\xaf\x2e\x54\xd8\x4c\x9b\x14\x0b\
-\xfd\xb3\x4f\x89\x1d\xf9\x3b\x69\xaa\x84\x75\xbe\xbd\xa6\x5d\xc0\
-\x43\x4f\x02\xf7\x3e\x02\xbc\xba\x44\xc0\xbc\xfa\x0b\xf1\x35\x8c\
-\x10\xc0\x9c\x2f\xe2\xcd\x23\x0f\xc2\x2c\xf3\xd3\x06\x13\xcd\xe5\
-\xe7\xef\x60\xc0\x7e\x44\x42\x86\x3f\xbd\x62\x79\xae\xb6\x79\xd5\
-\x8b\xa1\xa7\xa6\x97\xc5\x88\x81\x7f\x02\x70\x4d\xb6\xcb\x77\xdd\
-\xb7\x31\xf1\x99\x08\xea\xad\x1e\xd3\x9b\xef\xf0\xef\xdd\x0b\xb8\
-\xfc\x5c\x89\xcb\xce\x01\xf6\x1b\xed\xce\x52\x35\xac\xf3\xed\xad\
-\x59\x0f\xdc\xfd\x20\x70\xfb\xfc\x58\xc7\xa0\xd0\x17\x60\x4e\x1e\
-\x8f\xa6\x13\x66\x63\xd6\x2f\xff\x84\x77\x8c\xaf\x7b\xfc\xfc\xfd\
-\x15\xc0\xd7\x5d\x2e\xdf\x02\x30\xfc\xe9\xe5\xd9\x03\x5c\x74\x00\
-\x54\x2f\x86\x9e\xda\x5e\x7c\xc4\xc0\xa7\x74\x5d\x3a\x1d\x27\xe0\
-\x05\x00\x27\x21\xbe\x13\xf4\xba\x7c\xdf\xb8\x0c\x5f\x7f\x60\x01\
-\x6e\xdd\xba\x3d\xf5\x6a\xec\x7c\x86\x7f\x6d\x0d\x70\xf5\x45\xc0\
-\x37\x2e\x91\x8e\x8f\xf6\x93\x96\x03\xfe\x08\xeb\x7c\x7a\xcd\xbb\
-\x80\xdb\xe7\x4b\xdc\x7c\x17\xb0\x7d\xa7\x7b\x33\x9b\xbf\xef\xe0\
-\x81\xd0\xcf\x3e\x0d\x73\x6f\xb9\x13\xb7\x01\x59\x6d\x1f\x95\x00\
-\x9e\x04\x70\x8c\xc3\xe5\x7b\x14\xc0\x57\xc1\xf0\xa7\x97\x47\x2f\
-\xd1\x1c\x6d\xab\xaa\x17\x43\xcf\x1f\x5e\x7d\xfd\xe2\xca\xee\xee\
-\xee\x5b\x00\x5c\x64\x43\xfc\x1d\xc0\xb7\x00\xb4\x67\xb3\x7c\x17\
-\x9d\x89\x7b\xef\x7f\x0c\xe7\x77\x5a\x3c\x4d\x20\x5f\xe1\x3f\x78\
-\x00\xf0\xcd\x4b\x81\x2b\xce\x07\x6a\xfa\xaa\x1b\xae\x7e\xf2\x76\
-\xb7\x02\x7f\xbf\x0f\xf8\xc3\xdf\x81\xcd\x5b\x9d\x99\xb9\xf8\xfb\
-\x96\x97\x01\xe7\xcc\xc1\xfc\x8d\x8d\xb3\x2e\x44\x76\xdb\x47\x05\
-\x80\xdf\x02\x98\x1b\x2f\xcd\x6a\xf9\xba\xa5\x94\x37\x01\x98\x87\
-\xd8\xdd\x03\x8e\x9b\x5f\xf7\x07\xf4\x8a\xe3\x19\x4c\xfb\xed\xd5\
-\xf0\x54\x21\xf3\xb4\x4a\x14\x43\xcf\x97\xde\x24\xc4\x46\xf8\x9b\
-\x05\x60\x6f\x00\x7d\x10\x1b\xee\x37\x82\xd8\x29\xd3\xb7\x5d\x7a\
-\x49\x4d\x4a\x88\x33\x4e\xc2\xc2\x47\x9e\xc6\x4c\xab\xf7\xf3\x11\
-\xfe\x23\x86\x02\xd7\x5c\x06\x5c\x7a\x36\x50\x55\xe9\x9f\x70\xf5\
-\x93\xd7\xd1\x09\xdc\xfd\x1f\xe0\xb7\xb7\x65\xbe\x95\x30\xd7\x7f\
-\xdf\x33\x4e\x12\x8b\x6b\xf6\x3a\xf4\xd8\x75\xeb\xaa\x8d\x88\x97\
-\xed\xe3\x40\x00\x97\x0b\x21\x8e\x05\x30\x12\x80\x14\x42\xac\x01\
-\xf0\xbc\x94\xf2\xef\x52\xca\x4f\xdd\x2e\x5b\x40\xf6\x07\xf4\x0a\
-\xe4\x19\x4c\x00\x36\x1d\x00\x86\x3f\xbd\x02\x78\x1a\x62\x9f\xb1\
-\xae\x5c\x78\x37\xdf\x8c\x8a\xa7\x1e\xc1\x3b\xcf\xd4\xe3\x00\xab\
-\xf7\x73\x1d\x0e\x43\x07\x0b\xfc\xe4\xdb\xb1\x8b\xfb\xca\xcb\xfc\
-\x1b\xae\x7e\xf2\xba\xbb\x81\xfb\x1e\x03\x6e\xf8\x1d\xb0\x61\x73\
-\xf2\x7b\xf9\x3a\xb3\x73\xfc\x51\x62\xe5\x81\x93\x86\x4e\x7d\xff\
-\xfd\xfd\x3a\xe0\xef\xed\x8d\x5e\x89\x7a\x71\x33\xf1\x55\xa8\x04\
-\xec\x3b\x00\x89\xf0\x37\x4e\xa7\x44\x31\xf4\xe8\x99\xdb\xaf\x7e\
-\x88\xda\xa7\x5e\xc4\x8a\x45\x6f\x5a\x8f\x1c\x98\xcb\x70\x08\x85\
-\x80\xaf\x5f\x20\xf0\xd3\x6b\x80\x3e\xf1\x01\x7b\x82\x10\xae\x7e\
-\xf2\x5a\x76\x03\x37\xfe\x19\xf8\xf3\x5d\xb1\x4e\x41\xbe\x2f\xe8\
-\x9c\x79\x28\x36\x9f\x70\x94\x76\xd0\xf5\xbf\x8d\x36\xba\xb5\x54\
-\xd8\x3e\xe8\x95\xae\x17\x37\x8d\xd7\x41\xc9\x48\xa4\x5e\x8a\x0c\
-\x13\x1b\x8f\xfc\x13\xff\x57\xa2\x18\x7a\xf4\xcc\x6d\xde\xb7\x30\
-\xf2\xf1\x17\xf0\x9e\xd5\x95\xfe\x40\x6e\xc3\x61\xda\x24\xe0\xd6\
-\x1b\x05\x26\x1c\x68\xf0\x11\xac\x70\xf5\x93\xf7\xc1\xc7\xc0\xd5\
-\x3f\x16\x58\xfc\x96\xe9\xf7\xe4\xe1\xee\x81\xc9\x13\xd0\x74\xea\
-\x31\x38\x78\xde\x9f\x9d\x3d\xa1\x12\x50\x63\xfb\xa0\x57\xf2\x5e\
-\xd2\x91\x3f\x32\x75\x00\xe2\x3d\x05\xf3\x91\x7f\x54\xa1\x62\xe8\
-\xd1\xeb\x69\xd7\x7d\x1b\x13\x1f\x7e\x1c\xaf\xad\x5c\x8d\x4a\xab\
-\xf7\x73\x15\xfe\xfd\xfb\x01\xbf\xfc\x01\x70\xf1\x57\x44\xd2\x96\
-\xa1\x52\x18\x96\xb2\x77\xdf\x02\xe0\xba\x5f\xc7\x46\x17\xcc\xe7\
-\xad\x83\x63\xeb\xd0\x7e\xc6\xa9\x98\x6e\xbe\x4d\xd0\xaa\xa9\xb0\
-\x7d\xd0\x2b\x79\x2f\xe9\xc8\x1f\x86\xa7\xfe\x86\x2c\x66\x48\x84\
-\x3f\x0c\xff\x67\xf8\xd3\x53\xd2\xbb\xf6\x0a\x1c\x37\xff\x11\xbc\
-\xbc\x66\x3d\xca\xad\xde\xcf\x45\xf8\x0b\x01\x5c\x72\x16\xf0\xe8\
-\x1d\xc0\xf4\x29\x0c\x7f\x55\xbd\x09\x07\xc4\x2e\xc2\x6c\x6d\x93\
-\x58\xba\x1c\xf0\xd2\x07\x70\xf2\x79\xd9\xd1\x80\xf0\x9a\xcf\x70\
-\xd9\x95\xe7\xe1\xf5\x57\xde\xc6\xea\x74\x96\x0a\xdb\x07\xbd\x92\
-\xf7\x52\xae\xe1\x33\x5a\xc2\x62\x06\xf3\x91\xbf\xae\x50\x31\xf4\
-\xe8\xf5\xb4\x6f\x5d\x86\x0b\xe7\x3f\x8c\x7f\xec\x68\xb0\x7e\xe2\
-\x5a\x2e\xc2\x7f\xbf\xd1\xc0\x5d\xbf\x03\x0e\x9f\xe2\xaf\x30\x2c\
-\x75\x6f\xd9\x72\xe0\xe2\xef\xc6\x1e\x55\xec\xb4\xb9\xfd\xbc\x0c\
-\xa8\x85\x7e\xfe\x19\xb8\xe4\xcf\x77\xe2\x1e\xf3\x7b\x2a\x6c\x1f\
-\xf4\x4a\xde\x33\x1e\xe0\x27\x8e\xfc\x93\x1e\x7a\x15\x32\xcd\x60\
-\x3e\xf2\x67\xf8\xd3\x53\xd2\xfb\xf6\xa5\xb8\xf8\xff\xfe\x8d\x7f\
-\x34\x35\xe7\x2f\xfc\xcf\x3e\x05\x78\xec\x2e\xa0\x6e\x1f\x7f\x87\
-\x61\x29\x7a\x43\x07\x03\x17\x7f\x05\xd8\xb2\x0d\x58\xe6\xe0\x11\
-\x3f\x5e\x3e\x2f\x6d\xed\x10\x2b\x56\xe2\xb4\xaf\x5f\x84\x35\x6f\
-\x2c\xdd\x33\xe4\xaf\x0a\xdb\x07\x3d\x7a\x48\x3d\xf2\x4f\x79\xe2\
-\x65\x4f\x07\xa0\xae\x6e\x54\xd2\x91\x7f\x24\x52\xaf\xaf\x5e\xbd\
-\xd6\xed\xef\xf6\xd3\xca\xa1\xe7\x53\xef\x07\x57\xe2\xf8\xbb\x1f\
-\xc2\x83\xf9\x0a\xff\xca\x0a\xe0\xe6\x1b\x63\xdf\xf7\x97\x97\xfb\
-\x3f\x0c\x4b\xd5\x2b\x0b\x03\xa7\x1c\x07\xec\x3b\x2a\xf6\xd0\x21\
-\xab\x01\xa1\x80\xec\x3e\x2f\x9d\x5d\x10\xab\xd6\x60\xce\x37\x2e\
-\xc2\x6b\xaf\xbc\x8d\xd5\x2a\x6c\x1f\xf4\xe8\x99\x5e\x96\x91\x48\
-\x7d\xd4\x6a\x7a\xcd\x30\x53\x4f\xb3\xea\x29\x28\x54\x0c\xbd\x12\
-\xf6\xae\xfb\x36\x26\xfe\xeb\x31\xfc\x37\x5f\xa7\xfd\xf7\x1f\x0d\
-\xbc\xba\x00\xb8\xfc\xdc\x60\x85\x61\x29\x7b\xe7\x9e\x06\xbc\xf1\
-\x44\xec\x1a\x01\x73\xcb\xc5\x99\xa2\x1d\x0d\xd0\xee\x7b\x1c\x4f\
-\xfd\xe8\x5b\x62\x12\x02\xb6\xbd\xd1\x0b\x84\x97\x36\xcf\xcd\x3b\
-\x51\xc9\xf0\xa7\xa7\xaa\x37\xef\x5b\x18\xf9\xf0\xe3\x78\x6d\xc3\
-\x66\xcb\xf9\xb2\xde\x99\x9f\x33\x07\x78\xf3\xbf\xc0\xc1\x07\xaa\
-\x13\x5e\xf4\x72\xe3\x8d\xad\x03\x5e\x7b\x2c\xd6\xb1\xeb\x99\x3f\
-\x87\xb7\x86\x6e\xd8\x8c\xf0\xa3\xff\xc5\xab\x53\xf6\x7b\x63\x6f\
-\xd3\x5b\xbe\xdd\xde\xe8\xf9\xde\x93\xb0\xb9\x80\x3f\xa9\x03\x90\
-\xe5\xd0\x82\x7e\x5b\x39\xf4\x7c\xe4\xfd\xea\x87\xa8\x7d\xfc\x05\
-\xbc\x97\x8f\x5b\xfd\xaa\x2a\x81\xbf\xfd\x1a\xb8\xf7\xcf\xb1\xa7\
-\xf7\xa9\x16\x5e\xf4\x72\xe3\x55\x56\x00\x7f\xfd\x25\x70\xdf\xad\
-\x40\xdf\xde\xb9\x0b\x7f\x20\xf6\xf9\x5b\xb9\x1a\x95\xcf\x2f\x6e\
-\x5f\x3a\xe5\x80\x65\xb5\xf1\x97\x7d\xbb\xbd\xd1\x0b\x84\x67\x7b\
-\xf7\x9e\x97\xed\x31\x28\x2b\x87\x9e\x4f\xbc\x9b\x6f\x46\xc5\x7f\
-\xe6\x63\x4d\x3e\x46\xf8\x1b\x32\x10\xf8\xef\xdd\xc0\xa4\xf1\xf1\
-\xf9\xa0\x66\x78\xd1\xcb\xad\xf7\xe1\xa7\xc0\xa9\x17\x03\xeb\xe3\
-\x43\x09\xe7\x7a\xc4\xc0\x2f\x7f\xb5\x62\xd4\x77\xbe\xd3\xee\xea\
-\x89\x7e\x80\x1a\xdb\x1b\xbd\xd2\xf1\x34\xbb\x09\xfc\x54\x0c\xbd\
-\xe0\x79\x52\x42\x3c\xf5\x08\xde\xc9\x47\xf8\xd7\x8d\x04\x16\x3e\
-\xcc\xf0\x2f\x45\xef\x80\x31\xc0\x4b\x0f\x02\x07\xec\x9b\xfb\x41\
-\x83\x16\xbd\x29\x87\x3e\xf7\x78\xfb\xbb\xd2\xe5\x62\xaa\xb0\xbd\
-\xd1\x2b\x2d\xcf\xf3\x19\x00\x15\x8b\xa1\x17\x3c\xef\xf4\x13\xb1\
-\x28\x1f\x4f\xf5\x3b\xe4\x20\xe0\xa9\x7b\x62\x67\x00\x00\x7f\x85\
-\x57\xf0\x3c\x01\x74\x95\x41\xe8\x65\x40\x34\x0c\xe8\x65\x90\x7a\
-\x18\xb2\x2b\x0c\xa9\x87\x00\x3d\x04\xe8\x02\x42\x68\xd0\x84\x80\
-\x90\x02\x02\xa2\x67\x50\x53\x29\x00\x08\x19\x5b\x0a\xa1\x03\x5a\
-\xfc\x3f\x11\x05\x44\x14\x52\x8b\x42\x6a\xdd\xd0\xd1\x0d\x19\xea\
-\x86\x0c\x77\x01\x5a\x17\x04\x80\xa6\x5d\x12\xa7\x5c\x02\xbc\xb1\
-\xcc\x7d\xcd\x76\x9f\xbf\x33\x4e\xc2\xa2\x87\x9f\xc2\x91\x4e\x2c\
-\x55\xb6\x37\x7a\xa5\xe5\x79\xea\x00\xa8\x5a\x0c\xbd\x60\x79\x17\
-\x9d\x89\x7b\xff\xf9\x10\xce\xb7\x7a\x2f\x9b\xf0\x9f\x35\x1d\x78\
-\xe4\x0e\xa0\x6f\xfc\x21\x3e\xc5\x09\xc3\xc4\xc9\x37\xfb\x6b\x6e\
-\xd5\x0a\xeb\x2c\x3c\x5d\x83\xe8\xae\x04\xba\x2a\x20\xa2\x15\x40\
-\x57\xfc\xdf\x7a\x38\xd5\xd3\x93\x47\xf2\x13\x02\xd0\x34\x6f\x3b\
-\x2c\x4b\x0f\x80\x28\xef\x84\x28\xeb\x44\x6b\x77\x3b\xce\xfc\xee\
-\x4e\x3c\xb3\xa8\xcb\xb1\xe9\xf4\xf3\x77\xd1\x99\x98\xff\xcf\x87\
-\x70\x41\x26\x4b\x95\xed\x8d\x5e\xe9\x79\xae\xb7\x27\x95\x8b\xa1\
-\x17\x1c\xef\x1b\x97\xe1\xeb\x7f\xfb\x27\xfe\x6a\x75\xef\x76\x36\
-\xe1\x7f\xc6\x49\xc0\x3d\x7f\x02\x2a\xe2\x03\x07\x17\x32\x0c\xb5\
-\x8a\xe9\x10\xbd\x2f\x87\xa8\x3c\x1a\x08\x8f\x8c\xaf\x85\x35\x90\
-\xed\x11\xc8\x5d\xb7\x43\x76\x2e\x73\xe5\x29\x1d\xfe\x42\x40\xeb\
-\xac\x06\xba\xaa\x21\xba\xaa\xe2\xa1\x5f\xe6\xcc\xcb\x77\xf8\x5b\
-\x78\xdd\x51\x89\x4b\x7e\xbe\x09\xf3\x9f\x6d\xb4\x35\xdd\x7c\xfe\
-\xca\xcb\x80\x2b\x2e\xc2\x55\xb7\xdc\x89\xdb\xac\xde\x57\x65\x7b\
-\xa3\x57\x9a\x1e\xbf\xa3\xa2\xa7\x9c\x77\xdd\xb7\x31\xf1\xce\xf9\
-\x78\x7b\xeb\xf6\xd4\x6b\x54\xb2\x09\xff\x2b\xcf\x07\x6e\xfe\x59\
-\x6c\xe7\x0f\x14\x30\x0c\x2b\xf6\x41\xa8\xf6\x77\x10\xd5\x67\x64\
-\x9e\xbf\xe5\x0e\xe8\x3b\xbf\x05\xc8\xb6\xc2\x2e\x5f\x2e\xbc\x68\
-\x18\xa2\xb3\x1a\x5a\x67\x35\xb4\xee\x2a\x68\xd1\x2a\xc0\xe5\x27\
-\xa6\x58\xe1\xdf\x33\xbd\x04\xbe\x7b\xcb\xe7\xf8\xe3\xbf\x77\xa4\
-\x35\xbd\x7c\xfe\x06\x0f\x84\x7e\xd9\xf9\x98\x62\x7e\x78\x90\x2a\
-\xdb\x1b\xbd\xd2\xf4\x00\x8b\x87\x01\xf9\xb5\x18\x7a\xc1\xf0\xfe\
-\x70\x0d\xaa\x1e\x89\x60\xf9\xaa\xb5\xa8\x32\xbf\x97\x4d\xf8\xff\
-\xe8\x6a\xe0\x77\x3f\x89\x05\x00\x50\xa0\x70\x15\xd5\x08\x0f\xb8\
-\x1e\xa1\x81\xf7\x43\x94\x1f\x6c\x6b\x88\xf2\x29\x10\x15\x33\x21\
-\x5b\xff\x0d\x89\x6e\xe5\xc3\x5f\xb6\x57\x03\xad\xfd\xa1\x35\xef\
-\x05\xad\x79\x08\xb4\x8e\xbe\x08\x45\xab\xa0\xe9\xf6\x47\xfa\x96\
-\xcb\x57\xc4\xf0\x4f\xbc\x7f\xfc\xb4\xde\x08\x69\x02\x2f\x2d\xdd\
-\x6d\xf1\xbe\xb7\xcf\xdf\xee\x56\x88\xdd\x2d\x38\xe7\xfb\xe7\xe1\
-\xcf\xcf\xbe\x8e\x6e\x40\x9d\xed\x8d\x5e\x69\x7a\x89\xe6\xa8\x03\
-\xa0\x7a\x31\xf4\x82\xe3\x55\xd5\xe0\x95\x97\x5e\xc3\x18\xf3\xeb\
-\xd9\x1e\xf9\xff\xee\x27\x86\xf9\x90\xef\xf0\x17\xd0\x7a\x9d\x85\
-\xb2\x21\x8f\x41\xab\x3e\x15\x10\x61\xc7\x96\x08\x8f\x02\xb4\x01\
-\x88\xb6\x3c\xa5\x5e\xf8\x4b\x0d\xa2\xa3\x37\x44\xcb\x40\xc8\x86\
-\x61\x10\x2d\x03\x20\x3a\xab\x21\xf4\x70\xc1\xc3\x3a\x9f\xde\x51\
-\x93\x7a\xa1\x79\xb7\x8e\xd7\x97\xb7\x19\xe6\xcf\x6e\xdc\x80\xcd\
-\x5b\x51\x59\x55\x83\xe3\x3e\xfa\x14\x77\xaa\xb4\xbd\xd1\x2b\x3d\
-\x2f\x61\xd6\xd5\x8d\x12\xb6\x1d\x80\x74\x8f\x14\x54\xa5\x18\x7a\
-\xc1\xf1\xae\xba\x00\xd7\xcf\x7f\x34\xf5\x82\xa9\x6c\xbf\xf3\xff\
-\xbf\xdf\x16\xee\xc8\x5f\x94\x1f\x8c\xd0\xc0\xfb\x11\xee\xf7\x5d\
-\x88\x50\x8d\x7b\x4f\x4a\xc8\xf0\x64\xc8\xd6\x47\x00\x7d\x5b\xce\
-\x97\xcf\x8b\x27\x3a\x7a\x41\x6b\x19\x0c\xad\x71\x04\xd0\xd6\x0f\
-\xb2\xa3\x0a\xd0\xf7\x7c\x3b\x13\xa4\xf0\x4f\xb4\x2f\x1e\xd6\x1b\
-\x9f\x6e\xec\xc2\x7b\x9f\xb6\xe7\x6c\xc4\xc0\x95\xab\x31\xfc\xaa\
-\x0b\xd0\xbd\xa3\x65\xd4\x6b\x16\x6f\xfb\x7e\xfb\xa5\xa7\xbe\x67\
-\x30\x01\xd8\x9c\x01\x60\xf8\xd3\x2b\x94\xf7\x93\xab\x31\xee\x9e\
-\x47\xf0\xe0\xee\xb6\xe4\xcf\x5a\xb6\x57\xfb\x3f\xf4\xb7\xd8\x43\
-\x61\x80\x7c\x87\x7f\x08\xa2\xe6\xc7\x08\x0d\x9a\x8f\x50\x79\x9d\
-\xe5\x72\xdb\x7a\x52\x42\xd7\xf5\x58\x7d\x42\x87\x6c\x7b\xa6\x78\
-\xe1\xdf\x5d\x0e\xd1\x32\x10\x5a\xe3\x70\x68\xbb\x07\x40\x74\x55\
-\x42\x42\x28\x19\xd6\xf9\xf0\x84\x00\xbe\x34\xb3\x0f\xde\xfe\xa8\
-\x1d\xab\x36\x24\x8f\xe7\x93\xcd\xb8\x01\x9f\x6d\x14\xb3\x4e\x9a\
-\xb9\xf9\x91\xcd\x0d\x7b\x6f\x33\xae\x6d\xbf\x6f\xbf\xf4\xd4\xf7\
-\xe2\xa6\x06\xc3\xe6\x60\x37\x10\x90\xd5\xfb\x4a\x14\x43\x2f\x38\
-\x9e\x94\x10\x2f\xbc\x8e\x17\xb7\xed\x4c\xfe\xbc\x65\x7b\x9f\xff\
-\x23\x77\x14\xe8\x6a\xff\xd0\x08\x68\x83\x9f\x45\xa8\xdf\x0d\xd0\
-\xb4\x70\xf6\xe1\x0f\x40\x54\x1c\x5d\xf8\xf0\x17\x02\xa2\xb5\x1f\
-\xb4\x1d\x75\x08\x6d\xdd\x0f\x5a\xcb\xc0\x9e\x2b\xf7\x55\x0e\xeb\
-\x7c\x79\x21\x4d\xe0\xdf\x37\x8e\xc0\xb4\x71\x7b\x2e\x47\xc9\x76\
-\xd0\xa0\x6d\x3b\xa1\x2d\x5a\xd2\xf9\xdc\xc8\x91\xad\x89\xc5\xf2\
-\xfd\xf6\x4b\x4f\x7d\x2f\x6e\xa6\x0c\xfd\xaf\x65\x98\x98\x47\xfe\
-\xf4\x0a\xe2\x5d\xfc\x15\xdc\xfb\xea\xdb\x18\x6c\x7c\x2d\xdb\x11\
-\xfe\x9e\xba\xa7\x30\xf7\xf9\x8b\xaa\x93\x11\x1a\xba\x04\x5a\xd5\
-\x51\xd0\x34\x2d\x27\xe1\x0f\x00\xa2\x6c\x54\xe1\xc2\x5f\x86\x21\
-\x5a\x06\x41\xdb\xbc\x3f\xb4\xc6\xe1\x10\x1d\x55\xa9\x9e\xe2\x61\
-\x9d\x2f\xaf\xba\x42\xc3\xe3\xbf\x19\x89\x03\x47\x57\xe4\x6c\xc4\
-\xc0\xd7\x96\x62\xb0\x6c\x59\x7a\x0f\x02\xb2\xfd\xd2\x53\xdf\x4b\
-\x93\xe7\xd6\x67\x00\xcc\x3d\x05\xc4\xb6\x09\x65\x8a\xa1\x17\x1c\
-\xef\x47\x73\x31\xe3\xa1\xa7\x70\xae\xf1\xb5\x6c\xc7\xf6\x7f\xfa\
-\xde\x02\x8c\xf0\x27\x2a\xa0\xf5\xff\x3d\xb4\x41\x8f\x42\x84\x06\
-\xe4\x36\xfc\x85\x80\xa6\x89\xfc\x87\x7f\x77\x05\xb4\xc6\x61\x08\
-\x6d\xde\x1f\x5a\xf3\xe0\x94\x01\x79\x7a\x3c\x9f\x84\x75\xbe\xbc\
-\xfe\x7d\x43\x78\xf6\x0f\x23\xb1\xf7\x10\xf7\x77\x37\xc4\x96\x27\
-\x75\x49\xfe\xf3\x44\xf4\xec\x43\x0f\xa8\xff\x82\x5b\x4b\xb5\xed\
-\x97\x9e\x2f\x3c\xab\xa7\xfe\x4a\xc0\x62\x1b\x31\x7d\x47\x90\xf8\
-\xbf\xed\x53\x85\x7c\xbc\x72\xe8\x15\xc9\x93\x12\xe2\xb0\x89\xd8\
-\xf1\xd6\xbb\xa8\x4d\xbc\x96\xed\x53\xfd\x16\x3e\x54\x80\xb1\xfd\
-\xc3\xfb\x41\x1b\xf8\x2f\x88\xf2\x89\xf1\xb0\xce\x75\xf8\x6b\x40\
-\xf7\x07\xd0\x37\x8d\xf7\xb6\x7c\x36\xf5\x8a\xae\x2a\x88\x5d\x83\
-\x21\xda\x7b\xdb\x7b\x3e\x0b\xeb\x7c\x7a\x1f\xae\xed\xc0\xb4\xcb\
-\x56\x63\x57\xab\xf3\x27\xa6\x67\xfa\x3c\x4f\x9f\x18\x6e\x79\x75\
-\x59\x77\x5f\x91\xfc\x27\x4b\xdb\x54\xdb\x7e\xe9\xf9\xc2\x4b\x5c\
-\xe7\x97\x98\x5f\x46\x22\xf5\x3d\x1f\xe0\x90\xc5\x0c\x89\xff\x12\
-\x4d\x57\xa8\x18\x7a\x01\xf2\xd6\x7d\x88\xbb\x9f\x7c\x11\x87\x27\
-\x7e\xce\xf6\x6a\xeb\x5b\x6f\x04\x4e\x3e\x36\x3e\x1f\xf2\x13\xfe\
-\xa8\x98\x89\xd0\x90\xe7\x21\xc2\xa3\xf2\x16\xfe\x42\x08\xa0\xf5\
-\x01\xc8\xb6\xa7\x5d\x2f\x5f\xc6\x7a\xbb\x2b\xa0\x35\x0c\x87\xd6\
-\xbc\x17\x44\x77\xb9\xbd\xe7\xe3\xb0\xce\x87\x37\xa8\x5f\x18\xa3\
-\x87\x95\xe3\xe1\x97\x9a\x1d\x99\x76\x9f\xe7\x0d\x9f\xeb\xe5\x1b\
-\x3f\xd2\xf6\x5d\xba\x42\x3e\x62\x67\xa9\xb8\xfd\xd2\x53\xde\x33\
-\x5f\xe4\x9f\x14\xfe\x30\x4e\x60\x08\x7f\x18\xfe\xcf\xf0\xa7\x97\
-\x17\xef\x27\x57\x63\xdc\x3f\x1f\xc1\xdf\xda\x3b\x62\x9f\xb5\x6c\
-\xc3\xff\x9c\x39\xc0\xcf\xbf\x1f\x9f\x0f\x79\x0a\xff\xea\x39\xd0\
-\x06\x3d\x02\x68\xbd\xf2\x1b\xfe\x00\xe4\x8e\xcb\x00\x7d\xab\xab\
-\xe5\x4b\x5b\x6f\x77\x39\xb4\xc6\xa1\xd0\x9a\x86\xc5\xc6\xe0\x77\
-\xe2\xf9\x3c\xac\xf3\xe5\x8d\xaf\xab\xc4\xe6\xed\xdd\x78\x7b\x65\
-\x7b\x46\xd3\xe9\xe7\x79\xcd\x7a\x31\xe1\xfb\x97\xc9\x87\x16\xbe\
-\x85\x6d\xe9\x2c\x15\xb7\x5f\x7a\xbe\xf0\x92\x3e\x84\xe6\xf0\x47\
-\x9a\x5f\x0a\x58\xf4\x14\x14\x28\x86\x5e\x80\xbc\xd7\xde\xc5\xe3\
-\x8d\xcd\xb9\x09\xff\xfd\x47\x03\xb7\xfd\x32\x3e\x1f\xf2\x14\xfe\
-\x7d\xfe\x07\x5a\xed\x2d\x00\xb4\xfc\x87\xff\xae\xdb\x21\xbb\x96\
-\xbb\x5a\x3e\xcb\x7a\xa3\x65\xd0\x76\x0d\x82\x68\xab\x75\x3c\x2c\
-\x6f\x90\xc2\x3a\x5f\xde\x9f\xaf\x19\x8a\xd7\x57\xb4\xe1\xbd\x55\
-\xd6\x9d\x00\x37\x9f\xe7\x86\x66\x5d\xbc\xf5\x7e\xe8\x19\x20\xba\
-\xb7\xd5\xfb\xaa\x6e\xbf\xf4\x7c\xe5\xc9\x48\xa4\x3e\x6a\x35\xbd\
-\x66\x98\xa9\xa7\x31\xfc\xe9\xe5\xd3\xfb\xc6\x25\x98\x1b\x59\x8c\
-\x3a\x20\xfb\xf0\xaf\xac\x00\x1e\xb8\x0d\xe8\xdd\x2b\x5f\xe1\xaf\
-\x01\x35\x3f\x86\x56\xfb\x17\x14\x24\xfc\xdb\x5f\x86\xde\xf0\x1d\
-\x17\xcb\x67\x51\xaf\x06\x68\x2d\x03\x10\xda\xb6\x2f\x44\x2b\xc3\
-\x3f\xd7\x5e\x65\xb9\xc0\x83\x3f\x1f\x81\xde\x55\xa9\xd7\x50\x7b\
-\xf9\x3c\x3f\xb3\x30\x3a\xe2\x1b\x97\x60\xae\xf9\x75\x55\xb7\x5f\
-\x7a\xbe\xf3\xd2\xe6\xb9\xd5\xd5\x81\x0c\x7f\x7a\x79\xf3\x6e\xbe\
-\x19\x15\xcf\x2d\xc4\x6f\x81\xec\xc3\x1f\x00\xfe\xf0\x53\x60\xc2\
-\x01\xf9\x0a\xff\x30\x44\xff\x5b\xa0\xd5\xdc\x80\xc4\xf2\xe6\x35\
-\xfc\x5b\xee\x80\xbe\xf5\xc4\x9e\x87\x01\xd9\x2f\x5f\x6a\xbd\x21\
-\xbd\x0a\xa1\xed\x75\xd0\x9a\xf7\x4a\x1a\xad\xcf\x91\xa7\x40\xb8\
-\xfa\xc5\x1b\x3b\xb2\x02\xb7\x5d\x3b\x34\xe9\xb5\x6c\x3e\xcf\x2f\
-\x2c\x0c\xfd\xfe\xe6\x9b\xd1\xf3\xfd\x8c\xaa\xdb\x2f\x3d\x5f\x79\
-\x12\x36\x17\xf0\xa7\x0c\x0c\xe0\xf6\x17\xfb\x78\xe5\xd0\x2b\x82\
-\xb7\xe4\x65\xdc\xb5\xf2\x53\x54\xe6\x22\xfc\xcf\x3e\x05\xb8\xfc\
-\xdc\x7c\x85\x7f\x19\xc4\xc0\x7f\x41\xf4\xbe\x3c\xe6\xe5\x31\xfc\
-\x65\xe7\x12\xe8\x9f\x1f\x0e\x7d\xc7\xe5\xde\xc3\x3f\x1a\x46\xb8\
-\x79\x18\x42\xdb\x46\x43\x74\x55\xba\xaf\x57\xa1\x70\xf5\x8b\x77\
-\xfe\xf1\xfd\x70\xe9\x97\x6a\xe3\xf3\x67\xf7\x79\xfe\xe0\xd3\x68\
-\xf9\xbb\x8b\x43\xf7\x02\x6a\x6f\xbf\xf4\x7c\xe5\xd9\xde\xbd\xe7\
-\x65\xfb\x09\xca\xca\xa1\x57\x60\x6f\xde\x5c\x0c\xbb\xe5\x5f\x58\
-\xbf\xb3\x51\xa4\x1c\x9a\xba\x0d\xff\xfd\x46\x03\x6f\xfe\x37\x76\
-\xea\x3f\x1f\xa7\xfd\xc5\x80\xbf\x42\xf4\xfa\x5a\xcc\xcb\x57\xf8\
-\xcb\x1d\xd0\x1b\x7e\x04\xd9\x72\x17\x32\x9c\xa5\xb3\x58\xbe\xe4\
-\x7a\xb5\xdd\xb5\x08\xb7\x0e\x81\x70\x71\xc4\x9f\xe4\x29\x18\xae\
-\x7e\xf1\x5a\x3b\x74\x4c\xbb\x6c\x0d\x56\xac\xee\x48\xfe\x3d\x1e\
-\x06\x0d\x1a\xd8\x4f\x93\x57\x9d\x87\xbd\x5f\x5d\x79\xa4\xd5\xd5\
-\x9f\x45\xdf\x7e\xe9\x05\xcf\x73\xbf\xc7\x50\xb8\x18\x7a\x6a\x7b\
-\xef\x7d\x8a\x07\x72\x11\xfe\x42\x00\x77\xfd\x2e\x5f\xe1\x2f\x80\
-\x9a\x1f\xe7\x39\xfc\x01\xb4\xdc\x8a\xe8\xc6\xfd\x21\x5b\xee\x84\
-\xe7\xf0\xd7\xc3\x08\x35\xec\x83\x70\xcb\x50\x86\x7f\x91\xbc\x8a\
-\x32\x0d\x77\x5d\x37\x22\xf6\x37\x4d\xbc\xee\x71\xc4\xc0\xed\x8d\
-\xba\x58\xb9\x56\xb3\xba\x25\x50\x89\xed\x97\x5e\xf0\x3c\xcf\x1d\
-\x00\x15\x8b\xa1\xa7\xae\xf7\xe3\xb9\x62\xe2\xb3\xf5\x62\xa6\xf9\
-\x75\x2f\x3b\xcb\x8b\xbf\x02\x1c\x3e\x25\x4f\xe1\xdf\xfb\x52\x68\
-\x35\xb1\x67\x07\xe7\x23\xfc\x45\xf7\x3b\x90\x9f\x4f\x86\xbe\xf3\
-\x9b\x80\xde\xe0\x7a\xf9\x12\x9a\x68\xef\x8b\xd0\xb6\x31\x08\x75\
-\xf6\x52\x26\x0c\x4b\xd5\x9b\xb4\x7f\x05\xae\x38\xad\x7f\xec\xf5\
-\x2c\x87\x0b\xfe\xef\x8b\xfa\x61\x53\xf6\x7b\xf5\x60\xc3\xcb\x4a\
-\x6c\xbf\xf4\x82\xe9\x79\xea\x00\xa8\x5a\x0c\x3d\x75\xbd\x65\x1f\
-\x60\x7e\xab\xe9\xae\x29\x2f\x3b\xcb\x01\xb5\xc0\xaf\x7f\x94\xa7\
-\xf0\xaf\x3a\x19\x5a\xff\xbf\xc4\xbc\x7c\x84\x7f\xeb\xad\x90\x5b\
-\x66\x40\x76\xbe\xe7\x69\xf9\x24\x00\xe8\x1a\xb4\xc6\xe1\x08\x35\
-\x8c\x40\x08\x21\xe5\xc2\xb0\x54\xbd\x9f\xfd\xcf\x20\x0c\xae\xb5\
-\x7d\xba\x7a\xda\x96\xf8\x9c\xb5\xb6\x4b\xac\xf8\x24\x3a\x3f\xfe\
-\xb2\x32\xdb\x2f\xbd\x60\x7a\xae\x3b\x00\x2a\x17\x43\x4f\x4d\x6f\
-\x4a\xdd\x2b\x33\x22\x8b\x31\xce\xf8\xba\xd7\x23\xa5\x5f\x5c\x0b\
-\xf4\xeb\x9b\x8f\x11\xfe\xa6\x41\x1b\x78\x1f\x80\x50\xee\xc3\x5f\
-\x36\x01\x3b\xcf\x84\xdc\xf9\x6d\x40\x76\xb8\xf3\x60\x78\xf0\x50\
-\x67\x15\xb4\xed\xfb\x42\x6b\xab\x51\x3a\x0c\x4b\xd1\xeb\xdf\x37\
-\x84\xdf\xce\x1d\xe2\x41\x4c\xbd\x80\xf0\xf9\x85\xf2\x80\xc3\xf6\
-\x7b\x79\xaa\x2a\xdb\x2f\xbd\xe0\x7a\xae\x3a\x00\xaa\x17\x43\x4f\
-\x4d\xef\xbd\x55\xd1\xbf\x77\x76\xed\x79\xdd\x6b\xf8\x4f\x9b\x04\
-\x5c\xfc\x95\x3c\x8c\xed\x5f\xb6\x3f\xb4\x41\x8f\x01\xa2\x2a\xe7\
-\xe1\x8f\xce\xb7\x20\xb7\x4e\x05\x5a\x17\x78\x5f\x3e\x00\x62\x77\
-\x7f\x68\xdb\x46\x43\x8b\x86\x95\x0f\xc3\x52\xf5\x2e\x38\xa1\x1f\
-\x8e\x9c\x58\xed\xca\xb4\xfa\x9c\x75\x74\xea\x78\xef\x63\xf1\x0f\
-\xb7\xcb\xe7\x97\xfd\x01\x3d\x35\x3c\xc0\x45\x07\x40\xf5\x62\xe8\
-\xa9\xe9\x4d\xde\xf7\xd5\x29\x2f\xbd\x22\x0f\x4c\xbc\xee\x35\xfc\
-\x43\x21\xe0\xd6\x1b\x45\xd2\x9e\x3b\x27\xe1\x8f\x10\xb4\x01\xf3\
-\x01\xad\x7f\xee\xc3\xbf\xe5\x36\x60\xfb\x2c\x88\xee\xb5\xde\x97\
-\x4f\xc6\x4e\xf9\x6b\x4d\x7b\x41\x68\xfe\x09\xc3\x52\xf5\xfe\xfa\
-\xfd\x61\x08\x87\x9c\xfd\x86\x4c\xb7\x0e\x3e\xbf\x48\x8e\xbd\x7e\
-\x2e\xa6\x3a\x5d\x3e\xbf\xec\x0f\xe8\xa9\xe1\x25\x9a\xa3\x0e\x80\
-\xea\xc5\xd0\x53\xd7\x5b\xb9\xba\xfb\x2f\x1d\x9d\xb1\xd7\xb3\xb9\
-\x40\xea\xca\xf3\x05\x26\x1c\xb8\xe7\xe7\xdc\x84\x3f\x20\x7a\x7d\
-\x25\x2f\x4f\xf5\x93\x4d\x3f\x01\x9a\xbe\x05\x21\x3b\xbd\x2f\x5f\
-\xb4\x0c\xda\xb6\x51\x10\xad\x35\xbe\x0c\xc3\x52\xf4\xc6\x8d\xae\
-\xc0\xb7\xcf\x1e\x60\x6b\xda\x8d\x1b\xd0\xd1\x29\xf1\xc1\x27\xda\
-\x9d\x4e\x96\xcf\x4f\xfb\x03\x7a\xc5\xf7\x12\xe6\xec\xd9\xb3\x84\
-\x6d\x07\x20\xcd\x53\x85\x94\x29\x86\x9e\xba\xde\xd4\xfd\xdf\xd8\
-\xe7\x85\x57\xe4\x24\x20\xbb\xf0\x1f\x3a\x58\x60\x9e\x61\x74\xdc\
-\x5c\x85\x3f\x00\x88\xea\xf3\x72\x1c\xfe\x3a\xe4\xce\xaf\x43\xb4\
-\xfc\x1a\x0e\x9f\xf2\x6a\xb9\x7c\x68\xef\x8d\xd0\xb6\x3a\x88\xee\
-\x4a\xdf\x86\x61\xa9\x7a\x3f\xfd\xda\x20\x8c\x18\x5c\x96\xd6\x74\
-\x3a\x68\xd0\xf3\x8b\xe4\x21\xf3\xbe\x8d\x51\x99\x96\xcf\x4f\xfb\
-\x03\x7a\xc5\xf7\x0c\x26\x00\x9b\x33\x00\x86\xf0\x37\x7f\x62\x95\
-\x28\x86\x9e\xda\xde\x9a\x0d\x1d\xb7\xec\x6e\x85\xc8\xf6\xd6\xa8\
-\x9f\x7c\x1b\xe8\x13\x7f\x74\x7d\x2e\xc3\x1f\x00\xb4\xca\x69\xb9\
-\x0b\x7f\xd9\x09\xb9\xfd\x1c\x88\xb6\x3b\xb3\xbb\x20\xb1\xb5\x1f\
-\xb4\x86\x91\x80\x1e\xf2\x7d\x18\x96\xa2\xd7\xbb\x4a\xc3\x8d\xff\
-\x33\xd8\xf2\x3d\x37\x23\x06\xb6\xb4\x4a\x7c\xb2\x56\xfc\x35\xdd\
-\xef\xf1\xdb\xfe\x80\x5e\x71\xbd\xb8\xa9\xc1\xf0\xf1\xb5\x3b\x03\
-\x60\xf5\xbe\x12\xc5\xd0\x53\xdb\x3b\x64\xef\x0f\xab\x16\xbd\x29\
-\x8f\xcb\x36\xfc\x47\x0c\x05\xce\x3f\x3d\xfe\x33\x72\x1b\xfe\x42\
-\x94\x43\x0b\x0f\xc8\x51\xf8\xb7\x40\x6e\x3b\x05\xa2\xe3\x91\xec\
-\xc2\xbf\x79\x10\xb4\xc6\x61\x80\x0c\x46\x18\x96\xaa\x77\xfe\x09\
-\x35\x18\x35\x34\xf9\x2c\x80\x97\xe1\x82\x5f\x7a\x55\x1c\xff\x87\
-\x6b\x50\x65\x7e\xdd\x6f\xfb\x03\x7a\xc5\xf5\xe2\x66\xca\xd0\xff\
-\x5a\x86\x89\x79\xe4\x4f\xcf\xb3\xd7\xd4\xb6\xed\xe7\x9b\x3e\x97\
-\x9e\x6f\x8c\x4e\xec\x2c\xaf\xb9\x0c\x28\x2f\xcb\x43\xf8\x03\xd0\
-\xb4\x4e\x08\x11\x75\xef\x59\x1d\xf9\x6f\x3b\x0d\xa2\xeb\xc5\xac\
-\x96\x4f\x34\x0e\x85\xd6\x32\x28\x5e\x7f\x70\xc2\xb0\x14\xbd\x70\
-\x48\xe0\xda\xf3\x06\x1a\xe6\x77\x1f\xfe\x00\xb0\x69\xab\xae\x7d\
-\xf8\x39\x7e\x65\x7c\xcd\x8f\xfb\x03\x7a\xc5\xf5\xd2\xe4\xb9\xf5\
-\x19\x00\x73\x4f\x01\xb1\x6d\x42\x99\x62\xe8\xa9\xef\x2d\x5d\xae\
-\x5f\xe8\xd6\x4a\xb4\xc4\xce\x72\xf0\x00\xe0\xd2\xb3\xf3\x14\xfe\
-\x21\x09\x01\x09\xd9\xf5\x91\x3b\xcf\xea\x82\xbf\x1d\x97\x40\x74\
-\xbd\x9c\xc5\xf2\x69\x10\x0d\x7b\xc7\x1e\xdd\x8b\xe2\x87\x17\xbd\
-\xdc\x78\x97\x9e\x52\x8b\xa1\x03\xc2\x59\x3f\x28\x68\xd9\x72\x71\
-\x69\xe2\xdf\x7e\xdd\x1f\xd0\x2b\xaa\x67\xf5\xd4\x5f\x09\x8b\x37\
-\x52\xbe\x23\x88\x37\xdb\xa7\x0a\xf9\x78\xe5\xd0\xcb\xb1\x37\xb1\
-\xee\xe5\xe3\x97\x2e\x47\x8d\x5b\x0f\x48\x3e\x52\xfa\xe6\xa5\x40\
-\x55\x65\xbe\xc2\x3f\xde\x5a\x9f\x70\xee\x59\x85\x7f\xe3\xb5\x10\
-\x1d\x0f\x7a\x5f\xbe\xae\x10\xc4\xf6\x51\x10\x6d\x7d\xe2\xf5\xab\
-\x11\x5e\xf4\xb2\xf7\xca\xcb\x04\xbe\x7b\xce\xa0\xd4\xdf\xe3\xf2\
-\x6b\xb1\x25\xef\xcb\x3e\x3f\xb8\x1c\x27\xfb\x75\x7f\x40\xaf\xa8\
-\x5e\xca\x91\xbf\xd1\xd2\x2c\x66\x30\x36\x09\x86\x3f\x3d\x97\xde\
-\x27\x6b\xe5\x3c\xb7\x1e\x90\x1c\xfe\xb5\x35\xc0\x15\xe7\xe7\x39\
-\xfc\x01\xe8\x2d\xb7\x01\xb2\xdd\xde\xb3\xba\xcf\x7f\xd7\x2d\x10\
-\xbb\xff\x98\x5d\xf8\xef\x1c\x05\xd1\x59\x15\xaf\x5f\x9d\xf0\xa2\
-\x97\x1b\xef\xb2\x39\xfd\x30\xa0\x66\xcf\x37\x61\x5e\xaf\x89\xf9\
-\xf0\x33\xfc\x0c\x3e\xdd\x1f\xd0\x2b\x9a\x67\xfe\x0a\x56\x46\x22\
-\xf5\x49\x4f\x1e\xd3\x4c\x33\x98\x3f\xeb\xba\x42\xc5\xd0\xf3\x81\
-\x77\xfc\xc4\xfa\xea\x57\x96\x60\x92\x5b\xd3\x7c\x9a\xf4\xaa\x0b\
-\x81\x9a\xbe\xf9\x0d\xff\xd8\x12\xaf\x87\xde\xf0\xc3\xcc\x9e\x55\
-\xf8\xb7\x3d\x02\x34\x7f\x2f\xbb\xf0\xdf\x31\x0a\xa2\xb3\x32\x5e\
-\xbf\x7a\xe1\x45\x2f\x7b\xaf\x57\xa5\x86\x6f\x7e\x25\x36\x2e\x40\
-\x36\x17\xc4\xbe\xbe\x44\x9b\x34\x71\xf4\x8a\x5e\xa6\x97\x95\xdf\
-\x1f\xd0\x2b\xaa\x67\x3e\xf2\x4f\x79\xec\x68\xba\x8b\x00\x65\x24\
-\x52\xcf\x23\x7f\x7a\xae\xbd\x4f\x36\xe3\x86\xed\x3b\xdd\x0d\x31\
-\x6d\x0e\xff\xde\xbd\x80\x6f\x5e\x5a\x80\xf0\x4f\xcc\xb3\xeb\x66\
-\xc8\xe6\xdf\x5b\xbf\x67\x15\xfe\xed\xcf\x01\x0d\x17\x43\x38\x7c\
-\x8c\x6f\xca\xf2\x75\x87\x20\x76\xee\x03\xd1\xc5\xf0\x2f\x05\xef\
-\xea\x33\x6a\xd1\xb7\x97\xf7\x27\xaf\x0b\x21\xb0\x6d\xa7\x14\xcd\
-\x2d\x3b\xae\x33\xbc\xec\x8b\xfd\x01\x3d\x25\x3c\x19\x89\xd4\x5b\
-\x5e\xed\xac\x19\x66\xea\x69\x56\x3d\x05\x85\x8a\xa1\xa7\xb0\xb7\
-\x72\x15\xce\x73\x63\x5a\x5d\x20\x75\xf9\xb9\x12\xfd\xfb\xb9\x5d\
-\x3a\x6f\xe1\x9f\x98\x53\x6f\xf8\x1e\xf4\xed\xe7\x00\xd1\xcd\x7b\
-\x5e\x4d\xb9\xda\x7f\x37\x64\xd3\x4f\x81\x1d\x73\x20\x64\x9b\xb7\
-\xe5\xeb\x0e\x41\xec\x1c\xc9\xd3\xfe\x25\xe4\xd5\xf6\x0d\xe1\xaa\
-\xd3\x6b\x3d\x88\xc9\xdb\xc7\xc7\x6b\xc4\x05\xf1\x7f\xfa\x66\x7f\
-\x40\x4f\x09\x2f\x6d\x9e\x0b\xc3\x8c\x00\x92\x2f\x10\x50\xb4\x18\
-\x7a\x8a\x7a\xf3\xbe\x85\x91\xbf\xbe\x1d\x9f\xb5\x3b\x7c\xe0\x5d\
-\xba\xab\xa3\x3f\x7c\x09\xd8\x6f\xb4\xbb\xe5\xf3\x1e\xfe\xe6\x85\
-\xaa\x80\xa8\xfa\x12\x50\x79\x0c\x74\x31\x02\x52\x86\x01\x7d\x13\
-\x64\xc7\x6b\x40\xeb\x02\x68\x62\x67\x76\x57\xfb\x6f\xdf\x07\xa2\
-\xb3\x3a\x5e\xbf\xfa\xe1\x45\x2f\x37\xde\x9a\x4d\x9d\x18\xf3\x95\
-\x4f\xe0\xe6\x5b\x00\xf3\xf6\x51\x59\x21\x70\xed\xe5\x18\xf5\xbf\
-\x37\xeb\x9f\xb9\x5d\xbe\x20\xec\x5f\xe8\xb9\xf6\x6c\xaf\xe1\x4b\
-\x9a\x81\xe1\x4f\x2f\x1b\x6f\xdd\xe7\xb8\x3e\xdb\xf0\x9f\x36\xa9\
-\x88\xe1\x0f\x00\xb2\x03\x7a\xeb\xc3\xd0\x77\x3d\x92\x1b\xcf\xb0\
-\x7c\xa2\x61\x38\xc3\xbf\x44\xbd\xd1\xc3\xca\x31\xe3\xe0\x6a\x2c\
-\x7e\xb7\xd5\x91\x69\xb5\x7d\xb4\xb5\xeb\x58\xbf\x05\xd7\x01\xb8\
-\xc2\xcd\xf2\x05\x65\xff\x42\xcf\xb5\x67\xfb\x35\xbe\x06\xc4\x82\
-\x9f\xe1\x4f\x2f\x5b\xef\xa3\x4f\x31\xc7\x89\x99\xe9\xbe\xe8\xc4\
-\xa8\x7f\x4e\x5b\x4e\xc3\x3f\x8f\x1e\x76\x0d\x81\x68\xeb\x1b\xaf\
-\xdf\x5f\xe1\x45\x2f\x37\xde\x85\x27\xf6\x73\x64\x66\xda\x3e\x56\
-\xae\x16\xa7\xb9\x59\xbe\x20\xed\x5f\xe8\xe5\xde\xf3\x7e\x65\x8a\
-\x82\xc5\xd0\x2b\x9e\x37\x6f\x2e\x86\xbd\xfd\x1e\x86\xd8\x99\x99\
-\x76\x6e\xe5\x65\xc0\xd9\xa7\x38\x5f\x3e\xdf\x84\xff\xee\x5a\x68\
-\xbb\x06\xc4\xeb\xf7\x67\x78\xd1\xcb\xde\x3b\xeb\x98\xbe\xa8\x2c\
-\xcf\xfc\x9b\xec\x06\x0d\x5a\xf2\xae\x1c\x3c\x6f\x2e\x86\x39\x59\
-\xbe\x20\xed\x5f\xe8\xe5\xc7\xf3\xdc\x01\x50\xb1\x18\x7a\xc5\xf3\
-\x36\x35\xe2\x7b\x1d\x36\x4f\xbe\xb5\xdb\xb9\x9d\x78\x34\x1c\x5f\
-\xfc\xe7\x9b\xf0\xef\xec\x0d\xad\x79\x68\xbc\x7e\xff\x86\x17\xbd\
-\xec\xbd\x9a\xde\x21\x9c\x7a\x44\xdf\xb4\xa6\x93\x11\x03\x3b\x3a\
-\x63\xdb\x9a\xdd\xf2\x15\x7b\x7f\x40\xcf\x1f\x9e\xa7\x0e\x80\xaa\
-\xc5\xd0\x2b\x9e\xb7\x7a\x6d\xe6\xd3\xff\x4e\x76\x6e\x17\x9c\xe1\
-\x6c\xf9\xfc\x12\xfe\xb2\xab\x12\xda\xce\x11\x7c\xb0\x0f\xbd\x9e\
-\x76\xe1\x89\x35\x96\xaf\xbb\x19\x2e\x78\xcd\x67\x99\xb7\x35\x15\
-\xf6\x07\xf4\xfc\xe1\xb9\xee\x00\xa8\x5c\x0c\xbd\xe2\x78\x7f\xfb\
-\x1b\xca\x96\xad\x48\xff\xdc\x72\x27\x3b\xb7\xfe\xfd\x80\x93\x8e\
-\xb1\x5f\x3e\xdf\x84\xbf\x0c\x41\xdb\x39\x12\xd0\xb5\xc0\x84\x17\
-\xbd\xec\xbd\xe3\xa7\xf5\xc6\x90\xfe\xc9\x9b\x97\xdb\x67\x05\x2c\
-\x5b\x2e\x46\x3f\xf8\x20\x2c\x1f\xb4\xa5\xc2\xfe\x80\x9e\x7f\x3c\
-\x57\x1d\x00\xd5\x8b\xa1\x57\x1c\xef\x83\xb7\x70\xce\x8e\x06\xeb\
-\xcf\x92\xd3\x9d\xdb\x59\x5f\x8a\x5d\x03\x90\xa9\xf9\x26\xfc\x01\
-\x68\x3b\x47\x40\x44\xc3\x81\x0a\x2f\x7a\xb9\x79\x4a\xe0\x39\xc7\
-\xd5\x18\xe6\x77\x17\xfe\x00\xb0\xbd\x41\x8a\x57\x9e\x4b\x1d\x6f\
-\x43\x95\xfd\x01\x3d\x7f\x78\x80\x8b\x0e\x80\xea\xc5\xd0\x2b\x9e\
-\xb7\x65\x0b\xce\xb7\x7a\xdd\xcd\xce\xcd\xee\xf4\xbf\x9f\xc2\x5f\
-\xec\x1a\x04\xd1\xd1\xab\xe8\x61\x43\x4f\x4d\x2f\x71\x37\x40\x36\
-\x4f\x09\x34\x6f\x73\x2a\xed\x0f\xe8\xa9\xef\x25\x5a\xd8\xc9\x44\
-\xaa\x17\x43\xaf\xb8\xde\xa7\xeb\x30\xd5\xfc\x9a\x9b\x9d\xdb\xf0\
-\xbd\x80\xc3\x26\xa6\xf7\x7d\x15\xfe\xed\xbd\xa0\xb5\x0c\x52\x26\
-\x6c\xe8\xa9\xe7\x4d\xdc\xbf\x12\xa3\x87\x95\x63\xed\xe6\xae\xe4\
-\xdf\xe3\x62\x94\xa0\x4f\xd7\x89\x43\x11\xff\x04\xab\xb6\x3f\xa0\
-\xa7\xb6\x67\x30\xed\xcf\x00\xa4\x79\xaa\x90\x32\xc5\xd0\x2b\xae\
-\x77\xd3\xb5\xe8\xb3\x7c\x25\x6a\x8d\xaf\xb9\x3d\xb2\x39\xf9\x98\
-\xd8\x0e\xd5\xaa\xf9\x29\xfc\x11\x2d\x83\x68\x1c\x11\xf3\x14\x09\
-\x1b\x7a\x6a\x7a\x27\x4e\xef\x93\xfc\xba\xcb\x07\x05\x2d\xff\x48\
-\xf6\xbb\xe9\x5a\xf4\x51\x6d\x7f\x40\x4f\x6d\xcf\x60\x02\xb0\xe9\
-\x00\xa4\x7b\x9e\xb0\x2a\xc5\xd0\x2b\xbe\xb7\x71\x3b\x2e\x6c\x33\
-\x3c\x4d\xd7\xcb\x69\xcd\xe3\x67\x59\xbf\xee\xab\xf0\x97\x02\xda\
-\xce\xbd\xa1\xc9\x90\x72\x61\x43\x4f\x3d\xef\x84\xc3\x7b\xef\x79\
-\xdd\xc3\x53\x02\xdb\x3a\x62\xdb\x1e\x14\xdb\x1f\xd0\x53\xd7\x8b\
-\x9b\x1a\x0c\x1f\x5f\xbb\x33\x00\x56\xef\x2b\x51\x0c\x3d\x35\xbc\
-\xad\xdb\x71\x72\xe2\xdf\x5e\xc2\xbf\x2c\x0c\x1c\xfd\x85\xd4\xd7\
-\x7d\x15\xfe\x00\x44\xcb\x00\x68\xdd\x95\x4a\x86\x0d\x3d\xf5\xbc\
-\xa3\x26\x55\xa3\xbc\x4c\x64\xf5\x88\xe0\xad\xdb\xb5\x2f\x59\xbc\
-\x1c\xa8\xfd\x0b\xbd\xdc\x78\x71\x33\x29\xcf\x23\x91\x7a\x19\xce\
-\x30\x31\x8f\xfc\xe9\xd9\xb6\x0d\x9b\x31\x09\xf0\x7e\x41\xd3\xe4\
-\x09\x40\xdf\xde\xa6\xf9\x90\xcb\xb0\x0e\x41\x86\x06\xc5\xbd\x6d\
-\x00\xa2\x59\x7a\x16\xcb\xd7\x5d\x81\x50\xcb\x60\x65\xc3\x86\x9e\
-\x7a\x5e\xaf\x4a\x0d\x87\x1e\x58\xe9\xf8\xd9\x00\xe6\x26\x84\xc0\
-\xc6\xcd\x72\x62\x45\x4d\xd2\xcb\x45\xdf\x1f\xd0\x53\xd6\x4b\x84\
-\x7f\xd2\xfc\x5a\x9a\x19\xcc\xaf\x4b\xc5\x8a\xa1\xa7\x80\x27\x25\
-\xc4\xc7\xab\x31\x38\x9b\xab\x99\x8f\x9e\x6e\x9a\x0f\xb9\x08\x7f\
-\x0d\xa2\xfa\x74\x68\x83\x9f\x81\xb6\x77\x33\xc4\xd0\x0d\xd0\x86\
-\xaf\x43\x68\xef\x9d\xd0\x06\x3d\x09\xad\xfa\x74\x68\x21\x91\x9b\
-\xf0\x97\x02\xa1\xc6\xe1\x4a\x87\x0d\x3d\x35\xbd\x63\xa6\xf4\xf2\
-\x20\xee\xe9\x6c\x7f\xbc\x46\x0c\x1e\x39\xb2\x35\xb1\x58\x45\xdf\
-\x1f\xd0\x53\xd6\x4b\xc9\xf3\x84\xa5\x59\xcc\x90\xf4\x1d\x41\xbc\
-\xd9\x3e\x55\xc8\xc7\x2b\x87\x9e\x47\xef\xfa\xb9\x62\xea\xb6\x9d\
-\x22\xe5\x33\xe4\xe6\xb4\xe6\xcc\xc3\x0c\xf3\x21\x07\xe1\x1f\x1a\
-\x0e\x6d\xc8\x4b\xd0\x06\x3d\x0c\x54\x7e\x11\xba\xac\xd8\xb3\x3c\
-\xa2\x0a\x5a\xf5\x17\x11\x1e\xf2\x1f\x84\x86\xbc\x04\x84\x86\xbb\
-\xaa\xd7\x6a\xf9\xb4\x5d\x03\x11\x8a\x56\x2a\x1f\x36\xf4\xd4\xf3\
-\x66\x1e\x5c\xed\xda\x34\x76\xb6\xb7\xee\x90\xda\x80\xea\x65\x13\
-\xa1\xc8\xfe\x80\x9e\x92\x5e\xca\x99\x7c\xa3\xa5\x59\xcc\x60\x6c\
-\x12\x0c\x7f\x7a\x69\xbc\x9d\x4d\xa9\x4f\x26\x73\x13\xfe\x42\x00\
-\x87\x4f\x8e\xcf\x87\x1c\x84\x7f\x78\x6f\x84\xf6\x7a\x15\xa2\xf2\
-\x48\x48\x29\xa1\xeb\x7a\xd2\xf2\x08\x21\xa0\x69\x1a\x84\x10\x10\
-\x95\x47\x22\xb4\xd7\xab\x40\x78\x6f\x47\xb4\xe5\xf2\x75\x57\x20\
-\xdc\x3a\xc8\x17\x61\x43\x4f\x3d\x6f\xfa\x84\x6a\x68\x2e\x86\x62\
-\xb3\x3a\xd3\xd6\xd2\xd4\x75\x8a\x2a\xfb\x03\x7a\xca\x79\xe6\xbb\
-\xf7\x64\x24\x52\xaf\x1b\x5f\xd0\x4c\x33\x98\x3f\x61\xba\x42\xc5\
-\xd0\x53\xcc\xdb\xd9\x84\xc3\x8d\xaf\xbb\xbd\xa0\xe9\xc0\x7d\x81\
-\x7e\x7d\x73\x75\xda\x3f\x04\x6d\xe0\x83\x40\x78\xa4\x6d\xf8\xf7\
-\xb4\xf0\x48\x68\x03\x1f\x80\xf5\x5d\xae\x86\xba\xd2\x2c\x5f\xb8\
-\x69\x58\xda\xdb\x17\x6d\x3d\x9f\x87\x17\xbd\xec\xbd\xde\x55\x1a\
-\xc6\xd7\x55\x3a\x32\xd3\x7d\xcd\xb6\xb3\x21\x79\x1b\x74\xd2\xfc\
-\xb2\x7f\xa1\x97\xb5\x67\x3e\xf2\xd7\xcd\xd3\xa6\xbb\x08\x50\x5a\
-\x4d\x1c\xb0\x95\x43\x2f\x4b\x6f\xeb\x36\xb9\x7f\xe2\x75\x2f\x57\
-\x33\x1f\x7a\x48\xee\x2e\xf8\x13\xbd\xce\x85\xa8\x38\xdc\x79\xf8\
-\x27\xde\xab\x98\x0e\xd1\xeb\x5c\xc8\xdd\xf7\x5a\xba\xe9\x96\x2f\
-\xd4\x5e\x0b\xad\xbb\xca\x75\xcd\x41\x09\x2f\x7a\xb9\xf1\x0e\x3d\
-\xb0\x0a\xef\xad\x6a\xcf\x68\x66\xba\xc6\x66\xcb\x76\x8c\x75\xb3\
-\x7c\x7e\xda\xbf\xd0\xcb\x99\x27\x23\x91\xfa\xa8\xd5\xf4\x9a\x61\
-\xa6\x9e\xc6\xf0\xa7\xe7\xc4\xdb\xb8\x15\x83\x00\x6f\xe1\x0f\x00\
-\x13\xc7\xe5\xee\x6a\x7f\xd1\xe7\xeb\xae\xc3\x7f\xcf\xbc\x57\x5a\
-\xbe\x9e\xb6\x73\xa2\x69\x08\x35\x0f\x76\x5d\x6f\xb1\xc3\x86\x9e\
-\x7a\xde\xe4\xb1\x99\xcf\x00\xd8\x5d\x60\xbb\x71\x8b\x70\xfc\x41\
-\xf4\xdb\xfe\x85\x5e\xce\xbc\xb4\x79\x6e\x75\x75\x20\xc3\x9f\x9e\
-\xad\x37\x61\xc2\x27\x15\xeb\x36\xa0\x22\x9b\xfb\x98\x27\x1c\x90\
-\xa3\x5b\xfd\xb4\xbe\x40\xf9\x34\x4f\xe1\x0f\x00\xa2\xe2\x70\x40\
-\x33\x8d\xcc\x86\xf4\x9d\x93\x50\xd3\x60\x40\x66\xfe\xda\xc0\xdc\
-\x54\x08\x1b\x7a\xea\x79\x87\xec\x9b\xbe\x03\xe0\xe4\xee\x9a\xcf\
-\x36\xc8\x8a\x9b\x6f\x46\x85\xdd\xf2\xf9\x6d\xff\x42\x2f\x27\x9e\
-\xed\x35\x7c\x29\x03\x03\xb8\xfd\xc5\x3e\x5e\x39\xf4\xb2\xf0\xc2\
-\xed\x5b\xa6\x77\x74\x7a\x0f\x7f\x21\x04\xc6\x1b\x4e\x5e\x7a\x0e\
-\x7f\x00\x28\x3f\x0c\xba\x2e\x3d\x85\x7f\xac\x69\x40\x68\xcf\xc5\
-\x80\x99\xc2\x5f\xeb\xaa\x84\x68\xeb\xef\x6a\xf1\x54\x09\x1b\x7a\
-\xea\x79\xe3\xeb\xac\xb3\xdb\xe9\xad\xb5\x9d\x5d\xc0\xa6\x8f\x31\
-\x1d\x19\x9a\x1f\xf7\x2f\xf4\x72\xe2\xd9\x5e\xc0\x1f\x06\xbc\x07\
-\xbf\xcf\x57\x0e\xbd\x2c\xbc\xdd\x2d\xdd\x87\xb9\xb5\x12\x4d\x08\
-\x81\xc1\x03\x80\x7e\x35\xf1\x9f\x91\xdd\xa0\x3c\x32\x3c\x15\xc2\
-\x73\xf8\x27\x96\x21\x14\xb3\x90\xf9\x6b\x09\xd1\x34\xd4\x34\x94\
-\x86\xfd\xf2\xa9\x12\x36\xf4\xd4\xf3\x6a\x7a\x87\x30\x7c\x50\x19\
-\x36\x6e\xeb\x32\xcc\xef\x2c\xfc\x13\xad\xb9\x09\x33\x00\xd4\x5b\
-\xbd\xe7\xd7\xfd\x0b\xbd\xc2\x78\x2e\x6e\x42\x51\xbf\x18\x7a\x85\
-\xf3\x76\xb7\x61\xbc\x5b\x0f\xd8\xb3\x73\xdb\xbf\x2e\xfe\x33\xb2\
-\x1f\x91\x0f\x65\x13\x93\x7c\xb7\xe1\x0f\x00\x32\xba\xc1\x3e\xfc\
-\xdb\xfa\x42\x74\x3a\xbf\x77\x5b\xb5\xb0\xa1\xa7\xa6\x37\x76\x64\
-\xb9\x61\x7e\x77\xe1\x0f\x00\xe9\xb6\x45\x3f\xef\x5f\xe8\x15\xc6\
-\xf3\xdc\x01\x50\xb1\x18\x7a\x85\xf3\x9a\x5b\x30\xca\xad\x69\xdc\
-\xb9\xed\x57\x97\xbb\xe1\x78\x45\xd9\xc1\x3d\xbe\x97\xf0\x47\x74\
-\x03\xa4\xde\x90\xf9\x82\x44\x29\x20\x9a\x87\xb8\x5b\x3e\x05\xc3\
-\x86\x9e\x7a\xde\x98\xe1\xe5\xf1\xf9\xdd\x87\x3f\x00\x58\x6d\x8b\
-\x7e\xdf\xbf\xd0\x2b\x8c\xe7\xa9\x03\xa0\x6a\x31\xf4\x0a\xe7\x35\
-\xed\xc2\x5e\x6e\x4c\xf3\xce\x6d\xd4\x88\x1c\x8d\xc5\x2f\x2a\x80\
-\xb2\x31\xde\xc3\x1f\x80\xde\xb1\xc2\xf6\x6e\x04\xd1\x56\x03\x11\
-\x2d\x77\xe4\xa9\x1c\x36\xf4\xd4\xf3\xea\x86\x97\x7b\x0e\x7f\x20\
-\x75\x5b\x0c\xc2\xfe\x85\x5e\x61\x3c\xd7\x1d\x00\x95\x8b\xa1\x57\
-\x38\xaf\xa9\x19\xfd\x9c\x9a\x56\x3b\xb7\xd1\x7b\xe7\xe8\x29\x7c\
-\xe1\x31\x10\x22\xe4\x39\xfc\xa5\x94\xd0\x3b\x96\x67\xbe\x1b\x41\
-\x0a\x88\x5d\x83\x9c\x2f\x9f\xc2\x61\x43\x4f\x3d\x6f\xe4\x5e\xa9\
-\x1d\x4b\x37\x77\xd7\x34\xed\xda\xb3\x2d\x06\x65\xff\x42\xaf\x30\
-\x9e\xab\x0e\x80\xea\xc5\xd0\x2b\x9c\xd7\xd0\x04\x47\x5f\x86\xa7\
-\x3b\xb2\x19\x31\xd4\xed\xd2\xa5\xb9\x40\xaf\x6c\xdf\xec\xc2\x5f\
-\xd7\xa1\x77\x2d\xdf\xe3\x21\xf5\xcc\x84\xd3\xa3\x7f\x3f\x84\x0d\
-\x3d\xf5\xbc\x11\x83\xca\x92\x5f\x77\x79\x6b\x6d\x43\xa3\xa8\x06\
-\x82\xb5\x7f\xa1\x97\x7f\x0f\x70\xd1\x01\x50\xbd\x18\x7a\x85\xf5\
-\x1a\x9a\x50\x66\x67\x66\x3a\xad\x39\xd4\xe5\x38\x3a\x69\x2f\xd0\
-\xab\x18\x9d\x55\xf8\x4b\x29\x81\xae\x0f\xf6\x78\xe6\xaf\x25\xa4\
-\x80\xd8\x65\xbf\xb0\x7e\x09\x1b\x7a\xea\x79\xc3\x06\xee\xd9\xec\
-\xbc\x8c\xab\xd1\xd0\x24\xcb\x8a\xbd\x3f\xa0\xe7\x2f\x2f\xd1\x1c\
-\x75\x00\x54\x2f\x86\x5e\x61\xbd\x3f\x5c\x83\xaa\xc6\xe6\xcc\xfb\
-\x3d\xbb\xef\x34\xf7\x72\x76\x46\x3d\x36\x1f\x32\xdc\x97\x1f\x1a\
-\xe6\xb6\xdc\x94\x11\x03\x65\xe7\x87\x69\x2f\x48\x14\x6d\xfd\x20\
-\xa2\x99\xfb\x3a\x7e\x0a\x1b\x7a\xea\x79\x83\xfb\xc7\x06\x95\xf2\
-\x3a\xa8\x56\x63\x33\xc4\xa4\x91\x1f\xf4\xb6\x78\xcb\x97\xfb\x17\
-\x7a\xf9\xf5\x12\xe6\xec\xd9\xb3\x44\xd8\xc9\x84\xb0\x7e\x5a\x8a\
-\x12\xc5\x14\xc9\xab\x02\x70\x11\x80\xb3\x00\x4c\x02\x32\x7f\x1f\
-\xfe\xc2\x0b\x2f\xa7\xbc\x96\xcd\x08\x7a\x1e\xbd\x26\x00\xef\x00\
-\x78\x08\xc0\x3f\x00\xec\xf6\xba\xfe\x76\xea\x18\x99\xe9\xd7\xd9\
-\x85\x7f\x65\x05\xd0\xdb\xe1\xa3\xd0\xed\x6e\xcd\xb3\x7b\x90\x8f\
-\xd5\x72\x24\x8d\x18\xd8\xbd\x0e\x42\xb6\xa4\xbd\x20\x51\xb4\x0c\
-\xb0\x5f\x3e\x1f\x85\x0d\x3d\xf5\xbc\x5e\x95\x1a\xaa\x2a\x04\x5a\
-\xdb\xbd\xee\x13\x04\x50\xd9\x3c\x12\xc0\xc7\x86\x17\xdd\xee\xff\
-\x04\x80\x13\x00\x5c\xfc\xc2\x0b\x2f\xcf\x00\x30\x0c\x86\x12\x8b\
-\xb0\xbf\x72\xe2\xb5\x0b\x21\x3e\x01\xf0\x34\x20\x6f\xd3\x75\xb9\
-\xd6\xad\x15\x90\x3c\xf2\x62\x02\xb0\x39\x03\x90\xee\x79\xc2\xaa\
-\x14\x53\x24\xef\x28\x00\x1f\x01\xb8\x0d\xc0\xd1\xb0\x09\xff\x6c\
-\xae\xee\xcd\xb1\x57\x13\x5f\xf6\x5b\x10\xdb\x51\x1c\xe7\x75\xfd\
-\x75\x76\x21\xed\x61\xb7\x93\xe5\xeb\x9f\x71\x8d\x19\xe6\x83\xfd\
-\xb3\x02\x64\xf7\x5a\xc7\xeb\xce\xea\x59\x01\xe8\xfe\x28\x7d\xf8\
-\x77\xf4\x86\xe8\x4e\x3f\xca\xaa\x1f\xc3\x86\x9e\x9a\x5e\x6d\x1f\
-\x77\x1d\xd9\x3d\xf3\xc7\x96\x44\xca\xa8\xf1\xaa\x1a\xb7\xfb\xbf\
-\x61\x00\x22\x00\x9e\x12\x42\x9c\x05\x60\x38\x72\x14\xfe\x79\xde\
-\xff\x55\x4a\x29\x27\xe8\xba\x7e\xad\xae\xcb\x95\x00\x7e\x08\x17\
-\x7f\x9a\x80\xe4\x91\x5b\x53\x33\xae\x23\xbb\xaf\x00\xac\xde\x57\
-\xa2\x98\x22\x79\xa7\x00\x78\x1e\xc0\x48\x27\xa6\x42\xe1\x6f\x6e\
-\xc3\x00\x3c\x53\x5f\xbf\xe8\x6c\x9b\x7a\x2d\x5b\x57\x17\x2c\x6f\
-\x88\x77\xba\x7c\xfd\xfa\xda\x2f\xa0\x93\xf0\x07\x00\xb4\xbf\xe4\
-\xa8\xe0\x74\x0f\x0a\x12\x5d\x2f\xa5\xdd\x63\x64\x3a\xfa\xf7\x73\
-\xd8\xd0\x53\xcf\xab\xe9\xed\xfe\x8e\x6c\xe3\xf6\xd6\xd9\x29\x13\
-\xdb\xa4\xdb\xfd\xdf\x3e\x00\x5e\x03\x70\x8c\xc2\xfb\x2b\x27\x5e\
-\x39\x80\x5f\x21\x76\x60\x66\xfb\x27\x0a\x48\x1e\xb9\x35\x53\x86\
-\xfe\xd7\x32\x4c\xcc\x23\xff\x64\x6f\x0c\x80\xfb\x01\xfb\x8b\xdf\
-\x00\xa5\xc3\x3f\xe1\x69\xd1\xa8\xfe\x8f\xc5\x8b\x5f\x3b\xc0\xed\
-\xfa\xeb\x96\xa8\xcd\x66\xf9\xec\x4e\xff\x3b\x0e\x7f\x00\xb2\x6b\
-\x39\x64\xc7\xeb\x99\xbd\x74\x4f\x09\x14\x1d\x40\x9a\xc7\x00\xa3\
-\xab\x1c\xa2\xa3\xb7\xb5\x07\x7f\x87\x0d\x3d\xf5\xbc\x3e\xd5\xee\
-\x3a\x00\xe6\xed\x2d\x0a\x59\x0b\xf7\xfb\xbf\x30\x62\x5f\x09\x8e\
-\xf4\xc1\xfe\xca\xa9\x77\x45\xfc\xbf\xb4\x2d\x20\x79\xe4\xca\x4b\
-\x93\xe7\xd6\x67\x00\xcc\x3d\x05\xc4\x3e\xc3\xca\x14\x53\x24\xef\
-\x26\x00\x8e\xbe\xb9\xf6\xd1\xc6\x54\xd9\xd9\xd9\x75\x53\x9a\x7a\
-\xd3\x36\xbd\x1b\x7d\xd3\x78\x8e\x96\xaf\xba\x2a\xbd\xed\x26\xfc\
-\x7b\xe6\x69\xb8\x06\xe9\x9e\x78\x99\xe9\x11\xc1\xb2\xf9\x46\x20\
-\xba\xc5\x72\x3e\xad\xd5\xfa\x81\x3f\x41\x08\x1b\x7a\xea\x79\xbd\
-\x2a\x9d\x77\x00\x2c\xef\x7a\x89\x46\xab\x3c\xec\xff\x2e\x06\x30\
-\xd5\x47\xfb\x2b\xa7\xde\xaf\x10\xfb\xca\x33\xa5\x05\x28\x8f\xdc\
-\x78\x56\x4f\xfd\x95\xb0\x78\x23\xe5\x3b\x82\x78\xb3\x7d\xaa\x90\
-\x8f\x57\x8e\x13\x6f\x08\x80\x2f\x3b\x31\x15\xf8\xf0\xbb\xf2\xa4\
-\x94\x27\xbe\xf8\xe2\xc2\x61\x6e\xd6\x9f\x1e\xdd\x33\x06\x80\x97\
-\xe5\xab\x4c\xf3\xb5\xba\x97\xf0\x07\x00\xd9\xf1\x3a\xf4\x9d\x57\
-\x5b\x2e\x47\xba\xf0\x47\xeb\x83\x90\x4d\xbf\x49\x03\x86\x2c\x9f\
-\xf8\x17\x94\xb0\xa1\xa7\x9e\x57\x51\xee\xec\x37\xa4\xdb\xde\xf4\
-\x28\x7a\x3b\x02\x92\xdb\x95\x7e\xdb\x5f\x39\xf4\xfa\x21\x76\x81\
-\x76\x52\x0b\x50\x1e\xb9\xf1\x52\x8e\xfc\x8d\x96\x66\x31\x83\xb1\
-\x49\x30\xfc\x01\x60\x16\xec\xaf\x97\x50\xe5\xc3\xef\xda\xd3\x75\
-\xfd\x68\x57\x90\x1e\xfb\x1a\xc4\xeb\xf2\x95\x59\x7c\x89\xe2\x35\
-\xfc\x7b\xe6\xdf\x75\x3b\xf4\x6d\x67\x03\x7a\x83\xb1\x2e\x8b\xf0\
-\x97\x40\xf3\x2f\xa1\x6f\x3f\x0f\xe9\xce\x1a\x88\xd6\x1a\x40\x37\
-\x75\x94\x10\x9c\xb0\xa1\xa7\x9e\x57\x16\xb6\xff\x2d\x19\xb7\x37\
-\xdd\xd9\x57\x93\x89\x16\x0a\x85\x6a\x85\x10\x53\xd2\x7a\x1e\x9a\
-\x62\xfb\xbf\x63\x8d\x3f\x04\x2c\x8f\x9c\x7a\xe6\x2b\x4b\x65\x24\
-\x52\x9f\xb4\xd3\xd3\x4c\x33\x98\xd7\xb8\xae\x50\x31\xc5\xf4\xf6\
-\xb1\x33\x15\xfb\xf0\xbb\xf5\x46\xbb\xb1\xa2\x80\xc8\x66\xf9\xac\
-\x7a\x99\xd9\x84\x7f\x8f\xd3\xfa\x20\xa2\x1b\xf7\x43\xb4\xf1\xc7\
-\x88\xb6\xbf\x0d\x29\xe3\x8f\x58\x95\x5d\x10\xdd\x1f\x41\xec\xbe\
-\x19\xfa\xe6\x71\xd0\x1b\x7f\x1c\xab\x22\xdd\xf2\xb5\xf5\x4b\x5d\
-\xbe\x00\x85\x0d\x3d\xf5\x3c\xbb\xdf\x63\xb7\xbd\x45\x5d\x5e\xfd\
-\x1e\x0a\x85\x46\x67\xf2\xdc\x36\x05\xf7\x7f\x3d\xf5\x29\x90\x1f\
-\xc5\xf2\xcc\x47\xfe\x29\x47\x3c\xe9\xc6\x01\x90\x56\x13\x07\x6c\
-\xe5\xe4\xc4\x03\x94\xfc\xf0\xe7\xcd\x9b\x3d\x7b\x96\x90\x72\xa1\
-\x06\xc8\x9c\x78\xb9\x0a\xff\x1e\x4f\xdf\x01\x7d\xe7\x2f\x21\xf1\
-\xcb\x1e\x2d\xe6\x39\xfc\x38\x47\xcb\x20\x3a\xf7\x5c\xa4\xa0\x42\
-\x38\xd0\x2b\x5d\x2f\x36\x7f\x6e\xb7\x5f\x00\x61\x8b\xaf\x02\x3d\
-\x2e\x9d\xfa\xfb\x2b\x28\x9c\x1f\x05\xf2\x64\x24\x52\x6f\x79\xc4\
-\xa3\x19\x66\xea\x69\x0c\xff\x94\xf6\x59\xba\x37\x54\xfe\xf0\xbb\
-\xf0\xd6\x38\xb1\x12\xeb\x2f\x64\x4a\x7f\xb7\xcb\x27\x0d\xff\xcf\
-\x69\xf8\x5b\x7a\x12\x5a\x48\x77\xec\x89\xd6\xda\x64\x4f\xe1\x70\
-\xa0\x17\x1c\x2f\xdd\x16\xe4\x74\x7f\x10\x4a\x4f\xf4\x34\xe3\xfe\
-\xaf\xba\xba\x6a\x7d\x26\xcf\x69\x53\x78\xff\xb7\x46\xa1\xfc\x28\
-\xb6\x97\x36\xcf\xad\xae\x0e\x64\xf8\xa7\xb6\x7a\x58\xac\x44\x85\
-\x3f\xfc\x6e\xbd\x17\xed\xac\xa4\xf5\xa7\xa1\x3b\x9b\xe5\xeb\xea\
-\x2a\x54\xf8\xbb\xf7\x44\x6b\xcd\x1e\x4f\x91\x70\xa0\x17\x7c\xaf\
-\xab\x3b\x75\x3b\x72\xb5\x3f\xd0\xd0\x95\xc9\x37\xef\xff\xa6\x4c\
-\x99\xd8\x28\x04\x96\xfa\x74\x7f\xe5\xa4\xbd\x00\x75\xf2\xa3\x58\
-\x9e\xed\x35\x7c\x29\x03\x03\xb8\xfd\xc5\x3e\x5e\x39\x6e\xbc\x2d\
-\x00\x1e\x35\xbe\xa0\xf8\x87\xdf\x8d\xf7\x14\x80\x75\x99\x2c\xf3\
-\xfa\x13\x21\xd1\x9a\xcd\xf2\x75\x74\x2a\x1a\xfe\x5d\x55\x10\xd1\
-\x72\xe5\xc2\x81\x5e\xf0\xbd\x8e\xce\xe4\x6d\xc9\xed\xfe\x40\x0b\
-\xa1\x25\xdd\x7b\xe9\xf6\x7f\xba\x2e\x6f\xf3\x50\xae\xa7\xe5\x2b\
-\xb0\xd7\xd8\xaf\x5f\xcd\x23\x16\xaf\x07\x25\x8f\x9c\x7a\xb6\x17\
-\xf0\x87\x01\xef\xc1\xef\xf3\x95\xe3\xd6\xfb\x01\x62\x63\x65\xf7\
-\x52\xfc\xc3\xef\xc6\x6b\x07\xf0\xbd\x4c\x96\xd5\xfa\xd3\xc2\x68\
-\xce\x66\xf9\x76\xb7\xaa\x17\xfe\x00\x20\xda\x6a\x94\x0c\x07\x7a\
-\xc1\xf7\x76\xb7\xeb\x86\xf9\xdd\xef\x0f\xb4\xb0\x75\x07\x20\xd3\
-\xfe\x0f\xc0\xdd\x88\x0d\x9a\x33\xd5\x4d\xcd\xaa\xef\xff\x42\xa1\
-\xd0\x8f\xa7\x4e\x9d\xd4\x6c\xae\x37\x60\x79\x94\x13\xcf\xfd\xf8\
-\x93\x0a\x17\x93\x67\xef\x53\x21\xc4\xb9\x42\x88\x94\x53\x6d\x2a\
-\x7d\xf8\x5d\x78\x3a\x80\x0b\x01\x7c\x98\xce\x4a\xb7\xfe\xca\x35\
-\x7d\x7b\x36\xcb\xb7\xbb\xd5\xf0\x33\xd4\x08\x7f\x00\x90\x6d\x35\
-\x4a\x86\x03\xbd\xe0\x7b\xbb\x5a\xf5\xf8\xfc\xde\xf6\x07\x61\x81\
-\x06\xf3\x6b\x0e\xf6\x7f\xdd\x00\xce\x84\xcd\x19\x40\x63\x53\x3d\
-\xfc\x35\x4d\xbb\xe3\xb0\xc3\xa6\xdc\x91\xa6\x5e\x57\x4d\xf1\x3c\
-\xca\x89\xe7\xb9\x03\xa0\x62\x31\xf9\xf6\x8e\x3d\xf6\xa8\xa7\xc3\
-\xe1\xf0\x09\x42\xc0\xef\x17\xd0\x6c\x42\xec\x6c\xc6\x7f\xbc\xac\
-\xbf\xb2\x32\xb9\x05\x1e\x5a\x62\xf9\x9a\x76\xc5\x7f\x86\x42\xe1\
-\xdf\x55\x01\xd9\x15\x56\x32\x1c\xe8\x05\xdf\x6b\x6a\xd1\xb3\xda\
-\x1f\x54\x54\xe0\x73\xe3\xcf\x2e\xf6\x7f\x9f\x01\x98\x0e\x07\xd7\
-\x01\x29\x1e\xfe\x9d\xa1\x90\x76\xfd\xb4\x69\x53\xe7\xf6\xea\x55\
-\x6d\x44\x94\xc9\x0f\x15\x3d\x4f\x1d\x00\x55\x8b\x29\x84\x77\xd4\
-\x51\x33\x16\x0d\x19\x32\x78\xbc\xa6\x69\x73\xa5\x94\x2f\x01\x68\
-\xf4\xb2\x0e\x8b\xb0\x31\x35\x01\x78\x19\xc0\x37\x00\xec\x8f\xd8\
-\x43\x8d\x3c\xad\xbf\xf2\x32\x6c\xca\x66\xf9\x1a\x9a\x14\x0b\x7f\
-\x00\x72\x77\x8d\xb2\xe1\x40\x2f\xf8\x5e\x63\x4b\xea\xb5\xd7\x6e\
-\xf6\x07\xe1\x10\x36\x27\xfe\xed\x61\xff\xb7\x09\xc0\x6c\x00\x27\
-\x01\x78\x10\xc0\x46\x98\xee\x2a\x50\x34\xfc\xdb\x01\xbc\x07\xe0\
-\xd7\x55\x55\x95\x07\x1d\x7d\xf4\x91\xbf\x65\xf8\xbb\xf3\xc2\x6e\
-\x26\x56\xbd\x98\x42\x79\xe3\xc6\x1d\xd8\x36\x6e\x1c\xfe\x1a\x89\
-\xd4\xff\x45\xc5\xe5\xcb\xb7\xd7\x5f\xc3\x3a\x21\x92\x77\x80\x99\
-\x9a\x79\x63\x6f\x6d\x8b\x5d\xf4\x94\xe9\x99\x00\xe9\x5a\xbe\xee\
-\x1e\x10\x1d\x7d\x0c\xcb\xab\x56\x38\xd0\x0b\xb6\xd7\xd2\xaa\xa3\
-\xb5\x3d\xb9\x03\xe0\x26\x0c\x85\x88\x6d\x93\x40\x56\xfb\x03\x09\
-\xe0\xe9\xf8\x7f\x3d\x2d\x08\xfb\x2b\x7a\xe9\x9b\xab\xcf\xac\xea\
-\xc5\xd0\x2b\x9c\x57\x5b\x03\xbd\xa1\xc9\xfe\xf3\x93\xae\xa7\xff\
-\xc9\x22\x60\xf4\xde\xee\x96\x2f\x6f\xb7\x0e\xca\x10\x42\x9f\x8f\
-\x05\xa4\x7a\xe1\x40\x2f\xf8\xde\x9a\x4d\x5d\xd8\xff\xec\x4f\xf6\
-\xbc\xee\xf2\x48\xb8\xb6\x06\xb2\xa1\x09\x5a\x90\xf6\x2f\xf4\xf2\
-\xef\x01\x2e\xbe\x02\x50\xbd\x18\x7a\x85\xf5\x6a\x6b\x32\xdf\x77\
-\x0c\x64\x3e\xcd\xb7\xd9\xe5\x55\x04\x79\x0b\x7f\x00\xa2\xbd\x37\
-\xc3\x9f\x5e\xd1\xbc\x4d\xdb\xbb\xf7\xbc\xee\xe1\xb4\x7a\xbf\x1a\
-\x74\x15\x7b\x7f\x40\xcf\x5f\x5e\xa2\x39\xfa\x0a\x40\xf5\x62\xe8\
-\x15\xde\xab\xad\x41\x2b\x80\xf2\x74\xa6\xdd\x77\x7c\xeb\x37\xc3\
-\x71\xcb\x67\xf8\x03\x80\x68\xef\xa3\x6c\x38\xd0\x0b\xbe\xb7\x61\
-\x5b\xac\x2f\xed\xf5\x3b\xf5\xfe\xb1\x6d\x31\x50\xfb\x17\x7a\xf9\
-\xf3\x0c\xa6\xfd\x19\x80\x34\x4f\x15\x52\xa6\x18\x7a\xc5\xf1\x6a\
-\xfa\xa6\xbf\xf8\xd1\xc9\x05\x3e\x6b\x37\x38\x5b\xbe\x7c\x87\x3f\
-\x00\x88\xae\x6a\x65\xc3\x81\x5e\xf0\xbd\xcf\x36\x77\x65\x75\x41\
-\x5d\x4d\x5f\xd1\x64\xf1\xb2\xaf\xf7\x2f\xf4\xf2\xe3\x19\x4c\x00\
-\x36\x1d\x80\x74\xcf\x13\x56\xa5\x18\x7a\xc5\xf3\x6a\xfa\x24\xdf\
-\x76\x94\x68\x4e\xaf\xee\x5d\xbb\x1e\xb6\xad\x20\xe1\x1f\x2d\x43\
-\x48\x86\x95\x0d\x07\x7a\xc1\xf7\xd6\x6c\xea\xf0\xa0\x25\xe6\x17\
-\xa8\xe9\x23\xcc\xdb\xa2\xef\xf7\x2f\xf4\xf2\x16\xfe\x1a\x0c\x1f\
-\x5f\xbb\x33\x00\x56\xef\x2b\x51\x0c\xbd\xe2\x7a\x7d\x7b\x63\xad\
-\xf9\x35\x37\xb7\xf6\xac\x5a\x8b\x8c\xad\x20\xe1\x0f\x20\x14\xad\
-\x54\x3a\x1c\xe8\x05\xdf\xfb\x74\x63\xa7\x07\x71\xcf\xf6\xd6\xa7\
-\x77\xd2\xc3\xca\x02\xb1\x7f\xa1\x97\xb7\xf0\xef\x69\x91\x48\xbd\
-\x0c\x67\x98\x98\x47\xfe\xf4\xd2\xb6\x5e\x55\x58\x6e\xfc\xd9\xed\
-\x7d\xbd\x1f\xaf\x4e\x6f\x17\x2a\xfc\xb5\x90\x84\xd6\x59\xed\xcd\
-\xf3\x69\xd8\xd0\x53\xcf\x5b\xb9\xce\x7d\x07\xc0\xb8\xbd\x55\x57\
-\x8a\x15\xf1\x7f\x06\x66\xff\x42\x2f\xe7\x5e\x22\xfc\x93\xe6\xd7\
-\xd2\xcc\x90\xf2\x94\x40\xc5\x8a\xa1\x57\x64\xaf\x6f\x0d\x5e\x4b\
-\xfc\xdb\xcb\xa0\x1e\x1b\x3f\xdf\x33\x22\x60\xd2\x7c\x28\xf0\x83\
-\x82\xba\xdc\x75\x00\xfc\x1e\x36\xf4\xd4\xf2\x9a\x5a\xa2\xd8\xb8\
-\xcd\xf6\x86\x9a\xa4\x66\xde\xde\x7a\xf7\x11\xaf\x20\x60\xfb\x17\
-\x7a\x39\xf5\xac\x9e\xfa\x2b\x61\xf1\x46\xca\x77\x04\xf1\x66\xfb\
-\x54\x21\x1f\xaf\x1c\x7a\x1e\xbc\x61\xfb\xe3\x95\xf2\xb2\xec\x46\
-\xf4\x5a\xb1\xd2\x34\x1f\x0a\x1c\xfe\x52\x83\xe8\x74\x3e\x1a\x91\
-\xdf\xc3\x86\x9e\x7a\xde\xf2\xd5\xee\xbe\xff\x37\x6f\x6f\xe5\x65\
-\xc0\x90\x3a\xed\x95\x62\xef\x0f\xe8\x29\xeb\xa5\x9c\xc9\x37\x5a\
-\x9a\xc5\x0c\xc6\x26\xc1\xf0\xa7\x67\xd1\x1e\x7f\x7c\x56\xe7\x3e\
-\x7b\x8b\x94\xbd\x97\x9b\xab\x99\xdf\x35\x3c\x86\xa8\xe0\xe1\x0f\
-\x40\x74\x55\xba\xf3\x7c\x1e\x36\xf4\xd4\xf3\xde\x5d\xd5\xee\xd8\
-\xb4\xea\x6c\xef\x3d\x5c\x76\x7c\xff\xfb\x9d\xce\x91\x78\x53\x7d\
-\xff\x42\x2f\x27\x9e\xf9\xee\x3d\x19\x89\xd4\x27\x0d\x39\xa9\x99\
-\x66\x30\x7f\xc2\x74\x85\x8a\xa1\xa7\x98\x37\x7c\x30\xb6\x19\x5f\
-\x77\x7b\x2b\xd3\xb2\xf8\x55\x04\xc5\x08\x7f\x00\x80\xc3\x0e\x40\
-\x50\xc2\x86\x9e\x7a\xde\xd2\x95\xce\xb2\x3b\xdd\x99\xb6\x11\x43\
-\xb0\xd5\xed\xf2\xf9\x65\xff\x42\x2f\x6b\xcf\x7c\xe4\x9f\xf2\xc0\
-\x89\x74\x17\x01\x4a\xab\x89\x03\xb6\x72\xe8\x65\xe9\x0d\x1e\x24\
-\x3e\x06\xe4\x08\xc0\xdb\x20\x26\x4b\xde\x2b\x62\xf8\x03\x10\xd1\
-\x72\x67\x5e\x40\xc2\x86\x9e\x7a\xde\x5b\x1f\xb6\xd9\x9a\x99\xbe\
-\x66\x1b\x32\x10\x2b\x6d\x01\x43\xf3\xd3\xfe\x85\x5e\xce\x3c\x19\
-\x89\xd4\x47\xad\xa6\xd7\x0c\x33\xf5\x34\x86\x3f\x3d\x27\x5e\xff\
-\x1a\xbc\x0e\x78\x1f\xc1\x6c\xf9\x4a\xa0\xb9\xb9\x38\xe1\x0f\xc0\
-\xf6\x0c\x40\xb1\xc3\x81\x5e\xb0\xbd\x96\x36\x1d\xcb\x57\x67\x3e\
-\x03\x60\x77\x8d\x4d\xff\xda\xd8\x36\xe8\xa4\xf9\x6d\xff\x42\x2f\
-\x67\x5e\xda\x3c\xb7\xba\x3a\x90\xe1\x4f\xcf\x91\xd7\xb7\x4f\xe8\
-\x89\x6c\x46\x30\x93\x52\xe0\x8d\x65\x7b\x7e\x2e\x68\xf8\x03\x40\
-\x77\x45\x66\x2f\x40\x61\x43\x4f\x3d\xef\xb5\xf7\x5b\xa1\x67\xd8\
-\xdb\x3a\xb9\xc0\xb6\x76\x00\x1e\x75\xb2\x7c\x7e\xdc\xbf\xd0\xcb\
-\xda\xb3\xbd\x86\x2f\x65\x60\x00\xb7\xbf\xd8\xc7\x2b\x87\x5e\x96\
-\xde\x8c\x13\x06\xbf\x39\x78\x00\x3c\x75\x18\x13\x3b\xb7\x57\xdf\
-\x8e\xff\x8c\x02\x87\xbf\xae\x41\x44\xc3\xe9\xbd\x80\x85\x0d\x3d\
-\xf5\xbc\xc5\xef\xb5\xa6\x7d\xcf\x49\xf8\x0f\x1e\x00\xfd\x17\x7f\
-\xc4\x32\xd8\x34\xbf\xee\x5f\xe8\x65\xed\xd9\x5e\xc0\xaf\x01\xb1\
-\xe0\x67\xf8\xd3\x73\xeb\xcd\x99\xb3\x51\xdf\xbf\xce\xfd\x45\x48\
-\xc6\x9d\x5b\xfd\xeb\x45\x08\x7f\x00\x22\x5a\x91\xde\x53\x20\x1c\
-\xe8\x05\xdf\x7b\xf1\xed\xdd\x96\xaf\x3b\xbd\xb5\x76\xff\x3a\x6c\
-\x15\xc9\x1f\xfd\x94\xe6\xe7\xfd\x0b\xbd\xfc\x7b\x8e\x1f\x07\xec\
-\x87\x62\xe8\x15\xde\x1b\x31\xd4\xfe\x08\xc4\xd8\xcc\x3b\xb7\xb7\
-\xde\x01\x3a\x3a\x0b\x1b\xfe\x00\x80\xae\x0a\x6b\x4f\x91\x70\xa0\
-\x17\x6c\xaf\xb5\x5d\xc7\x9b\x1f\xa4\x5e\x00\xe8\x66\x5c\x0d\xbb\
-\x6d\x2f\x08\xfb\x17\x7a\xf9\xf5\x3c\x77\x00\x54\x2c\x86\x5e\xe1\
-\xbd\xc1\x03\xf1\xa4\x53\xd3\x6a\xe7\xd6\xd1\x29\x51\xff\x9a\x53\
-\x61\x4f\xcb\xfa\xee\x01\xbd\x3c\xd5\x53\x24\x1c\xe8\x05\xdf\x7b\
-\x69\xe9\x6e\x74\x76\x25\x6f\x96\x6e\x07\xd5\xca\xb4\xed\x05\x65\
-\xff\x42\x2f\xbf\x9e\xa7\x0e\x80\xaa\xc5\xd0\x2b\xbc\x37\x7c\x20\
-\xee\xa9\x72\x70\x3b\x7d\xa6\x9d\xdb\xb3\x2f\xbb\x5b\xbe\x5c\xdc\
-\x3a\x68\xfc\xfe\x5f\xb5\x70\xa0\x17\x7c\xef\xe9\xd7\x5a\x92\x7e\
-\x76\x1b\xfe\x55\x95\xb1\x6d\xcf\xea\xbd\x20\xed\x5f\xe8\xe5\xd7\
-\x73\xfd\xf9\x57\xb9\x18\x7a\xc5\xf1\x0e\x3d\x04\x3b\xdf\x7a\x17\
-\xb5\xe9\x4c\xbb\x9d\xdb\xa8\x11\xc0\xaa\xc5\xce\x96\x2f\x17\xe1\
-\x0f\x00\xda\x8e\x7d\x20\x3a\x7a\x2b\x19\x0e\xf4\x82\xef\x8d\x3e\
-\xe3\x63\xac\xdd\xdc\x15\x9f\xdf\x5d\xf8\x03\xc0\xa1\x87\xa0\xe1\
-\xad\x77\xd1\xdf\xfc\xba\x0a\xfb\x03\x7a\xfe\xf1\x5c\x9d\x01\x50\
-\xbd\x18\x7a\xc5\xf1\xc6\x8c\xc4\x92\x74\xef\x39\xd9\xb9\xad\xdd\
-\x00\xbc\xb3\x02\xb6\x2d\x57\xe1\x0f\x00\xd0\xc3\xca\x86\x03\xbd\
-\x60\x7b\xcb\x3e\x6e\xcf\x2a\xfc\x01\xeb\x6d\x4e\x95\xfd\x01\x3d\
-\x7f\x78\x80\x8b\x0e\x80\xea\xc5\xd0\x2b\x9e\x37\x64\x08\xe6\x5b\
-\xbd\xee\x66\xe7\x36\xff\x91\xcc\xcb\x97\xd3\xf0\x07\x20\xa3\x61\
-\x25\xc3\x81\x5e\xf0\xbd\x7b\x9e\x6e\x8c\xcf\xef\x2d\xfc\x81\xd4\
-\x6d\x4e\xa5\xfd\x01\x3d\xf5\xbd\x44\x73\xd4\x01\x50\xbd\x18\x7a\
-\xc5\xf5\x0e\x3a\x14\xf7\x0f\xa8\x4d\x1e\x0f\xc0\xed\xce\xed\xfe\
-\xc7\x80\x68\xd4\xfa\xbd\x9c\x87\x3f\x62\x1d\x00\x15\xc3\x81\x5e\
-\xb0\xbd\xee\xa8\xc4\xfd\xcf\x37\x65\x15\xfe\x03\x6a\xa1\xcf\xf8\
-\x22\xfe\x95\xf8\x59\xb5\xfd\x01\x3d\xb5\xbd\x84\x39\x7b\xf6\x2c\
-\x61\xdb\x01\x48\xf3\x54\x21\x65\x8a\xa1\x57\x7c\xef\x8a\x2b\xd0\
-\x35\x69\x1c\xd6\x26\x7e\xf6\xb2\x73\xdb\xb2\x1d\x78\x6e\x61\xea\
-\xeb\xf9\x08\x7f\x3d\x2a\x20\x0d\xdd\x15\x55\xc2\x81\x5e\xf0\xbd\
-\x67\xdf\x68\xc1\xd6\x86\xd4\x9e\xae\x9b\x11\x35\x27\x8d\xc3\xda\
-\xb3\xce\x42\x14\x50\x73\x7f\x40\x4f\x5d\xcf\x60\x02\xb0\x39\x03\
-\x90\xee\x79\xc2\xaa\x14\x43\x4f\x1d\xaf\x6e\x14\x1e\x03\xb2\x3b\
-\xad\x79\xef\xc3\xa6\xf9\x50\x80\x07\x05\x29\x14\x0e\xf4\x82\xef\
-\xdd\xf3\x74\x73\xea\xeb\x2e\x87\xd3\x4e\x6c\x6b\x2a\xef\x0f\xe8\
-\xa9\xe7\xc5\x4d\x0d\x86\x8f\xaf\xdd\x19\x00\xab\xf7\x95\x28\x86\
-\x9e\x5a\xde\x5e\x35\xda\xef\x2b\x2b\xbc\x87\x3f\x00\x3c\xfe\x3c\
-\xd0\xb4\x2b\x3e\x1f\x18\xfe\xf4\x82\xe5\x35\x34\x47\xf1\xc4\xe2\
-\xe4\x0e\x80\xdb\xf0\xaf\x28\x07\x86\xf5\xc3\xef\x54\xdf\x1f\xd0\
-\x53\xcb\x8b\x9b\x29\x43\xff\x6b\x19\x26\xe6\x91\x3f\x3d\xc7\xde\
-\xab\x2b\x8f\xdc\x3a\x79\x02\xb6\x18\x5f\x77\xbb\x73\x6b\xef\x00\
-\x1e\x7a\x92\xe1\x4f\x2f\x98\xde\x7f\x5e\xda\x85\xf6\xce\x3d\xa8\
-\x97\x07\x69\x4d\x39\x18\x5b\x16\x7f\x34\x6b\x33\x14\xdf\x1f\xd0\
-\x53\xcb\x4b\x93\xe7\xd6\x67\x00\xcc\x3d\x05\xc4\x3e\xc3\xca\x14\
-\x43\x4f\x4d\x6f\x6c\x9d\x78\x22\xf1\xba\xd7\xa7\x04\xde\xfb\x48\
-\x01\xc2\x1f\xea\x85\x03\xbd\xe0\x7b\xf3\x9f\x69\xdc\xf3\xba\xc7\
-\xed\xe3\x80\x31\x78\x0c\x3e\xd9\x1f\xd0\x53\xc6\xb3\x7a\xea\xaf\
-\x84\xc5\x1b\x29\xdf\x11\xc4\x9b\xed\x53\x85\x7c\xbc\x72\xe8\xe5\
-\xc8\x1b\x3c\xa0\xe2\x57\x95\x15\xde\x77\x6e\x00\xf0\xea\x12\x81\
-\x35\xeb\xf7\xfc\x9c\x97\xf0\xcf\xc6\xf3\x49\xd8\xd0\x53\xcb\x5b\
-\xb3\xb9\x0b\xaf\xbe\x1f\x7b\xfa\x9f\xd7\xed\xa3\xb2\x02\x18\xdc\
-\xbf\xea\x26\x8b\xb7\x94\xdc\x1f\xd0\x53\xc2\x4b\x39\xf2\x37\x5a\
-\x9a\xc5\x0c\xc6\x26\xc1\xf0\xa7\xe7\xd0\x7b\xfb\x93\x69\xeb\x0f\
-\x3b\x44\x6e\x74\x6b\x25\x9a\x10\x02\x52\x02\x77\x3f\x18\xff\x19\
-\x0c\x7f\x7a\xc1\xf0\xee\x7a\xa2\x01\x52\x66\xd7\x39\x9e\x36\x51\
-\x6c\x5c\xf2\xc9\xb4\xf5\xa6\x97\x95\xdd\x1f\xd0\x2b\xba\x67\xbe\
-\x7b\x4f\x46\x22\xf5\x49\xb7\x6b\x6b\xa6\x19\xcc\x9f\x75\x5d\xa1\
-\x62\xe8\xf9\xc0\x1b\xbb\xef\x9e\xfb\x93\xdd\x34\xe3\xdd\x03\xb7\
-\xcf\x07\x9a\x77\x31\xfc\xe9\x05\xc3\x6b\xde\x1d\xc5\xed\x0b\x1a\
-\xb2\x0a\x7f\x21\x04\xc6\xd6\x89\xfb\x4c\x2f\x2b\xbf\x3f\xa0\x57\
-\x54\xcf\x7c\xe4\xaf\x9b\xa7\x4d\x77\x11\xa0\x8c\x44\xea\x79\xe4\
-\x4f\xcf\xb5\xb7\xdf\x50\xfc\x6c\x60\x7f\xe8\x6e\x4c\xf3\xad\x83\
-\x4d\xbb\x80\xdb\xe7\x33\xfc\xe9\x05\xc3\xfb\xcb\xc3\x0d\x68\xdc\
-\xd5\xed\x41\x4b\x2c\x8f\xc0\xc0\xfe\xd0\xfb\xf6\x1e\xf0\x4b\xc3\
-\xcb\xbe\xd8\x1f\xd0\x53\xc2\x93\x91\x48\xbd\xe5\x30\x6b\x9a\x61\
-\xa6\x9e\x66\xd5\x53\x50\xa8\x18\x7a\x0a\x7b\xdf\xff\x1d\x76\xcf\
-\x98\x9a\xf9\x39\xe5\xc6\x96\x6e\xdc\x80\x9b\xef\x02\x76\xb7\xba\
-\x5b\x3e\x86\x3f\x3d\xd5\xbc\xd6\x76\x1d\x7f\x7e\x70\xbb\x07\x2d\
-\xb1\x3c\xb1\x25\xf9\xc2\x14\xf1\xce\x3b\x6b\xc6\xed\x8e\xbf\xec\
-\x9b\xfd\x01\x3d\x25\xbc\xb4\x79\x6e\x75\x75\x20\xc3\x9f\x5e\x56\
-\xde\x7e\xa3\xf0\x53\x27\x66\xa6\x41\x83\xb6\xef\x04\xee\xb8\xdf\
-\xf9\xf2\x31\xfc\xe9\xa9\xe8\xdd\xf9\x78\x03\x76\x34\x45\x3d\x88\
-\xc9\xdb\xc7\x7e\x23\xb5\x9f\xc5\xff\xe9\xbb\xfd\x01\xbd\xa2\x79\
-\xb6\xd7\xf0\x09\xc3\xcc\xf0\xf2\x8b\x7d\xbc\x72\xe8\xe5\xd1\x9b\
-\x3c\x1e\x8d\x4b\x97\xa3\x26\x9d\xe9\x64\xc4\xc0\x61\x43\x80\x4f\
-\x16\xc5\x06\x3f\xc9\xd4\xbc\x84\x7f\x68\xd3\xb8\xcc\x9e\x0f\xc3\
-\x86\x9e\x5a\x5e\x57\x54\xa2\xee\xf4\x8f\xb1\x79\x87\xfb\xd3\xff\
-\xc6\xed\x63\xd2\x78\x34\xf5\x1f\x72\xd4\x20\xf8\x78\x7f\x40\x4f\
-\x4d\x4f\x03\x62\xc1\xcf\xf0\xa7\x97\x4b\x6f\xca\x04\xdc\x9d\xee\
-\x3d\xa7\xc3\x05\x6f\xda\x02\xdc\xfd\x9f\xcc\xcb\xc7\x23\x7f\x7a\
-\xaa\x7a\xff\x78\xa2\x21\xeb\xf0\x07\x80\xc9\xe3\xc4\x3d\xf0\xf9\
-\xfe\x80\x9e\x9a\x9e\xe3\xc7\x01\xfb\xa1\x18\x7a\xea\x78\x07\xee\
-\x85\x1f\x0d\x1d\x82\x94\x73\x9f\x6e\x9f\x15\xf0\xdb\xdb\x80\xee\
-\x34\xfb\x50\x86\x3f\x3d\x55\xbd\x68\x54\xe2\x37\xff\x72\xff\xdd\
-\xbf\x79\xfb\x18\x3a\x04\xd1\xfd\x06\x87\x7e\xe8\xf7\xfd\x01\x3d\
-\x35\x3d\xcf\x1d\x00\x15\x8b\xa1\xa7\x8e\xf7\x9d\x3f\xa2\xed\xa8\
-\x69\x78\xce\xf8\x9a\x97\x07\x05\xad\xdd\x00\xdc\xf7\x58\xea\xeb\
-\x0c\x7f\x7a\x2a\x7b\xf3\x9f\x69\xc2\xda\xcd\x5d\xae\x4c\xab\xed\
-\xe3\xa8\x69\xf2\xd9\x1f\xdc\xdc\xe5\xf2\x72\x58\xf5\xf6\x07\xf4\
-\xd4\xf4\x3c\x75\x00\x54\x2d\x86\x9e\x5a\xde\x01\x75\xb8\xaa\x57\
-\x75\x2c\xa3\xb3\x79\x4a\xe0\x0d\xbf\x03\x5a\x76\x1b\xe6\x03\xc3\
-\x9f\x9e\xba\x5e\x4b\x9b\x8e\x9f\xdc\xb1\xd5\x95\x69\xb5\x7d\x54\
-\x57\x49\x39\x76\x34\xae\x76\xbb\x7c\xaa\xee\x0f\xe8\xa9\xe7\xb9\
-\xee\x00\xa8\x5c\x0c\x3d\xb5\xbc\x79\x7f\xc2\xda\xd9\x33\xb1\x34\
-\x9b\xf0\x07\x80\x0d\x9b\x81\x9f\xdf\x1c\x9f\x0f\x0c\x7f\x7a\x6a\
-\x7b\xff\xfb\x7f\xdb\xb0\x61\xab\xf3\xa3\xff\x74\xdb\xc7\xec\x99\
-\x58\x3a\xef\x4f\x58\xeb\x66\xf9\x54\xde\x1f\xd0\x53\xcf\x73\xd5\
-\x01\x50\xbd\x18\x7a\xea\x79\x63\xc7\x94\xcd\x35\x5f\xc5\xef\x65\
-\x44\xb4\x3f\xff\x1f\xf0\xc1\x27\xb9\x0b\x7f\x19\xea\x0a\x44\xd8\
-\xd0\x53\xcb\x5b\xb1\xa6\x03\x7f\x7a\x60\x87\x63\x33\x5d\xf8\x57\
-\x94\x03\xe3\xf7\xc7\x95\x6e\x96\xcf\x0f\xfb\x03\x7a\xea\x78\x80\
-\x8b\x0e\x80\xea\xc5\xd0\x53\xd3\x5b\xfa\xc9\x8c\xb7\x8f\x9e\x21\
-\x3e\x4c\xbc\xee\x75\x38\xd4\xae\x6e\x60\xee\x8f\x73\x78\xe4\xaf\
-\x75\xfb\x3e\x6c\xe8\xa9\xe7\x5d\xf5\xdb\x4d\xe8\x8e\x3a\xfb\x8c\
-\x67\x3a\x33\x76\xcc\x4c\x7c\xf0\x8b\x5b\xb1\xc4\xe9\xf2\xf9\x65\
-\x7f\x40\x4f\x0d\x2f\xd1\x1c\x75\x00\x54\x2f\x86\x9e\xda\xde\x84\
-\x7d\x43\x97\x97\x97\x65\xf7\x20\x14\x21\x04\x16\xbd\x09\xdc\x1f\
-\xbf\x20\x30\xeb\xd3\xfe\x5a\x97\xef\xc3\x86\x9e\x5a\xde\xbd\xcf\
-\x34\x62\xe1\x3b\xce\xae\xd7\xcb\x14\xfe\xe5\x65\xc0\xe4\xb1\xf8\
-\x9a\xd3\xe5\xf3\xdb\xfe\x80\x5e\x71\xbd\x84\x39\x7b\xf6\x2c\x61\
-\xbb\x3d\xa4\x7b\xa4\xa0\x2a\xc5\xd0\xf3\x87\x57\xa1\xd7\x2f\x7d\
-\xf2\x45\x8c\x77\xeb\x01\xc9\x3b\xcb\x21\x03\x81\xf7\x9e\x07\x6a\
-\xfb\x65\xf7\xac\x00\x34\xef\x05\xad\xa5\x7f\xdc\xf7\x5f\xd8\xd0\
-\x53\xcb\x6b\x6c\x89\xe2\x80\xaf\xae\xc2\x96\x9d\xf6\xf7\xfd\xdb\
-\x5d\x13\x73\xd2\xd1\x58\xfe\xd4\x4b\x98\xe0\x64\xf9\xfc\xba\x3f\
-\xa0\x57\x1c\xcf\x60\x02\xb0\x39\x03\xc0\xf0\xa7\x97\x2b\x6f\xf2\
-\x38\x9c\x5f\x5d\xe9\x56\x4c\xdd\x59\x6e\xd9\x0e\xfc\xef\x1f\x73\
-\xf0\xa0\xa0\x50\x67\xdc\xf7\x5f\xd8\xd0\x53\xcf\xfb\xf1\xdf\xb6\
-\xe6\x24\xfc\xab\x2b\x81\x29\xe3\x71\xbe\x93\xe5\xf3\xf3\xfe\x80\
-\x5e\xe1\xbd\xb8\xa9\xc1\xf0\xf1\xb5\xfb\x0a\xc0\xea\x7d\x25\x8a\
-\xa1\xe7\x2f\xef\xc6\x5b\xf0\xee\x09\x47\x63\xb1\x1b\x33\xdd\xce\
-\xf2\xf6\xf9\xc0\xb2\xe5\xee\x96\x2f\xe5\xee\x81\x50\x97\x6f\xc3\
-\x86\x9e\x5a\xde\xd2\x95\xed\xb8\xed\xd1\x9d\xb6\xa6\x93\xbb\x61\
-\x4e\x38\x1a\x8b\x6f\xbc\x05\xef\xda\x59\x7e\xdf\x1f\xd0\x2b\xac\
-\x17\x37\x93\xf2\x3c\x12\xa9\x97\x5a\x86\x89\x79\xe4\x4f\x2f\xa7\
-\xde\xc1\x63\x70\xb6\xd3\x47\x05\x67\xda\x59\x46\xa3\xc0\xc5\xdf\
-\x05\xda\xda\x9d\x2d\x9f\xe5\xad\x83\xe1\x2e\x5f\x86\x0d\x3d\xb5\
-\xbc\xd6\x76\x1d\x17\xfe\x6c\x03\x74\x9b\x4f\xb5\x93\xf0\x1f\xd8\
-\x1f\xfa\xc1\x63\x70\xb6\xdd\xf2\x05\x65\x7f\x40\xaf\x70\x5e\x9a\
-\x3c\xb7\x3e\x03\x60\xee\x29\x20\xb6\x4d\x28\x53\x0c\x3d\x7f\x7a\
-\xf3\x6e\xc5\xa6\x93\x8e\xc6\xbf\xed\x4c\x27\x3b\xcb\x15\x2b\x81\
-\x6f\xfd\xd4\x7e\xf9\x2c\xc3\x1f\x80\x28\xef\xf4\x5d\xd8\xd0\x53\
-\xcf\xfb\xc6\x1f\x3e\xc7\x8a\x35\x1d\x19\x4d\xa7\xe3\x60\x9c\x74\
-\x34\xfe\x3d\xef\x56\x6c\xca\x64\x05\x69\x7f\x40\xaf\x60\x9e\xd5\
-\x53\x7f\x25\x2c\xde\x48\xf9\x8e\x20\xde\xa2\x0a\x15\x43\xcf\xc7\
-\xde\xd4\xa3\x70\xe9\xd8\x31\x48\x7b\xec\xee\x66\xd0\xa0\xbb\x1e\
-\x00\xee\x5b\x90\x7e\xf9\xd2\x85\xbf\x16\x92\x10\x22\x0a\x68\xee\
-\x1e\xd3\x5a\xec\xb0\xa1\xa7\x96\x37\xff\xd9\x46\xdc\xf5\xdf\x86\
-\x8c\xa6\xd3\xcf\xf3\xd8\x31\x68\x9f\x7a\x14\x2e\xcd\x64\xa9\xb0\
-\xfd\xd2\xf3\x9d\x97\x72\xe4\x6f\xb4\x34\x8b\x19\x8c\x4d\x82\xe1\
-\x4f\x2f\x87\xde\x37\xbf\x89\x8e\x2f\x1e\x89\xef\x5b\xbd\xe7\x65\
-\xc4\xc0\xab\xae\x07\x56\xae\x4e\x7d\x3d\x63\xf8\x27\xa6\x29\x73\
-\xf8\x1d\x02\x8a\x1f\x36\xf4\xd4\xf2\x56\xae\xeb\xc0\xd7\x7f\xb3\
-\x39\xa3\xe9\xe6\xf3\xfc\xc5\x23\xf1\xfd\x6f\x7e\x13\x69\x4f\x25\
-\xa8\xb2\xfd\xd2\xf3\x95\x17\x32\xbd\x2c\x23\x91\xfa\xa4\x2f\xab\
-\x84\x69\x06\x61\x7a\x5d\x57\xa8\x18\x7a\x01\xf2\x66\xcf\xc4\xa7\
-\x91\xc5\xa8\x4b\xfc\x9c\xcd\x70\xc1\x13\x0e\x00\x5e\x7b\x0c\xa8\
-\xac\x88\xcf\x07\x67\x23\x06\x8a\xe6\xbd\xa0\xb5\x0c\xb0\xf5\x8b\
-\x1d\x36\xf4\xd4\xf2\xda\x3b\x25\xa6\x5d\xb6\x1a\xef\xad\x4a\xdf\
-\x81\x74\xf3\x79\x9e\x3d\x13\xab\x23\x8b\x31\x26\x9d\xa5\xe2\xf6\
-\x4b\xcf\x37\x5e\x62\x7e\x19\x89\xd4\xa7\x9c\xf2\x4c\x77\x11\xa0\
-\x8c\x44\xea\x79\xe4\x4f\x2f\x6f\xde\xf4\x43\x70\x6a\xbf\xbe\xb1\
-\x0f\x67\xb6\xcf\x0a\x78\xff\x23\xe0\x3b\xff\x1b\x9f\x0f\x2e\x86\
-\x0b\x2e\x6b\xb3\xb5\x8b\x1d\x36\xf4\xd4\xf3\xbe\xf5\xc7\xcd\x39\
-\x0b\xff\xda\x1a\xc8\xe9\x87\xe0\xd4\x74\x96\xaa\xdb\x2f\x3d\x5f\
-\x79\x96\xe1\x0f\xc4\x3b\x00\xe6\x53\xff\xe6\xd3\x04\x8a\x15\x43\
-\x2f\x00\xde\x8d\x7f\xc1\x8a\x2f\x9f\x80\x7b\xb2\x0d\xff\x44\xfb\
-\xfb\x7d\xc0\x83\xff\x75\xf7\xac\x00\x69\xd3\x01\x50\x21\x6c\xe8\
-\xa9\xe5\xfd\x3b\xd2\x84\xbf\x3f\x96\xfe\x7b\x7f\xb7\x9f\xe7\xd3\
-\x8e\xc7\x3d\x37\xfe\x05\x2b\xac\xde\x53\x79\xfb\xa5\xe7\x2b\x2f\
-\x6d\x9e\x5b\x5d\x1d\xc8\xf0\xa7\x57\x10\x2f\x5c\x73\xe8\xe5\x53\
-\x0f\x46\xd2\xde\x34\x9b\xe1\x82\xaf\xfc\xa1\xc0\x47\x86\xeb\x01\
-\x32\x85\x3f\x00\x20\xdc\x09\x08\xeb\xdf\xa7\x42\xd8\xd0\x53\xcb\
-\xfb\x70\x6d\x07\x2e\xff\x75\xfa\x8b\xf4\xdd\x86\xff\xa1\x87\xa0\
-\xe1\xae\x07\x70\x89\xd5\x7b\x7e\xd8\x7e\xe9\x29\xef\xd9\x5e\xc3\
-\x97\x32\x30\x80\xdb\x5f\xec\xe3\x95\x43\xaf\xc8\xde\x9a\x35\xbd\
-\xe4\xac\x2f\x84\xbf\xdc\xab\x3a\x76\xd0\x9e\xed\xb3\x02\x76\xed\
-\x06\x4e\xbd\x18\xd8\xb8\xd9\xf9\xb3\x02\x64\x79\xea\xa9\x5c\x15\
-\xc2\x86\x9e\x5a\xde\x86\xad\x5d\x38\xfe\x9a\xcf\xb0\xab\xd5\xfa\
-\xf8\xc8\x6d\xf8\xf7\xaa\x86\x9c\x7d\x04\x4e\x11\xc9\x27\xac\x00\
-\xf8\x67\xfb\xa5\xa7\xbc\x67\xfb\x35\xbe\x97\xed\x27\x28\x2b\x87\
-\x9e\x22\xde\xb0\x7e\x0b\xff\x79\xcf\x43\xfa\x39\x6e\xad\x44\x33\
-\xef\x7c\x0f\xdc\x0f\xa8\x7f\x50\xa2\x7f\x3f\xfb\x79\xb5\xc6\xa1\
-\x10\xad\xfd\x7b\x7e\x56\x21\x6c\xe8\xa9\xe5\xed\x6c\x8e\x62\xe6\
-\x95\x6b\xf0\xe1\x5a\xeb\x8b\xf4\xbd\x7c\x8d\x75\xd1\x99\xf8\xd7\
-\x3f\x1f\x4a\x1d\xf2\xd7\x8f\xdb\x2f\x3d\xff\x7a\x8e\x1f\x07\xec\
-\x87\x62\xe8\xf9\xd3\x3b\xe3\x82\xa1\xe7\x7f\x61\x0a\xb6\xba\xf5\
-\x00\xeb\x9d\xef\x07\x1f\x4b\x9c\x72\x09\xd0\x6a\x7f\x8d\x1f\x64\
-\xf9\x9e\x89\x54\x08\x1b\x7a\x6a\x79\xad\xed\x3a\x4e\xfe\xee\x67\
-\x39\x0d\xff\x2f\x4c\xc1\xd6\xbb\xff\x83\x0b\xcc\xaf\xfb\x75\xfb\
-\xa5\xe7\x5f\xcf\x73\x07\x40\xc5\x62\xe8\xf9\xd3\x9b\x33\x67\xa3\
-\x7e\xec\xe1\x38\x66\x90\xc3\x61\x82\x13\x2d\xd3\xce\xf7\x8d\x65\
-\xc0\x59\x5f\x07\xba\x6d\x9e\xcf\x22\x2b\x76\xc7\xfe\x8f\xe2\x87\
-\x0d\x3d\xb5\xbc\xae\x6e\x89\x33\xae\x5b\x8f\xd7\x57\x58\xf7\x24\
-\xbd\x84\xff\xa0\xfe\xd0\x8f\x3d\x1c\xc7\x98\x4f\xfd\xfb\x79\xfb\
-\xa5\xe7\x5f\x2f\xe4\x74\x42\x3f\x14\x43\xcf\xbf\xde\xc2\xb7\xb0\
-\xed\xe2\x33\x11\x5d\xf2\x3e\x8e\x71\x62\x3a\xd9\xf9\xae\x5a\x0b\
-\xac\x59\x0f\x9c\x76\x7c\x6c\x67\x6f\xd9\x34\x1d\x68\xab\x81\xec\
-\x0e\x07\x2a\xbc\xe8\x65\xe7\x49\x09\x5c\xf4\xf3\x8d\x78\xf4\xe5\
-\x5d\x96\xef\x7b\x09\x7f\x21\x80\x8b\xce\xc4\x4f\x7e\x7f\x27\x1e\
-\x36\xbe\x1e\x84\xed\x97\x9e\x3f\x3d\xd7\x1d\x00\x95\x8b\xa1\xe7\
-\x6f\xef\xad\xf7\xb0\xe8\xb4\xe3\x71\xd2\x47\x9f\x62\x78\x26\xd3\
-\xcd\xce\xf7\xfd\x8f\x80\x5d\x2d\xc0\x17\x8f\xb2\xb6\x24\x00\xd9\
-\x59\x01\x74\x56\x19\x7c\x7f\x87\x17\xbd\xec\xbd\xef\xdc\xfc\x39\
-\xee\x48\x73\xbb\x9f\xd7\x5b\x57\x4f\x3b\x1e\x6f\xde\xfb\x08\x2e\
-\x34\xbe\x16\xa4\xed\x97\x9e\xff\x3c\x57\x5f\x01\xa8\x5e\x0c\x3d\
-\xff\x7b\x47\x1e\x84\x59\x93\xc7\xa3\x29\x9d\xe9\x65\xe7\xfb\xa7\
-\xff\x03\x7e\x7e\x73\xea\xeb\x12\xb1\x71\x03\xf4\xf2\xdd\x06\xdf\
-\xff\xe1\x45\x2f\x3b\xef\x67\x77\x6d\xc3\x9f\x1e\xd8\x61\xf9\x9e\
-\xd7\xf0\x9f\x3c\x1e\x4d\x47\x1e\x84\x59\xc6\xd7\x54\xd8\xde\xe8\
-\x95\xae\x07\xb8\x38\x03\xa0\x7a\x31\xf4\x82\xe1\x3d\xfb\x3a\xba\
-\x2f\x39\x17\xcf\xac\x5c\x85\xcb\x77\xb7\x26\xef\xa7\xb3\x19\x34\
-\xa8\xfe\x35\xa0\x79\x17\x70\xdc\x91\xb1\x10\x48\x84\xbf\x04\x00\
-\xad\x1b\x5a\xcb\xc0\x40\x84\x17\x3d\xef\x9e\x94\xb1\x23\xff\x5f\
-\xdf\xbb\xdd\xf2\x7d\xaf\x9f\xbf\xc1\x03\xa1\x9f\x75\x1a\xbe\xf0\
-\xe3\x3f\x61\x43\xe2\x35\x55\xb6\x37\x7a\xa5\xe9\x25\x9a\xa3\x0e\
-\x80\xea\xc5\xd0\x0b\x96\xb7\xe8\x75\x7c\x7e\xe9\xb9\xd8\xf6\xce\
-\xfb\x38\x39\x1a\xbf\x2c\x30\x17\x23\x06\xbe\xbe\x0c\x58\xbd\x0e\
-\xf8\xd2\x6c\x00\xd2\x70\x15\x96\x90\xd0\x3a\xfa\x20\x84\xb0\x6f\
-\xc3\x8b\x5e\x76\x5e\x57\xb7\xc4\x45\x3f\xdf\x98\xf3\xd3\xfe\xe5\
-\x65\xc0\x45\x5f\xc5\xd5\xbf\xff\x2b\xfe\x9b\x78\x4d\xb5\xed\x8d\
-\x5e\x69\x79\x09\xb3\xae\x6e\x94\xb0\xed\x00\xa4\x7b\xa4\xa0\x2a\
-\xc5\xd0\x0b\xa6\xf7\xe6\x52\x2c\x39\xff\x74\xec\xfb\xee\x07\x38\
-\x38\x57\xc3\x05\x03\xb1\x6b\x02\xde\x7e\x4f\x60\xce\x17\x81\xb2\
-\xb2\xd8\x6b\x02\x80\x26\xc2\xd0\x3a\x7a\xb9\xf6\x54\x08\x2f\x7a\
-\xd9\x79\xad\xed\x3a\xbe\xfc\xc3\xf5\x39\xbd\xe0\x2f\xd1\xce\x3f\
-\x1d\xf3\xff\x3e\x1f\xd7\x25\x7e\x56\x75\x7b\xa3\x57\x1a\x9e\xc1\
-\x04\x60\x73\x0d\x00\xc3\x9f\x5e\x31\xbd\x8d\x8d\xb3\x2e\x3c\xfd\
-\x44\xf1\x8a\xf9\xf5\x6c\x47\x0c\x7c\xf6\x65\xe0\x84\x0b\x80\x86\
-\x46\xc3\x88\x81\x15\xbb\x5c\x5b\x2a\x84\x17\xbd\xec\xbc\x9d\xcd\
-\x51\x1c\xfb\x8d\xb5\x78\xe6\xf5\x16\xcb\xf7\xb3\x09\xff\x33\x4e\
-\xc2\xa2\x7f\x3e\xb4\xe7\x7e\x7f\xd5\xb7\x37\x7a\xc1\xf6\xe2\xa6\
-\x06\xc3\xe6\x60\x77\x11\xa0\xd5\xfb\x4a\x14\x43\xaf\x34\xbc\x7e\
-\x43\x0f\x3d\xe6\xf8\xa3\xc4\xca\xc4\xeb\xd9\x86\x7f\xa2\xbd\xf9\
-\x0e\x70\xec\x39\xc0\xe6\xad\xb1\xe1\x82\x65\x59\x1b\x64\xa8\xcb\
-\xb1\xa5\x42\x78\xd1\xcb\xce\x5b\xbf\xa5\x0b\x33\xaf\x5c\x93\xd3\
-\xfb\xfc\x13\xed\xc4\x59\xf8\xf0\xa1\x27\xd1\x73\xef\x89\x5f\xb6\
-\x37\x7a\xc1\xf4\xe2\x66\xca\xd0\xff\x5a\x86\x89\x79\xe4\x4f\xaf\
-\xe8\xde\xba\x75\xd5\xf2\xc0\x49\x43\xa7\xce\x3c\x14\x9b\x73\x15\
-\xfe\x89\xf6\xc1\xc7\x12\x47\x9c\x0e\x7c\xb8\x2a\xf6\xb3\xac\x6e\
-\x72\x64\xa9\x10\x5e\xf4\xb2\xf3\x3e\x5c\xdb\x81\x19\x39\x1e\xde\
-\x37\xd1\x8e\x98\x86\x4d\xa7\x9d\x83\x43\x12\x83\xfd\xf8\x69\x7b\
-\xa3\x17\x4c\x2f\x4d\x9e\x5b\x9f\x01\x30\xf7\x14\x10\xdb\xc6\x94\
-\x29\x86\x5e\x69\x79\xef\xbf\xbf\x5f\xc7\xf1\xb3\xb4\xf1\x99\x6e\
-\x0f\xcc\xd4\x32\xed\xcc\xd7\x6f\x06\xbe\x30\x27\xf6\x28\x61\x59\
-\xd5\x68\x6b\xa9\x10\x5e\xf4\xb2\xf3\xfe\x1d\x69\xc2\xb4\xcb\x56\
-\x63\xfd\x16\xeb\x33\x3e\xd9\x84\xff\xe4\x09\x68\x3a\x79\x16\x0e\
-\xba\xe2\x0a\x74\x01\xfe\xdc\xde\xe8\x05\xce\xb3\x7a\xea\x6f\xec\
-\x06\x28\x8b\x19\x92\xbe\x23\x88\x37\xdb\xa7\x0a\xf9\x78\xe5\xd0\
-\xf3\x81\xf7\xe3\xdf\x44\x77\x9e\x7a\x2c\x0e\x1e\x5b\x87\x76\x37\
-\xa6\x93\x9d\xf9\xae\xdd\xc0\xb9\x73\x81\xab\x6e\xe8\x40\x9b\x4c\
-\xcf\xab\x10\x5e\xf4\xbc\x7b\xed\x9d\x12\x57\xdc\xb4\x09\xe7\xdc\
-\xb0\x21\x67\x4f\xf5\x33\xb6\xb1\x63\xd0\x7e\xea\x31\x38\xf8\x87\
-\x37\xc5\x3a\xaa\x7e\xde\xde\xe8\x05\xc6\x4b\x39\xf2\x37\x5a\xc2\
-\x62\x06\x61\x7a\x5d\x57\xa8\x18\x7a\x25\xee\x5d\xf7\x6d\x4c\xbc\
-\xe7\x01\xbc\xb5\x61\xb3\xe5\xb4\x49\xcd\xcb\xce\xfc\x90\xb1\x61\
-\x3c\xf8\xbf\xa3\xb1\xff\xc8\xf2\xe4\xf9\x10\xac\x30\x2c\x35\x6f\
-\xe5\xba\x0e\x9c\xf5\xe3\x0d\x78\x6f\x55\xfa\x0e\x5e\x36\xe1\x3f\
-\x62\x28\xba\x2f\x3c\x1b\x87\xfe\xf2\x4f\x78\x07\x08\xce\xf6\x46\
-\xcf\xd7\x9e\xf1\x2e\x3f\x89\xd8\x91\x7f\x52\xcf\x37\x64\x9a\x21\
-\xb1\x05\x24\xfe\xcf\xf0\xa7\xa7\x94\xb7\xe8\x75\x7c\x7e\xe5\x79\
-\x78\xfd\xa3\xd5\x38\xaf\xad\x3d\x7d\x76\x78\xdd\x99\x6f\xd9\xa1\
-\xe3\xee\x27\x1b\xb1\xcf\x5e\xe5\x38\x78\xdf\xca\xd8\x7c\x08\x56\
-\x18\x96\x9a\x37\xff\xd9\x46\xcc\xb9\x76\x3d\xd6\x6f\x4d\x7f\x91\
-\x67\x36\xe1\x3f\xa0\x16\xfa\x45\xa7\xe3\xc4\x5f\xff\x05\xaf\x02\
-\xc1\xda\xde\xe8\xf9\xda\x33\x1f\xf9\xa7\x9c\xf6\xea\xe9\x00\xd4\
-\xd5\x8d\x4a\x3a\xf2\x8f\x44\xea\xf5\xd5\xab\xd7\xba\xfd\xdd\x7e\
-\x5a\x39\xf4\x7c\xea\xbd\xf2\x36\x56\x5f\x7e\x3e\xd6\xae\x58\x89\
-\xd3\x3a\xbb\x52\xf7\xf9\xd9\x8e\x1b\xd0\xd9\x2d\xf1\xc8\xcb\xcd\
-\xd8\xb0\xb5\x1b\xb3\x0f\xeb\x85\x90\x26\x02\x13\x86\xa5\xe4\xb5\
-\x75\xe8\xb8\xf2\x37\x9b\x71\xc3\x1d\x5b\xd1\xd9\x9d\xfe\xef\x9f\
-\xcd\xe7\xa5\x77\x2f\xc8\x8b\xcf\xc2\x25\x7f\xb8\x03\x8f\x02\x6a\
-\x6c\x1f\xf4\xe8\x99\x5e\x96\x91\x48\x7d\xd4\x6a\xfa\x90\x61\x26\
-\x20\xbe\x0d\x59\xf5\x14\x14\x2a\x86\x1e\x3d\xbc\xb1\x14\xef\x7e\
-\xfd\x22\xac\x59\xb5\x06\x73\x8c\x67\x02\x72\x39\x68\xd0\xb2\x8f\
-\xdb\xf1\xf8\xe2\x16\x1c\x76\x50\x2f\x0c\x1d\x10\x8e\xfb\xfe\x0c\
-\xc3\x52\xf3\x96\xae\x6c\xc7\xc9\xdf\xfd\x0c\xcf\xbe\xd1\x92\xd1\
-\xcc\xf6\xc8\xff\x92\xb3\x71\xf1\x9f\xef\xc4\xbd\x80\x5a\xdb\x07\
-\x3d\x7a\x86\x96\xf6\x60\x3e\x04\xf4\x1c\xfd\x03\x48\xbe\x40\x40\
-\xd1\x62\xe8\xd1\x03\x10\xeb\x04\x7c\xe3\x22\xbc\xf6\xd9\x26\x9c\
-\xd3\xdc\x02\x2d\x97\xe1\x0f\xc4\xc2\x61\x5b\x43\x14\x77\xfd\xb7\
-\x01\xdb\x1a\xa3\x98\x31\xa1\x0a\xd5\x95\x9a\xef\xc2\xb0\x94\xbc\
-\xc6\x96\x28\xbe\x77\xcb\x16\x5c\x7e\xd3\x26\x6c\xd9\x19\xcd\x68\
-\x66\xfb\x9d\xff\x45\xa7\xe3\xc4\xdf\xff\x9d\x47\xfe\xf4\x94\xf5\
-\x24\x6c\x2e\xe0\x4f\xea\x00\x30\xfc\xe9\xf9\xcd\x7b\xe5\x6d\xac\
-\xbe\xfa\x6b\xe2\xbf\xdb\xb7\x8b\x8b\x76\x34\x24\x9b\xb9\x1a\x37\
-\x40\x4a\x60\xc9\x87\x6d\xb8\xfb\xa9\x46\xec\xd5\x3f\x8c\x43\xe2\
-\xd7\x06\x38\x6d\x41\x09\x57\xd5\xbd\x7b\x9e\x6e\xc4\xa9\xd7\xae\
-\x47\xfd\xd2\xdd\xb0\xfb\xd3\x67\x7b\xb5\xff\x39\xa7\x63\x1a\xbf\
-\xf3\xa7\xa7\xb8\x67\x7b\xf7\x9e\x97\xed\x31\x28\x2b\x87\x5e\x80\
-\xbc\x29\xfb\xbd\xb1\xf7\xf3\x8b\xdb\x97\x2e\x5b\x8e\x1a\x20\x77\
-\xe1\x9f\x68\x46\xef\xa8\x49\xbd\xf0\x97\xef\x0d\xc5\xb8\xd1\x15\
-\xb6\x56\x50\xc2\x55\x65\x6f\xc5\x9a\x0e\x5c\xf5\xdb\x4d\x58\xf8\
-\x4e\xab\x23\x33\xdb\xfb\xfc\x4f\x3d\x06\x07\xcf\xfb\x33\xd6\x01\
-\xfe\xd9\x3e\xe8\xd1\xb3\x6a\x59\x75\x00\x54\x2b\x86\x5e\x69\x7b\
-\x53\x0e\x58\x56\xfb\xea\x9b\xcd\xef\x2c\x7a\x53\x0e\x75\x6b\x25\
-\x9a\xd3\x70\x08\x87\x04\xbe\x7d\xf6\x00\xcc\xfb\xda\x20\xf4\xaa\
-\xb2\x1e\x50\x33\x08\xe1\xaa\xb2\xd7\xd2\xa6\x63\xde\x9d\x5b\xf1\
-\xe7\x07\x77\xa2\x3b\xea\xec\xe3\x93\xed\x08\x7f\x27\xcf\xc2\x41\
-\xbc\xcf\x9f\x5e\x50\x3c\xcf\x1d\x00\x15\x8b\xa1\x47\xef\xf8\xe3\
-\x5f\x0d\xbd\xf0\x64\xe7\xb2\x67\xea\x71\x80\x5b\xd3\x4b\x38\x8c\
-\x18\x5c\x86\x1b\xff\x67\x30\xce\x3f\xa1\x06\xe1\x90\xe1\x6b\x03\
-\xf8\x3b\x5c\x55\xf6\xa2\x51\x89\xf9\xcf\x34\xe1\x27\x77\x6c\xc5\
-\x86\xad\xce\x9f\xdf\x90\xed\xd8\xfe\xa7\x9d\x83\x43\x38\xc2\x1f\
-\xbd\x20\x79\x9e\x3a\x00\xaa\x16\x43\xcf\x1f\xde\xaa\x55\xab\xcb\
-\x37\x6e\xdc\x34\xbd\xab\xab\xfb\x20\x00\x7d\x00\xec\x00\xb0\x04\
-\xc0\xdb\x88\xed\xfb\xb3\x5a\x3e\x29\x21\xce\x3c\x19\x2f\x3f\xfc\
-\x14\x8e\x70\xba\x8c\xd9\x5e\x40\x38\x6a\x68\x19\xae\x3d\x6f\x20\
-\x2e\x3d\xa5\x16\xe5\x65\xc2\xb7\xe1\xaa\xb2\xd7\x15\x95\xf8\xc7\
-\x13\x0d\xf8\xcd\xbf\xb6\x63\xed\x66\xe7\xc1\x1f\x9b\xdf\xfb\xdf\
-\xf7\x8c\x93\xb0\xf0\xa1\x27\x31\x2b\x87\x63\xfb\xef\x07\x60\x32\
-\x80\x7e\x00\x1a\x85\x10\xef\x4e\x9b\x36\x75\x75\xef\xde\xbd\xa4\
-\x47\x2f\xa9\xf9\x6d\x7f\x40\xaf\x78\x9e\xeb\xed\x53\xe5\x62\xe8\
-\xa9\xed\xad\x5a\xb5\xba\x7c\xfd\xfa\x8d\xdf\xd4\x75\xfd\x1a\x29\
-\xe5\x20\x8b\xc9\x3f\x01\x30\x0f\xc0\xfd\x48\xd3\x11\x70\xb3\x7c\
-\x17\x9d\x89\x7b\xef\x7f\x0c\xe7\x77\xda\x64\x45\x2e\xef\x1e\x18\
-\x36\x30\x8c\xef\x7c\x75\x10\x2e\x9b\xd3\x0f\xbd\x2a\xb5\xb8\xaf\
-\x7e\xb8\xaa\xec\xb5\xb6\xeb\xb8\xe3\xf1\x06\xfc\xfe\xbe\xed\xd8\
-\xbc\xa3\xdb\xb5\xe9\xf5\xef\x5b\x5e\x06\x9c\x33\x07\xf3\x73\xf4\
-\x48\x5f\x01\xe0\x34\x00\x37\x00\x98\x68\x5e\x3e\x21\xc4\x07\x9a\
-\xa6\xfd\xfc\xd0\x43\x27\x3f\xdc\xab\x57\xb5\x74\xe0\x59\x36\x3f\
-\xed\x0f\xe8\x15\xdf\x73\xb5\x8d\xaa\x5e\x0c\x3d\x75\xbd\x25\x4b\
-\x96\xd5\x36\x37\xef\x7a\x4c\x4a\x79\xb8\x83\x9d\xef\x7c\x00\x5f\
-\x03\xd0\x99\xed\xf2\x7d\xe3\x32\x7c\xfd\x81\x05\xb8\x75\xeb\x76\
-\xeb\x07\x5f\xe5\xe3\xd6\x41\x00\x18\xd8\x2f\x84\x6f\x9c\x39\x00\
-\x57\x9f\x51\x8b\xda\xbe\x21\x65\xc3\x55\x65\xaf\x79\x77\x14\x7f\
-\x79\xb8\x01\x7f\x7e\x70\x3b\x76\x34\x45\x3d\x88\xde\xff\xbe\x83\
-\x07\x42\x3f\xfb\x34\xcc\xbd\xe5\x4e\xdc\x96\x78\x2d\x8b\xed\xa3\
-\x1c\xc0\xdf\x01\x5c\x64\xb7\x7c\x42\x88\x07\xca\xca\xca\x2e\xea\
-\xe8\xe8\xe8\x80\xcb\xe6\xa7\xfd\x01\xbd\xe2\x7b\x80\x8b\xed\x54\
-\xf5\x62\xe8\xa9\xeb\xc5\xc3\xff\x69\x29\xe5\x64\x17\xe1\xfa\x4f\
-\x00\x17\xe7\x62\xf9\xae\xfb\x36\x26\x3e\x13\x41\xfd\xd2\xf8\x1d\
-\x02\x89\x96\xaf\xf0\x37\xb6\xbe\xbd\x34\x5c\x75\x7a\x2d\xfe\xe7\
-\xd4\x5a\x8c\x1e\x56\xee\xd8\xf2\x5b\x58\xe7\xd2\x5b\xbb\xb9\x0b\
-\xff\xf7\x44\x03\x6e\x5f\xd0\x80\xc6\x5d\xee\x8f\xf8\xf7\x2c\x8f\
-\xb7\xbf\xef\xe4\xf1\x68\x3a\x61\x36\x66\x25\xc6\xf5\x07\xb2\x3e\
-\xf2\xbf\x07\xc0\xf9\x2e\x96\x6f\x01\x80\xb3\x61\xea\x00\x67\x6a\
-\x7e\xda\x1f\xd0\x2b\xbe\x97\x68\x8e\xb6\x55\xd5\x8b\xa1\xa7\xae\
-\xe7\x31\xfc\x13\xed\x74\x00\x8f\xe6\x62\xf9\xfe\x70\x0d\xaa\x16\
-\x7e\x80\xfa\xc7\x9e\xc3\x61\x52\x16\x26\xfc\x8d\x9e\x10\xc0\xcc\
-\x83\xab\x71\xc1\x89\xfd\x70\xd6\x31\x7d\x51\xd3\x3b\x94\xd6\xf2\
-\x53\x58\xe7\xca\x6b\x68\x8e\xe2\x3f\x2f\xed\xc2\xfc\x67\x1a\xf1\
-\xea\xfb\xad\x90\x32\xbf\x7f\x0f\xeb\x79\x80\x39\x5f\xc4\x9b\x47\
-\x1e\x84\x59\xdf\xf9\x23\xda\x12\xaf\x67\xf9\xf9\x3b\x17\xc0\xbf\
-\x3c\x2c\xdf\x02\x38\xec\x04\xf8\x69\x7f\x40\xaf\xf8\x9e\xc1\xb4\
-\xdf\x5e\xd3\x3d\x52\x50\x95\x62\xe8\xa9\xeb\x65\x19\xfe\x00\xf0\
-\xce\xec\xd9\xb3\x26\xe7\x72\xf9\xae\xba\x00\xd7\x3f\xf4\x94\xf8\
-\xd9\xb6\x9d\xc9\x5f\x09\x14\x32\x6c\x2a\xcb\x05\x4e\x3d\xa2\x2f\
-\x2e\x3c\xb1\x06\xc7\x4f\xeb\x5d\xb2\x77\x0f\x74\x47\x25\x9e\x7d\
-\xa3\x05\xf7\x3c\xdd\x8c\x27\x16\x37\xa3\xbd\x73\x0f\x5a\xe8\xf0\
-\x1f\xd4\x1f\xfa\x57\x4e\xc6\x0d\x7f\xbd\x17\xbf\x30\xbe\x9e\xe5\
-\xf6\x21\x00\xac\x44\xec\xa2\x3f\x2f\xcb\xb7\x00\x36\x9d\x00\x3f\
-\xed\x0f\xe8\x15\xdf\x33\x98\x00\x6c\xb6\x59\x86\x3f\x3d\xaf\x5e\
-\x0e\xc2\x1f\x00\x50\x59\x59\x71\xd0\xcc\x99\xd3\x57\xe5\x72\xf9\
-\xa6\x8c\x79\xed\xa0\x45\x4b\x3a\x9f\x7b\x6d\x29\x06\x03\x85\x0f\
-\x1b\x63\x1b\xd2\x3f\x8c\x73\x8e\xab\xc1\x85\x27\xf6\xc3\xc4\xfd\
-\x2b\x95\x0d\xeb\x5c\x7a\xcb\x3e\x6e\xc7\x3d\x4f\x37\xe2\xfe\xe7\
-\x9b\xb0\xb5\x21\xf5\xbb\xfd\x42\xff\x3d\xbe\x30\x05\x5b\x8f\x3d\
-\x1c\xc7\xdc\xf8\x17\xac\x30\xbe\x9e\x83\xed\x63\x2a\x80\xb7\xb2\
-\x5c\xbe\x05\x48\xd3\x09\xf0\xd3\xfe\x80\x5e\xf1\xbd\xb8\x99\x38\
-\xf0\x91\x80\x7d\x07\x20\x11\xfe\xc6\xe9\x94\x28\x86\x9e\xba\x5e\
-\xae\xc2\x5f\x08\x81\x50\x28\x74\xee\xac\x59\x33\x1f\xca\x75\xbd\
-\x23\x47\xb6\x8a\xee\xe6\x25\x77\x3f\xfc\x94\xfe\xd5\xdd\xad\xde\
-\x6e\x87\xcd\xf5\xd7\x08\xa3\x87\x95\xe3\xc4\xe9\x7d\x70\xc2\xe1\
-\xbd\x71\xd4\xa4\x6a\xf4\xaa\xd4\x8a\x1e\xd6\xb9\xf0\x5a\xdb\x75\
-\xbc\xb4\x74\x37\x9e\x7e\xad\x05\x4f\xbe\xba\xab\xe7\x16\xbe\x42\
-\x7f\x0d\x63\x6e\xbd\xaa\x21\xcf\x3c\x09\xf7\xdd\xfd\x1f\x5c\x90\
-\xb8\xc5\x2f\xd1\x72\xb4\x7d\x5c\x09\xec\xb9\x88\x30\x8b\x7a\x17\
-\xc0\xd4\x09\xf0\xd3\xfe\x80\x5e\xf1\xbd\xb8\x69\x3c\xeb\x29\x23\
-\x91\x7a\x29\x32\x4c\x6c\x3c\xf2\x4f\xfc\x5f\x89\x62\xe8\xa9\xeb\
-\xe5\x32\xfc\x01\x40\xd3\xb4\xab\x8f\x3e\xfa\x88\x3b\xf2\x55\xef\
-\xa1\x07\xd4\x7f\x21\xb2\x08\x4f\xbc\xf5\x2e\x6a\xbd\x2c\x9f\xb1\
-\xe5\x32\xbc\xca\xcb\x04\x0e\x3d\xb0\x12\xc7\x4c\xe9\x85\x99\x07\
-\x57\x63\xfa\x84\x6a\xf4\x4e\x33\xe2\x60\xca\x72\xa0\xb8\xe1\xdf\
-\xd2\xa6\xe3\xb5\xf7\x5b\xb1\xf8\xbd\x56\xbc\xf8\xf6\x6e\xbc\xf9\
-\x41\x1b\x3a\xbb\x92\xd7\x4d\xb1\xc3\xff\xd0\x43\xd0\x30\xfb\x08\
-\x9c\xf2\xab\x5b\xf1\x8a\xf9\xbd\x1c\x6e\x1f\xd7\x03\xf8\x79\x8e\
-\xea\x5d\x80\x78\x27\xc0\x4f\xfb\x03\x7a\xca\x78\x49\x47\xfe\x88\
-\x77\x00\xc2\x69\x66\x30\xef\x69\x24\x1c\x3c\x58\xc0\xc7\x2b\x87\
-\x9e\x82\xe1\x1f\xff\x77\x63\x3e\xeb\x8d\x44\xf0\x8a\x94\x18\x70\
-\xe9\xd9\xf8\xc7\x82\x67\x71\x61\x43\x93\x7d\x46\x16\x22\xbc\x3a\
-\x3a\x75\x2c\x7e\xb7\x15\x8b\xdf\x8d\x8d\x6f\xaf\x69\xc0\xf8\xba\
-\x4a\x1c\x7a\x60\x15\x26\x8f\xad\xc4\x21\xfb\x56\x62\x7c\x5d\x45\
-\xca\xc5\x84\x85\x0e\xff\xa6\x96\x28\x96\xaf\xee\xc0\xbb\xab\xda\
-\xb1\x74\x65\x3b\xde\xfa\xb0\x0d\xcb\x57\xb7\x43\xcf\xf0\x40\xf1\
-\x62\x86\x7f\x6d\x0d\xe4\x69\xc7\xe3\x9e\xbb\x1e\xc0\x25\xe6\xa3\
-\x7e\x20\xe7\xdb\xc7\xae\x1c\xd6\x7b\x1a\x80\x07\x2a\x2a\x2a\xbe\
-\x0a\xc0\x6a\xed\x2a\xb7\x3f\xa0\xa7\x8c\x97\x92\xe7\x09\x4b\x58\
-\xcc\xa0\x21\xf5\xc8\x9f\xe1\x4f\x2f\xa3\x97\x8f\xf0\x07\x80\xf2\
-\xf2\xf2\xf1\x47\x1c\x31\xfd\x83\x42\xd4\xfb\x93\xab\x31\xee\xb5\
-\x77\xf1\x78\x64\x31\xea\x9c\x2e\x1f\x50\xdc\x6b\x08\x86\x0f\x2a\
-\xc3\xd8\x91\xe5\x18\x33\xbc\x1c\x75\xc3\xcb\x31\x72\xaf\x72\x8c\
-\x18\x54\x86\x61\x03\xc3\x18\xdc\x3f\x94\xf5\xd7\x08\x2d\xad\x3a\
-\xb6\xec\x8c\x62\xd3\xf6\x6e\x6c\xd8\xd6\x85\xcf\x36\x77\x61\xcd\
-\xa6\x0e\x7c\xba\xb1\x13\x2b\xd7\x75\x62\xe3\xb6\xc2\x8d\xc8\x97\
-\xad\x37\x7b\x26\x56\x4f\x3f\x04\xa7\x9a\xbf\xeb\xef\x79\x3f\xd7\
-\x83\xac\x08\x71\x0c\x80\x17\x72\x59\xaf\xa6\x69\x8f\x8d\x1c\x39\
-\xe2\xbc\x7d\xf7\xad\x33\x5e\x13\xa0\xdc\xfe\x80\x9e\x32\x5e\xe2\
-\x08\xc1\x78\xe4\xdf\xd3\x81\x14\x16\x33\x98\xbf\xf3\xd7\x15\x2a\
-\x86\x9e\x82\x5e\xbe\xc2\x1f\xc0\x07\x23\x46\x0c\x9b\xb0\x7e\xfd\
-\x46\xdd\xad\x95\x4d\xbd\xdf\xb8\x04\x73\x9f\x5b\x88\xdf\xae\xfc\
-\x14\x49\xcf\xfd\x55\x2d\xfc\x9d\x78\x55\x15\x02\xb5\x7d\x42\xa8\
-\xe9\xad\xa1\x4f\xb5\x86\x5e\x95\x1a\x2a\xca\x05\xca\xc2\xa2\x67\
-\x23\x97\x00\xba\xba\x25\x3a\x3a\x25\x76\xb7\xeb\xd8\xd5\xaa\xa3\
-\xa9\x45\x47\x63\x8b\x8e\xd6\xf6\xe4\x55\xaf\x7a\xbd\x56\xde\xd8\
-\x31\x68\xff\xe2\x91\xf8\xfe\x2d\xff\xc0\xad\xe9\xac\x7c\x6c\x1f\
-\x1f\x7f\xbc\xaa\x6a\xfd\xfa\x8d\x6b\x01\xf4\x8c\x7a\x99\x8b\x7a\
-\x85\x10\x8f\x8f\x1c\x39\xe2\xdc\x78\x27\x40\xb9\xfd\x01\x3d\x65\
-\x3c\xe3\xe9\x41\x09\x53\xf8\x03\x86\xa0\x37\x84\xbf\xf1\x75\x86\
-\x3f\xbd\x8c\x5e\x1e\xc3\x1f\x00\xce\x96\x52\x3e\x58\x8c\x7a\x6f\
-\xbe\x19\x15\x4b\x5e\xc6\x5d\x4f\xbe\x88\xaf\xee\x68\x80\xe6\xc7\
-\xf0\x2f\x75\x6f\x60\x7f\xe8\x27\x1d\x8d\x7f\x4f\x3d\x0a\x97\x7e\
-\xf3\x9b\x48\x3b\xb2\x5e\x3e\xb7\x8f\x97\x5e\x5a\xf4\x3d\x5d\xd7\
-\x7f\x99\xeb\x7a\x85\x10\x8f\x95\x95\x95\x9d\xcd\x11\x03\xe9\xd9\
-\x78\xc6\x23\xff\x94\x5b\x6e\xd2\x75\x00\x60\xee\x29\x28\x52\x0c\
-\x3d\x85\xbc\x7c\x86\xbf\x94\xf2\x7e\x00\xe7\xc1\xc1\xc3\x81\xf2\
-\x59\xef\x0d\x57\x6b\xc3\x97\xaf\x96\x0f\x3c\x5b\x8f\x19\xad\xed\
-\x49\xcb\x97\xeb\x7a\xe9\xe5\xc8\xab\xae\x04\x4e\x38\x1a\x8b\x0f\
-\x1e\x83\xb3\xe7\xdd\x8a\x4d\x99\xac\x42\x3c\xf8\x6a\xdd\xba\xf5\
-\x11\x5d\x97\x87\xe7\xa1\xde\x05\xe0\x88\x81\xf4\x32\x7b\x89\x23\
-\x7f\xcb\xb1\xb4\x85\x61\xa6\x9e\x9f\x19\xfe\xf4\xec\xbc\x3c\x87\
-\xff\x02\xb8\xdc\xb1\xe5\xbb\xde\x29\xfb\xbd\x7a\xf0\xfb\x1f\x75\
-\xff\xf3\x85\x57\xe4\xb8\x8e\x4e\xff\x84\x61\x29\x79\xe5\x65\xc0\
-\xec\x99\x58\x3e\x65\x3c\xce\xbf\xf1\x16\xbc\x6b\x67\x15\x6a\x7b\
-\x7b\xe9\xa5\x45\x7d\xa2\xd1\xe8\x73\x00\xa6\xe4\x61\xfd\x2d\x00\
-\x47\x0c\xa4\x97\xde\xcb\x78\x01\xbf\xb9\x03\x80\x2c\x47\x17\xf2\
-\xdb\xca\xa1\xe7\xc1\x2b\xb5\xf0\x37\xb6\xc3\xf6\x7b\x79\xea\xb2\
-\x95\xf2\xce\x17\x17\xe3\xa0\x0e\x57\x4b\xe8\xef\x70\x55\xd9\xab\
-\x28\x07\x8e\x99\x89\x0f\x26\x8f\xc5\xd7\x7e\x71\x1b\x5e\x77\x62\
-\x15\x61\x7b\xab\x05\xf0\x3c\x5c\x74\x02\x38\x62\x20\xbd\x2c\x3d\
-\xdb\xbb\xf7\x92\x3a\x00\x0c\x7f\x7a\x76\x5e\x29\x87\xbf\xd1\xbb\
-\x7e\x2e\xa6\x2e\xff\x18\xb7\x47\x16\x63\xb2\x93\x81\x84\xfc\x1a\
-\xae\x2a\x7b\xd5\x55\x52\xce\x9e\x89\xa5\xe3\xf7\xc7\x95\xbf\xb8\
-\x15\x4b\x9c\x5a\x45\xdc\xde\x1c\x77\x02\x38\x62\x20\xbd\x42\x78\
-\x5e\xee\x0e\x52\xb6\x18\x7a\x0c\xff\x42\xaf\xbf\x79\xdf\xc6\xa8\
-\x4f\xd6\x8a\xdb\xeb\x5f\x15\xc7\x6d\xdc\xaa\x17\xf4\x91\xc3\xa5\
-\xea\x0d\x1d\x82\xe8\x51\xd3\xe4\xb3\x63\x47\xe3\xea\x79\x7f\xc2\
-\x5a\x37\x56\xb1\x3f\x2f\x70\xd0\x09\xe0\x88\x81\xf4\x0a\xe5\x65\
-\xd5\x01\x50\xad\x18\x7a\x0c\xff\x62\xad\xbf\x3f\x5c\x83\xaa\x0f\
-\x3f\xc7\xaf\x96\x2d\xd7\x2e\x5d\xf2\xbe\xde\xc7\xa6\xde\x5c\xaf\
-\xbf\x92\xf0\x26\x8d\x47\xd3\xe4\x71\xe2\x9e\xfd\x06\x87\x7e\xf8\
-\x83\x9b\xbb\x5a\xdd\x5a\x0a\x7d\x5e\xd2\x76\x02\x38\x62\x20\xbd\
-\x42\x7a\x9e\x3b\x00\x2a\x16\x43\x8f\xe1\xaf\xc2\xfa\xfb\xc1\xe5\
-\x38\xf9\xc3\xcf\xf0\xb3\xd7\xdf\xd2\x26\x6d\x6b\x48\x1e\x6e\x5b\
-\xd5\x70\x55\xd5\x1b\xd8\x1f\xfa\x17\xa6\x88\x77\xf6\x1b\xa9\xfd\
-\xec\x9d\xb5\x33\x9f\x82\x02\x7f\xdf\x1c\x79\x29\x9d\x80\x1c\xae\
-\xbf\x05\x15\x15\x15\x5f\x3d\xe2\x88\xe9\x1c\x31\x90\x5e\xc6\xe6\
-\xa9\x03\xa0\x6a\x31\xf4\x72\xef\x31\xfc\xbd\x7b\x13\x47\xaf\xe8\
-\xd5\xdc\xb2\xe3\xba\x4f\xd6\x88\x0b\x5e\x7f\x47\xee\xd5\xd6\xee\
-\xe9\xe6\x9a\x4c\xeb\x2f\x90\x5e\x65\x05\x30\x6d\xa2\xd8\x38\xb6\
-\x4e\xdc\xd7\xb7\xf7\x80\x5f\xbe\xb3\x66\xdc\xee\xf8\x5b\x4a\xfd\
-\x7d\x73\xe0\xf5\x74\x02\x72\xfd\xf7\xe0\x88\x81\xf4\x9c\x34\xd7\
-\x1d\x00\x95\x8b\xa1\x97\x5b\x8f\xe1\x9f\x3b\x6f\xc6\x41\x0b\x87\
-\xad\xdf\xa2\x5f\xf7\xf1\xa7\xe2\xcb\x6f\xbd\x27\x07\xb9\xb9\x83\
-\x40\xe5\xb0\xce\x95\x57\x51\x0e\x4c\x39\x18\x5b\x0e\x18\x83\xc7\
-\x06\xf7\xaf\xba\x69\xc9\x27\xd3\xd6\x9b\x26\x51\xfa\xef\xeb\xd5\
-\x0b\x85\x42\xfd\xa5\xd4\x9f\x97\x12\x93\xb3\x59\x7f\xc6\xc6\x11\
-\x03\xe9\x39\x6d\xae\x3a\x00\xaa\x17\x43\x2f\x77\x1e\xc3\x3f\x7f\
-\xde\xbc\xb9\x18\xb6\xa9\x11\xdf\x5b\xf3\x19\xe6\x2c\x5b\x2e\x46\
-\x6f\x6f\x48\xff\x54\x4e\x15\xc3\x3a\x57\xde\x80\x5a\xe8\x93\xc6\
-\x61\x6d\xdd\x28\x3c\x36\xac\x1f\x7e\xb7\xf8\xa3\x59\x9b\x9d\xac\
-\x3f\xa7\xcd\x2f\x9f\x17\xe3\xb6\xe6\x66\xfd\x59\x35\x8e\x18\x48\
-\xcf\x4d\x73\xdc\x01\x50\xbd\x18\x7a\xb9\xf3\x18\xfe\x85\xf3\x1e\
-\x7c\x10\xa1\x57\x9e\xc3\x79\x5b\xb6\xe0\xfc\xd5\xeb\xb5\xc3\xde\
-\xff\x50\xd6\xb4\x75\xc8\x4c\xeb\xcf\xed\xa2\xf5\xb4\x62\x7b\x55\
-\x95\xc0\xf8\xb1\x68\x18\x33\x12\x4b\x86\x0c\xc1\xfc\x19\x5f\xc4\
-\xbf\xce\x3a\x0b\xd1\x6c\xd6\x5f\xba\xe6\x37\x2f\xb6\xcd\x35\x3f\
-\xad\xeb\x72\xb2\x5b\x2b\xd1\x38\x62\x20\x3d\xb7\xcd\x51\x07\x40\
-\xf5\x62\xe8\xe5\xce\x63\xf8\x17\xd7\xbb\xe9\x5a\xf4\xd9\xb8\x1d\
-\x17\x6e\xdd\xae\x7d\x69\xe3\x66\x39\xf1\xe3\x35\x62\xf0\xd6\x1d\
-\x52\x8b\xaf\x3f\xb7\x8b\xd6\xd3\x8a\x11\xfe\x83\x07\x40\xdf\xbf\
-\x0e\x5b\x47\x0c\xc5\xb2\xc1\x03\xf1\xe4\xf0\x81\xb8\xe7\x07\xbf\
-\x89\x3d\x22\x37\x5f\xeb\xcf\xcf\x1e\x47\x0c\xa4\x57\x08\xcf\x60\
-\xda\x77\x00\x0c\x4f\x15\x32\x4f\xab\x44\x31\xf4\x72\xe7\x31\xfc\
-\xd5\xf3\x46\x8e\x6c\x15\x03\xaa\x97\x4d\x6c\x69\xea\x3a\x65\x67\
-\x03\x0e\xdf\xb2\x43\x1c\xb0\xf1\x73\x0c\xfe\x6c\x83\x2c\xef\x74\
-\xf8\x24\xde\x7c\x87\x7f\x79\x19\xb0\xf7\x70\xd9\x31\x62\x08\xb6\
-\x0e\x19\x88\x95\xfd\x6b\xf1\x7a\xed\x00\x3c\xfa\x8b\x3f\x62\x99\
-\x10\x99\x9f\xe5\xe0\xb7\xbf\x47\x01\x3c\xc7\x83\x05\x25\x1a\x47\
-\x0c\xa4\xe7\xc1\x04\x60\xd3\x01\x60\xf8\x97\x8e\xc7\xf0\xf7\x97\
-\x77\xf3\xcd\xa8\xd8\xf4\x31\xa6\x37\x37\x61\xc6\xee\x36\x8c\x6f\
-\x6e\xc1\xa8\xa6\x5d\xd8\xab\xa9\x59\xd4\x36\x34\xa1\xba\xa1\x09\
-\xe1\xc6\x66\x29\xac\x36\x71\x37\x7f\x5f\x21\x80\x7e\x7d\x21\xfb\
-\xd5\xa0\xab\x7f\x0d\x5a\x6b\xfa\x8a\xa6\x9a\x3e\xe2\xf3\x3e\xbd\
-\xf1\x59\x75\xa5\x58\xd1\xbb\x8f\x78\x65\x48\x9d\xf6\xca\xf7\xbf\
-\xdf\xd9\xee\x18\x55\x60\xfd\x29\xee\x39\xee\x04\x70\xc4\x40\x7a\
-\x2e\xcd\xc4\x60\x65\x12\xb0\xef\x00\x24\xc2\xdf\x38\x9d\x12\xc5\
-\xd0\xcb\x9d\xc7\xf0\x0f\xa6\x37\x69\xe4\x07\xbd\x51\xd9\x3c\x52\
-\xca\xe8\xd0\xce\x4e\x39\x24\x0a\x59\x8b\x68\xb4\x4a\x8f\xa2\x37\
-\x74\x94\x45\xe3\xdb\x75\x08\x90\xd0\xd0\xa5\x85\xd0\xa2\x85\xd1\
-\x12\x16\x68\xa8\xa8\xc0\xe7\xe1\x10\x36\xf7\xd7\xb0\xee\x3b\x7f\
-\x44\x9b\x1f\xea\x0d\x98\x67\xdb\x09\xe0\x88\x81\xf4\x5c\x9a\xc6\
-\x91\x4a\x65\x24\x52\x9f\xfe\xea\x63\x43\xf8\xc3\xf0\x7f\x25\x8a\
-\xa1\x97\x3b\x8f\xe1\x4f\x8f\x9e\xb2\x5e\xda\x4e\x00\x47\x0c\xa4\
-\xe7\xd2\x4b\x3a\xf2\x47\xbc\x03\xa0\xa5\x99\xc1\xfc\xba\x54\xac\
-\x18\x7a\x0c\x7f\x7a\xf4\x82\xee\x35\x00\x38\x0e\xc0\xdb\xc6\x17\
-\x73\x74\x4d\xc7\x69\x00\x1e\xa8\xa8\xa8\xa8\x50\xa8\x5e\x7a\xf9\
-\x0d\xff\x44\x93\x09\x2b\x64\x31\x83\x86\xd4\x23\xff\xa8\x42\xc5\
-\xd0\x63\xf8\xd3\xa3\x57\x2a\x5e\x3b\x80\xff\x00\x98\x0d\x60\x58\
-\x8e\x2f\xe8\x3c\x40\x4a\x39\x21\x1a\x8d\x3e\xd6\xbf\x7f\x6d\x54\
-\x91\x7a\xe9\xe5\xd6\x4b\xb9\x86\xcf\x68\x69\x16\x33\x18\x9b\x04\
-\xc3\x3f\x70\xde\xca\x95\x9f\x54\x34\x37\xef\x7a\x8c\xe1\x4f\x8f\
-\x9e\x2f\xbc\x86\x50\x28\xf4\x45\x4d\x13\x4b\xcd\x6f\x64\xbb\xfd\
-\x4a\x29\xe7\xac\x5b\xb7\xe1\xae\xdd\xbb\x5b\xf9\x35\x6f\xf0\x3c\
-\xf3\x01\xbe\x8c\x44\xea\x93\xc6\x23\xd7\x4c\x33\x98\xf7\xe8\xba\
-\x42\xc5\xd0\xcb\x91\xb7\x69\xd3\xe6\x1f\x4a\x29\x0f\x67\xf8\xd3\
-\xa3\xe7\x0f\xef\xe8\xa3\x8f\xd8\xd5\xb7\x6f\xdf\x13\x85\xd8\xd3\
-\x09\xc8\xd5\xf6\x2b\xa5\x3c\xeb\xcd\x37\xdf\xbe\x50\xa5\x7a\xe9\
-\xe5\xc4\x33\x1f\xf9\xa7\x3c\x8c\x44\x98\x66\x12\x99\x26\x0e\xd8\
-\xca\x29\x49\xef\xed\xb7\xdf\xe9\xd7\xd8\xd8\xb4\x56\x4a\x59\xed\
-\xd6\x4a\x34\x86\x3f\x3d\x7a\xc5\xf1\xf2\x38\x62\xe0\x7a\x00\x75\
-\x00\xba\x55\xaa\x97\x5e\xd6\x9e\x44\xec\xc8\x3f\x6a\x35\xbd\x66\
-\x98\xa9\xa7\x31\xfc\x83\xeb\x35\x37\xef\x3a\x89\xe1\x4f\x8f\x9e\
-\x3f\xbd\xa9\x53\x27\x35\x08\xa1\xa5\x5c\x18\xe8\xb4\x65\xb8\x86\
-\x60\x6f\x00\x47\xaa\x56\x2f\xbd\x9c\x78\x69\xf3\xdc\xea\xea\x40\
-\x86\x7f\x80\xbd\x68\x34\x3a\xc9\xad\x95\x68\x0c\x7f\x7a\xf4\x8a\
-\xef\x45\xa3\xd1\x9d\xb0\xb8\x3b\xc0\xae\x39\xb8\x80\x70\x9a\x8a\
-\xf5\xd2\xf3\xec\xd9\x5e\xc3\x97\xd4\x01\xc8\x72\x68\x41\xbf\xad\
-\x9c\x92\xf4\x00\x0c\x74\xeb\x01\x0c\x7f\x7a\xf4\x14\xf3\x2c\x6f\
-\x11\x4c\xd7\x1c\xde\x3d\x30\x58\xe1\x7a\xe9\xb9\xf7\x6c\x2f\xe0\
-\x0f\x03\xde\x83\xdf\xe7\x2b\xa7\x54\xbd\x16\xb7\x26\xc3\x9f\x1e\
-\x3d\x25\xbd\x44\x27\x20\x57\x23\x06\xb6\x29\x5e\x2f\xbd\x1c\x7b\
-\x9a\xdd\x04\x7e\x2a\x86\x9e\x23\xef\x3d\x37\x26\xc3\x9f\x1e\x3d\
-\xa5\xbd\x8c\x67\x02\x5c\x8e\x1b\xf0\xbe\x0f\xea\xa5\x97\x43\x4f\
-\x38\x99\xc8\x2f\xc5\xd0\x73\xe4\xed\x0d\x60\x2d\x1c\x74\xfe\x18\
-\xfe\xc1\xf5\x42\xa1\x50\x6d\x28\x14\x1a\x2d\x84\x40\x75\x75\xd5\
-\xfa\x29\x53\x26\x36\xaa\xb4\x7c\xf4\x5c\x7b\xb5\x30\x9d\x09\x70\
-\x19\xfe\x9d\x00\x86\x03\xd8\xee\x93\x7a\xe9\xe5\xc0\xf3\xd4\x01\
-\x50\xb5\x18\x7a\x8e\xbd\xbb\x01\x5c\x94\xc9\x64\xf8\x07\xd2\x0b\
-\x03\xb8\x18\xc0\x95\x42\x88\xa4\x53\xc6\x42\x60\xa9\xae\xcb\xdb\
-\x10\xfb\x6c\xf0\x56\x30\x7f\x7a\x3d\x9d\x00\x0f\x23\x06\xde\x06\
-\xe0\x2a\x9f\xd5\x4b\x2f\x4b\xcf\x75\x07\x40\xe5\x62\xe8\x39\xf6\
-\x06\x21\x76\xca\x70\x6f\xab\x37\x19\xfe\x81\xf4\xf6\x01\xf0\x10\
-\x80\xa9\x36\xe1\xb0\x04\xc0\x99\x00\x3e\xf3\x79\xbd\x25\xe9\x85\
-\x42\xa1\xfe\x52\xea\xcf\x4b\x89\xa4\x71\x02\x6c\xc2\xff\x33\x00\
-\x93\x10\xfb\x3a\xc1\x57\xf5\xd2\xcb\xce\x73\xd5\x01\x50\xbd\x18\
-\x7a\xae\xbc\xb1\x00\x9e\x03\x30\xd2\xf8\x62\x9a\x70\x78\x00\xc0\
-\x85\x60\xf8\xfb\xd5\x1b\x06\xe0\x35\x00\x23\x1d\x1e\x19\xae\x03\
-\x30\x1d\xc0\x26\x9f\xd6\x5b\xd2\x5e\xfc\x39\x1f\x0b\xa4\x94\xd3\
-\x01\xdb\xf0\xdf\x80\xd8\x35\x04\x1f\xf9\xb5\x5e\x7a\xde\x3c\xc0\
-\xe2\x61\x40\x7e\x2d\x86\x9e\x6b\x6f\x07\x80\x7b\x00\x0c\x00\x70\
-\x30\x00\xcd\x22\x1c\x3e\x97\x52\x5e\x03\xe0\x7a\x00\x51\x07\xa6\
-\xca\xf5\x96\xaa\x27\x10\x7b\xf4\xeb\x44\x17\xa7\x85\x6b\x10\x3b\
-\x22\xbc\xd7\x87\xf5\x96\xbc\x37\x6c\xd8\xd0\xf6\x68\x34\x7a\x5f\
-\x73\xf3\xae\x4e\x29\xe5\x14\x00\x15\x16\xb3\x48\x00\xf7\x01\x38\
-\x03\x16\x67\x7b\xfc\x54\x2f\x3d\xef\x77\xf1\x39\x3a\x03\xa0\x7a\
-\x31\xf4\xb2\xf3\x34\x4d\xdb\x4b\x08\xf1\x25\x29\xe5\x38\x00\xd5\
-\x42\x60\x9b\x10\xda\xab\xa1\x50\xe8\x85\x8e\x8e\x8e\x8e\x62\x2f\
-\x1f\xbd\xac\xbc\x13\x01\x3c\xe5\xf1\x29\x72\x27\x01\x78\xda\x67\
-\xf5\xd2\x4b\xf6\x7a\x01\x38\x1e\xb1\x8b\x03\x87\x23\x36\x2a\xdc\
-\xbb\x00\x1e\x03\xb0\x46\x81\xe5\xa3\x57\x60\xcf\x60\xda\x77\x00\
-\xe2\x13\x86\x2c\xa6\x55\xa2\x18\x7a\xf4\xe8\x65\x6c\x0f\x08\x21\
-\xce\x32\xbf\xe8\xf0\x41\x32\x0f\x22\x76\xdd\x87\x6f\xea\xa5\x47\
-\x8f\x9e\x23\x13\x80\xcd\xad\x60\x0c\x7f\x7a\xf4\xfc\xed\x09\x21\
-\x66\x98\x5f\x77\xf1\x14\xb9\x19\x66\x4f\xf5\x7a\xe9\xd1\xa3\x97\
-\xd1\xd4\x60\xc8\x73\xbb\x7b\xc1\xad\xde\x57\xa2\x18\x7a\xf4\xe8\
-\x39\xf2\x86\x19\x5f\x77\xf9\x08\xd9\x61\x16\x9e\xea\xf5\xd2\xa3\
-\x47\xcf\xda\x4c\x19\xfa\x3f\x9c\x61\x62\x1e\xf9\xd3\xa3\xe7\x7f\
-\xaf\x67\x1b\xf6\xf0\xfc\x78\xe1\xc3\x7a\xe9\xd1\xa3\x97\xea\x25\
-\xc2\x3f\x69\xfe\x70\x9a\x19\x52\x9e\x12\x08\x07\x0f\x16\xf0\xf1\
-\xca\xa1\x47\x2f\xd0\x9e\x87\xf0\xf7\x75\xbd\xf4\xe8\xd1\x4b\x09\
-\xff\x44\x93\x09\x4b\xb3\x98\x21\xe9\x3b\x82\x78\x63\xf8\xd3\xa3\
-\xe7\x53\xcf\x6b\xf8\xc7\x9b\xef\xea\xa5\x47\x8f\x5e\xfa\x6b\xf8\
-\x8c\x56\xd8\x62\x06\x63\x93\x00\x74\x85\x8a\xa1\x47\x8f\x9e\x0b\
-\x2f\x9b\xf0\xb7\xba\x75\x50\xf5\x7a\xe9\xd1\xa3\x97\x14\xfe\xc6\
-\x26\x23\x91\x7a\xdd\xf8\x82\x66\x9a\xc1\xbc\xc5\x33\xfc\xe9\xd1\
-\xf3\xb1\xe7\xd6\x4a\x34\x86\x3f\x3d\x7a\xbe\xf7\xcc\x47\xfe\xba\
-\x79\xda\x74\x17\x01\x4a\xab\x89\x03\xb6\x72\xe8\xd1\xa3\x67\xd1\
-\x18\xfe\xf4\xe8\x05\xca\x93\x91\x48\xbd\xe5\x48\xae\x9a\x61\xa6\
-\x9e\xc6\xf0\xa7\x47\xaf\xf4\x3c\x80\xe1\x4f\x8f\x5e\x00\xbd\xb4\
-\x79\x6e\xd5\x53\xc8\x66\x74\x21\x3f\xae\x1c\x7a\xf4\x4a\xde\x03\
-\x18\xfe\xf4\xe8\x05\xcc\xb3\xbd\x7b\x2f\x65\x60\x00\xb7\xbf\xd8\
-\xc7\x2b\x87\x1e\x3d\x7a\xf1\x96\xee\x59\x01\x2a\x2c\x1f\x3d\x7a\
-\xf4\x3c\x79\xb6\x77\xef\x09\x64\xd9\x7c\xbc\x72\xe8\xd1\x2b\x05\
-\xcf\xf6\x77\xd8\x3c\x28\xc8\xd5\x3e\x42\x81\x7a\xe9\xd1\xa3\xe7\
-\xd0\xb3\x1b\x0a\xd8\x57\xc5\xd0\xa3\x47\xcf\x5d\xf3\xf8\x94\x40\
-\x5f\xd6\x4b\x8f\x1e\xbd\xe4\xe6\xb9\x03\xa0\x62\x31\xf4\xe8\xd1\
-\x73\xde\x18\xfe\xf4\xe8\x95\xb6\xe7\xa9\x03\xa0\x6a\x31\xf4\xe8\
-\xd1\x73\xd6\x18\xfe\xf4\xe8\xd1\x73\xdd\x01\x50\xb9\x18\x7a\xf4\
-\xe8\xd9\x37\x86\x3f\x3d\x7a\xf4\x00\x97\x1d\x00\xd5\x8b\xa1\x47\
-\x8f\x5e\xe6\xc6\xf0\xa7\x47\x8f\x5e\xa2\x39\xee\x00\xa8\x5e\x0c\
-\x3d\x7a\xf4\x32\x37\x86\x3f\x3d\x7a\xf4\x8c\x2d\xec\x64\x22\xd5\
-\x8b\xa1\x47\x8f\x5e\xe6\xc6\xf0\xa7\x47\x8f\x9e\xc9\xb4\x3f\x03\
-\x10\x9f\x30\x64\xf1\x96\x12\xc5\xd0\xa3\x47\x2f\x73\x63\xf8\xd3\
-\xa3\x47\xcf\x64\x02\xb0\xe9\x00\x18\xc2\xdf\xbc\x07\x51\xa2\x18\
-\x7a\xf4\xe8\x65\xf6\x18\xfe\xf4\xe8\xd1\x33\x98\x1a\x0c\x79\x6e\
-\x77\x06\xc0\xea\x7d\x25\x8a\xa1\x47\x8f\x9e\x7b\x8f\xe1\x4f\x8f\
-\x5e\xe9\x79\x71\x33\x65\xe8\xff\x70\x86\x89\x79\xe4\x4f\x8f\x5e\
-\x80\x3c\x86\x3f\x3d\x7a\x25\xeb\x25\xc2\x3f\x69\xfe\x70\x9a\x19\
-\xcc\x47\xfe\x12\x0e\x1e\x2c\xe0\xe3\x95\x43\x8f\x5e\xa0\x3d\x86\
-\x3f\x3d\x7a\x25\xeb\xa5\xe4\x79\xc2\xd2\x2c\x66\x48\xfa\x8e\x20\
-\xde\x18\xfe\xf4\xe8\xf9\xd4\xf3\x1a\xfe\xf1\xe6\xbb\x7a\xe9\xd1\
-\xa3\x97\xfe\x1a\x3e\xa3\x15\xb6\x98\xc1\xd8\x24\x00\x5d\xa1\x62\
-\xe8\xd1\xa3\xe7\xc2\xcb\x26\xfc\xad\x2e\x20\x54\xbd\x5e\x7a\xf4\
-\xe8\xa5\xbd\x7b\x4f\x46\x22\xf5\xba\xf1\x05\xcd\x34\x83\x79\x8b\
-\x67\xf8\xd3\xa3\xe7\x63\xcf\xad\x95\x68\x0c\x7f\x7a\xf4\x7c\xef\
-\x99\x8f\xfc\x75\xf3\xb4\xe9\x2e\x02\x94\x56\x13\x07\x6c\xe5\xd0\
-\xa3\x47\xcf\xa2\x31\xfc\xe9\xd1\x0b\x94\x27\x23\x91\xfa\xa8\xd5\
-\xf4\x9a\x61\xa6\x9e\xc6\xf0\xa7\x47\xaf\xf4\x3c\x80\xe1\x4f\x8f\
-\x5e\x00\xbd\xb4\x79\x6e\xd5\x53\xc8\x66\x74\x21\x3f\xae\x1c\x7a\
-\xf4\x4a\xde\x03\x18\xfe\xf4\xe8\x05\xcc\xb3\xbd\x7b\x2f\x65\x60\
-\x00\xb7\xbf\xd8\xc7\x2b\x87\x1e\x3d\x7a\xf1\x96\x6e\xc4\x40\x15\
-\x96\x8f\x1e\x3d\x7a\x9e\x3c\xdb\xbb\xf7\x04\xb2\x6c\x3e\x5e\x39\
-\xf4\xe8\x95\x82\x67\xfb\x3b\x6c\x86\x0b\x76\xb5\x8f\x50\xa0\x5e\
-\x7a\xf4\xe8\x39\xf4\x1c\x3f\x0e\xd8\x0f\xc5\xd0\xa3\x47\xcf\x5d\
-\xe3\xb3\x02\xe8\xd1\x2b\x5d\xcf\x73\x07\x40\xc5\x62\xe8\xd1\xa3\
-\xe7\xbc\x31\xfc\xe9\xd1\x2b\x6d\xcf\x53\x07\x40\xd5\x62\xe8\xd1\
-\xa3\xe7\xac\x31\xfc\xe9\xd1\xa3\xe7\xba\x03\xa0\x72\x31\xf4\xe8\
-\xd1\xb3\x6f\x0c\x7f\x7a\xf4\xe8\x01\x2e\x3b\x00\xaa\x17\x43\x8f\
-\x1e\xbd\xcc\x8d\xe1\x4f\x8f\x1e\xbd\x44\x73\xdc\x01\x50\xbd\x18\
-\x7a\xf4\xe8\x65\x6e\x0c\x7f\x7a\xf4\xe8\x19\x5b\xd8\xc9\x44\xaa\
-\x17\x43\x8f\x1e\xbd\xcc\x8d\xe1\x4f\x8f\x1e\x3d\x93\x69\x7f\x06\
-\x20\x3e\x61\xc8\xe2\x2d\x25\x8a\xa1\x47\x8f\x5e\xe6\xc6\xf0\xa7\
-\x47\x8f\x9e\xc9\x04\x60\xd3\x01\x30\x84\xbf\x79\x0f\xa2\x44\x31\
-\xf4\xe8\xd1\xcb\xec\x31\xfc\xe9\xd1\xa3\x67\x30\x35\x18\xf2\xdc\
-\xee\x0c\x80\xd5\xfb\x4a\x14\x43\x8f\x1e\x3d\xf7\x1e\xc3\x9f\x1e\
-\xbd\xd2\xf3\xe2\x66\xca\xd0\xff\xe1\x0c\x13\xf3\xc8\x9f\x1e\x3d\
-\xff\x7b\xed\x00\x2a\x01\x4f\xe1\xdf\xee\xc3\x7a\xe9\xd1\xa3\x97\
-\xea\x25\xc2\x3f\x69\x7e\x2d\xcd\x0c\xe6\xd7\xa5\x62\xc5\xd0\xa3\
-\x47\xcf\x81\x27\x84\xf8\x04\xf0\x7c\xe4\xff\xb1\xdf\xea\xa5\x47\
-\x8f\x5e\x8a\x97\x92\xe7\x09\x4b\xb3\x98\x21\xe9\x3b\x82\x78\xb3\
-\x7d\xaa\x90\x8f\x57\x0e\x3d\x7a\x41\xf6\x9e\xf6\x7a\xda\x1f\xc0\
-\x53\x3e\xac\x97\x1e\x3d\x7a\x7b\xbc\x94\x33\xf9\x46\x4b\xb3\x98\
-\xc1\xd8\x24\x18\xfe\xf4\xe8\xf9\xd8\x93\xb7\x01\xe8\x74\xeb\x01\
-\xe8\xac\xaa\xaa\xbc\xd3\x7f\xf5\xd2\xa3\x47\x2f\xcd\xdd\x7b\x32\
-\x12\xa9\xd7\x8d\x2f\x68\xa6\x19\xcc\x1d\x00\x5d\xa1\x62\xe8\xd1\
-\xa3\xe7\xd2\xd3\x75\xb9\x16\xc0\x4f\xdd\x9a\xa1\x90\xf6\xbf\x33\
-\x66\x1c\xbe\xce\x6f\xf5\xd2\xa3\x47\xaf\xc7\x33\x1f\xf9\xeb\xe6\
-\x69\xd3\x5d\x04\x28\xad\x26\x0e\xd8\xca\xa1\x47\xaf\x54\xbc\x9b\
-\x00\x8c\x02\x70\x85\x13\x53\xd3\xb4\x3b\x0e\x3b\x6c\xea\xef\x7c\
-\x5c\x2f\x3d\x7a\xf4\xf6\x34\x19\x89\xd4\x47\xad\xa6\xd7\x0c\x33\
-\xf5\x34\x86\x3f\x3d\x7a\x81\xf2\x24\x80\xaf\xc7\xff\x6b\xcc\x40\
-\x36\x86\x42\xa1\xb9\xd3\xa6\x4d\x9d\xdb\xab\x57\xb5\xcc\xe0\xa9\
-\x5e\x2f\x3d\x7a\xf4\xf6\xb4\xb4\x79\x6e\xd5\x53\xc8\x66\x74\x21\
-\x3f\xae\x1c\x7a\xf4\x4a\xc1\x93\x00\x6e\x07\x70\x3f\x80\xb3\x00\
-\x1c\x0b\x60\x74\xfc\xbd\x35\x00\x5e\xe8\xd7\xaf\xe6\x91\xa9\x53\
-\x27\x35\x07\xa4\x5e\x7a\xf4\x4a\xdd\xb3\xbd\x86\x4f\x18\x66\x06\
-\xc3\x9f\x1e\x3d\x7a\xf4\xe8\xd1\x2b\x0d\x4f\x20\xcb\xa6\x52\x31\
-\xf4\xe8\xd1\xa3\x47\x8f\x1e\x3d\x67\x5e\x56\x1d\x00\xd5\x8a\xa1\
-\x47\x8f\x1e\x3d\x7a\xf4\xe8\x39\xf3\x3c\x77\x00\x54\x2c\x86\x1e\
-\x3d\x7a\xf4\xe8\xd1\xa3\xe7\xac\x79\xea\x00\xa8\x5a\x0c\x3d\x7a\
-\xf4\xe8\xd1\xa3\x47\xcf\x59\x73\xdd\x01\x50\xb9\x18\x7a\xf4\xe8\
-\xd1\xa3\x47\x8f\x9e\xb3\xe6\xaa\x03\xa0\x7a\x31\xf4\xe8\xd1\xa3\
-\x47\x8f\x1e\x3d\x67\xcd\x71\x07\x40\xf5\x62\xe8\xd1\xa3\x47\x8f\
-\x1e\x3d\x7a\xce\x9b\xa3\x0e\x80\xea\xc5\xd0\xa3\x47\x8f\x1e\x3d\
-\x7a\xf4\x5c\x99\xa9\x8f\x03\x4e\x33\x61\xc8\xe2\x2d\x25\x8a\xa1\
-\x47\x8f\x1e\x3d\x7a\xf4\xe8\xb9\x32\x01\xd8\x9c\x01\x30\x84\xbf\
-\x79\x3a\x25\x8a\xa1\x47\x8f\x1e\x3d\x7a\xf4\xe8\x39\x36\x13\x07\
-\xfd\x12\xb0\x3f\x03\x60\xf5\xbe\x12\xc5\xd0\xa3\x47\x8f\x1e\x3d\
-\x7a\xf4\x1c\x9b\x49\x79\x1e\x89\xd4\xcb\x70\x86\x89\x79\xe4\x4f\
-\x8f\x1e\x3d\x7a\xf4\xe8\xf9\xdf\x4b\x3a\xf2\x4f\xb4\x70\x9a\x19\
-\xcc\x47\xfe\x12\x36\x4f\x15\xf2\xf9\xca\xa1\x47\x8f\x1e\x3d\x7a\
-\xf4\x82\xe8\xa5\xe4\x79\xc2\xd2\x2c\x66\xd0\x90\x7a\xe4\xcf\xf0\
-\xa7\x47\x8f\x1e\x3d\x7a\xf4\xfc\xe5\xa5\x9c\xc9\x37\x5a\x61\x8b\
-\x19\x8c\x4d\x02\xd0\x15\x2a\x86\x1e\x3d\x7a\xf4\xe8\xd1\xa3\x67\
-\xef\x99\xef\xde\x93\x91\x48\xbd\x6e\x7c\x41\x33\xcd\x60\xee\x00\
-\x30\xfc\xe9\xd1\xa3\x47\x8f\x1e\x3d\xff\x79\xe6\x23\x7f\xdd\x3c\
-\x6d\xba\x8b\x00\xa5\xd5\xc4\x01\x5b\x39\xf4\xe8\xd1\xa3\x47\x8f\
-\x5e\xd0\x3d\x19\x89\xd4\x47\xad\xa6\xd7\x0c\x33\xf5\x34\x86\x3f\
-\x3d\x7a\xf4\xe8\xd1\xa3\x17\x08\x2f\x6d\x9e\x5b\xf5\x14\xb2\x19\
-\x5d\xc8\x8f\x2b\x87\x1e\x3d\x7a\xf4\xe8\xd1\x0b\x9a\x67\x7b\xf7\
-\x5e\xca\xc0\x00\x6e\x7f\xb1\x8f\x57\x0e\x3d\x7a\xf4\xe8\xd1\xa3\
-\x17\x54\xcf\xf6\xee\x3d\x81\x2c\x9b\x8f\x57\x0e\x3d\x7a\xf4\xe8\
-\xd1\xa3\x57\xb2\x5e\x56\x1d\x00\xd5\x8a\xa1\x47\x8f\x1e\x3d\x7a\
-\xf4\xe8\x39\xf3\x3c\x77\x00\x54\x2c\x86\x1e\x3d\x7a\xf4\xe8\xd1\
-\xa3\xe7\xac\x79\xea\x00\xa8\x5a\x0c\x3d\x7a\xf4\xe8\xd1\xa3\x47\
-\xcf\x59\x73\xdd\x01\x50\xb9\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\x9e\
-\xb3\xe6\xaa\x03\xa0\x7a\x31\xf4\xe8\xd1\xa3\x47\x8f\x1e\x3d\x67\
-\xcd\x71\x07\x40\xf5\x62\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\xce\x9b\
-\xa3\x0e\x80\xea\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x5c\x99\xa9\
-\x8f\x03\x4e\x33\x61\xc8\xe2\x2d\x25\x8a\xa1\x47\x8f\x1e\x3d\x7a\
-\xf4\xe8\xb9\x32\x01\xd8\x9c\x01\x30\x84\xbf\x79\x3a\x25\x8a\xa1\
-\x47\x8f\x1e\x3d\x7a\xf4\xe8\x39\x36\x13\x07\xfd\x12\xb0\x3f\x03\
-\x60\xf5\xbe\x12\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x1c\x9b\x29\
-\x43\xff\x87\x33\x4c\xcc\x23\x7f\x7a\xf4\xe8\xd1\xa3\x47\xcf\xff\
-\x5e\xd2\x91\x7f\xa2\x85\xd3\xcc\x60\x3e\xf2\x97\x70\xf0\x60\x01\
-\x1f\xaf\x1c\x7a\xf4\xe8\xd1\xa3\x47\x2f\x88\x5e\x4a\x9e\x27\x2c\
-\xcd\x62\x06\x0d\xa9\x47\xfe\x0c\x7f\x7a\xf4\xe8\xd1\xa3\x47\xcf\
-\x5f\x5e\xca\x99\x7c\xa3\x15\xb6\x98\xc1\xd8\x24\x00\x5d\xa1\x62\
-\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\xf6\x9e\xf9\xee\x3d\x19\x89\xd4\
-\xeb\xc6\x17\x34\xd3\x0c\xe6\x0e\x00\xc3\x9f\x1e\x3d\x7a\xf4\xe8\
-\xd1\xf3\x9f\x67\x3e\xf2\xd7\xcd\xd3\xa6\xbb\x08\x50\x5a\x4d\x1c\
-\xb0\x95\x43\x8f\x1e\x3d\x7a\xf4\xe8\x05\xdd\x93\x91\x48\x7d\xd4\
-\x6a\x7a\xcd\x30\x53\x4f\x63\xf8\xd3\xa3\x47\x8f\x1e\x3d\x7a\x81\
-\xf0\xd2\xe6\xb9\x55\x4f\x21\x9b\xd1\x85\xfc\xb8\x72\xe8\xd1\xa3\
-\x47\x8f\x1e\xbd\xa0\x79\xb6\x77\xef\xa5\x0c\x0c\xe0\xf6\x17\xfb\
-\x78\xe5\xd0\xa3\x47\x8f\x1e\x3d\x7a\x41\xf5\x6c\xef\xde\x13\xc8\
-\xb2\xf9\x78\xe5\xd0\xa3\x47\x8f\x1e\x3d\x7a\x25\xeb\x65\xd5\x01\
-\x50\xad\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\x9e\x33\xcf\x73\x07\x40\
-\xc5\x62\xe8\xd1\xa3\x47\x8f\x1e\x3d\x7a\xce\x9a\xa7\x0e\x80\xaa\
-\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x9c\x35\xd7\x1d\x00\x95\x8b\
-\xa1\x47\x8f\x1e\x3d\x7a\xf4\xe8\x39\x6b\xae\x3a\x00\xaa\x17\x43\
-\x8f\x1e\x3d\x7a\xf4\xe8\xd1\x73\xd6\x1c\x77\x00\x54\x2f\x86\x1e\
-\x3d\x7a\xf4\xe8\xd1\xa3\xe7\xbc\x39\xea\x00\xa8\x5e\x0c\x3d\x7a\
-\xf4\xe8\xd1\xa3\x47\xcf\x95\x99\xfa\x38\xe0\x34\x13\x86\x2c\xde\
-\x52\xa2\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\x9e\x2b\x13\x80\xcd\x19\
-\x00\x43\xf8\x9b\xa7\x53\xa2\x18\x7a\xf4\xe8\xd1\xa3\x47\x8f\x9e\
-\x63\x33\x71\xd0\x2f\x01\xfb\x33\x00\x56\xef\x2b\x51\x0c\x3d\x7a\
-\xf4\xe8\xd1\xa3\x47\xcf\xb1\x99\x32\xf4\x7f\x38\xc3\xc4\x3c\xf2\
-\xa7\x47\x8f\x1e\x3d\x7a\xf4\xfc\xef\x25\x1d\xf9\x27\x5a\x38\xcd\
-\x0c\xe6\x23\x7f\x09\x07\x0f\x16\xf0\xf1\xca\xa1\x47\x8f\x1e\x3d\
-\x7a\xf4\x82\xe8\xa5\xe4\x79\xc2\xd2\x2c\x66\xd0\x90\x7a\xe4\xcf\
-\xf0\xa7\x47\x8f\x1e\x3d\x7a\xf4\xfc\xe5\xa5\x9c\xc9\x37\x5a\x61\
-\x8b\x19\x8c\x4d\x02\xd0\x15\x2a\x86\x1e\x3d\x7a\xf4\xe8\xd1\xa3\
-\x67\xef\x99\xef\xde\x93\x91\x48\xbd\x6e\x7c\x41\x33\xcd\x60\xee\
-\x00\x30\xfc\xe9\xd1\xa3\x47\x8f\x1e\x3d\xff\x79\xe6\x23\x7f\xdd\
-\x3c\x6d\xba\x8b\x00\xa5\xd5\xc4\x01\x5b\x39\xf4\xe8\xd1\xa3\x47\
-\x8f\x5e\xd0\x3d\x19\x89\xd4\x47\xad\xa6\xd7\x0c\x33\xf5\x34\x86\
-\x3f\x3d\x7a\xf4\xe8\xd1\xa3\x17\x08\x2f\x6d\x9e\x5b\xf5\x14\xb2\
-\x19\x5d\xc8\x8f\x2b\x87\x1e\x3d\x7a\xf4\xe8\xd1\x0b\x9a\x67\x7b\
-\xf7\x5e\xca\xc0\x00\x6e\x7f\xb1\x8f\x57\x0e\x3d\x7a\xf4\xe8\xd1\
-\xa3\x17\x54\xcf\xf6\xee\x3d\x81\x2c\x9b\x8f\x57\x0e\x3d\x7a\xf4\
-\xe8\xd1\xa3\x57\xb2\x5e\x56\x1d\x00\xd5\x8a\xa1\x47\x8f\x1e\x3d\
-\x7a\xf4\xe8\x39\xf3\x3c\x77\x00\x54\x2c\x86\x1e\x3d\x7a\xf4\xe8\
-\xd1\xa3\xe7\xac\x85\x9d\x4e\x68\xf1\xcb\x53\x06\x19\x40\x76\x23\
-\x06\xd2\xa3\x47\x8f\x1e\x3d\x7a\xf4\x0a\xe4\xb9\x3e\x03\x90\xe6\
-\x97\x23\xc7\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\xf2\xe8\xb9\x3a\
-\x03\x10\xff\xe5\x56\x0f\x0a\xca\x66\xc4\x40\x7a\xf4\xe8\xd1\xa3\
-\x47\x8f\x5e\x01\x3d\xc0\xfd\x57\x00\x29\x8f\x14\x4c\x37\xc2\x10\
-\x3d\x7a\xf4\xe8\xd1\xa3\x47\x4f\x59\xcf\x79\x07\x60\xb6\xc5\x23\
-\x82\xbd\x8e\x18\x48\x8f\x1e\x3d\x7a\xf4\xe8\xd1\x2b\x9a\x27\x00\
-\x87\xd7\x00\x58\xfc\x72\xcf\xc3\x05\xd3\xa3\x47\x8f\x1e\x3d\x7a\
-\xf4\x8a\xe6\xf5\xe4\xbe\xed\x19\x00\xe3\xc4\xf1\xe6\x79\xb8\x60\
-\x7a\xf4\xe8\xd1\xa3\x47\x8f\x5e\x51\x3d\x81\xf8\xd7\x08\xc2\xc1\
-\xc4\x49\x2d\xc7\xc5\xd0\xa3\x47\x8f\x1e\x3d\x7a\xf4\x0a\xec\x45\
-\x22\xf5\xd2\xf1\x35\x00\xd9\xfc\x62\x7a\xf4\xe8\xd1\xa3\x47\x8f\
-\x9e\x5a\xde\xff\x03\xf1\x4f\x7f\xd2\x7d\x14\xf2\x22\x00\x00\x00\
-\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x63\x72\x65\x61\x74\x65\
-\x00\x32\x30\x31\x38\x2d\x31\x31\x2d\x30\x32\x54\x30\x33\x3a\x32\
-\x36\x3a\x31\x36\x2d\x30\x35\x3a\x30\x30\x50\x5a\x64\x71\x00\x00\
-\x00\x25\x74\x45\x58\x74\x64\x61\x74\x65\x3a\x6d\x6f\x64\x69\x66\
-\x79\x00\x32\x30\x31\x38\x2d\x31\x31\x2d\x30\x32\x54\x30\x33\x3a\
-\x32\x36\x3a\x31\x36\x2d\x30\x35\x3a\x30\x30\x21\x07\xdc\xcd\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x68\x29\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x00\x18\x74\x45\x58\x74\x53\x6f\x66\x74\x77\x61\
-\x72\x65\x00\x70\x61\x69\x6e\x74\x2e\x6e\x65\x74\x20\x34\x2e\x30\
-\x2e\x39\x6c\x33\x7e\x4e\x00\x00\x67\x9a\x49\x44\x41\x54\x78\x5e\
-\xed\xdd\x4b\x8c\x6d\xdb\x79\x1d\x66\xc9\x3a\xbb\x0a\x86\x05\x38\
-\x0e\xf2\x4e\x47\x09\x82\x20\x09\x1c\xc0\xb0\x1e\x06\x9c\x46\x82\
-\x38\x6a\x29\x9d\x20\xed\xf4\x82\xb4\xd2\x4b\x02\xa4\x19\x58\xd1\
-\x03\xb1\x65\x44\x12\x29\x5e\xf2\xf2\x19\x8a\x52\x6c\xd9\x8a\x9e\
-\x46\xfc\x80\x25\x52\x02\x45\x49\x0e\xa2\x87\x1b\x16\xaf\x18\xf1\
-\xa5\x87\x25\x4a\xa4\x48\x4a\x24\x8f\xae\xce\xc9\xfc\xeb\xd6\xaa\
-\x3b\x6b\xd4\x58\x73\xce\xb1\xd7\x5c\x6b\xcf\xb5\xf6\x58\xc0\x07\
-\xe9\x4c\xd6\xfe\x6b\xfd\xff\x9c\x7b\x8f\x7b\xf7\xad\x3a\xfb\xab\
-\x5e\xbe\x7c\x69\x66\x66\x66\x57\x86\x2e\x9a\x99\x99\xd9\xb1\xd1\
-\x45\x33\x33\x33\x3b\x36\xba\x68\x66\x66\x66\xc7\x46\x17\xcd\xcc\
-\xcc\xec\xd8\xe8\xa2\x99\x99\x99\x1d\x1b\x5d\x34\x33\x33\xb3\x63\
-\xa3\x8b\x66\x66\x66\x76\x6c\x74\xd1\xcc\xcc\xcc\x8e\x8d\x2e\x9a\
-\x99\x99\xd9\xb1\xd1\x45\x33\x33\x33\x3b\x36\xba\x68\x66\x66\x66\
-\xc7\x46\x17\xcd\xcc\xcc\xec\xd8\xe8\xa2\x99\x99\x99\x1d\x1b\x5d\
-\x34\x33\x33\xb3\x63\xa3\x8b\x66\x66\x66\x76\x6c\x74\xd1\x6c\x4d\
-\xe9\x7a\x25\xf9\x68\xf2\xfc\xab\xbf\xfa\xab\xff\xe4\xd9\xb3\x67\
-\x1f\xbf\xb9\xb9\x79\x3f\xfb\x5a\x33\x33\x5b\x07\x5d\x34\x5b\x43\
-\xba\xde\x91\xbc\x48\xe2\x0f\x2f\x53\xf8\xbf\x7c\xf6\xec\x6b\x92\
-\x67\x0f\x6e\x6e\x4e\x3f\xc8\x1e\x6b\x66\x66\x7d\xd1\x45\xb3\xde\
-\xd2\xf5\xc1\x29\xf8\xe7\xc2\x3f\xfe\x1c\xeb\xe9\x7f\xff\x39\x56\
-\xc3\xcc\xcc\xfa\xa1\x8b\x66\x3d\xa5\x2b\xfe\xcd\xbf\x35\xfc\x27\
-\xef\x62\xb5\xcc\xcc\xac\x0f\xba\x68\xd6\x53\xba\x8a\x6f\xfb\x93\
-\xf0\xbf\x83\x75\xcc\xcc\xac\x1f\xba\x68\xd6\x4b\xba\x1e\xfe\xed\
-\x5f\x09\xff\x7b\xfe\xc1\x40\x33\xb3\x95\xd0\x45\xb3\x5e\xd2\xf5\
-\x85\x08\xf3\x33\xc2\x3f\x7c\x85\xd5\x34\x33\xb3\xe5\xe8\xa2\x59\
-\x2f\x11\xe4\x67\x86\xff\x1d\xac\x67\x66\x66\x7d\xd0\x45\xb3\x1e\
-\xd2\xf5\xf3\x4b\xc2\xff\xde\x6f\xb1\xda\x66\x66\xb6\x0c\x5d\x34\
-\xeb\xa1\x43\xf8\xdf\xc1\xba\x66\x66\xb6\x1c\x5d\x34\x5b\x2a\x85\
-\xfc\x5b\x7a\x84\xff\xbd\x8f\xb0\xef\x61\x66\x66\xe7\xa3\x8b\x66\
-\x4b\xa5\xc0\xff\x5c\xa7\xf0\xbf\x7b\x1c\xd6\x37\x33\xb3\x65\xe8\
-\xa2\xd9\x52\x3d\xc3\x3f\x1e\x7f\x73\x73\xf3\xb7\xd9\xf7\x31\x33\
-\xb3\xf3\xd0\x45\xb3\x25\x4e\xa7\xd3\x87\x7b\x86\xff\x7d\x2d\xff\
-\x4a\xa0\x99\x59\x47\x74\xd1\x6c\x89\x15\xc2\xff\xce\xed\xed\xed\
-\xb7\xb3\xef\x67\x66\x66\x3a\xba\x68\x76\xae\x14\xd2\xdf\xb3\x46\
-\xf8\xdf\xd7\xf3\xaf\x04\x9a\x99\x75\x42\x17\xcd\xce\x95\xc2\xfa\
-\xf7\x56\x0a\xff\xbb\xff\x1d\xbf\x9f\x99\x99\x9d\x87\x2e\x9a\x9d\
-\x6b\xcd\xf0\xbf\xe7\x5f\x09\x34\x33\xeb\x80\x2e\x9a\x9d\xe3\x74\
-\x3a\xfd\x93\x95\xc3\xff\x0e\x7e\x5f\x33\x33\xd3\xd1\x45\xb3\x73\
-\xa4\xb0\x7e\xf8\xd8\x5f\x85\x12\xfe\xf7\xfc\x29\x81\x66\x66\x0b\
-\xd1\x45\x33\x55\x0a\xeb\x6f\x23\x41\x5d\x75\x46\xf8\x07\xff\x4a\
-\xa0\x99\xd9\x42\x74\xd1\x4c\x95\xae\x4f\x67\x01\xdd\xe4\xcc\xf0\
-\xbf\x83\xdf\xdf\xcc\xcc\x34\x74\xd1\x4c\x85\x01\x5d\xb3\x24\xfc\
-\xef\xf9\x57\x02\xcd\xcc\x16\xa0\x8b\x66\x8a\x74\xfd\x58\x16\xcc\
-\x55\x1d\xc2\xff\x0e\xde\x87\x99\x99\xb5\xa3\x8b\x66\x8a\x74\xbd\
-\x9e\x07\x73\x49\xaf\xf0\xbf\xe7\x5f\x09\x34\x33\x3b\x13\x5d\x34\
-\x53\x40\x28\xcf\xea\x1c\xfe\x77\x8f\xc3\x7b\x31\x33\xb3\x36\x74\
-\xd1\xac\x55\xba\x7e\x23\x0f\xe5\x39\x6b\x84\x7f\x3c\xde\x9f\x12\
-\x68\x66\x76\x1e\xba\x68\xd6\x0a\x83\x99\x59\x2b\xfc\xef\x6b\xf9\
-\x57\x02\xcd\xcc\xce\x40\x17\xcd\x5a\xa4\xeb\x87\xf2\x60\x66\x56\
-\x0e\xff\x3b\xfe\x94\x40\x33\x33\x1d\x5d\x34\x6b\x91\xae\xaf\xe4\
-\xe1\x8c\x1a\xc2\x3f\xfe\xe6\xc0\xf7\x4d\x5f\x5f\x53\xa8\xe7\x5f\
-\x09\x34\x33\x13\xd1\x45\xb3\x16\x18\xd0\xb9\x86\xf0\x0f\xff\xf8\
-\xbe\x4e\xf1\x1f\x24\x42\xad\x5e\x7e\x5f\x66\x66\x56\x47\x17\xcd\
-\x6a\xd2\xf5\xcf\xa7\x70\x46\x8d\xe1\x9f\xca\x3c\xd4\x7a\x7f\xbe\
-\x8e\x1a\xeb\xf9\x57\x02\xcd\xcc\x04\x74\xd1\xac\x26\x0b\xde\x47\
-\x5a\xc3\x3f\xf9\x4c\xe7\x7a\xa9\xcc\xe3\x7b\x34\x33\xb3\x79\x74\
-\xd1\xac\x24\x5d\xf4\xdf\xd8\x95\xb0\x4e\xfe\x16\xd4\xfc\x48\xf6\
-\xbf\xdd\x11\xeb\x05\x7f\x4a\xa0\x99\x59\x23\xba\x68\x56\x92\xae\
-\x2f\x65\xa1\x7b\x47\x0d\x6b\xac\x19\xf2\xff\xfd\x8c\xf0\x0f\xfe\
-\x95\x40\x33\xb3\x46\x74\xd1\xac\x04\x42\xf7\x9c\xb0\xfe\xd9\x99\
-\xba\xbf\x15\xff\xfb\x99\xe1\x7f\x07\x6b\x9a\x99\x19\x47\x17\xcd\
-\xe6\xa4\xeb\x97\xf3\xc0\x3d\x27\xac\xb1\x66\x6e\x49\xf8\xdf\xf3\
-\xaf\x04\x9a\x99\x35\xa0\x8b\x66\x73\xf2\xb0\x3d\x33\xac\x3f\xc7\
-\xea\x4e\x52\x8d\xaf\x88\xf5\x9e\xc0\x9a\x66\x66\xf6\x14\x5d\x34\
-\x63\xd2\xf5\xea\x14\xb2\x0b\xfe\x4d\xfd\xfb\x58\xed\x49\xfc\xdd\
-\xfe\x4b\xc2\xff\x9e\x7f\x25\xd0\xcc\xac\x82\x2e\x9a\x31\xe9\xfa\
-\x42\x04\xec\x82\xf0\x4f\x65\x78\xed\xdc\xc2\xf0\xbf\x7b\x1c\xd6\
-\x34\x33\xb3\xc7\xe8\xa2\x19\x33\x85\xeb\xb9\xe1\x9f\xfc\x53\x56\
-\x17\x9d\x4e\xcf\x7e\x71\x49\xf8\xc7\xfd\xf8\x53\x02\xcd\xcc\xca\
-\xe8\xa2\x19\x4a\xd7\x2f\x2c\x0c\xff\x54\x86\xd7\x66\xf0\xb1\x2d\
-\xe0\xfe\xfc\x2b\x81\x66\x66\x05\x74\xd1\x0c\x2d\x0d\xff\xe4\x8b\
-\xac\xee\x9c\x74\xdd\xfd\x4a\x60\x2b\x76\x7f\xb7\xb7\xb7\xdf\xc6\
-\x6a\x9b\x99\x59\x7a\xe9\x64\x8b\x66\xb9\x14\xae\x6f\x59\x18\xfe\
-\xe1\x5d\xac\x76\x09\x3c\x7e\x56\xe1\x1f\x4e\xfc\x2b\x81\x66\x66\
-\x33\xe8\xa2\x59\x2e\x05\xea\xe7\x48\xb8\x3e\x09\xe2\x12\xac\xd9\
-\x22\x5d\xfe\x94\x40\x33\xb3\x95\xd0\x45\xb3\xdc\x5c\xb8\x0a\x7e\
-\x95\xd5\xad\x49\x57\x8f\x4f\x09\xfc\x39\x56\xdb\xcc\xec\xda\xd1\
-\x45\xb3\xc9\xe9\x74\xfa\xf0\xc2\xf0\x4f\x65\x78\xed\x16\x58\x6b\
-\xd2\x18\xfe\x77\xb0\xa6\x99\x99\xa5\x97\x47\xb6\x68\x36\x59\x1a\
-\xfe\xc9\x97\x59\xdd\x56\xe9\xf2\xa7\x04\x9a\x99\xad\x80\x2e\x9a\
-\x85\xdb\xdb\xdb\xef\x5d\x18\xfe\xf1\xb8\x1f\x60\xb5\x15\x50\xef\
-\xee\x7e\x84\xf0\x0f\xfe\x95\x40\x33\x33\x40\x17\xcd\x42\x0a\xd7\
-\xcf\x2c\x0c\xff\x54\x86\xd7\x56\xa4\xcb\x9f\x12\x68\x66\xd6\x19\
-\x5d\x34\x0b\x4b\xc3\x3f\x05\xf4\xaf\xb3\xba\xe7\x58\x12\xfe\xf7\
-\xfc\x2b\x81\x66\x66\x19\xba\x68\x76\x3a\x9d\xfe\xc9\xb2\xf0\xff\
-\x9a\x54\x86\xd7\x3e\x47\x0a\x7c\x7f\x4a\xa0\x99\x59\x47\x74\xd1\
-\x2c\x85\xeb\x0b\x16\xa2\x35\x53\xf8\xa7\x90\x7e\xce\xea\x9e\xab\
-\xd3\xa7\x04\xfa\x57\x02\xcd\xcc\xee\xd1\x45\xbb\x6e\x29\x5c\xbf\
-\x8d\x84\x67\x55\x16\xfe\xf1\x61\x3c\x3f\xc6\x6a\x2f\xb1\x30\xfc\
-\xef\x1e\x87\x35\xcd\xcc\xae\x15\x5d\xb4\xeb\x96\xae\xdf\xcc\x83\
-\xb3\x45\x1e\xfe\x01\x6b\xf6\xe0\x4f\x09\x34\x33\xeb\x87\x2e\xda\
-\x75\xc3\xf0\xac\xc1\xf0\x4f\x41\xfd\x49\x56\xb7\x07\xfc\xde\x2d\
-\xe0\xfe\xfc\x2b\x81\x66\x66\x09\x5d\xb4\xeb\x95\xae\x1f\xcf\xc3\
-\xb3\x06\xc3\x3f\xac\xf9\x29\x7c\xe9\xf2\xa7\x04\x9a\x99\x75\x40\
-\x17\xed\x7a\xa5\xeb\xf5\x3c\x40\x4b\x58\xb8\xa6\x3f\xbf\xce\xea\
-\xf6\x84\xf7\x31\x67\xe6\xfe\x62\xdd\xbf\x12\x68\x66\x57\x8f\x2e\
-\xda\xf5\xc2\x10\x9d\x53\x08\xd7\x9f\x64\x75\x7b\x4a\x97\x3f\x25\
-\xd0\xcc\x6c\x21\xba\x68\xd7\x29\x5d\xbf\x31\x05\x68\x49\x29\x5c\
-\xb1\xe6\x1a\xd2\xe5\x4f\x09\x34\x33\x5b\x88\x2e\xda\x75\xca\xc2\
-\x71\x56\x25\x5c\x37\x7b\x6b\x3d\xbf\xa7\x5c\x63\xf8\xdf\xc1\x9a\
-\x66\x66\xd7\x84\x2e\xda\xf5\x49\xd7\x0f\xe5\xe1\xc8\x34\x84\xeb\
-\xb7\xb3\xda\x6b\x48\x97\x3f\x25\xd0\xcc\x6c\x01\xba\x68\xd7\x27\
-\x5d\xcf\xb3\x60\x7c\xa2\x21\x5c\x5f\xb0\xba\x6b\x9a\xee\x2d\x9c\
-\x11\xfe\xc1\xbf\x12\x68\x66\x57\x8b\x2e\xda\xf5\x81\x60\x7c\xa4\
-\x31\x5c\xff\x31\xab\xbb\xa6\x74\xf9\x53\x02\xcd\xcc\xce\x44\x17\
-\xed\xba\xa4\xeb\xd7\xf2\x50\xcc\xb5\x86\x2b\xd6\xdc\xca\x92\xf0\
-\xbf\xe7\x5f\x09\x34\xb3\xab\x44\x17\xed\xba\x40\x20\x3e\x10\xc2\
-\xf5\xf7\x58\xdd\x2d\xa4\x7b\xf2\xa7\x04\x9a\x99\x9d\x81\x2e\xda\
-\xf5\x48\x17\xfd\x95\x3a\xf1\xdf\xac\xbf\x8b\xd5\xde\x82\x3f\x25\
-\xd0\xcc\xec\x3c\x74\xd1\xae\x47\xba\xbe\x94\x05\xe1\x1d\x31\xfc\
-\x53\x19\x5e\x7b\x2b\x0b\xc3\xff\xee\x71\x58\xd3\xcc\xec\xe8\xe8\
-\xa2\x5d\x0f\x16\x86\x4a\xf8\x27\x3f\xcb\xea\x6e\xc9\x9f\x12\x68\
-\x66\xa6\xa3\x8b\x76\x1d\xd2\xf5\x2b\x2c\x0c\x85\xf0\x4f\x65\x78\
-\xed\xad\xe1\x7d\xb5\x80\x7e\xfd\x2b\x81\x66\x76\x55\xe8\xa2\x5d\
-\x87\x42\x18\xde\xab\xbe\xad\xfe\x39\x56\xf7\x12\xd2\xe5\x4f\x09\
-\x34\x33\x13\xd0\x45\x3b\xbe\x74\xbd\xb3\x14\x86\x0d\xe1\x1f\xde\
-\xca\x6a\x5f\x0a\xdc\xdb\xac\x42\xbf\xfe\x95\x40\x33\xbb\x1a\x74\
-\xd1\x8e\x2f\x5d\x5f\xac\x84\xe1\xa3\xd0\x64\xb0\xe6\xa5\xa5\xcb\
-\x9f\x12\x68\x66\xd6\x88\x2e\xda\xf1\xb5\x84\x61\xc5\x2f\xb2\xba\
-\x97\x94\x2e\x7f\x4a\xa0\x99\x59\x23\xba\x68\xc7\x96\xae\x5f\x58\
-\x18\xfe\xa9\x0c\xaf\x7d\x69\x78\x9f\x13\xa5\x5f\xac\x69\x66\x76\
-\x44\x74\xd1\x8e\x6d\x69\xf8\x27\x5f\x64\x75\x47\x90\x2e\x7f\x4a\
-\xa0\x99\x59\x03\xba\x68\xc7\x95\x42\xef\xad\x0b\xc3\x3f\xbc\x8b\
-\xd5\x1e\x45\x7e\xaf\x67\x84\x7f\xf0\xaf\x04\x9a\xd9\xe1\xd1\x45\
-\x3b\xae\x14\x80\x9f\x13\xc3\xf0\x09\xac\x39\x9a\x74\xf9\x53\x02\
-\xcd\xcc\x2a\xe8\xa2\x1d\xd7\x39\x61\x08\x7e\x95\xd5\x1d\xcd\x92\
-\xf0\xbf\xe7\x5f\x09\x34\xb3\x43\xa3\x8b\x76\x4c\xa7\xd3\xe9\xe7\
-\x16\x86\x7f\x2a\xc3\x6b\x8f\x26\xf5\xe8\x4f\x09\x34\x33\x2b\xa0\
-\x8b\x76\x4c\x4b\xc2\xf0\xde\x97\x58\xdd\x11\xf9\x53\x02\x6d\x64\
-\xe9\x7a\x6f\xf2\xd3\xf7\xfc\x43\xa7\x76\x11\x74\xd1\x8e\xe7\xf6\
-\xf6\xf6\x7b\x17\x86\x61\x3c\xee\x03\xac\xf6\xa8\x3a\xf4\x9b\xca\
-\xf0\xda\x66\xe7\x48\xd7\x1f\xe4\x67\x0c\x7c\x9e\x3d\xc6\x6c\x2d\
-\x74\xd1\x8e\x27\x85\xe1\x67\xae\x2d\x0c\xfd\x29\x81\x36\x8a\x74\
-\xfd\x60\x7e\xbe\x2a\x7e\x94\xd5\x30\xeb\x8d\x2e\xda\xf1\x2c\x0d\
-\xff\xf4\x0f\x10\xbf\xce\xea\x8e\x0e\x7b\x69\x31\x85\xff\x1b\xef\
-\x20\xf8\x53\x02\x6d\x99\x74\x7d\x77\x7e\xbe\x6a\xe2\xfc\xdd\xdc\
-\x9c\xbe\x9f\xd5\x32\xeb\x89\x2e\xda\xb1\x9c\x4e\xa7\x9f\x5a\x16\
-\xfe\x5f\x93\xca\xf0\xda\xa3\x4b\x97\x3f\x25\xd0\x2e\x2a\x5d\x2f\
-\xf2\x33\x56\x92\x9f\x3f\xac\x63\xd6\x1b\x5d\xb4\x63\x49\x2f\x2a\
-\xcd\x2f\x40\xb9\xec\xc5\xe8\x39\xab\xbb\x17\xd8\xd7\x1c\x16\xfe\
-\xf1\xe7\xb4\xee\x5f\x09\xb4\xb3\xa4\xeb\x37\xf2\x33\x56\x42\xce\
-\xdf\xef\xb0\x9a\x66\xbd\xd0\x45\x3b\x8e\xf4\xa2\xf2\xed\xec\xc5\
-\xa6\x26\x7f\x31\xba\xb9\xb9\xd9\xf5\x7f\x93\x4c\x97\x3f\x25\xd0\
-\x36\x97\xae\xef\x9b\xce\x57\x4d\xe1\xfc\xed\xea\x07\x6f\x6d\x5f\
-\xe8\xa2\x1d\x47\xba\xa4\xb7\xc0\x03\xbe\x18\x61\xcd\xbd\x49\xd7\
-\xf7\xe7\xfd\xa1\x5a\xf8\xdf\xf3\xaf\x04\x9a\x24\x5d\x4d\xef\xbc\
-\xd5\xce\x1f\xd6\x35\xeb\x85\x2e\xda\x71\xe4\x2f\x34\x2d\xf0\xc5\
-\xe8\x74\x7a\xf6\x49\x56\x77\x6f\xb0\xcf\x49\x63\xf8\xdf\xc1\x9a\
-\x66\x73\xd2\xd5\xf4\xd6\x7f\xe3\xf9\xfb\x6d\xf6\x3d\xcc\x96\xa2\
-\x8b\x76\x0c\xe9\xfa\xf1\xec\x45\xa4\x8a\xbd\x18\x1d\xe5\x07\xe0\
-\xd2\xd5\xe3\x53\x02\xff\x0f\x56\xdb\x2c\x97\xae\xa6\xb7\xfe\xc5\
-\xf3\xe7\xdf\x0a\xb0\xee\xe8\xa2\x1d\x43\xba\x5e\xcf\x5e\x40\x8a\
-\x66\x5e\x8c\x5e\x67\x75\xf7\xaa\xa1\xdf\x52\xf8\x07\xff\x4a\xa0\
-\x55\xa5\xab\xfa\xd6\xff\x39\xe7\x0f\xbf\x8f\xd9\x52\x74\xd1\x8e\
-\x01\x5f\x40\xe6\x14\x5e\x8c\x7e\x92\xd5\xdd\xab\x74\xf9\x53\x02\
-\x6d\x55\xe9\xaa\xbe\xf5\xbf\xe0\xfc\xf9\x3f\x05\x58\x57\x74\xd1\
-\xf6\x2f\x5d\x1f\xcf\x5e\x38\x66\x95\x5e\x8c\xb0\xe6\x11\x2c\x78\
-\xf1\x9d\xf8\x57\x02\x8d\x4a\x57\xf5\xad\xff\x0e\xe7\xcf\xff\x29\
-\xc0\xba\xa1\x8b\xb6\x7f\xf0\xa2\x41\x55\x5e\x8c\x0e\x19\x74\xa9\
-\x47\x7f\x4a\xa0\xad\x22\x5d\xc5\xb7\xfe\x3b\x84\xff\x1d\xfc\xbe\
-\x66\xe7\xa2\x8b\xb6\x6f\xe9\xfa\xbb\xf9\x0b\x06\xd3\xf0\x62\x74\
-\xc8\xbf\xfd\xce\x9f\x12\x68\x6b\x48\x57\xf1\xad\xff\x5e\xe1\x7f\
-\xcf\xff\x29\xc0\xba\xa0\x8b\xb6\x6f\xe9\x7a\x9e\xbd\x58\x3c\xd1\
-\xf0\x62\xf4\x82\xd5\x3d\x8a\x85\x2f\xbe\x77\x8f\xc3\x9a\x76\xbd\
-\xd2\x55\x7c\xeb\xbf\xe1\xf9\x26\x89\xc7\xdd\xdc\x9c\xfc\x21\x55\
-\xb6\x18\x5d\xb4\x7d\xc3\x17\x8c\x5c\xe3\x8b\xd1\x3f\x62\x75\x8f\
-\xa2\xd3\xa7\x04\xfe\x9f\xac\xb6\x5d\x9f\x74\xcd\xbe\xf5\xdf\xf8\
-\x7c\x6b\x96\xd7\xc3\xfb\x30\x53\xd1\x45\xdb\xaf\x74\xfd\x5a\xfe\
-\x82\x91\x6b\x7d\x31\xc2\x9a\x47\x94\xf7\xdb\x0a\xe6\xe7\x5f\x09\
-\xb4\x74\x2c\xe6\xdf\xfa\x6f\x7d\xbe\xb5\x22\xf5\xfc\x59\x01\xb6\
-\x08\x5d\xb4\xfd\xc2\x17\x8d\x89\xf0\x62\xf4\x7b\xac\xee\xd1\xa4\
-\xcb\x9f\x12\x68\x8b\xa4\xeb\x6d\xf9\x19\xc9\x09\xcf\xb7\x26\x85\
-\x7a\xfe\xad\x00\x3b\x1b\x5d\xb4\x7d\x4a\x17\xfd\x3b\xef\xc5\x17\
-\xa3\xef\x62\xb5\x8f\x08\xfa\x9e\x55\x98\x9f\x7f\x25\xf0\x8a\xa5\
-\x8b\xbe\xf5\x2f\x3e\xdf\xaa\x6a\xf5\xf0\xbe\xcc\x5a\xd1\x45\xdb\
-\xa7\x74\x7d\x69\x7a\xd1\x98\xa8\x2f\x46\x58\xf3\xc8\xd2\xe5\x4f\
-\x09\xb4\xb3\xa4\x8b\xbe\xf5\xaf\x3e\xdf\x6a\x1a\xeb\xf9\x1f\x44\
-\xed\x2c\x74\xd1\xf6\x29\x7b\x41\xb8\x73\xc6\x8b\xd1\xcf\xb0\xba\
-\x47\x95\x2e\x7f\x4a\xa0\xc9\xd2\x45\xdf\xfa\x3f\xe3\xf9\x56\x24\
-\xd6\x7b\x3f\xbb\x57\xb3\x12\xba\x68\xfb\x93\xae\x5f\xc9\x5e\x0c\
-\xce\x7a\x31\xc2\x9a\xd7\x00\x67\x30\x51\xe6\x87\x35\xed\xd8\xd2\
-\xf5\xe4\xad\xff\x73\x9e\x6f\xc9\x27\x92\x4f\xc2\xda\x9d\x73\xea\
-\xe1\x7d\x9a\xd5\xd0\x45\xdb\x9f\xfc\x85\xe0\xcc\x17\xa3\xcf\xb2\
-\xba\x47\x97\x2e\x7f\x4a\xa0\x35\x4b\xd7\x93\xb7\xfe\xcf\x7c\xbe\
-\xa5\x72\x0f\x35\x1f\xad\x9f\x5b\x2f\xf1\x7f\x0a\x30\x09\x5d\xb4\
-\x7d\x49\xd7\x3b\xa7\x17\x81\x05\x2f\x1e\x6f\x65\xb5\xaf\x41\x3e\
-\x87\x33\xe7\xe7\x5f\x09\xbc\x02\xe9\x7a\xf2\xd6\xff\x82\xe7\xdb\
-\x3b\xb2\xba\xaf\x4e\xeb\x0b\xea\x4d\xfc\x9f\x02\xac\x19\x5d\xb4\
-\x7d\x49\xd7\x17\xe3\xc9\xbf\xe4\xc5\x03\x6b\x5e\x93\x74\xf9\x53\
-\x02\xad\x2a\x5d\x8f\xde\xfa\x5f\x70\x5e\x3e\x41\x6a\x7f\x72\xc9\
-\xf9\xcb\x61\x6d\xb3\x39\x74\xd1\xf6\x25\x9e\xf4\x0b\x5f\x3c\x7e\
-\x91\xd5\xbd\x26\x1d\x5e\x7c\xfd\xf6\xeb\x81\xa5\xeb\xd1\xa7\x6b\
-\x2e\x39\x2f\x58\x7b\xb2\xf0\xfc\xe5\x7c\x16\xad\x09\x5d\xb4\xfd\
-\x48\xd7\xdd\x5f\x6b\xbb\xe4\xc5\x03\x6b\x5e\xa3\x34\x33\x7f\x4a\
-\xa0\x51\xe9\x7a\xf4\xd6\xff\xc2\xe7\xdb\xc3\x5b\xff\xe8\xe6\xe6\
-\xe6\x7d\x4b\xce\xdf\x24\x1e\x77\x73\x73\xfa\x41\xf6\x3d\xcc\x72\
-\x74\xd1\xf6\x63\xe1\x8b\x51\xf8\x22\xab\x7b\x6d\xfc\x29\x81\x36\
-\x27\x5d\x0f\x6f\xfd\x2f\x7c\xbe\x3d\x79\xeb\x1f\x9d\x4e\xcf\x3e\
-\xbd\xe0\xfc\x3d\xba\x3f\xac\x6d\x86\xe8\xa2\xed\x43\x7a\xb2\x7f\
-\xdf\x82\x17\xa3\xc9\x3b\x59\xed\x6b\x74\xe6\xfc\x1e\xc4\xe3\xb0\
-\xa6\xed\x5b\xba\x1e\xde\xfa\xcf\xc3\xf5\x9c\xe7\x1b\xd6\x9e\xb3\
-\xe4\xfc\xc1\xfd\xf9\x63\x83\xad\x88\x2e\xda\x3e\xa4\x27\xf8\xe7\
-\xb2\x27\x7b\xa2\x87\x17\xd6\xbc\x66\xfe\x94\x40\xcb\xa5\xeb\x15\
-\xdc\xdf\x05\xcf\xb7\xd9\xb7\xfe\x51\xba\x1e\x7e\x2b\xa0\x55\xe1\
-\xfe\xfc\x5b\x01\x36\x8b\x2e\xda\x3e\x90\x27\xfb\x93\x17\x86\x8a\
-\x5f\x61\x75\xaf\x19\xcc\xa7\x09\xbc\xf8\xfa\x57\x02\x0f\x22\x5d\
-\x77\x6f\xfd\x17\xc2\xf5\xc9\x59\x98\x51\x7d\xeb\x1f\xa5\x8b\xfe\
-\x05\x41\x4c\xed\xfe\xb0\xb6\xd9\x84\x2e\xda\xf8\x4e\xa7\xd3\xcf\
-\x9d\xf9\x62\xf4\x00\x6b\x5a\x8c\xc5\x9f\x12\x68\xb1\xb5\x6f\xbc\
-\xf5\x5f\x0b\xd7\x16\x58\xbb\x15\xd6\x61\x1a\xef\xcf\xbf\x15\x60\
-\x14\x5d\xb4\xf1\x9d\xfb\x62\x94\xf9\x12\xab\x6b\x31\x1a\x3a\xaf\
-\x27\x0a\x2f\xbe\x7e\xc1\xdd\xb1\x74\xdd\xbd\xf5\xdf\x18\xae\x35\
-\xcd\x6f\xfd\xa3\x74\x15\xff\x53\x80\x78\x7f\xfe\xdb\x2a\xed\x09\
-\xba\x68\x63\x4b\xff\x86\xf9\x96\x33\x5f\x8c\x1e\xa4\xc7\x7d\x80\
-\xd5\xb6\x18\x8f\x3f\x25\xf0\x9a\xb5\xec\x6f\x23\xf9\xad\x7f\x94\
-\x2e\x7f\x56\x80\xad\x86\x2e\xda\xd8\xd2\x93\xfd\x33\x67\xbc\x18\
-\x3d\x88\xc7\x61\x4d\x7b\x53\xba\xfc\x29\x81\x57\x2a\x5d\x1f\x6f\
-\xdc\xdf\x2a\xac\x7d\x2e\xac\xbb\xe0\xfe\xfc\xce\x94\x3d\x42\x17\
-\x6d\x6c\xe7\xbc\x18\x4d\xde\x78\xf1\x78\xf6\x1a\xab\x6b\x6f\xc2\
-\xb9\x4d\x94\x17\x5f\xac\x69\x63\x4b\xd7\x2b\xca\xfe\x56\x9c\xfd\
-\xd6\x3f\x4a\x57\xcf\xcf\x0a\xf0\x7f\x0a\xb0\x07\x74\xd1\xc6\x75\
-\x3a\x9d\x7e\xea\x8c\x17\xa3\x3b\xd3\x8b\x07\xd6\xb4\xa7\xd2\xe5\
-\x4f\x09\xbc\x32\x67\xec\xef\x9c\xc5\x6f\xfd\xa3\x74\xf9\xb3\x02\
-\xac\x3b\xba\x68\xe3\x4a\x4f\xf6\x27\x9f\x45\xde\x22\x7b\xf1\x78\
-\xce\xea\xda\x53\x33\xf3\xcb\x54\x5f\x7c\xfd\x2b\x81\x3b\x91\xf6\
-\xf1\xe3\x3d\xc2\x35\x60\xed\x5e\x7a\xdd\x5f\xe2\xff\x14\x60\x77\
-\xe8\xa2\x8d\x29\x3d\xd9\xbf\x9d\x3c\x99\xab\xe2\x45\x62\x7a\xf1\
-\xb8\xb9\xb9\xf9\x51\x56\xdb\x9e\x4a\x97\x3f\x25\xf0\x0a\xa4\x7d\
-\x7c\x7b\xc7\x70\xed\xf6\xd6\x3f\xea\xfc\x59\x01\x3f\xc0\xbe\x87\
-\x5d\x17\xba\x68\x63\x4a\x97\xf4\x3b\xea\x21\x9e\xec\xf9\x8b\x1b\
-\xd6\xb4\x32\x9c\xdf\x19\x2f\xbe\xfe\xb7\xad\xc1\x2d\xdc\xdf\x5c\
-\xf7\xb7\xfe\x91\x3f\x2b\xc0\x7a\xa2\x8b\x36\x26\x7c\x32\xd7\x60\
-\x78\xa5\x17\x8f\x4f\xb2\xba\x36\x2f\xcd\xcd\x9f\x12\x78\x60\x69\
-\x4f\x3f\xb5\x74\x7f\x27\x58\x7b\x2d\x3d\xc2\xff\x9e\x3f\x2b\xe0\
-\xca\xd1\x45\x1b\x4f\xba\x7e\x22\x7f\x32\xd7\x90\x27\x7b\xfc\x0d\
-\x75\xff\x2b\xab\x6d\xf3\xfc\x29\x81\xc7\x95\xf6\xf6\xdd\xf9\xf3\
-\x63\x49\xf8\xa7\xc7\xbd\xca\xbe\xc7\x1a\xd2\xd5\xf3\xb3\x02\xfc\
-\x83\xaa\x57\x8c\x2e\xda\x78\xd2\xf5\x7a\xfe\x84\x2e\x99\x79\xb2\
-\xbf\xce\xea\x5a\x5d\xf6\x62\x49\xe7\x5d\x13\x8f\xc3\x9a\x76\x79\
-\xf0\xfc\x58\xb2\xbf\xab\xbf\xf5\x8f\xd2\xe5\xcf\x0a\xb0\xc5\xe8\
-\xa2\x8d\x27\x7f\x42\x97\x14\x9e\xec\x3f\xc1\xea\x5a\x9d\x3f\x25\
-\xf0\x78\xd2\x9e\x66\x6f\xfd\xef\xf3\x1f\xee\xf0\x5e\x98\xe9\xfc\
-\x91\xd7\x83\xfc\xeb\x7e\x93\xd5\xb7\xe3\xa3\x8b\x36\x96\x74\x3d\
-\x7c\x26\x79\x49\xe9\xc9\x8e\x35\x4d\x83\xb3\x6e\x01\xfb\xe1\x5f\
-\x09\x1c\xc4\xed\xed\xcd\x7b\xf0\xf9\xc1\xf6\xaf\x26\x1e\x77\x73\
-\x73\x7a\x0f\xfb\x1e\x5b\x48\x57\xcf\xcf\x0a\x78\x1f\xfb\x1e\x76\
-\x6c\x74\xd1\xc6\x02\x4f\x54\xaa\xf2\x64\xf7\x3f\xe1\x2f\x94\xae\
-\x1e\x9f\x12\xe8\x9f\xc1\x18\x00\x79\x7e\xc8\xde\xd8\xdf\x67\x9f\
-\x62\xf5\xb7\x94\x2e\x7f\x56\x80\x9d\x8d\x2e\xda\x38\xd2\xf5\x77\
-\xf3\x27\x29\xd3\xf0\x64\xf7\xc7\xd3\x76\x30\xcd\xbb\xa6\xb0\x1f\
-\xfe\x07\xb1\x0b\x7b\xf3\xad\xff\xa5\xe1\x3f\xce\xdf\xa8\x39\x77\
-\x7f\xe4\xfc\x3d\xfa\x3a\xc2\xe7\xf3\xca\xd0\x45\x1b\x47\xba\x9e\
-\x67\x4f\xd0\x27\x1a\x9e\xec\x2f\x58\x5d\xd3\xa5\xcb\x9f\x12\xb8\
-\x63\x6f\xbe\xf5\xbf\x3c\xfc\x53\xad\xf7\xb2\xef\x71\x09\xe9\xea\
-\xf9\x59\x01\xfe\x4f\x01\x57\x84\x2e\xda\x38\xe0\xc9\xf9\x48\xe3\
-\x93\xfd\x1f\xb1\xba\xa6\x4b\x97\x3f\x25\x70\xc7\x66\xf6\xa3\xd9\
-\xb4\xbf\xf1\x2e\x02\xab\x7f\x49\xe9\xf2\x67\x05\x98\x8c\x2e\xda\
-\x18\xd2\xf5\xd1\xfc\x89\x99\x6b\x7d\xb2\x63\x4d\x5b\x26\x9f\x6d\
-\x4e\x79\xf1\xc5\x9a\xb6\xbe\x37\xde\xfa\x5f\x1e\xfe\xb1\xaf\x58\
-\x7b\x14\xad\xe7\xaf\x81\xff\x53\xc0\x95\xa0\x8b\x36\x06\x78\x52\
-\x3e\x10\xc2\xe6\xf7\x58\x5d\x3b\x5f\xba\xfc\x29\x81\x3b\xf3\xc6\
-\x5b\xff\x7d\xc2\x7f\xa4\xb7\xfe\x51\xe7\xcf\x0a\xf8\x00\xfb\x1e\
-\x76\x2c\x74\xd1\x2e\x2f\x5d\xf4\xed\xe6\xfc\xc5\xa8\xe1\xc9\xfe\
-\x37\x59\x6d\x5b\x26\x9f\xb1\xb8\x1f\x13\xff\x4a\xe0\x86\x96\x86\
-\xe1\xb4\xbf\x23\xbe\xf5\x8f\xd2\x3d\xfa\xb3\x02\xac\x19\x5d\xb4\
-\xcb\x4b\xd7\x97\xf2\x27\x66\xc8\x9f\x9c\x2d\x61\x83\x35\xad\x8f\
-\x74\xf9\x53\x02\x77\x22\xed\xc9\xa7\x5a\xf6\x83\xc1\xfd\xc5\xda\
-\xa3\xea\xd5\x6f\xfa\x87\x09\x7f\x56\xc0\xc1\xd1\x45\xbb\xbc\xda\
-\x93\xf3\x0d\xc5\xb0\xf9\x19\x56\xd7\xfa\x38\x63\x3f\x90\xff\x3b\
-\xeb\xca\xe2\x2f\xe9\x11\xf6\xe3\x11\xdc\xdf\x91\xdf\xfa\x47\xe9\
-\xea\xf9\x59\x01\xfe\xad\x80\x03\xa3\x8b\x76\x59\xe9\xfa\xd5\xc6\
-\x27\xe7\xc3\xd7\x20\xac\x69\x7d\xa5\x3d\xf0\xa7\x04\x0e\x4e\xdd\
-\x8f\x09\x3e\xdf\xf6\xf0\xd6\x3f\x4a\x97\x3f\x2b\xc0\xaa\xe8\xa2\
-\x5d\x96\xf2\xe4\x9c\xf1\x59\x56\xd7\xfa\xe9\xf4\x29\x81\x1f\x66\
-\xb5\x6d\xb9\xb4\x1f\x9f\x20\xf3\xae\x62\xcf\x37\xac\xbd\x17\xd8\
-\x1b\xd3\xf8\xfa\xe2\x77\xab\x0e\x8a\x2e\xda\xe5\xa4\xeb\x5d\xd3\
-\x13\xaf\xf1\xc9\xc9\xbc\x85\xd5\xb6\xbe\x84\xfd\xa0\xe2\x71\x58\
-\xd3\x96\x4b\x73\x95\xdf\x02\x0f\xec\xf9\x76\x73\x73\xda\xcd\x5b\
-\xff\x28\x5d\x3d\x3f\x2b\x60\xb7\x73\xb0\x79\x74\xd1\x2e\x27\x5d\
-\x5f\x8c\x27\x9c\xf8\xe4\x7c\x04\x6b\xda\x3a\x4e\xfe\x94\xc0\x21\
-\xe1\xac\x5b\xf0\xe7\xdb\xb3\x4f\xb3\xfa\x7b\x92\x2e\x7f\x56\x80\
-\xcd\xa2\x8b\x76\x39\xf1\x44\x3b\xe7\xc9\x99\xf9\x05\x56\xd7\xd6\
-\x01\xb3\x6f\x02\xfb\xeb\x5f\x09\xec\x28\x5d\xf2\x5b\xff\x73\xcf\
-\x37\xac\xbd\x57\xad\xfd\x36\xbc\xbe\xf8\x3f\x05\x1c\x0c\x5d\xb4\
-\xcb\x48\xd7\xdd\xbf\x51\x9e\xf9\xe4\xbc\x83\x35\x6d\x5d\xe9\xf2\
-\xa7\x04\x0e\x22\x5d\xef\xc8\x67\xdd\xa2\xf0\x7c\x7b\x27\xfb\x1e\
-\x7b\x94\xae\x9e\x9f\x15\xe0\xff\x14\x70\x20\x74\xd1\x2e\xa3\xc3\
-\x93\xf3\x0b\xac\xae\xad\x0b\xf6\x60\x56\x61\x7f\xfd\x6f\x56\x1d\
-\xe0\xbc\x6b\x0a\xfb\xf1\x49\x56\x7f\xcf\xd2\xe5\xcf\x0a\xb0\x27\
-\xe8\xa2\x6d\x2f\x3d\x09\xbf\xaf\xc3\x93\xf3\x30\xff\xd6\xb2\x27\
-\xe9\xf2\xa7\x04\x5e\x58\xba\x9a\x7f\xed\x2d\x94\xf6\x03\x6b\x1f\
-\x45\xe9\xfc\x89\xfc\x0f\xac\x07\x41\x17\x6d\x7b\xe9\x09\xf9\x87\
-\x4b\x9f\x9c\x58\xd3\xb6\x91\xae\x1e\x9f\x12\xe8\x5f\x09\x3c\x53\
-\xba\xa4\xb7\xfe\x2b\xfb\xf1\x2a\xfb\x1e\x47\xd0\xf9\xb3\x02\xbe\
-\x9f\x7d\x0f\xdb\x17\xba\x68\xdb\x9b\x79\x31\x52\xfc\x0a\xab\x6b\
-\xdb\x80\xbd\x78\x50\x09\x9b\x47\xb0\xa6\xb5\xc1\x39\x96\x54\xf6\
-\xe3\x70\x6f\xfd\x23\x7f\x56\x80\xe5\xe8\xa2\x6d\xeb\x74\x3a\x7d\
-\x84\xbc\x18\x49\xb0\xa6\x6d\x2b\x5d\xfe\x94\xc0\x0b\x48\x97\xff\
-\xc6\x3b\xd1\x39\xaf\x2f\x01\xe7\xe7\xcf\x0a\xd8\x3f\xba\x68\xdb\
-\x62\x2f\x46\xa2\x2f\xb1\xba\xb6\xad\x7c\x4f\x6a\x61\x33\xc3\xbf\
-\x12\x28\x48\x57\xf3\x5f\xf8\xd3\xb0\x1f\x87\x7d\xeb\x1f\x45\xaf\
-\xf7\x3d\x37\x2b\xcc\xcf\xbf\x15\xb0\x63\x74\xd1\xb6\x73\x7b\x7b\
-\xfb\x16\xf2\x62\x24\x49\x8f\xf3\x7f\x8f\x1b\x40\xba\xfc\x29\x81\
-\x1b\xc2\xd9\xcd\x69\xd8\x8f\xc3\xbf\xf5\x8f\xa2\xe7\xfb\xde\xab\
-\x6a\xf3\xc3\xda\xb6\x1f\x74\xd1\xb6\x93\x9e\x4c\x9f\x69\x0d\x07\
-\x26\x1e\x87\x35\xed\x72\x6a\x2f\x96\x0d\xfc\x13\xd6\x0d\xd2\xd5\
-\x14\x60\x2d\xfb\x81\xb5\xaf\xc5\xd4\x7f\x49\xe3\x79\xde\xfd\xdf\
-\x98\x78\xad\xe8\xa2\x6d\x47\x0c\x87\x47\xde\x78\x72\x3e\x7b\x8d\
-\xd5\xb5\xcb\x48\xfb\xe1\x4f\x09\x5c\x59\xba\x9a\xde\xc2\x6e\x0c\
-\xaf\xab\x79\xeb\x1f\x45\xef\xd9\x1c\x9e\x68\x9c\xdf\xe4\x3d\xec\
-\x7b\xd8\xd8\xe8\xa2\x6d\xe3\x74\x3a\xfd\xb4\x1a\x0e\x93\xe9\xc9\
-\x89\x35\xed\xb2\xfc\x29\x81\xeb\x83\x59\x51\x8d\xe1\x75\x75\x6f\
-\xfd\xa3\x98\x41\x36\x8f\x07\x8d\xf3\x7b\x04\x6b\xdb\xf8\xe8\xa2\
-\x6d\x23\x3d\x99\x5e\xb0\x27\x52\x4d\xf6\xe4\x7c\xce\xea\xda\x65\
-\xb5\xbc\x58\x96\xc4\xe3\xb0\xa6\xbd\x21\x5d\xd5\xb7\xfe\xb3\xe7\
-\x47\xe6\xe9\x7e\x60\xed\x6b\x95\xcf\x24\xb4\xce\x8f\xf0\x7f\x0a\
-\xd8\x19\xba\x68\xeb\x4b\x4f\xa6\xef\x20\x4f\xa0\xaa\xfc\xc9\x99\
-\xfe\x6d\xf3\x47\x58\x6d\xbb\x2c\x7f\x4a\xe0\x3a\xd2\x55\x7d\xeb\
-\x3f\x7f\x7e\x54\xc2\xeb\x6a\xdf\xfa\x47\x31\x8b\x69\x2e\xc2\xfc\
-\xe6\xec\xfe\x3f\x05\xa4\xe7\xde\xbb\x52\xbf\x1f\x4d\xbd\x3c\xbf\
-\x17\xff\xff\x2b\xec\x6b\xf7\x8e\x2e\xda\xfa\xd2\x25\x7d\x88\x4c\
-\xc0\x27\x27\xd6\xb4\x71\xe0\xde\xb5\x80\xfd\xf5\xaf\x04\x02\x9c\
-\x17\x12\xc2\xeb\xea\xdf\xfa\x47\x31\x13\x61\x7e\x45\x58\x7b\x2f\
-\xde\xf8\x9b\x12\xbf\xe6\x45\xa1\xdf\x78\xc7\xf6\x50\x3f\xeb\x40\
-\x17\x6d\x7d\xd9\xa1\x6a\x82\x4f\xce\xf4\x6f\x99\x9f\x60\x75\x6d\
-\x0c\xe9\xf2\xa7\x04\x76\x94\xae\xe2\x5b\xff\x4a\x78\x61\x6d\x7b\
-\x43\xeb\xfc\x1a\xec\xee\x3f\x05\x9c\x4e\xa7\x0f\x0b\xfd\xfe\x0e\
-\xab\xb1\x47\x74\xd1\xd6\x95\xae\x9f\xc8\x0e\x53\xd5\x4c\x38\x7c\
-\x2b\xab\x6d\xe3\xc0\x7d\x9c\x53\x08\x2f\xff\x4a\x60\x92\xae\x9e\
-\x3f\xad\xee\xb7\xfe\x67\xbc\xf1\x6f\xc0\xd5\xf9\x55\xc5\xe3\x6e\
-\x6e\x4e\xef\x67\xdf\x63\x44\xb7\xb7\x37\xef\x3d\xb3\xdf\x1f\x65\
-\xf5\xf6\x84\x2e\xda\xba\xd2\xf5\x7a\x76\x88\x8a\x66\x5e\xdc\x5e\
-\x67\x75\x6d\x2c\xe9\xf2\xa7\x04\x76\x90\xcf\x0b\xd5\xe6\x07\xfc\
-\xd6\x7f\xc5\x35\x7e\x56\xc0\xc2\x7e\xff\x90\xd5\xdc\x0b\xba\x68\
-\xeb\xc2\x43\x34\x27\x7f\x32\xc1\x8b\xdb\x4f\xb0\xba\x36\x96\x74\
-\xf9\x53\x02\x17\x4a\xd7\xec\x5b\xff\x8d\xf3\x7b\x80\xb5\x8d\x9b\
-\x9b\x5f\x0d\xee\x47\xfa\x87\x89\xdf\x62\xf5\x47\x72\xff\x03\x7f\
-\xb4\x9f\x9a\xbc\xdf\xf8\x4f\x08\xac\xfe\xe8\xe8\xa2\xad\x27\x5d\
-\x9f\xc8\x0f\xd1\x1c\x7c\x32\xbd\xe1\x8d\x17\x37\xac\x69\xe3\xc2\
-\x7d\x9d\x94\xf6\x17\xbf\x16\x6b\x5e\x8b\x74\xbd\x33\x9f\x43\x4e\
-\x99\xdf\x3d\xbf\xf5\xdf\x28\x66\x95\xcd\xad\x49\x61\x3f\x86\xfe\
-\xa1\xb9\x74\x7f\xf1\x13\xfe\xb4\xa7\x12\xde\xef\xb3\x2f\xb3\xef\
-\x31\x32\xba\x68\xeb\xc1\x83\xc4\x14\x9e\x4c\xf1\xbf\xfb\xbf\x0b\
-\xef\x48\xba\x7e\x7e\xda\xd7\x49\x65\x7f\x99\xab\xfc\x94\x40\x98\
-\xc1\x83\x33\xe6\xe7\xb7\xfe\x45\x31\xb3\x6c\x7e\x45\xb5\xfd\xc0\
-\xda\x23\x49\x57\xfc\x9a\xdf\xa3\x7e\x6a\x1a\xce\xdf\x2f\xb3\xef\
-\x35\x22\xba\x68\xeb\x48\xd7\xdf\xbb\x3f\x20\xb3\x1a\x0e\x97\x7f\
-\x32\x7c\x67\xa6\xbd\x0d\x0d\xfb\xcb\x5c\xdd\xaf\x04\xa6\xcb\x7f\
-\x43\xdd\x85\xe1\x1c\x99\xc6\xfd\x18\xf6\xb7\x02\xb2\x7b\x6c\x22\
-\x9c\xbf\xf8\x39\xaf\xbf\xc9\xbe\xe7\x48\xe8\xa2\xad\x23\x5d\xc5\
-\x7f\xda\x6c\x38\x5c\x2f\x58\x5d\x1b\x5b\xba\xfc\x29\x81\x82\x74\
-\xd1\xb7\xfe\xcf\x9c\x9f\xdf\xfa\x3f\x53\xcc\x2e\x9b\xe3\x13\xe2\
-\x7e\xbc\x9b\x7d\x8f\x4b\x83\x7b\x2c\x3a\xf3\xfc\x7d\x8c\x7d\xdf\
-\x51\xd0\x45\x5b\x07\x1c\x8c\x47\x1a\x0f\xd7\x3f\x64\x75\x6d\x7c\
-\x67\xbe\x78\xe4\xae\xe6\x3f\xfd\x40\xdf\x77\xce\x9c\x9f\xdf\xfa\
-\x5f\x28\x66\x98\xcd\xf3\xc1\x39\xfb\x81\xb5\x47\x80\xf7\x38\xe7\
-\xcc\xf3\x97\x1b\xf2\x67\x21\xe8\xa2\xf5\x97\xae\xd9\x1f\x36\x69\
-\x3d\x5c\x58\xd3\xf6\x23\xed\xa9\x3f\x25\xb0\x41\xba\x9e\x04\xce\
-\xb9\x2f\xbe\x58\xdb\xce\x83\x73\x3d\x77\x3f\x92\xe1\xfe\x53\x00\
-\xdc\x1f\xb5\xa0\x5f\x34\xdc\x5f\x20\x44\x17\xad\x3f\x38\x08\x0f\
-\x84\xc3\xf5\x7b\xac\xae\xed\xc3\x8d\x3f\x25\xb0\x2a\x5d\x4f\xde\
-\xfa\x5f\xf0\xe2\xeb\xb7\xfe\x3b\x89\x59\x4e\x73\x5d\xb0\x1f\x93\
-\xa1\xfe\x53\x00\xdc\xdb\x13\x1d\xfa\x7d\x24\x1e\x77\x3a\x9d\x7e\
-\x92\xdd\xcb\x25\xd0\x45\xeb\x2b\x5d\x1f\xc8\x0f\xc1\x44\x3c\x5c\
-\xc3\xff\x40\x89\x95\xf5\x78\xf1\xc0\x9a\x47\xc2\xfa\x3d\xf3\xc5\
-\xd7\x6f\xfd\x77\x16\x33\x5d\xb0\x1f\x8f\x60\xed\x4b\xc2\x7b\xcb\
-\xf5\xea\x77\x02\xf5\x3e\xcf\xee\x67\x6b\x74\xd1\xfa\x4a\xd7\x97\
-\xf3\x83\x10\xd4\xc3\x85\x35\x6d\x7f\x4e\xa7\x67\xff\x74\xe9\x8b\
-\xc7\xcd\x41\x3f\x25\x30\x5d\x9f\x62\xfd\xb6\x3e\x3f\x72\x58\xdb\
-\xfa\x38\x77\x3f\x88\x4f\xb1\xfa\x97\x00\xf7\xf5\x60\xc9\xf9\x63\
-\x0a\xf5\x3e\xc4\xee\x6b\x2b\x74\xd1\xfa\x12\x0e\xc3\xa3\xaf\xcb\
-\x5c\xf4\x90\x58\x3f\xb0\xaf\x4d\xe0\xbc\x1c\xee\x57\x02\xd3\xf5\
-\xe8\xad\xff\x33\x9e\x1f\x39\xbf\xf5\xbf\x92\xce\x9f\x15\x30\xc4\
-\xdf\x6d\x81\xf7\x16\x16\x9e\xbf\x27\x1a\xea\x7d\x89\xdd\xdb\x16\
-\xe8\xa2\xf5\x93\xae\x5f\xbd\xdf\xe4\x3b\xe7\x1c\x2e\xac\x69\xfb\
-\x95\x2e\x7f\x4a\x20\xa8\xf5\x5b\x7b\x7e\x64\xfc\xd6\xff\xca\x8e\
-\xf6\x59\x01\xa5\xfb\x3b\xe3\xfc\x3d\x21\xd6\xfb\x25\x76\x8f\x6b\
-\xa2\x8b\xd6\x4f\xbe\xc1\x67\x1e\xae\xcf\xb2\xba\xb6\x5f\xb0\xbf\
-\xb3\x0a\xe7\xe5\x30\xbf\x12\x98\xae\x87\xb7\xfe\xcf\x7c\x7e\x3c\
-\xc0\xda\xb6\x8e\xd6\xfd\x40\xb8\xbf\xe9\x1f\x26\x2e\x7e\x8e\x4b\
-\xf7\xa7\x9e\x3f\x74\x66\xbd\x4d\xff\x02\x21\xba\x68\x7d\xa4\xeb\
-\x5d\xf7\x9b\xba\xe4\x70\xbd\x85\xd5\xb6\xfd\x4a\x97\x3f\x25\x30\
-\x49\x57\x8f\xe7\xc7\xc4\x6f\xfd\x6f\x24\x66\x9d\xcd\xbd\x49\x61\
-\x7f\x2f\xfa\x5b\x01\x0d\xf7\xf7\xa8\x8f\x56\x1d\xea\x6d\xf2\x17\
-\x08\xd1\x45\xeb\x23\x5d\x5f\x8c\xcd\x5c\x72\x18\xb0\xa6\xed\x5f\
-\xba\xfc\x29\x81\xc9\xd4\xcb\x92\xe7\xc7\x3d\xbf\xf5\xbf\xb1\x98\
-\x79\x36\xff\xa2\xda\xfe\x62\xed\x2d\xb5\xdc\x9f\xaa\x73\xbd\x55\
-\xff\x01\x89\x2e\x5a\x1f\xb1\x81\x0b\x0f\xc3\x2f\xb0\xba\xb6\x7f\
-\xb0\xcf\x0f\x94\xf3\x82\x35\xf7\x24\x5d\x77\x6f\xfd\x2f\x7c\x7e\
-\xdc\xc1\xda\xb6\x0d\xdc\x07\xa6\x71\x7f\x2f\xf6\x5b\x01\x3d\xce\
-\x5f\x6e\x9d\x7a\xcf\xfe\x05\xbb\xf7\x1e\xe8\xa2\x2d\x97\xae\xbb\
-\x5f\xf9\x5a\x72\x18\xb0\xa6\x1d\x47\xba\xae\xf6\x53\x02\xd3\x75\
-\xf7\xd6\xff\xd2\xe7\xc7\x3d\xbf\xf5\x7f\x21\x31\xfb\x6c\x1f\x9e\
-\x10\xf7\xf7\x5d\xec\x7b\xac\xad\xc3\xf9\x7b\xd0\xe9\x3c\x3f\xc0\
-\x7a\x37\x37\xfd\xff\x02\x21\xba\x68\xcb\x75\x38\x0c\x5f\x60\x75\
-\xed\x38\xf2\xfd\x3e\xf3\xbc\xec\xf2\x57\x02\xe3\xde\x3b\x3c\x3f\
-\x82\xdf\xfa\xbf\xb0\xd8\x83\x6c\x3f\x1e\x9c\xb3\xbf\x58\x7b\x0b\
-\xca\xfd\x31\xff\xda\xe9\xe6\xee\xff\x76\x3a\xcf\x0f\x0a\xf5\xfe\
-\x80\xf5\x71\x2e\xba\x68\xcb\xa4\x4d\x7a\x5b\x87\xc3\xe0\x7f\xb3\
-\x39\xb8\x74\x5d\xdd\xa7\x04\xa6\xeb\x53\x4b\xfa\xcd\x61\x6d\xbb\
-\x0c\xdc\x97\x05\xfb\xbb\xf9\x7f\x0a\x58\x72\xfe\xc2\x6f\xfd\xa5\
-\xff\xec\xe5\x7f\xf3\xaf\xfc\x5b\x77\x8f\x3f\xa3\x5f\xaa\x61\x7e\
-\x7f\xcc\x7a\x39\x07\x5d\xb4\x65\xd2\x86\xfd\x61\x61\xf3\x9a\x60\
-\x4d\x3b\xa6\x86\x27\x7b\xcd\x6e\x7e\x25\x30\x5d\xef\xea\xd0\xef\
-\xc4\xff\x80\x3c\x88\xd8\x8b\x69\x5f\x3a\xee\xef\x9d\xd1\xeb\xfd\
-\xd1\x37\x7c\xf3\xcb\xdf\xff\xc6\x6f\x7e\xf9\xc3\xff\xc1\x37\xbc\
-\xfc\x77\xff\xdc\xd7\x2e\xae\x27\xdc\xdf\x47\xd9\x5e\xa8\xe8\xa2\
-\x2d\xd3\xb0\x79\x35\xbf\xcc\xea\xda\xf1\xa4\x33\x72\x35\x9f\x12\
-\x28\xbc\xb8\xd5\xf8\xad\xff\xc1\xc4\x9e\x74\xdc\xdf\x3b\x7b\xa8\
-\x17\xe1\xff\x99\x7b\x9f\xfa\xfa\xff\xfc\xe5\x7f\xff\x6f\xfe\x3b\
-\x2f\x9f\xfd\x99\x3f\x43\xbf\xbe\x46\xbd\x3f\xdc\x83\x73\xd0\x45\
-\x3b\xdf\xe9\x74\xfa\xc8\xd2\xc3\x85\x35\xed\xb8\xae\xe5\x53\x02\
-\x53\x5f\x9f\x52\x5e\xdc\x4a\xb0\xb6\x8d\xa1\xd7\xfe\x86\x78\xdc\
-\x1e\xea\x4d\xe1\x1f\xe2\x1f\x06\xe2\x1d\x81\x9f\xfd\x0f\xff\xca\
-\xcb\xff\xf8\xcf\x7e\x2d\x7d\xdc\x9c\x33\xef\xef\xff\x66\xfb\xa0\
-\xa0\x8b\x76\xbe\x0e\x87\xeb\x62\x7f\x2f\xb4\x5d\xc6\xc2\xf3\x72\
-\xf7\x38\xac\x39\x92\x74\x7f\xef\x3e\xe3\xc5\x6d\x8e\xdf\xfa\x1f\
-\x54\xcf\xcf\x0a\xe8\x78\x5e\x56\xad\x87\xe1\xff\xa5\x7b\x9f\xff\
-\xfa\xff\xe2\xe5\xff\xf2\x6f\xff\x7b\x2f\x6f\xbf\xba\xfe\x6e\xc0\
-\x82\xfb\xfb\x0c\xdb\x07\x05\x5d\xb4\xf3\xdc\xde\xde\xbe\xb5\xc3\
-\xe1\xfa\x7e\x56\xdb\x8e\xab\xd3\xa7\x04\xfe\x20\xab\x3d\x82\x33\
-\x5f\xdc\x18\xbf\xf5\x3f\xb8\x9e\x9f\x15\xd0\xe1\xbc\xac\x5e\x8f\
-\x85\x7f\xee\x97\xff\xe2\x5f\x7d\xf9\x9f\x7c\xed\x5f\xa0\xb5\xc2\
-\xc2\xfb\x7b\xc1\xf6\x40\x41\x17\xed\x3c\x69\xf3\x7e\x7f\xe9\xe1\
-\xc2\x9a\x76\x1d\xf0\x2c\xb4\x80\x17\x8f\x2f\xb3\xba\x97\x96\xee\
-\xeb\x37\xef\xef\xef\xde\xf9\xcf\x0f\xac\x6d\x63\x5a\xf2\xfa\xb7\
-\x20\x0c\x9f\xd8\xa2\x5e\x29\xfc\x27\x7f\x9c\xfc\x97\xff\xd2\xbf\
-\xda\x54\x4f\xbc\xbf\xcf\xb1\xf9\x2b\xe8\xa2\x9d\x67\xf9\xe1\x7a\
-\xd6\xe5\x27\x3b\x6d\x7f\xd2\x75\xb8\x4f\x09\x8c\x8f\x7c\xcd\xef\
-\x6f\xe1\xf3\xe3\x9d\xec\x7b\xd8\x78\xd2\xd5\xf3\xb3\x02\xe8\xd7\
-\xd7\x6c\x55\xaf\x25\xfc\xff\xc7\x7f\xe3\xeb\x9a\xeb\x89\xf7\xb7\
-\xf8\x63\xe2\xe9\xa2\xe9\x4e\xa7\xd3\x4f\x2f\x3d\x5c\x58\xd3\xae\
-\x0b\x9e\x8b\x39\x85\x17\x8f\xa1\x7e\x25\x90\xdc\x1f\xed\xa7\x26\
-\x3d\xce\x6f\xfd\xef\x4c\xba\xba\x7d\x56\x80\x6a\xcb\x7a\x2c\xf4\
-\x27\x9f\xfd\xcb\x7f\xed\xe5\x7f\xfd\x2f\xff\xeb\x52\x3d\xfc\xda\
-\x12\x9c\xf9\x39\xe8\xa2\xe9\xd2\xe6\xbd\x60\x9b\x54\x93\x1d\x86\
-\x5d\xfe\xad\x6e\xd6\x4f\xba\x0e\xf3\x29\x81\xa7\xd3\xb3\xdf\x62\
-\xf7\xa7\x8a\xc7\x61\x6d\xdb\x07\xdc\x4b\xa6\x76\x9e\x55\x5b\xd7\
-\x63\xc1\x1f\x3e\xf9\x97\xfe\xd3\x97\xdf\xf4\xe7\xfe\xbc\x5c\x4f\
-\xf0\x3b\x6c\xe6\x2a\xba\x68\x9a\xb4\x79\xdf\x41\x36\xa8\x2a\x3f\
-\x0c\x37\x37\x37\x3f\xc2\x6a\xdb\xf5\x48\xd7\x21\x3e\x25\x30\x9d\
-\xe5\xef\x2f\xdc\x5f\xb3\x78\xdc\xcd\xcd\xe9\xbd\xec\x7b\xd8\xf8\
-\xd2\xd5\xf3\xb3\x02\xaa\x2e\x51\x8f\x85\xff\xff\xfb\x17\xff\xea\
-\xcb\xaf\xbb\xfd\xb3\x8f\x6a\x85\x8e\xf7\xf7\xa7\x6c\xde\xe7\xa0\
-\x8b\xa6\x49\xd7\x6f\x67\x9b\xd3\x04\x0f\x03\xd6\xb4\xeb\x84\xe7\
-\x64\xa2\xbc\x78\x60\xcd\xad\xd5\xee\xaf\xc5\x1b\xfd\x3e\xfb\x34\
-\xab\x6f\xfb\x91\xae\x6e\x9f\x15\x50\x72\xa9\x7a\x18\xfe\x7f\xff\
-\xdf\xff\xfa\x97\x7f\xfe\x6b\x9e\x3d\xfa\x9a\xd0\xf1\xfe\x9e\xb3\
-\x39\x9f\x8b\x2e\x9a\x06\x36\xa8\x0a\x0f\xc3\xe9\xf4\xec\x13\xac\
-\xae\x5d\x9f\x74\xf5\xf8\x94\xc0\xf7\xb1\xda\x5b\x78\xf3\xad\xff\
-\xe5\x2f\xbe\x58\xdb\xf6\x69\x6e\x7f\x85\xf3\x5c\x74\xc9\x7a\x79\
-\xf8\xbf\xed\xeb\xfe\xa3\x97\x27\xf2\x35\x1d\xef\xef\xb3\x6c\xbe\
-\x4b\xd0\x45\x6b\x97\xae\x9f\xcc\x36\xa8\x8a\x1d\x86\xdb\xdb\xdb\
-\x6f\x65\xb5\xed\x3a\xd5\xce\x4b\xc3\x8b\xc7\x45\x7e\x25\xf0\xcd\
-\xb7\xfe\x97\xbf\xf8\xa6\x5a\xbb\xfc\xa8\x63\x7b\x2a\x5d\xaf\xe0\
-\xfe\x8a\xe7\x79\xd6\xa5\xeb\x45\xf0\xc7\x4f\xfa\xff\x0f\xe4\x27\
-\xfd\x43\xc7\xfb\xfb\xff\xd8\x6c\x97\xa2\x8b\xd6\x2e\x5d\x7f\x9a\
-\x6d\x52\xd1\xcc\x61\x78\x9d\xd5\xb5\xeb\x95\xae\xbb\xff\xa4\xb4\
-\xe4\xc5\x03\x6b\x6e\x41\xb9\x3f\x66\xea\x37\xfe\x32\x19\x56\xdf\
-\xf6\x2b\x5d\x3f\xb5\xe4\x3c\x33\x23\xd4\xfb\x83\xbf\xfc\xd7\x5e\
-\xfe\x57\x7f\xe1\xe9\x4f\xfa\x87\x8e\xf7\xf7\x73\x6c\xa6\x3d\xd0\
-\x45\x6b\x07\x1b\x35\xab\x70\x18\x7e\x9c\xd5\xb5\xeb\xd6\xe1\xc5\
-\x63\xd3\x5f\x09\x7c\xe3\xad\xff\x3e\x2f\xbe\x58\xdb\x8e\xe1\xe6\
-\xe6\xe6\x5d\x69\x7f\x5f\x9c\x79\x9e\x1f\xe9\xf0\xfc\x78\xe4\xdc\
-\x7a\xdf\x48\x7e\xd2\x3f\x74\xbc\xbf\xbf\xcd\x66\xd9\x0b\x5d\xb4\
-\x36\xe9\xfa\x44\xb6\x51\xb3\x4a\x87\x01\x6b\x9a\x85\x74\x46\x76\
-\xf3\x29\x81\x6f\xbc\xf5\xdf\xe7\xc5\xd7\x6f\xfd\x1f\xdf\xed\xed\
-\xcd\x3b\xd3\x5e\xbf\x96\xf6\xfd\x39\x3b\x0f\x35\xf9\x79\x59\xf2\
-\xfc\x98\x0c\x5c\xef\xdb\xd9\xfc\x7a\xa2\x8b\xd6\x06\x36\x8b\xaa\
-\x1c\x06\xbf\xd5\x69\x54\x0a\xc2\xdd\x7c\x4a\xe0\x82\xfb\x7b\xf4\
-\xfc\xf0\x5b\xff\xb6\xb5\xca\xeb\xb3\xac\x53\xbd\xae\x3f\xe9\x5f\
-\x42\x17\xad\x2e\x5d\x7f\x2f\xdb\x30\xaa\xe1\x30\x0c\xf5\x57\xb7\
-\xda\x58\xce\x7c\xf1\x78\x10\x8f\xc3\x9a\xbd\xa5\x7b\xfc\xcd\x25\
-\xf7\x97\x3f\x3f\xb0\xb6\xd9\xda\x2a\xaf\xcf\x12\x3c\xcf\x67\xd6\
-\xeb\xfe\x93\xfe\x25\x74\xd1\xea\xd2\x55\x7c\xfb\xaa\xe1\x30\x2c\
-\xfe\x24\x27\x3b\xb6\xf4\x6f\xc4\x43\x7f\x4a\xe0\xcd\xcd\xe9\xfd\
-\x4b\xef\x6f\x7a\x6e\xf8\xad\x7f\xbb\x84\xc2\xeb\xb3\x04\xcf\xf3\
-\x99\xf5\x56\xf9\x49\xff\x12\xba\x68\x75\xb0\x71\x8f\x34\x1e\x86\
-\x7f\xc8\xea\x9a\xe5\xb2\xf3\xd2\x0c\xce\xdf\x6a\xbf\x12\x28\xbe\
-\xb8\x3d\xc0\xe7\x87\xdf\xfa\xb7\x4b\x99\xce\xe0\x19\x61\xfd\x00\
-\xcf\xf3\x99\xf5\x56\xfb\x49\xff\x12\xba\x68\x65\xe9\x7a\x2d\xdb\
-\xb8\x47\x5a\x0f\x03\xd6\x34\x63\xd2\x25\xfd\x2d\x93\xec\xfc\xad\
-\xf1\x29\x81\xe9\xfb\x7c\x9a\x7d\xff\x1a\x76\x7f\x58\xdb\x6c\x2b\
-\x6f\x9c\xc1\x8b\x87\xff\xdf\x61\xf7\xb6\x05\xba\x68\x65\xb0\x79\
-\x0f\x84\xc3\xf0\xbb\xac\xae\x19\x03\x67\x67\x56\xe1\xfc\x75\xfd\
-\x95\xc0\x54\xef\xbd\xec\xfb\xd7\xb0\xfb\xbb\xb9\x39\x5d\xec\x6f\
-\x2d\x34\x9b\x79\x7d\x6e\x52\x78\xbe\xd1\xaf\x9f\xf1\x1d\xec\xbe\
-\xb6\x42\x17\x6d\x5e\xba\x3e\x90\x6d\xde\x03\xf1\x30\xfc\x0d\x56\
-\xdb\x8c\x49\xd7\x50\x9f\x12\x98\x7f\xdf\x56\xfc\xfe\xfc\xd6\xbf\
-\x5d\xd6\xcc\xeb\x73\x55\xed\xf9\xd6\x60\xb3\x9f\xf4\x2f\xa1\x8b\
-\x36\x2f\x5d\x5f\xce\x36\xf1\x8e\x7a\x18\xb0\xa6\x59\x49\xba\x86\
-\xf9\x94\xc0\x74\xc9\x6f\xfd\xcf\xdd\x1f\xd6\x36\xdb\x1a\x9e\xd5\
-\x16\xea\xeb\x3d\xf1\x39\x76\x2f\x97\x40\x17\x6d\x1e\x6c\xe4\x39\
-\x87\xe1\x43\xac\xae\x59\x09\x9c\xa1\x07\xca\xf9\xc3\x9a\xaa\x74\
-\xbd\x27\xaf\xd7\xa2\x70\x7f\xef\x62\xdf\xc3\x6c\x4b\x78\x5e\x6b\
-\x94\xe7\xdb\x8c\xdf\x60\xf7\x71\x29\x74\xd1\xb8\x74\xfd\xb3\x6c\
-\x23\xcf\x3a\x0c\x58\xd3\xac\x45\xba\x2e\xfe\x29\x81\x50\xab\xaa\
-\x70\x7f\x9f\x64\xf5\xcd\xb6\x86\x67\xb6\xe4\x8c\xe7\x1b\xfa\x08\
-\xbb\x87\x4b\xa2\x8b\xc6\xe5\x9b\x79\xe6\x61\xd8\xf4\x2f\x79\xb0\
-\x63\xc9\xcf\xd2\x99\xe7\xef\xec\x5f\x09\x4c\x97\xf4\xd6\x7f\xe9\
-\xfe\xb0\xb6\xd9\xa5\xe0\xb9\x9d\x73\xe6\xf3\x2d\xf7\x43\xec\xfb\
-\x5f\x1a\x5d\xb4\xa7\xd2\xf5\xee\x69\x33\x17\x1c\x86\xef\x65\xb5\
-\xcd\x5a\xa4\xeb\x22\x9f\x12\x98\x2e\xe9\xad\xff\xca\xfd\xbd\x93\
-\x7d\x0f\xb3\x4b\xc8\xcf\xed\x9c\x25\xcf\xb7\x7b\xdf\xc9\xbe\xf7\
-\x08\xe8\xa2\x3d\x95\xae\x3f\x8a\xcd\x5c\x72\x18\xb0\xa6\x99\xaa\
-\xc3\x8b\x91\xfc\x2b\x81\xf0\xf8\xa2\xca\xfd\xf9\xad\x7f\x1b\x4a\
-\x7e\x76\x99\x85\xcf\xb7\x3f\x61\xdf\x73\x24\x74\xd1\x9e\x8a\x0d\
-\x5d\x78\x18\x7e\x9e\xd5\x35\x53\xa4\x33\xb7\xe9\xa7\x04\xa6\xeb\
-\x37\xf3\xc7\x96\xd4\x9e\x1f\x58\xdb\xec\xd2\xf2\xf3\x8b\x16\xbe\
-\xde\x0f\xf3\x93\xfe\x25\x74\xd1\x1e\x4b\xd7\xdd\xdf\xc9\xbe\xe0\
-\x30\xa4\x32\xbc\xb6\x99\x62\xcb\x4f\x09\x4c\x57\xf3\x5b\xff\x0d\
-\xcf\x0f\xbf\xf5\x6f\xc3\x99\xce\x2f\x5a\xf8\x7a\x3f\xd4\x4f\xfa\
-\x97\xd0\x45\x7b\x6c\xe1\x61\x08\x5f\x60\x75\xcd\xce\x71\xc6\xf9\
-\x7b\x24\x1e\x87\x35\x19\x7c\xdc\x9c\x86\xe7\x87\xdf\xfa\xb7\x21\
-\x4d\x67\x38\xd7\x70\x9e\x4b\x86\xfb\x49\xff\x12\xba\x68\x6f\x4a\
-\x9b\xfe\xb6\x05\x87\x61\xf2\x2a\xab\x7d\x29\xe9\x7a\x25\x89\xcf\
-\x33\x78\xf2\x89\x86\x0b\x0f\xff\x13\x3b\xa8\xf7\x3c\xd5\xf8\xd8\
-\xed\xed\xcd\xbb\xd9\xac\x46\xb4\xc5\xa7\x04\xa6\xab\xe9\xad\xff\
-\x96\xfd\xc0\xda\x66\xa3\x48\xd7\x9f\x4c\xe7\x34\xb4\x9c\xe7\x82\
-\x21\x7f\xd2\xbf\x84\x2e\xda\x9b\xd2\x01\xf8\xfc\x99\x87\xe1\x01\
-\xd6\xbc\x94\x74\xbd\x9a\xbc\x98\xee\x0b\x2d\x3c\xfc\x4f\xec\xb0\
-\xde\x8b\x9b\x9b\xd3\x7b\xd9\xec\x46\x83\xbd\xb4\x80\x7e\x67\x7f\
-\x25\x30\x5d\x4d\x7f\xd7\x7f\xe3\x7e\xf8\xad\x7f\x1b\x56\xba\x3e\
-\x3a\x9d\xd5\xc6\xf3\x3c\x67\xd8\x9f\xf4\x2f\xa1\x8b\xf6\xa6\x33\
-\x0f\x43\xee\x97\x59\xdd\xad\xa5\xeb\x43\xd9\x3d\x3d\xb1\xf0\xf0\
-\x3f\xb1\xf3\x7a\xc3\xff\x6d\x8d\xe9\x5a\xed\x53\x02\xf1\xb1\x4c\
-\xe3\x7e\xf8\xad\x7f\x1b\x5a\xba\xde\x16\x67\xb5\xf1\x3c\x33\xc3\
-\xff\xa4\x7f\x09\x5d\xb4\x37\x9c\x4e\xa7\x8f\x88\x87\xe1\x09\xac\
-\x79\x09\xe9\x8a\x7f\xf3\x7f\x72\x6f\x93\x05\x87\x9f\x3a\x48\xbd\
-\x77\xb0\x59\x8e\x24\xbb\xd7\xa2\x42\xbf\x4f\x7e\x25\x30\x5d\xd5\
-\xb7\xfe\x1b\xe7\x97\xca\x3d\xae\x6d\x36\xa2\x74\x6e\x5f\xb4\x9c\
-\x67\x62\x17\x3f\xe9\x5f\x42\x17\xed\x0d\xe2\x61\x60\xfe\x98\xd5\
-\xdd\x5a\xba\xfc\xb6\xff\x3d\xa1\xde\x0b\x36\xcb\x91\xa4\xab\xeb\
-\xa7\x04\xa6\xab\xfa\xd6\xbf\x30\x3f\xbf\xf5\x6f\xbb\x10\xff\xd9\
-\xaf\xe1\x3c\xa3\xdd\xfc\xa4\x7f\x09\x5d\xb4\x97\x5f\x75\x7b\x7b\
-\xfb\x56\xe1\x30\x50\xe9\x71\xef\x67\xb5\xb7\x94\xae\xf8\x81\xbf\
-\x27\xf7\x16\x84\x17\xf3\x26\x07\xac\xf7\x0a\x9b\xe9\x28\xd2\xd5\
-\xf5\x53\x02\xb3\x35\x4a\x98\x9f\xdf\xfa\xb7\x5d\x39\x9d\x4e\x1f\
-\x2e\x9c\x67\xb4\xab\x9f\xf4\x2f\xa1\x8b\x76\xf7\x6f\xff\xbf\xdf\
-\x78\x18\xa8\x78\x1c\xd6\xbc\x84\x74\xc5\x4f\xfb\xd3\xfb\x6b\x7c\
-\x31\x6f\x72\xd0\x7a\xaf\xb1\x99\x8e\x04\xee\xf7\x81\xd2\xef\x7d\
-\x9d\xe2\x5b\xff\x6a\x3d\xb3\xbd\xb9\xb9\x39\xbd\x27\x9d\xe7\xd9\
-\x77\x4b\x93\xf8\xdf\x86\xfa\x8d\xae\xa5\xe8\xa2\xc5\x3f\x00\x2c\
-\x0d\x9b\x67\x1f\x65\x75\xb7\x96\x2e\xff\xaa\xdf\xf9\xf5\x9e\xb3\
-\x99\x8e\x24\x5d\x3d\x3e\x25\xf0\x8f\xc9\xda\x03\xb1\x9e\xdf\xfa\
-\xb7\x5d\x4b\x57\xfc\x60\xe0\xaf\x25\xf1\xda\x19\xe2\x37\x05\xde\
-\xc6\xbe\x76\xef\xe8\xe2\xb5\x3b\x9d\x4e\x1f\x6c\x08\x07\x6a\x7a\
-\xb1\xc4\x9a\x97\x32\x77\x7f\x8d\x2f\xe6\x55\x47\xaf\x87\xf3\x1c\
-\x51\x7e\xbf\x17\x9e\x9f\xdf\xfa\x37\xdb\x11\xba\x78\xed\xd2\x8b\
-\x5b\xe9\x6d\xa0\x59\xd9\x8b\xe5\x57\x58\xdd\x4b\x98\xb9\xbf\xcc\
-\x71\xc2\x1a\xf5\xa8\x87\xf3\x1c\x51\xba\x16\x7f\x4a\x20\xa3\xd6\
-\xc3\xfb\x32\xb3\xb1\xd1\xc5\x6b\x96\x5e\xdc\xbe\x93\xbd\xb8\xd5\
-\xe4\x2f\x96\x37\x37\x37\xff\x17\xab\x7d\x09\xec\xfe\x5a\x5e\xcc\
-\x6b\xae\xa5\x1e\xce\x73\x54\x03\xcc\xcf\x6f\xfd\x9b\xed\x0c\x5d\
-\xbc\x66\xe9\x92\xfe\x82\x95\x80\x2f\x96\x58\xf3\x92\xd8\xfd\x35\
-\xbc\x98\x17\x5d\x53\x3d\x9c\xe7\xa8\x52\x8f\x8b\x3f\x25\x70\x72\
-\xc6\xfc\xfc\xd6\xbf\xd9\x0e\xd1\xc5\x6b\x06\x2f\x6c\x55\xf8\x62\
-\x79\x3a\x3d\xfb\x38\xab\x7b\x29\x67\xbc\x98\x17\x5d\x5b\x3d\x9c\
-\xe7\xa8\x3a\x7d\x4a\xe0\x59\xf3\xc3\x7b\x31\xb3\x7d\xa0\x8b\xd7\
-\x2a\x5d\x3f\x99\xbf\xb0\xd5\xb0\x17\xcb\xdb\xdb\xdb\xbf\xce\x6a\
-\x5f\x8a\xfa\x62\x5e\x72\x4e\x38\x94\xec\xa1\x1e\xce\x73\x64\x17\
-\x9a\x9f\xdf\xfa\x37\xdb\x29\xba\x78\xad\xd2\xf5\xa7\xd9\x0b\x5b\
-\xd1\xcc\x8b\xe5\xeb\xac\xee\x25\xc1\xfd\x6d\x1d\x0e\xb3\xf6\x52\
-\x0f\xe7\x39\xb2\x1e\x9f\x12\x28\xce\xcf\x6f\xfd\x9b\xed\x18\x5d\
-\xbc\x56\xf0\xe2\x36\xab\xf0\x62\xf9\xe3\xac\xee\x25\x09\x2f\xe6\
-\xb3\xce\x0c\x87\x59\x7b\xaa\x87\xf3\x1c\x1d\xf6\xd2\xe2\xdc\xf9\
-\xe1\xf7\x36\xb3\x7d\xa1\x8b\xd7\x28\x5d\x9f\xc8\x5f\xdc\xe6\x94\
-\x5e\x2c\xb1\xe6\x08\x5a\x5f\xcc\xe7\xbc\xfe\xcf\xff\xbb\x97\x5f\
-\xfc\xe5\xff\xf6\xe5\x17\x7e\xe9\x4d\xf1\xe7\x58\x7f\xf1\x6b\xba\
-\xad\xeb\xb1\x9e\x4a\x70\x7f\x71\x9e\xa3\x4b\xd7\xe2\x4f\x09\x6c\
-\x3c\x2f\x7e\xeb\xdf\x6c\xe7\xe8\xe2\x35\x82\x17\x37\xaa\xf2\x62\
-\xf9\x69\x56\xf7\xd2\x1a\x5f\xcc\xa9\x78\xdc\x96\x61\xad\x6a\xa9\
-\xc7\xfa\x9a\xc3\xf6\x17\xe7\xb9\x07\xd8\xd7\x9c\xca\x79\x2e\xf1\
-\x5b\xff\x66\x07\x40\x17\xaf\x4d\xba\x7e\x38\x7b\x71\xa3\x1a\x5e\
-\x2c\xbf\x95\xd5\xbe\xb4\x86\x17\x73\x6a\xea\xb7\x14\xae\x8a\x4b\
-\x84\x7f\x60\xbd\x31\x73\xfb\x8b\xf3\xdc\x83\x74\x2d\xfe\x94\xc0\
-\x12\xfc\x7e\x66\xb6\x4f\x74\xf1\xda\xa4\xeb\x4f\xf2\x17\x38\xd4\
-\xf0\x62\x39\xec\x47\xc7\x4e\x3d\x28\xf2\x7e\xb7\x0c\xeb\x56\x4a\
-\x3d\xd6\x1f\x2a\xed\x2f\xce\x73\x0f\xd2\xd5\xe3\x53\x02\xe7\xf8\
-\xad\x7f\xb3\x83\xa0\x8b\xd7\x06\x5e\xe0\x1e\x69\x7c\xb1\xfc\x07\
-\xac\xee\x08\xb2\x7b\x6c\x82\xfd\x6e\x19\xd6\x2d\xd4\x7a\xac\xc7\
-\x5c\x6d\x7f\x71\x9e\x7b\x91\xf7\x98\x6b\x3c\xcf\x73\xfc\xd6\xbf\
-\xd9\x81\xd0\xc5\x6b\x92\x2e\xfa\x71\xb9\xa1\xf5\xc5\x12\x6b\x8e\
-\x24\xbf\xcf\x1a\xd6\xef\x9e\xc3\x3f\xb0\x3e\x27\x2d\xfb\x8b\xf3\
-\xdc\x8b\x74\xf5\xf8\x94\xc0\x47\xf0\x7b\x98\xd9\xbe\xd1\xc5\x6b\
-\x82\x2f\x72\x13\xe1\xc5\xf2\x77\x59\xdd\x51\xc0\xbd\xce\x9a\xeb\
-\x77\xcf\xe1\x1f\x58\xaf\xa1\x75\x7f\x71\x9e\x7b\x92\xf7\x21\x9c\
-\xe7\x39\x7e\xeb\xdf\xec\x60\xe8\xe2\xb5\x48\xd7\x0f\x64\x2f\x70\
-\x0f\xc4\x17\xcb\xbf\xc1\x6a\x8f\x02\xee\x95\x2a\xf5\xcb\x42\xb5\
-\x66\x94\xf0\x0f\x6a\xbf\xf8\xb5\x38\xcf\x3d\x49\x57\xaf\x4f\x09\
-\xf4\x5b\xff\x66\x07\x44\x17\xaf\x45\xba\xbe\x9c\xbd\xc8\xdd\x51\
-\x5f\x2c\xb1\xe6\x68\xf0\x7e\x51\xad\x5f\x16\xaa\x25\x23\x85\x7f\
-\x50\xfb\x45\x38\xcf\xbd\x51\xfb\x65\xb0\xa6\x99\x1d\x03\x5d\xbc\
-\x16\xf8\x42\x77\xc6\x8b\xe5\x07\x59\xdd\x91\xc0\xfd\x3e\xd2\xd2\
-\x2f\x0b\xd5\x39\xa3\x85\x7f\x50\xfb\x45\x38\xcf\xbd\x49\x3d\x2e\
-\xfd\x94\x40\xbf\xf5\x6f\x76\x50\x74\xf1\x1a\xa4\xeb\x9f\x65\x2f\
-\x72\x87\x0d\x07\xbc\xe7\x49\x6b\xbf\x2c\x54\x99\x11\xc3\x3f\xa8\
-\xfd\x22\x9c\xe7\xde\x2c\xfc\x94\x40\xbf\xf5\x6f\x76\x60\x74\xf1\
-\x1a\xe4\x2f\x74\x67\x86\xc3\x1f\xb0\xba\xa3\x81\x7b\xbe\xa3\xf4\
-\xcb\x42\x15\x8d\x1a\xfe\x41\xed\x17\xe1\x3c\xf7\x28\xf5\xfb\xa2\
-\xb5\xdf\x1c\xd6\x31\xb3\x63\xa1\x8b\x47\x97\xae\x77\x4f\x2f\x72\
-\x0b\xc2\xe1\x7b\x58\xed\xd1\xc0\x3d\xcb\xfd\xb2\x50\xcd\x8d\x1c\
-\xfe\x61\xc1\xfe\xde\xc1\x79\xee\xd1\xcd\xcd\xe9\xbd\xad\xfd\x66\
-\x5e\x65\xb5\xcc\xec\x38\xe8\xe2\xd1\xa5\xeb\x8f\xe2\x45\x6e\x49\
-\x38\x60\xcd\x51\xe5\xf7\x7c\x4e\xbf\x2c\x54\x27\xa3\x87\x7f\x3c\
-\xee\xdc\xfd\x9d\xe0\x3c\xf7\x2a\x5d\x1f\xcc\xfb\xaa\x18\xfe\x67\
-\x5b\xcc\x6c\x39\xba\x78\x74\xf1\x22\xb7\x24\xfc\x93\x9f\x67\x75\
-\x47\x34\xdd\xf3\xb9\xfd\xb2\x60\x0d\x7b\x08\xff\x78\xbc\xda\x2f\
-\xc2\x79\xee\x59\xba\x5e\x4d\x5e\x4c\xbd\x11\xf1\xbf\xbd\x83\x3d\
-\xd6\xcc\x8e\x87\x2e\x1e\x59\xba\xfe\x9f\x85\xe1\x9f\xca\xf0\xda\
-\x23\x8a\xfb\x5d\xd2\x6f\x29\x5c\x7b\x87\xf5\x1a\xf5\xce\xd9\xdf\
-\x1c\xce\xf3\x08\xd2\xf5\x4a\xf2\xd1\x24\x3e\x03\x23\xc4\xdf\x86\
-\xf9\x0a\xfb\x5a\x33\x3b\x2e\xba\x78\x64\x4b\xc3\x3f\xf9\x02\xab\
-\x3b\xaa\xa5\xfd\x96\xc2\xb5\x77\x58\xaf\x51\xef\x8c\xfd\x7d\x04\
-\xe7\x69\x66\x76\x14\x74\xf1\xa8\x52\x08\xbc\xb2\x30\xfc\xc3\xae\
-\xde\x22\x5d\xda\x6f\x29\x5c\x7b\x87\xf5\x1a\xf5\x96\x84\x7f\x3c\
-\x0e\xe7\x69\x66\x76\x14\x74\xf1\xa8\x52\x00\x7e\x7e\x49\x18\x06\
-\xac\x39\xba\xa5\xfd\x96\xc2\x75\xf4\xf0\x8f\x3f\x2f\x09\xff\x98\
-\x17\xce\xd3\xcc\xec\x28\xe8\xe2\x51\x2d\x0d\xc3\xe4\x97\x58\xdd\
-\x91\x2d\xec\xb7\x18\xae\xa3\x87\x7f\xac\xb3\x9e\x6a\xa6\xf0\x8f\
-\xb9\xe1\x3c\xcd\xcc\x8e\x82\x2e\x1e\xd1\xe9\x74\xfa\xc8\xd2\x30\
-\xc4\x9a\x7b\xb0\xa4\xdf\xb0\x65\x58\xb3\xaf\xaf\xa9\xd5\x63\x3d\
-\x95\xe4\xe1\xef\x7f\x00\x30\xb3\x23\xa3\x8b\x47\xb4\x34\xfc\x93\
-\x3f\x66\x75\x47\xb7\x24\xfc\xe3\x71\x5b\x86\xb5\xaa\xa5\x1e\xeb\
-\x6b\x0e\x86\xbf\xff\x01\xc0\xcc\x8e\x8c\x2e\x1e\xcd\xed\xed\xed\
-\xf7\x2d\x0c\xff\x78\xdc\xfb\x59\xed\xd1\x2d\x09\xff\x98\x57\x29\
-\x5c\x15\x97\x08\xff\xc0\x7a\x63\x58\xf8\xc7\x9f\x71\x9e\x66\x66\
-\x47\x41\x17\x8f\x26\xbd\x98\xff\xfe\xc2\xf0\x4f\x65\x78\xed\xd1\
-\x61\x2f\x2d\xf2\x30\xdc\x32\xac\x5b\x29\xf5\x58\x7f\x68\x2e\xfc\
-\xf7\xbc\xef\x66\x66\x35\x74\xf1\x68\x96\x86\x7f\x0a\x84\x5f\x63\
-\x75\xf7\x00\xfb\xa9\xc1\x30\xdc\x32\xac\x5b\xa8\xf5\x58\x8f\xb9\
-\x52\xf8\xc7\xff\x8e\xf3\x34\x33\x3b\x0a\xba\x78\x24\xa7\xd3\xe9\
-\x83\xcb\xc2\x7f\xdf\x6f\x03\x63\x4f\x25\x2c\x0c\xf7\x1c\xfe\x81\
-\xf5\x39\xa9\x85\x7f\xc0\x79\x9a\x99\x1d\x05\x5d\x3c\x92\xf4\x62\
-\x5e\xfa\xbb\xcf\x67\x65\xe1\xf0\x15\x56\x77\x2f\xb0\xaf\x39\x73\
-\x61\xb8\xe7\xf0\x0f\xac\xd7\xd0\x12\xfe\x01\xe7\x69\x66\x76\x14\
-\x74\xf1\x28\xd2\x8b\xf9\x77\xe6\x2f\xe6\xad\xf2\x70\xb8\xb9\xb9\
-\xf9\x61\x56\x7b\x2f\xb0\x37\xa6\x14\x86\x2c\x54\x6b\x46\x09\xff\
-\xa0\xf6\x8b\x5f\x8b\xf3\x34\x33\x3b\x0a\xba\x78\x14\xe9\xfa\xed\
-\xfc\xc5\xbc\x05\x86\x03\xd6\xdc\x1b\xec\x0f\xd5\xc2\x90\x85\x6a\
-\xc9\x48\xe1\x1f\xd4\x7e\x11\xce\xd3\xcc\xec\x28\xe8\xe2\x51\xe0\
-\x8b\x79\x0d\x86\xc3\xe9\xf4\xec\xe3\xac\xee\x9e\x60\x8f\xb9\x96\
-\x30\x64\xa1\x3a\x67\xb4\xf0\x0f\x6a\xbf\x08\xe7\x69\x66\x76\x14\
-\x74\xf1\x08\xd2\xf5\xf7\xf3\x17\xf2\x1a\x16\x0e\xb7\xb7\xb7\x7f\
-\x9d\xd5\xde\x13\xec\x73\xd2\x1a\x86\x2c\x54\x99\x11\xc3\x3f\xa8\
-\xfd\x22\x9c\xa7\x99\xd9\x51\xd0\xc5\x23\x48\xd7\x9f\xe6\x2f\xe4\
-\x25\x33\xe1\xf0\x3a\xab\xbb\x37\xd8\x6b\x50\xc2\x90\x85\x2a\x1a\
-\x35\xfc\x83\xda\x2f\xc2\x79\x9a\x99\x1d\x05\x5d\x3c\x02\x7c\x21\
-\x9f\x53\x08\x87\x1f\x63\x75\xf7\x46\xe8\xf7\xd1\xd7\x4d\x58\xa8\
-\xe6\x46\x0e\xff\xa0\xf6\x8b\x70\x9e\x66\x66\x47\x41\x17\xf7\x2e\
-\x5d\x9f\xc8\x5f\xc4\xe7\x94\xc2\x01\x6b\xee\x55\x6b\xbf\xf9\xd7\
-\xe5\x58\xa8\x4e\x46\x0f\xff\x78\x9c\xda\x2f\xc2\x79\x9a\x99\x1d\
-\x05\x5d\xdc\x3b\x7c\x11\x67\x2a\x61\xf8\x69\x56\x77\x8f\x1a\xfb\
-\x9d\xc5\x82\x35\xec\x21\xfc\xe3\xf1\x6a\xbf\x08\xe7\x69\x66\x76\
-\x14\x74\x71\xcf\xd2\xf5\xc3\xf9\x0b\x38\xd3\x10\x86\xdf\xca\x6a\
-\xef\x51\x63\xbf\xb3\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\xf6\x8b\x70\
-\x9e\x66\x66\x47\x41\x17\xf7\x2c\x5d\x7f\x92\xbf\x80\xa3\x86\x30\
-\x7c\xc1\xea\xee\xd5\x92\xf0\x0f\xa5\x70\xed\x1d\xd6\x6b\xd4\x53\
-\xfb\x45\x38\x4f\x33\xb3\xa3\xa0\x8b\x7b\x86\x2f\xe0\xb9\xc6\x30\
-\xfc\x07\xac\xee\x5e\x2d\x09\xff\x50\x0a\xd7\xde\x61\xbd\x46\xbd\
-\x25\xe1\x1f\x8f\xc3\x79\x9a\x99\x1d\x05\x5d\xdc\xab\x74\xfd\x7a\
-\xfe\x02\x9e\x6b\x0c\xff\x54\x86\xd7\xde\xab\x5a\xbf\x35\xa5\x70\
-\x1d\x3d\xfc\xe3\xcf\x4b\xc2\x3f\xe6\x85\xf3\x34\x33\x3b\x0a\xba\
-\xb8\x57\xf8\x22\x3e\x69\x0d\xff\xe4\x5f\xb0\xba\x7b\xb6\x24\xfc\
-\x43\x29\x5c\x47\x0f\xff\x58\x67\x3d\xd5\xe4\xe7\x05\xe7\x69\x66\
-\x76\x14\x74\x51\x21\x84\x6b\x93\x0b\xd7\xfb\xdf\x58\x8f\x7b\xb6\
-\x74\x7e\x5b\x86\x35\xfb\xfa\x9a\x5a\x3d\xd6\x53\x09\x9e\x17\x9c\
-\xa7\xed\xdf\xcd\xcd\xcd\xbb\x4f\xa7\x67\x1f\x4b\xfb\xfb\x7c\xe9\
-\xf3\x43\x7c\x7d\xa9\xba\x40\xbd\xe7\xc9\x6b\xc9\x2b\x6c\x56\x76\
-\x6c\x74\x51\xb1\xf1\x61\x95\xa8\xf5\xb0\xb7\x23\x58\x3a\xbf\x2d\
-\xc3\x5a\xd5\x52\x8f\xf5\x35\x87\x9d\x17\x9c\xa7\xed\x57\xda\xdf\
-\x77\xa6\xfd\x7d\x91\xef\xef\xd2\xe7\x07\x9e\x97\x9d\xd7\x8b\x8f\
-\x4e\x7f\x95\xcd\xce\x8e\x89\x2e\x2a\x84\xc3\x55\x34\xc0\xe1\xff\
-\x20\xeb\x6f\xef\x96\xce\xaf\x14\xae\x8a\x4b\x84\x7f\x60\xbd\x31\
-\x73\xe7\x05\xe7\x69\xfb\x94\xf6\xf7\x67\xc4\xd7\x83\xa2\xb9\xf3\
-\x72\x90\x7a\x1f\x62\x33\xb4\xe3\xa1\x8b\x8a\x01\x0e\xeb\x13\xe7\
-\xd4\xc3\xbe\x8e\x02\xfb\x6c\x91\xcf\x6f\xcb\xb0\x6e\xa5\xd4\x63\
-\xfd\xa1\xd2\x79\xc1\x79\xda\xfe\xa4\x7d\x8c\x7f\xf3\xa7\xfb\xcb\
-\xce\x43\x4d\xe9\xbc\xb0\xaf\xaf\x19\xb4\xde\x3b\xd8\x2c\xed\x58\
-\xe8\xa2\x62\x90\xc3\xfa\xe0\xcc\x7a\x7f\xc0\x7a\x3b\x02\xe8\xb3\
-\x0a\xe7\xb7\x65\x58\xb7\x50\xeb\xb1\x1e\x73\xb5\xf3\x82\xf3\xb4\
-\xfd\x49\xfb\xe9\xb7\xfd\xf5\x7a\x87\xfa\xfb\x50\x8c\xa3\x8b\x8a\
-\x83\x1c\xfe\xef\x61\xbd\x1d\x01\xf4\x59\xc4\xe6\xb7\xe7\xf0\x0f\
-\xac\xcf\x49\xcb\x79\xc1\x79\xda\xbe\xc4\x0f\xfc\x95\xf6\x57\xd1\
-\x72\x5e\x14\x3b\xa8\xf7\x76\x36\x53\x3b\x0e\xba\xa8\x18\xe8\xb0\
-\x9e\x5d\x0f\x7b\x3a\x12\xec\x75\xce\xdc\xfc\xf6\x1c\xfe\x81\xf5\
-\x1a\x5a\xcf\x0b\xce\xd3\xf6\xe5\xfe\xa7\xfd\x67\xf7\xb7\x55\xeb\
-\x79\x69\xb5\x8f\x7a\xcf\x3e\xc6\x66\x6a\xc7\x41\x17\x15\x78\x70\
-\x5a\x0c\x76\xf8\x3f\xc2\xfa\x3a\x0a\xe8\x95\x2a\xcd\x8f\x85\x6a\
-\xcd\x28\xe1\x1f\xd4\x7e\xf1\x6b\x71\x9e\xb6\x2f\x69\x6f\xfd\xab\
-\x7e\xa2\xac\xde\x73\x36\x53\x3b\x0e\xba\xa8\xc0\xc3\x53\x33\xda\
-\xe1\xc7\x7e\x8e\x06\xfb\x45\xb5\xf9\xb1\x50\x2d\x19\x29\xfc\x83\
-\xda\x2f\xc2\x79\xda\xbe\xd4\xf6\xb7\x46\x3d\x2f\x35\x7b\xab\x87\
-\xf3\xb4\x63\xa1\x8b\x0a\x3c\x40\x25\x03\x1e\xfe\xcf\xb3\x9e\x8e\
-\x04\xfa\x7d\xa4\x65\x7e\x2c\x54\xe7\x8c\x16\xfe\x41\xed\x17\xe1\
-\x3c\x6d\x5f\xc4\xd7\x83\x47\xce\x39\x2f\x25\x7b\xac\x87\xf3\xb4\
-\x63\xa1\x8b\x0a\x3c\x44\x73\x06\x3d\xfc\x87\xff\x55\x17\xe8\xf7\
-\x41\xeb\xfc\x58\xa8\x32\x23\x86\x7f\x50\xfb\x45\x38\x4f\xdb\x17\
-\xf1\xf5\xe0\xc1\xb9\xe7\x65\xce\x5e\xeb\xe1\x3c\xed\x58\xe8\xa2\
-\x02\x0f\x12\x33\xe8\xe1\xbf\x8a\x5f\x73\x81\x9e\xef\x28\xf3\x63\
-\xa1\x8a\x46\x0d\xff\xa0\xf6\x8b\x70\x9e\xb6\x2f\xb8\x9f\x2d\x96\
-\x9c\x17\x66\xcf\xf5\x70\x9e\x76\x2c\x74\x51\x81\x87\x09\x6d\x79\
-\x58\xd9\xd7\x17\x5c\xc5\x5f\x74\x01\x3d\xcb\xf3\x63\xa1\x9a\x1b\
-\x39\xfc\xc3\xd2\xf3\x82\xf3\xb4\x7d\xc1\xfd\xac\x59\x7a\x5e\xd0\
-\xde\xeb\xe1\x3c\xed\x58\xe8\xa2\x22\x3f\x4c\x68\xeb\xc3\x2a\xf8\
-\x69\xd6\xcb\x11\xe5\x7d\x9f\x33\x3f\x16\xaa\x93\xd1\xc3\x3f\x1e\
-\xb7\xf4\xbc\xe0\x3c\x6d\x5f\x70\x3f\x4b\x3a\xbe\xbe\xdc\x39\x42\
-\x3d\x9c\xa7\x1d\x0b\x5d\x54\x4c\x07\x05\x5d\xe2\xb0\x36\x88\x0f\
-\xbb\xb8\xaa\x4f\xbd\x9a\x7a\x3f\x77\x7e\x2c\x58\xc3\x1e\xc2\x3f\
-\x1e\xaf\xf6\x8b\x70\x9e\xb6\x2f\xb8\x9f\x73\x3a\xbd\xbe\x3c\x38\
-\x4a\x3d\x9c\xa7\x1d\x0b\x5d\x54\xe4\x87\x65\x72\xa9\xc3\x3a\x23\
-\x3e\xee\xf2\xa3\xc9\xdb\xd8\xfd\x1f\x5d\xcc\x60\xc9\xfc\x4a\xe1\
-\xda\x3b\xac\xd7\xa8\x77\xc6\x79\x79\x04\xe7\x69\xfb\x82\xfb\xc9\
-\x2c\x7c\x7d\x79\xe2\x48\xf5\x70\x9e\x76\x2c\x74\xd1\x8e\x63\xe9\
-\x8b\x47\x29\x5c\x7b\x87\xf5\x1a\xf5\xd4\x7e\x11\xce\xd3\xf6\x05\
-\xf7\x13\xd5\x9e\x1f\x5f\xfa\x86\x6f\x96\xfc\x51\xf2\xfb\xdf\xf8\
-\xcd\x2f\x3f\x93\x89\x3f\xc7\x3a\xfb\xfa\x9a\xa5\xf5\xd4\x7e\x11\
-\xce\xd3\x8e\x85\x2e\xda\x71\x28\x4f\x76\xa6\x14\xae\xbd\xc3\x7a\
-\x8d\x7a\x6a\xbf\xb9\x78\x1c\xce\xd3\xf6\x05\xf7\x34\xd7\x12\x86\
-\x2c\x54\xe7\x8c\x16\xfe\x41\xed\x17\xe1\x3c\xed\x58\xe8\xa2\x1d\
-\x87\xf2\x64\x67\x4a\xe1\x3a\x7a\xf8\xc7\x9f\xd5\x7e\x27\xd3\x8b\
-\x25\xce\xd3\xf6\x05\xf7\x75\xd2\x1a\x86\x2c\x54\x99\x11\xc3\x3f\
-\xa8\xfd\x22\x9c\xa7\x1d\x0b\x5d\xb4\xe3\x50\x9e\xec\x4c\x29\x5c\
-\x47\x0f\xff\x58\x67\x3d\xd5\xe4\x2f\x96\x38\x4f\xdb\x17\xdc\xdb\
-\xa0\x84\x21\x0b\x55\x34\x6a\xf8\x07\xb5\x5f\x84\xf3\xb4\x63\xa1\
-\x8b\x76\x1c\xca\x93\x9d\xd9\x32\xac\xd9\xd7\xd7\xd4\xea\xb1\x9e\
-\x4a\xf0\xc5\x12\xe7\x69\xfb\x52\xdb\xdf\xda\xf3\x83\x85\x6a\x6e\
-\xe4\xf0\x0f\x6a\xbf\x08\xe7\x69\xc7\x42\x17\xed\x38\x94\x27\x3b\
-\x8a\xc7\x6d\x19\xd6\xaa\x96\x7a\xac\xaf\x39\xec\xc5\x12\xe7\x69\
-\xfb\x52\xdb\xdf\xda\xf3\x83\x85\xea\x64\xf4\xf0\x8f\xc7\xa9\xfd\
-\x22\x9c\xa7\x1d\x0b\x5d\xb4\xe3\x50\x9e\xec\xb9\xe9\xc5\xb2\x14\
-\xae\x8a\x4b\x84\x7f\x60\xbd\x31\x73\xe1\x80\xf3\xb4\x7d\xa9\xed\
-\x6f\xed\xf9\xc1\x82\x35\xec\x21\xfc\xe3\xf1\x6a\xbf\x08\xe7\x69\
-\xc7\x42\x17\xed\x38\xf0\x09\xdd\x22\x7f\xb1\xdc\x32\xac\x5b\x29\
-\xf5\x58\x7f\xa8\x14\x0e\x38\x4f\xdb\x97\xda\xfe\xe6\xe7\x80\x29\
-\x85\x6b\xef\xb0\x5e\xa3\x9e\xda\x2f\xc2\x79\xda\xb1\xd0\x45\x3b\
-\x0e\x7c\x42\xd7\xe0\x8b\xe5\x96\x61\xdd\x42\xad\xc7\x7a\xcc\xd5\
-\xc2\x01\xe7\x69\xfb\x52\xdb\xdf\x9a\x52\xb8\xf6\x0e\xeb\x35\xea\
-\xa9\xfd\x22\x9c\xa7\x1d\x0b\x5d\xb4\xe3\xc0\x27\x74\x09\x7b\xb1\
-\xdc\x73\xf8\x07\xd6\xe7\xa4\x25\x1c\x70\x9e\xb6\x2f\xb5\xfd\xad\
-\x29\x85\x6b\xef\xb0\x5e\xa3\x9e\xda\x6f\x2e\x1e\x87\xf3\xb4\x63\
-\xa1\x8b\x76\x1c\xf8\xa4\x9e\x33\x17\x86\x7b\x0e\xff\xc0\x7a\x0d\
-\x73\xfd\xe2\x8b\x25\xce\xd3\xf6\xa5\xb6\xbf\x35\xa5\x70\x1d\x3d\
-\xfc\xe3\xcf\x6a\xbf\x93\xe9\xf9\x81\xf3\xb4\x63\xa1\x8b\x76\x1c\
-\xf8\xc4\x66\x4a\x61\xc8\x42\xb5\x66\x94\xf0\x0f\x6a\xbf\xf8\xb5\
-\x38\x4f\xdb\x97\xda\xfe\xd6\x94\xc2\x75\xf4\xf0\x8f\x75\xd6\x53\
-\x4d\xfe\xfc\xc0\x79\xda\xb1\xd0\x45\x3b\x0e\x7c\x72\xa3\x5a\x18\
-\xb2\x50\x2d\x19\x29\xfc\x83\xda\x2f\xc2\x79\xda\xbe\xd4\xf6\xb7\
-\x66\xcb\xb0\x66\x5f\x5f\x53\xab\xc7\x7a\x2a\xc1\xe7\x07\xce\xd3\
-\x8e\x85\x2e\xda\x71\xe0\x13\x3c\xd7\x12\x86\x2c\x54\xe7\x8c\x16\
-\xfe\x41\xed\x17\xe1\x3c\x6d\x5f\x6a\xfb\x5b\x12\x8f\xdb\x32\xac\
-\x55\x2d\xf5\x58\x5f\x73\xd8\xf3\x03\xe7\x69\xc7\x42\x17\xed\x38\
-\xf0\x49\x3e\x69\x0d\x43\x16\xaa\xcc\x88\xe1\x1f\xd4\x7e\x11\xce\
-\xd3\xf6\xa5\xb6\xbf\x73\xa6\xf3\x52\x0a\x57\xc5\x25\xc2\x3f\xb0\
-\xde\x98\xb9\xe7\x07\xce\xd3\x8e\x85\x2e\xda\x71\xe0\x13\x3d\x28\
-\x61\xc8\x42\x15\x8d\x1a\xfe\x41\xed\x17\xe1\x3c\x6d\x5f\x70\x3f\
-\x5b\xe4\xe7\x65\xcb\xb0\x6e\xa5\xd4\x63\xfd\xa1\xd2\xf3\x03\xe7\
-\x69\xc7\x42\x17\xed\x38\x94\x27\x3b\x7e\x6d\x60\xa1\x9a\x1b\x39\
-\xfc\x83\xda\x2f\xc2\x79\xda\xbe\xe0\x7e\xd6\xe0\x79\xd9\x32\xac\
-\x5b\xa8\xf5\x58\x8f\xb9\xda\xf3\x03\xe7\x69\xc7\x42\x17\xed\x38\
-\x94\x27\x3b\xc3\x42\x75\x32\x7a\xf8\xc7\xe3\xd4\x7e\x11\xce\xd3\
-\xf6\x05\xf7\xb3\x84\x3d\x3f\xf6\x1c\xfe\x81\xf5\x39\x69\x79\x3d\
-\xc0\x79\xda\xb1\xd0\x45\x3b\x0e\xe5\xc9\xce\xb0\x60\x0d\x7b\x08\
-\xff\x78\xbc\xda\x2f\xc2\x79\xda\xbe\xe0\x7e\xce\x99\x7b\x7e\xec\
-\x39\xfc\x03\xeb\x35\xb4\xbe\x1e\xe0\x3c\xed\x58\xe8\xa2\x1d\x87\
-\xf2\x64\x67\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\xf6\x8b\x70\x9e\xb6\
-\x2f\xb8\x9f\x4c\xe9\xf9\xc1\x42\xb5\x66\x94\xf0\x0f\x6a\xbf\xf8\
-\xb5\x38\x4f\x3b\x16\xba\x68\xc7\xa1\x3c\xd9\x99\x52\xb8\xf6\x0e\
-\xeb\x35\xea\xa9\xfd\x22\x9c\xa7\xed\x0b\xee\x27\xaa\x3d\x3f\x58\
-\xa8\x96\x8c\x14\xfe\x41\xed\x17\xe1\x3c\xed\x58\xe8\xa2\x1d\x87\
-\xf2\x64\x67\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\xf6\x9b\x8b\xc7\xe1\
-\x3c\x6d\x5f\x70\x4f\x73\x2d\x61\xc8\x42\x75\xce\x68\xe1\x1f\xd4\
-\x7e\x11\xce\xd3\x8e\x85\x2e\xda\x71\x28\x4f\x76\xa6\x14\xae\xa3\
-\x87\x7f\xfc\x59\xed\x77\x32\xbd\x58\xe2\x3c\x6d\x5f\x70\x5f\x27\
-\xad\x61\xc8\x42\x95\x19\x31\xfc\x83\xda\x2f\xc2\x79\xda\xb1\xd0\
-\x45\x3b\x0e\xe5\xc9\xce\x94\xc2\x75\xf4\xf0\x8f\x75\xd6\x53\x4d\
-\xfe\x62\x89\xf3\xb4\x7d\xc1\xbd\x0d\x4a\x18\xb2\x50\x45\xa3\x86\
-\x7f\x50\xfb\x45\x38\x4f\x3b\x16\xba\x68\xc7\xa1\x3c\xd9\x99\x2d\
-\xc3\x9a\x7d\x7d\x4d\xad\x1e\xeb\xa9\x04\x5f\x2c\x71\x9e\x3d\xdc\
-\xdc\xdc\xbc\x3b\x7d\x9f\xd7\xd2\xf7\x7b\x8e\xdf\xbf\x66\xc9\x8b\
-\x39\x33\x40\xbd\x98\x41\xcc\xe2\x15\x36\xab\xa5\xee\xbf\xc7\x03\
-\xf5\xfe\x58\xa8\xe6\x46\x0e\xff\x70\xc6\x7e\x3c\x82\xf3\xb4\x63\
-\xa1\x8b\x76\x1c\xca\x93\x1d\xc5\xe3\xb6\x0c\x6b\x55\x4b\x3d\xd6\
-\xd7\x1c\xf6\x62\x89\xf3\x5c\x22\x05\xff\xfb\x52\xfd\x17\x4b\xf6\
-\x63\xc9\x8b\x39\x1a\xb0\xde\x8b\xe4\x55\x36\xbb\x73\x65\xb5\xcf\
-\xba\x3f\x16\xaa\x93\xd1\xc3\x3f\x1e\xb7\x70\x3f\xd2\x08\xf9\x5c\
-\xed\x18\xe8\xa2\x1d\x87\xf2\x64\xcf\x4d\x2f\x96\xa5\x70\x55\x5c\
-\x22\xfc\x03\xeb\x8d\x99\x0b\x07\x9c\xe7\xb9\x4e\xa7\xd3\x87\xd5\
-\x17\xdf\xdc\xdc\xfd\x1d\xb4\xde\x87\xd8\x0c\xcf\x31\xd5\x3c\xf7\
-\xfe\x58\xb0\x86\x3d\x84\x7f\x3c\x5e\xed\x17\xe1\x3c\xed\x58\xe8\
-\xa2\x1d\x07\x3e\xa1\x5b\xe4\x2f\x96\x5b\x86\x75\x2b\xa5\x1e\xeb\
-\x0f\x95\xc2\x01\xe7\x79\x8e\xfb\x7f\xf3\x97\x5f\x7c\x27\xa5\xfb\
-\x63\x5f\x5f\xb3\x87\x7a\x37\x37\xa7\xf7\xb0\x59\xaa\xa6\x7a\xe7\
-\xde\x5f\x29\x5c\x7b\x87\xf5\x1a\xf5\x96\xee\x07\xce\xd3\x8e\x85\
-\x2e\xda\x71\xe0\x13\xba\x06\x5f\x2c\xb7\x0c\xeb\x16\x6a\x3d\xd6\
-\x63\xae\x16\x0e\x38\xcf\x73\xa4\x7a\x7e\xdb\xbf\x51\x56\xef\x05\
-\x9b\xa5\x6a\xe9\xfd\x95\xc2\xb5\x77\x58\xaf\x51\x6f\xe9\x7e\xe0\
-\x3c\xed\x58\xe8\xa2\x1d\x07\x3e\xa1\x4b\xd8\x8b\xe5\x9e\xc3\x3f\
-\xb0\x3e\x27\x2d\xe1\x80\xf3\x54\xdd\xff\xc0\xdf\xa3\xef\xdb\xaa\
-\xe5\xfe\x14\x7b\xab\x77\x7b\x7b\xf3\x6e\x36\x53\xc5\xd2\xfb\x2b\
-\x85\x6b\xef\xb0\x5e\xa3\xde\xd2\xfd\xc0\x79\xda\xb1\xd0\x45\x3b\
-\x0e\x7c\x52\xcf\xc1\x17\xdf\xe9\xc5\x72\xcf\xe1\x1f\x58\xaf\x61\
-\xae\x5f\x7c\xb1\xc4\x79\xaa\x52\xbd\xf8\x09\xf7\x47\x35\x5b\xb4\
-\xde\x5f\xab\x7d\xd6\x7b\xf6\x31\x36\x53\xc5\xe3\x7a\xfa\xfd\x95\
-\xc2\x75\xf4\xf0\x8f\x3f\x2f\xdd\x0f\x9c\xa7\x1d\x0b\x5d\xb4\xe3\
-\xc0\x27\x36\xc3\x5f\x7c\xdf\x78\xb1\x64\xa1\x5a\x33\x4a\xf8\x07\
-\xb5\x5f\xfc\x5a\x9c\xa7\x2a\x5d\xfe\x55\xbf\x8a\x42\xbd\xe7\x6c\
-\xa6\x8a\xa5\xf7\x57\x0a\xd7\xd1\xc3\x3f\xd6\x59\x4f\x35\xf9\x7e\
-\xe0\x3c\xed\x58\xe8\xa2\x1d\x07\x3e\xb9\x51\xe1\xc5\xf7\xee\x7f\
-\x67\xa1\x5a\x32\x52\xf8\x07\xb5\x5f\x84\xf3\x54\x61\xbd\x1a\xf5\
-\xfe\x6a\xf6\x5e\x0f\xe7\xa9\x5a\x7a\x7f\x5b\x86\x35\xfb\xfa\x9a\
-\x5a\x3d\xd6\x53\x09\xee\x07\xce\xd3\x8e\x85\x2e\xda\x71\xe0\x13\
-\x3c\x57\x7b\xf1\x0d\x2c\x54\xe7\x8c\x16\xfe\x41\xed\x17\xe1\x3c\
-\x55\x58\xaf\xe4\x9c\xfb\x2b\x39\x42\x3d\x9c\xa7\x6a\xe9\xfd\x6d\
-\x19\xd6\xaa\x96\x7a\xac\xaf\x39\x6c\x3f\x70\x9e\x76\x2c\x74\xd1\
-\x8e\x03\x9f\xe4\x93\x96\x17\xdf\xc0\x42\x95\x19\x31\xfc\x83\xda\
-\x2f\xc2\x79\xaa\xb0\xde\x9c\x73\xef\x6f\xce\x51\xea\xe1\x3c\x55\
-\x4b\xef\xaf\x14\xae\x8a\x4b\x84\x7f\x60\xbd\x31\x73\xfb\x81\xf3\
-\xb4\x63\xa1\x8b\x76\x1c\xf8\x44\x0f\xad\x2f\xbe\x81\x85\x2a\x1a\
-\x35\xfc\x83\xda\x2f\xc2\x79\xaa\xb0\x1e\xb3\xe4\xfe\x98\x23\xd5\
-\xc3\x79\xaa\xb0\x5e\x8b\xfc\xfe\xb6\x0c\xeb\x56\x4a\x3d\xd6\x1f\
-\x2a\xed\x07\xce\xd3\x8e\x85\x2e\xda\x71\x28\x4f\x76\xfc\xda\xc0\
-\x42\x35\x37\x72\xf8\x07\xb5\x5f\x84\xf3\x54\x61\x3d\xb4\xf4\xfe\
-\xd0\xd1\xea\xe1\x3c\x55\x58\xaf\x06\xef\x6f\xcb\xb0\x6e\xa1\xd6\
-\x63\x3d\xe6\x6a\xfb\x81\xf3\xb4\x63\xa1\x8b\x76\x1c\xca\x93\x9d\
-\x61\xa1\x3a\x19\x3d\xfc\xe3\x71\x6a\xbf\x08\xe7\xa9\xc2\x7a\xb9\
-\x73\xf6\xa3\xe4\x88\xf5\x70\x9e\x2a\xac\x57\xc2\xee\x6f\xcf\xe1\
-\x1f\x58\x9f\x93\x96\xfd\xc0\x79\xda\xb1\xd0\x45\x3b\x0e\xe5\xc9\
-\xce\xb0\x60\x0d\x7b\x08\xff\x78\xbc\xda\x2f\xc2\x79\xaa\xb0\xde\
-\xe4\xdc\xfd\x98\x73\xd4\x7a\x38\x4f\x15\xd6\x9b\x33\x77\x7f\x7b\
-\x0e\xff\xc0\x7a\x0d\xad\xfb\x81\xf3\xb4\x63\xa1\x8b\x76\x1c\xca\
-\x93\x9d\x29\x85\x6b\xef\xb0\x5e\xa3\x9e\xda\x2f\xc2\x79\xaa\xb0\
-\x5e\x58\xb2\x1f\xcc\x91\xeb\xe1\x3c\x55\x58\x8f\x29\xdd\x1f\x0b\
-\xd5\x9a\x51\xc2\x3f\xa8\xfd\xe2\xd7\xe2\x3c\xed\x58\xe8\xa2\x1d\
-\x87\xf2\x64\x67\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\xf6\x8b\x70\x9e\
-\x2a\xac\xa7\xee\xc7\x1f\xbd\xf5\x9b\x8a\xbe\xf8\x96\x6f\x7a\xf9\
-\x99\xef\xfe\x2b\x2f\x7f\xf7\x7f\x7f\x53\xfc\x39\xd6\xd9\xd7\xd7\
-\xf4\xae\xb7\xf4\xfc\xe1\x3c\x55\x58\x0f\xd5\xee\x8f\x85\x6a\xc9\
-\x48\xe1\x1f\xd4\x7e\x11\xce\xd3\x8e\x85\x2e\xda\x71\x28\x4f\x76\
-\xa6\x14\xae\xbd\xc3\x7a\x8d\x7a\x6a\xbf\xb9\x78\x1c\xce\x53\x85\
-\xf5\xd4\xfd\x60\xa1\x3a\x19\x3d\xfc\xe3\x71\x4b\xcf\x1f\xce\x53\
-\x85\xf5\x72\x2d\xfb\xc1\x42\x75\xce\x68\xe1\x1f\xd4\x7e\x11\xce\
-\xd3\x8e\x85\x2e\xda\x71\x28\x4f\x76\xa6\x14\xae\xa3\x87\x7f\xfc\
-\x59\xed\x77\x32\xbd\x58\xe2\x3c\x55\x58\x4f\xdd\x0f\x16\xac\x61\
-\x0f\xe1\x1f\x8f\x57\xfb\x45\x38\x4f\x15\xd6\x9b\xb4\xee\x07\x0b\
-\x55\x66\xc4\xf0\x0f\x6a\xbf\x08\xe7\x69\xc7\x42\x17\xed\x38\x94\
-\x27\x3b\x53\x0a\xd7\xd1\xc3\x3f\xd6\x59\x4f\x35\xf9\x8b\x25\xce\
-\x53\x85\xf5\xd4\xfd\x28\x85\x6b\xef\xb0\x5e\xa3\x9e\xda\x2f\xc2\
-\x79\xaa\xb0\x5e\x50\xf6\x83\x85\x2a\x1a\x35\xfc\x83\xda\x2f\xc2\
-\x79\xda\xb1\xd0\x45\x3b\x0e\xe5\xc9\xce\x6c\x19\xd6\xec\xeb\x6b\
-\x6a\xf5\x58\x4f\x25\xf8\x62\x89\xf3\x54\x2d\x79\xf1\x0d\xa5\x70\
-\xed\x1d\xd6\x6b\xd4\x53\xfb\x45\x38\x4f\x15\xd6\x53\xf7\x83\x85\
-\x6a\x6e\xe4\xf0\x0f\x4b\xcf\x1f\xce\xd3\x8e\x85\x2e\xda\x71\x2c\
-\x79\xf1\x8d\xc7\x6d\x19\xd6\xaa\x96\x7a\xac\xaf\x39\xec\xc5\x12\
-\xe7\xa9\x5a\xf2\xe2\x1b\x4a\xe1\xda\x3b\xac\xd7\xa8\xb7\xf4\xfc\
-\xe1\x3c\x55\x58\x4f\xdd\x0f\x16\xaa\x93\xd1\xc3\x3f\x1e\xb7\xf4\
-\xfc\xe1\x3c\xed\x58\xe8\xa2\x1d\xc7\x92\x17\xdf\x78\xb1\x28\x85\
-\xab\xe2\x12\xe1\x1f\x58\x6f\xcc\x5c\x38\xe0\x3c\x55\x58\x4f\xdd\
-\x8f\x52\xb8\x8e\x1e\xfe\xf1\xe7\xa5\xe7\x0f\xe7\xa9\xc2\x7a\xea\
-\x7e\xb0\x60\x0d\x7b\x08\xff\x78\xbc\xda\x2f\xc2\x79\xda\xb1\xd0\
-\x45\x3b\x0e\x7c\x42\xb7\xc8\x5f\x2c\xb7\x0c\xeb\x56\x4a\x3d\xd6\
-\x1f\x2a\x85\x03\xce\x53\x85\xf5\xd8\xf7\x2f\x29\x85\xeb\xe8\xe1\
-\x1f\xeb\xac\xa7\x9a\x7c\x3f\x70\x9e\x2a\xac\xa7\xee\x47\x29\x5c\
-\x7b\x87\xf5\x1a\xf5\xd4\x7e\x11\xce\xd3\x8e\x85\x2e\xae\x2d\x5d\
-\xaf\x24\xaf\x25\xcf\x97\x3c\x39\x99\x1d\xd6\x7b\x9e\x7c\x2c\xad\
-\xbf\x9d\xcd\x6a\x29\xfc\xfe\x35\x78\x7f\x5b\x86\x75\x0b\xb5\x1e\
-\xeb\x31\x57\xdb\x5f\x9c\xa7\x0a\xeb\xa9\xb6\x0c\x6b\xf6\xf5\x35\
-\xb5\x7a\xac\xa7\x12\xdc\x0f\x9c\xa7\xaa\xb6\xbf\x35\xa5\x70\xed\
-\x1d\xd6\x6b\xd4\x53\xfb\x45\x38\x4f\x3b\x16\xba\xb8\x96\x74\xbd\
-\x9a\xbc\x98\x0e\xd7\xd2\x27\x27\x3a\x40\xbd\x98\xcd\xab\x6c\x76\
-\xe7\xba\xaf\xdb\x84\xdd\xdf\x9e\xc3\x3f\xb0\x3e\x27\x2d\xfb\x8b\
-\xf3\x54\x61\x3d\x45\x3c\x6e\xcb\xb0\x56\xb5\xd4\x63\x7d\xcd\x61\
-\xfb\x81\xf3\x54\xd5\xf6\xb7\xa6\x14\xae\xbd\xc3\x7a\x8d\x7a\x4b\
-\xcf\x1f\xce\xd3\x8e\x85\x2e\xae\x21\x5d\x1f\xc2\xc3\xb5\xf4\xc9\
-\x99\x3b\x58\xbd\x0f\xb1\x19\x9e\x03\xea\xce\x9a\xbb\xbf\x3d\x87\
-\x7f\x60\xbd\x86\xd6\xfd\xc0\x79\xaa\x66\xf6\xb7\x6a\xba\xbf\x52\
-\xb8\x2a\x2e\x11\xfe\x81\xf5\xc6\xcc\xed\x07\xce\x53\x85\xf5\xd4\
-\xfd\x28\x85\xeb\xe8\xe1\x1f\x7f\x5e\x7a\xfe\x70\x9e\x76\x2c\x74\
-\xb1\xb7\x74\xc5\xbf\xf9\x3f\x39\x5c\x4b\x9f\x9c\x93\x83\xd6\x7b\
-\x07\x9b\xa5\x0a\x6a\x52\xa5\xfb\x63\xa1\x5a\x33\x4a\xf8\x07\xb5\
-\x5f\xfc\x5a\x9c\xa7\x0a\xeb\xb5\xc8\xef\x6f\xcb\xb0\x6e\xa5\xd4\
-\x63\xfd\xa1\xd2\x7e\xe0\x3c\x55\x58\x8f\x7d\xff\x92\x52\xb8\x8e\
-\x1e\xfe\xb1\xce\x7a\xaa\xc9\xf7\x03\xe7\x69\xc7\x42\x17\x7b\x4b\
-\x97\xdf\xf6\xd7\xeb\xbd\x60\xb3\x54\x41\xcd\x27\x6a\xf7\xc7\x42\
-\xb5\x64\xa4\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x35\x78\x7f\x5b\
-\x86\x75\x0b\xb5\x1e\xeb\x31\x57\xdb\x0f\x9c\xa7\x0a\xeb\xa9\xb6\
-\x0c\x6b\xf6\xf5\x35\xb5\x7a\xac\xa7\x12\xdc\x0f\x9c\xa7\x1d\x0b\
-\x5d\xec\x29\x5d\xf1\x03\x7f\xf4\x70\x2d\x7d\x72\x5e\x41\xbd\x57\
-\xd8\x4c\x15\x50\xef\x91\x96\xfb\x63\xa1\x3a\x67\xb4\xf0\x0f\x6a\
-\xbf\x08\xe7\xa9\xc2\x7a\x25\xec\xfe\xf6\x1c\xfe\x81\xf5\x39\x69\
-\xd9\x0f\x9c\xa7\xaa\xb6\xbf\x25\xf1\xb8\x2d\xc3\x5a\xd5\x52\x8f\
-\xf5\x35\x87\xed\x07\xce\xd3\x8e\x85\x2e\xf6\x94\xae\xf8\x69\xff\
-\xa6\x27\xbb\xe2\x4a\xea\xbd\xc6\x66\xaa\x80\x7a\x0f\x5a\xef\x8f\
-\x85\x2a\x33\x62\xf8\x07\xb5\x5f\x84\xf3\x54\x61\xbd\x39\x73\xf7\
-\xb7\xe7\xf0\x0f\xac\xd7\xd0\xba\x1f\x38\x4f\x55\x6d\x7f\xe7\x4c\
-\xf7\x57\x0a\x57\xc5\x25\xc2\x3f\xb0\xde\x98\xb9\xfd\xc0\x79\xda\
-\xb1\xd0\xc5\x9e\xd2\xe5\x5f\xf5\x3b\xbf\xde\x73\x36\x53\x05\xd4\
-\xbb\xa3\xdc\x1f\x0b\x55\x34\x6a\xf8\x07\xb5\x5f\x84\xf3\x54\x61\
-\x3d\xa6\x74\x7f\x2c\x54\x6b\x46\x09\xff\xa0\xf6\x8b\x5f\x8b\xf3\
-\x54\x61\xbd\x16\xf9\xfd\x6d\x19\xd6\xad\x94\x7a\xac\x3f\x54\xda\
-\x0f\x9c\xa7\x1d\x0b\x5d\xec\x49\x79\xb2\xb7\xb8\xb6\x7a\x38\x4f\
-\x15\xd6\x53\xef\x8f\x85\x6a\x6e\xe4\xf0\x0f\x4b\xf7\x03\xe7\xa9\
-\xc2\x7a\xa8\x76\x7f\x2c\x54\x4b\x46\x0a\xff\xa0\xf6\x8b\x70\x9e\
-\x2a\xac\x57\x83\xf7\xb7\x65\x58\xb7\x50\xeb\xb1\x1e\x73\xb5\xfd\
-\xc0\x79\xda\xb1\xd0\xc5\x9e\x94\x27\x7b\x4d\xed\xb0\xaa\xf6\x50\
-\x0f\xe7\xa9\xc2\x7a\xea\xfd\xb1\x50\x9d\x8c\x1e\xfe\xf1\xb8\xa5\
-\xfb\x81\xf3\x54\x61\xbd\x5c\xcb\x7e\xb0\x50\x9d\x33\x5a\xf8\x07\
-\xb5\x5f\x84\xf3\x54\x61\xbd\x12\x76\x7f\x7b\x0e\xff\xc0\xfa\x9c\
-\xb4\xec\x07\xce\xd3\x8e\x85\x2e\xf6\x54\x3a\x5c\x8a\x96\xc3\xaa\
-\xd8\x4b\x3d\x9c\xa7\x0a\xeb\xa9\xf7\xc7\x82\x35\xec\x21\xfc\xe3\
-\xf1\x6a\xbf\x08\xe7\xa9\xc2\x7a\x93\xd6\xfd\x60\xa1\xca\x8c\x18\
-\xfe\x41\xed\x17\xe1\x3c\x55\x58\x6f\xce\xdc\xfd\xed\x39\xfc\x03\
-\xeb\x35\xb4\xee\x07\xce\xd3\x8e\x85\x2e\xf6\x54\x3a\x5c\xad\x5a\
-\x0f\x6b\xab\x3d\xd5\xc3\x79\xaa\xb0\x9e\x7a\x7f\xa5\x70\xed\x1d\
-\xd6\x6b\xd4\x53\xfb\x45\x38\x4f\x15\xd6\x0b\xca\x7e\xb0\x50\x45\
-\xa3\x86\x7f\x50\xfb\x45\x38\x4f\x15\xd6\x63\x4a\xf7\xc7\x42\xb5\
-\x66\x94\xf0\x0f\x6a\xbf\xf8\xb5\x38\x4f\x3b\x16\xba\xd8\x53\xe9\
-\x70\xb5\x50\x0e\x6b\x8b\xbd\xd5\xc3\x79\xaa\x96\xde\x5f\x29\x5c\
-\x7b\x87\xf5\x1a\xf5\xd4\x7e\x11\xce\x53\x85\xf5\xd4\xfd\x60\xa1\
-\x9a\x1b\x39\xfc\xc3\xd2\xf3\x87\xf3\x54\x61\x3d\x54\xbb\x3f\x16\
-\xaa\x25\x23\x85\x7f\x50\xfb\x45\x38\x4f\x3b\x16\xba\xd8\x93\xf2\
-\x64\x47\xea\x61\xad\xd9\x63\x3d\x9c\xa7\x6a\xe9\xfd\x95\xc2\xb5\
-\x77\x58\xaf\x51\x6f\xe9\x7e\xe0\x3c\x55\x58\x4f\xdd\x0f\x16\xaa\
-\x93\xd1\xc3\x3f\x1e\xb7\xf4\xfc\xe1\x3c\x55\x58\x2f\xd7\xb2\x1f\
-\x2c\x54\xe7\x8c\x16\xfe\x41\xed\x17\xe1\x3c\xed\x58\xe8\x62\x4f\
-\xca\x93\x3d\x77\xce\x61\x2d\xd9\x6b\x3d\x9c\xa7\x0a\xeb\xa9\xf7\
-\x57\x0a\xd7\xd1\xc3\x3f\xfe\xbc\x74\x3f\x70\x9e\x2a\xac\xa7\xee\
-\x07\x0b\xd6\xb0\x87\xf0\x8f\xc7\xab\xfd\x22\x9c\xa7\x0a\xeb\x4d\
-\x5a\xf7\x83\x85\x2a\x33\x62\xf8\x07\xb5\x5f\x84\xf3\xb4\x63\xa1\
-\x8b\x3d\xe1\x81\x6a\x71\xee\x61\x9d\xb3\xe7\x7a\x38\x4f\xd5\xd2\
-\xfb\x2b\x85\xeb\xe8\xe1\x1f\xeb\xac\xa7\x9a\x7c\x3f\x70\x9e\x2a\
-\xac\xa7\xee\x47\x29\x5c\x7b\x87\xf5\x1a\xf5\xd4\x7e\x11\xce\x53\
-\x85\xf5\x82\xb2\x1f\x2c\x54\xd1\xa8\xe1\x1f\xd4\x7e\x11\xce\xd3\
-\x8e\x85\x2e\xf6\x84\x07\xaa\x06\x0f\xeb\xb7\xbc\xf7\x7f\x7a\xf9\
-\x2d\xef\x4b\x3e\xf0\x3f\xbf\xfc\x96\x1f\x38\x43\x3c\x2e\x1e\x1f\
-\x75\x26\x1b\xd6\x63\x3d\xe6\x6a\x4f\x4e\x9c\xa7\x0a\xeb\xa9\xb6\
-\x0c\x6b\xf6\xf5\x35\xb5\x7a\xac\xa7\x12\xdc\x0f\x9c\xa7\xaa\xb6\
-\xbf\x35\xa5\x70\xed\x1d\xd6\x6b\xd4\x53\xfb\x45\x38\x4f\x15\xd6\
-\x53\xf7\x83\x85\x6a\x6e\xe4\xf0\x0f\x4b\xcf\x1f\xce\xd3\x8e\x85\
-\x2e\xf6\x84\x07\xaa\x84\x1d\xd6\x3d\x87\x7f\x60\x7d\x4e\x5a\x9e\
-\x9c\x38\x4f\x95\xf2\x64\x47\xf1\xb8\x2d\xc3\x5a\xd5\x52\x8f\xf5\
-\x35\x87\xed\x07\xce\x53\x55\xdb\xdf\x9a\x52\xb8\xf6\x0e\xeb\x35\
-\xea\x2d\x3d\x7f\x38\x4f\x15\xd6\x53\xf7\x83\x85\xea\x64\xf4\xf0\
-\x8f\xc7\x2d\x3d\x7f\x38\x4f\x3b\x16\xba\xd8\x13\x1e\xa8\x39\x73\
-\x4f\xce\x3d\x87\x7f\x60\xbd\x86\xd6\x17\x23\x9c\xa7\x4a\x79\xb2\
-\xe7\xa6\xfb\x2b\x85\xab\xe2\x12\xe1\x1f\x58\x6f\xcc\xdc\x7e\xe0\
-\x3c\x55\x58\x4f\xdd\x8f\x52\xb8\x8e\x1e\xfe\xf1\xe7\xa5\xe7\x0f\
-\xe7\xa9\xc2\x7a\xea\x7e\xb0\x60\x0d\x7b\x08\xff\x78\xbc\xda\x2f\
-\xc2\x79\xda\xb1\xd0\xc5\x9e\xf0\x40\x31\xa5\x27\x27\x0b\xd5\xaa\
-\x41\xc2\x3f\xa8\xfd\xe2\xd7\xe2\x3c\x55\x58\xaf\x45\x7e\x7f\x5b\
-\x86\x75\x2b\xa5\x1e\xeb\x0f\x95\xf6\x03\xe7\xa9\xc2\x7a\xec\xfb\
-\x97\x94\xc2\x75\xf4\xf0\x8f\x75\xd6\x53\x4d\xbe\x1f\x38\x4f\x15\
-\xd6\x53\xf7\xa3\x14\xae\xbd\xc3\x7a\x8d\x7a\x6a\xbf\x08\xe7\x69\
-\xc7\x42\x17\x7b\xc2\x03\x85\x6a\x4f\x4e\x16\xaa\x45\x03\x85\x7f\
-\x50\xfb\x45\x38\x4f\x15\xd6\xab\xc1\xfb\xdb\x32\xac\x5b\xa8\xf5\
-\x58\x8f\xb9\xda\x7e\xe0\x3c\x55\x58\x4f\xb5\x65\x58\xb3\xaf\xaf\
-\xa9\xd5\x63\x3d\x95\xe0\x7e\xe0\x3c\x55\xb5\xfd\xad\x29\x85\x6b\
-\xef\xb0\x5e\xa3\x9e\xda\x2f\xc2\x79\xda\xb1\xd0\xc5\x9e\xf0\x40\
-\xe5\x5a\x9e\x9c\x2c\x54\x67\x0d\x16\xfe\x41\xed\x17\xe1\x3c\x55\
-\x58\xaf\x84\xdd\xdf\x9e\xc3\x3f\xb0\x3e\x27\x2d\xfb\x81\xf3\x54\
-\xd5\xf6\xb7\x24\x1e\xb7\x65\x58\xab\x5a\xea\xb1\xbe\xe6\xb0\xfd\
-\xc0\x79\xaa\x6a\xfb\x5b\x53\x0a\xd7\xde\x61\xbd\x46\xbd\xa5\xe7\
-\x0f\xe7\x69\xc7\x42\x17\x7b\xc2\x43\x35\x61\x4f\x76\x76\x58\x59\
-\xa8\x52\x03\x86\x7f\x50\xfb\x45\x38\x4f\x15\xd6\x9b\x33\x77\x7f\
-\x7b\x0e\xff\xc0\x7a\x0d\xad\xfb\x81\xf3\x54\xd5\xf6\x77\xce\x74\
-\x7f\xa5\x70\x55\x5c\x22\xfc\x03\xeb\x8d\x99\xdb\x0f\x9c\xa7\x0a\
-\xeb\xa9\xfb\x51\x0a\xd7\xd1\xc3\x3f\xfe\xbc\xf4\xfc\xe1\x3c\xed\
-\x58\xe8\x62\x4f\x78\xb0\xc2\xdc\x93\x9d\x1d\x56\x16\xaa\x4f\x0c\
-\x1a\xfe\x41\xed\x17\xe1\x3c\x55\x58\x8f\x29\xdd\x1f\x0b\xd5\x9a\
-\x51\xc2\x3f\xa8\xfd\xe2\xd7\xe2\x3c\x55\x58\xaf\x45\x7e\x7f\x5b\
-\x86\x75\x2b\xa5\x1e\xeb\x0f\x95\xf6\x03\xe7\xa9\xc2\x7a\xec\xfb\
-\x97\x94\xc2\x75\xf4\xf0\x8f\x75\xd6\x53\x4d\xbe\x1f\x38\x4f\x3b\
-\x16\xba\xd8\x53\xe9\x70\xb5\x3c\x39\x59\xa8\x3e\x32\x70\xf8\x07\
-\xb5\x5f\x84\xf3\x54\x61\x3d\x54\xbb\x3f\x16\xaa\x25\x23\x85\x7f\
-\x50\xfb\x45\x38\x4f\x15\xd6\xab\xc1\xfb\xdb\x32\xac\x5b\xa8\xf5\
-\x58\x8f\xb9\xda\x7e\xe0\x3c\x55\x58\x4f\xb5\x65\x58\xb3\xaf\xaf\
-\xa9\xd5\x63\x3d\x95\xe0\x7e\xe0\x3c\xed\x58\xe8\x62\x4f\xa5\xc3\
-\xd5\xf2\xe4\x64\xa1\xfa\x60\xf0\xf0\x8f\xc7\xa9\xfd\x22\x9c\xa7\
-\x0a\xeb\xe5\x5a\xf6\x83\x85\xea\x9c\xd1\xc2\x3f\xa8\xfd\x22\x9c\
-\xa7\x0a\xeb\x95\xb0\xfb\xdb\x73\xf8\x07\xd6\xe7\xa4\x65\x3f\x70\
-\x9e\xaa\xda\xfe\x96\xc4\xe3\xb6\x0c\x6b\x55\x4b\x3d\xd6\xd7\x1c\
-\xb6\x1f\x38\x4f\x3b\x16\xba\xd8\x53\xe9\x70\xb5\x3c\x39\x69\xb0\
-\x86\x1d\x84\x7f\x3c\x5e\xed\x17\xe1\x3c\x55\x58\x6f\xd2\xba\x1f\
-\x2c\x54\x99\x11\xc3\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\xcd\x99\xbb\
-\xbf\x3d\x87\x7f\x60\xbd\x86\xd6\xfd\xc0\x79\xaa\x6a\xfb\x3b\x67\
-\xba\xbf\x52\xb8\x2a\x2e\x11\xfe\x81\xf5\xc6\xcc\xed\x07\xce\xd3\
-\x8e\x85\x2e\xf6\x54\x3a\x5c\x2d\x4f\xce\x52\xb8\xf6\x0e\xeb\x35\
-\xea\xa9\xfd\x22\x9c\xa7\x0a\xeb\x05\x65\x3f\x58\xa8\xa2\x51\xc3\
-\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\x31\xa5\xfb\x63\xa1\x5a\x33\x4a\
-\xf8\x07\xb5\x5f\xfc\x5a\x9c\xa7\x0a\xeb\xb5\xc8\xef\x6f\xcb\xb0\
-\x6e\xa5\xd4\x63\xfd\xa1\xd2\x7e\xe0\x3c\xed\x58\xe8\x62\x4f\xca\
-\x93\x9d\x29\x85\x6b\xef\xb0\x5e\xa3\x9e\xda\x2f\xc2\x79\xaa\xb0\
-\x9e\xba\x1f\x2c\x54\x73\x23\x87\x7f\x58\x7a\xfe\x70\x9e\x2a\xac\
-\x87\x6a\xf7\xc7\x42\xb5\x64\xa4\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\
-\x7a\x35\x78\x7f\x5b\x86\x75\x0b\xb5\x1e\xeb\x31\x57\xdb\x0f\x9c\
-\xa7\x1d\x0b\x5d\xec\x49\x79\xb2\x33\xa5\x70\xed\x1d\xd6\x6b\xd4\
-\x53\xfb\xcd\xc5\xe3\x70\x9e\x2a\xac\xa7\xee\x07\x0b\xd5\xc9\xe8\
-\xe1\x1f\x8f\x5b\x7a\xfe\x70\x9e\x2a\xac\x97\x6b\xd9\x0f\x16\xaa\
-\x73\x46\x0b\xff\xa0\xf6\x8b\x70\x9e\x2a\xac\x57\xc2\xee\x6f\xcf\
-\xe1\x1f\x58\x9f\x93\x96\xfd\xc0\x79\xda\xb1\xd0\xc5\x9e\x4a\x87\
-\xab\x45\x29\x5c\x47\x0f\xff\xf8\xb3\xda\xef\x64\x7a\x72\xe2\x3c\
-\x55\x58\x4f\xdd\x0f\x16\xac\x61\x0f\xe1\x1f\x8f\x57\xfb\x45\x38\
-\x4f\x15\xd6\x9b\xb4\xee\x07\x0b\x55\x66\xc4\xf0\x0f\x6a\xbf\x08\
-\xe7\xa9\xc2\x7a\x73\xe6\xee\x6f\xcf\xe1\x1f\x58\xaf\xa1\x75\x3f\
-\x70\x9e\x76\x2c\x74\xb1\xa7\xd2\xe1\x6a\x51\x0a\xd7\xd1\xc3\x3f\
-\xd6\x59\x4f\x35\xf9\x93\x13\xe7\xa9\xc2\x7a\xea\x7e\x94\xc2\xb5\
-\x77\x58\xaf\x51\x4f\xed\x17\xe1\x3c\x55\x58\x2f\x28\xfb\xc1\x42\
-\x15\x8d\x1a\xfe\x41\xed\x17\xe1\x3c\x55\x58\x8f\x29\xdd\x1f\x0b\
-\xd5\x9a\x51\xc2\x3f\xa8\xfd\xe2\xd7\xe2\x3c\xed\x58\xe8\x62\x4f\
-\xa5\xc3\xd5\x62\xcb\xb0\xa6\x5f\x5f\x53\xa9\xc7\x7a\x2a\xc1\x27\
-\x27\xce\x53\xa5\x3c\xd9\x99\x52\xb8\xf6\x0e\xeb\x35\xea\xa9\xfd\
-\x22\x9c\xa7\x0a\xeb\xa9\xfb\xc1\x42\x35\x37\x72\xf8\x87\xa5\xe7\
-\x0f\xe7\xa9\xc2\x7a\xa8\x76\x7f\x2c\x54\x4b\x46\x0a\xff\xa0\xf6\
-\x8b\x70\x9e\x76\x2c\x74\xb1\x27\xe5\xc9\x8e\xe2\x71\x5b\x86\xb5\
-\xac\xa1\x1e\xeb\x6b\x0e\x7b\x72\xe2\x3c\x55\xca\x93\x9d\x29\x85\
-\x6b\xef\xb0\x5e\xa3\xde\xd2\xf3\x87\xf3\x54\x61\x3d\x75\x3f\x58\
-\xa8\x4e\x46\x0f\xff\x78\xdc\xd2\xf3\x87\xf3\x54\x61\xbd\x5c\xcb\
-\x7e\xb0\x50\x9d\x33\x5a\xf8\x07\xb5\x5f\x84\xf3\xb4\x63\xa1\x8b\
-\x3d\x29\x4f\xf6\xdc\x74\x58\x4b\xe1\x2a\xb9\x40\xf8\x07\xd6\x1b\
-\x33\xf7\xe4\xc4\x79\xaa\xb0\x9e\xba\x1f\xa5\x70\x1d\x3d\xfc\xe3\
-\xcf\x4b\xcf\x1f\xce\x53\x85\xf5\xd4\xfd\x60\xc1\x1a\xf6\x10\xfe\
-\xf1\x78\xb5\x5f\x84\xf3\x54\x61\xbd\x49\xeb\x7e\xb0\x50\x65\x46\
-\x0c\xff\xa0\xf6\x8b\x70\x9e\x76\x2c\x74\xb1\x27\x3c\x50\x2d\xf2\
-\xc3\xba\x65\x58\x37\x13\xea\xb1\xfe\x50\xe9\xc9\x89\xf3\x54\x61\
-\x3d\xf6\xfd\x4b\x4a\xe1\x3a\x7a\xf8\xc7\x3a\xeb\xa9\x26\xdf\x0f\
-\x9c\xa7\x0a\xeb\xa9\xfb\x51\x0a\xd7\xde\x61\xbd\x46\x3d\xb5\x5f\
-\x84\xf3\x54\x61\xbd\xa0\xec\x07\x0b\x55\x34\x6a\xf8\x07\xb5\x5f\
-\x84\xf3\xb4\x63\xa1\x8b\x3d\xe1\x81\xaa\xc1\xc3\xba\x65\x58\x37\
-\x11\xeb\xb1\x1e\x73\xb5\x27\x27\xce\x53\x85\xf5\x54\x5b\x86\x35\
-\xfb\xfa\x9a\x5a\x3d\xd6\x53\x09\xee\x07\xce\x53\x55\xdb\xdf\x9a\
-\x52\xb8\xf6\x0e\xeb\x35\xea\xa9\xfd\x22\x9c\xa7\x0a\xeb\xa9\xfb\
-\xc1\x42\x35\x37\x72\xf8\x87\xa5\xe7\x0f\xe7\x69\xc7\x42\x17\x7b\
-\xc2\x03\x55\xc2\x0e\xeb\x9e\xc3\x3f\xb0\x3e\x27\x2d\x4f\x4e\x9c\
-\xa7\x4a\x79\xb2\xa3\x78\xdc\x96\x61\xad\x6a\xa9\xc7\xfa\x9a\xc3\
-\xf6\x03\xe7\xa9\xaa\xed\x6f\x4d\x29\x5c\x7b\x87\xf5\x1a\xf5\x96\
-\x9e\x3f\x9c\xa7\x0a\xeb\xa9\xfb\xc1\x42\x75\x32\x7a\xf8\xc7\xe3\
-\x96\x9e\x3f\x9c\xa7\x1d\x0b\x5d\xec\x09\x0f\xd4\x9c\xb9\x27\xe7\
-\x9e\xc3\x3f\xb0\x5e\x43\xeb\x8b\x11\xce\x53\xa5\x3c\xd9\x73\xd3\
-\xfd\x95\xc2\x55\x71\x89\xf0\x0f\xac\x37\x66\x6e\x3f\x70\x9e\x2a\
-\xac\xa7\xee\x47\x29\x5c\x47\x0f\xff\xf8\xf3\xd2\xf3\x87\xf3\x54\
-\x61\x3d\x75\x3f\x58\xb0\x86\x3d\x84\x7f\x3c\x5e\xed\x17\xe1\x3c\
-\xed\x58\xe8\x62\x4f\x78\xa0\x98\xd2\x93\x93\x85\x6a\xd5\x20\xe1\
-\x1f\xd4\x7e\xf1\x6b\x71\x9e\x2a\xac\xd7\x22\xbf\xbf\x2d\xc3\xba\
-\x95\x52\x8f\xf5\x87\x4a\xfb\x81\xf3\x54\x61\x3d\xf6\xfd\x4b\x4a\
-\xe1\x3a\x7a\xf8\xc7\x3a\xeb\xa9\x26\xdf\x0f\x9c\xa7\x0a\xeb\xa9\
-\xfb\x51\x0a\xd7\xde\x61\xbd\x46\x3d\xb5\x5f\x84\xf3\xb4\x63\xa1\
-\x8b\x3d\xe1\x81\x42\xb5\x27\x27\x0b\xd5\xa2\x81\xc2\x3f\xa8\xfd\
-\x22\x9c\xa7\x0a\xeb\xd5\xe0\xfd\x6d\x19\xd6\x2d\xd4\x7a\xac\xc7\
-\x5c\x6d\x3f\x70\x9e\x2a\xac\xa7\xda\x32\xac\xd9\xd7\xd7\xd4\xea\
-\xb1\x9e\x4a\x70\x3f\x70\x9e\xaa\xda\xfe\xd6\x94\xc2\xb5\x77\x58\
-\xaf\x51\x4f\xed\x17\xe1\x3c\x7b\xb8\xb9\xb9\x79\xf7\xe9\xf4\xec\
-\x63\xe9\xde\x9e\x2f\xbd\xbf\xa5\xfb\x8b\x2e\x50\xef\x79\xf2\x5a\
-\xf2\x0a\x9b\xd5\xda\xe8\x62\x4f\xf7\x4d\x52\x2d\xc3\x66\xa1\x3a\
-\x6b\xb0\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x25\xec\xfe\xf6\x1c\
-\xfe\x81\xf5\x39\x69\xd9\x0f\x9c\xa7\xaa\xb6\xbf\x25\xf1\xb8\x2d\
-\xc3\x5a\xd5\x52\x8f\xf5\x35\x87\xed\x07\xce\x53\x55\xdb\xdf\x9a\
-\x52\xb8\xf6\x0e\xeb\x35\xea\x2d\x3d\x7f\x38\xcf\x25\x52\xbd\x77\
-\xa6\xfb\x79\xb1\x64\x3f\x72\xf1\xb8\xa5\xfb\x9b\x1b\xa0\xde\x8b\
-\xe4\x55\x36\xbb\xb5\xd0\xc5\x9e\xb2\xe6\x1e\x69\x1d\x0e\x0b\x55\
-\x6a\xc0\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x73\xe6\xee\x6f\xcf\
-\xe1\x1f\x58\xaf\xa1\x75\x3f\x70\x9e\xaa\xda\xfe\xce\x99\xee\xaf\
-\x14\xae\x8a\x4b\x84\x7f\x60\xbd\x31\x73\xfb\x81\xf3\x54\x61\x3d\
-\x75\x3f\x4a\xe1\x3a\x7a\xf8\xc7\x9f\x97\x9e\x3f\x9c\xe7\xb9\x52\
-\xbd\x9f\x61\xfb\xbb\xf4\xfe\x0e\x5a\xef\x43\x6c\x86\x6b\xa0\x8b\
-\x3d\x41\x63\x77\x94\xe1\xb0\x50\x7d\x62\xd0\xf0\x0f\x6a\xbf\x08\
-\xe7\xa9\xc2\x7a\x4c\xe9\xfe\x58\xa8\xd6\x8c\x12\xfe\x41\xed\x17\
-\xbf\x16\xe7\xa9\xc2\x7a\x2d\xf2\xfb\xdb\x32\xac\x5b\x29\xf5\x58\
-\x7f\xa8\xb4\x1f\x38\x4f\x15\xd6\x63\xdf\xbf\xa4\x14\xae\xa3\x87\
-\x7f\xac\xb3\x9e\x6a\xf2\xfd\xc0\x79\x9e\x23\xd5\x8b\x7f\xf3\xbf\
-\xdf\x87\x65\xfb\x11\xf2\xfb\x3b\x70\xbd\x77\xb0\x59\xf6\x46\x17\
-\x7b\x82\xa6\xe4\xe1\xb0\x50\x7d\x64\xe0\xf0\x0f\x4b\x0f\x03\xce\
-\x53\x85\xf5\x50\xed\xfe\x58\xa8\x96\x8c\x14\xfe\x41\xed\x17\xe1\
-\x3c\x55\x58\xaf\x06\xef\x6f\xcb\xb0\x6e\xa1\xd6\x63\x3d\xe6\x6a\
-\xfb\x81\xf3\x54\x61\x3d\xd5\x96\x61\xcd\xbe\xbe\xa6\x56\x8f\xf5\
-\x54\x82\xfb\x81\xf3\x3c\x47\xaa\xe7\xb7\xfd\xf5\x7a\x2f\xd8\x2c\
-\x7b\xa3\x8b\x3d\xe5\x4d\x9d\x33\x1c\x16\xaa\x0f\x06\x0f\xff\x78\
-\xdc\xd2\xc3\x80\xf3\x54\x61\xbd\x5c\xcb\x7e\xb0\x50\x9d\x33\x5a\
-\xf8\x07\xb5\x5f\x84\xf3\x54\x61\xbd\x12\x76\x7f\x7b\x0e\xff\xc0\
-\xfa\x9c\xb4\xec\x07\xce\x53\x55\xdb\xdf\x92\x78\xdc\x96\x61\xad\
-\x6a\xa9\xc7\xfa\x9a\xc3\xf6\x03\xe7\xa9\x8a\x1f\xf8\xcb\xeb\x2d\
-\xdd\x8f\xda\x79\x51\xec\xa0\xde\xdb\xd9\x4c\x7b\xa2\x8b\x3d\x65\
-\xcd\x9c\x35\x1c\x1a\xac\x61\x07\xe1\x1f\x8f\x57\xfb\x45\x38\x4f\
-\x15\xd6\x9b\xb4\xee\x07\x0b\x55\x66\xc4\xf0\x0f\x6a\xbf\x08\xe7\
-\xa9\xc2\x7a\x73\xe6\xee\x6f\xcf\xe1\x1f\x58\xaf\xa1\x75\x3f\x70\
-\x9e\xaa\xda\xfe\xce\x99\xee\xaf\x14\xae\x8a\x4b\x84\x7f\x60\xbd\
-\x31\x73\xfb\x81\xf3\x54\xdd\xff\xb4\xff\x43\xbd\xa5\xfb\x81\xf7\
-\x77\xec\x7a\xcf\x3e\xc6\x66\xda\x13\x5d\xec\xe9\xcd\x66\xce\x1b\
-\x4e\x29\x5c\x7b\x87\xf5\x1a\xf5\xd4\x7e\x11\xce\x53\x85\xf5\x82\
-\xb2\x1f\x2c\x54\xd1\xa8\xe1\x1f\xd4\x7e\x11\xce\x53\x85\xf5\x98\
-\xd2\xfd\xb1\x50\xad\x19\x25\xfc\x83\xda\x2f\x7e\x2d\xce\x53\x85\
-\xf5\x5a\xe4\xf7\xb7\x65\x58\xb7\x52\xea\xb1\xfe\x50\x69\x3f\x70\
-\x9e\xaa\x54\xcb\xbf\xea\x27\xca\xea\x3d\x67\x33\xed\x89\x2e\xf6\
-\xb4\x74\x38\xa5\x70\xed\x1d\xd6\x6b\xd4\x5b\x7a\x18\x70\x9e\x2a\
-\xac\xa7\xee\x07\x0b\xd5\xdc\xc8\xe1\x1f\x96\x9e\x3f\x9c\xa7\x0a\
-\xeb\xa1\xda\xfd\xb1\x50\x2d\x19\x29\xfc\x83\xda\x2f\xc2\x79\xaa\
-\xb0\x5e\x0d\xde\xdf\x96\x61\xdd\x42\xad\xc7\x7a\xcc\xd5\xf6\x03\
-\xe7\xa9\xc2\x7a\xaa\xda\xfd\xa9\xf6\x56\x0f\xe7\xd9\x1b\x5d\xec\
-\x69\xe9\x70\x4a\xe1\xda\x3b\xac\xd7\xa8\xb7\xf4\x30\xe0\x3c\x55\
-\x58\x4f\xdd\x0f\x16\xaa\x93\xd1\xc3\x3f\x1e\xb7\xf4\xfc\xe1\x3c\
-\x55\x58\x2f\xd7\xb2\x1f\x2c\x54\xe7\x8c\x16\xfe\x41\xed\x17\xe1\
-\x3c\x55\x58\xaf\x84\xdd\xdf\x9e\xc3\x3f\xb0\x3e\x27\x2d\xfb\x81\
-\xf3\x54\xd5\xf6\xb7\xa4\xe5\xfe\x14\x7b\xac\x87\xf3\xec\x8d\x2e\
-\xf6\x94\x37\x73\xce\x70\x4a\xe1\x3a\x7a\xf8\xc7\x9f\x97\x1e\x06\
-\x9c\xa7\x0a\xeb\xa9\xfb\xc1\x82\x35\xec\x21\xfc\xe3\xf1\x6a\xbf\
-\x08\xe7\xa9\xc2\x7a\x93\xd6\xfd\x60\xa1\xca\x8c\x18\xfe\x41\xed\
-\x17\xe1\x3c\x55\x58\x6f\xce\xdc\xfd\xed\x39\xfc\x03\xeb\x35\xb4\
-\xee\x07\xce\x53\x55\xdb\xdf\x39\xad\xf7\xd7\x6a\xaf\xf5\x70\x9e\
-\xbd\xd1\xc5\x9e\x96\x0e\xa7\x14\xae\xa3\x87\x7f\xac\xb3\x9e\x6a\
-\xf2\xc3\x80\xf3\x54\x61\x3d\x75\x3f\x4a\xe1\xda\x3b\xac\xd7\xa8\
-\xa7\xf6\x8b\x70\x9e\x2a\xac\x17\x94\xfd\x60\xa1\x8a\x46\x0d\xff\
-\xa0\xf6\x8b\x70\x9e\x2a\xac\xc7\x94\xee\x8f\x85\x6a\xcd\x28\xe1\
-\x1f\xd4\x7e\xf1\x6b\x71\x9e\x2a\xac\xd7\x42\xb9\xbf\x16\x7b\xae\
-\x87\xf3\xec\x8d\x2e\xf6\xb4\x74\x38\x5b\x86\x35\xfd\xfa\x9a\x4a\
-\x3d\xd6\x53\x09\x1e\x06\x9c\xa7\xaa\x74\xb8\xd8\xf7\x47\xa5\x70\
-\xed\x1d\xd6\x6b\xd4\x53\xfb\x45\x38\x4f\x15\xd6\x53\xf7\x83\x85\
-\x6a\x6e\xe4\xf0\x0f\x4b\xcf\x1f\xce\x53\x85\xf5\x50\xed\xfe\x58\
-\xa8\x96\x8c\x14\xfe\x41\xed\x17\xe1\x3c\x55\x58\xaf\x46\xbd\xbf\
-\x9a\xbd\xd7\xc3\x79\xf6\x46\x17\x7b\x5a\x3a\x9c\x2d\xc3\x5a\xd6\
-\x50\x8f\xf5\x35\x87\x1d\x06\x9c\xa7\xaa\x74\xb8\x5a\x94\xc2\xb5\
-\x77\x58\xaf\x51\x6f\xe9\xf9\xc3\x79\xaa\xb0\x9e\xba\x1f\x2c\x54\
-\x27\xa3\x87\x7f\x3c\x6e\xe9\xf9\xc3\x79\xaa\xb0\x5e\xae\x65\x3f\
-\x58\xa8\xce\x19\x2d\xfc\x83\xda\x2f\xc2\x79\xaa\xb0\x5e\xc9\x39\
-\xf7\x57\x72\x84\x7a\x38\xcf\xde\xe8\x62\x4f\x4b\x87\x53\x0a\x57\
-\xc9\x05\xc2\x3f\xb0\xde\x98\xb9\xc3\x80\xf3\x54\x61\x3d\x75\x3f\
-\x4a\xe1\x3a\x7a\xf8\xc7\x9f\x97\x9e\x3f\x9c\xa7\x0a\xeb\xa9\xfb\
-\xc1\x82\x35\xec\x21\xfc\xe3\xf1\x6a\xbf\x08\xe7\xa9\xc2\x7a\x93\
-\xd6\xfd\x60\xa1\xca\x8c\x18\xfe\x41\xed\x17\xe1\x3c\x55\x58\x6f\
-\xce\xb9\xf7\x37\xe7\x28\xf5\x70\x9e\xbd\xd1\xc5\x9e\xf2\x66\x5a\
-\xe5\xc3\xd9\x32\xac\x9b\x09\xf5\x58\x7f\xa8\x74\x18\x70\x9e\x2a\
-\xac\xc7\xbe\x7f\x49\x29\x5c\x47\x0f\xff\x58\x67\x3d\xd5\xe4\xfb\
-\x81\xf3\x54\x61\x3d\x75\x3f\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\xf6\
-\x8b\x70\x9e\x2a\xac\x17\x94\xfd\x60\xa1\x8a\x46\x0d\xff\xa0\xf6\
-\x8b\x70\x9e\x2a\xac\xc7\x2c\xb9\x3f\xe6\x48\xf5\x70\x9e\xbd\xd1\
-\xc5\x9e\xb0\xa1\x1a\x1c\xce\x96\x61\xdd\x44\xac\xc7\x7a\xcc\xd5\
-\x0e\x03\xce\x53\x85\xf5\x54\x5b\x86\x35\xfb\xfa\x9a\x5a\x3d\xd6\
-\x53\x09\xee\x07\xce\x53\x55\xdb\xdf\x9a\x52\xb8\xf6\x0e\xeb\x35\
-\xea\xa9\xfd\x22\x9c\xa7\x0a\xeb\xa9\xfb\xc1\x42\x35\x37\x72\xf8\
-\x87\xa5\xe7\x0f\xe7\xa9\xc2\x7a\xa8\x76\x7f\xdf\xf3\xa3\x5f\x91\
-\x7c\xf7\x8f\x7c\xe9\xe5\xdf\xfa\xa1\xcf\xbe\xfc\xae\xbf\xf3\x07\
-\x0f\xe2\xcf\xb1\xce\xbe\xbe\x66\x69\x3d\xb5\x5f\x84\xf3\xec\x8d\
-\x2e\xf6\x84\x0d\x95\xb0\xe1\xec\x39\xfc\x03\xeb\x73\xd2\x72\x18\
-\x70\x9e\xaa\xd2\xe1\xaa\x89\xc7\x6d\x19\xd6\xaa\x96\x7a\xac\xaf\
-\x39\x6c\x3f\x70\x9e\xaa\xda\xfe\xd6\x94\xc2\xb5\x77\x58\xaf\x51\
-\x6f\xe9\xf9\xc3\x79\xaa\xb0\x9e\xba\x1f\x2c\x54\x27\xa3\x87\x7f\
-\x3c\x6e\xe9\xf9\xc3\x79\xaa\xb0\x5e\xae\x65\x3f\x58\xa8\xce\x19\
-\x2d\xfc\x83\xda\x2f\xc2\x79\xf6\x46\x17\x7b\xc2\x86\xe6\xcc\x0d\
-\x67\xcf\xe1\x1f\x58\xaf\xa1\xf5\x30\xe0\x3c\x55\xa5\xc3\x55\x32\
-\xdd\x5f\x29\x5c\x15\x97\x08\xff\xc0\x7a\x63\xe6\xf6\x03\xe7\xa9\
-\xc2\x7a\xea\x7e\x94\xc2\x75\xf4\xf0\x8f\x3f\x2f\x3d\x7f\x38\x4f\
-\x15\xd6\x53\xf7\x83\x05\x6b\xd8\x43\xf8\xc7\xe3\xd5\x7e\x11\xce\
-\x53\x85\xf5\x26\xad\xfb\xc1\x42\x95\x19\x31\xfc\x83\xda\x2f\xc2\
-\x79\xf6\x46\x17\x7b\xc2\x86\x98\xd2\x70\x58\xa8\x56\x0d\x12\xfe\
-\x41\xed\x17\xbf\x16\xe7\xa9\xc2\x7a\x2d\xf2\xfb\xdb\x32\xac\x5b\
-\x29\xf5\x58\x7f\xa8\xb4\x1f\x38\x4f\x15\xd6\x63\xdf\xbf\xa4\x14\
-\xae\xa3\x87\x7f\xac\xb3\x9e\x6a\xf2\xfd\xc0\x79\xaa\xb0\x9e\xba\
-\x1f\xa5\x70\xed\x1d\xd6\x6b\xd4\x53\xfb\x45\x38\x4f\x15\xd6\x0b\
-\xca\x7e\xb0\x50\x45\xa3\x86\x7f\x50\xfb\x45\x38\xcf\xde\xe8\x62\
-\x4f\xd8\x10\xaa\x0d\x87\x85\x6a\xd1\x40\xe1\x1f\xd4\x7e\x11\xce\
-\x53\x85\xf5\x6a\xf0\xfe\xb6\x0c\xeb\x16\x6a\x3d\xd6\x63\xae\xb6\
-\x1f\x38\x4f\x15\xd6\x53\x6d\x19\xd6\xec\xeb\x6b\x6a\xf5\x58\x4f\
-\x25\xb8\x1f\x38\x4f\x55\x6d\x7f\x6b\x4a\xe1\xda\x3b\xac\xd7\xa8\
-\xa7\xf6\x8b\x70\x9e\x2a\xac\xa7\xee\x07\x0b\xd5\xdc\xc8\xe1\x1f\
-\x96\x9e\x3f\x9c\x67\x6f\x74\xb1\x27\x6c\x28\xd7\x32\x1c\x16\xaa\
-\xb3\x06\x0b\xff\xa0\xf6\x8b\x70\x9e\x2a\xac\x57\xc2\xee\x6f\xcf\
-\xe1\x1f\x58\x9f\x93\x96\xfd\xc0\x79\xaa\x6a\xfb\x5b\x12\x8f\xdb\
-\x32\xac\x55\x2d\xf5\x58\x5f\x73\xd8\x7e\xe0\x3c\x55\xb5\xfd\xad\
-\x29\x85\x6b\xef\xb0\x5e\xa3\xde\xd2\xf3\x87\xf3\x54\x61\x3d\x75\
-\x3f\x58\xa8\x4e\x46\x0f\xff\x78\xdc\xd2\xf3\x87\xf3\xec\x8d\x2e\
-\xf6\x84\x0d\x4d\x5a\x0f\x03\x0b\x55\x6a\xc0\xf0\x0f\x6a\xbf\x08\
-\xe7\xa9\xc2\x7a\x73\xe6\xee\x6f\xcf\xe1\x1f\x58\xaf\xa1\x75\x3f\
-\x70\x9e\xaa\xda\xfe\xce\x99\xee\xaf\x14\xae\x8a\x4b\x84\x7f\x60\
-\xbd\x31\x73\xfb\x81\xf3\x54\x61\x3d\x75\x3f\x4a\xe1\x3a\x7a\xf8\
-\xc7\x9f\x97\x9e\x3f\x9c\xa7\x0a\xeb\xa9\xfb\xc1\x82\x35\xec\x21\
-\xfc\xe3\xf1\x6a\xbf\x08\xe7\xd9\x1b\x5d\xec\x09\x1b\x0a\xca\x61\
-\x60\xa1\xfa\xc4\xa0\xe1\x1f\xd4\x7e\x11\xce\x53\x85\xf5\x98\xd2\
-\xfd\xb1\x50\xad\x19\x25\xfc\x83\xda\x2f\x7e\x2d\xce\x53\x85\xf5\
-\x5a\xe4\xf7\xb7\x65\x58\xb7\x52\xea\xb1\xfe\x50\x69\x3f\x70\x9e\
-\x2a\xac\xc7\xbe\x7f\x49\x29\x5c\x47\x0f\xff\x58\x67\x3d\xd5\xe4\
-\xfb\x81\xf3\x54\x61\x3d\x75\x3f\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\
-\xf6\x8b\x70\x9e\xbd\xd1\xc5\x9e\xb0\x21\xf5\x30\xb0\x50\x7d\x64\
-\xe0\xf0\x0f\x4b\x0e\x7f\xc0\x79\xaa\xb0\x1e\xaa\xdd\x1f\x0b\xd5\
-\x92\x91\xc2\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\xd5\xe0\xfd\x6d\x19\
-\xd6\x2d\xd4\x7a\xac\xc7\x5c\x6d\x3f\x70\x9e\x2a\xac\xa7\xda\x32\
-\xac\xd9\xd7\xd7\xd4\xea\xb1\x9e\x4a\x70\x3f\x70\x9e\xaa\xda\xfe\
-\xd6\x94\xc2\xb5\x77\x58\xaf\x51\x4f\xed\x17\xe1\x3c\x7b\xa3\x8b\
-\x3d\xe5\xcd\x9c\x73\x18\x58\xa8\x3e\x18\x3c\xfc\xe3\x71\x4b\x0e\
-\x7f\xc0\x79\xaa\xb0\x5e\xae\x65\x3f\x58\xa8\xce\x19\x2d\xfc\x83\
-\xda\x2f\xc2\x79\xaa\xb0\x5e\x09\xbb\xbf\x3d\x87\x7f\x60\x7d\x4e\
-\x5a\xf6\x03\xe7\xa9\xaa\xed\x6f\x49\x3c\x6e\xcb\xb0\x56\xb5\xd4\
-\x63\x7d\xcd\x61\xfb\x81\xf3\x54\xd5\xf6\xb7\xa6\x14\xae\xbd\xc3\
-\x7a\x8d\x7a\x4b\xcf\x1f\xce\xb3\x37\xba\xd8\x53\xde\xcc\x39\x87\
-\x81\x06\x6b\xd8\x41\xf8\xc7\xe3\xd5\x7e\x11\xce\x53\x85\xf5\x26\
-\xad\xfb\xc1\x42\x95\x19\x31\xfc\x83\xda\x2f\xc2\x79\xaa\xb0\xde\
-\x9c\xb9\xfb\xdb\x73\xf8\x07\xd6\x6b\x68\xdd\x0f\x9c\xa7\xaa\xb6\
-\xbf\x73\xa6\xfb\x2b\x85\xab\xe2\x12\xe1\x1f\x58\x6f\xcc\xdc\x7e\
-\xe0\x3c\x55\x58\x4f\xdd\x8f\x52\xb8\x8e\x1e\xfe\xf1\xe7\xa5\xe7\
-\x0f\xe7\xd9\x1b\x5d\xec\x29\x6f\xe6\x9c\xc3\x50\x0a\xd7\xde\x61\
-\xbd\x46\xbd\x25\x87\x3f\xe0\x3c\x55\x58\x2f\x28\xfb\xc1\x42\x15\
-\x8d\x1a\xfe\x41\xed\x17\xe1\x3c\x55\x58\x8f\x29\xdd\x1f\x0b\xd5\
-\x9a\x51\xc2\x3f\xa8\xfd\xe2\xd7\xe2\x3c\x55\x58\xaf\x45\x7e\x7f\
-\x5b\x86\x75\x2b\xa5\x1e\xeb\x0f\x95\xf6\x03\xe7\xa9\xc2\x7a\xec\
-\xfb\x97\x94\xc2\x75\xf4\xf0\x8f\x75\xd6\x53\x4d\xbe\x1f\x38\xcf\
-\xde\xe8\x62\x4f\xa5\xc3\xc5\x9a\x47\xa5\x70\xed\x1d\xd6\x6b\xd4\
-\x5b\x72\xf8\x03\xce\x53\x85\xf5\xd4\xfd\x60\xa1\x9a\x1b\x39\xfc\
-\xc3\xd2\xf3\x87\xf3\x54\x61\x3d\x54\xbb\x3f\x16\xaa\x25\x23\x85\
-\x7f\x50\xfb\x45\x38\x4f\x15\xd6\xab\xc1\xfb\xdb\x32\xac\x5b\xa8\
-\xf5\x58\x8f\xb9\xda\x7e\xe0\x3c\x55\x58\x4f\xb5\x65\x58\xb3\xaf\
-\xaf\xa9\xd5\x63\x3d\x95\xe0\x7e\xe0\x3c\x7b\xa3\x8b\x3d\x95\x0e\
-\x57\x8b\x52\xb8\xf6\x0e\xeb\x35\xea\x2d\x39\xfc\xf1\x38\x9c\xa7\
-\x0a\xeb\xa9\xfb\xc1\x42\x75\x32\x7a\xf8\xc7\xe3\x96\x9e\x3f\x9c\
-\xa7\x0a\xeb\xe5\x5a\xf6\x83\x85\xea\x9c\xd1\xc2\x3f\xa8\xfd\x22\
-\x9c\xa7\x0a\xeb\x95\xb0\xfb\xdb\x73\xf8\x07\xd6\xe7\xa4\x65\x3f\
-\x70\x9e\xaa\xda\xfe\x96\xc4\xe3\xb6\x0c\x6b\x55\x4b\x3d\xd6\xd7\
-\x1c\xb6\x1f\x38\xcf\xde\xe8\x62\x4f\x79\x33\xe7\x1c\x86\x52\xb8\
-\x8e\x1e\xfe\xf1\xe7\x25\x87\x3f\xe6\x85\xf3\x54\x61\x3d\x75\x3f\
-\x58\xb0\x86\x3d\x84\x7f\x3c\x5e\xed\x17\xe1\x3c\x55\x58\x6f\xd2\
-\xba\x1f\x2c\x54\x99\x11\xc3\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\xcd\
-\x99\xbb\xbf\x3d\x87\x7f\x60\xbd\x86\xd6\xfd\xc0\x79\xaa\x6a\xfb\
-\x3b\x67\xba\xbf\x52\xb8\x2a\x2e\x11\xfe\x81\xf5\xc6\xcc\xed\x07\
-\xce\xb3\x37\xba\xd8\x53\xe9\x70\xb5\x28\x85\xeb\xe8\xe1\x1f\xeb\
-\xac\xa7\x9a\xfc\x30\xe0\x3c\x55\x58\x4f\xdd\x8f\x52\xb8\xf6\x0e\
-\xeb\x35\xea\xa9\xfd\x22\x9c\xa7\x0a\xeb\x05\x65\x3f\x58\xa8\xa2\
-\x51\xc3\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\x31\xa5\xfb\x63\xa1\x5a\
-\x33\x4a\xf8\x07\xb5\x5f\xfc\x5a\x9c\xa7\x0a\xeb\xb5\xc8\xef\x6f\
-\xcb\xb0\x6e\xa5\xd4\x63\xfd\xa1\xd2\x7e\xe0\x3c\x7b\xa3\x8b\x3d\
-\x95\x0e\x57\x8b\x2d\xc3\x9a\x7e\x7d\x4d\xa5\x1e\xeb\xa9\x04\x0f\
-\x03\xce\x53\x55\x3a\x5c\xec\xfb\xa3\x52\xb8\xf6\x0e\xeb\x35\xea\
-\xa9\xfd\x22\x9c\xa7\x0a\xeb\xa9\xfb\xc1\x42\x35\x37\x72\xf8\x87\
-\xa5\xe7\x0f\xe7\xa9\xc2\x7a\xa8\x76\x7f\x2c\x54\x4b\x46\x0a\xff\
-\xa0\xf6\x8b\x70\x9e\x2a\xac\x57\x83\xf7\xb7\x65\x58\xb7\x50\xeb\
-\xb1\x1e\x73\xb5\xfd\xc0\x79\xf6\x46\x17\x7b\x2a\x1d\xae\x9a\x78\
-\xdc\x96\x61\x2d\x6b\xa8\xc7\xfa\x9a\xc3\x0e\x03\xce\x53\x55\x3a\
-\x5c\x2d\x4a\xe1\xda\x3b\xac\xd7\xa8\xb7\xf4\xfc\xe1\x3c\x55\x58\
-\x4f\xdd\x0f\x16\xaa\x93\xd1\xc3\x3f\x1e\xb7\xf4\xfc\xe1\x3c\x55\
-\x58\x2f\xd7\xb2\x1f\x2c\x54\xe7\x8c\x16\xfe\x41\xed\x17\xe1\x3c\
-\x55\x58\xaf\x84\xdd\xdf\x9e\xc3\x3f\xb0\x3e\x27\x2d\xfb\x81\xf3\
-\xec\x8d\x2e\xf6\x54\x3a\x5c\x25\xd3\x70\x4a\xe1\x2a\xb9\x40\xf8\
-\x07\xd6\x1b\x33\x77\x18\x70\x9e\x2a\xac\xa7\xee\x47\x29\x5c\x47\
-\x0f\xff\xf8\xf3\xd2\xf3\x87\xf3\x54\x61\x3d\x75\x3f\x58\xb0\x86\
-\x3d\x84\x7f\x3c\x5e\xed\x17\xe1\x3c\x55\x58\x6f\xd2\xba\x1f\x2c\
-\x54\x99\x11\xc3\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\xcd\x99\xbb\xbf\
-\x3d\x87\x7f\x60\xbd\x86\xd6\xfd\xc0\x79\xf6\x46\x17\x7b\xca\x9b\
-\x69\x95\x0f\x67\xcb\xb0\x6e\x26\xd4\x63\xfd\xa1\xd2\x61\xc0\x79\
-\xaa\xb0\x1e\xfb\xfe\x25\xa5\x70\x1d\x3d\xfc\x63\x9d\xf5\x54\x93\
-\xef\x07\xce\x53\x85\xf5\xd4\xfd\x28\x85\x6b\xef\xb0\x5e\xa3\x9e\
-\xda\x2f\xc2\x79\xaa\xb0\x5e\x50\xf6\x83\x85\x2a\x1a\x35\xfc\x83\
-\xda\x2f\xc2\x79\xaa\xb0\x1e\x53\xba\x3f\x16\xaa\x35\xa3\x84\x7f\
-\x50\xfb\xc5\xaf\xc5\x79\xf6\x46\x17\x7b\xc2\x86\x6a\x70\x38\x5b\
-\x86\x75\x13\xb1\x1e\xeb\x31\x57\x3b\x0c\x38\x4f\x15\xd6\x53\x6d\
-\x19\xd6\xec\xeb\x6b\x6a\xf5\x58\x4f\x25\xb8\x1f\x38\x4f\x55\x6d\
-\x7f\x6b\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\xf6\x8b\x70\x9e\x2a\xac\
-\xa7\xee\x07\x0b\xd5\xdc\xc8\xe1\x1f\x96\x9e\x3f\x9c\xa7\x0a\xeb\
-\xa1\xda\xfd\xb1\x50\x2d\x19\x29\xfc\x83\xda\x2f\xc2\x79\xf6\x46\
-\x17\x7b\xc2\x86\x4a\xd8\x70\xf6\x1c\xfe\x81\xf5\x39\x69\x39\x0c\
-\x38\x4f\x55\xe9\x70\xd5\xc4\xe3\xb6\x0c\x6b\x55\x4b\x3d\xd6\xd7\
-\x1c\xb6\x1f\x38\x4f\x55\x6d\x7f\x6b\x4a\xe1\xda\x3b\xac\xd7\xa8\
-\xb7\xf4\xfc\xe1\x3c\x55\x58\x4f\xdd\x0f\x16\xaa\x93\xd1\xc3\x3f\
-\x1e\xb7\xf4\xfc\xe1\x3c\x55\x58\x2f\xd7\xb2\x1f\x2c\x54\xe7\x8c\
-\x16\xfe\x41\xed\x17\xe1\x3c\x7b\xa3\x8b\x3d\x61\x43\x73\xe6\x86\
-\xb3\xe7\xf0\x0f\xac\xd7\xd0\x7a\x18\x70\x9e\xaa\xd2\xe1\x2a\x99\
-\xee\xaf\x14\xae\x8a\x4b\x84\x7f\x60\xbd\x31\x73\xfb\x81\xf3\x54\
-\x61\x3d\x75\x3f\x4a\xe1\x3a\x7a\xf8\xc7\x9f\x97\x9e\x3f\x9c\xa7\
-\x0a\xeb\xa9\xfb\xc1\x82\x35\xec\x21\xfc\xe3\xf1\x6a\xbf\x08\xe7\
-\xa9\xc2\x7a\x93\xd6\xfd\x60\xa1\xca\x8c\x18\xfe\x41\xed\x17\xe1\
-\x3c\x7b\xa3\x8b\x3d\x61\x43\x4c\x69\x38\x2c\x54\xab\x06\x09\xff\
-\xa0\xf6\x8b\x5f\x8b\xf3\x54\x61\xbd\x16\xf9\xfd\x6d\x19\xd6\xad\
-\x94\x7a\xac\x3f\x54\xda\x0f\x9c\xa7\x0a\xeb\xb1\xef\x5f\x52\x0a\
-\xd7\xd1\xc3\x3f\xd6\x59\x4f\x35\xf9\x7e\xe0\x3c\x55\x58\x4f\xdd\
-\x8f\x52\xb8\xf6\x0e\xeb\x35\xea\xa9\xfd\x22\x9c\xa7\x0a\xeb\x05\
-\x65\x3f\x58\xa8\xa2\x51\xc3\x3f\xa8\xfd\x22\x9c\x67\x6f\x74\xb1\
-\x27\x6c\x08\xd5\x86\xc3\x42\xb5\x68\xa0\xf0\x0f\x6a\xbf\x08\xe7\
-\xa9\xc2\x7a\x35\x78\x7f\x5b\x86\x75\x0b\xb5\x1e\xeb\x31\x57\xdb\
-\x0f\x9c\xa7\x0a\xeb\xa9\xb6\x0c\x6b\xf6\xf5\x35\xb5\x7a\xac\xa7\
-\x12\xdc\x0f\x9c\xa7\xaa\xb6\xbf\x35\xa5\x70\xed\x1d\xd6\x6b\xd4\
-\x53\xfb\x45\x38\x4f\x15\xd6\x53\xf7\x83\x85\x6a\x6e\xe4\xf0\x0f\
-\x4b\xcf\x1f\xce\xb3\x37\xba\xd8\x13\x36\x94\x6b\x19\x0e\x0b\xd5\
-\x59\x83\x85\x7f\x50\xfb\x45\x38\x4f\x15\xd6\x2b\x61\xf7\xb7\xe7\
-\xf0\x0f\xac\xcf\x49\xcb\x7e\xe0\x3c\x55\xb5\xfd\x2d\x89\xc7\x6d\
-\x19\xd6\xaa\x96\x7a\xac\xaf\x39\x6c\x3f\x70\x9e\xaa\xda\xfe\xd6\
-\x94\xc2\xb5\x77\x58\xaf\x51\x6f\xe9\xf9\xc3\x79\xaa\xb0\x9e\xba\
-\x1f\x2c\x54\x27\xa3\x87\x7f\x3c\x6e\xe9\xf9\xc3\x79\xf6\x46\x17\
-\x7b\xc2\x86\x26\xad\x87\x81\x85\x2a\x35\x60\xf8\x07\xb5\x5f\x84\
-\xf3\x54\x61\xbd\x39\x73\xf7\xb7\xe7\xf0\x0f\xac\xd7\xd0\xba\x1f\
-\x38\x4f\x55\x6d\x7f\xe7\x4c\xf7\x57\x0a\x57\xc5\x25\xc2\x3f\xb0\
-\xde\x98\xb9\xfd\xc0\x79\xaa\xb0\x9e\xba\x1f\xa5\x70\x1d\x3d\xfc\
-\xe3\xcf\x4b\xcf\x1f\xce\x53\x85\xf5\xd4\xfd\x60\xc1\x1a\xf6\x10\
-\xfe\xf1\x78\xb5\x5f\x84\xf3\xec\x8d\x2e\xf6\x84\x0d\x05\xe5\x30\
-\xb0\x50\x7d\x62\xd0\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x4c\xe9\
-\xfe\x58\xa8\xd6\x8c\x12\xfe\x41\xed\x17\xbf\x16\xe7\xa9\xc2\x7a\
-\x2d\xf2\xfb\xdb\x32\xac\x5b\x29\xf5\x58\x7f\xa8\xb4\x1f\x38\x4f\
-\x15\xd6\x63\xdf\xbf\xa4\x14\xae\xa3\x87\x7f\xac\xb3\x9e\x6a\xf2\
-\xfd\xc0\x79\xaa\xb0\x9e\xba\x1f\xa5\x70\xed\x1d\xd6\x6b\xd4\x53\
-\xfb\x45\x38\xcf\xde\xe8\x62\x4f\xd8\x90\x7a\x18\x58\xa8\x3e\x32\
-\x70\xf8\x87\x25\x87\x3f\xe0\x3c\x55\x58\x0f\xd5\xee\x8f\x85\x6a\
-\xc9\x48\xe1\x1f\xd4\x7e\x11\xce\x53\x85\xf5\x6a\xf0\xfe\xb6\x0c\
-\xeb\x16\x6a\x3d\xd6\x63\xae\xb6\x1f\x38\x4f\x15\xd6\x53\x6d\x19\
-\xd6\xec\xeb\x6b\x6a\xf5\x58\x4f\x25\xb8\x1f\x38\x4f\x55\x6d\x7f\
-\x6b\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\xf6\x8b\x70\x9e\xbd\xd1\xc5\
-\x9e\xf2\x66\xce\x39\x0c\x2c\x54\x1f\x0c\x1e\xfe\xf1\xb8\x25\x87\
-\x3f\xe0\x3c\x55\x58\x2f\xd7\xb2\x1f\x2c\x54\xe7\x8c\x16\xfe\x41\
-\xed\x17\xe1\x3c\x55\x58\xaf\x84\xdd\xdf\x9e\xc3\x3f\xb0\x3e\x27\
-\x2d\xfb\x81\xf3\x54\xd5\xf6\xb7\x24\x1e\xb7\x65\x58\xab\x5a\xea\
-\xb1\xbe\xe6\xb0\xfd\xc0\x79\xaa\x6a\xfb\x5b\x53\x0a\xd7\xde\x61\
-\xbd\x46\xbd\xa5\xe7\x0f\xe7\xd9\x1b\x5d\xec\x29\x6f\xe6\x9c\xc3\
-\x40\x83\x35\xec\x20\xfc\xe3\xf1\x6a\xbf\x08\xe7\xa9\xc2\x7a\x93\
-\xd6\xfd\x60\xa1\xca\x8c\x18\xfe\x41\xed\x17\xe1\x3c\x55\x58\x6f\
-\xce\xdc\xfd\xed\x39\xfc\x03\xeb\x35\xb4\xee\x07\xce\x53\x55\xdb\
-\xdf\x39\xd3\xfd\x95\xc2\x55\x71\x89\xf0\x0f\xac\x37\x66\x6e\x3f\
-\x70\x9e\x2a\xac\xa7\xee\x47\x29\x5c\x47\x0f\xff\xf8\xf3\xd2\xf3\
-\x87\xf3\xec\x8d\x2e\xf6\x94\x37\x73\xce\x61\x28\x85\x6b\xef\xb0\
-\x5e\xa3\xde\x92\xc3\x1f\x70\x9e\x2a\xac\x17\x94\xfd\x60\xa1\x8a\
-\x46\x0d\xff\xa0\xf6\x8b\x70\x9e\x2a\xac\xc7\x94\xee\x8f\x85\x6a\
-\xcd\x28\xe1\x1f\xd4\x7e\xf1\x6b\x71\x9e\x2a\xac\xd7\x22\xbf\xbf\
-\x2d\xc3\xba\x95\x52\x8f\xf5\x87\x4a\xfb\x81\xf3\x54\x61\x3d\xf6\
-\xfd\x4b\x4a\xe1\x3a\x7a\xf8\xc7\x3a\xeb\xa9\x26\xdf\x0f\x9c\x67\
-\x6f\x74\xb1\xa7\xd2\xe1\x62\xcd\xa3\x52\xb8\xf6\x0e\xeb\x35\xea\
-\x2d\x39\xfc\x01\xe7\xa9\xc2\x7a\xea\x7e\xb0\x50\xcd\x8d\x1c\xfe\
-\x61\xe9\xf9\xc3\x79\xaa\xb0\x1e\xaa\xdd\x1f\x0b\xd5\x92\x91\xc2\
-\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\xd5\xe0\xfd\x6d\x19\xd6\x2d\xd4\
-\x7a\xac\xc7\x5c\x6d\x3f\x70\x9e\x2a\xac\xa7\xda\x32\xac\xd9\xd7\
-\xd7\xd4\xea\xb1\x9e\x4a\x70\x3f\x70\x9e\xbd\xd1\xc5\x9e\x4a\x87\
-\xab\x45\x29\x5c\x7b\x87\xf5\x1a\xf5\x96\x1c\xfe\x78\x1c\xce\x53\
-\x85\xf5\xd4\xfd\x60\xa1\x3a\x19\x3d\xfc\xe3\x71\x4b\xcf\x1f\xce\
-\x53\x85\xf5\x72\x2d\xfb\xc1\x42\x75\xce\x68\xe1\x1f\xd4\x7e\x11\
-\xce\x53\x85\xf5\x4a\xd8\xfd\xed\x39\xfc\x03\xeb\x73\xd2\xb2\x1f\
-\x38\x4f\x55\x6d\x7f\x4b\xe2\x71\x5b\x86\xb5\xaa\xa5\x1e\xeb\x6b\
-\x0e\xdb\x0f\x9c\x67\x6f\x74\xb1\xa7\xbc\x99\x73\x0e\x43\x29\x5c\
-\x47\x0f\xff\xf8\xf3\x92\xc3\x1f\xf3\xc2\x79\xaa\xb0\x9e\xba\x1f\
-\x2c\x58\xc3\x1e\xc2\x3f\x1e\xaf\xf6\x8b\x70\x9e\x2a\xac\x37\x69\
-\xdd\x0f\x16\xaa\xcc\x88\xe1\x1f\xd4\x7e\x11\xce\x53\x85\xf5\xe6\
-\xcc\xdd\xdf\x9e\xc3\x3f\xb0\x5e\x43\xeb\x7e\xe0\x3c\x55\xb5\xfd\
-\x9d\x33\xdd\x5f\x29\x5c\x15\x97\x08\xff\xc0\x7a\x63\xe6\xf6\x03\
-\xe7\xd9\x1b\x5d\xec\xa9\x74\xb8\x5a\x94\xc2\x75\xf4\xf0\x8f\x75\
-\xd6\x53\x4d\x7e\x18\x70\x9e\x2a\xac\xa7\xee\x47\x29\x5c\x7b\x87\
-\xf5\x1a\xf5\xd4\x7e\x11\xce\x53\x85\xf5\x82\xb2\x1f\x2c\x54\xd1\
-\xa8\xe1\x1f\xd4\x7e\x11\xce\x53\x85\xf5\x98\xd2\xfd\xb1\x50\xad\
-\x19\x25\xfc\x83\xda\x2f\x7e\x2d\xce\x53\x85\xf5\x5a\xe4\xf7\xb7\
-\x65\x58\xb7\x52\xea\xb1\xfe\x50\x69\x3f\x70\x9e\xbd\xd1\xc5\x9e\
-\x4a\x87\xab\xc5\x96\x61\x4d\xbf\xbe\xa6\x52\x8f\xf5\x54\x82\x87\
-\x01\xe7\xa9\x2a\x1d\x2e\xf6\xfd\x51\x29\x5c\x7b\x87\xf5\x1a\xf5\
-\xd4\x7e\x11\xce\x53\x85\xf5\xd4\xfd\x60\xa1\x9a\x1b\x39\xfc\xc3\
-\xd2\xf3\x87\xf3\x54\x61\x3d\x54\xbb\x3f\x16\xaa\x25\x23\x85\x7f\
-\x50\xfb\x45\x38\x4f\x15\xd6\xab\xc1\xfb\xdb\x32\xac\x5b\xa8\xf5\
-\x58\x8f\xb9\xda\x7e\xe0\x3c\x7b\xa3\x8b\x3d\x95\x0e\x57\x4d\x3c\
-\x6e\xcb\xb0\x96\x35\xd4\x63\x7d\xcd\x61\x87\x01\xe7\xa9\x2a\x1d\
-\xae\x16\xa5\x70\xed\x1d\xd6\x6b\xd4\x5b\x7a\xfe\x70\x9e\x2a\xac\
-\xa7\xee\x07\x0b\xd5\xc9\xe8\xe1\x1f\x8f\x5b\x7a\xfe\x70\x9e\x2a\
-\xac\x97\x6b\xd9\x0f\x16\xaa\x73\x46\x0b\xff\xa0\xf6\x8b\x70\x9e\
-\x2a\xac\x57\xc2\xee\x6f\xcf\xe1\x1f\x58\x9f\x93\x96\xfd\xc0\x79\
-\xf6\x46\x17\x7b\x2a\x1d\xae\x92\x69\x38\xa5\x70\x95\x5c\x20\xfc\
-\x03\xeb\x8d\x99\x3b\x0c\x38\x4f\x15\xd6\x53\xf7\xa3\x14\xae\xa3\
-\x87\x7f\xfc\x79\xe9\xf9\xc3\x79\xaa\xb0\x9e\xba\x1f\x2c\x58\xc3\
-\x1e\xc2\x3f\x1e\xaf\xf6\x8b\x70\x9e\x2a\xac\x37\x69\xdd\x0f\x16\
-\xaa\xcc\x88\xe1\x1f\xd4\x7e\x11\xce\x53\x85\xf5\xe6\xcc\xdd\xdf\
-\x9e\xc3\x3f\xb0\x5e\x43\xeb\x7e\xe0\x3c\x7b\xa3\x8b\x3d\xe5\xcd\
-\xb4\xca\x87\xb3\x65\x58\x37\x13\xea\xb1\xfe\x50\xe9\x30\xe0\x3c\
-\x55\x58\x8f\x7d\xff\x92\x52\xb8\x8e\x1e\xfe\xb1\xce\x7a\xaa\xc9\
-\xf7\x03\xe7\xa9\xc2\x7a\xea\x7e\x94\xc2\xb5\x77\x58\xaf\x51\x4f\
-\xed\x17\xe1\x3c\x55\x58\x2f\x28\xfb\xc1\x42\x15\x8d\x1a\xfe\x41\
-\xed\x17\xe1\x3c\x55\x58\x8f\x29\xdd\x1f\x0b\xd5\x9a\x51\xc2\x3f\
-\xa8\xfd\xe2\xd7\xe2\x3c\x7b\xa3\x8b\x3d\x61\x43\x35\x38\x9c\x2d\
-\xc3\xba\x89\x58\x8f\xf5\x98\xab\x1d\x06\x9c\xa7\x0a\xeb\xa9\xb6\
-\x0c\x6b\xf6\xf5\x35\xb5\x7a\xac\xa7\x12\xdc\x0f\x9c\xa7\xaa\xb6\
-\xbf\x35\xa5\x70\xed\x1d\xd6\x6b\xd4\x53\xfb\x45\x38\x4f\x15\xd6\
-\x53\xf7\x83\x85\x6a\x6e\xe4\xf0\x0f\x4b\xcf\x1f\xce\x53\x85\xf5\
-\x50\xed\xfe\x58\xa8\x96\x8c\x14\xfe\x41\xed\x17\xe1\x3c\x7b\xa3\
-\x8b\x3d\x61\x43\x25\x6c\x38\x7b\x0e\xff\xc0\xfa\x9c\xb4\x1c\x06\
-\x9c\xa7\xaa\x74\xb8\x6a\xe2\x71\x5b\x86\xb5\xaa\xa5\x1e\xeb\x6b\
-\x0e\xdb\x0f\x9c\xa7\xaa\xb6\xbf\x35\xa5\x70\xed\x1d\xd6\x6b\xd4\
-\x5b\x7a\xfe\x70\x9e\x2a\xac\xa7\xee\x07\x0b\xd5\xc9\xe8\xe1\x1f\
-\x8f\x5b\x7a\xfe\x70\x9e\x2a\xac\x97\x6b\xd9\x0f\x16\xaa\x73\x46\
-\x0b\xff\xa0\xf6\x8b\x70\x9e\xbd\xd1\xc5\x9e\xb0\xa1\x39\x73\xc3\
-\xd9\x73\xf8\x07\xd6\x6b\x68\x3d\x0c\x38\x4f\x55\xe9\x70\x95\x4c\
-\xf7\x57\x0a\x57\xc5\x25\xc2\x3f\xb0\xde\x98\xb9\xfd\xc0\x79\xaa\
-\xb0\x9e\xba\x1f\xa5\x70\x1d\x3d\xfc\xe3\xcf\x4b\xcf\x1f\xce\x53\
-\x85\xf5\xd4\xfd\x60\xc1\x1a\xf6\x10\xfe\xf1\x78\xb5\x5f\x84\xf3\
-\x54\x61\xbd\x49\xeb\x7e\xb0\x50\x65\x46\x0c\xff\xa0\xf6\x8b\x70\
-\x9e\xbd\xd1\xc5\x9e\xb0\x21\xa6\x34\x1c\x16\xaa\x55\x83\x84\x7f\
-\x50\xfb\xc5\xaf\xc5\x79\xaa\xb0\x5e\x8b\xfc\xfe\xb6\x0c\xeb\x56\
-\x4a\x3d\xd6\x1f\x2a\xed\x07\xce\x53\x85\xf5\xd8\xf7\x2f\x29\x85\
-\xeb\xe8\xe1\x1f\xeb\xac\xa7\x9a\x7c\x3f\x70\x9e\x2a\xac\xa7\xee\
-\x47\x29\x5c\x7b\x87\xf5\x1a\xf5\xd4\x7e\x11\xce\x53\x85\xf5\x82\
-\xb2\x1f\x2c\x54\xd1\xa8\xe1\x1f\xd4\x7e\x11\xce\xb3\x37\xba\xd8\
-\x13\x36\x84\x6a\xc3\x61\xa1\x5a\x34\x50\xf8\x07\xb5\x5f\x84\xf3\
-\x54\x61\xbd\x1a\xbc\xbf\x2d\xc3\xba\x85\x5a\x8f\xf5\x98\xab\xed\
-\x07\xce\x53\x85\xf5\x54\x5b\x86\x35\xfb\xfa\x9a\x5a\x3d\xd6\x53\
-\x09\xee\x07\xce\x53\x55\xdb\xdf\x9a\x52\xb8\xf6\x0e\xeb\x35\xea\
-\xa9\xfd\x22\x9c\xa7\x0a\xeb\xa9\xfb\xc1\x42\x35\x37\x72\xf8\x87\
-\xa5\xe7\x0f\xe7\xd9\x1b\x5d\xec\x09\x1b\xca\xb5\x0c\x87\x85\xea\
-\xac\xc1\xc2\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\x95\xb0\xfb\xdb\x73\
-\xf8\x07\xd6\xe7\xa4\x65\x3f\x70\x9e\xaa\xda\xfe\x96\xc4\xe3\xb6\
-\x0c\x6b\x55\x4b\x3d\xd6\xd7\x1c\xb6\x1f\x38\x4f\x55\x6d\x7f\x6b\
-\x4a\xe1\xda\x3b\xac\xd7\xa8\xb7\xf4\xfc\xe1\x3c\x55\x58\x4f\xdd\
-\x0f\x16\xaa\x93\xd1\xc3\x3f\x1e\xb7\xf4\xfc\xe1\x3c\x7b\xa3\x8b\
-\x3d\x61\x43\x93\xd6\xc3\xc0\x42\x95\x1a\x30\xfc\x83\xda\x2f\xc2\
-\x79\xaa\xb0\xde\x9c\xb9\xfb\xdb\x73\xf8\x07\xd6\x6b\x68\xdd\x0f\
-\x9c\xa7\xaa\xb6\xbf\x73\xa6\xfb\x2b\x85\xab\xe2\x12\xe1\x1f\x58\
-\x6f\xcc\xdc\x7e\xe0\x3c\x55\x58\x4f\xdd\x8f\x52\xb8\x8e\x1e\xfe\
-\xf1\xe7\xa5\xe7\x0f\xe7\xa9\xc2\x7a\xea\x7e\xb0\x60\x0d\x7b\x08\
-\xff\x78\xbc\xda\x2f\xc2\x79\xf6\x46\x17\x7b\xc2\x86\x82\x72\x18\
-\x58\xa8\x3e\x31\x68\xf8\x07\xb5\x5f\x84\xf3\x54\x61\x3d\xa6\x74\
-\x7f\x2c\x54\x6b\x46\x09\xff\xa0\xf6\x8b\x5f\x8b\xf3\x54\x61\xbd\
-\x16\xf9\xfd\x6d\x19\xd6\xad\x94\x7a\xac\x3f\x54\xda\x0f\x9c\xa7\
-\x0a\xeb\xb1\xef\x5f\x52\x0a\xd7\xd1\xc3\x3f\xd6\x59\x4f\x35\xf9\
-\x7e\xe0\x3c\x55\x58\x4f\xdd\x8f\x52\xb8\xf6\x0e\xeb\x35\xea\xa9\
-\xfd\x22\x9c\x67\x6f\x74\xb1\x27\x6c\x48\x3d\x0c\x2c\x54\x1f\x19\
-\x38\xfc\xc3\x92\xc3\x1f\x70\x9e\x2a\xac\x87\x6a\xf7\xc7\x42\xb5\
-\x64\xa4\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x35\x78\x7f\x5b\x86\
-\x75\x0b\xb5\x1e\xeb\x31\x57\xdb\x0f\x9c\xa7\x0a\xeb\xa9\xb6\x0c\
-\x6b\xf6\xf5\x35\xb5\x7a\xac\xa7\x12\xdc\x0f\x9c\xa7\xaa\xb6\xbf\
-\x35\xa5\x70\xed\x1d\xd6\x6b\xd4\x53\xfb\x45\x38\xcf\xde\xe8\x62\
-\x4f\x79\x33\xe7\x1c\x06\x16\xaa\x0f\x06\x0f\xff\x78\xdc\x92\xc3\
-\x1f\x70\x9e\x2a\xac\x97\x6b\xd9\x0f\x16\xaa\x73\x46\x0b\xff\xa0\
-\xf6\x8b\x70\x9e\x2a\xac\x57\xc2\xee\x6f\xcf\xe1\x1f\x58\x9f\x93\
-\x96\xfd\xc0\x79\xaa\x6a\xfb\x5b\x12\x8f\xdb\x32\xac\x55\x2d\xf5\
-\x58\x5f\x73\xd8\x7e\xe0\x3c\x55\xb5\xfd\xad\x29\x85\x6b\xef\xb0\
-\x5e\xa3\xde\xd2\xf3\x87\xf3\xec\x8d\x2e\xf6\x94\x37\x73\xce\x61\
-\xa0\xc1\x1a\x76\x10\xfe\xf1\x78\xb5\x5f\x84\xf3\x54\x61\xbd\x49\
-\xeb\x7e\xb0\x50\x65\x46\x0c\xff\xa0\xf6\x8b\x70\x9e\x2a\xac\x37\
-\x67\xee\xfe\xf6\x1c\xfe\x81\xf5\x1a\x5a\xf7\x03\xe7\xa9\xaa\xed\
-\xef\x9c\xe9\xfe\x4a\xe1\xaa\xb8\x44\xf8\x07\xd6\x1b\x33\xb7\x1f\
-\x38\x4f\x15\xd6\x53\xf7\xa3\x14\xae\xa3\x87\x7f\xfc\x79\xe9\xf9\
-\xc3\x79\xf6\x46\x17\x7b\xca\x9b\x39\xe7\x30\x94\xc2\xb5\x77\x58\
-\xaf\x51\x6f\xc9\xe1\x0f\x38\x4f\x15\xd6\x0b\xca\x7e\xb0\x50\x45\
-\xa3\x86\x7f\x50\xfb\x45\x38\x4f\x15\xd6\x63\x4a\xf7\xc7\x42\xb5\
-\x66\x94\xf0\x0f\x6a\xbf\xf8\xb5\x38\x4f\x15\xd6\x6b\x91\xdf\xdf\
-\x96\x61\xdd\x4a\xa9\xc7\xfa\x43\xa5\xfd\xc0\x79\xaa\xb0\x1e\xfb\
-\xfe\x25\xa5\x70\x1d\x3d\xfc\x63\x9d\xf5\x54\x93\xef\x07\xce\xb3\
-\x37\xba\xd8\x53\xe9\x70\xb1\xe6\x51\x29\x5c\x7b\x87\xf5\x1a\xf5\
-\x96\x1c\xfe\x80\xf3\x54\x61\x3d\x75\x3f\x58\xa8\xe6\x46\x0e\xff\
-\xb0\xf4\xfc\xe1\x3c\x55\x58\x0f\xd5\xee\x8f\x85\x6a\xc9\x48\xe1\
-\x1f\xd4\x7e\x11\xce\x53\x85\xf5\x6a\xf0\xfe\xb6\x0c\xeb\x16\x6a\
-\x3d\xd6\x63\xae\xb6\x1f\x38\x4f\x15\xd6\x53\x6d\x19\xd6\xec\xeb\
-\x6b\x6a\xf5\x58\x4f\x25\xb8\x1f\x38\xcf\xde\xe8\x62\x4f\xa5\xc3\
-\xd5\xa2\x14\xae\xbd\xc3\x7a\x8d\x7a\x4b\x0e\x7f\x3c\x0e\xe7\xa9\
-\xc2\x7a\xea\x7e\xb0\x50\x9d\x8c\x1e\xfe\xf1\xb8\xa5\xe7\x0f\xe7\
-\xa9\xc2\x7a\xb9\x96\xfd\x60\xa1\x3a\x67\xb4\xf0\x0f\x6a\xbf\x08\
-\xe7\xa9\xc2\x7a\x25\xec\xfe\xf6\x1c\xfe\x81\xf5\x39\x69\xd9\x0f\
-\x9c\xa7\xaa\xb6\xbf\x25\xf1\xb8\x2d\xc3\x5a\xd5\x52\x8f\xf5\x35\
-\x87\xed\x07\xce\xb3\x37\xba\xd8\x53\xde\xcc\x39\x87\xa1\x14\xae\
-\xa3\x87\x7f\xfc\x79\xc9\xe1\x8f\x79\xe1\x3c\x55\x58\x4f\xdd\x0f\
-\x16\xac\x61\x0f\xe1\x1f\x8f\x57\xfb\x45\x38\x4f\x15\xd6\x9b\xb4\
-\xee\x07\x0b\x55\x66\xc4\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x73\
-\xe6\xee\x6f\xcf\xe1\x1f\x58\xaf\xa1\x75\x3f\x70\x9e\xaa\xda\xfe\
-\xce\x99\xee\xaf\x14\xae\x8a\x4b\x84\x7f\x60\xbd\x31\x73\xfb\x81\
-\xf3\xec\x8d\x2e\xf6\x54\x3a\x5c\x2d\x4a\xe1\x3a\x7a\xf8\xc7\x3a\
-\xeb\xa9\x26\x3f\x0c\x38\x4f\x15\xd6\x53\xf7\xa3\x14\xae\xbd\xc3\
-\x7a\x8d\x7a\x6a\xbf\x08\xe7\xa9\xc2\x7a\x41\xd9\x0f\x16\xaa\x68\
-\xd4\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x4c\xe9\xfe\x58\xa8\xd6\
-\x8c\x12\xfe\x41\xed\x17\xbf\x16\xe7\xa9\xc2\x7a\x2d\xf2\xfb\xdb\
-\x32\xac\x5b\x29\xf5\x58\x7f\xa8\xb4\x1f\x38\xcf\xde\xe8\x62\x4f\
-\xa5\xc3\xd5\x62\xcb\xb0\xa6\x5f\x5f\x53\xa9\xc7\x7a\x2a\xc1\xc3\
-\x80\xf3\x54\x95\x0e\x17\xfb\xfe\xa8\x14\xae\xbd\xc3\x7a\x8d\x7a\
-\x6a\xbf\x08\xe7\xa9\xc2\x7a\xea\x7e\xb0\x50\xcd\x8d\x1c\xfe\x61\
-\xe9\xf9\xc3\x79\xaa\xb0\x1e\xaa\xdd\x1f\x0b\xd5\x92\x91\xc2\x3f\
-\xa8\xfd\x22\x9c\xa7\x0a\xeb\xd5\xe0\xfd\x6d\x19\xd6\x2d\xd4\x7a\
-\xac\xc7\x5c\x6d\x3f\x70\x9e\xbd\xd1\xc5\x9e\x4a\x87\xab\x26\x1e\
-\xb7\x65\x58\xcb\x1a\xea\xb1\xbe\xe6\xb0\xc3\x80\xf3\x54\x95\x0e\
-\x57\x8b\x52\xb8\xf6\x0e\xeb\x35\xea\x2d\x3d\x7f\x38\x4f\x15\xd6\
-\x53\xf7\x83\x85\xea\x64\xf4\xf0\x8f\xc7\x2d\x3d\x7f\x38\x4f\x15\
-\xd6\xcb\xb5\xec\x07\x0b\xd5\x39\xa3\x85\x7f\x50\xfb\x45\x38\x4f\
-\x15\xd6\x2b\x61\xf7\xb7\xe7\xf0\x0f\xac\xcf\x49\xcb\x7e\xe0\x3c\
-\x7b\xa3\x8b\x3d\x95\x0e\x57\xc9\x34\x9c\x52\xb8\x4a\x2e\x10\xfe\
-\x81\xf5\xc6\xcc\x1d\x06\x9c\xa7\x0a\xeb\xa9\xfb\x51\x0a\xd7\xd1\
-\xc3\x3f\xfe\xbc\xf4\xfc\xe1\x3c\x55\x58\x4f\xdd\x0f\x16\xac\x61\
-\x0f\xe1\x1f\x8f\x57\xfb\x45\x38\x4f\x15\xd6\x9b\xb4\xee\x07\x0b\
-\x55\x66\xc4\xf0\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x73\xe6\xee\x6f\
-\xcf\xe1\x1f\x58\xaf\xa1\x75\x3f\x70\x9e\xbd\xd1\xc5\x9e\xf2\x66\
-\x5a\xe5\xc3\xd9\x32\xac\x9b\x09\xf5\x58\x7f\xa8\x74\x18\x70\x9e\
-\x2a\xac\xc7\xbe\x7f\x49\x29\x5c\x47\x0f\xff\x58\x67\x3d\xd5\xe4\
-\xfb\x81\xf3\x54\x61\x3d\x75\x3f\x4a\xe1\xda\x3b\xac\xd7\xa8\xa7\
-\xf6\x8b\x70\x9e\x2a\xac\x17\x94\xfd\x60\xa1\x8a\x46\x0d\xff\xa0\
-\xf6\x8b\x70\x9e\x2a\xac\xc7\x94\xee\x8f\x85\x6a\xcd\x28\xe1\x1f\
-\xd4\x7e\xf1\x6b\x71\x9e\xbd\xd1\xc5\x9e\xb0\xa1\x1a\x1c\xce\x96\
-\x61\xdd\x44\xac\xc7\x7a\xcc\xd5\x0e\x03\xce\x53\x85\xf5\x54\x5b\
-\x86\x35\xfb\xfa\x9a\x5a\x3d\xd6\x53\x09\xee\x07\xce\x53\x55\xdb\
-\xdf\x9a\x52\xb8\xf6\x0e\xeb\x35\xea\xa9\xfd\x22\x9c\xa7\x0a\xeb\
-\xa9\xfb\xc1\x42\x35\x37\x72\xf8\x87\xa5\xe7\x0f\xe7\xa9\xc2\x7a\
-\xa8\x76\x7f\x2c\x54\x4b\x46\x0a\xff\xa0\xf6\x8b\x70\x9e\xbd\xd1\
-\xc5\x9e\xb0\xa1\x12\x36\x9c\x3d\x87\x7f\x60\x7d\x4e\x5a\x0e\x03\
-\xce\x53\x55\x3a\x5c\x35\xf1\xb8\x2d\xc3\x5a\xd5\x52\x8f\xf5\x35\
-\x87\xed\x07\xce\x53\x55\xdb\xdf\x9a\x52\xb8\xf6\x0e\xeb\x35\xea\
-\x2d\x3d\x7f\x38\x4f\x15\xd6\x53\xf7\x83\x85\xea\x64\xf4\xf0\x8f\
-\xc7\x2d\x3d\x7f\x38\x4f\x15\xd6\xcb\xb5\xec\x07\x0b\xd5\x39\xa3\
-\x85\x7f\x50\xfb\x45\x38\xcf\xde\xe8\x62\x4f\xd8\xd0\x9c\xb9\xe1\
-\xec\x39\xfc\x03\xeb\x35\xb4\x1e\x06\x9c\xa7\xaa\x74\xb8\x4a\xa6\
-\xfb\x2b\x85\xab\xe2\x12\xe1\x1f\x58\x6f\xcc\xdc\x7e\xe0\x3c\x55\
-\x58\x4f\xdd\x8f\x52\xb8\x8e\x1e\xfe\xf1\xe7\xa5\xe7\x0f\xe7\xa9\
-\xc2\x7a\xea\x7e\xb0\x60\x0d\x7b\x08\xff\x78\xbc\xda\x2f\xc2\x79\
-\xaa\xb0\xde\xa4\x75\x3f\x58\xa8\x32\x23\x86\x7f\x50\xfb\x45\x38\
-\xcf\xde\xe8\x62\x4f\xd8\x10\x53\x1a\x0e\x0b\xd5\xaa\x41\xc2\x3f\
-\xa8\xfd\xe2\xd7\xe2\x3c\x55\x58\xaf\x45\x7e\x7f\x5b\x86\x75\x2b\
-\xa5\x1e\xeb\x0f\x95\xf6\x03\xe7\xa9\xc2\x7a\xec\xfb\x97\x94\xc2\
-\x75\xf4\xf0\x8f\x75\xd6\x53\x4d\xbe\x1f\x38\x4f\x15\xd6\x53\xf7\
-\xa3\x14\xae\xbd\xc3\x7a\x8d\x7a\x6a\xbf\x08\xe7\xa9\xc2\x7a\x41\
-\xd9\x0f\x16\xaa\x68\xd4\xf0\x0f\x6a\xbf\x08\xe7\xd9\x1b\x5d\xec\
-\x09\x1b\x42\xb5\xe1\xb0\x50\x2d\x1a\x28\xfc\x83\xda\x2f\xc2\x79\
-\xaa\xb0\x5e\x0d\xde\xdf\x96\x61\xdd\x42\xad\xc7\x7a\xcc\xd5\xf6\
-\x03\xe7\xa9\xc2\x7a\xaa\x2d\xc3\x9a\x7d\x7d\x4d\xad\x1e\xeb\xa9\
-\x04\xf7\x03\xe7\xa9\xaa\xed\x6f\x4d\x29\x5c\x7b\x87\xf5\x1a\xf5\
-\xd4\x7e\x11\xce\x53\x85\xf5\xd4\xfd\x60\xa1\x9a\x1b\x39\xfc\xc3\
-\xd2\xf3\x87\xf3\xec\x8d\x2e\xf6\x84\x0d\xe5\x5a\x86\xc3\x42\x75\
-\xd6\x60\xe1\x1f\xd4\x7e\x11\xce\x53\x85\xf5\x4a\xd8\xfd\xed\x39\
-\xfc\x03\xeb\x73\xd2\xb2\x1f\x38\x4f\x55\x6d\x7f\x4b\xe2\x71\x5b\
-\x86\xb5\xaa\xa5\x1e\xeb\x6b\x0e\xdb\x0f\x9c\xa7\xaa\xb6\xbf\x35\
-\xa5\x70\xed\x1d\xd6\x6b\xd4\x5b\x7a\xfe\x70\x9e\x2a\xac\xa7\xee\
-\x07\x0b\xd5\xc9\xe8\xe1\x1f\x8f\x5b\x7a\xfe\x70\x9e\xbd\xd1\xc5\
-\x9e\xb0\xa1\x49\xeb\x61\x60\xa1\x4a\x0d\x18\xfe\x41\xed\x17\xe1\
-\x3c\x55\x58\x6f\xce\xdc\xfd\xed\x39\xfc\x03\xeb\x35\xb4\xee\x07\
-\xce\x53\x55\xdb\xdf\x39\xd3\xfd\x95\xc2\x55\x71\x89\xf0\x0f\xac\
-\x37\x66\x6e\x3f\x70\x9e\x2a\xac\xa7\xee\x47\x29\x5c\x47\x0f\xff\
-\xf8\xf3\xd2\xf3\x87\xf3\x54\x61\x3d\x75\x3f\x58\xb0\x86\x3d\x84\
-\x7f\x3c\x5e\xed\x17\xe1\x3c\x7b\xa3\x8b\x3d\x61\x43\x41\x39\x0c\
-\x2c\x54\x9f\x18\x34\xfc\x83\xda\x2f\xc2\x79\xaa\xb0\x1e\x53\xba\
-\x3f\x16\xaa\x35\xa3\x84\x7f\x50\xfb\xc5\xaf\xc5\x79\xaa\xb0\x5e\
-\x8b\xfc\xfe\xb6\x0c\xeb\x56\x4a\x3d\xd6\x1f\x2a\xed\x07\xce\x53\
-\x85\xf5\xd8\xf7\x2f\x29\x85\xeb\xe8\xe1\x1f\xeb\xac\xa7\x9a\x7c\
-\x3f\x70\x9e\x2a\xac\xa7\xee\x47\x29\x5c\x7b\x87\xf5\x1a\xf5\xd4\
-\x7e\x11\xce\xb3\x37\xba\xd8\x13\x36\xa4\x1e\x06\x16\xaa\x8f\x0c\
-\x1c\xfe\x61\xc9\xe1\x0f\x38\x4f\x15\xd6\x43\xb5\xfb\x63\xa1\x5a\
-\x32\x52\xf8\x07\xb5\x5f\x84\xf3\x54\x61\xbd\x1a\xbc\xbf\x2d\xc3\
-\xba\x85\x5a\x8f\xf5\x98\xab\xed\x07\xce\x53\x85\xf5\x54\x5b\x86\
-\x35\xfb\xfa\x9a\x5a\x3d\xd6\x53\x09\xee\x07\xce\x53\x55\xdb\xdf\
-\x9a\x52\xb8\xf6\x0e\xeb\x35\xea\xa9\xfd\x22\x9c\x67\x6f\x74\xb1\
-\xa7\xbc\x99\x73\x0e\x03\x0b\xd5\x07\x83\x87\x7f\x3c\x6e\xc9\xe1\
-\x0f\x38\x4f\x15\xd6\xcb\xb5\xec\x07\x0b\xd5\x39\xa3\x85\x7f\x50\
-\xfb\x45\x38\x4f\x15\xd6\x2b\x61\xf7\xb7\xe7\xf0\x0f\xac\xcf\x49\
-\xcb\x7e\xe0\x3c\x55\xb5\xfd\x2d\x89\xc7\x6d\x19\xd6\xaa\x96\x7a\
-\xac\xaf\x39\x6c\x3f\x70\x9e\xaa\xda\xfe\xd6\x94\xc2\xb5\x77\x58\
-\xaf\x51\x6f\xe9\xf9\xc3\x79\xf6\x46\x17\x7b\xca\x9b\x39\xe7\x30\
-\xd0\x60\x0d\x3b\x08\xff\x78\xbc\xda\x2f\xc2\x79\xaa\xb0\xde\xa4\
-\x75\x3f\x58\xa8\x32\x23\x86\x7f\x50\xfb\x45\x38\x4f\x15\xd6\x9b\
-\x33\x77\x7f\x7b\x0e\xff\xc0\x7a\x0d\xad\xfb\x81\xf3\x54\xd5\xf6\
-\x77\xce\x74\x7f\xa5\x70\x55\x5c\x22\xfc\x03\xeb\x8d\x99\xdb\x0f\
-\x9c\xa7\x0a\xeb\xa9\xfb\x51\x0a\xd7\xd1\xc3\x3f\xfe\xbc\xf4\xfc\
-\xe1\x3c\x7b\xa3\x8b\x3d\xe5\xcd\x9c\x73\x18\x4a\xe1\xda\x3b\xac\
-\xd7\xa8\xb7\xe4\xf0\x07\x9c\xa7\x0a\xeb\x05\x65\x3f\x58\xa8\xa2\
-\x51\xc3\x3f\xa8\xfd\x22\x9c\xa7\x0a\xeb\x31\xa5\xfb\x63\xa1\x5a\
-\x33\x4a\xf8\x07\xb5\x5f\xfc\x5a\x9c\xa7\x0a\xeb\xb5\xc8\xef\x6f\
-\xcb\xb0\x6e\xa5\xd4\x63\xfd\xa1\xd2\x7e\xe0\x3c\x55\x58\x8f\x7d\
-\xff\x92\x52\xb8\x8e\x1e\xfe\xb1\xce\x7a\xaa\xc9\xf7\x03\xe7\xd9\
-\x1b\x5d\xec\xa9\x74\xb8\x58\xf3\xa8\x14\xae\xbd\xc3\x7a\x8d\x7a\
-\x4b\x0e\x7f\xc0\x79\xaa\xb0\x9e\xba\x1f\x2c\x54\x73\x23\x87\x7f\
-\x58\x7a\xfe\x70\x9e\x2a\xac\x87\x6a\xf7\xc7\x42\xb5\x64\xa4\xf0\
-\x0f\x6a\xbf\x08\xe7\xa9\xc2\x7a\x35\x78\x7f\x5b\x86\x75\x0b\xb5\
-\x1e\xeb\x31\x57\xdb\x0f\x9c\xa7\x0a\xeb\xa9\xb6\x0c\x6b\xf6\xf5\
-\x35\xb5\x7a\xac\xa7\x12\xdc\x0f\x9c\x67\x6f\x74\xb1\xa7\xd2\xe1\
-\x6a\x51\x0a\xd7\xde\x61\xbd\x46\xbd\x25\x87\x3f\x1e\x87\xf3\x54\
-\x61\x3d\x75\x3f\x58\xa8\x4e\x46\x0f\xff\x78\xdc\xd2\xf3\x87\xf3\
-\x54\x61\xbd\x5c\xcb\x7e\xb0\x50\x9d\x33\x5a\xf8\x07\xb5\x5f\x84\
-\xf3\x54\x61\xbd\x12\x76\x7f\x7b\x0e\xff\xc0\xfa\x9c\xb4\xec\x07\
-\xce\x53\x55\xdb\xdf\x92\x78\xdc\x96\x61\xad\x6a\xa9\xc7\xfa\x9a\
-\xc3\xf6\x03\xe7\xd9\x1b\x5d\xec\x29\x6f\xe6\x9c\xc3\x50\x0a\xd7\
-\xd1\xc3\x3f\xfe\xbc\xe4\xf0\xc7\xbc\x70\x9e\x2a\xac\xa7\xee\x07\
-\x0b\xd6\xb0\x87\xf0\x8f\xc7\xab\xfd\x22\x9c\xa7\x0a\xeb\x4d\x5a\
-\xf7\x83\x85\x2a\x33\x62\xf8\x07\xb5\x5f\x84\xf3\x54\x61\xbd\x39\
-\x73\xf7\xb7\xe7\xf0\x0f\xac\xd7\xd0\xba\x1f\x38\x4f\x55\x6d\x7f\
-\xe7\x4c\xf7\x57\x0a\x57\xc5\x25\xc2\x3f\xb0\xde\x98\xb9\xfd\xc0\
-\x79\xf6\x46\x17\x7b\x2a\x1d\xae\x16\xa5\x70\x1d\x3d\xfc\x63\x9d\
-\xf5\x54\x93\x1f\x06\x9c\xa7\x0a\xeb\xa9\xfb\x51\x0a\xd7\xde\x61\
-\xbd\x46\x3d\xb5\x5f\x84\xf3\x54\x61\xbd\xa0\xec\x07\x0b\x55\x34\
-\x6a\xf8\x07\xb5\x5f\x84\xf3\x54\x61\x3d\xa6\x74\x7f\x2c\x54\x6b\
-\x46\x09\xff\xa0\xf6\x8b\x5f\x8b\xf3\x54\x61\xbd\x16\xf9\xfd\x6d\
-\x19\xd6\xad\x94\x7a\xac\x3f\x54\xda\x0f\x9c\x67\x6f\x74\xb1\xa7\
-\xd2\xe1\x6a\xb1\x65\x58\xd3\xaf\xaf\xa9\xd4\x63\x3d\x95\xe0\x61\
-\xc0\x79\xaa\x4a\x87\x8b\x7d\x7f\x54\x0a\xd7\xde\x61\xbd\x46\x3d\
-\xb5\x5f\x84\xf3\x54\x61\x3d\x75\x3f\x58\xa8\xe6\x46\x0e\xff\xb0\
-\xf4\xfc\xe1\x3c\x55\x58\x0f\xd5\xee\x8f\x85\x6a\xc9\x48\xe1\x1f\
-\xd4\x7e\x11\xce\x53\x85\xf5\x6a\xf0\xfe\xb6\x0c\xeb\x16\x6a\x3d\
-\xd6\x63\xae\xb6\x1f\x38\xcf\xde\xe8\x62\x4f\xa5\xc3\x55\x13\x8f\
-\xdb\x32\xac\x65\x0d\xf5\x58\x5f\x73\xd8\x61\xc0\x79\xaa\x4a\x87\
-\xab\x45\x29\x5c\x7b\x87\xf5\x1a\xf5\x96\x9e\x3f\x9c\xa7\x0a\xeb\
-\xa9\xfb\xc1\x42\x75\x32\x7a\xf8\xc7\xe3\x96\x9e\x3f\x9c\xa7\x0a\
-\xeb\xe5\x5a\xf6\x83\x85\xea\x9c\xd1\xc2\x3f\xa8\xfd\x22\x9c\xa7\
-\x0a\xeb\x95\xb0\xfb\xdb\x73\xf8\x07\xd6\xe7\xa4\x65\x3f\x70\x9e\
-\xbd\xd1\xc5\x9e\x4a\x87\xab\x64\x1a\x4e\x29\x5c\x25\x17\x08\xff\
-\xc0\x7a\x63\xe6\x0e\x03\xce\x53\x85\xf5\xd4\xfd\x28\x85\xeb\xe8\
-\xe1\x1f\x7f\x5e\x7a\xfe\x70\x9e\x2a\xac\xa7\xee\x07\x0b\xd6\xb0\
-\x87\xf0\x8f\xc7\xab\xfd\x22\x9c\xa7\x0a\xeb\x4d\x5a\xf7\x83\x85\
-\x2a\x33\x62\xf8\x07\xb5\x5f\x84\xf3\x54\x61\xbd\x39\x73\xf7\xb7\
-\xe7\xf0\x0f\xac\xd7\xd0\xba\x1f\x38\xcf\xde\xe8\x62\x4f\x79\x33\
-\xad\xf2\xe1\x6c\x19\xd6\xcd\x84\x7a\xac\x3f\x54\x3a\x0c\x38\x4f\
-\x15\xd6\x63\xdf\xbf\xa4\x14\xae\xa3\x87\x7f\xac\xb3\x9e\x6a\xf2\
-\xfd\xc0\x79\xaa\xb0\x9e\xba\x1f\xa5\x70\xed\x1d\xd6\x6b\xd4\x53\
-\xfb\x45\x38\x4f\x15\xd6\x0b\xca\x7e\xb0\x50\x45\xa3\x86\x7f\x50\
-\xfb\x45\x38\x4f\x15\xd6\x63\x4a\xf7\xc7\x42\xb5\x66\x94\xf0\x0f\
-\x6a\xbf\xf8\xb5\x38\xcf\xde\xe8\x62\x4f\xd8\x50\x8d\x32\x9c\x16\
-\x7b\xaf\x87\xf3\x54\xad\x7d\x7f\xaa\xbd\xd5\xc3\x79\xaa\xf6\xd6\
-\xef\x68\xf5\x70\x9e\x2a\xac\x37\x7a\xbf\xa3\xd5\xc3\x79\xaa\xb0\
-\x1e\x1a\xad\x5f\x74\xe9\x7a\x38\xcf\xde\xe8\x62\x4f\xd8\x50\xc9\
-\xa5\x87\x5d\x73\x89\x7a\x38\x4f\xd5\xde\xfa\x55\x6c\x51\x0f\xe7\
-\xa9\xda\x5b\xbf\xa3\xd5\xc3\x79\xaa\xb0\xde\xe8\xfd\x8e\x56\x0f\
-\xe7\xa9\xc2\x7a\xb9\x11\xfb\xcd\x8d\x50\x0f\xe7\xd9\x1b\x5d\xec\
-\x09\x1b\x9a\x33\xc2\xb0\x4b\x2e\x55\x0f\xe7\xa9\xda\x5b\xbf\xad\
-\xb6\xaa\x87\xf3\x54\x61\xbd\xd1\xfb\x1d\xad\x1e\xce\x53\x85\xf5\
-\x7a\xdf\xdf\xd1\xeb\xe1\x3c\x55\x58\x6f\x32\x6a\xbf\x93\x51\xea\
-\xe1\x3c\x7b\xa3\x8b\x3d\x61\x43\xcc\x28\xc3\x9e\x73\xc9\x7a\x38\
-\x4f\x15\xd6\x6b\x71\xc9\x7e\x5b\x6c\x59\x0f\xe7\xa9\x5a\xfb\xfe\
-\xd8\xd7\xd7\xec\xa9\x1e\xce\x53\x85\xf5\x7a\xdf\xdf\xd1\xeb\xe1\
-\x3c\x55\x58\x2f\x8c\xdc\x6f\x18\xa9\x1e\xce\xb3\x37\xba\xd8\x13\
-\x36\x84\x46\x1a\x36\x73\xe9\x7a\x38\x4f\x15\xd6\xab\xb9\x74\xbf\
-\x35\x5b\xd7\xc3\x79\xaa\xd6\xbe\x3f\xd5\xde\xea\xe1\x3c\x55\x7b\
-\xeb\x77\xb4\x7a\x38\x4f\x15\xd6\x1b\xbd\xdf\xd1\xea\xe1\x3c\x7b\
-\xa3\x8b\x3d\x61\x43\xb9\xd1\x86\x8d\x46\xa8\x87\xf3\x54\x61\xbd\
-\x92\x11\xfa\x2d\xb9\x44\x3d\x9c\xa7\x6a\x6f\xfd\x2a\xb6\xa8\x87\
-\xf3\x54\xed\xad\xdf\xd1\xea\xe1\x3c\x55\x58\x6f\xf4\x7e\x47\xab\
-\x87\xf3\xec\x8d\x2e\xf6\x84\x0d\x4d\x46\x1c\x76\x6e\x94\x7a\x38\
-\x4f\x15\xd6\x9b\x33\x4a\xbf\x73\x2e\x55\x0f\xe7\xa9\xda\x5b\xbf\
-\xad\xb6\xaa\x87\xf3\x54\x61\xbd\xd1\xfb\x1d\xad\x1e\xce\x53\x85\
-\xf5\x7a\xdf\xdf\xd1\xeb\xe1\x3c\x7b\xa3\x8b\x3d\x61\x43\x61\xd4\
-\x61\x4f\x46\xaa\x87\xf3\x54\x61\x3d\x66\xa4\x7e\x99\x4b\xd6\xc3\
-\x79\xaa\xb0\x5e\x8b\x4b\xf6\xdb\x62\xcb\x7a\x38\x4f\xd5\xda\xf7\
-\xc7\xbe\xbe\x66\x4f\xf5\x70\x9e\x2a\xac\xd7\xfb\xfe\x8e\x5e\x0f\
-\xe7\xd9\x1b\x5d\xec\x29\x5d\xcf\xf3\x86\x46\x1e\x76\x18\xac\xde\
-\x73\x36\x53\x45\xd4\xc8\xea\x3d\x31\x58\xbf\x4f\x5c\xb8\xde\xea\
-\xf3\x47\x17\xee\xb7\x6a\xe3\x7a\x8b\xe7\x9f\xea\x3d\xdf\x51\xbf\
-\xb2\x95\xeb\x2d\x9e\x7f\xaa\x77\x37\xff\x95\xee\xef\xe8\xf5\x16\
-\xcf\xbf\x86\x2e\xf6\x94\xae\xd7\xa6\x86\x06\x1f\xf6\x88\xf5\x5e\
-\x63\x33\x55\x44\x8d\xac\xde\x23\x03\xf6\xfb\xc8\x00\xf5\x56\x9d\
-\x3f\x1a\xa0\xdf\xa2\x0b\xd4\x5b\x3c\xff\x54\xf3\x63\x3b\xea\x57\
-\xb2\x76\xbd\xd3\xe9\xd9\xc7\xd8\x4c\x15\xa9\xce\xc7\xde\xbc\xb7\
-\xbe\xf7\x77\x05\xf5\x16\x9f\xff\x1a\xba\xd8\x53\xba\x5e\xb9\x6f\
-\xa6\xf7\x70\xae\xa1\xde\x2b\x6c\xa6\x8a\xa8\x91\xd5\x7b\x30\x68\
-\xbf\x0f\x06\xa9\xb7\xda\xfc\xd1\x20\xfd\xce\xba\x50\xbd\xc5\xf3\
-\x4f\xf5\xde\x9e\xd5\x6b\x76\xa1\x7e\x9b\x6d\x51\xef\xe6\xe6\xe6\
-\xdd\x6c\xa6\x8a\xdb\xdb\x9b\x77\xaf\x75\x7f\x47\xaf\xd7\x63\xfe\
-\x35\x74\xb1\xb7\xd4\xcc\x8b\xd1\x87\x3d\x60\xbd\x17\x6c\x96\xe7\
-\x88\x5a\x59\xdd\x51\xfb\x7d\x30\x48\xbd\xd5\xe6\x8f\x06\xe9\x77\
-\xd6\x85\xea\x6d\x36\x7f\x74\xa1\x7e\x9b\x6d\x54\xaf\xdb\xfc\x53\
-\xbd\xbb\xd7\xff\xc1\xfb\x1d\xad\x5e\xb7\xf9\x97\xd0\xc5\xde\x6e\
-\x6e\x4e\xef\xed\x3c\x9c\xac\xd6\x61\xeb\xbd\x83\xcd\xf2\x1c\xe9\
-\x7a\x75\xaa\x3b\x70\xbf\x77\x06\xaa\xb7\xca\xfc\xd1\x40\xfd\x52\
-\x17\xac\xb7\xc9\xfc\xd1\x05\xfb\x6d\xb2\x61\xbd\x57\xd9\x2c\xcf\
-\x11\xaf\xff\x3b\xe8\x97\x7e\x7d\xcd\x5a\xf5\x6e\x6f\x6f\xde\xcb\
-\x66\xd9\x1b\x5d\x5c\xc3\xe9\x74\xfa\xf0\xa8\xc3\x1e\xb0\xde\x87\
-\xd8\x0c\x97\x88\x9a\x03\xf7\x7b\x67\xa0\x7a\xab\xcc\x3f\xab\x7f\
-\x67\xa0\x7e\xa9\x0b\xd6\xdb\x64\xfe\xe8\x82\xfd\x36\xd9\xb0\xde\
-\xcf\xb0\x19\x2e\x91\xae\xea\xfc\xd1\x86\xfd\xd2\xaf\xaf\x59\xab\
-\x5e\x64\x25\x9b\xe1\x1a\xe8\xe2\x5a\xd2\x3f\x09\xbe\x27\x35\x29\
-\xbd\x1d\x37\x59\x6b\xd8\x83\xd5\x8b\xd9\x74\xfb\x37\x1f\x14\xf3\
-\x4f\xf7\xf5\x62\xc1\xfd\x3d\x18\x74\x7e\x0f\xce\xac\xb7\xea\xfc\
-\xa3\xf6\xfd\xf7\x18\xa5\xdf\x59\x17\xaa\xb7\xd9\xfc\xd1\x85\xfa\
-\x6d\xb6\x51\xbd\x17\x69\xbd\xdb\xbf\xf9\xa3\x74\xcd\xce\x1f\x6d\
-\xd4\xef\x68\xf5\x5e\x6c\xf5\x6f\xfe\x13\xba\xb8\xb6\x74\xc5\x0f\
-\x46\xc5\x4f\x47\x37\xfd\x8a\xd4\x4e\x36\xef\xdc\x7a\x31\x83\x98\
-\xc5\xe2\x1f\x78\x6a\x75\xff\x83\x39\xf1\xd3\xd1\xd2\xaf\xa8\x4d\
-\x06\x9b\xdf\x13\x62\xbd\xcd\xe7\x9f\xee\xe3\xed\xe9\x9e\xe2\xa7\
-\xa3\x9f\x37\xdc\x5f\x95\xd8\x6f\xd5\xc6\xf5\x36\x9f\x7f\x7c\xaf\
-\xfb\xef\x79\x77\xfe\x37\xee\x57\xb6\x72\xbd\xe7\xf1\xd3\xfe\x5b\
-\xfc\xc0\xd9\x24\x5d\xc5\xd7\xff\x9d\xcd\x6f\x69\xbd\xe7\xe9\x71\
-\xaf\x6d\x39\xff\x1c\x5d\x34\x33\x33\xb3\x63\xa3\x8b\x66\x66\x66\
-\x76\x6c\x74\xd1\xcc\xcc\xcc\x8e\x8d\x2e\x9a\x99\x99\xd9\xb1\xd1\
-\x45\x33\x33\x33\x3b\x36\xba\x68\x66\x66\x66\xc7\x46\x17\xcd\xcc\
-\xcc\xec\xd8\xe8\xa2\x99\x99\x99\x1d\x1b\x5d\x34\x33\x33\xb3\x63\
-\xa3\x8b\x66\x66\x66\x76\x6c\x74\xd1\xcc\xcc\xcc\x8e\x8d\x2e\x9a\
-\x99\x99\xd9\xb1\xd1\x45\x33\x33\x33\x3b\x36\xba\x68\x66\x66\x66\
-\xc7\x46\x17\xcd\xcc\xcc\xec\xd8\xe8\xa2\x99\x99\x99\x1d\xd9\xcb\
-\xaf\xfa\xff\x01\x8f\xdc\x67\xf6\x65\x38\xe3\xc1\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x77\x36\xb3\
-\x00\x70\
-\x00\x6c\x00\x6f\x00\x74\x00\x73\
-\x00\x0c\
-\x02\x79\xc2\x07\
-\x00\x70\
-\x00\x72\x00\x65\x00\x73\x00\x73\x00\x75\x00\x72\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x0d\x44\x28\x27\
-\x00\x68\
-\x00\x75\x00\x6d\x00\x69\x00\x64\x00\x69\x00\x74\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x04\x60\xad\x27\
-\x00\x74\
-\x00\x65\x00\x6d\x00\x70\x00\x65\x00\x72\x00\x61\x00\x74\x00\x75\x00\x72\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x03\xcb\x57\xa7\
-\x00\x6c\
-\x00\x75\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x08\xb6\xa2\x07\
-\x00\x73\
-\x00\x74\x00\x61\x00\x74\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\x00\x00\x00\x02\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x70\x00\x00\x00\x00\x00\x01\x00\x00\x8d\xb4\
-\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x72\xd2\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\xfe\xb4\
-\x00\x00\x00\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x60\x9c\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x72\x85\x7a\x84\x3f\
-\x00\x00\x00\x70\x00\x00\x00\x00\x00\x01\x00\x00\x8d\xb4\
-\x00\x00\x01\x72\x85\x72\xf2\x81\
-\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x72\xd2\
-\x00\x00\x01\x72\x85\x47\x5a\x28\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\xfe\xb4\
-\x00\x00\x01\x72\x94\xd4\xdd\xfd\
-\x00\x00\x00\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x60\x9c\
-\x00\x00\x01\x72\x85\x74\x76\x13\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,32 @@
+# Shared fixtures: a small synthetic archive in the logger's own layout, written once per test run, and its months
+# parsed. Each test compares a fast path against the plainest code that could give the same answer.
+
+import os
+import sys
+import datetime
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import env_data
+import generate_data
+
+
+@pytest.fixture(scope='session')
+def archive(tmp_path_factory):
+    """Return the month files of three months of 30 minute data, with gaps and plenty of spikes."""
+
+    outDir = str(tmp_path_factory.mktemp('archive'))
+
+    return generate_data.generate(outDir, datetime.datetime(2021, 12, 10, 7, 30), datetime.datetime(2022, 3, 5, 16, 0),
+                                  cadence=30, gapRate=0.004, spikeRate=0.01, seed=1)
+
+
+@pytest.fixture(scope='session')
+def months(archive):
+    """Return each month of the archive read whole and run through the spike filter."""
+
+    return [env_data.filterSpikes(env_data.readMonth(filename)) for filename in archive]
@@ -0,0 +1,75 @@
+import time
+import random
+
+import pytest
+
+import env_chill
+import env_data
+import env_schema
+
+
+def bruteHours(months, startSecs, endSecs, filtered):
+    """Return (chill, frost, logged) hours by grouping every sample under its local clock hour."""
+
+    hours = {}
+    for month in months:
+        weight = month.cadence / 3600
+        for timeVal, tempVal in zip(month.time, month.values(env_schema.column('temperature'), filtered)):
+            local = time.localtime(timeVal)
+            # NOTE - keyed by month too, each month's accumulator caps an hour it shares with the next on its own
+            hour = hours.setdefault((month.time[0], timeVal - local.tm_min * 60 - local.tm_sec), [0.0, 0.0, 0.0])
+            hour[0] += weight if env_chill.CHILL_RANGE[0] <= tempVal <= env_chill.CHILL_RANGE[1] else 0.0
+            hour[1] += weight if tempVal < env_chill.FROST_BELOW else 0.0
+            hour[2] += weight
+
+    totals = [0.0, 0.0, 0.0]
+    for (_, hourStart), figures in hours.items():
+        if startSecs <= hourStart < endSecs:
+            for idx, value in enumerate(figures):
+                totals[idx] += min(1.0, value)
+
+    return totals
+
+
+def blocksOf(months, stamp=0):
+
+    return [(('PT_month_{0}.CSV'.format(idx), stamp, 0), lambda monthData=monthData: monthData) for idx, monthData in enumerate(months)]
+
+
+@pytest.mark.parametrize('filtered', [False, True])
+def test_hours_match_brute_force(months, filtered):
+
+    env_chill.clearCache()
+    rng = random.Random(7)
+    first, last = months[0].time[0], months[-1].time[-1]
+    spans = [(first - 86400, last + 86400)] + [(start, start + rng.randint(0, 40 * 86400)) for start in (rng.randint(first, last) for _ in range(40))]
+
+    for startSecs, endSecs in spans:
+        expected = bruteHours(months, startSecs, endSecs, filtered)
+        assert env_chill.accumulatedHours(blocksOf(months), startSecs, endSecs, filtered) == pytest.approx(expected, abs=1e-9)
+
+    # The archive is winter data, both kinds of hour turn up
+    chill, frost, logged = env_chill.accumulatedHours(blocksOf(months), *spans[0], filtered)
+    assert chill and frost and logged < (spans[0][1] - spans[0][0]) / 3600
+
+
+def test_month_is_reduced_once_per_key(months):
+
+    env_chill.clearCache()
+    loads = []
+
+    def counted(key, load):
+        loads.append(key)
+        return load()
+
+    def blocks(stamp):
+        return [(key, lambda key=key, load=load: counted(key, load)) for key, load in blocksOf(months, stamp)]
+
+    startSecs, endSecs = months[0].time[0], months[-1].time[-1]
+    first = env_chill.accumulatedHours(blocks(0), startSecs, endSecs)
+    assert env_chill.accumulatedHours(blocks(0), startSecs, endSecs) == first
+    assert len(loads) == len(months)
+
+    # A month file that changes gets a new key, and is reduced again
+    env_chill.accumulatedHours(blocks(1), startSecs, endSecs)
+    assert len(loads) == 2 * len(months)
@@ -0,0 +1,193 @@
+import math
+import pickle
+import time
+import statistics
+
+import pytest
+
+import env_climate
+import env_schema
+
+COLUMNS = ('temperature', 'humidity', 'lux')
+
+
+def blocksOf(months, stamp=0):
+    """Return (key, load) per month as the viewer hands them to Climatology.update."""
+
+    return [(('PT_month_{0}.CSV'.format(idx), stamp, 0), lambda monthData=monthData: monthData) for idx, monthData in enumerate(months)]
+
+
+def referenceSlot(timeVal):
+
+    local = time.localtime(timeVal)
+
+    return local.tm_year, env_climate.MONTH_STARTS[local.tm_mon - 1] + local.tm_mday - 1, local.tm_hour * 2 + local.tm_min // 30
+
+
+def referencePercentile(values, pct):
+
+    if len(values) == 1:
+        return values[0]
+
+    # NOTE - the inclusive method interpolates between the two nearest ranks, as is usual for climate normals
+    return statistics.quantiles(values, n=100, method='inclusive')[pct - 1]
+
+
+def referenceTable(months, columnIdx):
+    """Return {(day, slot): (mean, percentiles)} from the half hour means of each year, pooled over the nearby days."""
+
+    buckets = {}
+    for monthData in months:
+        for timeVal, value in zip(monthData.time, monthData.values(columnIdx)):
+            buckets.setdefault(referenceSlot(timeVal), []).append(value)
+
+    # Every year's half hour means, by day of year and half hour
+    yearMeans = {}
+    for (_, day, slot), values in buckets.items():
+        yearMeans.setdefault((day, slot), []).append(sum(values) / len(values))
+
+    table = {}
+    for day in range(env_climate.DAYS):
+        for slot in range(env_climate.SLOTS_PER_DAY):
+            nearby = [((day + shift) % env_climate.DAYS, slot) for shift in range(-env_climate.POOL_DAYS, env_climate.POOL_DAYS + 1)]
+            pooled = sorted(mean for key in nearby for mean in yearMeans.get(key, ()))
+            if pooled:
+                table[day, slot] = (sum(pooled) / len(pooled), {pct: referencePercentile(pooled, pct) for pct in env_climate.PERCENTILES})
+
+    return table
+
+
+@pytest.fixture(scope='module')
+def climate(months):
+
+    climatology = env_climate.Climatology()
+    assert climatology.update(blocksOf(months))
+
+    return climatology
+
+
+@pytest.fixture(scope='module')
+def references(months):
+
+    return {name: referenceTable(months, env_schema.column(name)) for name in COLUMNS}
+
+
+@pytest.mark.parametrize('name', COLUMNS)
+def test_table_matches_reference(climate, references, name):
+
+    columnIdx = env_schema.column(name)
+    reference = references[name]
+
+    for day in range(env_climate.DAYS):
+        for slot in range(env_climate.SLOTS_PER_DAY):
+            position = day * env_climate.SLOTS_PER_DAY + slot
+            if (day, slot) not in reference:
+                assert math.isnan(climate.means[columnIdx][position])
+                continue
+            mean, percentiles = reference[day, slot]
+            assert climate.means[columnIdx][position] == pytest.approx(mean, rel=1e-6, abs=1e-6)
+            for pct, value in percentiles.items():
+                assert climate.percentiles[columnIdx][pct][position] == pytest.approx(value, rel=1e-6, abs=1e-6)
+
+
+@pytest.mark.parametrize('name', COLUMNS)
+def test_anomaly_baseline_per_sample(climate, references, months, name):
+
+    columnIdx = env_schema.column(name)
+    reference = references[name]
+    monthData = months[1]
+
+    means, lower, upper = climate.baseline(monthData.time, columnIdx)
+    for idx, timeVal in enumerate(monthData.time):
+        mean, percentiles = reference[referenceSlot(timeVal)[1:]]
+        assert means[idx] == pytest.approx(mean, rel=1e-6, abs=1e-6)
+        assert (lower[idx], upper[idx]) == pytest.approx((percentiles[env_climate.BAND[0]], percentiles[env_climate.BAND[1]]), rel=1e-6, abs=1e-6)
+
+
+def test_anomaly_baseline_per_bucket(climate, references, months):
+
+    columnIdx = env_schema.column('temperature')
+    reference = references['temperature']
+    bucketSecs = 3 * 3600
+    monthData = months[2]
+
+    # Buckets stamped at their middle, averaging the half hours they span within the day
+    middles = list(range(monthData.time[0] - monthData.time[0] % bucketSecs + bucketSecs // 2, monthData.time[-1], bucketSecs))
+    means = climate.baseline(middles, columnIdx, bucketSecs)[0]
+    for middle, mean in zip(middles, means):
+        _, day, slot = referenceSlot(middle - bucketSecs // 2)
+        spanned = [reference[day, other][0] for other in range(slot, min(slot + bucketSecs // env_climate.SLOT_SECS, env_climate.SLOTS_PER_DAY))
+                   if (day, other) in reference]
+        if spanned:
+            assert mean == pytest.approx(sum(spanned) / len(spanned), rel=1e-6, abs=1e-6)
+        else:
+            assert math.isnan(mean)
+
+
+def test_incremental_update_matches_full_build(climate, months):
+
+    climatology = env_climate.Climatology()
+    assert climatology.update(blocksOf(months[:2]))
+    assert climatology.update(blocksOf(months))
+    assert not climatology.update(blocksOf(months))
+
+    for name in COLUMNS:
+        columnIdx = env_schema.column(name)
+        assert list(map(repr, climatology.means[columnIdx])) == list(map(repr, climate.means[columnIdx]))
+
+
+def test_save_and_load(climate, tmp_path):
+
+    path = str(tmp_path / 'climatology.columns')
+    climate.save(path)
+
+    assert [entry.name for entry in tmp_path.iterdir()] == ['climatology.columns']
+    loaded = env_climate.Climatology.load(path)
+    assert loaded.months == climate.months
+    columnIdx = env_schema.column('temperature')
+    assert list(map(repr, loaded.means[columnIdx])) == list(map(repr, climate.means[columnIdx]))
+
+
+def test_load_ignores_anything_but_a_saved_table(climate, tmp_path):
+
+    path = tmp_path / 'climatology.columns'
+    path.write_bytes(pickle.dumps({'version': env_climate.TABLE_VERSION, 'columns': env_climate.COLUMNS}))
+    assert env_climate.Climatology.load(str(path)).months == {}
+
+    climate.save(str(path))
+    path.write_bytes(path.read_bytes()[:-8])
+    assert env_climate.Climatology.load(str(path)).months == {}
+
+
+def sameMeans(climatology, other):
+
+    return all(list(map(repr, climatology.means[column])) == list(map(repr, other.means[column])) for column in env_climate.COLUMNS)
+
+
+@pytest.mark.parametrize('kept', [slice(1, None), slice(None, -1)])
+def test_months_gone_from_the_archive_are_dropped(climate, months, tmp_path, kept):
+
+    path = str(tmp_path / 'climatology.columns')
+    climate.save(path)
+    blocks = blocksOf(months)[kept]
+
+    # The first month is the only one of its year, that year's tables go with it
+    loaded = env_climate.Climatology.load(path)
+    assert loaded.update(blocks)
+    assert set(loaded.months) == {key[0] for key, _ in blocks}
+
+    expected = env_climate.Climatology()
+    expected.update(blocks)
+    assert sorted(loaded.years) == sorted(expected.years)
+    assert sameMeans(loaded, expected)
+
+
+def test_renamed_month_is_not_counted_twice(climate, months):
+
+    climatology = env_climate.Climatology()
+    climatology.update(blocksOf(months))
+    renamed = [(('PT_renamed.CSV.gz', 0, 0), load) if idx == 1 else (key, load) for idx, (key, load) in enumerate(blocksOf(months))]
+
+    assert climatology.update(renamed)
+    assert 'PT_month_1.CSV' not in climatology.months
+    assert sameMeans(climatology, climate)
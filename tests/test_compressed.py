@@ -0,0 +1,81 @@
+import os
+import gzip
+import lzma
+import pickle
+import shutil
+
+import pytest
+
+import env_data
+from diagnostics import timings
+
+OPENERS = {'.gz': gzip.open, '.xz': lzma.open}
+
+
+class Planted():
+    """Unpickling this runs code, as a tampered pickle sidecar could."""
+
+    ran = False
+
+    def __reduce__(self):
+
+        return (setattr, (Planted, 'ran', True))
+
+
+@pytest.fixture(params=sorted(OPENERS))
+def compressed(archive, tmp_path, request):
+
+    path = str(tmp_path / (os.path.basename(archive[1]) + request.param))
+    with open(archive[1], 'rb') as src, OPENERS[request.param](path, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+
+    return path
+
+
+def sameColumns(monthData, expected):
+
+    return [column.tobytes() for column in monthData.columns] == [column.tobytes() for column in expected.columns]
+
+
+def test_compressed_month_and_its_sidecar(archive, compressed):
+
+    plain = env_data.readMonth(archive[1])
+    first = env_data.readMonth(compressed)
+    assert sameColumns(first, plain)
+    assert os.path.exists(env_data.sidecarPath(compressed))
+
+    timings.reset()
+    second = env_data.readMonth(compressed)
+    assert sameColumns(second, plain)
+    assert (second.headers, second.cadence, list(second.gaps)) == (plain.headers, plain.cadence, list(plain.gaps))
+    assert 'csv.parse' not in timings.stages and 'csv.sidecar_read' in timings.stages
+
+
+def test_sidecar_of_a_changed_month_is_ignored(compressed):
+
+    env_data.readMonth(compressed)
+    stat = os.stat(compressed)
+    os.utime(compressed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert env_data.readSidecar(compressed) is None
+
+
+@pytest.mark.parametrize('damage', ['pickle', 'truncated', 'garbage'])
+def test_bad_sidecar_is_never_trusted(archive, compressed, damage):
+
+    env_data.readMonth(compressed)
+    path = env_data.sidecarPath(compressed)
+
+    if damage == 'pickle':
+        with open(path, 'wb') as fh:
+            pickle.dump(Planted(), fh)
+    elif damage == 'truncated':
+        with open(path, 'r+b') as fh:
+            fh.truncate(os.path.getsize(path) - 100)
+    else:
+        with open(path, 'wb') as fh:
+            fh.write(env_data.COLUMN_FILE_MAGIC + b'\xff\xff\xff\x7f{')
+
+    assert env_data.readSidecar(compressed) is None
+    assert sameColumns(env_data.readMonth(compressed), env_data.readMonth(archive[1]))
+    assert not Planted.ran
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+import env_data
+import env_schema
+
+ENV_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Env_Data')
+
+MARCH = os.path.join(ENV_DATA_DIR, 'PT_Mar_2020.CSV')
+
+
+@pytest.mark.parametrize('wanted', [(0,), env_schema.columns(['humidity', 'lux']), (env_schema.column('vpd'),)])
+def test_records_of_a_projected_block(wanted):
+
+    whole = env_data.readMonth(MARCH)
+    projected = env_data.readMonth(MARCH, wanted)
+    read = env_data.projection(wanted)
+
+    records = list(projected)
+    assert len(records) == len(whole)
+    for idx in (0, len(whole) // 2, len(whole) - 1):
+        for record in (projected[idx], records[idx]):
+            for field, expected in zip(env_data.RECORD_FIELDS, whole[idx]):
+                columnIdx = env_schema.column(field)
+                assert getattr(record, field) == (expected if columnIdx in read else None)
+
+
+def test_projection_reads_the_inputs_of_derived_columns():
+
+    assert env_data.projection() == tuple(range(len(env_data.FIELDS)))
+    assert env_data.projection([]) == (0,)
+    assert env_data.projection([env_schema.column('lux')]) == (0, env_schema.column('lux'))
+    assert env_data.projection([env_schema.column('dewPoint')]) == env_schema.columns(['time', 'temperature', 'humidity', 'dewPoint'])
+
+
+def test_projected_block_tops_up_to_the_whole_month():
+
+    whole = env_data.readMonth(MARCH)
+    wanted = (env_schema.column('pressure'),)
+    projected = env_data.readMonth(MARCH, wanted)
+
+    assert projected.missing(wanted) == ()
+    assert projected.missing() == tuple(idx for idx in range(len(env_data.FIELDS)) if idx not in env_data.projection(wanted))
+
+    projected.fill(env_data.readMonth(MARCH, projected.missing()))
+    assert projected.missing() == ()
+    assert [column.tobytes() for column in projected.columns] == [column.tobytes() for column in whole.columns]
@@ -0,0 +1,55 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import env_data
+from diagnostics import Timings, timings
+
+
+def test_log_and_breakdown_while_stages_are_added(caplog):
+
+    recorder = Timings()
+    stop = threading.Event()
+
+    def addStages():
+        count = 0
+        while not stop.is_set():
+            recorder.add('stage{0}'.format(count % 5000), 0.001)
+            count += 1
+
+    worker = threading.Thread(target=addStages)
+    worker.start()
+    try:
+        with caplog.at_level(logging.INFO, logger='env_viewer.timing'):
+            for _ in range(50):
+                recorder.log(start='x')
+                recorder.breakdown()
+                recorder.reset()
+    finally:
+        stop.set()
+        worker.join()
+
+
+def test_muted_threads_stay_out_of_the_breakdown():
+
+    recorder = Timings()
+    with ThreadPoolExecutor(max_workers=1, initializer=recorder.mute) as pool:
+        pool.submit(recorder.add, 'background', 1.0).result()
+    recorder.add('foreground', 1.0)
+    with recorder.muted():
+        recorder.add('quiet', 1.0)
+
+    assert list(recorder.stages) == ['foreground']
+
+
+def test_background_load_stays_out_of_the_refresh(archive):
+
+    env_data.clearCache()
+    timings.reset()
+    with ThreadPoolExecutor(max_workers=1, initializer=timings.mute) as pool:
+        pool.submit(env_data.loadMonths, archive).result()
+    assert not any(stage.startswith('csv.') for stage in timings.stages)
+
+    env_data.clearCache()
+    env_data.loadMonths(archive)
+    assert 'csv.parse' in timings.stages
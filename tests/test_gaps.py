@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+import env_data
+
+
+def bruteGaps(timeVals, cadence):
+    """Return the index of every sample more than GAP_FACTOR sample periods after the one before it."""
+
+    return [idx for idx in range(1, len(timeVals)) if timeVals[idx] - timeVals[idx - 1] > cadence * env_data.GAP_FACTOR]
+
+
+def bruteMissing(timeVals, cadence, startSecs, endSecs):
+    """Return the seconds of startSecs to endSecs that no sample's period covers, one second at a time."""
+
+    covered = set()
+    for timeVal in timeVals:
+        covered.update(range(max(timeVal, startSecs), min(timeVal + cadence, endSecs)))
+
+    return (endSecs - startSecs) - len(covered)
+
+
+@pytest.fixture(scope='module')
+def combined(months):
+
+    return env_data.EnvData.concatenate(months)
+
+
+def test_joined_months_keep_every_gap(months, combined):
+
+    assert any(len(month.gaps) for month in months)
+    assert list(combined.gaps) == bruteGaps(combined.time, combined.cadence)
+
+
+def test_slices_and_joins_keep_the_index(combined):
+
+    rng = random.Random(3)
+    for _ in range(200):
+        startIdx, endIdx = sorted(rng.sample(range(len(combined) + 1), 2))
+        block = combined.slice(startIdx, endIdx)
+        assert list(block.gaps) == bruteGaps(block.time, combined.cadence)
+
+        # Split again and joined back, the join between the pieces is checked afresh
+        splitIdx = rng.randint(0, len(block))
+        joined = env_data.EnvData.concatenate([block.slice(0, splitIdx), block.slice(splitIdx, len(block))])
+        assert list(joined.gaps) == list(block.gaps)
+
+
+def test_segments_are_the_unbroken_runs(combined):
+
+    segments = combined.segments()
+
+    assert [start for start, _ in segments[1:]] == list(combined.gaps)
+    assert segments[0][0] == 0 and segments[-1][1] == len(combined)
+    for start, end in segments:
+        assert not bruteGaps(combined.time[start:end], combined.cadence)
+
+
+def test_missing_seconds_match_brute_force(months):
+
+    # The synthetic archive logs exactly on the sample period, so each sample covers one period with no overlap
+    month = months[1]
+    rng = random.Random(5)
+    first, last = month.time[0], month.time[-1]
+
+    for _ in range(50):
+        startSecs = rng.randint(first - 7200, last)
+        endSecs = startSecs + rng.randint(0, 10 * 86400)
+        block = month.between(startSecs, endSecs)
+        expected = bruteMissing(block.time, month.cadence, startSecs, endSecs)
+        assert block.missingSeconds(startSecs, endSecs) == expected
+        assert block.coverage(startSecs, endSecs) == pytest.approx(1.0 - expected / (endSecs - startSecs) if endSecs > startSecs else 1.0)
@@ -0,0 +1,74 @@
+import math
+import random
+
+import pytest
+
+import env_data
+import env_index
+import env_schema
+
+
+def bruteStats(envData, columnIdx, startSecs, endSecs, filtered):
+    """Return {subset: (min, max, total, count)} by looking at every sample."""
+
+    luxVals = envData.values(env_schema.column('lux'), filtered)
+    picked = {subset: [] for subset in env_index.SUBSETS}
+    for timeVal, value, luxVal in zip(envData.time, envData.values(columnIdx, filtered), luxVals):
+        if startSecs <= timeVal < endSecs:
+            picked['all'].append(value)
+            picked['day' if luxVal > env_index.DAY_LUX else 'night'].append(value)
+
+    return {subset: (min(values, default=math.inf), max(values, default=-math.inf), sum(values), len(values))
+            for subset, values in picked.items()}
+
+
+def spans(envData, count, seed):
+    """Return random spans over a block, some on the hour, some empty and one over the whole block."""
+
+    rng = random.Random(seed)
+    first, last = envData.time[0], envData.time[-1]
+    result = [(first, last + 1), (first - 86400, first), (last + 1, last + 86400)]
+    for _ in range(count):
+        start = rng.randint(first - 3600, last)
+        end = start + rng.choice((0, 60, 1800, 3600, 5400, 86400, 7 * 86400, rng.randint(1, 40 * 86400)))
+        if rng.random() < 0.3:
+            start -= start % 3600
+            end -= end % 3600
+        result.append((start, end))
+
+    return result
+
+
+@pytest.mark.parametrize('name', ['temperature', 'pressure', 'lux', 'dewPoint'])
+@pytest.mark.parametrize('filtered', [False, True])
+def test_query_matches_brute_force(months, name, filtered):
+
+    columnIdx = env_schema.column(name)
+    for seed, monthData in enumerate(months):
+        index = env_index.RangeIndex(monthData, columnIdx, filtered)
+        for startSecs, endSecs in spans(monthData, 200, seed):
+            expected = bruteStats(monthData, columnIdx, startSecs, endSecs, filtered)
+            for subset, (lo, hi, total, count) in index.query(startSecs, endSecs).items():
+                expectedLo, expectedHi, expectedTotal, expectedCount = expected[subset]
+                assert (lo, hi, count) == (expectedLo, expectedHi, expectedCount), (subset, startSecs, endSecs)
+                assert total == pytest.approx(expectedTotal, rel=1e-9, abs=1e-6)
+
+
+def test_range_stats_across_months(months):
+
+    columnIdx = env_schema.column('temperature')
+    blocks = [(('month', idx, 0, 0), lambda monthData=monthData: monthData) for idx, monthData in enumerate(months)]
+    combined = env_data.EnvData.concatenate(months)
+    env_index.clearCache()
+
+    for startSecs, endSecs in spans(combined, 100, 99):
+        stats, covered = env_index.rangeStats(blocks, columnIdx, startSecs, endSecs)
+        expected = bruteStats(combined, columnIdx, startSecs, endSecs, False)
+        for subset, (lo, hi, mean, count) in stats.items():
+            expectedLo, expectedHi, expectedTotal, expectedCount = expected[subset]
+            assert (count, lo, hi) == (expectedCount, expectedLo, expectedHi)
+            if count:
+                assert mean == pytest.approx(expectedTotal / expectedCount, rel=1e-9)
+            else:
+                assert math.isnan(mean)
+        assert covered == expected['all'][3] * months[0].cadence
@@ -0,0 +1,72 @@
+import math
+from array import array
+
+import pytest
+
+import env_data
+import env_metrics
+import env_schema
+
+
+@pytest.mark.parametrize('temperature', [-10.0, 0.0, 12.5, 20.0, 35.0])
+@pytest.mark.parametrize('humidity', [5.0, 40.0, 75.0, 100.0])
+def test_dew_point_saturates_the_air(temperature, humidity):
+
+    # Cooled to its dew point the air holds the vapour it had as saturation
+    dewPoint = env_metrics.dewPoint(temperature, humidity)
+
+    assert dewPoint <= temperature + 1e-9
+    assert env_metrics.saturationPressure(dewPoint) == pytest.approx(env_metrics.saturationPressure(temperature) * humidity / 100, rel=1e-9)
+
+
+def test_published_values():
+
+    # Saturation pressure at 20 *C is 2.34 kPa, air at 20 *C and 50% has a dew point of 9.3 *C
+    assert env_metrics.saturationPressure(20.0) == pytest.approx(2.34, abs=0.01)
+    assert env_metrics.dewPoint(20.0, 50.0) == pytest.approx(9.3, abs=0.05)
+    assert env_metrics.vapourPressureDeficit(20.0, 50.0) == pytest.approx(1.17, abs=0.01)
+
+
+def test_vpd_bounds():
+
+    assert env_metrics.vapourPressureDeficit(25.0, 100.0) == 0.0
+    assert env_metrics.vapourPressureDeficit(25.0, 0.0) == env_metrics.saturationPressure(25.0)
+
+    # A reading out of range is clamped rather than giving a negative deficit or more than saturation
+    assert env_metrics.vapourPressureDeficit(25.0, 104.0) == 0.0
+    assert env_metrics.vapourPressureDeficit(25.0, -3.0) == env_metrics.saturationPressure(25.0)
+    assert math.isfinite(env_metrics.dewPoint(25.0, 0.0))
+
+
+def test_growing_degree_days():
+
+    days = env_metrics.growingDegreeDays([4.0, 8.0, 12.0, -2.0], [10.0, 18.0, 30.0, 21.0], base=10.0)
+
+    assert list(days) == [0.0, 3.0, 11.0, 0.0]
+
+
+def test_month_columns_match_the_formulas(months):
+
+    month = months[0]
+    temperature = month.values(env_schema.column('temperature'))
+    humidity = month.values(env_schema.column('humidity'))
+
+    for name, function in [('dewPoint', env_metrics.dewPoint), ('vpd', env_metrics.vapourPressureDeficit)]:
+        expected = array(env_schema.sensor(name).typecode, map(function, temperature, humidity))
+        assert month.values(env_schema.column(name)) == expected, name
+
+
+def test_filtered_columns_come_from_the_filtered_readings(months):
+
+    # The synthetic archive has no temperature glitches, so one is put in
+    month = months[0]
+    columns = [array(column.typecode, column) for column in month.columns]
+    temperatureIdx, humidityIdx, dewPointIdx = env_schema.columns(['temperature', 'humidity', 'dewPoint'])
+    columns[temperatureIdx][100] = 85.0
+    spiked = env_data.filterSpikes(env_data.EnvData(month.headers, columns, month.gaps, month.cadence))
+
+    temperature = spiked.values(temperatureIdx, True)
+    assert temperature[100] != 85.0
+    assert spiked.values(dewPointIdx, True) == array('f', map(env_metrics.dewPoint, temperature, spiked.values(humidityIdx, True)))
+    assert spiked.masks[dewPointIdx][100]
+    assert list(spiked.masks[dewPointIdx]) == [int(bool(flags)) for flags in map(max, spiked.masks[temperatureIdx], spiked.masks[humidityIdx])]
@@ -0,0 +1,87 @@
+from array import array
+
+import pytest
+
+import env_data
+import env_rolling
+import env_schema
+
+
+def naiveWindows(timeVals, windowSecs):
+    """Return the indices of the samples inside the window centred on each sample."""
+
+    half = windowSecs // 2
+
+    return [[idx for idx, other in enumerate(timeVals) if timeVal - half <= other <= timeVal + half] for timeVal in timeVals]
+
+
+def naiveVariance(values, weights):
+
+    total = sum(weights)
+    mean = sum(value * weight for value, weight in zip(values, weights)) / total
+
+    return sum((value - mean) ** 2 * weight for value, weight in zip(values, weights)) / total
+
+
+@pytest.fixture(scope='module')
+def month(months):
+    """A month cut down to ten days, the naive windows are quadratic."""
+
+    monthData = months[1]
+
+    return monthData.between(monthData.time[0], monthData.time[0] + 10 * 86400)
+
+
+@pytest.mark.parametrize('windowSecs', env_rolling.WINDOWS[:3])
+@pytest.mark.parametrize('name', ['temperature', 'pressure', 'visible'])
+def test_samples_match_naive_windows(month, windowSecs, name):
+
+    columnIdx = env_schema.column(name)
+    values = month.values(columnIdx)
+    windows = naiveWindows(month.time, windowSecs)
+
+    means, = env_rolling.rolling(month, columnIdx, windowSecs, 'mean')
+    lows, highs = env_rolling.rolling(month, columnIdx, windowSecs, 'envelope')
+    deviations, = env_rolling.rolling(month, columnIdx, windowSecs, 'std')
+
+    for idx, window in enumerate(windows):
+        windowVals = [values[other] for other in window]
+        assert means[idx] == pytest.approx(sum(windowVals) / len(windowVals), rel=1e-9)
+        assert (lows[idx], highs[idx]) == (min(windowVals), max(windowVals))
+        # NOTE - compared squared, the prefix sums leave rounding of ~1e-12 in a flat window's variance
+        assert deviations[idx] ** 2 == pytest.approx(naiveVariance(windowVals, [1] * len(windowVals)), rel=1e-6, abs=1e-6)
+
+
+@pytest.mark.parametrize('windowSecs', env_rolling.WINDOWS)
+def test_aggregate_matches_naive_windows(months, windowSecs):
+
+    columnIdx = env_schema.column('temperature')
+    level = env_data.aggregate(env_data.EnvData.concatenate(months), 3 * 3600)
+    values = level.values(columnIdx)
+    windows = naiveWindows(level.time, windowSecs)
+
+    means, = env_rolling.rolling(level, columnIdx, windowSecs, 'mean')
+    lows, highs = env_rolling.rolling(level, columnIdx, windowSecs, 'envelope')
+    deviations, = env_rolling.rolling(level, columnIdx, windowSecs, 'std')
+
+    for idx, window in enumerate(windows):
+        weights = [level.counts[other] for other in window]
+        windowVals = [values[other] for other in window]
+        assert means[idx] == pytest.approx(sum(value * weight for value, weight in zip(windowVals, weights)) / sum(weights), rel=1e-9)
+        assert lows[idx] == min(level.minimums[columnIdx][other] for other in window)
+        assert highs[idx] == max(level.maximums[columnIdx][other] for other in window)
+        assert deviations[idx] ** 2 == pytest.approx(naiveVariance(windowVals, weights), rel=1e-6, abs=1e-6)
+
+
+def test_cache_follows_month_stamps(month):
+
+    columnIdx = env_schema.column('temperature')
+    rewritten = month.between(month.time[0], month.time[-1] + 1)
+    rewritten.columns[columnIdx] = array('d', (value + 5 for value in month.columns[columnIdx]))
+
+    means, = env_rolling.rolling(month, columnIdx, 3600, 'mean', stamps=(('month.csv', 100, 1),))
+    assert env_rolling.rolling(month, columnIdx, 3600, 'mean', stamps=(('month.csv', 100, 1),))[0] is means
+
+    # Same timestamps, rewritten readings, only the file stamp tells them apart
+    rewrittenMeans, = env_rolling.rolling(rewritten, columnIdx, 3600, 'mean', stamps=(('month.csv', 100, 2),))
+    assert list(rewrittenMeans) == pytest.approx([value + 5 for value in means])
@@ -0,0 +1,64 @@
+import sqlite3
+
+import pytest
+
+import env_data
+import env_metrics
+import env_schema
+import env_sqlite
+
+# The header the logger writes, as in every month file
+LOGGER_HEADER = ['Date/Time (YYYY:MM:DD HH:MM:SS)', ' Temperature (*C)', ' Pressure (Pa)', ' Humidity (%)', ' Infrared', ' Visible',
+                 ' Full Spectrum', ' Lux (lm/m^2)']
+
+
+def test_columns_follow_the_registry():
+
+    assert [sensor.column for sensor in env_schema.SENSORS.values()] == list(range(len(env_schema.SENSORS)))
+    assert env_data.FIELDS == tuple(env_schema.SENSORS)
+    assert env_data.FIELD_TYPECODES == tuple(sensor.typecode for sensor in env_schema.SENSORS.values())
+    assert [sensor.header for sensor in env_schema.LOGGER] == LOGGER_HEADER
+    assert [name for name, *_ in env_metrics.METRICS] == [sensor.name for sensor in env_schema.DERIVED]
+
+
+@pytest.mark.parametrize('label, expected', [
+    (' Temperature (*C)', ('temperature', '*C')),
+    ('Full Spectrum', ('fullspectrum', '')),
+    ('  LUX  (lm/m^2) ', ('lux', 'lm/m^2')),
+    ('Date/Time (YYYY:MM:DD HH:MM:SS)', ('date/time', 'YYYY:MM:DD HH:MM:SS')),
+])
+def test_split_label(label, expected):
+
+    assert env_schema.splitLabel(label) == expected
+
+
+def test_header_positions():
+
+    assert env_schema.headerPositions(LOGGER_HEADER) == tuple(range(len(env_schema.LOGGER)))
+
+    # Moved columns are found by name, a sensor the viewer doesn't know is left out and the first of a repeat is used
+    moved = [LOGGER_HEADER[0], ' UV Index'] + LOGGER_HEADER[:0:-1] + [' temperature (C)']
+    assert env_schema.headerPositions(moved) == (0,) + tuple(range(len(moved) - 2, 1, -1))
+
+    # Any logger column missing and the file can't be read by name
+    assert env_schema.headerPositions(LOGGER_HEADER[:-1]) is None
+    assert env_schema.headerPositions([]) is None
+
+
+def test_charts_and_floors():
+
+    assert [sensor.name for sensor in env_schema.chartSensors('lux')] == ['lux', 'infrared', 'visible', 'fullSpectrum']
+    assert [sensor.name for sensor in env_schema.chartSensors('dewPoint')] == ['dewPoint']
+
+    # Only logged columns are filtered, a derived one follows its inputs
+    assert env_data.FILTER_FLOORS == {sensor.name: sensor.floor for sensor in env_schema.LOGGER[1:]}
+    assert all(sensor.floor is None for sensor in env_schema.DERIVED + env_schema.LOGGER[:1])
+
+
+def test_sqlite_table_follows_the_registry():
+
+    connection = sqlite3.connect(':memory:')
+    connection.executescript(env_sqlite.SCHEMA)
+    columns = [(name, sqlType) for _, name, sqlType, *_ in connection.execute('PRAGMA table_info(samples)')]
+
+    assert columns == [(sensor.name, env_sqlite.SQL_TYPES[sensor.typecode]) for sensor in env_schema.LOGGER]
@@ -0,0 +1,104 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+import env_data
+import env_schema
+import env_session
+
+
+@pytest.fixture
+def session(months):
+
+    monthData = months[1]
+    compact = env_session.compactData(monthData, [env_schema.column('temperature')], filtered=True)
+
+    return {'range': (int(monthData.time[0]), int(monthData.time[-1])), 'tab': 2, 'filtered': True, 'plots': {'temperature': compact}}
+
+
+def test_save_and_load(session, tmp_path):
+
+    path = str(tmp_path / 'session.pickle')
+    env_session.save(path, session)
+
+    assert os.listdir(str(tmp_path)) == ['session.pickle']
+    loaded = env_session.load(path)
+    assert (loaded['range'], loaded['tab'], loaded['filtered']) == (session['range'], session['tab'], session['filtered'])
+
+    compact = loaded['plots']['temperature']
+    original = session['plots']['temperature']
+    assert compact.columns[env_schema.column('temperature')].tobytes() == original.columns[env_schema.column('temperature')].tobytes()
+    assert compact.columns[env_schema.column('pressure')] is None
+    assert list(compact.masks) == [env_schema.column('temperature')]
+
+
+def test_failed_save_keeps_the_earlier_snapshot(session, tmp_path):
+
+    path = str(tmp_path / 'session.pickle')
+    env_session.save(path, session)
+
+    # A lambda can't be pickled, the write fails part way
+    env_session.save(path, dict(session, tab=lambda: None))
+
+    assert os.listdir(str(tmp_path)) == ['session.pickle']
+    assert env_session.load(path)['tab'] == 2
+
+
+@pytest.mark.parametrize('change', ['version', 'fields', 'typecodes'])
+def test_another_version_or_schema_is_rejected(session, tmp_path, change):
+
+    path = str(tmp_path / 'session.pickle')
+    env_session.save(path, session)
+    with open(path, 'rb') as fh:
+        state = pickle.load(fh)
+
+    if change == 'version':
+        state['version'] = env_session.SESSION_VERSION + 1
+    elif change == 'fields':
+        state['fields'] = state['fields'][:2] + ('windSpeed',) + state['fields'][2:]
+    else:
+        state['typecodes'] = ('q',) + ('d',) * (len(state['typecodes']) - 1)
+    with open(path, 'wb') as fh:
+        pickle.dump(state, fh)
+
+    assert env_session.load(path) is None
+
+
+def test_missing_or_corrupt_file(tmp_path):
+
+    path = tmp_path / 'session.pickle'
+    assert env_session.load(str(path)) is None
+
+    path.write_bytes(b'not a pickle')
+    assert env_session.load(str(path)) is None
+
+
+def test_stale_stamps(archive, tmp_path, monkeypatch):
+
+    pytest.importorskip('PyQt5')
+    import data_viewer
+
+    dataDir = tmp_path / 'data'
+    shutil.copytree(os.path.dirname(archive[0]), str(dataDir))
+    monkeypatch.setattr(data_viewer, 'DATA_DIR', str(dataDir))
+    monkeypatch.setattr(data_viewer, 'DB_PATH', str(tmp_path / 'absent.sqlite'))
+    env_data.clearCache()
+
+    monthData = env_data.readMonth(archive[1])
+    startSecs, endSecs = int(monthData.time[0]), int(monthData.time[0]) + 7 * 86400
+    stamps = data_viewer.monthStamps(startSecs, endSecs)
+    assert stamps
+
+    statsData = data_viewer.checkSession(startSecs, endSecs, stamps)
+    assert statsData is not None
+    assert list(statsData.time) == list(monthData.between(startSecs, endSecs).time)
+
+    # The month behind the range is written to after the session was saved
+    path = dataDir / os.path.basename(archive[1])
+    with open(str(path), 'a', newline='') as fh:
+        fh.write('28/02/2022 23:59,1,100000,50,0,0,0,0\n')
+
+    assert data_viewer.monthStamps(startSecs, endSecs) != stamps
+    assert data_viewer.checkSession(startSecs, endSecs, stamps) is None
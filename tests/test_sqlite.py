@@ -0,0 +1,84 @@
+import os
+import shutil
+import time
+
+import pytest
+
+import env_data
+import env_sqlite
+
+
+@pytest.fixture(scope='module')
+def database(archive, tmp_path_factory):
+
+    dbPath = str(tmp_path_factory.mktemp('db') / env_sqlite.DB_FILENAME)
+    env_sqlite.importArchive(os.path.dirname(archive[0]), dbPath)
+
+    return dbPath
+
+
+def spanSecs(*start, days):
+
+    startSecs = int(time.mktime(start + (0, 0, 0, -1)))
+
+    return startSecs, startSecs + days * 86400
+
+
+def assertSameBlocks(block, expected):
+
+    assert len(block) == len(expected)
+    for idx, (column, expectedColumn) in enumerate(zip(block.columns, expected.columns)):
+        assert list(column) == list(expectedColumn), env_data.FIELDS[idx]
+    assert list(block.gaps) == list(expected.gaps)
+
+
+def test_import_again_is_a_no_op(archive, database):
+
+    assert env_sqlite.isPopulated(database)
+    assert sorted(env_sqlite.importedFiles(database)) == sorted(os.path.basename(path) for path in archive)
+    assert env_sqlite.importArchive(os.path.dirname(archive[0]), database) == 0
+
+
+@pytest.mark.parametrize('span', [spanSecs(2021, 12, 1, 0, 0, days=120), spanSecs(2021, 12, 30, 17, 0, days=5), spanSecs(2022, 2, 10, 9, 30, days=1)])
+def test_range_matches_the_csvs(months, database, span):
+
+    # The gap index is read back from the gaps table, it has to agree with the one worked out from the samples
+    expected = env_data.EnvData.concatenate(month.between(*span) for month in months)
+    assertSameBlocks(env_sqlite.queryRange(database, *span), expected)
+
+
+def test_level_matches_aggregate(months, database):
+
+    startSecs, endSecs = spanSecs(2022, 1, 1, 0, 0, days=31)
+    expected = env_data.aggregate(env_data.EnvData.concatenate(month.between(startSecs, endSecs) for month in months), 3 * 3600)
+    level = env_sqlite.queryLevel(database, startSecs, endSecs, 3 * 3600)
+
+    assert list(level.time) == list(expected.time)
+    assert list(level.counts) == list(expected.counts)
+    for idx, typecode in enumerate(env_data.FIELD_TYPECODES[1:], 1):
+        assert list(level.minimums[idx]) == list(expected.minimums[idx]), env_data.FIELDS[idx]
+        assert list(level.maximums[idx]) == list(expected.maximums[idx]), env_data.FIELDS[idx]
+        # NOTE - SQLite averages derived columns at full precision, a month holds them as float32
+        tolerance = {'rel': 1e-6, 'abs': 1e-6} if typecode == 'f' else {'rel': 1e-9}
+        assert list(level.columns[idx]) == pytest.approx(list(expected.columns[idx]), **tolerance), env_data.FIELDS[idx]
+
+
+def test_changed_month_replaces_its_rows(archive, tmp_path):
+
+    dataDir = tmp_path / 'archive'
+    shutil.copytree(os.path.dirname(archive[0]), dataDir)
+    dbPath = str(tmp_path / env_sqlite.DB_FILENAME)
+    env_sqlite.importArchive(str(dataDir), dbPath)
+
+    # The month is cut short, the rows it no longer has mustn't linger
+    path = dataDir / os.path.basename(archive[1])
+    lines = path.read_bytes().splitlines(keepends=True)
+    path.write_bytes(b''.join(lines[:len(lines) // 2]))
+    shortened = env_data.readMonth(str(path))
+
+    assert env_sqlite.importArchive(str(dataDir), dbPath) == len(shortened)
+    startSecs, endSecs = spanSecs(2021, 12, 1, 0, 0, days=120)
+    expected = env_data.EnvData.concatenate(env_data.readMonth(str(dataDir / os.path.basename(filename))).between(startSecs, endSecs)
+                                            for filename in archive)
+    assertSameBlocks(env_sqlite.queryRange(dbPath, startSecs, endSecs), expected)
+    env_sqlite.close(dbPath)
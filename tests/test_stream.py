@@ -0,0 +1,104 @@
+import os
+import csv
+import time
+
+import pytest
+
+import env_data
+import env_schema
+import env_sqlite
+import env_stream
+
+COLUMNS = env_schema.columns(['lux', 'temperature', 'pressure', 'infrared', 'dewPoint', 'vpd'])
+
+
+def readBack(path):
+
+    with open(path, 'rb') as fh:
+        return list(env_stream.readBinary(fh))
+
+
+def expectedColumns(archive, startSecs, endSecs, filtered):
+    """Return {name: list} for the range, each month parsed whole and sliced."""
+
+    blocks = [env_data.prepareMonth(filename, filtered).between(startSecs, endSecs) for filename in archive]
+    combined = env_data.EnvData.concatenate(blocks)
+
+    return {env_data.FIELDS[idx]: list(combined.values(idx, filtered)) for idx in (0,) + COLUMNS}
+
+
+@pytest.fixture(scope='module')
+def database(archive, tmp_path_factory):
+
+    dbPath = str(tmp_path_factory.mktemp('db') / env_sqlite.DB_FILENAME)
+    env_sqlite.importArchive(os.path.dirname(archive[0]), dbPath)
+
+    return dbPath
+
+
+@pytest.mark.parametrize('filtered', [False, True])
+@pytest.mark.parametrize('backend', ['csv', 'sqlite'])
+def test_binary_round_trip(archive, database, tmp_path, backend, filtered):
+
+    startSecs = int(time.mktime((2021, 12, 20, 13, 0, 0, 0, 0, -1)))
+    endSecs = int(time.mktime((2022, 2, 11, 6, 30, 0, 0, 0, -1)))
+    outPath = str(tmp_path / 'range.bin')
+
+    rows = env_stream.exportRange(outPath, startSecs, endSecs, os.path.dirname(archive[0]), COLUMNS, 'bin',
+                                  database if backend == 'sqlite' else None, chunkRows=777, filtered=filtered)
+    chunks = readBack(outPath)
+    expected = expectedColumns(archive, startSecs, endSecs, filtered)
+
+    assert rows == len(expected['time']) == sum(len(chunk['time']) for chunk in chunks)
+    assert all(len(chunk['time']) <= 777 for chunk in chunks)
+    assert list(chunks[0]) == list(expected)
+
+    for name, values in expected.items():
+        readValues = [value for chunk in chunks for value in chunk[name]]
+        assert readValues == values, name
+        assert {chunk[name].typecode for chunk in chunks} == {env_data.FIELD_TYPECODES[env_data.FIELDS.index(name)]}
+
+
+def test_not_a_binary_export(tmp_path):
+
+    path = tmp_path / 'range.csv'
+    path.write_bytes(b'Date/Time,Temperature\n')
+
+    with pytest.raises(ValueError):
+        readBack(str(path))
+
+
+@pytest.mark.parametrize('fileFormat', env_stream.FORMATS)
+def test_empty_range(archive, tmp_path, fileFormat):
+
+    startSecs = int(time.mktime((2019, 1, 1, 0, 0, 0, 0, 0, -1)))
+    outPath = tmp_path / ('range.' + fileFormat)
+
+    rows = env_stream.exportRange(str(outPath), startSecs, startSecs + 86400, os.path.dirname(archive[0]), COLUMNS, fileFormat)
+
+    assert rows == 0
+    if fileFormat == 'csv':
+        assert outPath.read_text().splitlines() == [','.join(env_schema.sensor(env_data.FIELDS[idx]).label for idx in (0,) + COLUMNS)]
+    elif fileFormat == 'bin':
+        assert readBack(str(outPath)) == []
+    else:
+        assert outPath.read_text() == ''
+
+
+def test_csv_matches_binary(archive, tmp_path):
+
+    startSecs = int(time.mktime((2022, 1, 30, 0, 0, 0, 0, 0, -1)))
+    endSecs = int(time.mktime((2022, 2, 2, 0, 0, 0, 0, 0, -1)))
+    dataDir = os.path.dirname(archive[0])
+
+    rows = env_stream.exportRange(str(tmp_path / 'range.csv'), startSecs, endSecs, dataDir, COLUMNS, 'csv', chunkRows=50)
+    env_stream.exportRange(str(tmp_path / 'range.bin'), startSecs, endSecs, dataDir, COLUMNS, 'bin', chunkRows=50)
+
+    with open(tmp_path / 'range.csv', newline='') as fh:
+        header, *lines = list(csv.reader(fh))
+    binary = readBack(str(tmp_path / 'range.bin'))
+
+    # One header however many chunks, then a row per sample
+    assert header[1:] == [env_schema.sensor(env_data.FIELDS[idx]).label for idx in COLUMNS]
+    assert len(lines) == rows == sum(len(chunk['time']) for chunk in binary)
+    assert [line[0] for line in lines] == env_stream.formatTimestamps([value for chunk in binary for value in chunk['time']])